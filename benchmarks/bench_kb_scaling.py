@@ -0,0 +1,301 @@
+# File: benchmarks/bench_kb_scaling.py
+
+"""
+Stress test di scalabilità del solver su Knowledge Base sintetiche ingrandite.
+
+Per ogni fattore di scala genera una KB con `enlarged_kb.py` e la misura in un
+processo dedicato (il runtime SWI-Prolog è unico per processo, e la memoria
+residente del worker include quella del motore Prolog):
+
+  - il tempo di caricamento della KB (consult di `reasoning.pl` e `facts.pl`);
+  - l'enumerazione di `approved_for/3` (`get_approvals`) su un campione di
+    patologie, per chiamata e per farmaco approvato;
+  - `verify_therapy` su regimi casuali di 2-6 farmaci approvati;
+  - `TherapyOptimizer.solve` su una coorte di pazienti sintetici, a cache
+    fredde per ogni paziente (`bench_solver.reset_caches`);
+  - il picco di memoria residente del processo (ru_maxrss).
+
+Per ogni metrica viene stimato l'esponente di crescita tra scale successive
+(pendenza in scala log-log rispetto al numero di fatti `has_atc_code/2`):
+un esponente sensibilmente maggiore di 1 segnala un punto caldo super-lineare.
+I risultati vengono salvati in JSON e riassunti in un grafico.
+
+Uso:
+    python benchmarks/bench_kb_scaling.py --scales 1 10 100 --output kb_scaling.json --plot kb_scaling.png
+"""
+
+import io
+import os
+import sys
+import json
+import math
+import time
+import random
+import signal
+import argparse
+import resource
+import tempfile
+import subprocess
+import contextlib
+import numpy as np
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import seaborn as sns
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BASE_DIR)
+sys.path.append(os.path.join(BASE_DIR, "benchmarks"))
+
+from enlarged_kb import generate_enlarged_kb
+from synthetic_patients import PatientGenerator, load_target_diseases
+
+sns.set_theme(style="whitegrid", palette="muted")
+PLOT_DPI = 150
+SUPERLINEAR_EXPONENT = 1.15
+
+# Metriche per cui stimare l'esponente di crescita: (chiave nel risultato, etichetta)
+SCALING_METRICS = [
+    ('load_seconds', 'Caricamento KB'),
+    ('approvals_ms_per_call', 'get_approvals / chiamata'),
+    ('verify_ms_per_call', 'verify_therapy / chiamata'),
+    ('solve_p50_ms', 'solve p50'),
+    ('solve_p95_ms', 'solve p95'),
+    ('max_rss_mb', 'Memoria residente'),
+]
+
+
+class SolveTimeout(Exception):
+    """Ricerca interrotta per superamento del budget di tempo."""
+
+
+def _raise_timeout(signum, frame):
+    raise SolveTimeout()
+
+
+def measure_kb(kb_dir: str, probe_diseases: int, regimens: int, patients: int,
+               diseases_per_patient: int, seed: int, solve_timeout: float) -> dict:
+    """
+    Misura una KB nel processo corrente (modalità worker).
+
+    Le ricerche che superano `solve_timeout` secondi vengono interrotte (SIGALRM)
+    e contate in `solve_timeouts`; la loro latenza è registrata pari al budget,
+    quindi i percentili sono una stima per difetto.
+
+    Returns:
+        dict: Metriche grezze della KB.
+    """
+    from src.sss.search import TherapyOptimizer
+    from bench_solver import reset_caches
+
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        optimizer = TherapyOptimizer(kb_dir=kb_dir)
+    load_seconds = time.perf_counter() - start
+    kb = optimizer.kb
+    rng = random.Random(seed)
+
+    diseases = load_target_diseases(os.path.join(kb_dir, "reasoning.pl"))
+    probe = sorted(rng.sample(diseases, min(probe_diseases, len(diseases))))
+    approval_times, approved, total_approvals = [], set(), 0
+    for disease in probe:
+        start = time.perf_counter()
+        approvals = kb.get_approvals(disease)
+        approval_times.append(time.perf_counter() - start)
+        approved.update(approvals)
+        total_approvals += len(approvals)
+
+    verify_times = {}
+    pool = sorted(approved)
+    for size in range(2, 7):
+        times = []
+        for _ in range(regimens if len(pool) >= size else 0):
+            regimen = rng.sample(pool, size)
+            start = time.perf_counter()
+            kb.verify_therapy(regimen)
+            times.append(time.perf_counter() - start)
+        if times:
+            verify_times[size] = float(np.mean(times) * 1000)
+
+    generator = PatientGenerator(diseases=diseases, seed=seed)
+    latencies, solved, timeouts = [], 0, 0
+    signal.signal(signal.SIGALRM, _raise_timeout)
+    for profile, targets in generator.cohort(diseases_per_patient, patients):
+        # Ogni paziente paga grafo dei conflitti e inferenze RF/BN a freddo
+        reset_caches(optimizer)
+        start = time.perf_counter()
+        signal.setitimer(signal.ITIMER_REAL, solve_timeout)
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                solved += optimizer.solve(profile, targets) is not None
+        except SolveTimeout:
+            timeouts += 1
+        finally:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    return {
+        'load_seconds': load_seconds,
+        'approvals_ms_per_call': float(np.mean(approval_times) * 1000),
+        'approvals_us_per_drug': float(np.sum(approval_times) * 1e6 / max(total_approvals, 1)),
+        'approved_drugs_per_disease': total_approvals / max(len(probe), 1),
+        'verify_ms_by_size': verify_times,
+        'verify_ms_per_call': float(np.mean(list(verify_times.values()))) if verify_times else None,
+        'solve_p50_ms': float(np.percentile(latencies, 50)),
+        'solve_p95_ms': float(np.percentile(latencies, 95)),
+        'solved_ratio': solved / max(len(latencies), 1),
+        'solve_timeouts': timeouts,
+        # ru_maxrss è espresso in KB su Linux
+        'max_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+
+def run_worker(kb_dir: str, args) -> dict:
+    """
+    Esegue `measure_kb` in un processo separato e ne restituisce il risultato.
+
+    Returns:
+        dict: Le metriche, oppure {'error': motivo} se il worker termina in modo
+            anomalo (es. ucciso per memoria esaurita) o supera `--worker-timeout`.
+    """
+    with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as tmp:
+        result_path = tmp.name
+    cmd = [sys.executable, os.path.abspath(__file__), "--worker", kb_dir, "--worker-output", result_path,
+           "--probe-diseases", str(args.probe_diseases), "--regimens", str(args.regimens),
+           "--patients", str(args.patients), "--diseases-per-patient", str(args.diseases_per_patient),
+           "--solve-timeout", str(args.solve_timeout), "--seed", str(args.seed)]
+    try:
+        subprocess.run(cmd, check=True, timeout=args.worker_timeout)
+        with open(result_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except subprocess.TimeoutExpired:
+        return {'error': f"timeout del worker ({args.worker_timeout} s)"}
+    except subprocess.CalledProcessError as e:
+        reason = f"segnale {-e.returncode}" if e.returncode < 0 else f"exit code {e.returncode}"
+        return {'error': f"worker terminato ({reason})"}
+    finally:
+        os.remove(result_path)
+
+
+def growth_exponents(points: list) -> dict:
+    """
+    Calcola, per ogni metrica, la pendenza log-log tra scale successive.
+
+    Args:
+        points (list[dict]): Risultati ordinati per dimensione della KB.
+
+    Returns:
+        dict: metrica → lista di esponenti (uno per coppia di scale consecutive).
+    """
+    exponents = {}
+    for key, _ in SCALING_METRICS:
+        values = []
+        for a, b in zip(points, points[1:]):
+            ya, yb = a['metrics'].get(key), b['metrics'].get(key)
+            xa, xb = a['kb']['has_atc_code_facts'], b['kb']['has_atc_code_facts']
+            if ya and yb and xb > xa:
+                values.append(round(math.log(yb / ya) / math.log(xb / xa), 2))
+        exponents[key] = values
+    return exponents
+
+
+def plot_scaling(points: list, path: str) -> None:
+    """Grafico tempo e memoria in funzione della dimensione della KB (scala log-log)."""
+    sizes = [p['kb']['has_atc_code_facts'] for p in points]
+    fig, axes = plt.subplots(1, 3, figsize=(16, 4.5))
+
+    panels = [
+        (axes[0], "Interrogazioni KB", "ms per chiamata",
+         [('approvals_ms_per_call', 'get_approvals'), ('verify_ms_per_call', 'verify_therapy')]),
+        (axes[1], "Caricamento e ricerca", "secondi / ms",
+         [('load_seconds', 'Caricamento KB (s)'), ('solve_p50_ms', 'solve p50 (ms)'), ('solve_p95_ms', 'solve p95 (ms)')]),
+        (axes[2], "Memoria", "MB", [('max_rss_mb', 'Memoria residente (MB)')]),
+    ]
+    for ax, title, ylabel, series in panels:
+        for key, label in series:
+            values = [p['metrics'].get(key) for p in points]
+            ax.plot(sizes, values, marker='o', label=label)
+        ax.set_xscale('log')
+        ax.set_yscale('log')
+        ax.set_xlabel("Fatti has_atc_code/2", fontsize=11)
+        ax.set_ylabel(ylabel, fontsize=11)
+        ax.set_title(title, fontsize=13, fontweight='bold')
+        ax.legend(fontsize=8)
+
+    fig.suptitle("SafeTherapy — Scalabilità del solver sulla dimensione della KB", fontsize=14, fontweight='bold')
+    fig.tight_layout()
+    fig.savefig(path, dpi=PLOT_DPI, bbox_inches='tight')
+    plt.close(fig)
+    print(f"[BENCH-KB] Grafico salvato: {path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stress test del solver su KB sintetiche ingrandite")
+    parser.add_argument("--scales", type=int, nargs='+', default=[1, 10, 100], help="Fattori di scala dei farmaci")
+    parser.add_argument("--disease-scale", type=int, default=None, help="Default: uguale alla scala dei farmaci")
+    parser.add_argument("--ddi-scale", type=int, default=None, help="Default: uguale alla scala dei farmaci")
+    parser.add_argument("--probe-diseases", type=int, default=30, help="Patologie campionate per get_approvals")
+    parser.add_argument("--regimens", type=int, default=50, help="Regimi casuali per dimensione (2-6 farmaci)")
+    parser.add_argument("--patients", type=int, default=10)
+    parser.add_argument("--diseases-per-patient", type=int, default=3)
+    parser.add_argument("--solve-timeout", type=float, default=60.0, help="Budget in secondi per ogni ricerca")
+    parser.add_argument("--worker-timeout", type=float, default=3600.0, help="Budget in secondi per ogni scala")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--workdir", type=str, default=None, help="Directory delle KB generate (default: temporanea)")
+    parser.add_argument("--output", type=str, default=None, help="File JSON di output dei risultati")
+    parser.add_argument("--plot", type=str, default="kb_scaling.png", help="Grafico di output")
+    parser.add_argument("--worker", type=str, default=None, help=argparse.SUPPRESS)
+    parser.add_argument("--worker-output", type=str, default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        metrics = measure_kb(args.worker, args.probe_diseases, args.regimens, args.patients,
+                             args.diseases_per_patient, args.seed, args.solve_timeout)
+        with open(args.worker_output, 'w', encoding='utf-8') as f:
+            json.dump(metrics, f)
+        return
+
+    with contextlib.ExitStack() as stack:
+        workdir = args.workdir or stack.enter_context(tempfile.TemporaryDirectory())
+        points, failed = [], None
+        for scale in sorted(args.scales):
+            kb_dir = os.path.join(workdir, f"kb_x{scale}")
+            start = time.perf_counter()
+            manifest = generate_enlarged_kb(kb_dir, scale, args.disease_scale, args.ddi_scale, args.seed)
+            generation_seconds = time.perf_counter() - start
+            print(f"[BENCH-KB] Scala {scale}×: {manifest['has_atc_code_facts']} has_atc_code, "
+                  f"{manifest['diseases']} patologie, {manifest['ddi_classes']} classi DDI "
+                  f"(generata in {generation_seconds:.1f} s)")
+
+            metrics = run_worker(kb_dir, args)
+            if 'error' in metrics:
+                # Le scale maggiori fallirebbero a loro volta: ci si ferma qui
+                print(f"[BENCH-KB] ❌ Scala {scale}×: {metrics['error']}")
+                failed = {'scale': scale, 'kb': manifest, 'error': metrics['error']}
+                break
+            points.append({'scale': scale, 'kb': manifest, 'generation_seconds': generation_seconds,
+                           'metrics': metrics})
+            print(f"[BENCH-KB]   caricamento {metrics['load_seconds']:.2f} s | "
+                  f"get_approvals {metrics['approvals_ms_per_call']:.2f} ms | "
+                  f"verify_therapy {metrics['verify_ms_per_call'] or 0:.2f} ms | "
+                  f"solve p50 {metrics['solve_p50_ms']:.0f} ms, p95 {metrics['solve_p95_ms']:.0f} ms | "
+                  f"RSS {metrics['max_rss_mb']:.0f} MB | timeout {metrics['solve_timeouts']}/{args.patients}")
+
+    results = {'seed': args.seed, 'points': points, 'failed': failed, 'growth_exponents': growth_exponents(points)}
+    for key, label in SCALING_METRICS:
+        exps = results['growth_exponents'][key]
+        flag = " ⚠️ super-lineare" if any(e > SUPERLINEAR_EXPONENT for e in exps) else ""
+        if key.startswith('solve') and any(p['metrics']['solve_timeouts'] for p in points):
+            flag += " (stima per difetto: ricerche interrotte dal budget)"
+        print(f"[BENCH-KB] Esponente di crescita {label:<26}: {exps}{flag}")
+
+    if args.plot and len(points) > 1:
+        plot_scaling(points, args.plot)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+# File: benchmarks/bench_risk_matrix.py
+
+"""
+Benchmark della matrice di rischio di coorte (`AIHeuristic.cohort_penalty_matrix`).
+
+Genera una coorte di pazienti sintetici riproducibili (`PatientGenerator`) in
+forma colonnare e un formulario di farmaci noti al Random Forest, calcola la
+matrice N × M delle penalità e misura:
+
+  - il tempo totale e le coppie (paziente, farmaco) valutate al secondo;
+  - la crescita della memoria residente durante il calcolo, confrontata con
+    la dimensione della matrice di output;
+  - la coerenza con il percorso puntuale (`evaluate_drug_penalty`) su un
+    campione di celle, e il tempo per cella di quest'ultimo.
+
+Uso:
+    python benchmarks/bench_risk_matrix.py --patients 100000 --drugs 500
+"""
+
+import io
+import os
+import sys
+import time
+import resource
+import argparse
+import contextlib
+import numpy as np
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BASE_DIR)
+sys.path.append(os.path.join(BASE_DIR, "benchmarks"))
+
+from src.sss.heuristic import AIHeuristic
+from synthetic_patients import PatientGenerator
+
+
+def columnar_cohort(generator: PatientGenerator, n_patients: int) -> dict:
+    """Restituisce i profili dei primi `n_patients` pazienti in forma colonnare."""
+    profiles = [generator.patient(1, i)[0] for i in range(n_patients)]
+    return {key: [p[key] for p in profiles] for key in ('age', 'sex', 'weight', 'concomitant')}
+
+
+def formulary(heuristic: AIHeuristic, n_drugs: int, seed: int) -> list:
+    """Campiona `n_drugs` farmaci del vocabolario del Random Forest e ne restituisce gli atomi."""
+    encoder = heuristic.ml.encoders.get('DRUG_NAME')
+    if encoder is None:
+        raise SystemExit("[BENCH-RISK] Encoder DRUG_NAME non disponibile: eseguire prima il training.")
+    names = np.random.default_rng(seed).choice(encoder.classes_, min(n_drugs, len(encoder.classes_)), replace=False)
+    return [heuristic.atoms.atom_for(str(name)) or str(name) for name in names]
+
+
+def max_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark della matrice di rischio di coorte")
+    parser.add_argument("--patients", type=int, default=100_000)
+    parser.add_argument("--drugs", type=int, default=500)
+    parser.add_argument("--block-patients", type=int, default=4096)
+    parser.add_argument("--max-batch-rows", type=int, default=262_144)
+    parser.add_argument("--check", type=int, default=200, help="Celle confrontate con il percorso puntuale")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    heuristic = AIHeuristic()
+    patients = columnar_cohort(PatientGenerator(seed=args.seed), args.patients)
+    drugs = formulary(heuristic, args.drugs, args.seed)
+    print(f"[BENCH-RISK] Coorte: {args.patients} pazienti × {len(drugs)} farmaci")
+
+    rss_before = max_rss_mb()
+    start = time.perf_counter()
+    matrix = heuristic.cohort_penalty_matrix(patients, drugs, block_patients=args.block_patients,
+                                             max_batch_rows=args.max_batch_rows)
+    elapsed = time.perf_counter() - start
+    rss_growth = max_rss_mb() - rss_before
+    print(f"[BENCH-RISK] Matrice calcolata in {elapsed:.1f} s ({matrix.size / elapsed:,.0f} coppie/s)")
+    print(f"[BENCH-RISK] Memoria: +{rss_growth:.0f} MB di picco, di cui {matrix.nbytes / 1024**2:.0f} MB di output")
+
+    rng = np.random.default_rng(args.seed)
+    cells = zip(rng.integers(0, len(patients['age']), args.check), rng.integers(0, len(drugs), args.check))
+    worst, start = 0.0, time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for i, j in cells:
+            profile = {key: column[i] for key, column in patients.items()}
+            expected = heuristic.evaluate_drug_penalty(profile, drugs[j])
+            worst = max(worst, abs(float(matrix[i, j]) - expected) / max(expected, 1e-9))
+    per_cell = (time.perf_counter() - start) / max(args.check, 1)
+    print(f"[BENCH-RISK] Percorso puntuale: {per_cell * 1000:.2f} ms/cella "
+          f"(stima per l'intera matrice: {per_cell * matrix.size / 3600:.1f} h)")
+    print(f"[BENCH-RISK] Scarto relativo massimo sulle {args.check} celle campionate: {worst:.2e}")
+
+
+if __name__ == "__main__":
+    main()
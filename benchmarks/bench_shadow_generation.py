@@ -0,0 +1,192 @@
+# File: benchmarks/bench_shadow_generation.py
+
+"""
+Benchmark della generazione dei casi shadow e della scrittura del dataset FAERS.
+
+Sintetizza N casi reali (default 500.000, distribuiti su `--drugs` farmaci) e
+ripete il percorso di `FaersMiningBot._process_drug` senza rete: per ogni
+farmaco genera i casi shadow con il Generator dedicato, mescola il blocco e lo
+passa a `BufferedDatasetWriter`. Il dataset risultante ha 2N righe.
+
+Misura:
+  - il throughput end-to-end (generazione + scrittura CSV);
+  - il confronto, su un sottocampione, tra la generazione vettorizzata e
+    quella storica riga per riga (`iterrows` + `random`);
+  - la riproducibilità: due esecuzioni con lo stesso seme devono produrre
+    file identici (stesso SHA-256) e, elaborando i farmaci in ordine diverso,
+    le stesse righe per ogni farmaco.
+
+Uso:
+    python benchmarks/bench_shadow_generation.py --rows 500000 --output bench_shadows.json
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import tempfile
+import numpy as np
+import pandas as pd
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BASE_DIR)
+sys.path.append(os.path.join(BASE_DIR, "tools"))
+
+from generate_dataset_faers import FaersMiningBot, BufferedDatasetWriter
+from src.ml.dataset import dataset_sha256
+
+
+def synthesize_real_cases(bot: FaersMiningBot, rows: int, drugs: int, seed: int) -> dict:
+    """
+    Genera casi reali sintetici (TARGET=1), raggruppati per farmaco.
+
+    Returns:
+        dict: nome del farmaco → DataFrame dei suoi casi reali.
+    """
+    rng = np.random.default_rng(seed)
+    names = np.array([f"drug {k:05d}" for k in range(drugs)])
+    concomitant = np.array(['None'] + bot.conditions, dtype=object)
+    df = pd.DataFrame({
+        'AGE': rng.integers(18, 95, rows),
+        'SEX': rng.choice(np.array(['M', 'F']), rows),
+        'WEIGHT': np.round(rng.normal(75, 15, rows).clip(40, 150), 1),
+        'DRUG_NAME': names[rng.integers(0, drugs, rows)],
+        'CONCOMITANT': concomitant[rng.integers(0, len(concomitant), rows)],
+        'REACTION_DESC': 'Nausea',
+        'TARGET': 1
+    })
+    return {drug: group.reset_index(drop=True) for drug, group in df.groupby('DRUG_NAME', sort=True)}
+
+
+def legacy_shadows(bot: FaersMiningBot, df_real: pd.DataFrame) -> pd.DataFrame:
+    """Implementazione riga per riga precedente alla vettorizzazione (riferimento)."""
+    safe_data = []
+    for _, row in df_real.iterrows():
+        age = np.random.normal(45, 12)
+        age = max(18, min(75, age))
+
+        sex = random.choice(['M', 'F'])
+        if sex == 'M': weight = np.random.normal(80, 10)
+        else: weight = np.random.normal(62, 8)
+        weight = max(45, min(110, weight))
+
+        if random.random() < 0.70:
+            concomitant = 'None'
+        else:
+            conditions = list(set(bot.keywords.values()))
+            if row['CONCOMITANT'] in conditions:
+                conditions.remove(row['CONCOMITANT'])
+            concomitant = random.choice(conditions) if conditions else 'None'
+
+        safe_data.append({
+            'AGE': int(age),
+            'SEX': sex,
+            'WEIGHT': round(weight, 1),
+            'DRUG_NAME': row['DRUG_NAME'],
+            'CONCOMITANT': concomitant,
+            'REACTION_DESC': 'No Adverse Event',
+            'TARGET': 0
+        })
+    return pd.DataFrame(safe_data)
+
+
+def write_dataset(bot: FaersMiningBot, real_cases: dict, path: str, order: list) -> int:
+    """Genera shadow e scrive il dataset elaborando i farmaci nell'ordine dato."""
+    writer = BufferedDatasetWriter(path, path + ".checkpoint", bot.buffer_rows)
+    for drug in order:
+        df_real = real_cases[drug]
+        rng = bot.drug_rng(drug)
+        df_chunk = pd.concat([df_real, bot.generate_smart_shadows(df_real, rng)], ignore_index=True)
+        writer.add(drug, df_chunk.sample(frac=1, random_state=rng).reset_index(drop=True))
+    writer.close()
+    return writer.rows_written
+
+
+def rows_by_drug(path: str) -> pd.DataFrame:
+    """Righe del dataset raggruppate per farmaco, mantenendo l'ordine interno di ogni farmaco."""
+    return pd.read_csv(path).sort_values('DRUG_NAME', kind='stable').reset_index(drop=True)
+
+
+def check_distribution(real: pd.DataFrame, shadows: pd.DataFrame) -> dict:
+    """Verifica i vincoli dei casi shadow (range, comorbidità diversa dal caso reale)."""
+    differs = (shadows['CONCOMITANT'] == 'None') | (shadows['CONCOMITANT'] != real['CONCOMITANT'])
+    return {
+        'age_range': [int(shadows['AGE'].min()), int(shadows['AGE'].max())],
+        'weight_range': [float(shadows['WEIGHT'].min()), float(shadows['WEIGHT'].max())],
+        'none_share': round(float((shadows['CONCOMITANT'] == 'None').mean()), 4),
+        'concomitant_differs': bool(differs.all())
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark generazione casi shadow e scrittura dataset FAERS")
+    parser.add_argument("--rows", type=int, default=500_000, help="Casi reali sintetici (il dataset ne avrà il doppio)")
+    parser.add_argument("--drugs", type=int, default=2000, help="Farmaci su cui distribuire i casi")
+    parser.add_argument("--legacy-rows", type=int, default=20_000, help="Sottocampione per il confronto riga per riga")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", type=str, default=None, help="File JSON di output dei risultati")
+    args = parser.parse_args()
+
+    bot = FaersMiningBot(seed=args.seed)
+    real_cases = synthesize_real_cases(bot, args.rows, args.drugs, args.seed)
+    drugs = sorted(real_cases)
+    results = {'real_rows': args.rows, 'drugs': len(drugs), 'seed': args.seed}
+
+    # Confronto vettorizzato / riga per riga sugli stessi casi
+    sample = pd.concat(list(real_cases.values()), ignore_index=True).head(args.legacy_rows)
+    start = time.perf_counter()
+    vectorized = bot.generate_smart_shadows(sample, np.random.default_rng(args.seed))
+    vec_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    legacy_shadows(bot, sample)
+    legacy_seconds = time.perf_counter() - start
+    results['shadow_generation'] = {
+        'rows': len(sample),
+        'vectorized_seconds': round(vec_seconds, 4),
+        'legacy_seconds': round(legacy_seconds, 3),
+        'speedup': round(legacy_seconds / vec_seconds, 1),
+        'checks': check_distribution(sample, vectorized)
+    }
+    print(f"[BENCH-SHADOW] Shadow su {len(sample)} righe: vettorizzato {vec_seconds:.3f} s, "
+          f"riga per riga {legacy_seconds:.2f} s ({results['shadow_generation']['speedup']}×)")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        first = os.path.join(tmp, "run_a.csv")
+        start = time.perf_counter()
+        rows = write_dataset(bot, real_cases, first, drugs)
+        seconds = time.perf_counter() - start
+        results['end_to_end'] = {
+            'rows_written': rows,
+            'seconds': round(seconds, 3),
+            'rows_per_second': round(rows / seconds),
+            'file_mb': round(os.path.getsize(first) / 1024**2, 1)
+        }
+        print(f"[BENCH-SHADOW] Dataset di {rows:,} righe scritto in {seconds:.2f} s ({rows / seconds:,.0f} righe/s)")
+
+        # Seconda esecuzione con lo stesso seme ma farmaci completati in ordine diverso,
+        # come accade con le richieste concorrenti: il contenuto per farmaco non deve cambiare.
+        second = os.path.join(tmp, "run_b.csv")
+        shuffled = list(np.random.default_rng(args.seed + 1).permutation(drugs))
+        write_dataset(bot, real_cases, second, shuffled)
+
+        third = os.path.join(tmp, "run_c.csv")
+        write_dataset(bot, real_cases, third, drugs)
+        results['reproducible'] = {
+            'same_order_identical_file': dataset_sha256(first) == dataset_sha256(third),
+            'any_order_identical_content': rows_by_drug(first).equals(rows_by_drug(second))
+        }
+        print(f"[BENCH-SHADOW] Riproducibilità: {results['reproducible']}")
+
+    if not all(results['reproducible'].values()) or not results['shadow_generation']['checks']['concomitant_differs']:
+        print("[BENCH-SHADOW] ❌ Output non riproducibile o vincoli dei casi shadow violati!")
+        sys.exit(1)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
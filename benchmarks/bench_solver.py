@@ -0,0 +1,237 @@
+# File: benchmarks/bench_solver.py
+
+"""
+Benchmark end-to-end di `TherapyOptimizer.solve` su pazienti sintetici.
+
+Per ogni numero di patologie target (default da 1 a 8) risolve una coorte di
+pazienti generata da `PatientGenerator` e misura, per ciascuna esecuzione:
+
+  - la latenza (p50/p95/p99 e media);
+  - i nodi espansi e generati dall'A*;
+  - le chiamate alla Knowledge Base (`get_approvals`, `verify_therapy`, ...);
+  - le chiamate ai modelli (Random Forest e Rete Bayesiana);
+  - il picco di memoria allocata durante la ricerca (tracemalloc, in una
+    seconda passata separata per non alterare le latenze).
+
+Per default le cache della T-Box dell'ottimizzatore vengono svuotate prima di
+ogni paziente (come in un'invocazione della CLI); con `--warm` restano condivise
+tra i pazienti. Il risultato è un JSON con i metadati dell'esecuzione (commit,
+backend, seme) confrontabile tra commit diversi con `--compare`.
+
+Uso:
+    python benchmarks/bench_solver.py --patients 50 --output bench_solver.json
+    python benchmarks/bench_solver.py --kb snapshot --compare bench_solver.json
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import subprocess
+import tracemalloc
+import threading
+import contextlib
+from collections import Counter
+import numpy as np
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BASE_DIR)
+sys.path.append(os.path.join(BASE_DIR, "benchmarks"))
+
+from src.sss.search import TherapyOptimizer
+from synthetic_patients import PatientGenerator
+
+
+class CallCounter:
+    """
+    Proxy che conta le chiamate ai metodi dell'oggetto avvolto (anche da più
+    thread, con `--workers`).
+
+    Attributes:
+        calls (Counter): Numero di chiamate per nome del metodo.
+    """
+
+    def __init__(self, target):
+        self._target = target
+        self.calls = Counter()
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name):
+        attr = getattr(self._target, name)
+        if not callable(attr):
+            return attr
+
+        def counted(*args, **kwargs):
+            with self._lock:
+                self.calls[name] += 1
+            return attr(*args, **kwargs)
+        return counted
+
+
+def instrument(optimizer: TherapyOptimizer) -> dict:
+    """Sostituisce KB e modelli dell'ottimizzatore con proxy contatori."""
+    counters = {
+        'kb': CallCounter(optimizer.kb),
+        'ml': CallCounter(optimizer.ai.ml),
+        'bn': CallCounter(optimizer.ai.bn)
+    }
+    optimizer.kb = counters['kb']
+    optimizer.ai.ml = counters['ml']
+    optimizer.ai.bn = counters['bn']
+    return counters
+
+
+def reset_caches(optimizer: TherapyOptimizer) -> None:
+    """Riporta l'ottimizzatore a cache fredde: cache della KB, grafo dei conflitti e tabelle dei modelli."""
+    optimizer.invalidate_kb_caches()
+    optimizer.ai.clear_tables()
+
+
+def percentiles(values: list, digits: int = 3) -> dict:
+    """Riassume una serie di misure con media e percentili 50/95/99."""
+    arr = np.asarray(values, dtype=float)
+    if not len(arr):
+        return {}
+    p50, p95, p99 = np.percentile(arr, [50, 95, 99])
+    return {'mean': round(float(arr.mean()), digits), 'p50': round(float(p50), digits),
+            'p95': round(float(p95), digits), 'p99': round(float(p99), digits),
+            'max': round(float(arr.max()), digits)}
+
+
+def run_cohort(optimizer: TherapyOptimizer, counters: dict, cohort: list, warm: bool, trace_memory: bool) -> list:
+    """
+    Risolve una coorte di pazienti e restituisce le misure di ogni esecuzione.
+
+    Args:
+        trace_memory (bool): Se True misura il picco di memoria con tracemalloc
+            invece della latenza.
+    """
+    runs = []
+    for profile, targets in cohort:
+        if not warm:
+            reset_caches(optimizer)
+        for counter in counters.values():
+            counter.calls.clear()
+
+        if trace_memory:
+            tracemalloc.start()
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            solution = optimizer.solve(profile, targets)
+        elapsed = time.perf_counter() - start
+        if trace_memory:
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            runs.append({'peak_memory_mb': peak / 1024**2})
+            continue
+
+        runs.append({
+            'latency_ms': elapsed * 1000,
+            'solved': solution is not None,
+            'nodes_expanded': optimizer.stats.get('nodes_expanded', 0),
+            'nodes_generated': optimizer.stats.get('nodes_generated', 0),
+            'prolog_calls': sum(counters['kb'].calls.values()),
+            'ml_calls': counters['ml'].calls['predict_risk'],
+            'bn_calls': counters['bn'].calls['get_patient_fragility'],
+        })
+    return runs
+
+
+def summarize(runs: list, memory_runs: list) -> dict:
+    summary = {'patients': len(runs), 'solved_ratio': round(float(np.mean([r['solved'] for r in runs])), 3)}
+    summary['latency_ms'] = percentiles([r['latency_ms'] for r in runs])
+    for key in ('nodes_expanded', 'nodes_generated', 'prolog_calls', 'ml_calls', 'bn_calls'):
+        summary[key] = percentiles([r[key] for r in runs], digits=1)
+    if memory_runs:
+        summary['peak_memory_mb'] = percentiles([r['peak_memory_mb'] for r in memory_runs])
+    return summary
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], cwd=BASE_DIR,
+                                       stderr=subprocess.DEVNULL, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def compare(results: dict, baseline_path: str) -> None:
+    """Stampa il rapporto corrente/baseline delle metriche principali."""
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    print(f"[BENCH-SOLVER] Confronto con {baseline_path} (commit {baseline.get('meta', {}).get('commit')})")
+    print(f"   {'patologie':>9} | {'p50 ms':>16} | {'p95 ms':>16} | {'nodi espansi':>14} | {'chiamate KB':>13}")
+    for n, current in results['by_disease_count'].items():
+        base = baseline.get('by_disease_count', {}).get(n)
+        if not base:
+            continue
+
+        def ratio(section, stat):
+            old = base[section][stat]
+            return f"{current[section][stat]:.1f} ({current[section][stat] / old:.2f}x)" if old else "n/a"
+        print(f"   {n:>9} | {ratio('latency_ms', 'p50'):>16} | {ratio('latency_ms', 'p95'):>16} | "
+              f"{ratio('nodes_expanded', 'mean'):>14} | {ratio('prolog_calls', 'mean'):>13}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark end-to-end del solver A* su pazienti sintetici")
+    parser.add_argument("--kb", type=str, choices=['prolog', 'snapshot'], default='prolog')
+    parser.add_argument("--workers", type=int, default=1, help="Thread per le penalità ML/BN (TherapyOptimizer)")
+    parser.add_argument("--patients", type=int, default=30, help="Pazienti per numero di patologie")
+    parser.add_argument("--min-diseases", type=int, default=1)
+    parser.add_argument("--max-diseases", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--warm", action="store_true", help="Mantiene le cache della T-Box tra i pazienti")
+    parser.add_argument("--skip-memory", action="store_true", help="Salta la passata con tracemalloc")
+    parser.add_argument("--output", type=str, default=None, help="File JSON di output dei risultati")
+    parser.add_argument("--compare", type=str, default=None, help="JSON di un'esecuzione precedente")
+    args = parser.parse_args()
+
+    generator = PatientGenerator(seed=args.seed)
+    optimizer = TherapyOptimizer(kb_backend=args.kb, workers=args.workers)
+    counters = instrument(optimizer)
+
+    results = {
+        'meta': {
+            'commit': git_revision(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'kb_backend': args.kb,
+            'workers': args.workers,
+            'seed': args.seed,
+            'patients_per_size': args.patients,
+            'warm_cache': args.warm,
+            'diseases_available': len(generator.diseases)
+        },
+        'by_disease_count': {}
+    }
+
+    # Esecuzione di riscaldamento (import pigri, caricamento dei modelli) esclusa dalle misure
+    run_cohort(optimizer, counters, generator.cohort(args.min_diseases, 1), args.warm, trace_memory=False)
+    reset_caches(optimizer)
+
+    for n in range(args.min_diseases, args.max_diseases + 1):
+        cohort = generator.cohort(n, args.patients)
+        runs = run_cohort(optimizer, counters, cohort, args.warm, trace_memory=False)
+        memory_runs = [] if args.skip_memory else run_cohort(optimizer, counters, cohort, args.warm, trace_memory=True)
+        summary = summarize(runs, memory_runs)
+        results['by_disease_count'][str(n)] = summary
+        print(f"[BENCH-SOLVER] {n} patologie: p50 {summary['latency_ms']['p50']:.1f} ms, "
+              f"p95 {summary['latency_ms']['p95']:.1f} ms, p99 {summary['latency_ms']['p99']:.1f} ms | "
+              f"nodi {summary['nodes_expanded']['mean']:.0f} | KB {summary['prolog_calls']['mean']:.0f} | "
+              f"ML {summary['ml_calls']['mean']:.0f} | risolti {summary['solved_ratio']:.0%}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+    optimizer.close()
+
+
+if __name__ == "__main__":
+    main()
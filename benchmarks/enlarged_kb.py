@@ -0,0 +1,171 @@
+# File: benchmarks/enlarged_kb.py
+
+"""
+Generatore di Knowledge Base sintetiche ingrandite per i test di scalabilità.
+
+Produce in una directory una KB completa e autoconsistente — `facts.pl`,
+`reasoning.pl` e `atom_mapping.json` — caricabile con
+`TherapyOptimizer(kb_dir=...)`:
+
+  - farmaci: il catalogo WHO viene replicato `drug_scale` volte (nomi resi
+    unici con un suffisso di replica, come in `bench_fact_extractor.py`) e
+    l'A-Box viene rigenerata dall'ETL reale (`FactsExtractor`): le repliche
+    conservano i codici ATC, quindi ogni patologia ha `drug_scale` volte più
+    farmaci approvati;
+  - patologie: ogni fatto `requires_X(Disease).` della T-Box viene affiancato
+    da `disease_scale - 1` varianti `Disease_vK` con lo stesso bisogno
+    terapeutico;
+  - interazioni: alle classi `dangerous_classes/4` originali si aggiungono
+    classi sintetiche tra sottogruppi ATC di livello 4 esistenti, fino a
+    `ddi_scale` volte il numero originale.
+
+Uso:
+    python benchmarks/enlarged_kb.py --drug-scale 10 --output-dir /tmp/kb_x10
+"""
+
+import os
+import re
+import sys
+import json
+import random
+import argparse
+import tempfile
+import pandas as pd
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BASE_DIR)
+sys.path.append(os.path.join(BASE_DIR, "benchmarks"))
+
+from src.kb.fact_extractor import FactsExtractor
+from bench_fact_extractor import WHO_FILENAME, build_scaled_catalog
+
+REASONING_PATH = os.path.join(BASE_DIR, "src", "kb", "prolog", "reasoning.pl")
+REQUIRES_LINE = re.compile(r"^(requires_\w+)\(\s*([a-z]\w*)\s*\)\s*\.\s*$")
+DDI_LINE = re.compile(r"^dangerous_classes\(")
+
+
+def synthetic_ddi_classes(prefixes: list, count: int, seed: int, high_ratio: float = 0.2) -> list:
+    """
+    Genera `count` fatti `dangerous_classes/4` tra sottogruppi ATC esistenti.
+
+    Args:
+        prefixes (list[str]): Prefissi ATC di livello 4 disponibili.
+        count (int): Numero di classi da generare.
+        seed (int): Seme del generatore.
+        high_ratio (float): Quota di interazioni con severità 'high'.
+
+    Returns:
+        list[str]: Righe Prolog dei fatti generati.
+    """
+    rng = random.Random(seed)
+    pairs = set()
+    max_pairs = len(prefixes) * (len(prefixes) - 1) // 2
+    while len(pairs) < min(count, max_pairs):
+        pairs.add(tuple(sorted(rng.sample(prefixes, 2))))
+
+    facts = []
+    for k, (c1, c2) in enumerate(sorted(pairs)):
+        severity = 'high' if rng.random() < high_ratio else 'medium'
+        facts.append(f"dangerous_classes('{c1}', '{c2}', '{severity}', 'SYNTHETIC: Class interaction {k}').")
+    return facts
+
+
+def enlarge_reasoning(source: str, disease_scale: int, ddi_facts: list) -> tuple:
+    """
+    Riscrive la T-Box aggiungendo varianti delle patologie e classi DDI sintetiche.
+
+    Le varianti di ogni `requires_X/1` sono inserite subito dopo il fatto
+    originale e le classi DDI dopo l'ultima `dangerous_classes/4`, così che
+    le clausole di ciascun predicato restino contigue.
+
+    Returns:
+        tuple: (testo della T-Box, numero di patologie).
+    """
+    lines_out, diseases = [], set()
+    lines = source.splitlines()
+    last_ddi = max(i for i, line in enumerate(lines) if DDI_LINE.match(line))
+
+    for i, line in enumerate(lines):
+        lines_out.append(line)
+        match = REQUIRES_LINE.match(line)
+        if match:
+            predicate, disease = match.groups()
+            diseases.add(disease)
+            for k in range(1, disease_scale):
+                lines_out.append(f"{predicate}({disease}_v{k}).")
+                diseases.add(f"{disease}_v{k}")
+        if i == last_ddi:
+            lines_out.extend(ddi_facts)
+
+    return "\n".join(lines_out) + "\n", len(diseases)
+
+
+def generate_enlarged_kb(output_dir: str, drug_scale: int = 10, disease_scale: int = None,
+                         ddi_scale: int = None, seed: int = 42, reasoning_path: str = REASONING_PATH) -> dict:
+    """
+    Scrive in `output_dir` una KB ingrandita.
+
+    Args:
+        output_dir (str): Directory di destinazione (creata se assente).
+        drug_scale (int): Fattore di replica del catalogo dei farmaci.
+        disease_scale (int, optional): Fattore per le patologie. Default: `drug_scale`.
+        ddi_scale (int, optional): Fattore per le classi DDI. Default: `drug_scale`.
+        seed (int): Seme per le classi DDI sintetiche.
+        reasoning_path (str): T-Box di partenza.
+
+    Returns:
+        dict: Manifest della KB generata (parametri e dimensioni), salvato
+            anche in `kb_manifest.json`.
+    """
+    disease_scale = disease_scale or drug_scale
+    ddi_scale = ddi_scale or drug_scale
+    os.makedirs(output_dir, exist_ok=True)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        catalog_rows = build_scaled_catalog(drug_scale, tmp)
+        extractor = FactsExtractor(tmp, output_dir)
+        extractor.process_who_catalog()
+        extractor.save_artifacts()
+        codes = pd.read_csv(os.path.join(tmp, WHO_FILENAME))['atc_code'].dropna().astype(str).str.strip().str.lower()
+        prefixes = sorted(codes[codes.str.len() == 7].str[:4].unique())
+
+    with open(reasoning_path, 'r', encoding='utf-8') as f:
+        source = f.read()
+    base_ddi = sum(1 for line in source.splitlines() if DDI_LINE.match(line))
+    ddi_facts = synthetic_ddi_classes(prefixes, base_ddi * (ddi_scale - 1), seed)
+    reasoning, n_diseases = enlarge_reasoning(source, disease_scale, ddi_facts)
+    with open(os.path.join(output_dir, "reasoning.pl"), 'w', encoding='utf-8') as f:
+        f.write(reasoning)
+
+    manifest = {
+        'drug_scale': drug_scale,
+        'disease_scale': disease_scale,
+        'ddi_scale': ddi_scale,
+        'seed': seed,
+        'catalog_rows': catalog_rows,
+        'drugs': len(extractor.atom_mapping),
+        'has_atc_code_facts': len(extractor.facts),
+        'diseases': n_diseases,
+        'ddi_classes': base_ddi + len(ddi_facts)
+    }
+    with open(os.path.join(output_dir, "kb_manifest.json"), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generatore di KB sintetiche ingrandite")
+    parser.add_argument("--drug-scale", type=int, default=10)
+    parser.add_argument("--disease-scale", type=int, default=None, help="Default: uguale a --drug-scale")
+    parser.add_argument("--ddi-scale", type=int, default=None, help="Default: uguale a --drug-scale")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output-dir", type=str, required=True)
+    args = parser.parse_args()
+
+    manifest = generate_enlarged_kb(args.output_dir, args.drug_scale, args.disease_scale, args.ddi_scale, args.seed)
+    print(f"[KB-GEN] KB generata in {args.output_dir}: {manifest['has_atc_code_facts']} has_atc_code, "
+          f"{manifest['diseases']} patologie, {manifest['ddi_classes']} classi DDI")
+
+
+if __name__ == "__main__":
+    main()
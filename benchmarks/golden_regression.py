@@ -0,0 +1,334 @@
+# File: benchmarks/golden_regression.py
+
+"""
+Harness di regressione "golden" del solver A*: qualità del piano e prestazioni.
+
+Un corpus fisso di interrogazioni (paziente, patologie target) — alcuni casi
+clinici scritti a mano più una coorte riproducibile di `PatientGenerator` —
+viene risolto con `TherapyOptimizer.solve`. Per ogni interrogazione si
+registrano il piano (farmaci e patologie coperte), il costo g(n), i nodi
+espansi e generati e la latenza.
+
+  - `--record FILE` salva i risultati come baseline JSON; con `--revision REV`
+    il corpus viene risolto con il codice di un'altra revisione git, estratta
+    in un worktree temporaneo;
+  - `--check [FILE]` risolve di nuovo il corpus della baseline (default
+    `benchmarks/golden_baseline.json`) e fallisce (exit code 1) se la
+    baseline manca, se un piano differisce, se un costo differisce oltre
+    `--cost-tolerance` (relativa, default 1e-6), se la latenza p95 supera
+    quella registrata oltre `--latency-tolerance`, o se i nodi espansi o
+    generati crescono oltre `--node-tolerance`.
+
+La baseline va registrata alla revisione dell'ultimo cambiamento voluto della
+semantica dei costi: oggi c315335, che legge la fragilità del paziente da
+`BNPredictor` invece della costante 0.5 (tutti i costi cambiano rispetto alle
+revisioni precedenti). Un nuovo cambiamento voluto dei costi richiede una
+nuova baseline registrata alla sua revisione.
+
+Piani e costi sono deterministici e vanno sempre confrontati; le latenze sono
+confrontabili solo tra esecuzioni sulla stessa macchina (la baseline ne
+registra i metadati) e possono essere escluse con `--skip-latency`. Gli hash
+di T-Box, A-Box e modelli sono salvati nella baseline: se differiscono, un
+cambiamento dei piani può essere legittimo e va registrata una nuova baseline.
+
+Uso:
+    python benchmarks/golden_regression.py --record benchmarks/golden_baseline.json --revision c315335
+    python benchmarks/golden_regression.py --check
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import hashlib
+import platform
+import argparse
+import tempfile
+import subprocess
+import contextlib
+import numpy as np
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BASE_DIR)
+sys.path.append(os.path.join(BASE_DIR, "benchmarks"))
+
+# Con --revision il processo figlio riceve il worktree della revisione in
+# PYTHONPATH, che precede BASE_DIR: il pacchetto `src` è quello della revisione
+import src
+from src.sss.search import TherapyOptimizer
+from synthetic_patients import PatientGenerator
+from bench_solver import percentiles, git_revision
+
+SOURCE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(src.__file__)))
+DEFAULT_BASELINE = os.path.join(BASE_DIR, "benchmarks", "golden_baseline.json")
+
+# Casi clinici fissi, in aggiunta alla coorte sintetica
+CLINICAL_CASES = [
+    ({'age': 21, 'weight': 50.0, 'sex': 'M', 'concomitant': ['hypertension']}, ['pain', 'headache']),
+    ({'age': 78, 'weight': 62.0, 'sex': 'F', 'concomitant': ['diabetes', 'hypertension']}, ['pain', 'urinary tract infections']),
+    ({'age': 45, 'weight': 95.0, 'sex': 'M', 'concomitant': ['none']}, ['hypertension']),
+]
+
+ARTIFACTS = [
+    os.path.join("src", "kb", "prolog", "reasoning.pl"),
+    os.path.join("src", "kb", "prolog", "facts.pl"),
+    os.path.join("src", "ml", "models", "rf_risk_model.pkl"),
+    os.path.join("src", "ml", "models", "label_encoders.pkl"),
+    os.path.join("src", "bn", "models", "faers_frailty_bbn.pkl"),
+]
+
+# Differenza relativa dei costi ammessa di default (solo arrotondamenti)
+DEFAULT_COST_TOLERANCE = 1e-6
+
+
+def build_corpus(seed: int, patients: int, max_diseases: int) -> list:
+    """
+    Costruisce il corpus di interrogazioni.
+
+    Returns:
+        list[dict]: Interrogazioni con chiavi 'id', 'profile' e 'targets'.
+    """
+    corpus = [{'id': f"clinical-{i}", 'profile': profile, 'targets': targets}
+              for i, (profile, targets) in enumerate(CLINICAL_CASES)]
+    generator = PatientGenerator(seed=seed)
+    for n in range(1, max_diseases + 1):
+        for i, (profile, targets) in enumerate(generator.cohort(n, patients)):
+            corpus.append({'id': f"synthetic-{n}-{i}", 'profile': profile, 'targets': targets})
+    return corpus
+
+
+def artifact_hashes() -> dict:
+    """Hash SHA-256 (abbreviati) degli artefatti che determinano i piani, nella revisione in uso."""
+    hashes = {}
+    for rel_path in ARTIFACTS:
+        path = os.path.join(SOURCE_DIR, rel_path)
+        if not os.path.exists(path):
+            hashes[rel_path] = None
+            continue
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+        hashes[rel_path] = digest.hexdigest()[:16]
+    return hashes
+
+
+def create_optimizer(kb_backend: str) -> TherapyOptimizer:
+    """Crea l'ottimizzatore; le revisioni precedenti al backend snapshot non accettano argomenti."""
+    if kb_backend == 'prolog':
+        return TherapyOptimizer()
+    return TherapyOptimizer(kb_backend=kb_backend)
+
+
+def reset_optimizer(optimizer: TherapyOptimizer) -> None:
+    """
+    Riporta l'ottimizzatore a cache fredde (vedi `bench_solver.reset_caches`),
+    anche per revisioni che non hanno ancora tutte le cache.
+    """
+    if hasattr(optimizer, 'invalidate_kb_caches'):
+        optimizer.invalidate_kb_caches()
+    else:
+        for name in ('_approval_cache', '_safety_cache'):
+            getattr(optimizer, name, {}).clear()
+    if hasattr(optimizer.ai, 'clear_tables'):
+        optimizer.ai.clear_tables()
+
+
+def plan_of(node) -> dict:
+    """Forma canonica e serializzabile del piano di un nodo soluzione."""
+    if node is None:
+        return None
+    return {drug: sorted(diseases) for drug, diseases in sorted(node.selected_drugs.items())}
+
+
+def run_corpus(optimizer: TherapyOptimizer, corpus: list, repeats: int) -> list:
+    """
+    Risolve ogni interrogazione del corpus `repeats` volte, a cache fredde.
+
+    Returns:
+        list[dict]: Per interrogazione: piano, costo, nodi e latenza mediana in ms.
+    """
+    results = []
+    for query in corpus:
+        latencies = []
+        for _ in range(repeats):
+            reset_optimizer(optimizer)
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                solution = optimizer.solve(query['profile'], query['targets'])
+            latencies.append((time.perf_counter() - start) * 1000)
+        # Le revisioni senza `stats` non contano i nodi
+        stats = getattr(optimizer, 'stats', {})
+        results.append({
+            'id': query['id'],
+            'plan': plan_of(solution),
+            'cost': None if solution is None else round(solution.g, 6),
+            'nodes_expanded': stats.get('nodes_expanded'),
+            'nodes_generated': stats.get('nodes_generated'),
+            'latency_ms': round(float(np.median(latencies)), 3)
+        })
+    return results
+
+
+def summarize(results: list) -> dict:
+    summary = {'latency_ms': percentiles([r['latency_ms'] for r in results])}
+    for key in ('nodes_expanded', 'nodes_generated'):
+        counts = [r[key] for r in results]
+        summary[key] = None if None in counts else int(sum(counts))
+    return summary
+
+
+def check(baseline: dict, results: list, summary: dict, latency_tolerance: float,
+          node_tolerance: float, skip_latency: bool,
+          cost_tolerance: float = DEFAULT_COST_TOLERANCE) -> list:
+    """
+    Confronta i risultati con la baseline.
+
+    I piani (farmaci e patologie coperte) devono coincidere; i costi possono
+    differire al più di `cost_tolerance` in termini relativi.
+
+    Returns:
+        list[str]: Descrizione delle regressioni trovate (vuota se nessuna).
+    """
+    failures = []
+    expected = {r['id']: r for r in baseline['results']}
+    for result in results:
+        base = expected[result['id']]
+        if result['plan'] != base['plan']:
+            failures.append(f"{result['id']}: piano diverso ({base['plan']} -> {result['plan']})")
+        elif (result['cost'] is None) != (base['cost'] is None) or (
+                result['cost'] is not None and abs(result['cost'] - base['cost']) > cost_tolerance * max(1.0, abs(base['cost']))):
+            failures.append(f"{result['id']}: costo diverso ({base['cost']} -> {result['cost']})")
+
+    base_summary = baseline['summary']
+    for key in ('nodes_expanded', 'nodes_generated'):
+        if base_summary[key] is None or summary[key] is None:
+            continue
+        if summary[key] > base_summary[key] * (1 + node_tolerance):
+            grown = [r for r in results if r[key] > expected[r['id']][key]]
+            worst = sorted(grown, key=lambda r: r[key] - expected[r['id']][key], reverse=True)[:3]
+            detail = ", ".join(f"{r['id']} {expected[r['id']][key]}->{r[key]}" for r in worst)
+            failures.append(f"{key}: {base_summary[key]} -> {summary[key]} "
+                            f"(oltre +{node_tolerance:.0%}; maggiori aumenti: {detail})")
+
+    if not skip_latency:
+        old_p95, new_p95 = base_summary['latency_ms']['p95'], summary['latency_ms']['p95']
+        if new_p95 > old_p95 * (1 + latency_tolerance):
+            failures.append(f"latenza p95: {old_p95:.1f} ms -> {new_p95:.1f} ms (oltre +{latency_tolerance:.0%})")
+    return failures
+
+
+def record_at_revision(revision: str, argv: list) -> int:
+    """
+    Registra la baseline con il codice di un'altra revisione git.
+
+    La revisione viene estratta in un worktree temporaneo e l'harness corrente
+    viene rieseguito con il worktree in PYTHONPATH: corpus e formato della
+    baseline restano quelli attuali, solver, KB e modelli quelli della
+    revisione (i modelli gestiti con Git LFS richiedono `git lfs`).
+
+    Returns:
+        int: Exit code del processo di registrazione.
+    """
+    worktree = tempfile.mkdtemp(prefix="golden-")
+    subprocess.run(['git', 'worktree', 'add', '--detach', worktree, revision], cwd=BASE_DIR, check=True)
+    try:
+        sha = subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], cwd=worktree, text=True).strip()
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [worktree, os.environ.get('PYTHONPATH')])))
+        command = [sys.executable, os.path.abspath(__file__)] + argv + ['--source-revision', sha]
+        return subprocess.run(command, cwd=BASE_DIR, env=env).returncode
+    finally:
+        subprocess.run(['git', 'worktree', 'remove', '--force', worktree], cwd=BASE_DIR)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Regressione golden del solver A*: piani, costi e prestazioni")
+    mode = parser.add_mutually_exclusive_group(required=True)
+    mode.add_argument("--record", type=str, help="Registra la baseline nel file JSON indicato")
+    mode.add_argument("--check", type=str, nargs='?', const=DEFAULT_BASELINE,
+                      help=f"Confronta con la baseline JSON indicata (default: {os.path.relpath(DEFAULT_BASELINE, BASE_DIR)})")
+    parser.add_argument("--revision", type=str, default=None,
+                        help="Con --record: registra la baseline con il codice di questa revisione git")
+    parser.add_argument("--source-revision", type=str, default=None, help=argparse.SUPPRESS)
+    parser.add_argument("--kb", type=str, choices=['prolog', 'snapshot'], default=None,
+                        help="Backend della KB (default: 'prolog', o quello della baseline con --check)")
+    parser.add_argument("--patients", type=int, default=10, help="Pazienti sintetici per numero di patologie (--record)")
+    parser.add_argument("--max-diseases", type=int, default=5, help="Patologie target massime (--record)")
+    parser.add_argument("--seed", type=int, default=42, help="Seme della coorte sintetica (--record)")
+    parser.add_argument("--repeats", type=int, default=3, help="Esecuzioni per interrogazione (latenza mediana)")
+    parser.add_argument("--cost-tolerance", type=float, default=DEFAULT_COST_TOLERANCE,
+                        help="Differenza relativa massima dei costi dei piani")
+    parser.add_argument("--latency-tolerance", type=float, default=0.25, help="Aumento massimo della latenza p95")
+    parser.add_argument("--node-tolerance", type=float, default=0.05, help="Aumento massimo dei nodi espansi/generati")
+    parser.add_argument("--skip-latency", action="store_true", help="Non confronta le latenze (macchine diverse)")
+    args = parser.parse_args()
+
+    if args.revision:
+        if not args.record:
+            parser.error("--revision si usa solo con --record")
+        argv = ['--record', os.path.abspath(args.record), '--kb', args.kb or 'prolog',
+                '--patients', str(args.patients), '--max-diseases', str(args.max_diseases),
+                '--seed', str(args.seed), '--repeats', str(args.repeats)]
+        sys.exit(record_at_revision(args.revision, argv))
+
+    if args.check:
+        if not os.path.exists(args.check):
+            print(f"[GOLDEN] ❌ Baseline non trovata: {args.check}")
+            print("[GOLDEN] Registrarla prima, alla revisione dell'ultimo cambiamento voluto dei costi:\n"
+                  f"   python benchmarks/golden_regression.py --record {args.check} --revision c315335")
+            sys.exit(1)
+        with open(args.check, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        corpus = baseline['corpus']
+        kb_backend = args.kb or baseline['meta']['kb_backend']
+    else:
+        baseline = None
+        corpus = build_corpus(args.seed, args.patients, args.max_diseases)
+        kb_backend = args.kb or 'prolog'
+
+    optimizer = create_optimizer(kb_backend)
+    with contextlib.redirect_stdout(io.StringIO()):
+        optimizer.solve(corpus[0]['profile'], corpus[0]['targets'])
+
+    print(f"[GOLDEN] Risoluzione di {len(corpus)} interrogazioni (backend {kb_backend}, {args.repeats} ripetizioni)...")
+    results = run_corpus(optimizer, corpus, args.repeats)
+    summary = summarize(results)
+    print(f"[GOLDEN] p50 {summary['latency_ms']['p50']:.1f} ms, p95 {summary['latency_ms']['p95']:.1f} ms | "
+          f"nodi espansi {summary['nodes_expanded']}, generati {summary['nodes_generated']}")
+
+    meta = {
+        'commit': args.source_revision or git_revision(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'node': platform.node(),
+        'kb_backend': kb_backend,
+        'artifacts': artifact_hashes()
+    }
+
+    if args.record:
+        with open(args.record, 'w', encoding='utf-8') as f:
+            json.dump({'meta': meta, 'corpus': corpus, 'summary': summary, 'results': results}, f, indent=2)
+        print(f"[GOLDEN] Baseline registrata in {args.record}")
+        return
+
+    print(f"[GOLDEN] Baseline: commit {baseline['meta']['commit']} del {baseline['meta']['timestamp']}")
+    changed = [path for path, digest in meta['artifacts'].items() if baseline['meta']['artifacts'].get(path) != digest]
+    if changed:
+        print(f"[GOLDEN-WARN] Artefatti diversi dalla baseline: {', '.join(changed)}")
+    if not args.skip_latency and baseline['meta'].get('node') != meta['node']:
+        print("[GOLDEN-WARN] Baseline registrata su un'altra macchina: il confronto delle latenze non è affidabile")
+
+    failures = check(baseline, results, summary, args.latency_tolerance, args.node_tolerance,
+                     args.skip_latency, args.cost_tolerance)
+    if failures:
+        print(f"[GOLDEN] ❌ {len(failures)} regressioni:")
+        for failure in failures:
+            print(f"   - {failure}")
+        sys.exit(1)
+    print("[GOLDEN] ✅ Piani, costi e prestazioni in linea con la baseline")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+# File: benchmarks/synthetic_patients.py
+
+"""
+Generatore riproducibile di pazienti sintetici per i benchmark del solver.
+
+I profili usano lo stesso vocabolario dei dati reali: le comorbidità sono le
+condizioni normalizzate dal generatore del dataset FAERS
+(`tools/generate_dataset_faers.py`), le patologie target sono quelle dichiarate
+dai fatti `requires_*` della T-Box (`reasoning.pl`).
+
+Ogni paziente dipende solo da (seme, numero di patologie, indice): aumentando
+il numero di pazienti quelli già generati restano invariati, e i risultati di
+commit diversi sono confrontabili caso per caso.
+"""
+
+import os
+import re
+import sys
+import numpy as np
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BASE_DIR)
+sys.path.append(os.path.join(BASE_DIR, "tools"))
+
+REASONING_PATH = os.path.join(BASE_DIR, "src", "kb", "prolog", "reasoning.pl")
+REQUIRES_FACT = re.compile(r"^requires_\w+\(\s*([a-z][a-zA-Z0-9_]*)\s*\)\s*\.", re.MULTILINE)
+
+
+def load_target_diseases(reasoning_path: str = REASONING_PATH) -> list:
+    """
+    Estrae le patologie trattabili dai fatti `requires_*(Disease).` della T-Box.
+
+    Args:
+        reasoning_path (str): Percorso di `reasoning.pl`.
+
+    Returns:
+        list[str]: Atomi delle patologie, ordinati e senza duplicati.
+    """
+    with open(reasoning_path, 'r', encoding='utf-8') as f:
+        return sorted(set(REQUIRES_FACT.findall(f.read())))
+
+
+def keyword_conditions() -> list:
+    """Comorbidità normalizzate usate dal generatore del dataset FAERS."""
+    from generate_dataset_faers import FaersMiningBot
+    return list(FaersMiningBot().conditions)
+
+
+class PatientGenerator:
+    """
+    Genera coppie (profilo paziente, patologie target) per `TherapyOptimizer.solve`.
+
+    Attributes:
+        diseases (list[str]): Atomi delle patologie target disponibili.
+        conditions (list[str]): Comorbidità disponibili.
+        seed (int): Seme base.
+    """
+
+    def __init__(self, diseases: list = None, conditions: list = None, seed: int = 42):
+        """
+        Args:
+            diseases (list[str], optional): Patologie target. Default: i fatti `requires_*`.
+            conditions (list[str], optional): Comorbidità. Default: quelle del generatore FAERS.
+            seed (int): Seme base.
+        """
+        self.diseases = sorted(diseases if diseases is not None else load_target_diseases())
+        self.conditions = sorted(conditions if conditions is not None else keyword_conditions())
+        self.seed = seed
+
+    def patient(self, n_diseases: int, index: int) -> tuple:
+        """
+        Genera il paziente `index` con `n_diseases` patologie da trattare.
+
+        Returns:
+            tuple: (profilo, lista delle patologie target in forma testuale).
+        """
+        rng = np.random.default_rng([self.seed, n_diseases, index])
+        sex = str(rng.choice(['M', 'F']))
+        weight = rng.normal(80, 12) if sex == 'M' else rng.normal(65, 10)
+        n_conditions = int(rng.integers(0, 4))
+        concomitant = [str(c) for c in rng.choice(self.conditions, n_conditions, replace=False)] or ['none']
+        profile = {
+            'age': int(rng.integers(18, 96)),
+            'weight': round(float(np.clip(weight, 40, 150)), 1),
+            'sex': sex,
+            'concomitant': concomitant
+        }
+        targets = rng.choice(self.diseases, min(n_diseases, len(self.diseases)), replace=False)
+        return profile, [str(d).replace('_', ' ') for d in targets]
+
+    def cohort(self, n_diseases: int, n_patients: int) -> list:
+        """Restituisce i primi `n_patients` pazienti con `n_diseases` patologie target."""
+        return [self.patient(n_diseases, i) for i in range(n_patients)]
@@ -1,20 +1,33 @@
 # File: src/bn/learner.py
 
 import os
+import sys
 import json
+import time
+import tracemalloc
 import pandas as pd
 import numpy as np
 import joblib
 import networkx as nx
 import matplotlib.pyplot as plt
 import seaborn as sns
+from scipy.special import gammaln
 
 from pgmpy.models import DiscreteBayesianNetwork
-from pgmpy.estimators import BayesianEstimator, BDeu, BIC
+from pgmpy.estimators import BayesianEstimator
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from src.ml.dataset import FaersChunkReader, GroupCountSink, DEFAULT_CHUNK_SIZE
 
 sns.set_theme(style="whitegrid", palette="muted")
 PLOT_DPI = 150
 
+BN_VARIABLES = ['AgeGroup', 'WeightGroup', 'HasConcomitant', 'IsFragile']
+BN_EDGES = [('AgeGroup', 'IsFragile'), ('WeightGroup', 'IsFragile'), ('HasConcomitant', 'IsFragile')]
+BN_RAW_COLUMNS = ['AGE', 'WEIGHT', 'CONCOMITANT', 'TARGET']
+EQUIVALENT_SAMPLE_SIZE = 10
+
 
 class FaersBN:
     """
@@ -25,6 +38,13 @@ class FaersBN:
     Probability Tables) tramite BDeu estimator, ed estrae metriche di 
     Goodness-of-Fit (BIC e BDeu) per valutarne la robustezza strutturale.
     Genera inoltre una rappresentazione grafica del DAG e delle CPT.
+
+    Le quattro variabili discrete hanno al più 54 configurazioni congiunte:
+    il dataset viene quindi letto a blocchi, discretizzato in modo vettoriale
+    e ridotto a una tabella di contingenza (configurazione, conteggio). CPT e
+    metriche di Goodness-of-Fit sono calcolate da questa tabella, per cui
+    tempo e memoria dell'apprendimento non dipendono dal numero di righe
+    oltre alla singola passata di lettura.
     
     Questo modulo deve essere eseguito in modalità standalone.
 
@@ -83,24 +103,108 @@ class FaersBN:
     def _build_train_dataframe(self, df_raw: pd.DataFrame) -> pd.DataFrame:
         """
         Applica la pipeline di discretizzazione a un DataFrame grezzo FAERS.
-        
+
+        Equivale ad applicare `_discretize_age`, `_discretize_weight` e la
+        regola sui concomitanti riga per riga, ma opera su colonne intere.
+
         Args:
             df_raw (pd.DataFrame): DataFrame contenente i dati non processati.
-            
+
         Returns:
             pd.DataFrame: Dati discretizzati pronti per il fit della Rete Bayesiana.
         """
-        df_out = pd.DataFrame()
-        df_out['AgeGroup'] = df_raw['AGE'].apply(self._discretize_age)
-        df_out['WeightGroup'] = df_raw['WEIGHT'].apply(self._discretize_weight)
-        df_out['HasConcomitant'] = df_raw['CONCOMITANT'].apply(
-            lambda x: "0" if pd.isna(x) or str(x).strip().lower() == 'none' else "1"
-        )
-        df_out['IsFragile'] = df_raw['TARGET'].astype(str)
+        age = df_raw['AGE'].to_numpy(dtype=float)
+        weight = df_raw['WEIGHT'].to_numpy(dtype=float)
+        concomitant = df_raw['CONCOMITANT']
+        no_concomitant = concomitant.isna() | (concomitant.astype(str).str.strip().str.lower() == 'none')
+
+        df_out = pd.DataFrame({
+            'AgeGroup': np.select([age < 18, age < 65], ['pediatric', 'adult'], 'geriatric'),
+            'WeightGroup': np.select([weight < 50, weight <= 90], ['underweight', 'normal'], 'overweight'),
+            'HasConcomitant': np.where(no_concomitant.to_numpy(), "0", "1"),
+            'IsFragile': df_raw['TARGET'].astype('int64').astype(str).to_numpy()
+        }, index=df_raw.index)
         for col in df_out.columns:
             df_out[col] = df_out[col].astype('category')
         return df_out
 
+    def _discretize_chunk(self, chunk: pd.DataFrame) -> pd.DataFrame:
+        """Scarta le righe incomplete di un blocco grezzo e lo discretizza."""
+        return self._build_train_dataframe(chunk.dropna(subset=['AGE', 'WEIGHT', 'TARGET']))
+
+    def count_sink(self) -> GroupCountSink:
+        """
+        Crea il sink che riduce il dataset FAERS alla tabella di contingenza
+        della rete, da alimentare con `FaersChunkReader` (anche in una passata
+        condivisa con il Random Forest).
+
+        Returns:
+            GroupCountSink: Il sink; dopo la lettura, `sink.table` contiene una
+                riga per configurazione osservata delle variabili in
+                BN_VARIABLES (colonne categoriali) e la colonna `_weight` con il
+                numero di campioni, nel formato dei dati pesati di pgmpy.
+        """
+        return GroupCountSink(
+            BN_VARIABLES, transform=self._discretize_chunk, columns=BN_RAW_COLUMNS
+        )
+
+    def _aggregate_counts(self, chunksize: int = DEFAULT_CHUNK_SIZE) -> pd.DataFrame:
+        """
+        Legge il dataset FAERS a blocchi e lo riduce a una tabella di contingenza
+        sulle variabili discrete della rete.
+
+        Args:
+            chunksize (int): Numero di righe lette per blocco.
+
+        Returns:
+            pd.DataFrame: La tabella dei conteggi (vedi `count_sink`).
+        """
+        sink = self.count_sink()
+        FaersChunkReader(self.dataset_path, BN_RAW_COLUMNS, chunksize=chunksize).consume(sink)
+        return sink.table
+
+    def _score_from_counts(self, counts: pd.DataFrame, equivalent_sample_size: float = EQUIVALENT_SAMPLE_SIZE) -> tuple:
+        """
+        Calcola i punteggi BDeu e BIC della rete dalla tabella di contingenza.
+
+        Le formule sono quelle di `pgmpy.estimators.BDeu` e `BIC`, espresse sui
+        conteggi N_jk (stato k della variabile, configurazione j dei genitori):
+        i punteggi coincidono con quelli calcolati sul dataset riga per riga.
+
+        Args:
+            counts (pd.DataFrame): Tabella prodotta da `_aggregate_counts`.
+            equivalent_sample_size (float): Dimensione campionaria equivalente del prior BDeu.
+
+        Returns:
+            tuple[float, float]: (punteggio BDeu, punteggio BIC).
+        """
+        sample_size = counts['_weight'].sum()
+        cardinality = {var: counts[var].nunique() for var in BN_VARIABLES}
+        bdeu_score, bic_score = 0.0, 0.0
+
+        for node in self.network.nodes():
+            parents = sorted(self.network.get_parents(node))
+            n_parent_states = int(np.prod([cardinality[p] for p in parents]))
+            r = cardinality[node]
+
+            n_jk = counts.groupby([node] + parents, observed=True)['_weight'].sum()
+            n_jk = n_jk[n_jk > 0].to_numpy(dtype=float)
+            if parents:
+                n_j = counts.groupby(parents, observed=True)['_weight'].sum()
+                n_j = n_j[n_j > 0].to_numpy(dtype=float)
+            else:
+                n_j = np.array([float(sample_size)])
+
+            alpha = equivalent_sample_size / n_parent_states
+            beta = equivalent_sample_size / (n_parent_states * r)
+            bdeu_score += (np.sum(gammaln(n_jk + beta) - gammaln(beta))
+                           - np.sum(gammaln(n_j + alpha) - gammaln(alpha)))
+
+            log_likelihood = np.sum(n_jk * np.log(n_jk)) - np.sum(n_j * np.log(n_j))
+            bic_score += log_likelihood - 0.5 * np.log(sample_size) * n_parent_states * (r - 1)
+
+        return float(bdeu_score), float(bic_score)
+
     def _save_dag_plot(self) -> None:
         """
         Disegna e salva il Directed Acyclic Graph (DAG) della rete.
@@ -197,34 +301,49 @@ class FaersBN:
         plt.close(fig)
         print(f"[BBN-PLOT] Salvate Heatmap in: {path}")
 
-    def train_and_save(self) -> None:
+    def train_and_save(self, counts: pd.DataFrame = None) -> None:
         """
         Addestra l'architettura Bayesiana, ne calcola le statistiche di
         Goodness-of-Fit e serializza il modello, i report e i grafici.
+
+        Args:
+            counts (pd.DataFrame, optional): Tabella di contingenza già calcolata
+                da `count_sink` (es. nella passata di lettura condivisa con il
+                Random Forest). Se assente, il dataset viene letto qui.
         """
-        if not os.path.exists(self.dataset_path):
+        if counts is None and not os.path.exists(self.dataset_path):
             print(f"❌ [BBN-ERROR] Dataset FAERS non trovato in {self.dataset_path}.")
             return
 
-        print(f"[BBN-LEARN] Caricamento dataset FAERS unificato da: {self.dataset_path}")
-        df_raw = pd.read_csv(self.dataset_path)
-        df_raw = df_raw.dropna(subset=['AGE', 'WEIGHT', 'TARGET'])
-
-        print("[BBN-LEARN] Discretizzazione delle variabili biomediche in corso...")
-        df_train = self._build_train_dataframe(df_raw)
+        tracemalloc.start()
+        start = time.perf_counter()
+        if counts is None:
+            print(f"[BBN-LEARN] Lettura a blocchi e aggregazione del dataset FAERS da: {self.dataset_path}")
+            counts = self._aggregate_counts()
+        else:
+            print("[BBN-LEARN] Uso della tabella di contingenza fornita dalla passata condivisa...")
+        aggregation_seconds = time.perf_counter() - start
+        training_samples = int(counts['_weight'].sum())
+        print(f"    ✓ {training_samples} campioni ridotti a {len(counts)} configurazioni "
+              f"in {aggregation_seconds:.2f} s")
 
         print("[BBN-LEARN] Costruzione del Grafo Bayesiano Diretto (DAG)...")
-        edges = [('AgeGroup', 'IsFragile'), ('WeightGroup', 'IsFragile'), ('HasConcomitant', 'IsFragile')]
-        self.network = DiscreteBayesianNetwork(edges)
+        self.network = DiscreteBayesianNetwork(BN_EDGES)
 
-        print("[BBN-LEARN] Apprendimento delle distribuzioni probabilistiche (CPT)...")
-        self.network.fit(data=df_train, estimator=BayesianEstimator, prior_type="BDeu", equivalent_sample_size=10)
+        print("[BBN-LEARN] Apprendimento delle distribuzioni probabilistiche (CPT) dai conteggi...")
+        start = time.perf_counter()
+        self.network.fit(
+            data=counts, estimator=BayesianEstimator, prior_type="BDeu",
+            equivalent_sample_size=EQUIVALENT_SAMPLE_SIZE, weighted=True
+        )
 
         # Calcolo delle metriche di Goodness of Fit
         print("[BBN-LEARN] Calcolo statistiche di Goodness-of-Fit (BIC, BDeu)...")
-        bdeu_score = BDeu(df_train, equivalent_sample_size=10).score(self.network)
-        bic_score = BIC(df_train).score(self.network)
-        
+        bdeu_score, bic_score = self._score_from_counts(counts)
+        fit_seconds = time.perf_counter() - start
+        _, peak_memory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
         print(f"    ✓ BDeu Score: {bdeu_score:.4f}")
         print(f"    ✓ BIC Score:  {bic_score:.4f}")
 
@@ -249,10 +368,17 @@ class FaersBN:
                 'edges': list(self.network.edges())
             },
             'estimator': 'BayesianEstimator (BDeu, equivalent_sample_size=10)',
-            'training_samples': len(df_train),
+            'training_samples': training_samples,
+            'aggregated_configurations': len(counts),
             'goodness_of_fit_metrics': {
                 'bdeu_score': round(bdeu_score, 4),
                 'bic_score': round(bic_score, 4)
+            },
+            'training_profile': {
+                'aggregation_seconds': round(aggregation_seconds, 3),
+                'fit_seconds': round(fit_seconds, 3),
+                'peak_memory_mb': round(peak_memory / 2**20, 2),
+                'chunk_size': DEFAULT_CHUNK_SIZE
             }
         }
         
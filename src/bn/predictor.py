@@ -1,10 +1,19 @@
 # File: src/bn/predictor.py
 
 import os
+import sys
+import threading
 import joblib
+import numpy as np
 import pandas as pd
 from pgmpy.inference import VariableElimination
 
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from src.metrics import get_metrics
+
+metrics = get_metrics()
+
 class BNPredictor:
     """
     Modulo di Inferenza in Real-Time per la Rete Bayesiana.
@@ -23,6 +32,9 @@ class BNPredictor:
         
         self.network = None
         self.inference_engine = None
+        # VariableElimination conserva sull'istanza i fattori della query in corso:
+        # le inferenze da thread diversi (es. il pool di TherapyOptimizer) vanno serializzate
+        self._lock = threading.Lock()
         
         self._load_model()
 
@@ -32,15 +44,34 @@ class BNPredictor:
         """
         if os.path.exists(self.model_path):
             try:
-                data = joblib.load(self.model_path)
-                self.network = data.get('network')
-                if self.network:
-                    self.inference_engine = VariableElimination(self.network)
+                self.install(*self.read_model())
             except Exception as e:
                 print(f"[BN-PREDICT] Errore nel caricamento del modello Bayesiano: {e}")
         else:
             print(f"[BN-PREDICT] Modello non trovato in {self.model_path}. Eseguire prima il learner.")
 
+    def read_model(self) -> tuple:
+        """
+        Legge da disco la rete e ne prepara il motore di inferenza, senza
+        sostituire quelli in uso.
+
+        Returns:
+            tuple: (rete, motore VariableElimination), oppure (None, None) se
+                il file non contiene una rete.
+        """
+        network = joblib.load(self.model_path).get('network')
+        return network, VariableElimination(network) if network else None
+
+    def install(self, network, inference_engine) -> None:
+        """
+        Sostituisce rete e motore di inferenza in uso.
+
+        Lo scambio avviene sotto lo stesso lock delle inferenze: nessuna query
+        osserva una rete e un motore di versioni diverse.
+        """
+        with self._lock:
+            self.network, self.inference_engine = network, inference_engine
+
     def _discretize_age(self, age: float) -> str:
         """Discretizza l'età continua nella corrispondente categoria clinica."""
         if age < 18:
@@ -59,6 +90,7 @@ class BNPredictor:
         else:
             return 'overweight'
 
+    @metrics.timed('bn.patient_fragility')
     def get_patient_fragility(self, age: float, weight: float, concomitant: list) -> float:
         """
         Calcola l'indice di fragilità sistemica del paziente tramite inferenza.
@@ -74,30 +106,88 @@ class BNPredictor:
         if not self.inference_engine:
             return 0.5
 
+        return self._query_fragility(
+            self._discretize_age(age),
+            self._discretize_weight(weight),
+            self._has_concomitant(concomitant)
+        )
+
+    def evidence_key(self, age: float, weight: float, concomitant: list) -> tuple:
+        """
+        Restituisce l'evidenza discretizzata usata da `get_patient_fragility`:
+        profili con la stessa chiave hanno la stessa fragilità.
+
+        Returns:
+            tuple: (fascia d'età, fascia di peso, presenza di comorbidità),
+                oppure una tupla vuota in assenza del modello.
+        """
+        if not self.inference_engine:
+            return ()
+        return (self._discretize_age(age), self._discretize_weight(weight), self._has_concomitant(concomitant))
+
+    @metrics.timed('bn.cohort_fragility')
+    def get_cohort_fragility(self, age, weight, concomitant) -> np.ndarray:
+        """
+        Calcola l'indice di fragilità per una coorte di pazienti.
+
+        L'evidenza della rete ha al più 18 configurazioni (3 fasce d'età × 3 fasce
+        di peso × presenza di comorbidità): la discretizzazione è vettoriale e
+        l'inferenza viene eseguita una sola volta per configurazione osservata.
+
+        Args:
+            age (array-like): Età dei pazienti in anni (N,).
+            weight (array-like): Peso corporeo in chilogrammi (N,).
+            concomitant (array-like): Anamnesi di ogni paziente.
+
+        Returns:
+            np.ndarray: P(IsFragile=1 | evidenza) per ogni paziente (N,).
+        """
+        if not self.inference_engine:
+            return np.full(len(age), 0.5)
+
+        age = np.asarray(age, dtype=float)
+        weight = np.asarray(weight, dtype=float)
+        evidence = pd.DataFrame({
+            'AgeGroup': np.select([age < 18, age < 65], ['pediatric', 'adult'], 'geriatric'),
+            'WeightGroup': np.select([weight < 50, weight <= 90], ['underweight', 'normal'], 'overweight'),
+            'HasConcomitant': [self._has_concomitant(c) for c in concomitant]
+        })
+        codes, groups = pd.MultiIndex.from_frame(evidence).factorize()
+        values = np.array([self._query_fragility(*group) for group in groups], dtype=float)
+        return values[codes]
+
+    def _has_concomitant(self, concomitant) -> str:
+        """
+        Restituisce "1" se l'anamnesi contiene almeno una voce diversa da 'none'.
+
+        Come in `RiskPredictor`, un'anamnesi che non sia una stringa o una lista
+        (NaN o None di una coorte colonnare) è trattata come vuota e le voci non
+        testuali sono ignorate.
+        """
         if isinstance(concomitant, str):
             concomitant = [concomitant]
-
-        age_group = self._discretize_age(age)
-        weight_group = self._discretize_weight(weight)
-        
-        has_conc = "0"
+        elif not pd.api.types.is_list_like(concomitant):
+            concomitant = []
         for c in concomitant:
-            if c and c.lower().strip() != 'none':
-                has_conc = "1"
-                break
+            if isinstance(c, str) and c.lower().strip() != 'none':
+                return "1"
+        return "0"
 
+    def _query_fragility(self, age_group: str, weight_group: str, has_conc: str) -> float:
+        """Esegue l'inferenza di P(IsFragile=1) per una configurazione dell'evidenza."""
         try:
-            query_result = self.inference_engine.query(
-                variables=['IsFragile'],
-                evidence={
-                    'AgeGroup': age_group,
-                    'WeightGroup': weight_group,
-                    'HasConcomitant': has_conc
-                },
-                show_progress=False
-            )
+            with self._lock:
+                query_result = self.inference_engine.query(
+                    variables=['IsFragile'],
+                    evidence={
+                        'AgeGroup': age_group,
+                        'WeightGroup': weight_group,
+                        'HasConcomitant': has_conc
+                    },
+                    show_progress=False
+                )
             state_idx = query_result.state_names['IsFragile'].index("1")
             return float(query_result.values[state_idx])
         except Exception as e:
             print(f"[BN-PREDICT] Errore inferenza Bayesiana: {e}. Fallback a 0.5")
-            return 0.5
\ No newline at end of file
+            return 0.5
@@ -0,0 +1,144 @@
+# File: src/kb/atoms.py
+
+"""
+Registro condiviso degli atomi Prolog.
+Carica una sola volta per processo il dizionario `atom_mapping.json` e
+fornisce la traduzione bidirezionale tra atomi Prolog e nomi originali
+del catalogo WHO a tutti i moduli (ricerca, euristica, CLI).
+"""
+
+import os
+import sys
+import json
+import threading
+
+DEFAULT_MAPPING_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "prolog", "atom_mapping.json")
+
+
+def read_mapping(mapping_path: str) -> tuple:
+    """
+    Legge e indicizza il dizionario `atom_mapping.json`.
+
+    Args:
+        mapping_path (str): Percorso del dizionario JSON atomo → nome.
+
+    Returns:
+        tuple: (atomo → nome originale, nome originale → atomo), vuoti se il
+            file non esiste.
+    """
+    to_name, to_atom = {}, {}
+    if os.path.exists(mapping_path):
+        with open(mapping_path, 'r', encoding='utf-8') as f:
+            raw = json.load(f)
+        for atom, name in raw.items():
+            atom, name = sys.intern(atom), sys.intern(name)
+            to_name[atom] = name
+            to_atom.setdefault(name, atom)
+    else:
+        print(f"[KB-WARN] Mapping degli atomi non trovato: {mapping_path}")
+    return to_name, to_atom
+
+
+class AtomRegistry:
+    """
+    Dizionario bidirezionale atomo Prolog ↔ nome originale.
+
+    Il caricamento del file JSON è pigro (alla prima interrogazione) e
+    protetto da lock, così che il registro possa essere condiviso tra thread.
+    Chiavi e valori sono internati con `sys.intern`: le stringhe degli atomi
+    restituite da PySwip e dalle tabelle della ricerca vengono confrontate
+    per identità nei lookup e non sono duplicate in memoria.
+
+    Attributes:
+        mapping_path (str): Percorso del file `atom_mapping.json`.
+    """
+
+    def __init__(self, mapping_path: str = DEFAULT_MAPPING_PATH):
+        """
+        Inizializza il registro senza leggere il file.
+
+        Args:
+            mapping_path (str): Percorso del dizionario JSON atomo → nome.
+        """
+        self.mapping_path = mapping_path
+        self._to_name = None
+        self._to_atom = None
+        self._lock = threading.Lock()
+
+    def _ensure_loaded(self) -> None:
+        """Legge e indicizza il dizionario alla prima richiesta."""
+        if self._to_name is not None:
+            return
+        with self._lock:
+            if self._to_name is not None:
+                return
+            self.install(*read_mapping(self.mapping_path))
+
+    def install(self, to_name: dict, to_atom: dict) -> None:
+        """
+        Sostituisce il dizionario in uso (es. dopo la rigenerazione dell'A-Box).
+
+        Args:
+            to_name (dict): Mappa atomo → nome originale, da `read_mapping`.
+            to_atom (dict): Mappa nome originale → atomo.
+        """
+        self._to_atom = to_atom
+        self._to_name = to_name
+
+    def original_name(self, atom: str) -> str:
+        """
+        Traduce un atomo Prolog nel nome originale del catalogo.
+
+        Args:
+            atom (str): L'atomo Prolog (es. 'acetylsalicylic_acid').
+
+        Returns:
+            str: Il nome originale, oppure l'atomo invariato se assente.
+        """
+        self._ensure_loaded()
+        return self._to_name.get(atom, atom)
+
+    def atom_for(self, original_name: str):
+        """
+        Traduce un nome originale del catalogo nel relativo atomo Prolog.
+
+        Se più atomi condividono lo stesso nome viene restituito il primo
+        registrato nel dizionario.
+
+        Args:
+            original_name (str): Il nome originale (es. 'acetylsalicylic acid').
+
+        Returns:
+            str | None: L'atomo Prolog, oppure None se il nome è sconosciuto.
+        """
+        self._ensure_loaded()
+        return self._to_atom.get(original_name)
+
+    def __contains__(self, atom: str) -> bool:
+        """Verifica se l'atomo è presente nel registro."""
+        self._ensure_loaded()
+        return atom in self._to_name
+
+    def __len__(self) -> int:
+        """Numero di atomi registrati."""
+        self._ensure_loaded()
+        return len(self._to_name)
+
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def get_atom_registry() -> AtomRegistry:
+    """
+    Restituisce il registro degli atomi condiviso dal processo.
+
+    Returns:
+        AtomRegistry: L'istanza unica, creata alla prima chiamata.
+    """
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = AtomRegistry()
+    return _registry
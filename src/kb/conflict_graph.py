@@ -0,0 +1,502 @@
+# File: src/kb/conflict_graph.py
+
+"""
+Grafo dei conflitti farmacologici (DDI) tra i candidati di una ricerca.
+
+All'inizio di `TherapyOptimizer.solve` l'universo dei farmaci che possono
+entrare in un regime è noto (i candidati delle patologie target). Invece di
+interrogare la T-Box per ogni regime, i conflitti di tutte le coppie vengono
+calcolati in blocco e memorizzati come bitset per farmaco: vicini con
+conflitto 'high' e vicini con conflitto 'medium'. La validità di un regime
+diventa un AND tra bitset e la penalità 'medium' un conteggio di bit.
+
+I bitset vengono forniti dal backend della KB (`conflict_bitsets`):
+
+  - `SnapshotInterface` li costruisce dalle coppie materializzate nello snapshot;
+  - `PrologInterface` li deriva con `rule_conflicts` dalle regole per
+    prefisso ATC di `check_pair_safety/3` in `reasoning.pl`, come OR dei
+    bitset dei farmaci che possiedono ciascun prefisso, senza matrici N×N
+    intermedie: la memoria è quella dei bitset (al più N²/8 byte per tipo).
+
+Come in `therapy_conflicts/2`, per ogni coppia vale la prima regola che ha
+successo. La coppia viene valutata con il primo farmaco in ordine
+alfabetico (la stessa convenzione dello snapshot): l'ordine conta solo per
+coppie che soddisfano classi `dangerous_classes/4` di severità diverse.
+
+I prefissi delle regole cablate (antagonismo sulla pressione, cascata
+prescrittiva, livello della duplicazione) replicano `reasoning.pl`:
+`PrologInterface` verifica con `check_rule_parity` che le due versioni
+coincidano dopo ogni caricamento della T-Box e, in caso contrario, non
+fornisce il grafo.
+
+Uso:
+    python src/kb/conflict_graph.py check                      # confronta le regole con Prolog
+    python src/kb/conflict_graph.py check --kb-dir /tmp/kb_x10 # ... su una KB ingrandita
+"""
+
+import os
+import sys
+import random
+import argparse
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from src.kb.snapshot import SEVERITY_CODES
+
+# Prefissi ATC delle regole di `check_pair_safety/3` (sezione 5 di reasoning.pl)
+BP_ANTAGONISM = ('r03', 'c07')          # increases_bp/1 × decreases_bp/1, 'high'
+PRESCRIBING_CASCADE = ('m01a', 'c09a')  # FANS × ACE-inibitore, 'medium'
+DUPLICATION_LEVEL = 4                   # stesso sottogruppo atc_l4/2, 'medium'
+
+# Severità non riconosciute dall'A* (nessuna penalità), ma che bloccano le regole successive
+OTHER_SEVERITY = max(SEVERITY_CODES.values()) + 1
+
+
+def _severity_code(severity: str) -> int:
+    return SEVERITY_CODES.get(severity, OTHER_SEVERITY)
+
+
+def prefix_members(code_drug: np.ndarray, codes: np.ndarray, prefixes) -> dict:
+    """
+    Calcola quali farmaci hanno almeno un codice ATC che inizia con ciascun prefisso.
+
+    Per ogni lunghezza di prefisso i codici vengono troncati in blocco e
+    cercati nell'indice dei prefissi di quella lunghezza.
+
+    Args:
+        code_drug (np.ndarray): Indice del farmaco di ogni codice (C,).
+        codes (np.ndarray): Codici ATC (C,).
+        prefixes (iterable[str]): Prefissi da verificare.
+
+    Returns:
+        dict: Mappa {prefisso: indici ordinati dei farmaci (np.ndarray)}.
+    """
+    members = {}
+    by_length = {}
+    for prefix in prefixes:
+        by_length.setdefault(len(prefix), set()).add(prefix)
+    for length, table in by_length.items():
+        distinct = sorted(table)
+        found = pd.Index(distinct).get_indexer(codes.astype(f'<U{length}'))
+        hit = found >= 0
+        keys, drugs = found[hit], code_drug[hit]
+        order = np.lexsort((drugs, keys))
+        keys, drugs = keys[order], drugs[order]
+        bounds = np.searchsorted(keys, np.arange(len(distinct) + 1))
+        for k, prefix in enumerate(distinct):
+            members[prefix] = np.unique(drugs[bounds[k]:bounds[k + 1]])
+    return members
+
+
+class _BitsetBuilder:
+    """Converte insiemi di indici in bitset riusando un'unica riga booleana di lavoro."""
+
+    def __init__(self, n: int):
+        self._row = np.zeros(n, dtype=bool)
+
+    def __call__(self, indices: np.ndarray) -> int:
+        if not len(indices):
+            return 0
+        self._row[indices] = True
+        bits = int.from_bytes(np.packbits(self._row, bitorder='little').tobytes(), 'little')
+        self._row[indices] = False
+        return bits
+
+
+def _bit_indices(mask: int):
+    """Indici dei bit accesi di un bitset, in ordine crescente."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def _first_class_severity(codes1: list, codes2: list, classes: list) -> int:
+    """
+    Severità della prima soluzione delle due clausole `dangerous_classes/4`
+    di `check_pair_safety(Drug1, Drug2, _)`, nell'ordine di enumerazione di Prolog.
+    """
+    for swapped in (False, True):
+        for atc1 in codes1:
+            for atc2 in codes2:
+                for c1, c2, severity in classes:
+                    left, right = (atc2, atc1) if swapped else (atc1, atc2)
+                    if left.startswith(c1) and right.startswith(c2):
+                        return _severity_code(severity)
+    return 0
+
+
+def rule_conflicts(drugs: list, atc_codes: list, dangerous_classes: list) -> tuple:
+    """
+    Deriva i vicini in conflitto di ogni farmaco dalle regole per prefisso ATC
+    di `check_pair_safety/3`.
+
+    Le regole vengono applicate in ordine di priorità e ogni coppia riceve la
+    severità della prima che la riguarda: antagonismo sulla pressione,
+    classi pericolose, cascata prescrittiva, duplicazione terapeutica. Per
+    ogni prefisso (e sottogruppo di livello 4) viene costruito il bitset dei
+    farmaci che lo possiedono; i vicini di un farmaco sono l'OR dei bitset
+    dei prefissi complementari ai suoi, senza matrici N×N intermedie.
+
+    Args:
+        drugs (list[str]): Farmaci, nell'ordine in cui compaiono come Drug1.
+        atc_codes (list[list[str]]): Codici ATC di ciascun farmaco, nell'ordine
+            dei fatti `has_atc_code/2`.
+        dangerous_classes (list[tuple]): Fatti (Classe1, Classe2, Severità) di
+            `dangerous_classes/4`, nell'ordine della T-Box.
+
+    Returns:
+        tuple: (hard, medium), liste di N bitset con i vicini 'high' e
+            'medium' di ciascun farmaco (bit i = drugs[i]).
+    """
+    n = len(drugs)
+    code_drug = np.repeat(np.arange(n), [len(codes) for codes in atc_codes])
+    codes = np.array([code for drug_codes in atc_codes for code in drug_codes], dtype=str)
+    hard, medium = [0] * n, [0] * n
+    if not len(codes):
+        return hard, medium
+    to_bitset = _BitsetBuilder(n)
+
+    def link(accumulator: list, left: np.ndarray, right: np.ndarray) -> None:
+        """Collega ogni farmaco di `left` a tutti quelli di `right` e viceversa."""
+        left_bits, right_bits = to_bitset(left), to_bitset(right)
+        for i in left.tolist():
+            accumulator[i] |= right_bits
+        for i in right.tolist():
+            accumulator[i] |= left_bits
+
+    members = prefix_members(code_drug, codes, BP_ANTAGONISM + PRESCRIBING_CASCADE +
+                             tuple(prefix for c in dangerous_classes for prefix in c[:2]))
+
+    # 1. Antagonismo fisiopatologico sulla pressione arteriosa
+    link(hard, members[BP_ANTAGONISM[0]], members[BP_ANTAGONISM[1]])
+    # Coppie già decise da una regola a priorità più alta
+    decided = list(hard)
+
+    # 2. Classi pericolose: un insieme di vicini per severità; le coppie che
+    #    soddisfano classi di severità diverse seguono l'ordine di Prolog
+    if dangerous_classes:
+        by_code = {}
+        first_of, second_of = {}, {}
+        for k, (c1, c2, severity) in enumerate(dangerous_classes):
+            link(by_code.setdefault(_severity_code(severity), [0] * n), members[c1], members[c2])
+            for i in members[c1].tolist():
+                first_of.setdefault(i, set()).add(k)
+            for i in members[c2].tolist():
+                second_of.setdefault(i, set()).add(k)
+        resolved = {}
+        for i in range(n):
+            matched = {code: neighbours[i] & ~decided[i] for code, neighbours in by_code.items()}
+            seen = overlap = 0
+            for bits in matched.values():
+                overlap |= seen & bits
+                seen |= bits
+            for j in _bit_indices(overlap):
+                a, b = min(i, j), max(i, j)
+                winner = resolved.pop((a, b), None)
+                if winner is None:
+                    # Solo le classi soddisfatte dalla coppia, nell'ordine della T-Box
+                    candidates = sorted(first_of.get(a, set()) & second_of.get(b, set()) |
+                                        first_of.get(b, set()) & second_of.get(a, set()))
+                    winner = resolved[(a, b)] = _first_class_severity(
+                        atc_codes[a], atc_codes[b], [dangerous_classes[k] for k in candidates])
+                for code in matched:
+                    matched[code] = matched[code] | (1 << j) if code == winner else matched[code] & ~(1 << j)
+            hard[i] |= matched.get(SEVERITY_CODES['high'], 0)
+            medium[i] |= matched.get(SEVERITY_CODES['medium'], 0)
+            decided[i] |= seen
+        del by_code, first_of, second_of
+
+    # 3. Cascata prescrittiva
+    cascade = [0] * n
+    link(cascade, members[PRESCRIBING_CASCADE[0]], members[PRESCRIBING_CASCADE[1]])
+    for i in range(n):
+        if cascade[i]:
+            medium[i] |= cascade[i] & ~decided[i]
+            decided[i] |= cascade[i]
+    del cascade
+
+    # 4. Duplicazione terapeutica: almeno un sottogruppo di livello 4 in comune
+    subgroups = prefix_members(code_drug, codes, set(codes.astype(f'<U{DUPLICATION_LEVEL}').tolist()))
+    for group in subgroups.values():
+        if len(group) > 1:
+            bits = to_bitset(group)
+            for i in group.tolist():
+                medium[i] |= bits & ~decided[i]
+
+    # Un farmaco non entra mai in coppia con sé stesso: le regole per prefisso
+    # (es. due codici dello stesso farmaco in classi pericolose) non valgono
+    for i in range(n):
+        self_bit = 1 << i
+        hard[i] &= ~self_bit
+        medium[i] &= ~self_bit
+    return hard, medium
+
+
+def pair_conflicts(n: int, left: np.ndarray, right: np.ndarray, severity: np.ndarray) -> tuple:
+    """
+    Costruisce i bitset dei vicini da un elenco di coppie in conflitto.
+
+    Args:
+        n (int): Numero di farmaci dell'universo.
+        left, right (np.ndarray): Posizioni dei due farmaci di ogni coppia.
+        severity (np.ndarray): Codice `SEVERITY_CODES` di ogni coppia.
+
+    Returns:
+        tuple: (hard, medium), come `rule_conflicts`.
+    """
+    to_bitset = _BitsetBuilder(n)
+    result = []
+    for code in (SEVERITY_CODES['high'], SEVERITY_CODES['medium']):
+        selected = (severity == code) & (left != right)
+        rows = np.concatenate([left[selected], right[selected]])
+        cols = np.concatenate([right[selected], left[selected]])
+        order = np.argsort(rows, kind='stable')
+        rows, cols = rows[order], cols[order]
+        bounds = np.searchsorted(rows, np.arange(n + 1))
+        result.append([to_bitset(cols[bounds[i]:bounds[i + 1]]) for i in range(n)])
+    return tuple(result)
+
+
+class ConflictGraph:
+    """
+    Grafo dei conflitti di un universo di farmaci, con un bitset di vicini per farmaco.
+
+    Attributes:
+        drugs (list[str]): Universo dei farmaci.
+        index (dict): Farmaco → posizione del suo bit.
+        hard (list[int]): Bitset dei farmaci in conflitto 'high' con ciascun farmaco.
+        medium (list[int]): Bitset dei farmaci in conflitto 'medium' con ciascun farmaco.
+    """
+
+    def __init__(self, drugs: list, hard: list, medium: list):
+        """
+        Args:
+            drugs (list[str]): Universo dei farmaci.
+            hard (list[int]): Vicini 'high' di ciascun farmaco (bit i = drugs[i]).
+            medium (list[int]): Vicini 'medium' di ciascun farmaco.
+        """
+        self.drugs = list(drugs)
+        self.index = {drug: i for i, drug in enumerate(self.drugs)}
+        self.hard = list(hard)
+        self.medium = list(medium)
+
+    def __len__(self) -> int:
+        return len(self.drugs)
+
+    def __contains__(self, drug: str) -> bool:
+        return drug in self.index
+
+    def covers(self, drugs) -> bool:
+        """True se tutti i farmaci indicati appartengono all'universo del grafo."""
+        return all(drug in self.index for drug in drugs)
+
+    def severity(self, i: int, j: int) -> str:
+        """Severità del conflitto tra i farmaci in posizione i e j ('high', 'medium' o None)."""
+        if self.hard[i] >> j & 1:
+            return 'high'
+        if self.medium[i] >> j & 1:
+            return 'medium'
+        return None
+
+    def assess(self, current_drugs, new_drug: str) -> tuple:
+        """
+        Valuta il regime ottenuto aggiungendo `new_drug` ai farmaci correnti.
+
+        Il regime corrente non contiene conflitti 'high' (l'A* non genera
+        nodi non sicuri): basta confrontare i vicini del nuovo farmaco.
+
+        Args:
+            current_drugs (iterable[str]): Farmaci già nel regime.
+            new_drug (str): Farmaco da aggiungere.
+
+        Returns:
+            tuple: (conflitto 'high' presente, numero di coppie 'medium' del
+                regime risultante), oppure None se un farmaco è esterno all'universo.
+        """
+        new_id = self.index.get(new_drug)
+        ids = [self.index.get(drug) for drug in current_drugs]
+        if new_id is None or None in ids:
+            return None
+
+        mask = 0
+        for i in ids:
+            mask |= 1 << i
+        if self.hard[new_id] & mask:
+            return True, 0
+        existing = sum((self.medium[i] & mask).bit_count() for i in ids) // 2
+        return False, existing + (self.medium[new_id] & mask).bit_count()
+
+
+def parity_probe(atc_codes: dict, dangerous_classes: list, size: int = 60, seed: int = 42) -> list:
+    """
+    Sceglie un piccolo insieme di farmaci che esercita ogni regola di `rule_conflicts`.
+
+    Per ogni prefisso delle regole cablate (antagonismo sulla pressione,
+    cascata prescrittiva) e per un campione delle classi `dangerous_classes/4`
+    vengono inclusi farmaci che lo possiedono, più una coppia dello stesso
+    sottogruppo di livello 4; il resto del campione è casuale.
+
+    Args:
+        atc_codes (dict): Mappa {farmaco: [codici ATC]} dell'A-Box.
+        dangerous_classes (list[tuple]): Fatti (Classe1, Classe2, Severità).
+        size (int): Dimensione indicativa del campione.
+        seed (int): Seed del campionamento.
+
+    Returns:
+        list[str]: Farmaci del campione, in ordine alfabetico.
+    """
+    drugs = sorted(atc_codes)
+    if not drugs:
+        return []
+    code_drug = np.repeat(np.arange(len(drugs)), [len(atc_codes[drug]) for drug in drugs])
+    codes = np.array([code for drug in drugs for code in atc_codes[drug]], dtype=str)
+
+    rng = random.Random(seed)
+    classes = rng.sample(dangerous_classes, min(len(dangerous_classes), size // 4))
+    prefixes = BP_ANTAGONISM + PRESCRIBING_CASCADE + tuple(prefix for c in classes for prefix in c[:2])
+    members = prefix_members(code_drug, codes, prefixes)
+    subgroups = prefix_members(code_drug, codes, set(codes.astype(f'<U{DUPLICATION_LEVEL}').tolist()))
+
+    probe = set()
+    for prefix in prefixes:
+        probe.update(rng.sample(members[prefix].tolist(), min(len(members[prefix]), 2)))
+    shared = [group for group in subgroups.values() if len(group) > 1]
+    if shared:
+        probe.update(rng.sample(rng.choice(shared).tolist(), 2))
+    while len(probe) < min(size, len(drugs)):
+        probe.add(rng.randrange(len(drugs)))
+    return sorted(drugs[i] for i in probe)
+
+
+def check_rule_parity(kb, size: int = 60, seed: int = 42) -> list:
+    """
+    Verifica che `rule_conflicts` riproduca `therapy_conflicts/2` sulla T-Box corrente.
+
+    I prefissi delle regole di `check_pair_safety/3` sono replicati in questo
+    modulo: se `reasoning.pl` cambia (es. dopo un ricaricamento a caldo) le
+    due versioni possono divergere. Il controllo valuta con una sola chiamata
+    a `therapy_conflicts/2` tutte le coppie di `parity_probe` e le confronta
+    con i bitset derivati dalle regole. Una regola nuova che non riguarda i
+    prefissi noti viene rilevata solo se colpisce le coppie casuali del campione.
+
+    Args:
+        kb (PrologInterface): Interfaccia verso la KB live.
+        size (int): Dimensione indicativa del campione.
+        seed (int): Seed del campionamento.
+
+    Returns:
+        list[tuple]: Coppie divergenti (farmaco1, farmaco2, severità Prolog,
+            severità delle regole); vuota se le regole sono coerenti.
+    """
+    codes = kb.atc_codes()
+    classes = [(res['C1'], res['C2'], res['Severity'])
+               for res in kb.prolog.query("dangerous_classes(C1, C2, Severity, _)")]
+    probe = parity_probe(codes, classes, size=size, seed=seed)
+    graph = ConflictGraph(probe, *rule_conflicts(probe, [codes[drug] for drug in probe], classes))
+
+    live = {}
+    for conflict in kb.find_conflicts(probe):
+        if conflict['severity'] in SEVERITY_CODES:
+            live[conflict['drugs']] = conflict['severity']
+    return [(probe[i], probe[j], live.get((probe[i], probe[j])), graph.severity(i, j))
+            for i in range(len(probe)) for j in range(i + 1, len(probe))
+            if live.get((probe[i], probe[j])) != graph.severity(i, j)]
+
+
+def _expected_verdict(conflicts: list) -> tuple:
+    """(conflitto 'high' presente, coppie 'medium') dei conflitti di `therapy_conflicts/2`."""
+    severities = [conflict['severity'] for conflict in conflicts]
+    if 'high' in severities:
+        return True, 0
+    return False, severities.count('medium')
+
+
+def check_conflict_graph(kb, n_samples: int = 2000, n_regimens: int = 300, seed: int = 42) -> dict:
+    """
+    Confronta il grafo dei conflitti con `therapy_conflicts/2`.
+
+    L'universo è l'insieme dei farmaci approvati per almeno una patologia.
+    Vengono confrontate la diagonale (nessun farmaco in conflitto con sé
+    stesso), tutte le coppie in conflitto secondo le regole, un
+    campione riproducibile di coppie senza conflitto e `n_regimens` regimi
+    di 3-6 farmaci costruiti come nell'A* (un farmaco alla volta, finché
+    non compare un conflitto 'high'), valutati con `ConflictGraph.assess`.
+    Su una KB con classi `dangerous_classes/4` di severità diverse (es.
+    generata da `benchmarks/enlarged_kb.py`) il confronto copre anche
+    l'ordine di valutazione delle coppie che ne soddisfano più di una.
+
+    Args:
+        kb (PrologInterface): Interfaccia verso la KB live.
+        n_samples (int): Coppie senza conflitto da campionare.
+        n_regimens (int): Regimi da verificare.
+        seed (int): Seed del campionamento.
+
+    Returns:
+        dict: Report con l'esito ('consistent'), le coppie e i regimi
+            verificati e le discrepanze.
+    """
+    drugs = sorted({res['Drug'] for res in kb.prolog.query("approved_for(Drug, _, _)")})
+    graph = ConflictGraph(drugs, *kb.conflict_bitsets(drugs))
+
+    rng = random.Random(seed)
+    conflicting = [(i, j) for i in range(len(drugs))
+                   for j in _bit_indices((graph.hard[i] | graph.medium[i]) >> (i + 1) << (i + 1))]
+    pairs = conflicting + [(i, j) for i, j in ((rng.randrange(len(drugs)), rng.randrange(len(drugs)))
+                                               for _ in range(n_samples)) if i < j and graph.severity(i, j) is None]
+
+    # Un farmaco non è mai in conflitto con sé stesso (Prolog non valuta la coppia)
+    mismatches = [(drug, drug, None, graph.severity(i, i))
+                  for i, drug in enumerate(drugs) if graph.severity(i, i) is not None]
+    for i, j in pairs:
+        live = kb.find_conflicts([drugs[i], drugs[j]])
+        expected = live[0]['severity'] if live else None
+        if expected not in SEVERITY_CODES:
+            expected = None
+        if expected != graph.severity(i, j):
+            mismatches.append((drugs[i], drugs[j], expected, graph.severity(i, j)))
+
+    # Regimi: farmaci in conflitto con qualcuno, per esercitare i conteggi 'medium'
+    involved = sorted({drugs[k] for pair in conflicting for k in pair})
+    regimens = 0
+    for _ in range(n_regimens if len(involved) >= 6 else 0):
+        regimen = []
+        for drug in rng.sample(involved, rng.randint(3, 6)):
+            verdict = graph.assess(regimen, drug)
+            regimen.append(drug)
+            if len(regimen) < 2:
+                continue
+            regimens += 1
+            expected = _expected_verdict(kb.find_conflicts(sorted(regimen)))
+            if verdict != expected:
+                mismatches.append((tuple(sorted(regimen)), expected, verdict))
+            if verdict[0]:
+                break
+
+    return {'consistent': not mismatches, 'drugs': len(drugs), 'pairs_checked': len(pairs),
+            'regimens_checked': regimens, 'mismatches': mismatches}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="SafeTherapy - Grafo dei conflitti DDI")
+    parser.add_argument("command", choices=["check"], help="Verifica le regole vettoriali contro Prolog")
+    parser.add_argument("--samples", type=int, default=2000, help="Coppie senza conflitto da verificare")
+    parser.add_argument("--regimens", type=int, default=300, help="Regimi di 3-6 farmaci da verificare")
+    parser.add_argument("--kb-dir", type=str, default=None,
+                        help="Directory di una KB alternativa (reasoning.pl + facts.pl), es. una KB ingrandita")
+    args = parser.parse_args()
+
+    from src.kb.interface import PrologInterface
+    rule_file = os.path.join(args.kb_dir, "reasoning.pl") if args.kb_dir else None
+    result = check_conflict_graph(PrologInterface(rule_file=rule_file), n_samples=args.samples,
+                                  n_regimens=args.regimens)
+    print(f"[KB-DDI] Farmaci candidati : {result['drugs']}")
+    print(f"[KB-DDI] Coppie verificate : {result['pairs_checked']}")
+    print(f"[KB-DDI] Regimi verificati : {result['regimens_checked']}")
+    print(f"[KB-DDI] Divergenze        : {len(result['mismatches'])}")
+    for mismatch in result['mismatches'][:10]:
+        print(f"   - {mismatch}")
+    print("✅ Regole coerenti con la KB live." if result['consistent'] else "❌ Regole NON coerenti.")
+    sys.exit(0 if result['consistent'] else 1)
@@ -0,0 +1,444 @@
+# File: src/kb/engine_pool.py
+
+"""
+Pool di motori SWI-Prolog per interrogazioni concorrenti della Knowledge Base.
+
+Un'istanza `pyswip.Prolog` non può essere condivisa tra thread Python: PySwip
+tiene traccia della query aperta con un flag di classe e ogni thread deve
+avere un proprio motore SWI-Prolog collegato. Questo modulo mantiene un
+insieme di motori, ciascuno vincolato a un thread worker dedicato, e offre
+un'API di prelievo/restituzione (checkout/checkin) con metriche sui tempi
+di attesa in coda.
+
+Il database delle clausole di SWI-Prolog è condiviso tra i thread: le regole
+di `reasoning.pl` (e i fatti di `facts.pl`) vengono quindi consultate una sola
+volta e sono visibili a tutti i motori. Le tabelle di `approved_for/3` e dei
+classificatori sono invece private di ciascun motore e si riscaldano in modo
+indipendente.
+"""
+
+import os
+import sys
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from concurrent.futures import Future
+
+from pyswip import Prolog
+from pyswip.prolog import PrologError, normalize_values
+from pyswip.easy import getTerm
+from pyswip.core import (
+    PL_STRING,
+    REP_UTF8,
+    PL_Q_NODEBUG,
+    PL_Q_CATCH_EXCEPTION,
+    PL_Q_NORMAL,
+    PL_open_foreign_frame,
+    PL_new_term_refs,
+    PL_put_chars,
+    PL_predicate,
+    PL_open_query,
+    PL_next_solution,
+    PL_copy_term_ref,
+    PL_exception,
+    PL_cut_query,
+    PL_discard_foreign_frame,
+)
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from src.kb.interface import PrologInterface
+
+
+class EngineProlog:
+    """
+    Runtime Prolog legato al motore SWI-Prolog del thread corrente.
+
+    Espone la stessa API `query` di `pyswip.Prolog`, ma registra la query
+    aperta sull'istanza anziché sul flag di classe condiviso da PySwip: motori
+    diversi possono così eseguire query contemporaneamente, mentre su uno
+    stesso motore le query annidate restano vietate.
+
+    Deve essere usato esclusivamente dal thread a cui il motore è collegato.
+    """
+
+    def __init__(self):
+        """Inizializza il runtime senza query aperte."""
+        self._query_open = False
+
+    def query(self, query: str, maxresult: int = -1, catcherrors: bool = True, normalize: bool = True):
+        """
+        Esegue una query Prolog e ne restituisce le soluzioni.
+
+        Args:
+            query (str): Il goal Prolog da risolvere.
+            maxresult (int): Numero massimo di soluzioni (-1 = tutte).
+            catcherrors (bool): Se True le eccezioni Prolog sono convertite in `PrologError`.
+            normalize (bool): Se True le soluzioni sono convertite in dizionari
+                di valori Python, come in PySwip.
+
+        Yields:
+            dict | list: Le soluzioni della query, nel formato di `pyswip.Prolog.query`.
+
+        Raises:
+            PrologError: Se il goal solleva un'eccezione o se una query è già
+                aperta su questo motore.
+        """
+        if self._query_open:
+            raise PrologError("Query annidata: l'ultima query del motore non è stata chiusa")
+
+        swipl_fid = PL_open_foreign_frame()
+        swipl_args = PL_new_term_refs(2)
+        swipl_goal = swipl_args
+        swipl_bindings = swipl_args + 1
+
+        PL_put_chars(swipl_goal, PL_STRING | REP_UTF8, -1, query.encode("utf-8"))
+        swipl_predicate = PL_predicate("pyrun", 2, None)
+
+        flags = PL_Q_NODEBUG | PL_Q_CATCH_EXCEPTION if catcherrors else PL_Q_NORMAL
+        swipl_qid = PL_open_query(None, flags, swipl_predicate, swipl_args)
+
+        self._query_open = True
+        try:
+            while maxresult and PL_next_solution(swipl_qid):
+                maxresult -= 1
+                term = getTerm(PL_copy_term_ref(swipl_bindings))
+                if not normalize:
+                    yield term
+                    continue
+                try:
+                    yield term.value
+                except AttributeError:
+                    solution = {}
+                    for binding in (x.value for x in term):
+                        solution.update(normalize_values(binding))
+                    yield solution
+
+            if PL_exception(swipl_qid):
+                error = getTerm(PL_exception(swipl_qid))
+                raise PrologError(f"Caused by: '{query}'. Returned: '{error}'.")
+        finally:
+            PL_cut_query(swipl_qid)
+            PL_discard_foreign_frame(swipl_fid)
+            self._query_open = False
+
+
+class PrologEngine:
+    """
+    Motore SWI-Prolog vincolato a un thread worker dedicato.
+
+    Le richieste vengono accodate al worker, che le esegue sul proprio motore
+    tramite un `PrologInterface` costruito sopra `EngineProlog`. Anche la
+    conversione dei termini Prolog in valori Python avviene nel worker, così
+    che nessun riferimento a termini o atomi SWI-Prolog attraversi i thread.
+
+    Attributes:
+        name (str): Nome del motore (e del relativo thread).
+    """
+
+    def __init__(self, name: str):
+        """
+        Avvia il thread worker e vi collega un nuovo motore SWI-Prolog.
+
+        Args:
+            name (str): Nome identificativo del motore.
+
+        Raises:
+            PrologError: Se SWI-Prolog non riesce a creare il motore.
+        """
+        self.name = name
+        self._jobs = queue.Queue()
+        self._ready = Future()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+        self._ready.result()
+
+    def _run(self) -> None:
+        """Ciclo del worker: collega il motore ed esegue le richieste in coda."""
+        try:
+            Prolog._init_prolog_thread()
+            kb = PrologInterface(prolog=EngineProlog())
+        except Exception as e:
+            self._ready.set_exception(e)
+            return
+        self._ready.set_result(True)
+
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                break
+            fn, args, future = job
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(fn(kb, *args))
+            except BaseException as e:
+                future.set_exception(e)
+
+    def call(self, fn, *args):
+        """
+        Esegue `fn(kb, *args)` nel thread del motore e ne attende il risultato.
+
+        Args:
+            fn (callable): Funzione che riceve il `PrologInterface` del motore.
+                Deve restituire solo valori Python (non termini Prolog).
+            *args: Argomenti aggiuntivi per `fn`.
+
+        Returns:
+            Il valore restituito da `fn`.
+        """
+        if not self._thread.is_alive():
+            raise RuntimeError(f"Il motore Prolog {self.name} è stato chiuso")
+        future = Future()
+        self._jobs.put((fn, args, future))
+        return future.result()
+
+    def query(self, goal: str, maxresult: int = -1) -> list:
+        """
+        Esegue una query generica sul motore.
+
+        Args:
+            goal (str): Il goal Prolog.
+            maxresult (int): Numero massimo di soluzioni (-1 = tutte).
+
+        Returns:
+            list[dict]: Le soluzioni normalizzate.
+        """
+        return self.call(lambda kb: list(kb.prolog.query(goal, maxresult=maxresult)))
+
+    def get_approvals(self, disease_atom: str) -> dict:
+        """Vedi `PrologInterface.get_approvals`."""
+        return self.call(PrologInterface.get_approvals, disease_atom)
+
+    def verify_therapy(self, drugs: list) -> dict:
+        """Vedi `PrologInterface.verify_therapy`."""
+        return self.call(PrologInterface.verify_therapy, drugs)
+
+    def find_conflicts(self, drugs: list) -> list:
+        """Vedi `PrologInterface.find_conflicts`."""
+        return self.call(PrologInterface.find_conflicts, drugs)
+
+    def atc_codes(self) -> dict:
+        """Vedi `PrologInterface.atc_codes`."""
+        return self.call(PrologInterface.atc_codes)
+
+    def conflict_bitsets(self, drugs: list) -> tuple:
+        """Vedi `PrologInterface.conflict_bitsets`."""
+        return self.call(PrologInterface.conflict_bitsets, drugs)
+
+    def close(self) -> None:
+        """Arresta il thread worker dopo le richieste già accodate."""
+        if self._thread.is_alive():
+            self._jobs.put(None)
+            self._thread.join()
+
+
+class PrologEnginePool:
+    """
+    Insieme di motori SWI-Prolog condivisi da più thread applicativi.
+
+    Ogni richiesta preleva un motore libero (`checkout`), lo usa in esclusiva
+    e lo restituisce (`checkin`); se tutti i motori sono occupati la richiesta
+    attende in coda. Il pool registra il numero di prelievi e i tempi di
+    attesa, utili a dimensionarlo rispetto al carico.
+
+    Esempio:
+        pool = PrologEnginePool(size=4)
+        with pool.engine() as engine:
+            report = engine.verify_therapy(['warfarin', 'ibuprofen'])
+
+    Attributes:
+        size (int): Numero di motori del pool.
+        kb (PrologInterface): Interfaccia del thread principale, usata per
+            consultare le regole una sola volta.
+    """
+
+    def __init__(self, size: int = None):
+        """
+        Carica le regole della KB e crea i motori del pool.
+
+        Args:
+            size (int, optional): Numero di motori. Default: numero di CPU.
+        """
+        self.size = size or os.cpu_count() or 1
+        self.kb = PrologInterface()
+
+        self._engines = [PrologEngine(f"prolog-engine-{i}") for i in range(self.size)]
+        self._idle = queue.LifoQueue()
+        for engine in self._engines:
+            self._idle.put(engine)
+
+        self._lock = threading.Lock()
+        self._closed = False
+        self._checkouts = 0
+        self._waited = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._in_use = 0
+        self._peak_in_use = 0
+
+    def checkout(self, timeout: float = None) -> PrologEngine:
+        """
+        Preleva un motore libero, attendendo se necessario.
+
+        Args:
+            timeout (float, optional): Attesa massima in secondi (None = illimitata).
+
+        Returns:
+            PrologEngine: Il motore, da restituire con `checkin`.
+
+        Raises:
+            TimeoutError: Se nessun motore si libera entro `timeout`.
+            RuntimeError: Se il pool è stato chiuso.
+        """
+        if self._closed:
+            raise RuntimeError("Il pool di motori Prolog è stato chiuso")
+
+        start = time.perf_counter()
+        try:
+            engine = self._idle.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError(f"Nessun motore Prolog libero entro {timeout} s") from None
+        wait = time.perf_counter() - start
+
+        with self._lock:
+            self._checkouts += 1
+            self._wait_total += wait
+            self._wait_max = max(self._wait_max, wait)
+            if wait > 1e-3:
+                self._waited += 1
+            self._in_use += 1
+            self._peak_in_use = max(self._peak_in_use, self._in_use)
+        return engine
+
+    def checkin(self, engine: PrologEngine) -> None:
+        """
+        Restituisce al pool un motore prelevato con `checkout`.
+
+        Args:
+            engine (PrologEngine): Il motore da restituire.
+        """
+        with self._lock:
+            self._in_use -= 1
+        self._idle.put(engine)
+
+    @contextmanager
+    def engine(self, timeout: float = None):
+        """
+        Context manager che preleva un motore e lo restituisce all'uscita.
+
+        Args:
+            timeout (float, optional): Attesa massima in secondi.
+
+        Yields:
+            PrologEngine: Il motore prelevato.
+        """
+        engine = self.checkout(timeout)
+        try:
+            yield engine
+        finally:
+            self.checkin(engine)
+
+    def metrics(self) -> dict:
+        """
+        Restituisce le metriche di utilizzo del pool.
+
+        Returns:
+            dict: 'size', 'in_use', 'peak_in_use', 'checkouts', 'waited'
+                (prelievi con attesa > 1 ms), 'wait_total_s', 'wait_mean_ms'
+                e 'wait_max_ms'.
+        """
+        with self._lock:
+            mean = self._wait_total / self._checkouts if self._checkouts else 0.0
+            return {
+                'size': self.size,
+                'in_use': self._in_use,
+                'peak_in_use': self._peak_in_use,
+                'checkouts': self._checkouts,
+                'waited': self._waited,
+                'wait_total_s': round(self._wait_total, 6),
+                'wait_mean_ms': round(mean * 1000, 3),
+                'wait_max_ms': round(self._wait_max * 1000, 3),
+            }
+
+    def close(self) -> None:
+        """Arresta tutti i motori del pool."""
+        self._closed = True
+        for engine in self._engines:
+            engine.close()
+
+
+class PooledPrologInterface:
+    """
+    Adattatore con la stessa API di `PrologInterface` che esegue ogni
+    interrogazione su un motore prelevato dal pool.
+
+    Può essere condiviso tra thread (es. da più `TherapyOptimizer` serviti
+    in parallelo): ogni chiamata usa un motore diverso per la sola durata
+    della query.
+
+    Attributes:
+        pool (PrologEnginePool): Il pool di motori sottostante.
+    """
+
+    def __init__(self, pool: PrologEnginePool, timeout: float = None):
+        """
+        Args:
+            pool (PrologEnginePool): Il pool da cui prelevare i motori.
+            timeout (float, optional): Attesa massima per ogni prelievo.
+        """
+        self.pool = pool
+        self.timeout = timeout
+
+    def get_approvals(self, disease_atom: str) -> dict:
+        """Vedi `PrologInterface.get_approvals`."""
+        with self.pool.engine(self.timeout) as engine:
+            return engine.get_approvals(disease_atom)
+
+    def verify_therapy(self, drugs: list) -> dict:
+        """Vedi `PrologInterface.verify_therapy`."""
+        with self.pool.engine(self.timeout) as engine:
+            return engine.verify_therapy(drugs)
+
+    def find_conflicts(self, drugs: list) -> list:
+        """Vedi `PrologInterface.find_conflicts`."""
+        with self.pool.engine(self.timeout) as engine:
+            return engine.find_conflicts(drugs)
+
+    def atc_codes(self) -> dict:
+        """Vedi `PrologInterface.atc_codes`."""
+        with self.pool.engine(self.timeout) as engine:
+            return engine.atc_codes()
+
+    def conflict_bitsets(self, drugs: list) -> tuple:
+        """
+        Vedi `PrologInterface.conflict_bitsets`.
+
+        La verifica di coerenza delle regole DDI con la T-Box viene eseguita
+        (e memorizzata) dal `PrologInterface` del motore prelevato.
+        """
+        with self.pool.engine(self.timeout) as engine:
+            return engine.conflict_bitsets(drugs)
+
+
+if __name__ == "__main__":
+    from concurrent.futures import ThreadPoolExecutor
+
+    pool = PrologEnginePool(size=4)
+    therapies = [['warfarin', 'ibuprofen'], ['paracetamol', 'ibuprofen'],
+                 ['sertraline', 'tramadol'], ['amlodipine', 'ramipril']] * 25
+
+    def check(drugs):
+        with pool.engine() as engine:
+            return engine.verify_therapy(drugs)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        reports = list(executor.map(check, therapies))
+    elapsed = time.perf_counter() - start
+
+    unsafe = sum(1 for r in reports if not r['safe'])
+    print(f"[POOL] {len(reports)} terapie verificate in {elapsed:.3f} s ({unsafe} con conflitti)")
+    print(f"[POOL] Metriche: {pool.metrics()}")
+    pool.close()
@@ -2,25 +2,40 @@
 
 """
 Modulo ETL per la generazione della Knowledge Base Estensionale (A-Box).
-Elabora il catalogo WHO ATC-DDD estraendo i mapping tra principi attivi 
+Elabora il catalogo WHO ATC-DDD estraendo i mapping tra principi attivi
 e classi farmacologiche.
 """
 
 import os
 import sys
 import json
+import hashlib
+import argparse
 import pandas as pd
 
 try:
-    from .utils import to_prolog_atom
+    from .utils import to_prolog_atoms
 except ImportError:
     sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-    from utils import to_prolog_atom
+    from utils import to_prolog_atoms
+
+# Versione del formato degli artefatti generati: va incrementata quando cambia
+# la forma dei fatti scritti, così che la modalità incrementale li rigeneri
+ETL_FORMAT_VERSION = 2
 
 class FactsExtractor:
     """
     Gestisce l'estrazione dei fatti Prolog a partire dai dataset governativi
     e crea i dizionari di traduzione necessari ai moduli ML.
+
+    In modalità incrementale (`run(incremental=True)`) l'estrattore confronta
+    con il manifest dell'ultima generazione l'hash del CSV sorgente, la
+    versione del formato e gli hash di `facts.pl` e `atom_mapping.json`: se
+    nulla è cambiato gli artefatti non vengono riscritti; altrimenti viene
+    prodotto un diff dei farmaci aggiunti e rimossi, così che le cache a valle
+    possano essere invalidate in modo selettivo. Il manifest e il diff sono
+    file locali, non versionati: se gli artefatti vengono sostituiti (es. da
+    un checkout) i loro hash non corrispondono più e l'A-Box viene rigenerata.
     """
 
     def __init__(self, data_dir: str, output_dir: str):
@@ -34,14 +49,26 @@ class FactsExtractor:
         self.who_csv_path = os.path.join(data_dir, "WHO ATC-DDD 2024-07-31.csv")
         self.output_file = os.path.join(output_dir, "facts.pl")
         self.mapping_file = os.path.join(output_dir, "atom_mapping.json")
-        
+        self.manifest_file = os.path.join(output_dir, "facts_manifest.json")
+        self.diff_file = os.path.join(output_dir, "facts_diff.json")
+
         self.facts = set()
+        self.prefix_facts = set()
         self.atom_mapping = {}
 
     def process_who_catalog(self) -> None:
         """
         Elabora il dataset WHO ATC, genera i predicati has_atc_code/2
         e compila il dizionario di traduzione atomo-stringa.
+
+        Per ogni codice genera inoltre i fatti atc_l3/2 e atc_l4/2
+        (prefisso ATC di livello 3 e 4, farmaco), con il prefisso come primo
+        argomento: le regole della T-Box possono così classificare i farmaci
+        tramite l'indicizzazione sul primo argomento di SWI-Prolog, invece di
+        scandire tutti i fatti has_atc_code/2 con sub_atom/5.
+
+        L'elaborazione è interamente vettorizzata (`to_prolog_atoms` e
+        concatenazioni di colonne), senza iterare sulle righe del catalogo.
         """
         if not os.path.exists(self.who_csv_path):
             print(f"[ERROR] File WHO non trovato: {self.who_csv_path}")
@@ -54,14 +81,18 @@ class FactsExtractor:
         df_valid = df.dropna(subset=[atc_col, name_col])
         df_valid = df_valid[df_valid[atc_col].str.len() == 7]
 
-        for _, row in df_valid.iterrows():
-            original_name = str(row[name_col]).strip().lower()
-            atc_code = str(row[atc_col]).strip().lower()
-            drug_atom = to_prolog_atom(original_name)
-            
-            if drug_atom != "unknown" and atc_code:
-                self.facts.add(f"has_atc_code('{drug_atom}', '{atc_code}').")
-                self.atom_mapping[drug_atom] = original_name
+        original_names = df_valid[name_col].astype(str).str.strip().str.lower()
+        atc_codes = df_valid[atc_col].astype(str).str.strip().str.lower()
+        drug_atoms = to_prolog_atoms(original_names)
+
+        keep = (drug_atoms != "unknown") & (atc_codes != "")
+        original_names, atc_codes, drug_atoms = original_names[keep], atc_codes[keep], drug_atoms[keep]
+
+        self.facts.update("has_atc_code('" + drug_atoms + "', '" + atc_codes + "').")
+        self.prefix_facts.update("atc_l3('" + atc_codes.str[:3] + "', '" + drug_atoms + "').")
+        self.prefix_facts.update("atc_l4('" + atc_codes.str[:4] + "', '" + drug_atoms + "').")
+        # Come nella scrittura riga per riga: a parità di atomo vale l'ultimo nome.
+        self.atom_mapping.update(zip(drug_atoms, original_names))
 
     def save_artifacts(self) -> None:
         """
@@ -69,22 +100,121 @@ class FactsExtractor:
         e il file di mapping in formato JSON.
         """
         os.makedirs(os.path.dirname(self.output_file), exist_ok=True)
-        
+
         with open(self.output_file, 'w', encoding='utf-8') as f:
             f.write("% --- EXTENSIONAL KNOWLEDGE BASE (A-BOX) ---\n")
             f.write(":- multifile has_atc_code/2.\n")
-            f.write(":- discontiguous has_atc_code/2.\n\n")
+            f.write(":- discontiguous has_atc_code/2.\n")
+            f.write(":- multifile atc_l3/2.\n")
+            f.write(":- multifile atc_l4/2.\n\n")
             for fact in sorted(self.facts):
                 f.write(fact + "\n")
 
+            f.write("\n% --- PREFISSI ATC PRECALCOLATI: atc_l3(Prefisso, Farmaco), atc_l4(Prefisso, Farmaco) ---\n")
+            for fact in sorted(self.prefix_facts):
+                f.write(fact + "\n")
+
         with open(self.mapping_file, 'w', encoding='utf-8') as f:
             json.dump(self.atom_mapping, f, indent=2)
 
+    @staticmethod
+    def _file_hash(path: str) -> str:
+        """Calcola l'hash SHA-256 di un file, o None se il file non esiste."""
+        if not os.path.exists(path):
+            return None
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def _source_hash(self) -> str:
+        """Calcola l'hash SHA-256 del catalogo WHO sorgente."""
+        return self._file_hash(self.who_csv_path)
+
+    def _artifact_hashes(self) -> dict:
+        """Hash SHA-256 degli artefatti generati, indicizzati per nome di file."""
+        return {os.path.basename(path): self._file_hash(path)
+                for path in (self.output_file, self.mapping_file)}
+
+    def _load_json(self, path: str) -> dict:
+        """Legge un file JSON se presente, altrimenti restituisce un dizionario vuoto."""
+        if not os.path.exists(path):
+            return {}
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def run(self, incremental: bool = True) -> dict:
+        """
+        Esegue la pipeline ETL completa, saltando la rigenerazione se il
+        catalogo sorgente non è cambiato dall'ultima esecuzione.
+
+        Args:
+            incremental (bool): Se True confronta hash del CSV, versione del
+                formato e hash degli artefatti con il manifest e rigenera gli
+                artefatti solo in caso di differenze. Se False rigenera sempre.
+
+        Returns:
+            dict: Il diff della generazione, con le chiavi 'changed' (bool),
+                'source_sha256', 'previous_sha256', 'added' e 'removed'
+                (liste ordinate di atomi dei farmaci).
+        """
+        if not os.path.exists(self.who_csv_path):
+            print(f"[ERROR] File WHO non trovato: {self.who_csv_path}")
+            sys.exit(1)
+
+        source_hash = self._source_hash()
+        manifest = self._load_json(self.manifest_file)
+        previous_hash = manifest.get('source_sha256')
+
+        artifact_hashes = self._artifact_hashes()
+        up_to_date = (
+            previous_hash == source_hash and
+            manifest.get('format_version') == ETL_FORMAT_VERSION and
+            None not in artifact_hashes.values() and
+            manifest.get('artifacts') == artifact_hashes
+        )
+        if incremental and up_to_date:
+            print("[ETL] Catalogo WHO e A-Box invariati: rigenerazione non necessaria.")
+            return {'changed': False, 'source_sha256': source_hash,
+                    'previous_sha256': previous_hash, 'added': [], 'removed': []}
+
+        previous_drugs = set(self._load_json(self.mapping_file))
+
+        self.process_who_catalog()
+        self.save_artifacts()
+
+        current_drugs = set(self.atom_mapping)
+        diff = {
+            'changed': True,
+            'source_sha256': source_hash,
+            'previous_sha256': previous_hash,
+            'added': sorted(current_drugs - previous_drugs),
+            'removed': sorted(previous_drugs - current_drugs),
+        }
+
+        with open(self.diff_file, 'w', encoding='utf-8') as f:
+            json.dump(diff, f, indent=2)
+        with open(self.manifest_file, 'w', encoding='utf-8') as f:
+            json.dump({
+                'format_version': ETL_FORMAT_VERSION,
+                'source_sha256': source_hash,
+                'artifacts': self._artifact_hashes(),
+                'drug_count': len(current_drugs)
+            }, f, indent=2)
+
+        print(f"[ETL] A-Box rigenerata: {len(diff['added'])} farmaci aggiunti, "
+              f"{len(diff['removed'])} rimossi (diff in {self.diff_file}).")
+        return diff
+
 if __name__ == "__main__":
     base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
     data_dir = os.path.join(base_dir, "data")
     output_dir = os.path.join(base_dir, "src", "kb", "prolog")
-    
+
+    parser = argparse.ArgumentParser(description="SafeTherapy - ETL dell'A-Box dal catalogo WHO ATC-DDD")
+    parser.add_argument("--force", action="store_true", help="Rigenera gli artefatti anche se il catalogo non è cambiato")
+    args = parser.parse_args()
+
     extractor = FactsExtractor(data_dir, output_dir)
-    extractor.process_who_catalog()
-    extractor.save_artifacts()
\ No newline at end of file
+    extractor.run(incremental=not args.force)
@@ -7,8 +7,16 @@ il motore di inferenza logica (T-Box) durante l'esecuzione dell'algoritmo A*.
 """
 
 import os
-import re
+import sys
 from pyswip import Prolog
+from pyswip.prolog import PrologError
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from src.metrics import get_metrics
+from src.kb.conflict_graph import rule_conflicts, check_rule_parity
+
+metrics = get_metrics()
 
 
 class PrologInterface:
@@ -22,9 +30,11 @@ class PrologInterface:
 
     Attributes:
         prolog (Prolog): L'istanza del runtime SWI-Prolog gestita da PySwip.
+        rule_file (str): T-Box consultata all'avvio; None se il runtime è
+            fornito dall'esterno.
     """
 
-    def __init__(self):
+    def __init__(self, prolog=None, rule_file: str = None):
         """
         Inizializza l'ambiente Prolog e carica le regole inferenziali.
 
@@ -32,28 +42,96 @@ class PrologInterface:
         del modulo corrente e lo consulta nel runtime Prolog. Se il file
         non viene trovato, stampa un errore senza sollevare un'eccezione,
         lasciando l'oggetto in stato degradato (nessuna regola caricata).
+
+        Args:
+            prolog (optional): Runtime già inizializzato con le regole caricate
+                (es. il motore di un `PrologEnginePool`), con la stessa API
+                `query` di PySwip. Se fornito, `reasoning.pl` non viene
+                consultato di nuovo.
+            rule_file (str, optional): T-Box alternativa da consultare (es. una
+                KB sintetica ingrandita); il relativo `facts.pl` viene cercato
+                nella stessa directory. Il runtime SWI-Prolog è unico per
+                processo: KB diverse vanno caricate in processi distinti.
         """
+        self.rule_file = None
+        self._atc_codes = None
+        self._rule_mismatches = None
+        if prolog is not None:
+            self.prolog = prolog
+            return
+
         self.prolog = Prolog()
-        base_dir = os.path.dirname(os.path.abspath(__file__))
-        rule_file = os.path.join(base_dir, "prolog", "reasoning.pl").replace("\\", "/")
+        if rule_file is None:
+            base_dir = os.path.dirname(os.path.abspath(__file__))
+            rule_file = os.path.join(base_dir, "prolog", "reasoning.pl")
+        rule_file = rule_file.replace("\\", "/")
+        self.rule_file = rule_file
 
         if os.path.exists(rule_file):
             self.prolog.consult(rule_file)
         else:
             print(f"[ERROR] File Prolog non trovato: {rule_file}")
 
+    def reload(self) -> None:
+        """
+        Riconsulta T-Box e A-Box nel runtime corrente dopo una loro modifica.
+
+        `reasoning.pl` viene consultato di nuovo (e con esso `facts.pl`) e le
+        tabelle di `approved_for/3` vengono svuotate. Il runtime SWI-Prolog è
+        unico per processo: il chiamante deve garantire che nessuna query sia
+        in corso (es. `ArtifactReloader` ricarica solo tra due ricerche).
+
+        Raises:
+            RuntimeError: Se l'interfaccia usa un runtime fornito dall'esterno.
+        """
+        if self.rule_file is None:
+            raise RuntimeError("[KB] Ricaricamento non disponibile per un runtime Prolog esterno")
+        list(self.prolog.query("abolish_all_tables"))
+        self.prolog.consult(self.rule_file)
+        self._atc_codes = None
+        self._rule_mismatches = None
+
+    @metrics.timed('kb.query.approved_for')
+    def get_approvals(self, disease_atom: str) -> dict:
+        """
+        Estrae con una singola query tutti i farmaci approvati per una patologia
+        e la relativa linea terapeutica.
+
+        Un farmaco può essere dedotto per più linee della stessa patologia
+        (es. il triamcinolone per l'asma: linea 1 come broncodilatatore R03,
+        linea 2 come corticosteroide H02); viene conservata la linea più
+        bassa. Nella T-Box non tabellata la ricerca leggeva la prima soluzione
+        di `approved_for(Drug, Disease, Line)`, che coincide con la linea più
+        bassa perché le clausole sono ordinate per linea. Con `approved_for/3`
+        tabellato l'ordine delle risposte non è più garantito, quindi il
+        minimo va preso esplicitamente; è anche la linea usata da
+        `disease_specific_cost/3`.
+
+        Args:
+            disease_atom (str): L'atomo Prolog della patologia.
+
+        Returns:
+            dict: Mappa {farmaco_atom: linea_terapeutica (int)}. Vuota se la
+                patologia non è riconosciuta dalla T-Box.
+        """
+        approvals = {}
+        for res in self.prolog.query(f"approved_for(Drug, '{disease_atom}', Line)"):
+            drug = res['Drug']
+            line = int(res['Line'])
+            if drug not in approvals or line < approvals[drug]:
+                approvals[drug] = line
+        return approvals
+
     def verify_therapy(self, drugs: list) -> dict:
         """
         Valuta la sicurezza di una combinazione di farmaci interrogando Prolog.
 
-        Itera su tutte le coppie non ordinate di farmaci forniti ed esegue
-        il predicato `check_pair_safety/3` per ciascuna. Supporta il parsing
-        robusto dei risultati PySwip tramite due strategie: lettura dell'oggetto
-        Functor nativo (metodo primario) e parsing con espressioni regolari
-        sulla rappresentazione stringa (metodo di fallback).
-
-        I farmaci con interazione di severità 'high' causano la restituzione
-        immediata del conflitto senza analizzare le coppie rimanenti.
+        Delega l'intera valutazione al predicato `therapy_conflicts/2`, che
+        esamina tutte le coppie non ordinate dei farmaci forniti tramite
+        `check_pair_safety/3` e restituisce i conflitti come termini strutturati
+        `conflict(Drug1, Drug2, Severity, Msg)`. La combinazione viene quindi
+        verificata con una sola chiamata al runtime Prolog, indipendentemente
+        dal numero di coppie.
 
         Args:
             drugs (list[str]): Lista di atomi Prolog rappresentanti i farmaci
@@ -66,51 +144,112 @@ class PrologInterface:
                   con le chiavi 'drugs' (tuple), 'severity' (str) e 'msg' (str).
                   Lista vuota se la terapia è sicura o se viene fornito meno
                   di un farmaco.
+                Se la query solleva un errore Prolog la verifica fallisce in
+                modo sicuro: la terapia è dichiarata non sicura con un unico
+                conflitto 'high' sull'intera combinazione, e la chiave
+                aggiuntiva 'error' (str) riporta l'errore.
         """
-        conflicts = []
-
         if len(drugs) < 2:
             return {'safe': True, 'conflicts': []}
 
-        for i in range(len(drugs)):
-            for j in range(i + 1, len(drugs)):
-                query = f"check_pair_safety('{drugs[i]}', '{drugs[j]}', Result)"
-
-                try:
-                    res = list(self.prolog.query(query))
-                    if not res:
-                        continue
-
-                    result_obj = res[0]['Result']
-                    result_str = str(result_obj)
-
-                    if result_str == 'safe':
-                        continue
-
-                    severity = 'high'  # Fallback prudenziale
-                    msg = 'Interazione rilevata'
-
-                    # TENTATIVO 1: Lettura tramite oggetto Functor (PySwip standard)
-                    if hasattr(result_obj, 'args') and len(result_obj.args) >= 2:
-                        severity = str(result_obj.args[0])
-                        msg = str(result_obj.args[1])
-                    else:
-                        # TENTATIVO 2: Parsing tramite Espressioni Regolari (Stringa raw)
-                        match = re.search(r"conflict\(([^,]+),\s*(.*)\)", result_str)
-                        if match:
-                            severity = match.group(1).strip().strip("'").strip('"')
-                            raw_msg = match.group(2).strip()
-                            if raw_msg.endswith(')'):
-                                raw_msg = raw_msg[:-1]
-                            msg = raw_msg.strip("'").strip('"')
-
-                    conflicts.append({
-                        'drugs': (drugs[i], drugs[j]),
-                        'severity': severity,
-                        'msg': msg
-                    })
-
-                except Exception as e:
-                    print(f"[KB-WARN] Errore di parsing Prolog su {drugs[i]}-{drugs[j]}: {e}")
-
-        return {'safe': len(conflicts) == 0, 'conflicts': conflicts}
\ No newline at end of file
+        try:
+            conflicts = self.find_conflicts(drugs)
+        except PrologError as e:
+            print(f"[KB-ERROR] Verifica Prolog della terapia {drugs} non riuscita: {e}")
+            return {
+                'safe': False,
+                'conflicts': [{
+                    'drugs': tuple(drugs),
+                    'severity': 'high',
+                    'msg': 'Verifica delle interazioni non riuscita'
+                }],
+                'error': str(e)
+            }
+
+        return {'safe': len(conflicts) == 0, 'conflicts': conflicts}
+
+    @metrics.timed('kb.query.therapy_conflicts')
+    def find_conflicts(self, drugs: list) -> list:
+        """
+        Esegue `therapy_conflicts/2` sulla lista di farmaci e converte i termini
+        `conflict/4` restituiti in dizionari Python.
+
+        A differenza di `verify_therapy`, non intercetta gli errori del runtime
+        Prolog: è pensato per i processi offline (es. la compilazione dello
+        snapshot della KB) che devono fallire in modo esplicito.
+
+        Args:
+            drugs (list[str]): Lista di atomi Prolog dei farmaci.
+
+        Returns:
+            list[dict]: Conflitti rilevati, con le chiavi 'drugs', 'severity' e 'msg'.
+        """
+        drug_list = ", ".join(f"'{d}'" for d in drugs)
+        query = f"therapy_conflicts([{drug_list}], Conflicts)"
+        conflicts = []
+
+        # normalize=False preserva i termini conflict/4 come Functor,
+        # evitando la serializzazione in stringa di PySwip.
+        for solution in self.prolog.query(query, maxresult=1, normalize=False):
+            bindings = {}
+            for binding in solution:
+                bindings.update(binding.value)
+
+            for term in bindings.get('Conflicts', []):
+                drug1, drug2, severity, msg = (arg.value for arg in term.args)
+                conflicts.append({
+                    'drugs': (drug1, drug2),
+                    'severity': severity,
+                    'msg': msg
+                })
+
+        return conflicts
+
+    def atc_codes(self) -> dict:
+        """
+        Restituisce i codici ATC di ogni farmaco dell'A-Box, letti una sola volta.
+
+        Returns:
+            dict: Mappa {farmaco_atom: [codici ATC]}, nell'ordine dei fatti `has_atc_code/2`.
+        """
+        if self._atc_codes is None:
+            codes = {}
+            for res in self.prolog.query("has_atc_code(Drug, Atc)"):
+                codes.setdefault(res['Drug'], []).append(res['Atc'])
+            self._atc_codes = codes
+        return self._atc_codes
+
+    @metrics.timed('kb.query.conflict_bitsets')
+    def conflict_bitsets(self, drugs: list) -> tuple:
+        """
+        Calcola in blocco i conflitti tra tutte le coppie di farmaci.
+
+        Invece di valutare `check_pair_safety/3` coppia per coppia, legge da
+        Prolog i codici ATC dei farmaci e i fatti `dangerous_classes/4` e applica
+        le regole per prefisso ATC in forma vettoriale (`rule_conflicts`).
+        Alla prima chiamata dopo il caricamento (o un `reload`) della T-Box le
+        regole vettoriali vengono confrontate con `therapy_conflicts/2` su un
+        campione che esercita ogni regola (`check_rule_parity`); se divergono
+        il metodo solleva un'eccezione e l'A* verifica i regimi con Prolog.
+        La verifica completa si esegue con `python src/kb/conflict_graph.py check`.
+
+        Args:
+            drugs (list[str]): Lista di atomi Prolog dei farmaci (N).
+
+        Returns:
+            tuple: (hard, medium), liste di N bitset con i vicini 'high' e
+                'medium' di ciascun farmaco (bit i = drugs[i]).
+
+        Raises:
+            RuntimeError: Se le regole vettoriali non coincidono con la T-Box corrente.
+        """
+        if self._rule_mismatches is None:
+            self._rule_mismatches = check_rule_parity(self)
+        if self._rule_mismatches:
+            raise RuntimeError(f"[KB] Regole DDI vettoriali non coerenti con la T-Box "
+                               f"({len(self._rule_mismatches)} coppie, es. {self._rule_mismatches[0]})")
+
+        codes = self.atc_codes()
+        classes = [(res['C1'], res['C2'], res['Severity'])
+                   for res in self.prolog.query("dangerous_classes(C1, C2, Severity, _)")]
+        return rule_conflicts(drugs, [codes.get(drug, []) for drug in drugs], classes)
@@ -1,6 +1,8 @@
 % --- EXTENSIONAL KNOWLEDGE BASE (A-BOX) ---
 :- multifile has_atc_code/2.
 :- discontiguous has_atc_code/2.
+:- multifile atc_l3/2.
+:- multifile atc_l4/2.
 
 has_atc_code('abacavir', 'j05af06').
 has_atc_code('abaloparatide', 'h05aa04').
@@ -5497,3 +5499,10811 @@ has_atc_code('zoster_purified_antigen', 'j07bk03').
 has_atc_code('zotepine', 'n05ax11').
 has_atc_code('zucapsaicin', 'm02ab02').
 has_atc_code('zuclopenthixol', 'n05af05').
+
+% --- PREFISSI ATC PRECALCOLATI: atc_l3(Prefisso, Farmaco), atc_l4(Prefisso, Farmaco) ---
+atc_l3('a01', 'acetylsalicylic_acid').
+atc_l3('a01', 'adrenalone').
+atc_l3('a01', 'amlexanox').
+atc_l3('a01', 'amphotericin_b').
+atc_l3('a01', 'becaplermin').
+atc_l3('a01', 'benzoxonium_chloride').
+atc_l3('a01', 'benzydamine').
+atc_l3('a01', 'chlorhexidine').
+atc_l3('a01', 'chlorhexidine_and_cetylpyridinium').
+atc_l3('a01', 'chlortetracycline').
+atc_l3('a01', 'clotrimazole').
+atc_l3('a01', 'combinations').
+atc_l3('a01', 'dexamethasone').
+atc_l3('a01', 'domiphen').
+atc_l3('a01', 'doxycycline').
+atc_l3('a01', 'epinephrine').
+atc_l3('a01', 'hexetidine').
+atc_l3('a01', 'hydrocortisone').
+atc_l3('a01', 'hydrogen_peroxide').
+atc_l3('a01', 'mepartricin').
+atc_l3('a01', 'metronidazole').
+atc_l3('a01', 'miconazole').
+atc_l3('a01', 'minocycline').
+atc_l3('a01', 'natamycin').
+atc_l3('a01', 'neomycin').
+atc_l3('a01', 'octenidine').
+atc_l3('a01', 'olaflur').
+atc_l3('a01', 'oxyquinoline').
+atc_l3('a01', 'oxytetracycline').
+atc_l3('a01', 'polynoxylin').
+atc_l3('a01', 'prednisolone').
+atc_l3('a01', 'prednisolone_combinations').
+atc_l3('a01', 'sodium_fluoride').
+atc_l3('a01', 'sodium_fluoride_combinations').
+atc_l3('a01', 'sodium_monofluorophosphate').
+atc_l3('a01', 'sodium_perborate').
+atc_l3('a01', 'stannous_fluoride').
+atc_l3('a01', 'tetracycline').
+atc_l3('a01', 'tibezonium_iodide').
+atc_l3('a01', 'triamcinolone').
+atc_l3('a01', 'various').
+atc_l3('a02', 'acetoxolone').
+atc_l3('a02', 'algeldrate').
+atc_l3('a02', 'alginic_acid').
+atc_l3('a02', 'almagate').
+atc_l3('a02', 'almasilate').
+atc_l3('a02', 'aloglutamol').
+atc_l3('a02', 'aluminium_acetoacetate').
+atc_l3('a02', 'aluminium_glycinate').
+atc_l3('a02', 'aluminium_hydroxide').
+atc_l3('a02', 'aluminium_phosphate').
+atc_l3('a02', 'bismuth_subcitrate').
+atc_l3('a02', 'bismuth_subcitrate_tetracycline_and_metronidazole').
+atc_l3('a02', 'bismuth_subnitrate').
+atc_l3('a02', 'calcium_carbonate').
+atc_l3('a02', 'calcium_silicate').
+atc_l3('a02', 'carbenoxolone').
+atc_l3('a02', 'carbenoxolone_combinations_excl_psycholeptics').
+atc_l3('a02', 'carbenoxolone_combinations_with_psycholeptics').
+atc_l3('a02', 'cimetidine').
+atc_l3('a02', 'cimetidine_combinations').
+atc_l3('a02', 'combinations').
+atc_l3('a02', 'dexlansoprazole').
+atc_l3('a02', 'dexrabeprazole').
+atc_l3('a02', 'dihydroxialumini_sodium_carbonate').
+atc_l3('a02', 'enprostil').
+atc_l3('a02', 'esomeprazole').
+atc_l3('a02', 'esomeprazole_amoxicillin_and_clarithromycin').
+atc_l3('a02', 'famotidine').
+atc_l3('a02', 'famotidine_combinations').
+atc_l3('a02', 'gefarnate').
+atc_l3('a02', 'gefarnate_combinations_with_psycholeptics').
+atc_l3('a02', 'hydrotalcite').
+atc_l3('a02', 'irsogladine').
+atc_l3('a02', 'lafutidine').
+atc_l3('a02', 'lansoprazole').
+atc_l3('a02', 'lansoprazole_amoxicillin_and_clarithromycin').
+atc_l3('a02', 'lansoprazole_amoxicillin_and_levofloxacin').
+atc_l3('a02', 'lansoprazole_amoxicillin_and_metronidazole').
+atc_l3('a02', 'lansoprazole_clarithromycin_and_tinidazole').
+atc_l3('a02', 'lansoprazole_combinations').
+atc_l3('a02', 'lansoprazole_tetracycline_and_metronidazole').
+atc_l3('a02', 'magaldrate').
+atc_l3('a02', 'magaldrate_and_antiflatulents').
+atc_l3('a02', 'magnesium_carbonate').
+atc_l3('a02', 'magnesium_hydroxide').
+atc_l3('a02', 'magnesium_oxide').
+atc_l3('a02', 'magnesium_peroxide').
+atc_l3('a02', 'magnesium_silicate').
+atc_l3('a02', 'methiosulfonium_chloride').
+atc_l3('a02', 'misoprostol').
+atc_l3('a02', 'niperotidine').
+atc_l3('a02', 'nizatidine').
+atc_l3('a02', 'omeprazole').
+atc_l3('a02', 'omeprazole_amoxicillin_and_clarithromycin').
+atc_l3('a02', 'omeprazole_amoxicillin_and_metronidazole').
+atc_l3('a02', 'omeprazole_amoxicillin_and_rifabutin').
+atc_l3('a02', 'omeprazole_combinations').
+atc_l3('a02', 'ordinary_salt_combinations').
+atc_l3('a02', 'ordinary_salt_combinations_and_antiflatulents').
+atc_l3('a02', 'pantoprazole').
+atc_l3('a02', 'pantoprazole_amoxicillin_and_clarithromycin').
+atc_l3('a02', 'pantoprazole_amoxicillin_clarithromycin_and_metronidazole').
+atc_l3('a02', 'pirenzepine').
+atc_l3('a02', 'proglumide').
+atc_l3('a02', 'rabeprazole').
+atc_l3('a02', 'rabeprazole_amoxicillin_and_clarithromycin').
+atc_l3('a02', 'rabeprazole_amoxicillin_and_metronidazole').
+atc_l3('a02', 'rabeprazole_combinations').
+atc_l3('a02', 'ranitidine').
+atc_l3('a02', 'ranitidine_bismuth_citrate').
+atc_l3('a02', 'rebamipide').
+atc_l3('a02', 'roxatidine').
+atc_l3('a02', 'sucralfate').
+atc_l3('a02', 'sulglicotide').
+atc_l3('a02', 'tegoprazan').
+atc_l3('a02', 'teprenone').
+atc_l3('a02', 'troxipide').
+atc_l3('a02', 'vonoprazan').
+atc_l3('a02', 'vonoprazan_amoxicillin_and_clarithromycin').
+atc_l3('a02', 'vonoprazan_amoxicillin_and_metronidazole').
+atc_l3('a02', 'vonoprazan_and_amoxicillin').
+atc_l3('a02', 'zolimidine').
+atc_l3('a03', 'acotiamide').
+atc_l3('a03', 'alizapride').
+atc_l3('a03', 'alosetron').
+atc_l3('a03', 'alverine').
+atc_l3('a03', 'alverine_combinations').
+atc_l3('a03', 'ambutonium_and_psycholeptics').
+atc_l3('a03', 'atropine').
+atc_l3('a03', 'atropine_and_psycholeptics').
+atc_l3('a03', 'belladonna_total_alkaloids').
+atc_l3('a03', 'belladonna_total_alkaloids_and_psycholeptics').
+atc_l3('a03', 'benzilone').
+atc_l3('a03', 'bevonium').
+atc_l3('a03', 'bevonium_and_analgesics').
+atc_l3('a03', 'bevonium_and_psycholeptics').
+atc_l3('a03', 'bromopride').
+atc_l3('a03', 'butylscopolamine').
+atc_l3('a03', 'butylscopolamine_and_analgesics').
+atc_l3('a03', 'camylofin').
+atc_l3('a03', 'camylofin_and_analgesics').
+atc_l3('a03', 'caroverine').
+atc_l3('a03', 'chlorbenzoxamine').
+atc_l3('a03', 'ciclonium_and_analgesics').
+atc_l3('a03', 'cilansetron').
+atc_l3('a03', 'cimetropium_bromide').
+atc_l3('a03', 'cinitapride').
+atc_l3('a03', 'cisapride').
+atc_l3('a03', 'clebopride').
+atc_l3('a03', 'clidinium_and_psycholeptics').
+atc_l3('a03', 'dicycloverine').
+atc_l3('a03', 'difemerine').
+atc_l3('a03', 'dihexyverine').
+atc_l3('a03', 'diisopromine').
+atc_l3('a03', 'dimethylaminopropionylphenothiazine').
+atc_l3('a03', 'diphemanil').
+atc_l3('a03', 'diphemanil_and_psycholeptics').
+atc_l3('a03', 'domperidone').
+atc_l3('a03', 'drotaverine').
+atc_l3('a03', 'emepronium_and_psycholeptics').
+atc_l3('a03', 'fenoverine').
+atc_l3('a03', 'fenpiprane').
+atc_l3('a03', 'fenpiverinium').
+atc_l3('a03', 'fentonium').
+atc_l3('a03', 'glycopyrronium_bromide').
+atc_l3('a03', 'glycopyrronium_bromide_and_psycholeptics').
+atc_l3('a03', 'hexocyclium').
+atc_l3('a03', 'homatropine_methylbromide').
+atc_l3('a03', 'homatropine_methylbromide_and_psycholeptics').
+atc_l3('a03', 'hyoscyamine').
+atc_l3('a03', 'hyoscyamine_and_psycholeptics').
+atc_l3('a03', 'idanpramine').
+atc_l3('a03', 'isometheptene').
+atc_l3('a03', 'isopropamide').
+atc_l3('a03', 'isopropamide_and_psycholeptics').
+atc_l3('a03', 'itopride').
+atc_l3('a03', 'mebeverine').
+atc_l3('a03', 'menthae_piperitae_aetheroleum').
+atc_l3('a03', 'mepenzolate').
+atc_l3('a03', 'methantheline').
+atc_l3('a03', 'methylatropine').
+atc_l3('a03', 'methylscopolamine').
+atc_l3('a03', 'methylscopolamine_and_psycholeptics').
+atc_l3('a03', 'metoclopramide').
+atc_l3('a03', 'mosapride').
+atc_l3('a03', 'moxaverine').
+atc_l3('a03', 'n_2_benzhydryloxyethyl_diethyl_methylammonium_iodide').
+atc_l3('a03', 'nicofetamide').
+atc_l3('a03', 'otilonium_bromide').
+atc_l3('a03', 'otilonium_bromide_and_psycholeptics').
+atc_l3('a03', 'oxyphencyclimine').
+atc_l3('a03', 'oxyphencyclimine_and_psycholeptics').
+atc_l3('a03', 'oxyphenonium').
+atc_l3('a03', 'oxyphenonium_combinations').
+atc_l3('a03', 'papaverine').
+atc_l3('a03', 'penthienate').
+atc_l3('a03', 'phloroglucinol').
+atc_l3('a03', 'pinaverium').
+atc_l3('a03', 'pipenzolate').
+atc_l3('a03', 'pipenzolate_and_psycholeptics').
+atc_l3('a03', 'piperidolate').
+atc_l3('a03', 'pitofenone_and_analgesics').
+atc_l3('a03', 'poldine').
+atc_l3('a03', 'prifinium_bromide').
+atc_l3('a03', 'propantheline').
+atc_l3('a03', 'propantheline_and_psycholeptics').
+atc_l3('a03', 'proxazole').
+atc_l3('a03', 'rociverine').
+atc_l3('a03', 'silicones').
+atc_l3('a03', 'tiemonium_iodide').
+atc_l3('a03', 'tiemonium_iodide_and_analgesics').
+atc_l3('a03', 'timepidium_bromide').
+atc_l3('a03', 'tiropramide').
+atc_l3('a03', 'trepibutone').
+atc_l3('a03', 'tridihexethyl').
+atc_l3('a03', 'trimebutine').
+atc_l3('a03', 'trimethyldiphenylpropylamine').
+atc_l3('a03', 'tropenzilone_and_analgesics').
+atc_l3('a03', 'trospium_and_analgesics').
+atc_l3('a03', 'valethamate').
+atc_l3('a04', 'aprepitant').
+atc_l3('a04', 'casopitant').
+atc_l3('a04', 'cerium_oxalate').
+atc_l3('a04', 'chlorobutanol').
+atc_l3('a04', 'chlorobutanol_combinations').
+atc_l3('a04', 'dolasetron').
+atc_l3('a04', 'dronabinol').
+atc_l3('a04', 'granisetron').
+atc_l3('a04', 'metopimazine').
+atc_l3('a04', 'nabilone').
+atc_l3('a04', 'ondansetron').
+atc_l3('a04', 'palonosetron').
+atc_l3('a04', 'palonosetron_combinations').
+atc_l3('a04', 'rolapitant').
+atc_l3('a04', 'scopolamine').
+atc_l3('a04', 'scopolamine_combinations').
+atc_l3('a04', 'tropisetron').
+atc_l3('a05', 'arginine_glutamate').
+atc_l3('a05', 'chenodeoxycholic_acid').
+atc_l3('a05', 'cholic_acid').
+atc_l3('a05', 'citiolone').
+atc_l3('a05', 'cyclobutyrol').
+atc_l3('a05', 'elafibranor').
+atc_l3('a05', 'epomediol').
+atc_l3('a05', 'glycyrrhizic_acid').
+atc_l3('a05', 'hymecromone').
+atc_l3('a05', 'maralixibat_chloride').
+atc_l3('a05', 'metadoxine').
+atc_l3('a05', 'nicotinyl_methylamide').
+atc_l3('a05', 'obeticholic_acid').
+atc_l3('a05', 'odevixibat').
+atc_l3('a05', 'ornithine_oxoglurate').
+atc_l3('a05', 'phospholipids').
+atc_l3('a05', 'piprozolin').
+atc_l3('a05', 'silymarin').
+atc_l3('a05', 'tidiacic_arginine').
+atc_l3('a05', 'ursodeoxycholic_acid').
+atc_l3('a05', 'ursodoxicoltaurine').
+atc_l3('a06', 'alvimopan').
+atc_l3('a06', 'bisacodyl').
+atc_l3('a06', 'bisacodyl_combinations').
+atc_l3('a06', 'bisoxatin').
+atc_l3('a06', 'carbon_dioxide_producing_drugs').
+atc_l3('a06', 'cascara').
+atc_l3('a06', 'cascara_combinations').
+atc_l3('a06', 'castor_oil').
+atc_l3('a06', 'combinations').
+atc_l3('a06', 'contact_laxatives_in_combination').
+atc_l3('a06', 'contact_laxatives_in_combination_with_belladonna_alkaloids').
+atc_l3('a06', 'dantron').
+atc_l3('a06', 'dantron_combinations').
+atc_l3('a06', 'dantron_incl_combinations').
+atc_l3('a06', 'docusate_sodium').
+atc_l3('a06', 'docusate_sodium_incl_combinations').
+atc_l3('a06', 'elobixibat').
+atc_l3('a06', 'ethulose').
+atc_l3('a06', 'glycerol').
+atc_l3('a06', 'ispaghula_combinations').
+atc_l3('a06', 'ispaghula_psylla_seeds').
+atc_l3('a06', 'lactitol').
+atc_l3('a06', 'lactulose').
+atc_l3('a06', 'lactulose_combinations').
+atc_l3('a06', 'linaclotide').
+atc_l3('a06', 'linseed').
+atc_l3('a06', 'linseed_combinations').
+atc_l3('a06', 'liquid_paraffin').
+atc_l3('a06', 'liquid_paraffin_combinations').
+atc_l3('a06', 'lubiprostone').
+atc_l3('a06', 'macrogol').
+atc_l3('a06', 'macrogol_combinations').
+atc_l3('a06', 'magnesium_carbonate').
+atc_l3('a06', 'magnesium_citrate').
+atc_l3('a06', 'magnesium_oxide').
+atc_l3('a06', 'magnesium_peroxide').
+atc_l3('a06', 'magnesium_sulfate').
+atc_l3('a06', 'mannitol').
+atc_l3('a06', 'methylcellulose').
+atc_l3('a06', 'methylnaltrexone_bromide').
+atc_l3('a06', 'mineral_salts_in_combination').
+atc_l3('a06', 'naldemedine').
+atc_l3('a06', 'naloxegol').
+atc_l3('a06', 'naloxone').
+atc_l3('a06', 'oil').
+atc_l3('a06', 'oxyphenisatine').
+atc_l3('a06', 'pentaerithrityl').
+atc_l3('a06', 'phenolphthalein').
+atc_l3('a06', 'plecanatide').
+atc_l3('a06', 'polycarbophil_calcium').
+atc_l3('a06', 'prucalopride').
+atc_l3('a06', 'senna_glycosides').
+atc_l3('a06', 'senna_glycosides_combinations').
+atc_l3('a06', 'sodium_lauryl_sulfoacetate_incl_combinations').
+atc_l3('a06', 'sodium_phosphate').
+atc_l3('a06', 'sodium_picosulfate').
+atc_l3('a06', 'sodium_picosulfate_combinations').
+atc_l3('a06', 'sodium_sulfate').
+atc_l3('a06', 'sodium_tartrate').
+atc_l3('a06', 'sorbitol').
+atc_l3('a06', 'sterculia').
+atc_l3('a06', 'sterculia_combinations').
+atc_l3('a06', 'tegaserod').
+atc_l3('a06', 'tenapanor').
+atc_l3('a06', 'triticum_wheat_fibre').
+atc_l3('a07', 'acetarsol').
+atc_l3('a07', 'albumin_tannate').
+atc_l3('a07', 'albumin_tannate_combinations').
+atc_l3('a07', 'amphotericin_b').
+atc_l3('a07', 'attapulgite').
+atc_l3('a07', 'attapulgite_combinations').
+atc_l3('a07', 'balsalazide').
+atc_l3('a07', 'beclometasone').
+atc_l3('a07', 'betamethasone').
+atc_l3('a07', 'broxyquinoline').
+atc_l3('a07', 'budesonide').
+atc_l3('a07', 'calcium_compounds').
+atc_l3('a07', 'ceratonia').
+atc_l3('a07', 'colistin').
+atc_l3('a07', 'combinations').
+atc_l3('a07', 'crofelemer').
+atc_l3('a07', 'cromoglicic_acid').
+atc_l3('a07', 'crospovidone').
+atc_l3('a07', 'difenoxin').
+atc_l3('a07', 'diosmectite').
+atc_l3('a07', 'diphenoxylate').
+atc_l3('a07', 'eluxadoline').
+atc_l3('a07', 'escherichia_coli').
+atc_l3('a07', 'fidaxomicin').
+atc_l3('a07', 'hydrocortisone').
+atc_l3('a07', 'kanamycin').
+atc_l3('a07', 'kaolin').
+atc_l3('a07', 'lactic_acid_producing_organisms').
+atc_l3('a07', 'lactic_acid_producing_organisms_combinations').
+atc_l3('a07', 'loperamide').
+atc_l3('a07', 'loperamide_combinations').
+atc_l3('a07', 'loperamide_oxide').
+atc_l3('a07', 'medicinal_charcoal').
+atc_l3('a07', 'medicinal_charcoal_combinations').
+atc_l3('a07', 'mesalazine').
+atc_l3('a07', 'miconazole').
+atc_l3('a07', 'morphine_combinations').
+atc_l3('a07', 'natamycin').
+atc_l3('a07', 'neomycin').
+atc_l3('a07', 'neomycin_combinations').
+atc_l3('a07', 'nifuroxazide').
+atc_l3('a07', 'nifurzide').
+atc_l3('a07', 'nystatin').
+atc_l3('a07', 'olsalazine').
+atc_l3('a07', 'opium').
+atc_l3('a07', 'paromomycin').
+atc_l3('a07', 'pectin').
+atc_l3('a07', 'phthalylsulfathiazole').
+atc_l3('a07', 'polymyxin_b').
+atc_l3('a07', 'prednisolone').
+atc_l3('a07', 'prednisone').
+atc_l3('a07', 'racecadotril').
+atc_l3('a07', 'rifamycin').
+atc_l3('a07', 'rifaximin').
+atc_l3('a07', 'saccharomyces_boulardii').
+atc_l3('a07', 'streptomycin').
+atc_l3('a07', 'streptomycin_combinations').
+atc_l3('a07', 'succinylsulfathiazole').
+atc_l3('a07', 'sulfaguanidine').
+atc_l3('a07', 'sulfasalazine').
+atc_l3('a07', 'tixocortol').
+atc_l3('a07', 'vancomycin').
+atc_l3('a08', 'amfepramone').
+atc_l3('a08', 'bupropion_and_naltrexone').
+atc_l3('a08', 'cathine').
+atc_l3('a08', 'clobenzorex').
+atc_l3('a08', 'dexfenfluramine').
+atc_l3('a08', 'ephedrine_combinations').
+atc_l3('a08', 'etilamfetamine').
+atc_l3('a08', 'fenfluramine').
+atc_l3('a08', 'lorcaserin').
+atc_l3('a08', 'mazindol').
+atc_l3('a08', 'mefenorex').
+atc_l3('a08', 'orlistat').
+atc_l3('a08', 'phentermine').
+atc_l3('a08', 'phentermine_and_topiramate').
+atc_l3('a08', 'rimonabant').
+atc_l3('a08', 'setmelanotide').
+atc_l3('a08', 'sibutramine').
+atc_l3('a09', 'betaine_hydrochloride').
+atc_l3('a09', 'citric_acid').
+atc_l3('a09', 'diastase').
+atc_l3('a09', 'glutamic_acid_hydrochloride').
+atc_l3('a09', 'hydrochloric_acid').
+atc_l3('a09', 'multienzymes_and_acid_preparations').
+atc_l3('a09', 'multienzymes_lipase_protease_etc').
+atc_l3('a09', 'pepsin').
+atc_l3('a09', 'pepsin_and_acid_preparations').
+atc_l3('a09', 'tilactase').
+atc_l3('a10', 'acarbose').
+atc_l3('a10', 'acetohexamide').
+atc_l3('a10', 'albiglutide').
+atc_l3('a10', 'alogliptin').
+atc_l3('a10', 'beinaglutide').
+atc_l3('a10', 'benfluorex').
+atc_l3('a10', 'bexagliflozin').
+atc_l3('a10', 'buformin').
+atc_l3('a10', 'canagliflozin').
+atc_l3('a10', 'carbutamide').
+atc_l3('a10', 'carfloglitazar').
+atc_l3('a10', 'chlorpropamide').
+atc_l3('a10', 'combinations').
+atc_l3('a10', 'dapagliflozin').
+atc_l3('a10', 'dorzagliatin').
+atc_l3('a10', 'dulaglutide').
+atc_l3('a10', 'empagliflozin').
+atc_l3('a10', 'ertugliflozin').
+atc_l3('a10', 'evogliptin').
+atc_l3('a10', 'exenatide').
+atc_l3('a10', 'gemigliptin').
+atc_l3('a10', 'gemigliptin_and_rosuvastatin').
+atc_l3('a10', 'glibenclamide').
+atc_l3('a10', 'glibornuride').
+atc_l3('a10', 'gliclazide').
+atc_l3('a10', 'glimepiride').
+atc_l3('a10', 'glimepiride_and_pioglitazone').
+atc_l3('a10', 'glimepiride_and_rosiglitazone').
+atc_l3('a10', 'glipizide').
+atc_l3('a10', 'gliquidone').
+atc_l3('a10', 'glisoxepide').
+atc_l3('a10', 'glymidine').
+atc_l3('a10', 'guar_gum').
+atc_l3('a10', 'imeglimin').
+atc_l3('a10', 'insulin_aspart').
+atc_l3('a10', 'insulin_beef').
+atc_l3('a10', 'insulin_degludec').
+atc_l3('a10', 'insulin_degludec_and_insulin_aspart').
+atc_l3('a10', 'insulin_degludec_and_liraglutide').
+atc_l3('a10', 'insulin_detemir').
+atc_l3('a10', 'insulin_glargine').
+atc_l3('a10', 'insulin_glargine_and_lixisenatide').
+atc_l3('a10', 'insulin_glulisine').
+atc_l3('a10', 'insulin_human').
+atc_l3('a10', 'insulin_icodec').
+atc_l3('a10', 'insulin_lispro').
+atc_l3('a10', 'insulin_pork').
+atc_l3('a10', 'ipragliflozin').
+atc_l3('a10', 'linagliptin').
+atc_l3('a10', 'linagliptin_and_empagliflozin').
+atc_l3('a10', 'liraglutide').
+atc_l3('a10', 'lixisenatide').
+atc_l3('a10', 'lobeglitazone').
+atc_l3('a10', 'luseogliflozin').
+atc_l3('a10', 'metahexamide').
+atc_l3('a10', 'metformin').
+atc_l3('a10', 'metformin_and_acarbose').
+atc_l3('a10', 'metformin_and_alogliptin').
+atc_l3('a10', 'metformin_and_canagliflozin').
+atc_l3('a10', 'metformin_and_dapagliflozin').
+atc_l3('a10', 'metformin_and_empagliflozin').
+atc_l3('a10', 'metformin_and_ertugliflozin').
+atc_l3('a10', 'metformin_and_evogliptin').
+atc_l3('a10', 'metformin_and_gemigliptin').
+atc_l3('a10', 'metformin_and_linagliptin').
+atc_l3('a10', 'metformin_and_lobeglitazone').
+atc_l3('a10', 'metformin_and_pioglitazone').
+atc_l3('a10', 'metformin_and_repaglinide').
+atc_l3('a10', 'metformin_and_rosiglitazone').
+atc_l3('a10', 'metformin_and_saxagliptin').
+atc_l3('a10', 'metformin_and_sitagliptin').
+atc_l3('a10', 'metformin_and_sulfonylureas').
+atc_l3('a10', 'metformin_and_teneligliptin').
+atc_l3('a10', 'metformin_and_vildagliptin').
+atc_l3('a10', 'metformin_linagliptin_and_empagliflozin').
+atc_l3('a10', 'metformin_saxagliptin_and_dapagliflozin').
+atc_l3('a10', 'miglitol').
+atc_l3('a10', 'mitiglinide').
+atc_l3('a10', 'nateglinide').
+atc_l3('a10', 'phenformin').
+atc_l3('a10', 'phenformin_and_sulfonylureas').
+atc_l3('a10', 'pioglitazone').
+atc_l3('a10', 'pioglitazone_and_alogliptin').
+atc_l3('a10', 'pioglitazone_and_sitagliptin').
+atc_l3('a10', 'pramlintide').
+atc_l3('a10', 'repaglinide').
+atc_l3('a10', 'rosiglitazone').
+atc_l3('a10', 'saxagliptin').
+atc_l3('a10', 'saxagliptin_and_dapagliflozin').
+atc_l3('a10', 'semaglutide').
+atc_l3('a10', 'sitagliptin').
+atc_l3('a10', 'sitagliptin_and_dapagliflozin').
+atc_l3('a10', 'sitagliptin_and_ertugliflozin').
+atc_l3('a10', 'sitagliptin_and_simvastatin').
+atc_l3('a10', 'sotagliflozin').
+atc_l3('a10', 'teneligliptin').
+atc_l3('a10', 'teplizumab').
+atc_l3('a10', 'tirzepatide').
+atc_l3('a10', 'tolazamide').
+atc_l3('a10', 'tolbutamide').
+atc_l3('a10', 'tolrestat').
+atc_l3('a10', 'troglitazone').
+atc_l3('a10', 'vildagliptin').
+atc_l3('a10', 'voglibose').
+atc_l3('a11', 'alfacalcidol').
+atc_l3('a11', 'ascorbic_acid_vit_c').
+atc_l3('a11', 'ascorbic_acid_vit_c_and_calcium').
+atc_l3('a11', 'benfotiamine').
+atc_l3('a11', 'betacarotene').
+atc_l3('a11', 'biotin').
+atc_l3('a11', 'calcifediol').
+atc_l3('a11', 'calcitriol').
+atc_l3('a11', 'calcium_pantothenate').
+atc_l3('a11', 'colecalciferol').
+atc_l3('a11', 'colecalciferol_combinations').
+atc_l3('a11', 'combinations').
+atc_l3('a11', 'dexpanthenol').
+atc_l3('a11', 'dihydrotachysterol').
+atc_l3('a11', 'ergocalciferol').
+atc_l3('a11', 'inositol').
+atc_l3('a11', 'multivitamins_and_calcium').
+atc_l3('a11', 'multivitamins_and_iron').
+atc_l3('a11', 'multivitamins_and_other_minerals_incl_combinations').
+atc_l3('a11', 'multivitamins_and_trace_elements').
+atc_l3('a11', 'nicotinamide').
+atc_l3('a11', 'pantethine').
+atc_l3('a11', 'pyridoxal_phosphate').
+atc_l3('a11', 'pyridoxine_vit_b6').
+atc_l3('a11', 'retinol_vit_a').
+atc_l3('a11', 'riboflavin_vit_b2').
+atc_l3('a11', 'sulbutiamine').
+atc_l3('a11', 'thiamine_vit_b1').
+atc_l3('a11', 'tocofersolan').
+atc_l3('a11', 'tocopherol_vit_e').
+atc_l3('a12', 'calcium_carbonate').
+atc_l3('a12', 'calcium_chloride').
+atc_l3('a12', 'calcium_citrate').
+atc_l3('a12', 'calcium_citrate_lysine_complex').
+atc_l3('a12', 'calcium_different_salts_in_combination').
+atc_l3('a12', 'calcium_glubionate').
+atc_l3('a12', 'calcium_glucoheptonate').
+atc_l3('a12', 'calcium_gluconate').
+atc_l3('a12', 'calcium_glycerylphosphate').
+atc_l3('a12', 'calcium_lactate').
+atc_l3('a12', 'calcium_lactate_gluconate').
+atc_l3('a12', 'calcium_laevulate').
+atc_l3('a12', 'calcium_pangamate').
+atc_l3('a12', 'calcium_phosphate').
+atc_l3('a12', 'fluoride_combinations').
+atc_l3('a12', 'magnesium_aspartate').
+atc_l3('a12', 'magnesium_chloride').
+atc_l3('a12', 'magnesium_citrate').
+atc_l3('a12', 'magnesium_different_salts_in_combination').
+atc_l3('a12', 'magnesium_gluconate').
+atc_l3('a12', 'magnesium_lactate').
+atc_l3('a12', 'magnesium_levulinate').
+atc_l3('a12', 'magnesium_orotate').
+atc_l3('a12', 'magnesium_oxide').
+atc_l3('a12', 'magnesium_pidolate').
+atc_l3('a12', 'magnesium_sulfate').
+atc_l3('a12', 'potassium_chloride').
+atc_l3('a12', 'potassium_chloride_combinations').
+atc_l3('a12', 'potassium_citrate').
+atc_l3('a12', 'potassium_different_salts_in_combination').
+atc_l3('a12', 'potassium_gluconate').
+atc_l3('a12', 'potassium_hydrogencarbonate').
+atc_l3('a12', 'potassium_hydrogentartrate').
+atc_l3('a12', 'sodium_chloride').
+atc_l3('a12', 'sodium_fluoride').
+atc_l3('a12', 'sodium_monofluorophosphate').
+atc_l3('a12', 'sodium_selenate').
+atc_l3('a12', 'sodium_selenite').
+atc_l3('a12', 'sodium_sulfate').
+atc_l3('a12', 'zinc_gluconate').
+atc_l3('a12', 'zinc_protein_complex').
+atc_l3('a12', 'zinc_sulfate').
+atc_l3('a14', 'androstanolone').
+atc_l3('a14', 'ethylestrenol').
+atc_l3('a14', 'metandienone').
+atc_l3('a14', 'metenolone').
+atc_l3('a14', 'nandrolone').
+atc_l3('a14', 'norethandrolone').
+atc_l3('a14', 'oxabolone_cipionate').
+atc_l3('a14', 'oxandrolone').
+atc_l3('a14', 'oxymetholone').
+atc_l3('a14', 'prasterone').
+atc_l3('a14', 'quinbolone').
+atc_l3('a14', 'stanozolol').
+atc_l3('a16', 'ademetionine').
+atc_l3('a16', 'agalsidase_alfa').
+atc_l3('a16', 'agalsidase_beta').
+atc_l3('a16', 'alglucerase').
+atc_l3('a16', 'alglucosidase_alfa').
+atc_l3('a16', 'anethole_trithione').
+atc_l3('a16', 'asfotase_alfa').
+atc_l3('a16', 'atidarsagene_autotemcel').
+atc_l3('a16', 'avalglucosidase_alfa').
+atc_l3('a16', 'betaine').
+atc_l3('a16', 'carglumic_acid').
+atc_l3('a16', 'cerliponase_alfa').
+atc_l3('a16', 'cipaglucosidase_alfa').
+atc_l3('a16', 'eladocagene_exuparvovec').
+atc_l3('a16', 'eliglustat').
+atc_l3('a16', 'elivaldogene_autotemcel').
+atc_l3('a16', 'elosulfase_alfa').
+atc_l3('a16', 'fosdenopterin').
+atc_l3('a16', 'galsulfase').
+atc_l3('a16', 'givosiran').
+atc_l3('a16', 'glutamine').
+atc_l3('a16', 'glycerol_phenylbutyrate').
+atc_l3('a16', 'idursulfase').
+atc_l3('a16', 'idursulfase_beta').
+atc_l3('a16', 'imiglucerase').
+atc_l3('a16', 'laronidase').
+atc_l3('a16', 'leriglitazone').
+atc_l3('a16', 'levocarnitine').
+atc_l3('a16', 'lonafarnib').
+atc_l3('a16', 'lumasiran').
+atc_l3('a16', 'mercaptamine').
+atc_l3('a16', 'metreleptin').
+atc_l3('a16', 'migalastat').
+atc_l3('a16', 'miglustat').
+atc_l3('a16', 'nitisinone').
+atc_l3('a16', 'olipudase_alfa').
+atc_l3('a16', 'pabinafusp_alfa').
+atc_l3('a16', 'pegunigalsidase_alfa').
+atc_l3('a16', 'pegvaliase').
+atc_l3('a16', 'pegzilarginase').
+atc_l3('a16', 'sacrosidase').
+atc_l3('a16', 'sapropterin').
+atc_l3('a16', 'sebelipase_alfa').
+atc_l3('a16', 'sodium_benzoate').
+atc_l3('a16', 'sodium_benzoate_and_sodium_phenylacetate').
+atc_l3('a16', 'sodium_phenylbutyrate').
+atc_l3('a16', 'taliglucerase_alfa').
+atc_l3('a16', 'teduglutide').
+atc_l3('a16', 'telotristat').
+atc_l3('a16', 'thioctic_acid').
+atc_l3('a16', 'tiomolibdic_acid').
+atc_l3('a16', 'trientine').
+atc_l3('a16', 'triheptanoin').
+atc_l3('a16', 'uridine_triacetate').
+atc_l3('a16', 'velaglucerase_alfa').
+atc_l3('a16', 'velmanase_alfa').
+atc_l3('a16', 'vestronidase_alfa').
+atc_l3('a16', 'zinc_acetate').
+atc_l3('b01', 'abciximab').
+atc_l3('b01', 'acenocoumarol').
+atc_l3('b01', 'acetylsalicylic_acid').
+atc_l3('b01', 'acetylsalicylic_acid_combinations_with_proton_pump_inhibitors').
+atc_l3('b01', 'aloxiprin').
+atc_l3('b01', 'alteplase').
+atc_l3('b01', 'ancrod').
+atc_l3('b01', 'anistreplase').
+atc_l3('b01', 'antithrombin_iii').
+atc_l3('b01', 'apadamtase_alfa_and_cinaxadamtase_alfa').
+atc_l3('b01', 'apixaban').
+atc_l3('b01', 'argatroban').
+atc_l3('b01', 'bemiparin').
+atc_l3('b01', 'beraprost').
+atc_l3('b01', 'betrixaban').
+atc_l3('b01', 'bivalirudin').
+atc_l3('b01', 'brinase').
+atc_l3('b01', 'cangrelor').
+atc_l3('b01', 'caplacizumab').
+atc_l3('b01', 'carbasalate_calcium').
+atc_l3('b01', 'cilostazol').
+atc_l3('b01', 'clopidogrel').
+atc_l3('b01', 'cloricromen').
+atc_l3('b01', 'clorindione').
+atc_l3('b01', 'combinations').
+atc_l3('b01', 'dabigatran_etexilate').
+atc_l3('b01', 'dalteparin').
+atc_l3('b01', 'danaparoid').
+atc_l3('b01', 'defibrotide').
+atc_l3('b01', 'dermatan_sulfate').
+atc_l3('b01', 'desirudin').
+atc_l3('b01', 'dicoumarol').
+atc_l3('b01', 'diphenadione').
+atc_l3('b01', 'dipyridamole').
+atc_l3('b01', 'ditazole').
+atc_l3('b01', 'drotrecogin_alfa_activated').
+atc_l3('b01', 'edoxaban').
+atc_l3('b01', 'enoxaparin').
+atc_l3('b01', 'epoprostenol').
+atc_l3('b01', 'eptifibatide').
+atc_l3('b01', 'ethyl_biscoumacetate').
+atc_l3('b01', 'fibrinolysin').
+atc_l3('b01', 'fluindione').
+atc_l3('b01', 'fondaparinux').
+atc_l3('b01', 'heparin').
+atc_l3('b01', 'heparin_combinations').
+atc_l3('b01', 'iloprost').
+atc_l3('b01', 'indobufen').
+atc_l3('b01', 'lepirudin').
+atc_l3('b01', 'limaprost').
+atc_l3('b01', 'melagatran').
+atc_l3('b01', 'nadroparin').
+atc_l3('b01', 'parnaparin').
+atc_l3('b01', 'phenindione').
+atc_l3('b01', 'phenprocoumon').
+atc_l3('b01', 'picotamide').
+atc_l3('b01', 'prasugrel').
+atc_l3('b01', 'protein_c').
+atc_l3('b01', 'reteplase').
+atc_l3('b01', 'reviparin').
+atc_l3('b01', 'rivaroxaban').
+atc_l3('b01', 'rivaroxaban_and_acetylsalicylic_acid').
+atc_l3('b01', 'saruplase').
+atc_l3('b01', 'selexipag').
+atc_l3('b01', 'streptokinase').
+atc_l3('b01', 'sulodexide').
+atc_l3('b01', 'tenecteplase').
+atc_l3('b01', 'ticagrelor').
+atc_l3('b01', 'ticlopidine').
+atc_l3('b01', 'tinzaparin').
+atc_l3('b01', 'tioclomarol').
+atc_l3('b01', 'tirofiban').
+atc_l3('b01', 'treprostinil').
+atc_l3('b01', 'triflusal').
+atc_l3('b01', 'urokinase').
+atc_l3('b01', 'vorapaxar').
+atc_l3('b01', 'warfarin').
+atc_l3('b01', 'ximelagatran').
+atc_l3('b02', 'absorbable_gelatin_sponge').
+atc_l3('b02', 'adrenalone').
+atc_l3('b02', 'alfa1_antitrypsin').
+atc_l3('b02', 'aminocaproic_acid').
+atc_l3('b02', 'aminomethylbenzoic_acid').
+atc_l3('b02', 'aprotinin').
+atc_l3('b02', 'avatrombopag').
+atc_l3('b02', 'batroxobin').
+atc_l3('b02', 'calcium_alginate').
+atc_l3('b02', 'camostat').
+atc_l3('b02', 'carbazochrome').
+atc_l3('b02', 'catridecacog').
+atc_l3('b02', 'coagulation_factor_ix').
+atc_l3('b02', 'coagulation_factor_ix_ii_vii_and_x_in_combination').
+atc_l3('b02', 'coagulation_factor_vii').
+atc_l3('b02', 'coagulation_factor_viia').
+atc_l3('b02', 'coagulation_factor_viii').
+atc_l3('b02', 'coagulation_factor_x').
+atc_l3('b02', 'coagulation_factor_xiii').
+atc_l3('b02', 'collagen').
+atc_l3('b02', 'combinations').
+atc_l3('b02', 'concizumab').
+atc_l3('b02', 'eltrombopag').
+atc_l3('b02', 'emicizumab').
+atc_l3('b02', 'epinephrine').
+atc_l3('b02', 'etamsylate').
+atc_l3('b02', 'etranacogene_dezaparvovec').
+atc_l3('b02', 'factor_viii_inhibitor_bypassing_activity').
+atc_l3('b02', 'fibrinogen_human').
+atc_l3('b02', 'fostamatinib').
+atc_l3('b02', 'lusutrombopag').
+atc_l3('b02', 'menadione').
+atc_l3('b02', 'oxidized_cellulose').
+atc_l3('b02', 'phytomenadione').
+atc_l3('b02', 'romiplostim').
+atc_l3('b02', 'susoctocog_alfa').
+atc_l3('b02', 'tetragalacturonic_acid_hydroxymethylester').
+atc_l3('b02', 'thrombin').
+atc_l3('b02', 'tranexamic_acid').
+atc_l3('b02', 'ulinastatin').
+atc_l3('b02', 'valoctocogene_roxaparvovec').
+atc_l3('b02', 'von_willebrand_factor').
+atc_l3('b02', 'von_willebrand_factor_and_coagulation_factor_viii_in_combination').
+atc_l3('b03', 'chondroitin_sulfate_iron_complex').
+atc_l3('b03', 'cobamamide').
+atc_l3('b03', 'cyanocobalamin').
+atc_l3('b03', 'cyanocobalamin_combinations').
+atc_l3('b03', 'cyanocobalamin_tannin_complex').
+atc_l3('b03', 'daprodustat').
+atc_l3('b03', 'darbepoetin_alfa').
+atc_l3('b03', 'erythropoietin').
+atc_l3('b03', 'ferric_acetyl_transferrin').
+atc_l3('b03', 'ferric_hydroxide').
+atc_l3('b03', 'ferric_maltol').
+atc_l3('b03', 'ferric_oxide_polymaltose_complexes').
+atc_l3('b03', 'ferric_oxide_polymaltose_complexes_and_folic_acid').
+atc_l3('b03', 'ferric_proteinsuccinylate').
+atc_l3('b03', 'ferric_sodium_citrate').
+atc_l3('b03', 'ferrous_amino_acid_complex_and_folic_acid').
+atc_l3('b03', 'ferrous_ascorbate').
+atc_l3('b03', 'ferrous_aspartate').
+atc_l3('b03', 'ferrous_carbonate').
+atc_l3('b03', 'ferrous_chloride').
+atc_l3('b03', 'ferrous_fumarate').
+atc_l3('b03', 'ferrous_fumarate_and_folic_acid').
+atc_l3('b03', 'ferrous_gluconate').
+atc_l3('b03', 'ferrous_gluconate_and_folic_acid').
+atc_l3('b03', 'ferrous_glycine_sulfate').
+atc_l3('b03', 'ferrous_iodine').
+atc_l3('b03', 'ferrous_sodium_citrate').
+atc_l3('b03', 'ferrous_succinate').
+atc_l3('b03', 'ferrous_sulfate').
+atc_l3('b03', 'ferrous_sulfate_and_folic_acid').
+atc_l3('b03', 'ferrous_tartrate').
+atc_l3('b03', 'folic_acid').
+atc_l3('b03', 'folic_acid_combinations').
+atc_l3('b03', 'hydroxocobalamin').
+atc_l3('b03', 'hydroxocobalamin_combinations').
+atc_l3('b03', 'iron_and_multivitamins').
+atc_l3('b03', 'iron_multivitamins_and_folic_acid').
+atc_l3('b03', 'iron_multivitamins_and_minerals').
+atc_l3('b03', 'iron_vitamin_b12_and_folic_acid').
+atc_l3('b03', 'luspatercept').
+atc_l3('b03', 'mecobalamin').
+atc_l3('b03', 'methoxy_polyethylene_glycol_epoetin_beta').
+atc_l3('b03', 'peginesatide').
+atc_l3('b03', 'roxadustat').
+atc_l3('b03', 'saccharated_iron_oxide').
+atc_l3('b03', 'sodium_feredetate').
+atc_l3('b03', 'vadadustat').
+atc_l3('b03', 'various_combinations').
+atc_l3('b05', 'alanyl_glutamine').
+atc_l3('b05', 'albumin').
+atc_l3('b05', 'amino_acids').
+atc_l3('b05', 'ammonium_chloride').
+atc_l3('b05', 'arginine_hydrochloride').
+atc_l3('b05', 'blood_plasma').
+atc_l3('b05', 'calcium_chloride').
+atc_l3('b05', 'calcium_gluconate').
+atc_l3('b05', 'carbamide').
+atc_l3('b05', 'carbohydrates').
+atc_l3('b05', 'cardioplegia_solutions').
+atc_l3('b05', 'cetylpyridinium').
+atc_l3('b05', 'chlorhexidine').
+atc_l3('b05', 'combinations').
+atc_l3('b05', 'combinations_of_electrolytes').
+atc_l3('b05', 'dextran').
+atc_l3('b05', 'electrolytes').
+atc_l3('b05', 'electrolytes_in_combination_with_other_drugs').
+atc_l3('b05', 'electrolytes_with_carbohydrates').
+atc_l3('b05', 'erythrocytes').
+atc_l3('b05', 'ethacridine_lactate').
+atc_l3('b05', 'fat_emulsions').
+atc_l3('b05', 'fluorocarbon_blood_substitutes').
+atc_l3('b05', 'gelatin_agents').
+atc_l3('b05', 'glucose').
+atc_l3('b05', 'glycine').
+atc_l3('b05', 'hemoglobin_crosfumaril').
+atc_l3('b05', 'hemoglobin_glutamer_bovine').
+atc_l3('b05', 'hemoglobin_raffimer').
+atc_l3('b05', 'hydrochloric_acid').
+atc_l3('b05', 'hydroxyethylstarch').
+atc_l3('b05', 'lysine').
+atc_l3('b05', 'magnesium_chloride').
+atc_l3('b05', 'magnesium_citrate').
+atc_l3('b05', 'magnesium_phosphate').
+atc_l3('b05', 'magnesium_sulfate').
+atc_l3('b05', 'mandelic_acid').
+atc_l3('b05', 'mannitol').
+atc_l3('b05', 'neomycin').
+atc_l3('b05', 'nitrofural').
+atc_l3('b05', 'noxytiolin').
+atc_l3('b05', 'other_plasma_protein_fractions').
+atc_l3('b05', 'potassium_acetate').
+atc_l3('b05', 'potassium_chloride').
+atc_l3('b05', 'potassium_lactate').
+atc_l3('b05', 'potassium_phosphate_incl_combinations_with_other_potassium_salts').
+atc_l3('b05', 'protein_hydrolysates').
+atc_l3('b05', 'sodium_acetate').
+atc_l3('b05', 'sodium_bicarbonate').
+atc_l3('b05', 'sodium_chloride').
+atc_l3('b05', 'sodium_citrate').
+atc_l3('b05', 'sodium_glycerophosphate').
+atc_l3('b05', 'sodium_phosphate').
+atc_l3('b05', 'sodium_selenite').
+atc_l3('b05', 'sorbitol').
+atc_l3('b05', 'stem_cells_from_umbilical_cord_blood').
+atc_l3('b05', 'sulfamethizole').
+atc_l3('b05', 'taurolidine').
+atc_l3('b05', 'thrombocytes').
+atc_l3('b05', 'trometamol').
+atc_l3('b05', 'zinc_chloride').
+atc_l3('b05', 'zinc_sulfate').
+atc_l3('b06', 'berotralstat').
+atc_l3('b06', 'betibeglogene_autotemcel').
+atc_l3('b06', 'c1_inhibitor_plasma_derived').
+atc_l3('b06', 'chymotrypsin').
+atc_l3('b06', 'conestat_alfa').
+atc_l3('b06', 'crizanlizumab').
+atc_l3('b06', 'desoxyribonuclease').
+atc_l3('b06', 'ecallantide').
+atc_l3('b06', 'exagamglogene_autotemcel').
+atc_l3('b06', 'fibrinolysin_and_desoxyribonuclease').
+atc_l3('b06', 'hemin').
+atc_l3('b06', 'hyaluronidase').
+atc_l3('b06', 'icatibant').
+atc_l3('b06', 'lanadelumab').
+atc_l3('b06', 'mitapivat').
+atc_l3('b06', 'streptokinase_combinations').
+atc_l3('b06', 'trypsin').
+atc_l3('b06', 'voxelotor').
+atc_l3('c01', 'acadesine').
+atc_l3('c01', 'acetyldigitoxin').
+atc_l3('c01', 'acetyldigoxin').
+atc_l3('c01', 'acetyldigoxin_combinations').
+atc_l3('c01', 'adenosine').
+atc_l3('c01', 'ajmaline').
+atc_l3('c01', 'alprostadil').
+atc_l3('c01', 'amezinium_metilsulfate').
+atc_l3('c01', 'amiodarone').
+atc_l3('c01', 'amrinone').
+atc_l3('c01', 'angiotensin_ii').
+atc_l3('c01', 'angiotensinamide').
+atc_l3('c01', 'aprindine').
+atc_l3('c01', 'arbutamine').
+atc_l3('c01', 'benziodarone').
+atc_l3('c01', 'benziodarone_combinations').
+atc_l3('c01', 'bretylium_tosilate').
+atc_l3('c01', 'bucladesine').
+atc_l3('c01', 'bunaftine').
+atc_l3('c01', 'cafedrine').
+atc_l3('c01', 'camphora').
+atc_l3('c01', 'carbocromen').
+atc_l3('c01', 'centhaquine').
+atc_l3('c01', 'cibenzoline').
+atc_l3('c01', 'cinepazet').
+atc_l3('c01', 'cloridarol').
+atc_l3('c01', 'combinations').
+atc_l3('c01', 'crataegus_glycosides').
+atc_l3('c01', 'creatinolfosfate').
+atc_l3('c01', 'cymarin').
+atc_l3('c01', 'deslanoside').
+atc_l3('c01', 'digitalis_leaves').
+atc_l3('c01', 'digitoxin').
+atc_l3('c01', 'digoxin').
+atc_l3('c01', 'dilazep').
+atc_l3('c01', 'dimetofrine').
+atc_l3('c01', 'disopyramide').
+atc_l3('c01', 'dobutamine').
+atc_l3('c01', 'dofetilide').
+atc_l3('c01', 'dopamine').
+atc_l3('c01', 'dopexamine').
+atc_l3('c01', 'dronedarone').
+atc_l3('c01', 'droxidopa').
+atc_l3('c01', 'efloxate').
+atc_l3('c01', 'encainide').
+atc_l3('c01', 'enoximone').
+atc_l3('c01', 'ephedrine').
+atc_l3('c01', 'epinephrine').
+atc_l3('c01', 'eritrityl_tetranitrate').
+atc_l3('c01', 'eritrityl_tetranitrate_combinations').
+atc_l3('c01', 'etafenone').
+atc_l3('c01', 'ethacizine').
+atc_l3('c01', 'etilefrine').
+atc_l3('c01', 'etilefrine_combinations').
+atc_l3('c01', 'fenoldopam').
+atc_l3('c01', 'flecainide').
+atc_l3('c01', 'flosequinan').
+atc_l3('c01', 'fosfocreatine').
+atc_l3('c01', 'fructose_1_6_diphosphate').
+atc_l3('c01', 'g_strophanthin').
+atc_l3('c01', 'gepefrine').
+atc_l3('c01', 'gitoformate').
+atc_l3('c01', 'glyceryl_trinitrate').
+atc_l3('c01', 'glyceryl_trinitrate_combinations').
+atc_l3('c01', 'heptaminol').
+atc_l3('c01', 'hexobendine').
+atc_l3('c01', 'hydroquinidine').
+atc_l3('c01', 'ibopamine').
+atc_l3('c01', 'ibuprofen').
+atc_l3('c01', 'ibutilide').
+atc_l3('c01', 'imolamine').
+atc_l3('c01', 'indometacin').
+atc_l3('c01', 'isoprenaline').
+atc_l3('c01', 'isosorbide_dinitrate').
+atc_l3('c01', 'isosorbide_dinitrate_combinations').
+atc_l3('c01', 'isosorbide_mononitrate').
+atc_l3('c01', 'itramin_tosilate').
+atc_l3('c01', 'itramin_tosilate_combinations').
+atc_l3('c01', 'ivabradine').
+atc_l3('c01', 'lanatoside_c').
+atc_l3('c01', 'levosimendan').
+atc_l3('c01', 'lidocaine').
+atc_l3('c01', 'linsidomine').
+atc_l3('c01', 'lorajmine').
+atc_l3('c01', 'lorcainide').
+atc_l3('c01', 'mavacamten').
+atc_l3('c01', 'meldonium').
+atc_l3('c01', 'mephentermine').
+atc_l3('c01', 'metaraminol').
+atc_l3('c01', 'methoxamine').
+atc_l3('c01', 'methylpropylpropanediol_dinitrate').
+atc_l3('c01', 'methylpropylpropanediol_dinitrate_combinations').
+atc_l3('c01', 'metildigoxin').
+atc_l3('c01', 'mexiletine').
+atc_l3('c01', 'midodrine').
+atc_l3('c01', 'milrinone').
+atc_l3('c01', 'molsidomine').
+atc_l3('c01', 'moracizine').
+atc_l3('c01', 'nesiritide').
+atc_l3('c01', 'nicorandil').
+atc_l3('c01', 'norepinephrine').
+atc_l3('c01', 'norfenefrine').
+atc_l3('c01', 'octopamine').
+atc_l3('c01', 'omecamtiv_mecarbil').
+atc_l3('c01', 'organic_nitrates_in_combination').
+atc_l3('c01', 'organic_nitrates_in_combination_with_psycholeptics').
+atc_l3('c01', 'oxedrine').
+atc_l3('c01', 'oxyfedrine').
+atc_l3('c01', 'oxyfedrine_combinations').
+atc_l3('c01', 'pentaerithrityl_tetranitrate').
+atc_l3('c01', 'pentaerithrityl_tetranitrate_combinations').
+atc_l3('c01', 'peruvoside').
+atc_l3('c01', 'phenylephrine').
+atc_l3('c01', 'prajmaline').
+atc_l3('c01', 'prenalterol').
+atc_l3('c01', 'prenylamine').
+atc_l3('c01', 'prenylamine_combinations').
+atc_l3('c01', 'procainamide').
+atc_l3('c01', 'propafenone').
+atc_l3('c01', 'propatylnitrate').
+atc_l3('c01', 'propatylnitrate_combinations').
+atc_l3('c01', 'proscillaridin').
+atc_l3('c01', 'proscillaridin_combinations').
+atc_l3('c01', 'quinidine').
+atc_l3('c01', 'quinidine_combinations_excl_psycholeptics').
+atc_l3('c01', 'quinidine_combinations_with_psycholeptics').
+atc_l3('c01', 'ranolazine').
+atc_l3('c01', 'regadenoson').
+atc_l3('c01', 'serelaxin').
+atc_l3('c01', 'sparteine').
+atc_l3('c01', 'tedisamil').
+atc_l3('c01', 'tenitramine').
+atc_l3('c01', 'theodrenaline').
+atc_l3('c01', 'tiazotic_acid').
+atc_l3('c01', 'tiracizine').
+atc_l3('c01', 'tocainide').
+atc_l3('c01', 'trapidil').
+atc_l3('c01', 'trimetazidine').
+atc_l3('c01', 'trolnitrate').
+atc_l3('c01', 'trolnitrate_combinations').
+atc_l3('c01', 'ubidecarenone').
+atc_l3('c01', 'vericiguat').
+atc_l3('c01', 'vernakalant').
+atc_l3('c01', 'xamoterol').
+atc_l3('c02', 'ambrisentan').
+atc_l3('c02', 'ambrisentan_and_tadalafil').
+atc_l3('c02', 'aprocitentan').
+atc_l3('c02', 'betanidine').
+atc_l3('c02', 'bietaserpine').
+atc_l3('c02', 'bietaserpine_and_diuretics').
+atc_l3('c02', 'bietaserpine_combinations').
+atc_l3('c02', 'bosentan').
+atc_l3('c02', 'cadralazine').
+atc_l3('c02', 'clonidine').
+atc_l3('c02', 'clonidine_and_diuretics').
+atc_l3('c02', 'clonidine_and_diuretics_combinations_with_other_drugs').
+atc_l3('c02', 'combination_of_rauwolfia_alkaloids_and_diuretics_incl_other_combinations').
+atc_l3('c02', 'combinations_of_rauwolfia_alkaloids').
+atc_l3('c02', 'combinations_of_rauwolfia_alkoloids_combinations').
+atc_l3('c02', 'debrisoquine').
+atc_l3('c02', 'deserpidine').
+atc_l3('c02', 'deserpidine_and_diuretics').
+atc_l3('c02', 'diazoxide').
+atc_l3('c02', 'dihydralazine').
+atc_l3('c02', 'dihydralazine_and_diuretics').
+atc_l3('c02', 'dihydralazine_and_diuretics_combinations_with_other_drugs').
+atc_l3('c02', 'doxazosin').
+atc_l3('c02', 'endralazine').
+atc_l3('c02', 'guanazodine').
+atc_l3('c02', 'guanethidine').
+atc_l3('c02', 'guanethidine_and_diuretics').
+atc_l3('c02', 'guanfacine').
+atc_l3('c02', 'guanoclor').
+atc_l3('c02', 'guanoxabenz').
+atc_l3('c02', 'guanoxan').
+atc_l3('c02', 'hydralazine').
+atc_l3('c02', 'hydralazine_and_diuretics').
+atc_l3('c02', 'indoramin').
+atc_l3('c02', 'ketanserin').
+atc_l3('c02', 'macitentan').
+atc_l3('c02', 'macitentan_and_tadalafil').
+atc_l3('c02', 'mecamylamine').
+atc_l3('c02', 'methoserpidine').
+atc_l3('c02', 'methoserpidine_and_diuretics').
+atc_l3('c02', 'methyldopa_levorotatory').
+atc_l3('c02', 'methyldopa_levorotatory_and_diuretics').
+atc_l3('c02', 'methyldopa_racemic').
+atc_l3('c02', 'metirosine').
+atc_l3('c02', 'minoxidil').
+atc_l3('c02', 'moxonidine').
+atc_l3('c02', 'moxonidine_and_diuretics').
+atc_l3('c02', 'nitroprusside').
+atc_l3('c02', 'pargyline').
+atc_l3('c02', 'pargyline_and_diuretics').
+atc_l3('c02', 'picodralazine_and_diuretics').
+atc_l3('c02', 'picodralazine_and_diuretics_combinations_with_psycholeptics').
+atc_l3('c02', 'pinacidil').
+atc_l3('c02', 'pinacidil_and_diuretics').
+atc_l3('c02', 'prazosin').
+atc_l3('c02', 'prazosin_and_diuretics').
+atc_l3('c02', 'rauwolfia_alkaloids_whole_root').
+atc_l3('c02', 'rauwolfia_alkaloids_whole_root_and_diuretics').
+atc_l3('c02', 'rescinnamine').
+atc_l3('c02', 'rescinnamine_and_diuretics').
+atc_l3('c02', 'rescinnamine_and_diuretics_combinations_with_other_drugs').
+atc_l3('c02', 'reserpine').
+atc_l3('c02', 'reserpine_and_diuretics').
+atc_l3('c02', 'reserpine_and_diuretics_combinations_with_other_drugs').
+atc_l3('c02', 'reserpine_and_diuretics_combinations_with_psycholeptics').
+atc_l3('c02', 'reserpine_combinations').
+atc_l3('c02', 'rilmenidine').
+atc_l3('c02', 'riociguat').
+atc_l3('c02', 'sitaxentan').
+atc_l3('c02', 'syrosingopine_and_diuretics').
+atc_l3('c02', 'tolonidine').
+atc_l3('c02', 'trimazosin').
+atc_l3('c02', 'trimetaphan').
+atc_l3('c02', 'urapidil').
+atc_l3('c02', 'veratrum').
+atc_l3('c02', 'veratrum_and_diuretics').
+atc_l3('c03', 'altizide_and_potassium_sparing_agents').
+atc_l3('c03', 'amiloride').
+atc_l3('c03', 'bendroflumethiazide').
+atc_l3('c03', 'bendroflumethiazide_and_potassium').
+atc_l3('c03', 'bendroflumethiazide_and_potassium_sparing_agents').
+atc_l3('c03', 'bumetanide').
+atc_l3('c03', 'bumetanide_and_potassium').
+atc_l3('c03', 'bumetanide_and_potassium_sparing_agents').
+atc_l3('c03', 'butizide_and_potassium_sparing_agents').
+atc_l3('c03', 'canrenone').
+atc_l3('c03', 'chlorothiazide').
+atc_l3('c03', 'chlorothiazide_and_potassium').
+atc_l3('c03', 'chlorothiazide_combinations').
+atc_l3('c03', 'chlortalidone').
+atc_l3('c03', 'chlortalidone_and_potassium').
+atc_l3('c03', 'chlortalidone_and_potassium_sparing_agents').
+atc_l3('c03', 'cicletanine').
+atc_l3('c03', 'clofenamide').
+atc_l3('c03', 'clofenamide_and_potassium').
+atc_l3('c03', 'clopamide').
+atc_l3('c03', 'clopamide_and_potassium').
+atc_l3('c03', 'clorexolone').
+atc_l3('c03', 'clorexolone_combinations_with_psycholeptics').
+atc_l3('c03', 'conivaptan').
+atc_l3('c03', 'cyclopenthiazide').
+atc_l3('c03', 'cyclopenthiazide_and_potassium').
+atc_l3('c03', 'cyclopenthiazide_and_potassium_sparing_agents').
+atc_l3('c03', 'cyclothiazide').
+atc_l3('c03', 'cyclothiazide_and_potassium').
+atc_l3('c03', 'epitizide_and_potassium_sparing_agents').
+atc_l3('c03', 'eplerenone').
+atc_l3('c03', 'etacrynic_acid').
+atc_l3('c03', 'etozolin').
+atc_l3('c03', 'fenquizone').
+atc_l3('c03', 'finerenone').
+atc_l3('c03', 'furosemide').
+atc_l3('c03', 'furosemide_and_potassium').
+atc_l3('c03', 'furosemide_and_potassium_sparing_agents').
+atc_l3('c03', 'hydrochlorothiazide').
+atc_l3('c03', 'hydrochlorothiazide_and_potassium').
+atc_l3('c03', 'hydrochlorothiazide_and_potassium_sparing_agents').
+atc_l3('c03', 'hydrochlorothiazide_combinations').
+atc_l3('c03', 'hydroflumethiazide').
+atc_l3('c03', 'hydroflumethiazide_and_potassium').
+atc_l3('c03', 'hydroflumethiazide_combinations').
+atc_l3('c03', 'indapamide').
+atc_l3('c03', 'mebutizide').
+atc_l3('c03', 'mebutizide_and_potassium_sparing_agents').
+atc_l3('c03', 'mefruside').
+atc_l3('c03', 'mefruside_and_potassium').
+atc_l3('c03', 'mersalyl').
+atc_l3('c03', 'methyclothiazide').
+atc_l3('c03', 'methyclothiazide_and_potassium').
+atc_l3('c03', 'meticrane').
+atc_l3('c03', 'metolazone').
+atc_l3('c03', 'metolazone_and_potassium_sparing_agents').
+atc_l3('c03', 'muzolimine').
+atc_l3('c03', 'piretanide').
+atc_l3('c03', 'polythiazide').
+atc_l3('c03', 'polythiazide_and_potassium').
+atc_l3('c03', 'potassium_canrenoate').
+atc_l3('c03', 'quinethazone').
+atc_l3('c03', 'quinethazone_and_potassium').
+atc_l3('c03', 'spironolactone').
+atc_l3('c03', 'theobromine').
+atc_l3('c03', 'tienilic_acid').
+atc_l3('c03', 'tolvaptan').
+atc_l3('c03', 'torasemide').
+atc_l3('c03', 'triamterene').
+atc_l3('c03', 'trichlormethiazide').
+atc_l3('c03', 'trichlormethiazide_and_potassium').
+atc_l3('c03', 'trichlormethiazide_and_potassium_sparing_agents').
+atc_l3('c03', 'xipamide').
+atc_l3('c04', 'azapetine').
+atc_l3('c04', 'bamethan').
+atc_l3('c04', 'bencyclane').
+atc_l3('c04', 'buflomedil').
+atc_l3('c04', 'buphenine').
+atc_l3('c04', 'butalamine').
+atc_l3('c04', 'cetiedil').
+atc_l3('c04', 'ciclonicate').
+atc_l3('c04', 'cinepazide').
+atc_l3('c04', 'clazosentan').
+atc_l3('c04', 'cyclandelate').
+atc_l3('c04', 'dihydroergocristine').
+atc_l3('c04', 'dihydroergocristine_combinations').
+atc_l3('c04', 'ergoloid_mesylates').
+atc_l3('c04', 'ergoloid_mesylates_combinations').
+atc_l3('c04', 'etofylline_nicotinate').
+atc_l3('c04', 'fasudil').
+atc_l3('c04', 'ifenprodil').
+atc_l3('c04', 'inositol_nicotinate').
+atc_l3('c04', 'isoxsuprine').
+atc_l3('c04', 'kallidinogenase').
+atc_l3('c04', 'moxisylyte').
+atc_l3('c04', 'naftidrofuryl').
+atc_l3('c04', 'nicergoline').
+atc_l3('c04', 'nicotinic_acid').
+atc_l3('c04', 'nicotinyl_alcohol_pyridylcarbinol').
+atc_l3('c04', 'pentifylline').
+atc_l3('c04', 'pentoxifylline').
+atc_l3('c04', 'phenoxybenzamine').
+atc_l3('c04', 'phentolamine').
+atc_l3('c04', 'suloctidil').
+atc_l3('c04', 'tolazoline').
+atc_l3('c04', 'vinburnine').
+atc_l3('c04', 'vincamine').
+atc_l3('c04', 'visnadine').
+atc_l3('c04', 'xantinol_nicotinate').
+atc_l3('c05', 'aluminium_preparations').
+atc_l3('c05', 'benzocaine').
+atc_l3('c05', 'beperminogene_perplasmid').
+atc_l3('c05', 'betamethasone').
+atc_l3('c05', 'bismuth_preparations_combinations').
+atc_l3('c05', 'calcium_dobesilate').
+atc_l3('c05', 'calcium_dobesilate_combinations').
+atc_l3('c05', 'cinchocaine').
+atc_l3('c05', 'dexamethasone').
+atc_l3('c05', 'diltiazem').
+atc_l3('c05', 'diosmin').
+atc_l3('c05', 'diosmin_combinations').
+atc_l3('c05', 'fluocinolone_acetonide').
+atc_l3('c05', 'fluocinonide').
+atc_l3('c05', 'fluocortolone').
+atc_l3('c05', 'fluorometholone').
+atc_l3('c05', 'glucose_combinations').
+atc_l3('c05', 'glyceryl_trinitrate').
+atc_l3('c05', 'heparin').
+atc_l3('c05', 'heparin_combinations').
+atc_l3('c05', 'heparinoid_combinations').
+atc_l3('c05', 'hidrosmin').
+atc_l3('c05', 'hippocastani_semen').
+atc_l3('c05', 'hydrocortisone').
+atc_l3('c05', 'invert_sugar').
+atc_l3('c05', 'isosorbide_dinitrate').
+atc_l3('c05', 'lidocaine').
+atc_l3('c05', 'monoethanolamine_oleate').
+atc_l3('c05', 'monoxerutin').
+atc_l3('c05', 'naftazone').
+atc_l3('c05', 'organo_heparinoid').
+atc_l3('c05', 'other_preparations_combinations').
+atc_l3('c05', 'oxetacaine').
+atc_l3('c05', 'pentosan_polysulfate_sodium').
+atc_l3('c05', 'phenol').
+atc_l3('c05', 'phenylephrine').
+atc_l3('c05', 'polidocanol').
+atc_l3('c05', 'pramocaine').
+atc_l3('c05', 'prednisolone').
+atc_l3('c05', 'procaine').
+atc_l3('c05', 'rutoside').
+atc_l3('c05', 'rutoside_combinations').
+atc_l3('c05', 'sodium_apolate').
+atc_l3('c05', 'sodium_tetradecyl_sulfate').
+atc_l3('c05', 'tetracaine').
+atc_l3('c05', 'triamcinolone').
+atc_l3('c05', 'tribenoside').
+atc_l3('c05', 'troxerutin').
+atc_l3('c05', 'troxerutin_combinations').
+atc_l3('c05', 'zinc_preparations').
+atc_l3('c07', 'acebutolol').
+atc_l3('c07', 'acebutolol_and_thiazides').
+atc_l3('c07', 'alprenolol').
+atc_l3('c07', 'atenolol').
+atc_l3('c07', 'atenolol_and_nifedipine').
+atc_l3('c07', 'atenolol_and_other_diuretics').
+atc_l3('c07', 'atenolol_and_other_diuretics_combinations').
+atc_l3('c07', 'atenolol_and_thiazides').
+atc_l3('c07', 'atenolol_thiazides_and_other_diuretics').
+atc_l3('c07', 'betaxolol').
+atc_l3('c07', 'bevantolol').
+atc_l3('c07', 'bevantolol_and_thiazides').
+atc_l3('c07', 'bisoprolol').
+atc_l3('c07', 'bisoprolol_and_acetylsalicylic_acid').
+atc_l3('c07', 'bisoprolol_and_amlodipine').
+atc_l3('c07', 'bisoprolol_and_thiazides').
+atc_l3('c07', 'bopindolol').
+atc_l3('c07', 'bopindolol_and_other_diuretics').
+atc_l3('c07', 'bupranolol').
+atc_l3('c07', 'carteolol').
+atc_l3('c07', 'carvedilol').
+atc_l3('c07', 'carvedilol_and_ivabradine').
+atc_l3('c07', 'celiprolol').
+atc_l3('c07', 'cloranolol').
+atc_l3('c07', 'epanolol').
+atc_l3('c07', 'esmolol').
+atc_l3('c07', 'labetalol').
+atc_l3('c07', 'labetalol_and_other_diuretics').
+atc_l3('c07', 'labetalol_and_thiazides').
+atc_l3('c07', 'landiolol').
+atc_l3('c07', 'mepindolol').
+atc_l3('c07', 'metipranolol_and_thiazides_combinations').
+atc_l3('c07', 'metoprolol').
+atc_l3('c07', 'metoprolol_and_acetylsalicylic_acid').
+atc_l3('c07', 'metoprolol_and_amlodipine').
+atc_l3('c07', 'metoprolol_and_felodipine').
+atc_l3('c07', 'metoprolol_and_ivabradine').
+atc_l3('c07', 'metoprolol_and_other_diuretics').
+atc_l3('c07', 'metoprolol_and_thiazides').
+atc_l3('c07', 'metoprolol_and_thiazides_combinations').
+atc_l3('c07', 'nadolol').
+atc_l3('c07', 'nadolol_and_thiazides').
+atc_l3('c07', 'nebivolol').
+atc_l3('c07', 'nebivolol_and_amlodipine').
+atc_l3('c07', 'nebivolol_and_thiazides').
+atc_l3('c07', 'oxprenolol').
+atc_l3('c07', 'oxprenolol_and_other_diuretics').
+atc_l3('c07', 'oxprenolol_and_thiazides').
+atc_l3('c07', 'penbutolol').
+atc_l3('c07', 'penbutolol_and_other_diuretics').
+atc_l3('c07', 'pindolol').
+atc_l3('c07', 'pindolol_and_other_diuretics').
+atc_l3('c07', 'practolol').
+atc_l3('c07', 'propranolol').
+atc_l3('c07', 'propranolol_and_other_combinations').
+atc_l3('c07', 'propranolol_and_thiazides').
+atc_l3('c07', 's_atenolol').
+atc_l3('c07', 'sotalol').
+atc_l3('c07', 'sotalol_and_acetylsalicylic_acid').
+atc_l3('c07', 'sotalol_and_thiazides').
+atc_l3('c07', 'talinolol').
+atc_l3('c07', 'tertatolol').
+atc_l3('c07', 'timolol').
+atc_l3('c07', 'timolol_and_thiazides').
+atc_l3('c07', 'timolol_thiazides_and_other_diuretics').
+atc_l3('c08', 'amlodipine').
+atc_l3('c08', 'amlodipine_and_celecoxib').
+atc_l3('c08', 'amlodipine_and_diuretics').
+atc_l3('c08', 'barnidipine').
+atc_l3('c08', 'benidipine').
+atc_l3('c08', 'bepridil').
+atc_l3('c08', 'cilnidipine').
+atc_l3('c08', 'clevidipine').
+atc_l3('c08', 'diltiazem').
+atc_l3('c08', 'felodipine').
+atc_l3('c08', 'fendiline').
+atc_l3('c08', 'gallopamil').
+atc_l3('c08', 'isradipine').
+atc_l3('c08', 'lacidipine').
+atc_l3('c08', 'lercanidipine').
+atc_l3('c08', 'levamlodipine').
+atc_l3('c08', 'lidoflazine').
+atc_l3('c08', 'manidipine').
+atc_l3('c08', 'mibefradil').
+atc_l3('c08', 'nicardipine').
+atc_l3('c08', 'nifedipine').
+atc_l3('c08', 'nifedipine_and_diuretics').
+atc_l3('c08', 'nifedipine_combinations').
+atc_l3('c08', 'nilvadipine').
+atc_l3('c08', 'nimodipine').
+atc_l3('c08', 'nisoldipine').
+atc_l3('c08', 'nitrendipine').
+atc_l3('c08', 'perhexiline').
+atc_l3('c08', 'verapamil').
+atc_l3('c08', 'verapamil_combinations').
+atc_l3('c09', 'aliskiren').
+atc_l3('c09', 'aliskiren_amlodipine_and_hydrochlorothiazide').
+atc_l3('c09', 'aliskiren_and_amlodipine').
+atc_l3('c09', 'aliskiren_and_hydrochlorothiazide').
+atc_l3('c09', 'azilsartan_medoxomil').
+atc_l3('c09', 'azilsartan_medoxomil_and_diuretics').
+atc_l3('c09', 'benazepril').
+atc_l3('c09', 'benazepril_and_amlodipine').
+atc_l3('c09', 'benazepril_and_diuretics').
+atc_l3('c09', 'candesartan').
+atc_l3('c09', 'candesartan_amlodipine_and_hydrochlorothiazide').
+atc_l3('c09', 'candesartan_and_amlodipine').
+atc_l3('c09', 'candesartan_and_diuretics').
+atc_l3('c09', 'captopril').
+atc_l3('c09', 'captopril_and_diuretics').
+atc_l3('c09', 'cilazapril').
+atc_l3('c09', 'cilazapril_and_diuretics').
+atc_l3('c09', 'delapril').
+atc_l3('c09', 'delapril_and_diuretics').
+atc_l3('c09', 'delapril_and_manidipine').
+atc_l3('c09', 'enalapril').
+atc_l3('c09', 'enalapril_and_diuretics').
+atc_l3('c09', 'enalapril_and_lercanidipine').
+atc_l3('c09', 'enalapril_and_nitrendipine').
+atc_l3('c09', 'eprosartan').
+atc_l3('c09', 'eprosartan_and_diuretics').
+atc_l3('c09', 'fimasartan').
+atc_l3('c09', 'fimasartan_and_amlodipine').
+atc_l3('c09', 'fimasartan_and_diuretics').
+atc_l3('c09', 'fosinopril').
+atc_l3('c09', 'fosinopril_and_diuretics').
+atc_l3('c09', 'imidapril').
+atc_l3('c09', 'irbesartan').
+atc_l3('c09', 'irbesartan_amlodipine_and_hydrochlorothiazide').
+atc_l3('c09', 'irbesartan_and_amlodipine').
+atc_l3('c09', 'irbesartan_and_diuretics').
+atc_l3('c09', 'lisinopril').
+atc_l3('c09', 'lisinopril_and_amlodipine').
+atc_l3('c09', 'lisinopril_and_diuretics').
+atc_l3('c09', 'losartan').
+atc_l3('c09', 'losartan_and_amlodipine').
+atc_l3('c09', 'losartan_and_diuretics').
+atc_l3('c09', 'moexipril').
+atc_l3('c09', 'moexipril_and_diuretics').
+atc_l3('c09', 'olmesartan_medoxomil').
+atc_l3('c09', 'olmesartan_medoxomil_amlodipine_and_hydrochlorothiazide').
+atc_l3('c09', 'olmesartan_medoxomil_and_amlodipine').
+atc_l3('c09', 'olmesartan_medoxomil_and_diuretics').
+atc_l3('c09', 'perindopril').
+atc_l3('c09', 'perindopril_amlodipine_and_indapamide').
+atc_l3('c09', 'perindopril_and_amlodipine').
+atc_l3('c09', 'perindopril_and_bisoprolol').
+atc_l3('c09', 'perindopril_and_diuretics').
+atc_l3('c09', 'perindopril_bisoprolol_amlodipine_and_indapamide').
+atc_l3('c09', 'perindopril_bisoprolol_and_amlodipine').
+atc_l3('c09', 'quinapril').
+atc_l3('c09', 'quinapril_and_diuretics').
+atc_l3('c09', 'ramipril').
+atc_l3('c09', 'ramipril_amlodipine_and_hydrochlorothiazide').
+atc_l3('c09', 'ramipril_and_amlodipine').
+atc_l3('c09', 'ramipril_and_bisoprolol').
+atc_l3('c09', 'ramipril_and_diuretics').
+atc_l3('c09', 'ramipril_and_felodipine').
+atc_l3('c09', 'remikiren').
+atc_l3('c09', 'spirapril').
+atc_l3('c09', 'tasosartan').
+atc_l3('c09', 'telmisartan').
+atc_l3('c09', 'telmisartan_amlodipine_and_hydrochlorothiazide').
+atc_l3('c09', 'telmisartan_and_amlodipine').
+atc_l3('c09', 'telmisartan_and_diuretics').
+atc_l3('c09', 'temocapril').
+atc_l3('c09', 'trandolapril').
+atc_l3('c09', 'trandolapril_and_verapamil').
+atc_l3('c09', 'valsartan').
+atc_l3('c09', 'valsartan_amlodipine_and_hydrochlorothiazide').
+atc_l3('c09', 'valsartan_and_aliskiren').
+atc_l3('c09', 'valsartan_and_amlodipine').
+atc_l3('c09', 'valsartan_and_diuretics').
+atc_l3('c09', 'valsartan_and_lercanidipine').
+atc_l3('c09', 'valsartan_and_nebivolol').
+atc_l3('c09', 'valsartan_and_sacubitril').
+atc_l3('c09', 'zofenopril').
+atc_l3('c09', 'zofenopril_and_diuretics').
+atc_l3('c09', 'zofenopril_and_nebivolol').
+atc_l3('c10', 'acipimox').
+atc_l3('c10', 'alipogene_tiparvovec').
+atc_l3('c10', 'alirocumab').
+atc_l3('c10', 'aluminium_clofibrate').
+atc_l3('c10', 'aluminium_nicotinate').
+atc_l3('c10', 'atorvastatin').
+atc_l3('c10', 'atorvastatin_acetylsalicylic_acid_and_perindopril').
+atc_l3('c10', 'atorvastatin_acetylsalicylic_acid_and_ramipril').
+atc_l3('c10', 'atorvastatin_amlodipine_and_candesartan').
+atc_l3('c10', 'atorvastatin_amlodipine_and_perindopril').
+atc_l3('c10', 'atorvastatin_amlodipine_and_ramipril').
+atc_l3('c10', 'atorvastatin_and_acetylsalicylic_acid').
+atc_l3('c10', 'atorvastatin_and_amlodipine').
+atc_l3('c10', 'atorvastatin_and_ezetimibe').
+atc_l3('c10', 'atorvastatin_and_omega_3_fatty_acids').
+atc_l3('c10', 'atorvastatin_and_perindopril').
+atc_l3('c10', 'bempedoic_acid').
+atc_l3('c10', 'bempedoic_acid_and_ezetimibe').
+atc_l3('c10', 'bezafibrate').
+atc_l3('c10', 'cerivastatin').
+atc_l3('c10', 'choline_fenofibrate').
+atc_l3('c10', 'ciprofibrate').
+atc_l3('c10', 'clofibrate').
+atc_l3('c10', 'clofibride').
+atc_l3('c10', 'colesevelam').
+atc_l3('c10', 'colestipol').
+atc_l3('c10', 'colestyramine').
+atc_l3('c10', 'colextran').
+atc_l3('c10', 'dextrothyroxine').
+atc_l3('c10', 'etofibrate').
+atc_l3('c10', 'evinacumab').
+atc_l3('c10', 'evolocumab').
+atc_l3('c10', 'ezetimibe').
+atc_l3('c10', 'fenofibrate').
+atc_l3('c10', 'fluvastatin').
+atc_l3('c10', 'gemfibrozil').
+atc_l3('c10', 'inclisiran').
+atc_l3('c10', 'lomitapide').
+atc_l3('c10', 'lovastatin').
+atc_l3('c10', 'lovastatin_and_nicotinic_acid').
+atc_l3('c10', 'magnesium_pyridoxal_5_phosphate_glutamate').
+atc_l3('c10', 'meglutol').
+atc_l3('c10', 'mipomersen').
+atc_l3('c10', 'niceritrol').
+atc_l3('c10', 'nicofuranose').
+atc_l3('c10', 'nicotinic_acid').
+atc_l3('c10', 'nicotinic_acid_combinations').
+atc_l3('c10', 'nicotinyl_alcohol_pyridylcarbinol').
+atc_l3('c10', 'omega_3_triglycerides_incl_other_esters_and_acids').
+atc_l3('c10', 'pemafibrate').
+atc_l3('c10', 'pitavastatin').
+atc_l3('c10', 'policosanol').
+atc_l3('c10', 'pravastatin').
+atc_l3('c10', 'pravastatin_and_acetylsalicylic_acid').
+atc_l3('c10', 'pravastatin_and_ezetimibe').
+atc_l3('c10', 'pravastatin_and_fenofibrate').
+atc_l3('c10', 'pravastatin_ezetimibe_and_fenofibrate').
+atc_l3('c10', 'probucol').
+atc_l3('c10', 'ronifibrate').
+atc_l3('c10', 'rosuvastatin').
+atc_l3('c10', 'rosuvastatin_amlodipine_and_lisinopril').
+atc_l3('c10', 'rosuvastatin_amlodipine_and_perindopril').
+atc_l3('c10', 'rosuvastatin_and_acetylsalicylic_acid').
+atc_l3('c10', 'rosuvastatin_and_amlodipine').
+atc_l3('c10', 'rosuvastatin_and_ezetimibe').
+atc_l3('c10', 'rosuvastatin_and_fenofibrate').
+atc_l3('c10', 'rosuvastatin_and_fimasartan').
+atc_l3('c10', 'rosuvastatin_and_omega_3_fatty_acids').
+atc_l3('c10', 'rosuvastatin_and_perindopril').
+atc_l3('c10', 'rosuvastatin_and_ramipril').
+atc_l3('c10', 'rosuvastatin_and_telmisartan').
+atc_l3('c10', 'rosuvastatin_and_valsartan').
+atc_l3('c10', 'rosuvastatin_perindopril_and_indapamide').
+atc_l3('c10', 'simfibrate').
+atc_l3('c10', 'simvastatin').
+atc_l3('c10', 'simvastatin_acetylsalicylic_acid_and_ramipril').
+atc_l3('c10', 'simvastatin_and_acetylsalicylic_acid').
+atc_l3('c10', 'simvastatin_and_ezetimibe').
+atc_l3('c10', 'simvastatin_and_fenofibrate').
+atc_l3('c10', 'tiadenol').
+atc_l3('c10', 'volanesorsen').
+atc_l3('d01', 'amorolfine').
+atc_l3('d01', 'bifonazole').
+atc_l3('d01', 'bifonazole_combinations').
+atc_l3('d01', 'bromochlorosalicylanilide').
+atc_l3('d01', 'butenafine').
+atc_l3('d01', 'chlormidazole').
+atc_l3('d01', 'chlorphenesin').
+atc_l3('d01', 'ciclopirox').
+atc_l3('d01', 'clotrimazole').
+atc_l3('d01', 'combinations').
+atc_l3('d01', 'dimazole').
+atc_l3('d01', 'eberconazole').
+atc_l3('d01', 'econazole').
+atc_l3('d01', 'efinaconazole').
+atc_l3('d01', 'ethyl_hydroxybenzoate').
+atc_l3('d01', 'fenticonazole').
+atc_l3('d01', 'fluconazole').
+atc_l3('d01', 'flucytosine').
+atc_l3('d01', 'flutrimazole').
+atc_l3('d01', 'fosravuconazole').
+atc_l3('d01', 'griseofulvin').
+atc_l3('d01', 'hachimycin').
+atc_l3('d01', 'haloprogin').
+atc_l3('d01', 'imidazoles_triazoles_in_combination_with_corticosteroids').
+atc_l3('d01', 'isoconazole').
+atc_l3('d01', 'ketoconazole').
+atc_l3('d01', 'lanoconazole').
+atc_l3('d01', 'liranaftate').
+atc_l3('d01', 'luliconazole').
+atc_l3('d01', 'mepartricin').
+atc_l3('d01', 'methylrosaniline').
+atc_l3('d01', 'miconazole').
+atc_l3('d01', 'miconazole_combinations').
+atc_l3('d01', 'n_2_4_chlorphenoxy_ethanol').
+atc_l3('d01', 'naftifine').
+atc_l3('d01', 'natamycin').
+atc_l3('d01', 'neticonazole').
+atc_l3('d01', 'nystatin').
+atc_l3('d01', 'omoconazole').
+atc_l3('d01', 'oxiconazole').
+atc_l3('d01', 'pecilocin').
+atc_l3('d01', 'polynoxylin').
+atc_l3('d01', 'pyrrolnitrin').
+atc_l3('d01', 'salicylic_acid').
+atc_l3('d01', 'selenium_sulfide').
+atc_l3('d01', 'sertaconazole').
+atc_l3('d01', 'sulbentine').
+atc_l3('d01', 'sulconazole').
+atc_l3('d01', 'tavaborole').
+atc_l3('d01', 'terbinafine').
+atc_l3('d01', 'tiabendazole').
+atc_l3('d01', 'ticlatone').
+atc_l3('d01', 'tioconazole').
+atc_l3('d01', 'tolciclate').
+atc_l3('d01', 'tolnaftate').
+atc_l3('d01', 'tribromometacresol').
+atc_l3('d01', 'undecylenic_acid').
+atc_l3('d01', 'undecylenic_acid_combinations').
+atc_l3('d02', 'afamelanotide').
+atc_l3('d02', 'aminobenzoic_acid').
+atc_l3('d02', 'betacarotene').
+atc_l3('d02', 'carbamide').
+atc_l3('d02', 'carbamide_combinations').
+atc_l3('d02', 'octinoxate').
+atc_l3('d03', 'becaplermin').
+atc_l3('d03', 'beremagene_geperpavec').
+atc_l3('d03', 'betulae_cortex').
+atc_l3('d03', 'bromelains').
+atc_l3('d03', 'cadexomer_iodine').
+atc_l3('d03', 'calcium_pantothenate').
+atc_l3('d03', 'centella_asiatica_herba_incl_combinations').
+atc_l3('d03', 'collagenase').
+atc_l3('d03', 'collagenase_combinations').
+atc_l3('d03', 'crilanomer').
+atc_l3('d03', 'dexpanthenol').
+atc_l3('d03', 'dextranomer').
+atc_l3('d03', 'enoxolone').
+atc_l3('d03', 'hyaluronic_acid').
+atc_l3('d03', 'sodium_chlorite').
+atc_l3('d03', 'trafermin').
+atc_l3('d03', 'trolamine').
+atc_l3('d03', 'trypsin').
+atc_l3('d04', 'bamipine').
+atc_l3('d04', 'benzocaine').
+atc_l3('d04', 'chloropyramine').
+atc_l3('d04', 'chlorphenoxamine').
+atc_l3('d04', 'cinchocaine').
+atc_l3('d04', 'clemastine').
+atc_l3('d04', 'dimetindene').
+atc_l3('d04', 'diphenhydramine').
+atc_l3('d04', 'diphenhydramine_methylbromide').
+atc_l3('d04', 'doxepin').
+atc_l3('d04', 'isothipendyl').
+atc_l3('d04', 'lidocaine').
+atc_l3('d04', 'mepyramine').
+atc_l3('d04', 'oxybuprocaine').
+atc_l3('d04', 'pheniramine').
+atc_l3('d04', 'pramocaine').
+atc_l3('d04', 'promethazine').
+atc_l3('d04', 'quinisocaine').
+atc_l3('d04', 'tetracaine').
+atc_l3('d04', 'thenalidine').
+atc_l3('d04', 'thonzylamine').
+atc_l3('d04', 'tolpropamine').
+atc_l3('d04', 'tripelennamine').
+atc_l3('d05', 'acitretin').
+atc_l3('d05', 'bergapten').
+atc_l3('d05', 'calcipotriol').
+atc_l3('d05', 'calcipotriol_combinations').
+atc_l3('d05', 'calcitriol').
+atc_l3('d05', 'dithranol').
+atc_l3('d05', 'dithranol_combinations').
+atc_l3('d05', 'etretinate').
+atc_l3('d05', 'fumaric_acid').
+atc_l3('d05', 'fumaric_acid_derivatives_combinations').
+atc_l3('d05', 'methoxsalen').
+atc_l3('d05', 'roflumilast').
+atc_l3('d05', 'tacalcitol').
+atc_l3('d05', 'tapinarof').
+atc_l3('d05', 'tazarotene').
+atc_l3('d05', 'tazarotene_and_ulobetasol').
+atc_l3('d05', 'trioxysalen').
+atc_l3('d06', 'aciclovir').
+atc_l3('d06', 'aciclovir_combinations').
+atc_l3('d06', 'amikacin').
+atc_l3('d06', 'bacitracin').
+atc_l3('d06', 'chloramphenicol').
+atc_l3('d06', 'chlortetracycline').
+atc_l3('d06', 'demeclocycline').
+atc_l3('d06', 'docosanol').
+atc_l3('d06', 'edoxudine').
+atc_l3('d06', 'fusidic_acid').
+atc_l3('d06', 'gentamicin').
+atc_l3('d06', 'ibacitabine').
+atc_l3('d06', 'idoxuridine').
+atc_l3('d06', 'imiquimod').
+atc_l3('d06', 'ingenol_mebutate').
+atc_l3('d06', 'inosine').
+atc_l3('d06', 'lysozyme').
+atc_l3('d06', 'mafenide').
+atc_l3('d06', 'metronidazole').
+atc_l3('d06', 'mupirocin').
+atc_l3('d06', 'neomycin').
+atc_l3('d06', 'oxytetracycline').
+atc_l3('d06', 'ozenoxacin').
+atc_l3('d06', 'penciclovir').
+atc_l3('d06', 'podophyllotoxin').
+atc_l3('d06', 'retapamulin').
+atc_l3('d06', 'rifamycin').
+atc_l3('d06', 'rifaximin').
+atc_l3('d06', 'silver_sulfadiazine').
+atc_l3('d06', 'silver_sulfadiazine_combinations').
+atc_l3('d06', 'sinecatechins').
+atc_l3('d06', 'sulfamerazine').
+atc_l3('d06', 'sulfamethizole').
+atc_l3('d06', 'sulfanilamide').
+atc_l3('d06', 'sulfathiazole').
+atc_l3('d06', 'tetracycline').
+atc_l3('d06', 'tirbanibulin').
+atc_l3('d06', 'tromantadine').
+atc_l3('d06', 'tyrothricin').
+atc_l3('d06', 'virginiamycin').
+atc_l3('d07', 'alclometasone').
+atc_l3('d07', 'amcinonide').
+atc_l3('d07', 'beclometasone').
+atc_l3('d07', 'beclometasone_and_antibiotics').
+atc_l3('d07', 'betamethasone').
+atc_l3('d07', 'betamethasone_and_antibiotics').
+atc_l3('d07', 'betamethasone_and_antiseptics').
+atc_l3('d07', 'budesonide').
+atc_l3('d07', 'clobetasol').
+atc_l3('d07', 'clobetasol_and_antibiotics').
+atc_l3('d07', 'clobetasone').
+atc_l3('d07', 'clocortolone').
+atc_l3('d07', 'combinations_of_corticosteroids').
+atc_l3('d07', 'desonide').
+atc_l3('d07', 'desonide_and_antiseptics').
+atc_l3('d07', 'desoximetasone').
+atc_l3('d07', 'dexamethasone').
+atc_l3('d07', 'dexamethasone_and_antibiotics').
+atc_l3('d07', 'diflorasone').
+atc_l3('d07', 'diflucortolone').
+atc_l3('d07', 'diflucortolone_and_antiseptics').
+atc_l3('d07', 'difluprednate').
+atc_l3('d07', 'fluclorolone').
+atc_l3('d07', 'fludroxycortide').
+atc_l3('d07', 'fludroxycortide_and_antibiotics').
+atc_l3('d07', 'flumetasone').
+atc_l3('d07', 'flumetasone_and_antibiotics').
+atc_l3('d07', 'flumetasone_and_antiseptics').
+atc_l3('d07', 'fluocinolone_acetonide').
+atc_l3('d07', 'fluocinolone_acetonide_and_antibiotics').
+atc_l3('d07', 'fluocinolone_acetonide_and_antiseptics').
+atc_l3('d07', 'fluocinonide').
+atc_l3('d07', 'fluocinonide_and_antibiotics').
+atc_l3('d07', 'fluocortin').
+atc_l3('d07', 'fluocortolone').
+atc_l3('d07', 'fluocortolone_and_antibiotics').
+atc_l3('d07', 'fluocortolone_and_antiseptics').
+atc_l3('d07', 'fluorometholone').
+atc_l3('d07', 'fluorometholone_and_antibiotics').
+atc_l3('d07', 'fluperolone').
+atc_l3('d07', 'fluprednidene').
+atc_l3('d07', 'fluprednidene_and_antibiotics').
+atc_l3('d07', 'fluticasone').
+atc_l3('d07', 'halcinonide').
+atc_l3('d07', 'halometasone').
+atc_l3('d07', 'hydrocortisone').
+atc_l3('d07', 'hydrocortisone_aceponate').
+atc_l3('d07', 'hydrocortisone_and_antibiotics').
+atc_l3('d07', 'hydrocortisone_and_antiseptics').
+atc_l3('d07', 'hydrocortisone_buteprate').
+atc_l3('d07', 'hydrocortisone_butyrate').
+atc_l3('d07', 'hydrocortisone_butyrate_and_antiseptics').
+atc_l3('d07', 'methylprednisolone').
+atc_l3('d07', 'methylprednisolone_aceponate').
+atc_l3('d07', 'methylprednisolone_and_antibiotics').
+atc_l3('d07', 'mometasone').
+atc_l3('d07', 'prednicarbate').
+atc_l3('d07', 'prednisolone').
+atc_l3('d07', 'prednisolone_and_antibiotics').
+atc_l3('d07', 'prednisolone_and_antiseptics').
+atc_l3('d07', 'triamcinolone').
+atc_l3('d07', 'triamcinolone_and_antibiotics').
+atc_l3('d07', 'triamcinolone_and_antiseptics').
+atc_l3('d07', 'ulobetasol').
+atc_l3('d08', 'aminoacridine').
+atc_l3('d08', 'benzalkonium').
+atc_l3('d08', 'benzethonium_chloride').
+atc_l3('d08', 'benzethonium_chloride_combinations').
+atc_l3('d08', 'benzoxonium_chloride').
+atc_l3('d08', 'biphenylol').
+atc_l3('d08', 'cetrimide').
+atc_l3('d08', 'cetrimonium').
+atc_l3('d08', 'cetylpyridinium').
+atc_l3('d08', 'chlorhexidine').
+atc_l3('d08', 'chlorhexidine_combinations').
+atc_l3('d08', 'chloroxylenol').
+atc_l3('d08', 'chlorquinaldol').
+atc_l3('d08', 'clioquinol').
+atc_l3('d08', 'decamethoxine').
+atc_l3('d08', 'dequalinium').
+atc_l3('d08', 'dibrompropamidine').
+atc_l3('d08', 'didecyldimethylammonium_chloride').
+atc_l3('d08', 'diiodohydroxypropane').
+atc_l3('d08', 'dodeclonium_bromide_combinations').
+atc_l3('d08', 'eosin').
+atc_l3('d08', 'ethacridine_lactate').
+atc_l3('d08', 'ethanol').
+atc_l3('d08', 'euflavine').
+atc_l3('d08', 'hexachlorophene').
+atc_l3('d08', 'hexamidine').
+atc_l3('d08', 'hydrogen_peroxide').
+atc_l3('d08', 'iodine').
+atc_l3('d08', 'iodine_octylphenoxypolyglycolether').
+atc_l3('d08', 'isopropanol').
+atc_l3('d08', 'merbromin').
+atc_l3('d08', 'mercuric_amidochloride').
+atc_l3('d08', 'mercuric_chloride').
+atc_l3('d08', 'mercuric_iodide').
+atc_l3('d08', 'mercury_metallic').
+atc_l3('d08', 'nitrofural').
+atc_l3('d08', 'octenidine_combinations').
+atc_l3('d08', 'oxyquinoline').
+atc_l3('d08', 'phenol').
+atc_l3('d08', 'phenylmercuric_borate').
+atc_l3('d08', 'policresulen').
+atc_l3('d08', 'polihexanide').
+atc_l3('d08', 'potassium_permanganate').
+atc_l3('d08', 'povidone_iodine').
+atc_l3('d08', 'propamidine').
+atc_l3('d08', 'propanol').
+atc_l3('d08', 'propanol_combinations').
+atc_l3('d08', 'silver').
+atc_l3('d08', 'silver_nitrate').
+atc_l3('d08', 'sodium_hypochlorite').
+atc_l3('d08', 'thiomersal').
+atc_l3('d08', 'tosylchloramide_sodium').
+atc_l3('d08', 'triclosan').
+atc_l3('d09', 'aluminium_chlorohydrate').
+atc_l3('d09', 'benzalkonium').
+atc_l3('d09', 'benzododecinium').
+atc_l3('d09', 'cetylpyridinium').
+atc_l3('d09', 'chlorhexidine').
+atc_l3('d09', 'clioquinol').
+atc_l3('d09', 'framycetin').
+atc_l3('d09', 'fusidic_acid').
+atc_l3('d09', 'iodoform').
+atc_l3('d09', 'nitrofural').
+atc_l3('d09', 'phenylmercuric_nitrate').
+atc_l3('d09', 'povidone_iodine').
+atc_l3('d09', 'triclosan').
+atc_l3('d09', 'zinc_bandage_with_supplements').
+atc_l3('d09', 'zinc_bandage_without_supplements').
+atc_l3('d10', 'adapalene').
+atc_l3('d10', 'adapalene_combinations').
+atc_l3('d10', 'aluminium_chloride').
+atc_l3('d10', 'aluminium_oxide').
+atc_l3('d10', 'azelaic_acid').
+atc_l3('d10', 'benzoyl_peroxide').
+atc_l3('d10', 'benzoyl_peroxide_combinations').
+atc_l3('d10', 'bithionol').
+atc_l3('d10', 'chloramphenicol').
+atc_l3('d10', 'clascoterone').
+atc_l3('d10', 'clindamycin').
+atc_l3('d10', 'clindamycin_combinations').
+atc_l3('d10', 'dapsone').
+atc_l3('d10', 'dexamethasone').
+atc_l3('d10', 'erythromycin').
+atc_l3('d10', 'erythromycin_combinations').
+atc_l3('d10', 'fluorometholone').
+atc_l3('d10', 'ichtasol').
+atc_l3('d10', 'isotretinoin').
+atc_l3('d10', 'isotretinoin_combinations').
+atc_l3('d10', 'meclocycline').
+atc_l3('d10', 'mesulfen').
+atc_l3('d10', 'methylprednisolone').
+atc_l3('d10', 'minocycline').
+atc_l3('d10', 'motretinide').
+atc_l3('d10', 'nadifloxacin').
+atc_l3('d10', 'resorcinol').
+atc_l3('d10', 'retinol').
+atc_l3('d10', 'sulfacetamide').
+atc_l3('d10', 'sulfur').
+atc_l3('d10', 'tioxolone').
+atc_l3('d10', 'tretinoin').
+atc_l3('d10', 'tretinoin_combinations').
+atc_l3('d10', 'trifarotene').
+atc_l3('d10', 'various_combinations').
+atc_l3('d11', 'abrocitinib').
+atc_l3('d11', 'alitretinoin').
+atc_l3('d11', 'aminobenzoate_potassium').
+atc_l3('d11', 'brimonidine').
+atc_l3('d11', 'cadmium_compounds').
+atc_l3('d11', 'caffeine').
+atc_l3('d11', 'calcium_gluconate').
+atc_l3('d11', 'cetrimide').
+atc_l3('d11', 'collagen_combinations').
+atc_l3('d11', 'crisaborole').
+atc_l3('d11', 'cromoglicic_acid').
+atc_l3('d11', 'delgocitinib').
+atc_l3('d11', 'deoxycholic_acid').
+atc_l3('d11', 'diclofenac').
+atc_l3('d11', 'dupilumab').
+atc_l3('d11', 'eflornithine').
+atc_l3('d11', 'finasteride').
+atc_l3('d11', 'gamolenic_acid').
+atc_l3('d11', 'gamolenic_acid_combinations').
+atc_l3('d11', 'glycopyrronium').
+atc_l3('d11', 'hydrogen_peroxide').
+atc_l3('d11', 'hydroquinone').
+atc_l3('d11', 'ivermectin').
+atc_l3('d11', 'lebrikizumab').
+atc_l3('d11', 'lithium_succinate').
+atc_l3('d11', 'magnesium_sulfate').
+atc_l3('d11', 'mequinol').
+atc_l3('d11', 'metandienone').
+atc_l3('d11', 'minoxidil').
+atc_l3('d11', 'monobenzone').
+atc_l3('d11', 'nemolizumab').
+atc_l3('d11', 'others').
+atc_l3('d11', 'oxaceprol').
+atc_l3('d11', 'oxymetazoline').
+atc_l3('d11', 'pimecrolimus').
+atc_l3('d11', 'povidone_iodine').
+atc_l3('d11', 'pyrithione_zinc').
+atc_l3('d11', 'ruxolitinib').
+atc_l3('d11', 'selenium_compounds').
+atc_l3('d11', 'sulfur_compounds').
+atc_l3('d11', 'tacrolimus').
+atc_l3('d11', 'tiratricol').
+atc_l3('d11', 'tralokinumab').
+atc_l3('d11', 'xenysalate').
+atc_l3('g01', 'acetarsol').
+atc_l3('g01', 'acetic_acid').
+atc_l3('g01', 'amphotericin_b').
+atc_l3('g01', 'ascorbic_acid').
+atc_l3('g01', 'azanidazole').
+atc_l3('g01', 'broxyquinoline').
+atc_l3('g01', 'butoconazole').
+atc_l3('g01', 'candicidin').
+atc_l3('g01', 'carfecillin').
+atc_l3('g01', 'chloramphenicol').
+atc_l3('g01', 'chlorquinaldol').
+atc_l3('g01', 'ciclopirox').
+atc_l3('g01', 'clindamycin').
+atc_l3('g01', 'clioquinol').
+atc_l3('g01', 'clodantoin').
+atc_l3('g01', 'clotrimazole').
+atc_l3('g01', 'combinations_of_imidazole_derivatives').
+atc_l3('g01', 'combinations_of_sulfonamides').
+atc_l3('g01', 'copper_usnate').
+atc_l3('g01', 'dapivirine').
+atc_l3('g01', 'dequalinium').
+atc_l3('g01', 'diiodohydroxyquinoline').
+atc_l3('g01', 'econazole').
+atc_l3('g01', 'econazole_combinations').
+atc_l3('g01', 'fenticonazole').
+atc_l3('g01', 'flutrimazole').
+atc_l3('g01', 'furazolidone').
+atc_l3('g01', 'hachimycin').
+atc_l3('g01', 'hexetidine').
+atc_l3('g01', 'inosine').
+atc_l3('g01', 'isoconazole').
+atc_l3('g01', 'ketoconazole').
+atc_l3('g01', 'lactic_acid').
+atc_l3('g01', 'lactobacillus').
+atc_l3('g01', 'mepartricin').
+atc_l3('g01', 'methylrosaniline').
+atc_l3('g01', 'metronidazole').
+atc_l3('g01', 'miconazole').
+atc_l3('g01', 'natamycin').
+atc_l3('g01', 'nifuratel').
+atc_l3('g01', 'nystatin').
+atc_l3('g01', 'nystatin_combinations').
+atc_l3('g01', 'octenidine_combinations').
+atc_l3('g01', 'omoconazole').
+atc_l3('g01', 'ornidazole').
+atc_l3('g01', 'oxiconazole').
+atc_l3('g01', 'oxyquinoline').
+atc_l3('g01', 'oxytetracycline').
+atc_l3('g01', 'pentamycin').
+atc_l3('g01', 'policresulen').
+atc_l3('g01', 'povidone_iodine').
+atc_l3('g01', 'propenidazole').
+atc_l3('g01', 'protiofate').
+atc_l3('g01', 'sertaconazole').
+atc_l3('g01', 'sulfatolamide').
+atc_l3('g01', 'terconazole').
+atc_l3('g01', 'tinidazole').
+atc_l3('g01', 'tioconazole').
+atc_l3('g02', 'agni_casti_fructus').
+atc_l3('g02', 'atosiban').
+atc_l3('g02', 'benzydamine').
+atc_l3('g02', 'bremelanotide').
+atc_l3('g02', 'bromocriptine').
+atc_l3('g02', 'buphenine').
+atc_l3('g02', 'cabergoline').
+atc_l3('g02', 'carboprost').
+atc_l3('g02', 'cimicifugae_rhizoma').
+atc_l3('g02', 'dinoprost').
+atc_l3('g02', 'dinoprostone').
+atc_l3('g02', 'ergometrine').
+atc_l3('g02', 'ergot_alkaloids').
+atc_l3('g02', 'fenoterol').
+atc_l3('g02', 'fezolinetant').
+atc_l3('g02', 'flibanserin').
+atc_l3('g02', 'flunoxaprofen').
+atc_l3('g02', 'gemeprost').
+atc_l3('g02', 'ibuprofen').
+atc_l3('g02', 'lisuride').
+atc_l3('g02', 'metergoline').
+atc_l3('g02', 'methylergometrine').
+atc_l3('g02', 'methylergometrine_and_oxytocin').
+atc_l3('g02', 'misoprostol').
+atc_l3('g02', 'naproxen').
+atc_l3('g02', 'plastic_iud').
+atc_l3('g02', 'plastic_iud_with_copper').
+atc_l3('g02', 'plastic_iud_with_progestogen').
+atc_l3('g02', 'quinagolide').
+atc_l3('g02', 'ritodrine').
+atc_l3('g02', 'sulprostone').
+atc_l3('g02', 'terguride').
+atc_l3('g02', 'vaginal_ring_with_progestogen').
+atc_l3('g02', 'vaginal_ring_with_progestogen_and_estrogen').
+atc_l3('g03', 'allylestrenol').
+atc_l3('g03', 'androstanolone').
+atc_l3('g03', 'bazedoxifene').
+atc_l3('g03', 'chlormadinone').
+atc_l3('g03', 'chlormadinone_and_estrogen').
+atc_l3('g03', 'chlormadinone_and_ethinylestradiol').
+atc_l3('g03', 'chlorotrianisene').
+atc_l3('g03', 'choriogonadotropin_alfa').
+atc_l3('g03', 'chorionic_gonadotrophin').
+atc_l3('g03', 'clomifene').
+atc_l3('g03', 'combinations').
+atc_l3('g03', 'conjugated_estrogens').
+atc_l3('g03', 'conjugated_estrogens_and_bazedoxifene').
+atc_l3('g03', 'corifollitropin_alfa').
+atc_l3('g03', 'cyclofenil').
+atc_l3('g03', 'cyproterone').
+atc_l3('g03', 'cyproterone_and_estrogen').
+atc_l3('g03', 'danazol').
+atc_l3('g03', 'demegestone').
+atc_l3('g03', 'desogestrel').
+atc_l3('g03', 'desogestrel_and_estrogen').
+atc_l3('g03', 'desogestrel_and_ethinylestradiol').
+atc_l3('g03', 'dienestrol').
+atc_l3('g03', 'dienogest').
+atc_l3('g03', 'dienogest_and_estradiol').
+atc_l3('g03', 'dienogest_and_estrogen').
+atc_l3('g03', 'dienogest_and_ethinylestradiol').
+atc_l3('g03', 'diethylstilbestrol').
+atc_l3('g03', 'drospirenone').
+atc_l3('g03', 'drospirenone_and_estetrol').
+atc_l3('g03', 'drospirenone_and_estrogen').
+atc_l3('g03', 'drospirenone_and_ethinylestradiol').
+atc_l3('g03', 'dydrogesterone').
+atc_l3('g03', 'dydrogesterone_and_estrogen').
+atc_l3('g03', 'epimestrol').
+atc_l3('g03', 'estradiol').
+atc_l3('g03', 'estradiol_combinations').
+atc_l3('g03', 'estriol').
+atc_l3('g03', 'estrone').
+atc_l3('g03', 'ethinylestradiol').
+atc_l3('g03', 'ethisterone').
+atc_l3('g03', 'ethisterone_and_estrogen').
+atc_l3('g03', 'etonogestrel').
+atc_l3('g03', 'etynodiol').
+atc_l3('g03', 'etynodiol_and_estrogen').
+atc_l3('g03', 'etynodiol_and_ethinylestradiol').
+atc_l3('g03', 'fluoxymesterone').
+atc_l3('g03', 'follitropin_alfa').
+atc_l3('g03', 'follitropin_beta').
+atc_l3('g03', 'follitropin_delta').
+atc_l3('g03', 'gestodene_and_ethinylestradiol').
+atc_l3('g03', 'gestonorone').
+atc_l3('g03', 'gestrinone').
+atc_l3('g03', 'human_menopausal_gonadotrophin').
+atc_l3('g03', 'hydroxyprogesterone').
+atc_l3('g03', 'hydroxyprogesterone_and_estrogen').
+atc_l3('g03', 'lasofoxifene').
+atc_l3('g03', 'levonorgestrel').
+atc_l3('g03', 'levonorgestrel_and_estrogen').
+atc_l3('g03', 'levonorgestrel_and_ethinylestradiol').
+atc_l3('g03', 'lutropin_alfa').
+atc_l3('g03', 'lynestrenol').
+atc_l3('g03', 'lynestrenol_and_estrogen').
+atc_l3('g03', 'lynestrenol_and_ethinylestradiol').
+atc_l3('g03', 'medrogestone').
+atc_l3('g03', 'medrogestone_and_estrogen').
+atc_l3('g03', 'medroxyprogesterone').
+atc_l3('g03', 'medroxyprogesterone_and_estradiol').
+atc_l3('g03', 'medroxyprogesterone_and_estrogen').
+atc_l3('g03', 'medroxyprogesterone_and_ethinylestradiol').
+atc_l3('g03', 'megestrol').
+atc_l3('g03', 'megestrol_and_estrogen').
+atc_l3('g03', 'megestrol_and_ethinylestradiol').
+atc_l3('g03', 'mesterolone').
+atc_l3('g03', 'methallenestril').
+atc_l3('g03', 'methylestrenolone').
+atc_l3('g03', 'methylnortestosterone_and_estrogen').
+atc_l3('g03', 'methyltestosterone').
+atc_l3('g03', 'methyltestosterone_and_estrogen').
+atc_l3('g03', 'mifepristone').
+atc_l3('g03', 'mifepristone_combinations').
+atc_l3('g03', 'moxestrol').
+atc_l3('g03', 'nomegestrol').
+atc_l3('g03', 'nomegestrol_and_estradiol').
+atc_l3('g03', 'nomegestrol_and_estrogen').
+atc_l3('g03', 'norelgestromin_and_ethinylestradiol').
+atc_l3('g03', 'norethisterone').
+atc_l3('g03', 'norethisterone_and_estrogen').
+atc_l3('g03', 'norethisterone_and_ethinylestradiol').
+atc_l3('g03', 'noretynodrel_and_estrogen').
+atc_l3('g03', 'norgestimate_and_estrogen').
+atc_l3('g03', 'norgestimate_and_ethinylestradiol').
+atc_l3('g03', 'norgestrel_and_estrogen').
+atc_l3('g03', 'norgestrel_and_ethinylestradiol').
+atc_l3('g03', 'norgestrienone').
+atc_l3('g03', 'ormeloxifene').
+atc_l3('g03', 'ospemifene').
+atc_l3('g03', 'prasterone').
+atc_l3('g03', 'prasterone_and_estrogen').
+atc_l3('g03', 'progesterone').
+atc_l3('g03', 'progesterone_and_estrogen').
+atc_l3('g03', 'promegestone').
+atc_l3('g03', 'promestriene').
+atc_l3('g03', 'quingestanol').
+atc_l3('g03', 'quingestanol_and_ethinylestradiol').
+atc_l3('g03', 'raloxifene').
+atc_l3('g03', 'serum_gonadotrophin').
+atc_l3('g03', 'testosterone').
+atc_l3('g03', 'testosterone_and_estrogen').
+atc_l3('g03', 'tibolone').
+atc_l3('g03', 'trimegestone_and_estrogen').
+atc_l3('g03', 'ulipristal').
+atc_l3('g03', 'urofollitropin').
+atc_l3('g04', 'acetohydroxamic_acid').
+atc_l3('g04', 'alfuzosin').
+atc_l3('g04', 'alfuzosin_and_finasteride').
+atc_l3('g04', 'alprostadil').
+atc_l3('g04', 'ammonium_chloride').
+atc_l3('g04', 'apomorphine').
+atc_l3('g04', 'avanafil').
+atc_l3('g04', 'calcium_chloride').
+atc_l3('g04', 'collagen').
+atc_l3('g04', 'combinations').
+atc_l3('g04', 'dapoxetine').
+atc_l3('g04', 'darifenacin').
+atc_l3('g04', 'desfesoterodine').
+atc_l3('g04', 'dimethyl_sulfoxide').
+atc_l3('g04', 'doxazosin_and_finasteride').
+atc_l3('g04', 'dutasteride').
+atc_l3('g04', 'emepronium').
+atc_l3('g04', 'fesoterodine').
+atc_l3('g04', 'fexapotide').
+atc_l3('g04', 'finasteride').
+atc_l3('g04', 'finasteride_and_tadalafil').
+atc_l3('g04', 'flavoxate').
+atc_l3('g04', 'imidafenacin').
+atc_l3('g04', 'magnesium_hydroxide').
+atc_l3('g04', 'meladrazine').
+atc_l3('g04', 'mepartricin').
+atc_l3('g04', 'mirabegron').
+atc_l3('g04', 'moxisylyte').
+atc_l3('g04', 'oxybutynin').
+atc_l3('g04', 'papaverine').
+atc_l3('g04', 'papaverine_combinations').
+atc_l3('g04', 'pentosan_polysulfate_sodium').
+atc_l3('g04', 'phenazopyridine').
+atc_l3('g04', 'phenyl_salicylate').
+atc_l3('g04', 'propiverine').
+atc_l3('g04', 'prunus_africanae_cortex').
+atc_l3('g04', 'sabalis_serrulatae_fructus').
+atc_l3('g04', 'sildenafil').
+atc_l3('g04', 'silodosin').
+atc_l3('g04', 'sodium_salicylate_and_methenamine').
+atc_l3('g04', 'solifenacin').
+atc_l3('g04', 'succinimide').
+atc_l3('g04', 'tadalafil').
+atc_l3('g04', 'tamsulosin').
+atc_l3('g04', 'tamsulosin_and_dutasteride').
+atc_l3('g04', 'tamsulosin_and_solifenacin').
+atc_l3('g04', 'tamsulosin_and_tadalafil').
+atc_l3('g04', 'terazosin').
+atc_l3('g04', 'terodiline').
+atc_l3('g04', 'tiopronin').
+atc_l3('g04', 'tolterodine').
+atc_l3('g04', 'trospium').
+atc_l3('g04', 'udenafil').
+atc_l3('g04', 'vardenafil').
+atc_l3('g04', 'vibegron').
+atc_l3('g04', 'yohimbine').
+atc_l3('h01', 'carbetocin').
+atc_l3('h01', 'cetrorelix').
+atc_l3('h01', 'corticotropin').
+atc_l3('h01', 'demoxytocin').
+atc_l3('h01', 'desmopressin').
+atc_l3('h01', 'elagolix').
+atc_l3('h01', 'elagolix_estradiol_and_norethisterone').
+atc_l3('h01', 'ganirelix').
+atc_l3('h01', 'gonadorelin').
+atc_l3('h01', 'lanreotide').
+atc_l3('h01', 'linzagolix').
+atc_l3('h01', 'lonapegsomatropin').
+atc_l3('h01', 'lypressin').
+atc_l3('h01', 'mecasermin').
+atc_l3('h01', 'mecasermin_rinfabate').
+atc_l3('h01', 'nafarelin').
+atc_l3('h01', 'octreotide').
+atc_l3('h01', 'ornipressin').
+atc_l3('h01', 'oxytocin').
+atc_l3('h01', 'pasireotide').
+atc_l3('h01', 'pegvisomant').
+atc_l3('h01', 'relugolix_estradiol_and_norethisterone').
+atc_l3('h01', 'sermorelin').
+atc_l3('h01', 'somapacitan').
+atc_l3('h01', 'somatostatin').
+atc_l3('h01', 'somatrem').
+atc_l3('h01', 'somatrogon').
+atc_l3('h01', 'somatropin').
+atc_l3('h01', 'terlipressin').
+atc_l3('h01', 'tesamorelin').
+atc_l3('h01', 'tetracosactide').
+atc_l3('h01', 'thyrotropin_alfa').
+atc_l3('h01', 'vapreotide').
+atc_l3('h01', 'vasopressin_argipressin').
+atc_l3('h02', 'aldosterone').
+atc_l3('h02', 'betamethasone').
+atc_l3('h02', 'cloprednol').
+atc_l3('h02', 'cortisone').
+atc_l3('h02', 'cortivazol').
+atc_l3('h02', 'deflazacort').
+atc_l3('h02', 'desoxycortone').
+atc_l3('h02', 'dexamethasone').
+atc_l3('h02', 'fludrocortisone').
+atc_l3('h02', 'fluocortolone').
+atc_l3('h02', 'hydrocortisone').
+atc_l3('h02', 'ketoconazole').
+atc_l3('h02', 'levoketoconazole').
+atc_l3('h02', 'meprednisone').
+atc_l3('h02', 'methylprednisolone').
+atc_l3('h02', 'methylprednisolone_combinations').
+atc_l3('h02', 'osilodrostat').
+atc_l3('h02', 'paramethasone').
+atc_l3('h02', 'prednisolone').
+atc_l3('h02', 'prednisone').
+atc_l3('h02', 'prednylidene').
+atc_l3('h02', 'rimexolone').
+atc_l3('h02', 'triamcinolone').
+atc_l3('h02', 'trilostane').
+atc_l3('h02', 'vamorolone').
+atc_l3('h03', 'benzylthiouracil').
+atc_l3('h03', 'carbimazole').
+atc_l3('h03', 'combinations_of_levothyroxine_and_liothyronine').
+atc_l3('h03', 'dibromotyrosine').
+atc_l3('h03', 'diiodotyrosine').
+atc_l3('h03', 'levothyroxine_sodium').
+atc_l3('h03', 'levothyroxine_sodium_and_iodine_compounds').
+atc_l3('h03', 'liothyronine_sodium').
+atc_l3('h03', 'methylthiouracil').
+atc_l3('h03', 'potassium_perchlorate').
+atc_l3('h03', 'propylthiouracil').
+atc_l3('h03', 'thiamazole').
+atc_l3('h03', 'thiamazole_combinations').
+atc_l3('h03', 'thyroid_gland_preparations').
+atc_l3('h03', 'tiratricol').
+atc_l3('h04', 'dasiglucagon').
+atc_l3('h04', 'glucagon').
+atc_l3('h05', 'abaloparatide').
+atc_l3('h05', 'calcifediol').
+atc_l3('h05', 'calcitonin_human_synthetic').
+atc_l3('h05', 'calcitonin_pork_natural').
+atc_l3('h05', 'calcitonin_salmon_synthetic').
+atc_l3('h05', 'cinacalcet').
+atc_l3('h05', 'doxercalciferol').
+atc_l3('h05', 'elcatonin').
+atc_l3('h05', 'etelcalcetide').
+atc_l3('h05', 'evocalcet').
+atc_l3('h05', 'palopegteriparatide').
+atc_l3('h05', 'parathyroid_gland_extract').
+atc_l3('h05', 'parathyroid_hormone').
+atc_l3('h05', 'paricalcitol').
+atc_l3('h05', 'teriparatide').
+atc_l3('j01', 'amikacin').
+atc_l3('j01', 'amoxicillin').
+atc_l3('j01', 'amoxicillin_and_beta_lactamase_inhibitor').
+atc_l3('j01', 'ampicillin').
+atc_l3('j01', 'ampicillin_and_beta_lactamase_inhibitor').
+atc_l3('j01', 'ampicillin_combinations').
+atc_l3('j01', 'arbekacin').
+atc_l3('j01', 'aspoxicillin').
+atc_l3('j01', 'azidocillin').
+atc_l3('j01', 'azithromycin').
+atc_l3('j01', 'azithromycin_fluconazole_and_secnidazole').
+atc_l3('j01', 'azlocillin').
+atc_l3('j01', 'aztreonam').
+atc_l3('j01', 'bacampicillin').
+atc_l3('j01', 'bacitracin').
+atc_l3('j01', 'bekanamycin').
+atc_l3('j01', 'benzathine_benzylpenicillin').
+atc_l3('j01', 'benzathine_phenoxymethylpenicillin').
+atc_l3('j01', 'benzylpenicillin').
+atc_l3('j01', 'biapenem').
+atc_l3('j01', 'brodimoprim').
+atc_l3('j01', 'carbenicillin').
+atc_l3('j01', 'carindacillin').
+atc_l3('j01', 'carumonam').
+atc_l3('j01', 'cefacetrile').
+atc_l3('j01', 'cefaclor').
+atc_l3('j01', 'cefadroxil').
+atc_l3('j01', 'cefalexin').
+atc_l3('j01', 'cefaloridine').
+atc_l3('j01', 'cefalotin').
+atc_l3('j01', 'cefamandole').
+atc_l3('j01', 'cefapirin').
+atc_l3('j01', 'cefatrizine').
+atc_l3('j01', 'cefazedone').
+atc_l3('j01', 'cefazolin').
+atc_l3('j01', 'cefbuperazone').
+atc_l3('j01', 'cefcapene').
+atc_l3('j01', 'cefdinir').
+atc_l3('j01', 'cefditoren').
+atc_l3('j01', 'cefepime').
+atc_l3('j01', 'cefepime_and_amikacin').
+atc_l3('j01', 'cefepime_and_beta_lactamase_inhibitor').
+atc_l3('j01', 'cefetamet').
+atc_l3('j01', 'cefiderocol').
+atc_l3('j01', 'cefixime').
+atc_l3('j01', 'cefixime_and_azithromycin').
+atc_l3('j01', 'cefixime_and_beta_lactamase_inhibitor').
+atc_l3('j01', 'cefixime_and_ornidazole').
+atc_l3('j01', 'cefmenoxime').
+atc_l3('j01', 'cefmetazole').
+atc_l3('j01', 'cefminox').
+atc_l3('j01', 'cefodizime').
+atc_l3('j01', 'cefonicid').
+atc_l3('j01', 'cefoperazone').
+atc_l3('j01', 'cefoperazone_and_beta_lactamase_inhibitor').
+atc_l3('j01', 'ceforanide').
+atc_l3('j01', 'cefotaxime').
+atc_l3('j01', 'cefotaxime_and_beta_lactamase_inhibitor').
+atc_l3('j01', 'cefotetan').
+atc_l3('j01', 'cefotiam').
+atc_l3('j01', 'cefoxitin').
+atc_l3('j01', 'cefozopran').
+atc_l3('j01', 'cefpiramide').
+atc_l3('j01', 'cefpirome').
+atc_l3('j01', 'cefpodoxime').
+atc_l3('j01', 'cefpodoxime_and_beta_lactamase_inhibitor').
+atc_l3('j01', 'cefprozil').
+atc_l3('j01', 'cefradine').
+atc_l3('j01', 'cefroxadine').
+atc_l3('j01', 'cefsulodin').
+atc_l3('j01', 'ceftaroline_fosamil').
+atc_l3('j01', 'ceftazidime').
+atc_l3('j01', 'ceftazidime_and_beta_lactamase_inhibitor').
+atc_l3('j01', 'cefteram').
+atc_l3('j01', 'ceftezole').
+atc_l3('j01', 'ceftibuten').
+atc_l3('j01', 'ceftizoxime').
+atc_l3('j01', 'ceftobiprole_medocaril').
+atc_l3('j01', 'ceftolozane_and_beta_lactamase_inhibitor').
+atc_l3('j01', 'ceftriaxone').
+atc_l3('j01', 'ceftriaxone_and_beta_lactamase_inhibitor').
+atc_l3('j01', 'ceftriaxone_combinations').
+atc_l3('j01', 'cefuroxime').
+atc_l3('j01', 'cefuroxime_and_beta_lactamase_inhibitor').
+atc_l3('j01', 'cefuroxime_and_metronidazole').
+atc_l3('j01', 'chloramphenicol').
+atc_l3('j01', 'chlortetracycline').
+atc_l3('j01', 'cinoxacin').
+atc_l3('j01', 'ciprofloxacin').
+atc_l3('j01', 'ciprofloxacin_and_metronidazole').
+atc_l3('j01', 'ciprofloxacin_and_ornidazole').
+atc_l3('j01', 'ciprofloxacin_and_tinidazole').
+atc_l3('j01', 'clarithromycin').
+atc_l3('j01', 'clindamycin').
+atc_l3('j01', 'clofoctol').
+atc_l3('j01', 'clometocillin').
+atc_l3('j01', 'clomocycline').
+atc_l3('j01', 'cloxacillin').
+atc_l3('j01', 'colistin').
+atc_l3('j01', 'combinations').
+atc_l3('j01', 'combinations_of_penicillins').
+atc_l3('j01', 'combinations_of_tetracyclines').
+atc_l3('j01', 'dalbavancin').
+atc_l3('j01', 'daptomycin').
+atc_l3('j01', 'delafloxacin').
+atc_l3('j01', 'demeclocycline').
+atc_l3('j01', 'dibekacin').
+atc_l3('j01', 'dicloxacillin').
+atc_l3('j01', 'dirithromycin').
+atc_l3('j01', 'doripenem').
+atc_l3('j01', 'doxycycline').
+atc_l3('j01', 'enoxacin').
+atc_l3('j01', 'epicillin').
+atc_l3('j01', 'eravacycline').
+atc_l3('j01', 'ertapenem').
+atc_l3('j01', 'erythromycin').
+atc_l3('j01', 'faropenem').
+atc_l3('j01', 'fleroxacin').
+atc_l3('j01', 'flomoxef').
+atc_l3('j01', 'flucloxacillin').
+atc_l3('j01', 'flumequine').
+atc_l3('j01', 'flurithromycin').
+atc_l3('j01', 'fosfomycin').
+atc_l3('j01', 'furazidin').
+atc_l3('j01', 'fusidic_acid').
+atc_l3('j01', 'garenoxacin').
+atc_l3('j01', 'gatifloxacin').
+atc_l3('j01', 'gemifloxacin').
+atc_l3('j01', 'gentamicin').
+atc_l3('j01', 'grepafloxacin').
+atc_l3('j01', 'hetacillin').
+atc_l3('j01', 'iclaprim').
+atc_l3('j01', 'imipenem_and_cilastatin').
+atc_l3('j01', 'imipenem_cilastatin_and_relebactam').
+atc_l3('j01', 'isepamicin').
+atc_l3('j01', 'josamycin').
+atc_l3('j01', 'kanamycin').
+atc_l3('j01', 'lascufloxacin').
+atc_l3('j01', 'latamoxef').
+atc_l3('j01', 'lefamulin').
+atc_l3('j01', 'levofloxacin').
+atc_l3('j01', 'levofloxacin_and_ornidazole').
+atc_l3('j01', 'levonadifloxacin').
+atc_l3('j01', 'lincomycin').
+atc_l3('j01', 'linezolid').
+atc_l3('j01', 'lomefloxacin').
+atc_l3('j01', 'loracarbef').
+atc_l3('j01', 'lymecycline').
+atc_l3('j01', 'mandelic_acid').
+atc_l3('j01', 'mecillinam').
+atc_l3('j01', 'meropenem').
+atc_l3('j01', 'meropenem_and_vaborbactam').
+atc_l3('j01', 'metacycline').
+atc_l3('j01', 'metampicillin').
+atc_l3('j01', 'methenamine').
+atc_l3('j01', 'meticillin').
+atc_l3('j01', 'metronidazole').
+atc_l3('j01', 'mezlocillin').
+atc_l3('j01', 'midecamycin').
+atc_l3('j01', 'minocycline').
+atc_l3('j01', 'miocamycin').
+atc_l3('j01', 'moxifloxacin').
+atc_l3('j01', 'nafcillin').
+atc_l3('j01', 'nalidixic_acid').
+atc_l3('j01', 'nemonoxacin').
+atc_l3('j01', 'neomycin').
+atc_l3('j01', 'netilmicin').
+atc_l3('j01', 'nifurtoinol').
+atc_l3('j01', 'nitrofurantoin').
+atc_l3('j01', 'nitrofurantoin_combinations').
+atc_l3('j01', 'nitroxoline').
+atc_l3('j01', 'norfloxacin').
+atc_l3('j01', 'norfloxacin_and_metronidazole').
+atc_l3('j01', 'norfloxacin_and_tinidazole').
+atc_l3('j01', 'ofloxacin').
+atc_l3('j01', 'ofloxacin_and_ornidazole').
+atc_l3('j01', 'oleandomycin').
+atc_l3('j01', 'omadacycline').
+atc_l3('j01', 'oritavancin').
+atc_l3('j01', 'ornidazole').
+atc_l3('j01', 'oxacillin').
+atc_l3('j01', 'oxolinic_acid').
+atc_l3('j01', 'oxytetracycline').
+atc_l3('j01', 'oxytetracycline_combinations').
+atc_l3('j01', 'panipenem_and_betamipron').
+atc_l3('j01', 'pazufloxacin').
+atc_l3('j01', 'pefloxacin').
+atc_l3('j01', 'penamecillin').
+atc_l3('j01', 'penicillins_combinations_with_other_antibacterials').
+atc_l3('j01', 'penimepicycline').
+atc_l3('j01', 'pheneticillin').
+atc_l3('j01', 'phenoxymethylpenicillin').
+atc_l3('j01', 'pipemidic_acid').
+atc_l3('j01', 'piperacillin').
+atc_l3('j01', 'piperacillin_and_beta_lactamase_inhibitor').
+atc_l3('j01', 'piromidic_acid').
+atc_l3('j01', 'pivampicillin').
+atc_l3('j01', 'pivmecillinam').
+atc_l3('j01', 'plazomicin').
+atc_l3('j01', 'polymyxin_b').
+atc_l3('j01', 'pristinamycin').
+atc_l3('j01', 'procaine_benzylpenicillin').
+atc_l3('j01', 'propicillin').
+atc_l3('j01', 'prulifloxacin').
+atc_l3('j01', 'quinupristin_dalfopristin').
+atc_l3('j01', 'ribostamycin').
+atc_l3('j01', 'rokitamycin').
+atc_l3('j01', 'rolitetracycline').
+atc_l3('j01', 'rosoxacin').
+atc_l3('j01', 'roxithromycin').
+atc_l3('j01', 'rufloxacin').
+atc_l3('j01', 'sarecycline').
+atc_l3('j01', 'sisomicin').
+atc_l3('j01', 'sitafloxacin').
+atc_l3('j01', 'solithromycin').
+atc_l3('j01', 'sparfloxacin').
+atc_l3('j01', 'spectinomycin').
+atc_l3('j01', 'spiramycin').
+atc_l3('j01', 'spiramycin_and_metronidazole').
+atc_l3('j01', 'streptoduocin').
+atc_l3('j01', 'streptomycin').
+atc_l3('j01', 'sulbactam').
+atc_l3('j01', 'sulbenicillin').
+atc_l3('j01', 'sulfadiazine').
+atc_l3('j01', 'sulfadiazine_and_tetroxoprim').
+atc_l3('j01', 'sulfadiazine_and_trimethoprim').
+atc_l3('j01', 'sulfadimethoxine').
+atc_l3('j01', 'sulfadimidine').
+atc_l3('j01', 'sulfadimidine_and_trimethoprim').
+atc_l3('j01', 'sulfafurazole').
+atc_l3('j01', 'sulfaisodimidine').
+atc_l3('j01', 'sulfalene').
+atc_l3('j01', 'sulfamazone').
+atc_l3('j01', 'sulfamerazine').
+atc_l3('j01', 'sulfamerazine_and_trimethoprim').
+atc_l3('j01', 'sulfamethizole').
+atc_l3('j01', 'sulfamethoxazole').
+atc_l3('j01', 'sulfamethoxazole_and_trimethoprim').
+atc_l3('j01', 'sulfamethoxypyridazine').
+atc_l3('j01', 'sulfametomidine').
+atc_l3('j01', 'sulfametoxydiazine').
+atc_l3('j01', 'sulfametrole_and_trimethoprim').
+atc_l3('j01', 'sulfamoxole').
+atc_l3('j01', 'sulfamoxole_and_trimethoprim').
+atc_l3('j01', 'sulfanilamide').
+atc_l3('j01', 'sulfaperin').
+atc_l3('j01', 'sulfaphenazole').
+atc_l3('j01', 'sulfapyridine').
+atc_l3('j01', 'sulfathiazole').
+atc_l3('j01', 'sulfathiourea').
+atc_l3('j01', 'sulfonamides_combinations_with_other_antibacterials_excl_trimethoprim').
+atc_l3('j01', 'sultamicillin').
+atc_l3('j01', 'talampicillin').
+atc_l3('j01', 'tazobactam').
+atc_l3('j01', 'tebipenem_pivoxil').
+atc_l3('j01', 'tedizolid').
+atc_l3('j01', 'teicoplanin').
+atc_l3('j01', 'telavancin').
+atc_l3('j01', 'telithromycin').
+atc_l3('j01', 'temafloxacin').
+atc_l3('j01', 'temocillin').
+atc_l3('j01', 'tetracycline').
+atc_l3('j01', 'tetracycline_and_oleandomycin').
+atc_l3('j01', 'thiamphenicol').
+atc_l3('j01', 'thiamphenicol_combinations').
+atc_l3('j01', 'ticarcillin').
+atc_l3('j01', 'ticarcillin_and_beta_lactamase_inhibitor').
+atc_l3('j01', 'tigecycline').
+atc_l3('j01', 'tinidazole').
+atc_l3('j01', 'tobramycin').
+atc_l3('j01', 'tosufloxacin').
+atc_l3('j01', 'trimethoprim').
+atc_l3('j01', 'troleandomycin').
+atc_l3('j01', 'trovafloxacin').
+atc_l3('j01', 'vancomycin').
+atc_l3('j01', 'xibornol').
+atc_l3('j02', 'amphotericin_b').
+atc_l3('j02', 'anidulafungin').
+atc_l3('j02', 'caspofungin').
+atc_l3('j02', 'fluconazole').
+atc_l3('j02', 'flucytosine').
+atc_l3('j02', 'hachimycin').
+atc_l3('j02', 'ibrexafungerp').
+atc_l3('j02', 'isavuconazole').
+atc_l3('j02', 'itraconazole').
+atc_l3('j02', 'ketoconazole').
+atc_l3('j02', 'micafungin').
+atc_l3('j02', 'miconazole').
+atc_l3('j02', 'oteseconazole').
+atc_l3('j02', 'posaconazole').
+atc_l3('j02', 'rezafungin_acetate').
+atc_l3('j02', 'voriconazole').
+atc_l3('j04', 'aldesulfone_sodium').
+atc_l3('j04', 'bedaquiline').
+atc_l3('j04', 'calcium_aminosalicylate').
+atc_l3('j04', 'capreomycin').
+atc_l3('j04', 'clofazimine').
+atc_l3('j04', 'cycloserine').
+atc_l3('j04', 'dapsone').
+atc_l3('j04', 'dapsone_and_rifampicin').
+atc_l3('j04', 'dapsone_rifampicin_and_clofazimine').
+atc_l3('j04', 'delamanid').
+atc_l3('j04', 'enviomycin').
+atc_l3('j04', 'ethambutol').
+atc_l3('j04', 'ethambutol_and_isoniazid').
+atc_l3('j04', 'ethionamide').
+atc_l3('j04', 'isoniazid').
+atc_l3('j04', 'isoniazid_combinations').
+atc_l3('j04', 'isoniazid_sulfamethoxazole_trimethoprim_and_pyridoxine').
+atc_l3('j04', 'morinamide').
+atc_l3('j04', 'n_4_aminosalicylic_acid').
+atc_l3('j04', 'pretomanid').
+atc_l3('j04', 'protionamide').
+atc_l3('j04', 'pyrazinamide').
+atc_l3('j04', 'rifabutin').
+atc_l3('j04', 'rifampicin').
+atc_l3('j04', 'rifampicin_and_isoniazid').
+atc_l3('j04', 'rifampicin_ethambutol_and_isoniazid').
+atc_l3('j04', 'rifampicin_pyrazinamide_and_isoniazid').
+atc_l3('j04', 'rifampicin_pyrazinamide_ethambutol_and_isoniazid').
+atc_l3('j04', 'rifamycin').
+atc_l3('j04', 'rifapentine').
+atc_l3('j04', 'sodium_aminosalicylate').
+atc_l3('j04', 'streptomycin_and_isoniazid').
+atc_l3('j04', 'terizidone').
+atc_l3('j04', 'thioacetazone').
+atc_l3('j04', 'thioacetazone_and_isoniazid').
+atc_l3('j04', 'tiocarlide').
+atc_l3('j05', 'abacavir').
+atc_l3('j05', 'aciclovir').
+atc_l3('j05', 'adefovir_dipivoxil').
+atc_l3('j05', 'amenamevir').
+atc_l3('j05', 'amprenavir').
+atc_l3('j05', 'asunaprevir').
+atc_l3('j05', 'atazanavir').
+atc_l3('j05', 'atazanavir_and_cobicistat').
+atc_l3('j05', 'atazanavir_and_ritonavir').
+atc_l3('j05', 'baloxavir_marboxil').
+atc_l3('j05', 'boceprevir').
+atc_l3('j05', 'brincidofovir').
+atc_l3('j05', 'brivudine').
+atc_l3('j05', 'bulevirtide').
+atc_l3('j05', 'cabotegravir').
+atc_l3('j05', 'cidofovir').
+atc_l3('j05', 'clevudine').
+atc_l3('j05', 'coblopasvir').
+atc_l3('j05', 'daclatasvir').
+atc_l3('j05', 'daclatasvir_asunaprevir_and_beclabuvir').
+atc_l3('j05', 'darunavir').
+atc_l3('j05', 'darunavir_and_cobicistat').
+atc_l3('j05', 'darunavir_and_ritonavir').
+atc_l3('j05', 'dasabuvir').
+atc_l3('j05', 'dasabuvir_ombitasvir_paritaprevir_and_ritonavir').
+atc_l3('j05', 'delavirdine').
+atc_l3('j05', 'didanosine').
+atc_l3('j05', 'dolutegravir').
+atc_l3('j05', 'dolutegravir_and_rilpivirine').
+atc_l3('j05', 'doravirine').
+atc_l3('j05', 'efavirenz').
+atc_l3('j05', 'elbasvir').
+atc_l3('j05', 'elbasvir_and_grazoprevir').
+atc_l3('j05', 'elvitegravir').
+atc_l3('j05', 'emtricitabine').
+atc_l3('j05', 'emtricitabine_and_tenofovir_alafenamide').
+atc_l3('j05', 'emtricitabine_tenofovir_alafenamide_and_bictegravir').
+atc_l3('j05', 'emtricitabine_tenofovir_alafenamide_and_rilpivirine').
+atc_l3('j05', 'emtricitabine_tenofovir_alafenamide_darunavir_and_cobicistat').
+atc_l3('j05', 'emtricitabine_tenofovir_alafenamide_elvitegravir_and_cobicistat').
+atc_l3('j05', 'emtricitabine_tenofovir_disoproxil_and_efavirenz').
+atc_l3('j05', 'emtricitabine_tenofovir_disoproxil_and_rilpivirine').
+atc_l3('j05', 'emtricitabine_tenofovir_disoproxil_elvitegravir_and_cobicistat').
+atc_l3('j05', 'enfuvirtide').
+atc_l3('j05', 'enisamium_iodide').
+atc_l3('j05', 'ensitrelvir').
+atc_l3('j05', 'entecavir').
+atc_l3('j05', 'etravirine').
+atc_l3('j05', 'faldaprevir').
+atc_l3('j05', 'famciclovir').
+atc_l3('j05', 'favipiravir').
+atc_l3('j05', 'fosamprenavir').
+atc_l3('j05', 'foscarnet').
+atc_l3('j05', 'fosfonet').
+atc_l3('j05', 'fostemsavir').
+atc_l3('j05', 'ganciclovir').
+atc_l3('j05', 'glecaprevir_and_pibrentasvir').
+atc_l3('j05', 'grazoprevir').
+atc_l3('j05', 'ibalizumab').
+atc_l3('j05', 'idoxuridine').
+atc_l3('j05', 'indinavir').
+atc_l3('j05', 'inosine_pranobex').
+atc_l3('j05', 'lamivudine').
+atc_l3('j05', 'lamivudine_abacavir_and_dolutegravir').
+atc_l3('j05', 'lamivudine_and_abacavir').
+atc_l3('j05', 'lamivudine_and_dolutegravir').
+atc_l3('j05', 'lamivudine_and_raltegravir').
+atc_l3('j05', 'lamivudine_and_tenofovir_disoproxil').
+atc_l3('j05', 'lamivudine_tenofovir_disoproxil_and_dolutegravir').
+atc_l3('j05', 'lamivudine_tenofovir_disoproxil_and_doravirine').
+atc_l3('j05', 'lamivudine_tenofovir_disoproxil_and_efavirenz').
+atc_l3('j05', 'laninamivir').
+atc_l3('j05', 'lenacapavir').
+atc_l3('j05', 'letermovir').
+atc_l3('j05', 'lopinavir_and_ritonavir').
+atc_l3('j05', 'lysozyme').
+atc_l3('j05', 'maraviroc').
+atc_l3('j05', 'maribavir').
+atc_l3('j05', 'metisazone').
+atc_l3('j05', 'molnupiravir').
+atc_l3('j05', 'moroxydine').
+atc_l3('j05', 'nelfinavir').
+atc_l3('j05', 'nevirapine').
+atc_l3('j05', 'nirmatrelvir_and_ritonavir').
+atc_l3('j05', 'ombitasvir_paritaprevir_and_ritonavir').
+atc_l3('j05', 'oseltamivir').
+atc_l3('j05', 'penciclovir').
+atc_l3('j05', 'pentanedioic_acid_imidazolyl_ethanamide').
+atc_l3('j05', 'peramivir').
+atc_l3('j05', 'pleconaril').
+atc_l3('j05', 'raltegravir').
+atc_l3('j05', 'ravidasvir').
+atc_l3('j05', 'remdesivir').
+atc_l3('j05', 'ribavirin').
+atc_l3('j05', 'rilpivirine').
+atc_l3('j05', 'rimantadine').
+atc_l3('j05', 'ritonavir').
+atc_l3('j05', 'saquinavir').
+atc_l3('j05', 'simeprevir').
+atc_l3('j05', 'sofosbuvir').
+atc_l3('j05', 'sofosbuvir_and_ledipasvir').
+atc_l3('j05', 'sofosbuvir_and_velpatasvir').
+atc_l3('j05', 'sofosbuvir_velpatasvir_and_voxilaprevir').
+atc_l3('j05', 'stavudine').
+atc_l3('j05', 'stavudine_and_lamivudine').
+atc_l3('j05', 'stavudine_lamivudine_and_nevirapine').
+atc_l3('j05', 'tecovirimat').
+atc_l3('j05', 'telaprevir').
+atc_l3('j05', 'telbivudine').
+atc_l3('j05', 'tenofovir_alafenamide').
+atc_l3('j05', 'tenofovir_disoproxil').
+atc_l3('j05', 'tenofovir_disoproxil_and_emtricitabine').
+atc_l3('j05', 'tilorone').
+atc_l3('j05', 'tipranavir').
+atc_l3('j05', 'tromantadine').
+atc_l3('j05', 'umifenovir').
+atc_l3('j05', 'valaciclovir').
+atc_l3('j05', 'valganciclovir').
+atc_l3('j05', 'vidarabine').
+atc_l3('j05', 'zalcitabine').
+atc_l3('j05', 'zanamivir').
+atc_l3('j05', 'zidovudine').
+atc_l3('j05', 'zidovudine_and_lamivudine').
+atc_l3('j05', 'zidovudine_lamivudine_and_abacavir').
+atc_l3('j05', 'zidovudine_lamivudine_and_nevirapine').
+atc_l3('j06', 'ansuvimab').
+atc_l3('j06', 'anthrax_immunoglobulin').
+atc_l3('j06', 'anti_d_rh_immunoglobulin').
+atc_l3('j06', 'bezlotoxumab').
+atc_l3('j06', 'botulinum_antitoxin').
+atc_l3('j06', 'casirivimab_and_imdevimab').
+atc_l3('j06', 'combinations').
+atc_l3('j06', 'cytomegalovirus_immunoglobulin').
+atc_l3('j06', 'diphtheria_antitoxin').
+atc_l3('j06', 'diphtheria_immunoglobulin').
+atc_l3('j06', 'encephalitis_tick_borne_immunoglobulin').
+atc_l3('j06', 'gas_gangrene_sera').
+atc_l3('j06', 'hepatitis_a_immunoglobulin').
+atc_l3('j06', 'hepatitis_b_immunoglobulin').
+atc_l3('j06', 'immunoglobulins_normal_human_for_extravascular_adm').
+atc_l3('j06', 'immunoglobulins_normal_human_for_intravascular_adm').
+atc_l3('j06', 'measles_immunoglobulin').
+atc_l3('j06', 'motavizumab').
+atc_l3('j06', 'mumps_immunoglobulin').
+atc_l3('j06', 'nebacumab').
+atc_l3('j06', 'nirsevimab').
+atc_l3('j06', 'obiltoxaximab').
+atc_l3('j06', 'palivizumab').
+atc_l3('j06', 'pertussis_immunoglobulin').
+atc_l3('j06', 'rabies_immunoglobulin').
+atc_l3('j06', 'rabies_serum').
+atc_l3('j06', 'raxibacumab').
+atc_l3('j06', 'regdanvimab').
+atc_l3('j06', 'rubella_immunoglobulin').
+atc_l3('j06', 'snake_venom_antiserum').
+atc_l3('j06', 'sotrovimab').
+atc_l3('j06', 'staphylococcus_immunoglobulin').
+atc_l3('j06', 'tetanus_antitoxin').
+atc_l3('j06', 'tetanus_immunoglobulin').
+atc_l3('j06', 'tixagevimab_and_cilgavimab').
+atc_l3('j06', 'vaccinia_immunoglobulin').
+atc_l3('j06', 'varicella_zoster_immunoglobulin').
+atc_l3('j07', 'anthrax_antigen').
+atc_l3('j07', 'brucella_antigen').
+atc_l3('j07', 'cholera_combinations_with_typhoid_vaccine_inactivated_whole_cell').
+atc_l3('j07', 'cholera_inactivated_whole_cell').
+atc_l3('j07', 'cholera_live_attenuated').
+atc_l3('j07', 'combinations').
+atc_l3('j07', 'covid_19_inactivated_virus').
+atc_l3('j07', 'covid_19_protein_subunit').
+atc_l3('j07', 'covid_19_rna_based_vaccine').
+atc_l3('j07', 'covid_19_viral_vector_non_replicating').
+atc_l3('j07', 'covid_19_virus_like_particles').
+atc_l3('j07', 'dengue_virus_vaccines').
+atc_l3('j07', 'diphtheria_haemophilus_influenzae_b_pertussis_poliomyelitis_tetanus').
+atc_l3('j07', 'diphtheria_haemophilus_influenzae_b_pertussis_poliomyelitis_tetanus_hepatitis_b').
+atc_l3('j07', 'diphtheria_haemophilus_influenzae_b_pertussis_tetanus_hepatitis_b').
+atc_l3('j07', 'diphtheria_haemophilus_influenzae_b_pertussis_tetanus_hepatitis_b_meningococcus_a_c').
+atc_l3('j07', 'diphtheria_hepatitis_b_pertussis_tetanus').
+atc_l3('j07', 'diphtheria_hepatitis_b_tetanus').
+atc_l3('j07', 'diphtheria_pertussis_poliomyelitis_tetanus').
+atc_l3('j07', 'diphtheria_pertussis_poliomyelitis_tetanus_hepatitis_b').
+atc_l3('j07', 'diphtheria_poliomyelitis_tetanus').
+atc_l3('j07', 'diphtheria_rubella_tetanus').
+atc_l3('j07', 'diphtheria_toxoid').
+atc_l3('j07', 'ebola_vaccines').
+atc_l3('j07', 'encephalitis_japanese_inactivated_whole_virus').
+atc_l3('j07', 'encephalitis_japanese_live_attenuated').
+atc_l3('j07', 'encephalitis_tick_borne_inactivated_whole_virus').
+atc_l3('j07', 'enterovirus_71_vaccines').
+atc_l3('j07', 'haemophilus_influenza_b_combinations_with_meningococcus_c_y_conjugated').
+atc_l3('j07', 'haemophilus_influenzae_b_and_hepatitis_b').
+atc_l3('j07', 'haemophilus_influenzae_b_and_poliomyelitis').
+atc_l3('j07', 'haemophilus_influenzae_b_combinations_with_meningococcus_c_conjugated').
+atc_l3('j07', 'haemophilus_influenzae_b_combinations_with_pertussis_and_toxoids').
+atc_l3('j07', 'haemophilus_influenzae_b_combinations_with_toxoids').
+atc_l3('j07', 'haemophilus_influenzae_b_purified_antigen_conjugated').
+atc_l3('j07', 'hepatitis_a_inactivated_whole_virus').
+atc_l3('j07', 'hepatitis_b_purified_antigen').
+atc_l3('j07', 'influenza_inactivated_split_virus_or_surface_antigen').
+atc_l3('j07', 'influenza_inactivated_whole_virus').
+atc_l3('j07', 'influenza_live_attenuated').
+atc_l3('j07', 'influenza_virus_like_particles').
+atc_l3('j07', 'leptospira_vaccines').
+atc_l3('j07', 'malaria_vaccines').
+atc_l3('j07', 'measles_combinations_with_mumps_and_rubella_live_attenuated').
+atc_l3('j07', 'measles_combinations_with_mumps_live_attenuated').
+atc_l3('j07', 'measles_combinations_with_mumps_rubella_and_varicella_live_attenuated').
+atc_l3('j07', 'measles_combinations_with_rubella_live_attenuated').
+atc_l3('j07', 'measles_live_attenuated').
+atc_l3('j07', 'meningococcus_a_c_bivalent_purified_polysaccharides_antigen').
+atc_l3('j07', 'meningococcus_a_c_y_w_135_tetravalent_purified_polysaccharides_antigen').
+atc_l3('j07', 'meningococcus_a_c_y_w_135_tetravalent_purified_polysaccharides_antigen_conjugated').
+atc_l3('j07', 'meningococcus_a_purified_polysaccharides_antigen').
+atc_l3('j07', 'meningococcus_a_purified_polysaccharides_antigen_conjugated').
+atc_l3('j07', 'meningococcus_b_multicomponent_vaccine').
+atc_l3('j07', 'meningococcus_b_outer_membrane_vesicle_vaccine').
+atc_l3('j07', 'meningococcus_c_purified_polysaccharides_antigen_conjugated').
+atc_l3('j07', 'mumps_live_attenuated').
+atc_l3('j07', 'other_meningococcal_monovalent_purified_polysaccharides_antigen').
+atc_l3('j07', 'other_meningococcal_polyvalent_purified_polysaccharides_antigen').
+atc_l3('j07', 'papillomavirus_human_types_16_18').
+atc_l3('j07', 'papillomavirus_human_types_6_11_16_18').
+atc_l3('j07', 'papillomavirus_human_types_6_11_16_18_31_33_45_52_58').
+atc_l3('j07', 'pertussis_inactivated_whole_cell').
+atc_l3('j07', 'pertussis_inactivated_whole_cell_combinations_with_toxoids').
+atc_l3('j07', 'pertussis_purified_antigen').
+atc_l3('j07', 'pertussis_purified_antigen_combinations_with_toxoids').
+atc_l3('j07', 'plague_inactivated_whole_cell').
+atc_l3('j07', 'pneumococcus_purified_polysaccharides_antigen').
+atc_l3('j07', 'pneumococcus_purified_polysaccharides_antigen_and_haemophilus_influenzae_conjugated').
+atc_l3('j07', 'pneumococcus_purified_polysaccharides_antigen_conjugated').
+atc_l3('j07', 'poliomyelitis_oral_bivalent_live_attenuated').
+atc_l3('j07', 'poliomyelitis_oral_monovalent_live_attenuated').
+atc_l3('j07', 'poliomyelitis_oral_trivalent_live_attenuated').
+atc_l3('j07', 'poliomyelitis_trivalent_inactivated_whole_virus').
+atc_l3('j07', 'rabies_inactivated_whole_virus').
+atc_l3('j07', 'respiratory_syncytial_virus_vaccines').
+atc_l3('j07', 'rota_virus_live_attenuated').
+atc_l3('j07', 'rota_virus_pentavalent_live_reassorted').
+atc_l3('j07', 'rubella_combinations_with_mumps_live_attenuated').
+atc_l3('j07', 'rubella_live_attenuated').
+atc_l3('j07', 'smallpox_and_monkeypox_vaccines').
+atc_l3('j07', 'tetanus_toxoid').
+atc_l3('j07', 'tetanus_toxoid_combinations_with_diphtheria_toxoid').
+atc_l3('j07', 'tetanus_toxoid_combinations_with_tetanus_immunoglobulin').
+atc_l3('j07', 'tuberculosis_live_attenuated').
+atc_l3('j07', 'typhoid_combinations_with_paratyphi_types').
+atc_l3('j07', 'typhoid_hepatitis_a').
+atc_l3('j07', 'typhoid_inactivated_whole_cell').
+atc_l3('j07', 'typhoid_oral_live_attenuated').
+atc_l3('j07', 'typhoid_purified_polysaccharide_antigen').
+atc_l3('j07', 'typhus_exanthematicus_inactivated_whole_cell').
+atc_l3('j07', 'varicella_live_attenuated').
+atc_l3('j07', 'yellow_fever_live_attenuated').
+atc_l3('j07', 'zoster_live_attenuated').
+atc_l3('j07', 'zoster_purified_antigen').
+atc_l3('l01', 'abemaciclib').
+atc_l3('l01', 'acalabrutinib').
+atc_l3('l01', 'aclarubicin').
+atc_l3('l01', 'adagrasib').
+atc_l3('l01', 'afatinib').
+atc_l3('l01', 'aflibercept').
+atc_l3('l01', 'alectinib').
+atc_l3('l01', 'alitretinoin').
+atc_l3('l01', 'alpelisib').
+atc_l3('l01', 'altretamine').
+atc_l3('l01', 'aminolevulinic_acid').
+atc_l3('l01', 'amivantamab').
+atc_l3('l01', 'amrubicin').
+atc_l3('l01', 'amsacrine').
+atc_l3('l01', 'anagrelide').
+atc_l3('l01', 'arsenic_trioxide').
+atc_l3('l01', 'asciminib').
+atc_l3('l01', 'asparaginase').
+atc_l3('l01', 'atezolizumab').
+atc_l3('l01', 'aumolertinib').
+atc_l3('l01', 'avapritinib').
+atc_l3('l01', 'avelumab').
+atc_l3('l01', 'axicabtagene_ciloleucel').
+atc_l3('l01', 'axitinib').
+atc_l3('l01', 'azacitidine').
+atc_l3('l01', 'belantamab_mafodotin').
+atc_l3('l01', 'belinostat').
+atc_l3('l01', 'belotecan').
+atc_l3('l01', 'belzutifan').
+atc_l3('l01', 'bendamustine').
+atc_l3('l01', 'bermekimab').
+atc_l3('l01', 'bevacizumab').
+atc_l3('l01', 'bexarotene').
+atc_l3('l01', 'binimetinib').
+atc_l3('l01', 'bleomycin').
+atc_l3('l01', 'blinatumomab').
+atc_l3('l01', 'bortezomib').
+atc_l3('l01', 'bosutinib').
+atc_l3('l01', 'brentuximab_vedotin').
+atc_l3('l01', 'brexucabtagene_autoleucel').
+atc_l3('l01', 'brigatinib').
+atc_l3('l01', 'busulfan').
+atc_l3('l01', 'cabazitaxel').
+atc_l3('l01', 'cabozantinib').
+atc_l3('l01', 'capecitabine').
+atc_l3('l01', 'capivasertib').
+atc_l3('l01', 'capmatinib').
+atc_l3('l01', 'carboplatin').
+atc_l3('l01', 'carboquone').
+atc_l3('l01', 'carfilzomib').
+atc_l3('l01', 'carmofur').
+atc_l3('l01', 'carmustine').
+atc_l3('l01', 'catumaxomab').
+atc_l3('l01', 'cediranib').
+atc_l3('l01', 'celecoxib').
+atc_l3('l01', 'cemiplimab').
+atc_l3('l01', 'ceritinib').
+atc_l3('l01', 'cetuximab').
+atc_l3('l01', 'chlorambucil').
+atc_l3('l01', 'chlormethine').
+atc_l3('l01', 'ciltacabtagene_autoleucel').
+atc_l3('l01', 'cisplatin').
+atc_l3('l01', 'cladribine').
+atc_l3('l01', 'clofarabine').
+atc_l3('l01', 'cobimetinib').
+atc_l3('l01', 'copanlisib').
+atc_l3('l01', 'crizotinib').
+atc_l3('l01', 'cyclophosphamide').
+atc_l3('l01', 'cytarabine').
+atc_l3('l01', 'cytarabine_and_daunorubicin').
+atc_l3('l01', 'dabrafenib').
+atc_l3('l01', 'dacarbazine').
+atc_l3('l01', 'dacomitinib').
+atc_l3('l01', 'dactinomycin').
+atc_l3('l01', 'daratumumab').
+atc_l3('l01', 'dasatinib').
+atc_l3('l01', 'daunorubicin').
+atc_l3('l01', 'decitabine').
+atc_l3('l01', 'decitabine_combinations').
+atc_l3('l01', 'demecolcine').
+atc_l3('l01', 'denileukin_diftitox').
+atc_l3('l01', 'dinutuximab_beta').
+atc_l3('l01', 'docetaxel').
+atc_l3('l01', 'dostarlimab').
+atc_l3('l01', 'doxorubicin').
+atc_l3('l01', 'durvalumab').
+atc_l3('l01', 'duvelisib').
+atc_l3('l01', 'edrecolomab').
+atc_l3('l01', 'efaproxiral').
+atc_l3('l01', 'eflornithine').
+atc_l3('l01', 'elotuzumab').
+atc_l3('l01', 'enasidenib').
+atc_l3('l01', 'encorafenib').
+atc_l3('l01', 'enfortumab_vedotin').
+atc_l3('l01', 'entinostat').
+atc_l3('l01', 'entrectinib').
+atc_l3('l01', 'epacadostat').
+atc_l3('l01', 'epcoritamab').
+atc_l3('l01', 'epirubicin').
+atc_l3('l01', 'erdafitinib').
+atc_l3('l01', 'eribulin').
+atc_l3('l01', 'erlotinib').
+atc_l3('l01', 'estramustine').
+atc_l3('l01', 'etirinotecan_pegol').
+atc_l3('l01', 'etoglucid').
+atc_l3('l01', 'etoposide').
+atc_l3('l01', 'everolimus').
+atc_l3('l01', 'fedratinib').
+atc_l3('l01', 'floxuridine').
+atc_l3('l01', 'fludarabine').
+atc_l3('l01', 'fluorouracil').
+atc_l3('l01', 'fluorouracil_combinations').
+atc_l3('l01', 'fotemustine').
+atc_l3('l01', 'fruquintinib').
+atc_l3('l01', 'futibatinib').
+atc_l3('l01', 'gefitinib').
+atc_l3('l01', 'gemcitabine').
+atc_l3('l01', 'gemtuzumab_ozogamicin').
+atc_l3('l01', 'gilteritinib').
+atc_l3('l01', 'glasdegib').
+atc_l3('l01', 'glofitamab').
+atc_l3('l01', 'hydroxycarbamide').
+atc_l3('l01', 'ibrutinib').
+atc_l3('l01', 'icotinib').
+atc_l3('l01', 'idarubicin').
+atc_l3('l01', 'idecabtagene_vicleucel').
+atc_l3('l01', 'idelalisib').
+atc_l3('l01', 'ifosfamide').
+atc_l3('l01', 'imatinib').
+atc_l3('l01', 'imetelstat').
+atc_l3('l01', 'infigratinib').
+atc_l3('l01', 'inotuzumab_ozogamicin').
+atc_l3('l01', 'ipilimumab').
+atc_l3('l01', 'irinotecan').
+atc_l3('l01', 'isatuximab').
+atc_l3('l01', 'ivosidenib').
+atc_l3('l01', 'ixabepilone').
+atc_l3('l01', 'ixazomib').
+atc_l3('l01', 'lapatinib').
+atc_l3('l01', 'larotrectinib').
+atc_l3('l01', 'lazertinib').
+atc_l3('l01', 'lenvatinib').
+atc_l3('l01', 'lifileucel').
+atc_l3('l01', 'lisocabtagene_maraleucel').
+atc_l3('l01', 'lomustine').
+atc_l3('l01', 'loncastuximab_tesirine').
+atc_l3('l01', 'lonidamine').
+atc_l3('l01', 'lorlatinib').
+atc_l3('l01', 'lurbinectedin').
+atc_l3('l01', 'mannosulfan').
+atc_l3('l01', 'margetuximab').
+atc_l3('l01', 'masitinib').
+atc_l3('l01', 'masoprocol').
+atc_l3('l01', 'melphalan').
+atc_l3('l01', 'melphalan_flufenamide').
+atc_l3('l01', 'mercaptopurine').
+atc_l3('l01', 'methotrexate').
+atc_l3('l01', 'methyl_aminolevulinate').
+atc_l3('l01', 'midostaurin').
+atc_l3('l01', 'mirvetuximab_soravtansine').
+atc_l3('l01', 'mitobronitol').
+atc_l3('l01', 'mitoguazone').
+atc_l3('l01', 'mitomycin').
+atc_l3('l01', 'mitotane').
+atc_l3('l01', 'mitoxantrone').
+atc_l3('l01', 'mobocertinib').
+atc_l3('l01', 'mogamulizumab').
+atc_l3('l01', 'momelotinib').
+atc_l3('l01', 'mosunetuzumab').
+atc_l3('l01', 'moxetumomab_pasudotox').
+atc_l3('l01', 'nadofaragene_firadenovec').
+atc_l3('l01', 'navitoclax').
+atc_l3('l01', 'naxitamab').
+atc_l3('l01', 'necitumumab').
+atc_l3('l01', 'nelarabine').
+atc_l3('l01', 'neratinib').
+atc_l3('l01', 'nilotinib').
+atc_l3('l01', 'nimustine').
+atc_l3('l01', 'nintedanib').
+atc_l3('l01', 'niraparib').
+atc_l3('l01', 'niraparib_and_abiraterone').
+atc_l3('l01', 'nivolumab').
+atc_l3('l01', 'nivolumab_and_relatlimab').
+atc_l3('l01', 'obinutuzumab').
+atc_l3('l01', 'oblimersen').
+atc_l3('l01', 'ofatumumab').
+atc_l3('l01', 'olaparib').
+atc_l3('l01', 'olaratumab').
+atc_l3('l01', 'olmutinib').
+atc_l3('l01', 'omacetaxine_mepesuccinate').
+atc_l3('l01', 'oportuzumab_monatox').
+atc_l3('l01', 'orelabrutinib').
+atc_l3('l01', 'osimertinib').
+atc_l3('l01', 'oxaliplatin').
+atc_l3('l01', 'paclitaxel').
+atc_l3('l01', 'paclitaxel_and_encequidar').
+atc_l3('l01', 'paclitaxel_poliglumex').
+atc_l3('l01', 'pacritinib').
+atc_l3('l01', 'padeliporfin').
+atc_l3('l01', 'palbociclib').
+atc_l3('l01', 'pamiparib').
+atc_l3('l01', 'panitumumab').
+atc_l3('l01', 'panobinostat').
+atc_l3('l01', 'parsaclisib').
+atc_l3('l01', 'pazopanib').
+atc_l3('l01', 'pegaspargase').
+atc_l3('l01', 'pembrolizumab').
+atc_l3('l01', 'pemetrexed').
+atc_l3('l01', 'pemigatinib').
+atc_l3('l01', 'pentostatin').
+atc_l3('l01', 'pertuzumab').
+atc_l3('l01', 'pertuzumab_and_trastuzumab').
+atc_l3('l01', 'pexidartinib').
+atc_l3('l01', 'pipobroman').
+atc_l3('l01', 'pirarubicin').
+atc_l3('l01', 'pirtobrutinib').
+atc_l3('l01', 'pixantrone').
+atc_l3('l01', 'plicamycin').
+atc_l3('l01', 'plitidepsin').
+atc_l3('l01', 'polatuzumab_vedotin').
+atc_l3('l01', 'polyplatillen').
+atc_l3('l01', 'ponatinib').
+atc_l3('l01', 'porfimer_sodium').
+atc_l3('l01', 'pralatrexate').
+atc_l3('l01', 'pralsetinib').
+atc_l3('l01', 'prednimustine').
+atc_l3('l01', 'procarbazine').
+atc_l3('l01', 'prolgolimab').
+atc_l3('l01', 'prolgolimab_and_nurulimab').
+atc_l3('l01', 'quizartinib').
+atc_l3('l01', 'raltitrexed').
+atc_l3('l01', 'ramucirumab').
+atc_l3('l01', 'ranimustine').
+atc_l3('l01', 'regorafenib').
+atc_l3('l01', 'retifanlimab').
+atc_l3('l01', 'ribociclib').
+atc_l3('l01', 'ridaforolimus').
+atc_l3('l01', 'ripretinib').
+atc_l3('l01', 'rituximab').
+atc_l3('l01', 'rociletinib').
+atc_l3('l01', 'romidepsin').
+atc_l3('l01', 'rucaparib').
+atc_l3('l01', 'ruxolitinib').
+atc_l3('l01', 'sabatolimab').
+atc_l3('l01', 'sacituzumab_govitecan').
+atc_l3('l01', 'satraplatin').
+atc_l3('l01', 'selinexor').
+atc_l3('l01', 'selpercatinib').
+atc_l3('l01', 'selumetinib').
+atc_l3('l01', 'semustine').
+atc_l3('l01', 'serplulimab').
+atc_l3('l01', 'sirolimus').
+atc_l3('l01', 'sitimagene_ceradenovec').
+atc_l3('l01', 'sitravatinib').
+atc_l3('l01', 'sonidegib').
+atc_l3('l01', 'sorafenib').
+atc_l3('l01', 'sotorasib').
+atc_l3('l01', 'streptozocin').
+atc_l3('l01', 'sugemalimab').
+atc_l3('l01', 'sunitinib').
+atc_l3('l01', 'surufatinib').
+atc_l3('l01', 'tabelecleucel').
+atc_l3('l01', 'tafasitamab').
+atc_l3('l01', 'tagraxofusp').
+atc_l3('l01', 'talazoparib').
+atc_l3('l01', 'talimogene_laherparepvec').
+atc_l3('l01', 'talquetamab').
+atc_l3('l01', 'tazemetostat').
+atc_l3('l01', 'tebentafusp').
+atc_l3('l01', 'teclistamab').
+atc_l3('l01', 'tegafur').
+atc_l3('l01', 'tegafur_combinations').
+atc_l3('l01', 'temoporfin').
+atc_l3('l01', 'temozolomide').
+atc_l3('l01', 'temsirolimus').
+atc_l3('l01', 'teniposide').
+atc_l3('l01', 'tepotinib').
+atc_l3('l01', 'thiotepa').
+atc_l3('l01', 'tiazofurine').
+atc_l3('l01', 'tioguanine').
+atc_l3('l01', 'tisagenlecleucel').
+atc_l3('l01', 'tislelizumab').
+atc_l3('l01', 'tisotumab_vedotin').
+atc_l3('l01', 'tivozanib').
+atc_l3('l01', 'topotecan').
+atc_l3('l01', 'toripalimab').
+atc_l3('l01', 'trabectedin').
+atc_l3('l01', 'trametinib').
+atc_l3('l01', 'trastuzumab').
+atc_l3('l01', 'trastuzumab_deruxtecan').
+atc_l3('l01', 'trastuzumab_duocarmazine').
+atc_l3('l01', 'trastuzumab_emtansine').
+atc_l3('l01', 'tremelimumab').
+atc_l3('l01', 'treosulfan').
+atc_l3('l01', 'tretinoin').
+atc_l3('l01', 'triaziquone').
+atc_l3('l01', 'trifluridine_combinations').
+atc_l3('l01', 'trofosfamide').
+atc_l3('l01', 'tucatinib').
+atc_l3('l01', 'umbralisib').
+atc_l3('l01', 'uramustine').
+atc_l3('l01', 'valrubicin').
+atc_l3('l01', 'vandetanib').
+atc_l3('l01', 'veliparib').
+atc_l3('l01', 'vemurafenib').
+atc_l3('l01', 'venetoclax').
+atc_l3('l01', 'vinblastine').
+atc_l3('l01', 'vincristine').
+atc_l3('l01', 'vindesine').
+atc_l3('l01', 'vinflunine').
+atc_l3('l01', 'vinorelbine').
+atc_l3('l01', 'vintafolide').
+atc_l3('l01', 'vismodegib').
+atc_l3('l01', 'vorinostat').
+atc_l3('l01', 'vosaroxin').
+atc_l3('l01', 'zanubrutinib').
+atc_l3('l01', 'zorubicin').
+atc_l3('l02', 'abarelix').
+atc_l3('l02', 'abiraterone').
+atc_l3('l02', 'abiraterone_and_prednisolone').
+atc_l3('l02', 'aminoglutethimide').
+atc_l3('l02', 'anastrozole').
+atc_l3('l02', 'apalutamide').
+atc_l3('l02', 'bicalutamide').
+atc_l3('l02', 'buserelin').
+atc_l3('l02', 'darolutamide').
+atc_l3('l02', 'degarelix').
+atc_l3('l02', 'diethylstilbestrol').
+atc_l3('l02', 'elacestrant').
+atc_l3('l02', 'enzalutamide').
+atc_l3('l02', 'ethinylestradiol').
+atc_l3('l02', 'exemestane').
+atc_l3('l02', 'flutamide').
+atc_l3('l02', 'formestane').
+atc_l3('l02', 'fosfestrol').
+atc_l3('l02', 'fulvestrant').
+atc_l3('l02', 'gestonorone').
+atc_l3('l02', 'goserelin').
+atc_l3('l02', 'histrelin').
+atc_l3('l02', 'letrozole').
+atc_l3('l02', 'leuprorelin').
+atc_l3('l02', 'leuprorelin_and_bicalutamide').
+atc_l3('l02', 'medroxyprogesterone').
+atc_l3('l02', 'megestrol').
+atc_l3('l02', 'nilutamide').
+atc_l3('l02', 'polyestradiol_phosphate').
+atc_l3('l02', 'relugolix').
+atc_l3('l02', 'tamoxifen').
+atc_l3('l02', 'toremifene').
+atc_l3('l02', 'triptorelin').
+atc_l3('l02', 'vorozole').
+atc_l3('l03', 'albinterferon_alfa_2b').
+atc_l3('l03', 'aldesleukin').
+atc_l3('l03', 'ancestim').
+atc_l3('l03', 'balugrastim').
+atc_l3('l03', 'bcg_vaccine').
+atc_l3('l03', 'cepeginterferon_alfa_2b').
+atc_l3('l03', 'cridanimod').
+atc_l3('l03', 'dasiprotimut_t').
+atc_l3('l03', 'efbemalenograstim_alfa').
+atc_l3('l03', 'eflapegrastim').
+atc_l3('l03', 'elapegademase').
+atc_l3('l03', 'empegfilgrastim').
+atc_l3('l03', 'filgrastim').
+atc_l3('l03', 'glatiramer_acetate').
+atc_l3('l03', 'histamine_dihydrochloride').
+atc_l3('l03', 'immunocyanin').
+atc_l3('l03', 'interferon_alfa_2a').
+atc_l3('l03', 'interferon_alfa_2b').
+atc_l3('l03', 'interferon_alfa_n1').
+atc_l3('l03', 'interferon_alfa_natural').
+atc_l3('l03', 'interferon_alfacon_1').
+atc_l3('l03', 'interferon_beta_1a').
+atc_l3('l03', 'interferon_beta_1b').
+atc_l3('l03', 'interferon_beta_natural').
+atc_l3('l03', 'interferon_gamma').
+atc_l3('l03', 'leniolisib').
+atc_l3('l03', 'lenograstim').
+atc_l3('l03', 'lentinan').
+atc_l3('l03', 'lipegfilgrastim').
+atc_l3('l03', 'melanoma_vaccine').
+atc_l3('l03', 'mifamurtide').
+atc_l3('l03', 'molgramostim').
+atc_l3('l03', 'oprelvekin').
+atc_l3('l03', 'pegademase').
+atc_l3('l03', 'pegfilgrastim').
+atc_l3('l03', 'peginterferon_alfa_2a').
+atc_l3('l03', 'peginterferon_alfa_2a_combinations').
+atc_l3('l03', 'peginterferon_alfa_2b').
+atc_l3('l03', 'peginterferon_alfa_2b_combinations').
+atc_l3('l03', 'peginterferon_alfacon_2').
+atc_l3('l03', 'peginterferon_beta_1a').
+atc_l3('l03', 'pegteograstim').
+atc_l3('l03', 'pidotimod').
+atc_l3('l03', 'plerixafor').
+atc_l3('l03', 'poly_i_c').
+atc_l3('l03', 'poly_iclc').
+atc_l3('l03', 'ropeginterferon_alfa_2b').
+atc_l3('l03', 'roquinimex').
+atc_l3('l03', 'sampeginterferon_beta_1a').
+atc_l3('l03', 'sargramostim').
+atc_l3('l03', 'sipuleucel_t').
+atc_l3('l03', 'tasonermin').
+atc_l3('l03', 'thymopentin').
+atc_l3('l04', 'abatacept').
+atc_l3('l04', 'abetimus').
+atc_l3('l04', 'adalimumab').
+atc_l3('l04', 'afelimomab').
+atc_l3('l04', 'alefacept').
+atc_l3('l04', 'alemtuzumab').
+atc_l3('l04', 'anakinra').
+atc_l3('l04', 'anifrolumab').
+atc_l3('l04', 'antilymphocyte_immunoglobulin_horse').
+atc_l3('l04', 'antithymocyte_immunoglobulin_rabbit').
+atc_l3('l04', 'apremilast').
+atc_l3('l04', 'avacopan').
+atc_l3('l04', 'azathioprine').
+atc_l3('l04', 'baricitinib').
+atc_l3('l04', 'basiliximab').
+atc_l3('l04', 'begelomab').
+atc_l3('l04', 'belatacept').
+atc_l3('l04', 'belimumab').
+atc_l3('l04', 'belumosudil').
+atc_l3('l04', 'bimekizumab').
+atc_l3('l04', 'briakinumab').
+atc_l3('l04', 'brodalumab').
+atc_l3('l04', 'canakinumab').
+atc_l3('l04', 'certolizumab_pegol').
+atc_l3('l04', 'ciclosporin').
+atc_l3('l04', 'cladribine').
+atc_l3('l04', 'crovalimab').
+atc_l3('l04', 'daclizumab').
+atc_l3('l04', 'danicopan').
+atc_l3('l04', 'darvadstrocel').
+atc_l3('l04', 'deucravacitinib').
+atc_l3('l04', 'dimethyl_fumarate').
+atc_l3('l04', 'diroximel_fumarate').
+atc_l3('l04', 'divozilimab').
+atc_l3('l04', 'eculizumab').
+atc_l3('l04', 'efalizumab').
+atc_l3('l04', 'efgartigimod_alfa').
+atc_l3('l04', 'emapalumab').
+atc_l3('l04', 'etanercept').
+atc_l3('l04', 'etrasimod').
+atc_l3('l04', 'everolimus').
+atc_l3('l04', 'filgotinib').
+atc_l3('l04', 'fingolimod').
+atc_l3('l04', 'golimumab').
+atc_l3('l04', 'guselkumab').
+atc_l3('l04', 'gusperimus').
+atc_l3('l04', 'imlifidase').
+atc_l3('l04', 'inebilizumab').
+atc_l3('l04', 'infliximab').
+atc_l3('l04', 'iptacopan').
+atc_l3('l04', 'itacitinib').
+atc_l3('l04', 'ixekizumab').
+atc_l3('l04', 'leflunomide').
+atc_l3('l04', 'lenalidomide').
+atc_l3('l04', 'levilimab').
+atc_l3('l04', 'methotrexate').
+atc_l3('l04', 'mirikizumab').
+atc_l3('l04', 'muromonab_cd3').
+atc_l3('l04', 'mycophenolic_acid').
+atc_l3('l04', 'natalizumab').
+atc_l3('l04', 'netakimab').
+atc_l3('l04', 'ocrelizumab').
+atc_l3('l04', 'ofatumumab').
+atc_l3('l04', 'olokizumab').
+atc_l3('l04', 'opinercept').
+atc_l3('l04', 'ozanimod').
+atc_l3('l04', 'peficitinib').
+atc_l3('l04', 'pegcetacoplan').
+atc_l3('l04', 'pirfenidone').
+atc_l3('l04', 'pomalidomide').
+atc_l3('l04', 'ponesimod').
+atc_l3('l04', 'ravulizumab').
+atc_l3('l04', 'rilonacept').
+atc_l3('l04', 'risankizumab').
+atc_l3('l04', 'ritlecitinib').
+atc_l3('l04', 'rozanolixizumab').
+atc_l3('l04', 'sarilumab').
+atc_l3('l04', 'satralizumab').
+atc_l3('l04', 'secukinumab').
+atc_l3('l04', 'siltuximab').
+atc_l3('l04', 'siponimod').
+atc_l3('l04', 'sirolimus').
+atc_l3('l04', 'sirukumab').
+atc_l3('l04', 'spesolimab').
+atc_l3('l04', 'sutimlimab').
+atc_l3('l04', 'tacrolimus').
+atc_l3('l04', 'teprotumumab').
+atc_l3('l04', 'teriflunomide').
+atc_l3('l04', 'thalidomide').
+atc_l3('l04', 'tildrakizumab').
+atc_l3('l04', 'tocilizumab').
+atc_l3('l04', 'tofacitinib').
+atc_l3('l04', 'ublituximab').
+atc_l3('l04', 'upadacitinib').
+atc_l3('l04', 'ustekinumab').
+atc_l3('l04', 'vedolizumab').
+atc_l3('l04', 'voclosporin').
+atc_l3('l04', 'zilucoplan').
+atc_l3('m01', 'aceclofenac').
+atc_l3('m01', 'acemetacin').
+atc_l3('m01', 'acetylsalicylic_acid_and_corticosteroids').
+atc_l3('m01', 'alclofenac').
+atc_l3('m01', 'alminoprofen').
+atc_l3('m01', 'auranofin').
+atc_l3('m01', 'aurothioglucose').
+atc_l3('m01', 'aurotioprol').
+atc_l3('m01', 'avocado_and_soyabean_oil_unsaponifiables').
+atc_l3('m01', 'azapropazone').
+atc_l3('m01', 'benoxaprofen').
+atc_l3('m01', 'benzydamine').
+atc_l3('m01', 'bucillamine').
+atc_l3('m01', 'bufexamac').
+atc_l3('m01', 'bumadizone').
+atc_l3('m01', 'celecoxib').
+atc_l3('m01', 'chondroitin_sulfate').
+atc_l3('m01', 'clofezone').
+atc_l3('m01', 'dexibuprofen').
+atc_l3('m01', 'dexketoprofen').
+atc_l3('m01', 'diacerein').
+atc_l3('m01', 'diclofenac').
+atc_l3('m01', 'diclofenac_combinations').
+atc_l3('m01', 'difenpiramide').
+atc_l3('m01', 'dipyrocetyl_and_corticosteroids').
+atc_l3('m01', 'droxicam').
+atc_l3('m01', 'etodolac').
+atc_l3('m01', 'etoricoxib').
+atc_l3('m01', 'fenbufen').
+atc_l3('m01', 'fenoprofen').
+atc_l3('m01', 'fentiazac').
+atc_l3('m01', 'feprazone').
+atc_l3('m01', 'feprazone_combinations').
+atc_l3('m01', 'flufenamic_acid').
+atc_l3('m01', 'flunoxaprofen').
+atc_l3('m01', 'flurbiprofen').
+atc_l3('m01', 'glucosamine').
+atc_l3('m01', 'glucosaminoglycan_polysulfate').
+atc_l3('m01', 'ibuprofen').
+atc_l3('m01', 'ibuprofen_combinations').
+atc_l3('m01', 'ibuproxam').
+atc_l3('m01', 'indometacin').
+atc_l3('m01', 'indometacin_combinations').
+atc_l3('m01', 'indoprofen').
+atc_l3('m01', 'kebuzone').
+atc_l3('m01', 'ketoprofen').
+atc_l3('m01', 'ketoprofen_combinations').
+atc_l3('m01', 'ketorolac').
+atc_l3('m01', 'lonazolac').
+atc_l3('m01', 'lornoxicam').
+atc_l3('m01', 'lumiracoxib').
+atc_l3('m01', 'meclofenamic_acid').
+atc_l3('m01', 'mefenamic_acid').
+atc_l3('m01', 'meloxicam').
+atc_l3('m01', 'meloxicam_combinations').
+atc_l3('m01', 'mofebutazone').
+atc_l3('m01', 'morniflumate').
+atc_l3('m01', 'nabumetone').
+atc_l3('m01', 'naproxcinod').
+atc_l3('m01', 'naproxen').
+atc_l3('m01', 'naproxen_and_diphenhydramine').
+atc_l3('m01', 'naproxen_and_esomeprazole').
+atc_l3('m01', 'naproxen_and_misoprostol').
+atc_l3('m01', 'niflumic_acid').
+atc_l3('m01', 'nimesulide').
+atc_l3('m01', 'orgotein').
+atc_l3('m01', 'oxaceprol').
+atc_l3('m01', 'oxametacin').
+atc_l3('m01', 'oxaprozin').
+atc_l3('m01', 'oxycinchophen').
+atc_l3('m01', 'oxyphenbutazone').
+atc_l3('m01', 'parecoxib').
+atc_l3('m01', 'penicillamine').
+atc_l3('m01', 'phenylbutazone').
+atc_l3('m01', 'phenylbutazone_and_corticosteroids').
+atc_l3('m01', 'piroxicam').
+atc_l3('m01', 'pirprofen').
+atc_l3('m01', 'polmacoxib').
+atc_l3('m01', 'proglumetacin').
+atc_l3('m01', 'proquazone').
+atc_l3('m01', 'rofecoxib').
+atc_l3('m01', 'sodium_aurothiomalate').
+atc_l3('m01', 'sodium_aurotiosulfate').
+atc_l3('m01', 'sulindac').
+atc_l3('m01', 'suprofen').
+atc_l3('m01', 'tenidap').
+atc_l3('m01', 'tenoxicam').
+atc_l3('m01', 'tiaprofenic_acid').
+atc_l3('m01', 'tolfenamic_acid').
+atc_l3('m01', 'tolmetin').
+atc_l3('m01', 'valdecoxib').
+atc_l3('m01', 'zomepirac').
+atc_l3('m02', 'aceclofenac').
+atc_l3('m02', 'bendazac').
+atc_l3('m02', 'benzydamine').
+atc_l3('m02', 'bufexamac').
+atc_l3('m02', 'capsaicin').
+atc_l3('m02', 'clofezone').
+atc_l3('m02', 'dexketoprofen').
+atc_l3('m02', 'diclofenac').
+atc_l3('m02', 'dimethyl_sulfoxide').
+atc_l3('m02', 'esflurbiprofen').
+atc_l3('m02', 'etofenamate').
+atc_l3('m02', 'felbinac').
+atc_l3('m02', 'fentiazac').
+atc_l3('m02', 'feprazone').
+atc_l3('m02', 'flurbiprofen').
+atc_l3('m02', 'ibuprofen').
+atc_l3('m02', 'idrocilamide').
+atc_l3('m02', 'indometacin').
+atc_l3('m02', 'ketoprofen').
+atc_l3('m02', 'loxoprofen').
+atc_l3('m02', 'meclofenamic_acid').
+atc_l3('m02', 'mofebutazone').
+atc_l3('m02', 'naproxen').
+atc_l3('m02', 'nifenazone').
+atc_l3('m02', 'niflumic_acid').
+atc_l3('m02', 'nimesulide').
+atc_l3('m02', 'oxyphenbutazone').
+atc_l3('m02', 'phenylbutazone').
+atc_l3('m02', 'piketoprofen').
+atc_l3('m02', 'piroxicam').
+atc_l3('m02', 'suxibuzone').
+atc_l3('m02', 'tolazoline').
+atc_l3('m02', 'tolmetin').
+atc_l3('m02', 'tolperisone').
+atc_l3('m02', 'various').
+atc_l3('m02', 'zucapsaicin').
+atc_l3('m03', 'alcuronium').
+atc_l3('m03', 'atracurium').
+atc_l3('m03', 'baclofen').
+atc_l3('m03', 'botulinum_toxin').
+atc_l3('m03', 'carisoprodol').
+atc_l3('m03', 'carisoprodol_combinations_excl_psycholeptics').
+atc_l3('m03', 'carisoprodol_combinations_with_psycholeptics').
+atc_l3('m03', 'chlormezanone').
+atc_l3('m03', 'chlormezanone_combinations_excl_psycholeptics').
+atc_l3('m03', 'chlormezanone_combinations_with_psycholeptics').
+atc_l3('m03', 'chlorzoxazone').
+atc_l3('m03', 'chlorzoxazone_combinations_excl_psycholeptics').
+atc_l3('m03', 'chlorzoxazone_combinations_with_psycholeptics').
+atc_l3('m03', 'cisatracurium').
+atc_l3('m03', 'cyclobenzaprine').
+atc_l3('m03', 'dantrolene').
+atc_l3('m03', 'dimethyltubocurarine').
+atc_l3('m03', 'doxacurium_chloride').
+atc_l3('m03', 'eperisone').
+atc_l3('m03', 'fazadinium_bromide').
+atc_l3('m03', 'febarbamate').
+atc_l3('m03', 'fenyramidol').
+atc_l3('m03', 'gallamine').
+atc_l3('m03', 'hexafluronium').
+atc_l3('m03', 'mephenesin').
+atc_l3('m03', 'methocarbamol').
+atc_l3('m03', 'methocarbamol_combinations_excl_psycholeptics').
+atc_l3('m03', 'methocarbamol_combinations_with_psycholeptics').
+atc_l3('m03', 'mivacurium_chloride').
+atc_l3('m03', 'orphenadrine_citrate').
+atc_l3('m03', 'orphenadrine_combinations').
+atc_l3('m03', 'pancuronium').
+atc_l3('m03', 'phenprobamate').
+atc_l3('m03', 'phenprobamate_combinations_excl_psycholeptics').
+atc_l3('m03', 'phenprobamate_combinations_with_psycholeptics').
+atc_l3('m03', 'pipecuronium_bromide').
+atc_l3('m03', 'pridinol').
+atc_l3('m03', 'pridinol_combinations').
+atc_l3('m03', 'rocuronium_bromide').
+atc_l3('m03', 'styramate').
+atc_l3('m03', 'suxamethonium').
+atc_l3('m03', 'tetrazepam').
+atc_l3('m03', 'thiocolchicoside').
+atc_l3('m03', 'thiocolchicoside_combinations').
+atc_l3('m03', 'tizanidine').
+atc_l3('m03', 'tolperisone').
+atc_l3('m03', 'tubocurarine').
+atc_l3('m03', 'vecuronium').
+atc_l3('m04', 'allopurinol').
+atc_l3('m04', 'allopurinol_combinations').
+atc_l3('m04', 'benzbromarone').
+atc_l3('m04', 'cinchophen').
+atc_l3('m04', 'colchicine').
+atc_l3('m04', 'colchicine_and_probenecid').
+atc_l3('m04', 'febuxostat').
+atc_l3('m04', 'isobromindione').
+atc_l3('m04', 'lesinurad').
+atc_l3('m04', 'pegloticase').
+atc_l3('m04', 'probenecid').
+atc_l3('m04', 'sulfinpyrazone').
+atc_l3('m04', 'tisopurine').
+atc_l3('m04', 'urate_oxidase').
+atc_l3('m05', 'alendronic_acid').
+atc_l3('m05', 'alendronic_acid_and_alfacalcidol_sequential').
+atc_l3('m05', 'alendronic_acid_and_colecalciferol').
+atc_l3('m05', 'alendronic_acid_calcium_and_colecalciferol_sequential').
+atc_l3('m05', 'aluminium_chlorohydrate').
+atc_l3('m05', 'burosumab').
+atc_l3('m05', 'clodronic_acid').
+atc_l3('m05', 'denosumab').
+atc_l3('m05', 'dibotermin_alfa').
+atc_l3('m05', 'eptotermin_alfa').
+atc_l3('m05', 'etidronic_acid').
+atc_l3('m05', 'etidronic_acid_and_calcium_sequential').
+atc_l3('m05', 'ibandronic_acid').
+atc_l3('m05', 'ibandronic_acid_and_colecalciferol').
+atc_l3('m05', 'ipriflavone').
+atc_l3('m05', 'menatetrenone').
+atc_l3('m05', 'pamidronic_acid').
+atc_l3('m05', 'risedronic_acid').
+atc_l3('m05', 'risedronic_acid_and_calcium_sequential').
+atc_l3('m05', 'risedronic_acid_and_colecalciferol').
+atc_l3('m05', 'risedronic_acid_calcium_and_colecalciferol_sequential').
+atc_l3('m05', 'romosozumab').
+atc_l3('m05', 'strontium_ranelate').
+atc_l3('m05', 'strontium_ranelate_and_colecalciferol').
+atc_l3('m05', 'tiludronic_acid').
+atc_l3('m05', 'vosoritide').
+atc_l3('m05', 'zoledronic_acid').
+atc_l3('m05', 'zoledronic_acid_calcium_and_colecalciferol_sequential').
+atc_l3('m09', 'aceneuramic_acid').
+atc_l3('m09', 'ataluren').
+atc_l3('m09', 'bromelains').
+atc_l3('m09', 'casimersen').
+atc_l3('m09', 'chondrocytes_autologous').
+atc_l3('m09', 'chymopapain').
+atc_l3('m09', 'collagenase_clostridium_histolyticum').
+atc_l3('m09', 'delandistrogene_moxeparvovec').
+atc_l3('m09', 'drisapersen').
+atc_l3('m09', 'eteplirsen').
+atc_l3('m09', 'givinostat').
+atc_l3('m09', 'golodirsen').
+atc_l3('m09', 'hyaluronic_acid').
+atc_l3('m09', 'hydroquinine').
+atc_l3('m09', 'nusinersen').
+atc_l3('m09', 'onasemnogene_abeparvovec').
+atc_l3('m09', 'palovarotene').
+atc_l3('m09', 'quinine_combinations_with_psycholeptics').
+atc_l3('m09', 'risdiplam').
+atc_l3('m09', 'trypsin_combinations').
+atc_l3('m09', 'viltolarsen').
+atc_l3('n01', 'alfaxalone').
+atc_l3('n01', 'alfentanil').
+atc_l3('n01', 'anileridine').
+atc_l3('n01', 'articaine').
+atc_l3('n01', 'articaine_combinations').
+atc_l3('n01', 'benzocaine').
+atc_l3('n01', 'bupivacaine').
+atc_l3('n01', 'bupivacaine_and_meloxicam').
+atc_l3('n01', 'bupivacaine_combinations').
+atc_l3('n01', 'butanilicaine').
+atc_l3('n01', 'capsaicin').
+atc_l3('n01', 'chloroform').
+atc_l3('n01', 'chloroprocaine').
+atc_l3('n01', 'cinchocaine').
+atc_l3('n01', 'cocaine').
+atc_l3('n01', 'combinations').
+atc_l3('n01', 'desflurane').
+atc_l3('n01', 'diethyl_ether').
+atc_l3('n01', 'dyclonine').
+atc_l3('n01', 'enflurane').
+atc_l3('n01', 'esketamine').
+atc_l3('n01', 'ethyl_chloride').
+atc_l3('n01', 'etidocaine').
+atc_l3('n01', 'etidocaine_combinations').
+atc_l3('n01', 'etomidate').
+atc_l3('n01', 'fentanyl').
+atc_l3('n01', 'fentanyl_combinations').
+atc_l3('n01', 'halothane').
+atc_l3('n01', 'hexobarbital').
+atc_l3('n01', 'isoflurane').
+atc_l3('n01', 'ketamine').
+atc_l3('n01', 'levobupivacaine').
+atc_l3('n01', 'lidocaine').
+atc_l3('n01', 'lidocaine_combinations').
+atc_l3('n01', 'mepivacaine').
+atc_l3('n01', 'mepivacaine_combinations').
+atc_l3('n01', 'metabutethamine').
+atc_l3('n01', 'methohexital').
+atc_l3('n01', 'narcobarbital').
+atc_l3('n01', 'nitrous_oxide').
+atc_l3('n01', 'nitrous_oxide_combinations').
+atc_l3('n01', 'phenol').
+atc_l3('n01', 'phenoperidine').
+atc_l3('n01', 'prilocaine').
+atc_l3('n01', 'prilocaine_combinations').
+atc_l3('n01', 'procaine').
+atc_l3('n01', 'procaine_combinations').
+atc_l3('n01', 'propanidid').
+atc_l3('n01', 'propofol').
+atc_l3('n01', 'remifentanil').
+atc_l3('n01', 'ropivacaine').
+atc_l3('n01', 'sevoflurane').
+atc_l3('n01', 'sodium_oxybate').
+atc_l3('n01', 'sufentanil').
+atc_l3('n01', 'tetracaine').
+atc_l3('n01', 'tetracaine_combinations').
+atc_l3('n01', 'thiopental').
+atc_l3('n01', 'trichloroethylene').
+atc_l3('n01', 'vinyl_ether').
+atc_l3('n01', 'xenon').
+atc_l3('n02', 'acetylsalicylic_acid').
+atc_l3('n02', 'acetylsalicylic_acid_combinations_excl_psycholeptics').
+atc_l3('n02', 'acetylsalicylic_acid_combinations_with_psycholeptics').
+atc_l3('n02', 'almotriptan').
+atc_l3('n02', 'aloxiprin').
+atc_l3('n02', 'aminophenazone').
+atc_l3('n02', 'aminophenazone_combinations_excl_psycholeptics').
+atc_l3('n02', 'aminophenazone_combinations_with_psycholeptics').
+atc_l3('n02', 'atogepant').
+atc_l3('n02', 'benorilate').
+atc_l3('n02', 'bezitramide').
+atc_l3('n02', 'bucetin').
+atc_l3('n02', 'bucetin_combinations_excl_psycholeptics').
+atc_l3('n02', 'bucetin_combinations_with_psycholeptics').
+atc_l3('n02', 'buprenorphine').
+atc_l3('n02', 'butorphanol').
+atc_l3('n02', 'cannabinoids').
+atc_l3('n02', 'carbasalate_calcium').
+atc_l3('n02', 'carbasalate_calcium_combinations_excl_psycholeptics').
+atc_l3('n02', 'choline_salicylate').
+atc_l3('n02', 'clonidine').
+atc_l3('n02', 'codeine_and_acetylsalicylic_acid').
+atc_l3('n02', 'codeine_and_ibuprofen').
+atc_l3('n02', 'codeine_and_other_non_opioid_analgesics').
+atc_l3('n02', 'codeine_and_paracetamol').
+atc_l3('n02', 'codeine_combinations_excl_psycholeptics').
+atc_l3('n02', 'codeine_combinations_with_psycholeptics').
+atc_l3('n02', 'dextromoramide').
+atc_l3('n02', 'dextropropoxyphene').
+atc_l3('n02', 'dextropropoxyphene_combinations_excl_psycholeptics').
+atc_l3('n02', 'dextropropoxyphene_combinations_with_psycholeptics').
+atc_l3('n02', 'dezocine').
+atc_l3('n02', 'diflunisal').
+atc_l3('n02', 'dihydrocodeine').
+atc_l3('n02', 'dihydrocodeine_and_acetylsalicylic_acid').
+atc_l3('n02', 'dihydrocodeine_and_other_non_opioid_analgesics').
+atc_l3('n02', 'dihydrocodeine_and_paracetamol').
+atc_l3('n02', 'dihydrocodeine_combinations').
+atc_l3('n02', 'dihydroergotamine').
+atc_l3('n02', 'dihydroergotamine_combinations').
+atc_l3('n02', 'dimetotiazine').
+atc_l3('n02', 'dipyrocetyl').
+atc_l3('n02', 'dipyrocetyl_combinations_excl_psycholeptics').
+atc_l3('n02', 'dipyrocetyl_combinations_with_psycholeptics').
+atc_l3('n02', 'eletriptan').
+atc_l3('n02', 'eptinezumab').
+atc_l3('n02', 'erenumab').
+atc_l3('n02', 'ergotamine').
+atc_l3('n02', 'ergotamine_combinations_excl_psycholeptics').
+atc_l3('n02', 'ergotamine_combinations_with_psycholeptics').
+atc_l3('n02', 'ethenzamide').
+atc_l3('n02', 'ethenzamide_combinations_excl_psycholeptics').
+atc_l3('n02', 'ethenzamide_combinations_with_psycholeptics').
+atc_l3('n02', 'fentanyl').
+atc_l3('n02', 'floctafenine').
+atc_l3('n02', 'flumedroxone').
+atc_l3('n02', 'flupirtine').
+atc_l3('n02', 'fremanezumab').
+atc_l3('n02', 'frovatriptan').
+atc_l3('n02', 'gabapentin').
+atc_l3('n02', 'galcanezumab').
+atc_l3('n02', 'glafenine').
+atc_l3('n02', 'guacetisal').
+atc_l3('n02', 'hydrocodone_and_ibuprofen').
+atc_l3('n02', 'hydrocodone_and_paracetamol').
+atc_l3('n02', 'hydromorphone').
+atc_l3('n02', 'hydromorphone_and_antispasmodics').
+atc_l3('n02', 'hydromorphone_and_naloxone').
+atc_l3('n02', 'imidazole_salicylate').
+atc_l3('n02', 'iprazochrome').
+atc_l3('n02', 'ketobemidone').
+atc_l3('n02', 'ketobemidone_and_antispasmodics').
+atc_l3('n02', 'lasmiditan').
+atc_l3('n02', 'lisuride').
+atc_l3('n02', 'magnesium_salicylate_combinations_excl_psycholeptics').
+atc_l3('n02', 'meptazinol').
+atc_l3('n02', 'metamizole_sodium').
+atc_l3('n02', 'metamizole_sodium_combinations_excl_psycholeptics').
+atc_l3('n02', 'metamizole_sodium_combinations_with_psycholeptics').
+atc_l3('n02', 'methadone_combinations_excl_psycholeptics').
+atc_l3('n02', 'methoxyflurane').
+atc_l3('n02', 'methysergide').
+atc_l3('n02', 'mirogabalin').
+atc_l3('n02', 'morphine').
+atc_l3('n02', 'morphine_and_antispasmodics').
+atc_l3('n02', 'morphine_combinations').
+atc_l3('n02', 'morpholine_salicylate').
+atc_l3('n02', 'nalbuphine').
+atc_l3('n02', 'naratriptan').
+atc_l3('n02', 'nefopam').
+atc_l3('n02', 'nicomorphine').
+atc_l3('n02', 'nifenazone').
+atc_l3('n02', 'oliceridine').
+atc_l3('n02', 'opium').
+atc_l3('n02', 'oxetorone').
+atc_l3('n02', 'oxycodone').
+atc_l3('n02', 'oxycodone_and_acetylsalicylic_acid').
+atc_l3('n02', 'oxycodone_and_ibuprofen').
+atc_l3('n02', 'oxycodone_and_naloxone').
+atc_l3('n02', 'oxycodone_and_naltrexone').
+atc_l3('n02', 'oxycodone_and_paracetamol').
+atc_l3('n02', 'oxymorphone').
+atc_l3('n02', 'papaveretum').
+atc_l3('n02', 'paracetamol').
+atc_l3('n02', 'paracetamol_combinations_excl_psycholeptics').
+atc_l3('n02', 'paracetamol_combinations_with_psycholeptics').
+atc_l3('n02', 'pentazocine').
+atc_l3('n02', 'pentazocine_and_naloxone').
+atc_l3('n02', 'pethidine').
+atc_l3('n02', 'pethidine_and_antispasmodics').
+atc_l3('n02', 'pethidine_combinations_excl_psycholeptics').
+atc_l3('n02', 'pethidine_combinations_with_psycholeptics').
+atc_l3('n02', 'phenacetin').
+atc_l3('n02', 'phenacetin_combinations_excl_psycholeptics').
+atc_l3('n02', 'phenacetin_combinations_with_psycholeptics').
+atc_l3('n02', 'phenazocine').
+atc_l3('n02', 'phenazone').
+atc_l3('n02', 'phenazone_combinations_excl_psycholeptics').
+atc_l3('n02', 'phenazone_combinations_with_psycholeptics').
+atc_l3('n02', 'piritramide').
+atc_l3('n02', 'pizotifen').
+atc_l3('n02', 'potassium_salicylate').
+atc_l3('n02', 'pregabalin').
+atc_l3('n02', 'propacetamol').
+atc_l3('n02', 'propyphenazone').
+atc_l3('n02', 'propyphenazone_combinations_excl_psycholeptics').
+atc_l3('n02', 'propyphenazone_combinations_with_psycholeptics').
+atc_l3('n02', 'rimazolium').
+atc_l3('n02', 'rimegepant').
+atc_l3('n02', 'rizatriptan').
+atc_l3('n02', 'salicylamide').
+atc_l3('n02', 'salicylamide_combinations_excl_psycholeptics').
+atc_l3('n02', 'salicylamide_combinations_with_psycholeptics').
+atc_l3('n02', 'salsalate').
+atc_l3('n02', 'sodium_salicylate').
+atc_l3('n02', 'sumatriptan').
+atc_l3('n02', 'sumatriptan_and_naproxen').
+atc_l3('n02', 'tanezumab').
+atc_l3('n02', 'tapentadol').
+atc_l3('n02', 'tilidine').
+atc_l3('n02', 'tilidine_and_naloxone').
+atc_l3('n02', 'tramadol').
+atc_l3('n02', 'tramadol_and_celecoxib').
+atc_l3('n02', 'tramadol_and_dexketoprofen').
+atc_l3('n02', 'tramadol_and_other_non_opioid_analgesics').
+atc_l3('n02', 'tramadol_and_paracetamol').
+atc_l3('n02', 'ubrogepant').
+atc_l3('n02', 'viminol').
+atc_l3('n02', 'ziconotide').
+atc_l3('n02', 'zolmitriptan').
+atc_l3('n03', 'amino_diphenylhydantoin_valeric_acid').
+atc_l3('n03', 'aminobutyric_acid').
+atc_l3('n03', 'barbexaclone').
+atc_l3('n03', 'beclamide').
+atc_l3('n03', 'brivaracetam').
+atc_l3('n03', 'cannabidiol').
+atc_l3('n03', 'carbamazepine').
+atc_l3('n03', 'carisbamate').
+atc_l3('n03', 'cenobamate').
+atc_l3('n03', 'clonazepam').
+atc_l3('n03', 'eslicarbazepine').
+atc_l3('n03', 'ethadione').
+atc_l3('n03', 'ethosuximide').
+atc_l3('n03', 'ethosuximide_combinations').
+atc_l3('n03', 'ethotoin').
+atc_l3('n03', 'felbamate').
+atc_l3('n03', 'fenfluramine').
+atc_l3('n03', 'fosphenytoin').
+atc_l3('n03', 'ganaxolone').
+atc_l3('n03', 'lacosamide').
+atc_l3('n03', 'lamotrigine').
+atc_l3('n03', 'levetiracetam').
+atc_l3('n03', 'mephenytoin').
+atc_l3('n03', 'mephenytoin_combinations').
+atc_l3('n03', 'mesuximide').
+atc_l3('n03', 'metharbital').
+atc_l3('n03', 'methylphenobarbital').
+atc_l3('n03', 'oxcarbazepine').
+atc_l3('n03', 'paramethadione').
+atc_l3('n03', 'perampanel').
+atc_l3('n03', 'phenacemide').
+atc_l3('n03', 'pheneturide').
+atc_l3('n03', 'phenobarbital').
+atc_l3('n03', 'phensuximide').
+atc_l3('n03', 'phenytoin').
+atc_l3('n03', 'phenytoin_combinations').
+atc_l3('n03', 'primidone').
+atc_l3('n03', 'progabide').
+atc_l3('n03', 'retigabine').
+atc_l3('n03', 'rufinamide').
+atc_l3('n03', 'stiripentol').
+atc_l3('n03', 'sultiame').
+atc_l3('n03', 'tiagabine').
+atc_l3('n03', 'topiramate').
+atc_l3('n03', 'trimethadione').
+atc_l3('n03', 'valproic_acid').
+atc_l3('n03', 'valpromide').
+atc_l3('n03', 'vigabatrin').
+atc_l3('n03', 'zonisamide').
+atc_l3('n04', 'amantadine').
+atc_l3('n04', 'apomorphine').
+atc_l3('n04', 'benzatropine').
+atc_l3('n04', 'biperiden').
+atc_l3('n04', 'bornaprine').
+atc_l3('n04', 'bromocriptine').
+atc_l3('n04', 'budipine').
+atc_l3('n04', 'cabergoline').
+atc_l3('n04', 'dexetimide').
+atc_l3('n04', 'dihydroergocryptine_mesylate').
+atc_l3('n04', 'entacapone').
+atc_l3('n04', 'etanautine').
+atc_l3('n04', 'etilevodopa_and_decarboxylase_inhibitor').
+atc_l3('n04', 'etybenzatropine').
+atc_l3('n04', 'foslevodopa_and_decarboxylase_inhibitor').
+atc_l3('n04', 'istradefylline').
+atc_l3('n04', 'levodopa').
+atc_l3('n04', 'levodopa_and_decarboxylase_inhibitor').
+atc_l3('n04', 'levodopa_decarboxylase_inhibitor_and_comt_inhibitor').
+atc_l3('n04', 'mazaticol').
+atc_l3('n04', 'melevodopa').
+atc_l3('n04', 'melevodopa_and_decarboxylase_inhibitor').
+atc_l3('n04', 'metixene').
+atc_l3('n04', 'opicapone').
+atc_l3('n04', 'orphenadrine_chloride').
+atc_l3('n04', 'pergolide').
+atc_l3('n04', 'phenglutarimide').
+atc_l3('n04', 'piribedil').
+atc_l3('n04', 'pramipexole').
+atc_l3('n04', 'procyclidine').
+atc_l3('n04', 'profenamine').
+atc_l3('n04', 'rasagiline').
+atc_l3('n04', 'ropinirole').
+atc_l3('n04', 'rotigotine').
+atc_l3('n04', 'safinamide').
+atc_l3('n04', 'selegiline').
+atc_l3('n04', 'tolcapone').
+atc_l3('n04', 'trihexyphenidyl').
+atc_l3('n04', 'tropatepine').
+atc_l3('n05', 'acepromazine').
+atc_l3('n05', 'acetophenazine').
+atc_l3('n05', 'acetylglycinamide_chloral_hydrate').
+atc_l3('n05', 'adinazolam').
+atc_l3('n05', 'allobarbital').
+atc_l3('n05', 'alprazolam').
+atc_l3('n05', 'amisulpride').
+atc_l3('n05', 'amobarbital').
+atc_l3('n05', 'aprobarbital').
+atc_l3('n05', 'apronal').
+atc_l3('n05', 'aripiprazole').
+atc_l3('n05', 'asenapine').
+atc_l3('n05', 'barbital').
+atc_l3('n05', 'barbiturates_in_combination_with_other_drugs').
+atc_l3('n05', 'benperidol').
+atc_l3('n05', 'bentazepam').
+atc_l3('n05', 'benzoctamine').
+atc_l3('n05', 'brexpiprazole').
+atc_l3('n05', 'bromazepam').
+atc_l3('n05', 'bromides').
+atc_l3('n05', 'bromisoval').
+atc_l3('n05', 'bromperidol').
+atc_l3('n05', 'brotizolam').
+atc_l3('n05', 'buspirone').
+atc_l3('n05', 'butaperazine').
+atc_l3('n05', 'butobarbital').
+atc_l3('n05', 'camazepam').
+atc_l3('n05', 'captodiame').
+atc_l3('n05', 'carbromal').
+atc_l3('n05', 'cariprazine').
+atc_l3('n05', 'chloral_hydrate').
+atc_l3('n05', 'chloralodol').
+atc_l3('n05', 'chlordiazepoxide').
+atc_l3('n05', 'chlorproethazine').
+atc_l3('n05', 'chlorpromazine').
+atc_l3('n05', 'chlorprothixene').
+atc_l3('n05', 'cinolazepam').
+atc_l3('n05', 'clobazam').
+atc_l3('n05', 'clomethiazole').
+atc_l3('n05', 'clomethiazole_combinations').
+atc_l3('n05', 'clopenthixol').
+atc_l3('n05', 'clotiapine').
+atc_l3('n05', 'clotiazepam').
+atc_l3('n05', 'cloxazolam').
+atc_l3('n05', 'clozapine').
+atc_l3('n05', 'combinations_of_barbiturates').
+atc_l3('n05', 'cyamemazine').
+atc_l3('n05', 'cyclobarbital').
+atc_l3('n05', 'daridorexant').
+atc_l3('n05', 'dexmedetomidine').
+atc_l3('n05', 'diazepam').
+atc_l3('n05', 'dichloralphenazone').
+atc_l3('n05', 'dipiperonylaminoethanol_combinations').
+atc_l3('n05', 'dixyrazine').
+atc_l3('n05', 'doxefazepam').
+atc_l3('n05', 'droperidol').
+atc_l3('n05', 'emepronium_combinations').
+atc_l3('n05', 'emylcamate').
+atc_l3('n05', 'estazolam').
+atc_l3('n05', 'eszopiclone').
+atc_l3('n05', 'etallobarbital').
+atc_l3('n05', 'ethchlorvynol').
+atc_l3('n05', 'ethyl_loflazepate').
+atc_l3('n05', 'etifoxine').
+atc_l3('n05', 'etizolam').
+atc_l3('n05', 'fabomotizole').
+atc_l3('n05', 'fluanisone').
+atc_l3('n05', 'fludiazepam').
+atc_l3('n05', 'flunitrazepam').
+atc_l3('n05', 'flupentixol').
+atc_l3('n05', 'fluphenazine').
+atc_l3('n05', 'flurazepam').
+atc_l3('n05', 'fluspirilene').
+atc_l3('n05', 'gedocarnil').
+atc_l3('n05', 'glutethimide').
+atc_l3('n05', 'halazepam').
+atc_l3('n05', 'haloperidol').
+atc_l3('n05', 'heptabarbital').
+atc_l3('n05', 'hexapropymate').
+atc_l3('n05', 'hexobarbital').
+atc_l3('n05', 'hydroxyzine').
+atc_l3('n05', 'hydroxyzine_combinations').
+atc_l3('n05', 'iloperidone').
+atc_l3('n05', 'ketazolam').
+atc_l3('n05', 'lavandulae_aetheroleum').
+atc_l3('n05', 'lemborexant').
+atc_l3('n05', 'levomepromazine').
+atc_l3('n05', 'levosulpiride').
+atc_l3('n05', 'lithium').
+atc_l3('n05', 'loprazolam').
+atc_l3('n05', 'lorazepam').
+atc_l3('n05', 'lorazepam_combinations').
+atc_l3('n05', 'lormetazepam').
+atc_l3('n05', 'loxapine').
+atc_l3('n05', 'lumateperone').
+atc_l3('n05', 'lurasidone').
+atc_l3('n05', 'mebutamate').
+atc_l3('n05', 'medazepam').
+atc_l3('n05', 'melatonin').
+atc_l3('n05', 'melperone').
+atc_l3('n05', 'mephenoxalone').
+atc_l3('n05', 'meprobamate').
+atc_l3('n05', 'meprobamate_combinations').
+atc_l3('n05', 'mesoridazine').
+atc_l3('n05', 'methaqualone').
+atc_l3('n05', 'methaqualone_combinations').
+atc_l3('n05', 'methohexital').
+atc_l3('n05', 'methylpentynol').
+atc_l3('n05', 'methylpentynol_combinations').
+atc_l3('n05', 'methyprylon').
+atc_l3('n05', 'mexazolam').
+atc_l3('n05', 'midazolam').
+atc_l3('n05', 'molindone').
+atc_l3('n05', 'moperone').
+atc_l3('n05', 'mosapramine').
+atc_l3('n05', 'niaprazine').
+atc_l3('n05', 'nimetazepam').
+atc_l3('n05', 'nitrazepam').
+atc_l3('n05', 'nordazepam').
+atc_l3('n05', 'olanzapine').
+atc_l3('n05', 'olanzapine_and_samidorphan').
+atc_l3('n05', 'oxazepam').
+atc_l3('n05', 'oxypertine').
+atc_l3('n05', 'paliperidone').
+atc_l3('n05', 'paraldehyde').
+atc_l3('n05', 'penfluridol').
+atc_l3('n05', 'pentobarbital').
+atc_l3('n05', 'perazine').
+atc_l3('n05', 'periciazine').
+atc_l3('n05', 'perphenazine').
+atc_l3('n05', 'pimavanserin').
+atc_l3('n05', 'pimozide').
+atc_l3('n05', 'pinazepam').
+atc_l3('n05', 'pipamperone').
+atc_l3('n05', 'pipotiazine').
+atc_l3('n05', 'potassium_clorazepate').
+atc_l3('n05', 'prazepam').
+atc_l3('n05', 'prochlorperazine').
+atc_l3('n05', 'promazine').
+atc_l3('n05', 'propiomazine').
+atc_l3('n05', 'prothipendyl').
+atc_l3('n05', 'proxibarbal').
+atc_l3('n05', 'pyrithyldione').
+atc_l3('n05', 'quazepam').
+atc_l3('n05', 'quetiapine').
+atc_l3('n05', 'ramelteon').
+atc_l3('n05', 'remimazolam').
+atc_l3('n05', 'remoxipride').
+atc_l3('n05', 'reposal').
+atc_l3('n05', 'risperidone').
+atc_l3('n05', 'scopolamine').
+atc_l3('n05', 'secobarbital').
+atc_l3('n05', 'sertindole').
+atc_l3('n05', 'sulpiride').
+atc_l3('n05', 'sultopride').
+atc_l3('n05', 'suvorexant').
+atc_l3('n05', 'talbutal').
+atc_l3('n05', 'tasimelteon').
+atc_l3('n05', 'temazepam').
+atc_l3('n05', 'thiopental').
+atc_l3('n05', 'thiopropazate').
+atc_l3('n05', 'thioproperazine').
+atc_l3('n05', 'thioridazine').
+atc_l3('n05', 'tiapride').
+atc_l3('n05', 'tiotixene').
+atc_l3('n05', 'tofisopam').
+atc_l3('n05', 'triazolam').
+atc_l3('n05', 'triclofos').
+atc_l3('n05', 'trifluoperazine').
+atc_l3('n05', 'trifluperidol').
+atc_l3('n05', 'triflupromazine').
+atc_l3('n05', 'valerianae_radix').
+atc_l3('n05', 'valnoctamide').
+atc_l3('n05', 'veralipride').
+atc_l3('n05', 'vinbarbital').
+atc_l3('n05', 'vinylbital').
+atc_l3('n05', 'zaleplon').
+atc_l3('n05', 'ziprasidone').
+atc_l3('n05', 'zolpidem').
+atc_l3('n05', 'zopiclone').
+atc_l3('n05', 'zotepine').
+atc_l3('n05', 'zuclopenthixol').
+atc_l3('n06', 'acetylcarnitine').
+atc_l3('n06', 'adrafinil').
+atc_l3('n06', 'aducanumab').
+atc_l3('n06', 'agomelatine').
+atc_l3('n06', 'alaproclate').
+atc_l3('n06', 'amfetamine').
+atc_l3('n06', 'amineptine').
+atc_l3('n06', 'amitriptyline').
+atc_l3('n06', 'amitriptyline_and_psycholeptics').
+atc_l3('n06', 'amoxapine').
+atc_l3('n06', 'aniracetam').
+atc_l3('n06', 'armodafinil').
+atc_l3('n06', 'atomoxetine').
+atc_l3('n06', 'bifemelane').
+atc_l3('n06', 'brexanolone').
+atc_l3('n06', 'bupropion').
+atc_l3('n06', 'bupropion_and_dextromethorphan').
+atc_l3('n06', 'butriptyline').
+atc_l3('n06', 'caffeine').
+atc_l3('n06', 'citalopram').
+atc_l3('n06', 'citicoline').
+atc_l3('n06', 'clomipramine').
+atc_l3('n06', 'combinations').
+atc_l3('n06', 'deanol').
+atc_l3('n06', 'desipramine').
+atc_l3('n06', 'desvenlafaxine').
+atc_l3('n06', 'dexamfetamine').
+atc_l3('n06', 'dexmethylphenidate').
+atc_l3('n06', 'dexmethylphenidate_and_serdexmethylphenidate').
+atc_l3('n06', 'dibenzepin').
+atc_l3('n06', 'dimetacrine').
+atc_l3('n06', 'donanemab').
+atc_l3('n06', 'donepezil').
+atc_l3('n06', 'donepezil_and_memantine').
+atc_l3('n06', 'donepezil_memantine_and_ginkgo_folium').
+atc_l3('n06', 'dosulepin').
+atc_l3('n06', 'doxepin').
+atc_l3('n06', 'duloxetine').
+atc_l3('n06', 'escitalopram').
+atc_l3('n06', 'esketamine').
+atc_l3('n06', 'etoperidone').
+atc_l3('n06', 'fencamfamin').
+atc_l3('n06', 'fenetylline').
+atc_l3('n06', 'fenozolone').
+atc_l3('n06', 'fipexide').
+atc_l3('n06', 'fluoxetine').
+atc_l3('n06', 'fluoxetine_and_psycholeptics').
+atc_l3('n06', 'fluvoxamine').
+atc_l3('n06', 'galantamine').
+atc_l3('n06', 'gepirone').
+atc_l3('n06', 'ginkgo_folium').
+atc_l3('n06', 'hyperici_herba').
+atc_l3('n06', 'idebenone').
+atc_l3('n06', 'imipramine').
+atc_l3('n06', 'imipramine_oxide').
+atc_l3('n06', 'ipidacrine').
+atc_l3('n06', 'iprindole').
+atc_l3('n06', 'iproclozide').
+atc_l3('n06', 'iproniazide').
+atc_l3('n06', 'isocarboxazid').
+atc_l3('n06', 'lecanemab').
+atc_l3('n06', 'levomilnacipran').
+atc_l3('n06', 'linopirdine').
+atc_l3('n06', 'lisdexamfetamine').
+atc_l3('n06', 'lofepramine').
+atc_l3('n06', 'maprotiline').
+atc_l3('n06', 'meclofenoxate').
+atc_l3('n06', 'medifoxamine').
+atc_l3('n06', 'melitracen').
+atc_l3('n06', 'melitracen_and_psycholeptics').
+atc_l3('n06', 'memantine').
+atc_l3('n06', 'metamfetamine').
+atc_l3('n06', 'methylphenidate').
+atc_l3('n06', 'mianserin').
+atc_l3('n06', 'milnacipran').
+atc_l3('n06', 'minaprine').
+atc_l3('n06', 'mirtazapine').
+atc_l3('n06', 'moclobemide').
+atc_l3('n06', 'modafinil').
+atc_l3('n06', 'nefazodone').
+atc_l3('n06', 'nialamide').
+atc_l3('n06', 'nizofenone').
+atc_l3('n06', 'nomifensine').
+atc_l3('n06', 'nortriptyline').
+atc_l3('n06', 'opipramol').
+atc_l3('n06', 'oxaflozane').
+atc_l3('n06', 'oxiracetam').
+atc_l3('n06', 'oxitriptan').
+atc_l3('n06', 'paroxetine').
+atc_l3('n06', 'pemoline').
+atc_l3('n06', 'phenelzine').
+atc_l3('n06', 'phenibut').
+atc_l3('n06', 'pipradrol').
+atc_l3('n06', 'piracetam').
+atc_l3('n06', 'pirisudanol').
+atc_l3('n06', 'pivagabine').
+atc_l3('n06', 'pramiracetam').
+atc_l3('n06', 'prolintane').
+atc_l3('n06', 'propentofylline').
+atc_l3('n06', 'protriptyline').
+atc_l3('n06', 'pyritinol').
+atc_l3('n06', 'quinupramine').
+atc_l3('n06', 'reboxetine').
+atc_l3('n06', 'rivastigmine').
+atc_l3('n06', 'sertraline').
+atc_l3('n06', 'solriamfetol').
+atc_l3('n06', 'tacrine').
+atc_l3('n06', 'temgicoluril').
+atc_l3('n06', 'tianeptine').
+atc_l3('n06', 'toloxatone').
+atc_l3('n06', 'tranylcypromine').
+atc_l3('n06', 'trazodone').
+atc_l3('n06', 'trimipramine').
+atc_l3('n06', 'tryptophan').
+atc_l3('n06', 'venlafaxine').
+atc_l3('n06', 'vilazodone').
+atc_l3('n06', 'viloxazine').
+atc_l3('n06', 'vinpocetine').
+atc_l3('n06', 'vortioxetine').
+atc_l3('n06', 'zimeldine').
+atc_l3('n07', 'acamprosate').
+atc_l3('n07', 'acetylleucine').
+atc_l3('n07', 'ambenonium').
+atc_l3('n07', 'amifampridine').
+atc_l3('n07', 'arimoclomol').
+atc_l3('n07', 'betahistine').
+atc_l3('n07', 'bethanechol').
+atc_l3('n07', 'buprenorphine').
+atc_l3('n07', 'buprenorphine_combinations').
+atc_l3('n07', 'calcium_carbimide').
+atc_l3('n07', 'carbachol').
+atc_l3('n07', 'cevimeline').
+atc_l3('n07', 'choline_alfoscerate').
+atc_l3('n07', 'cinnarizine').
+atc_l3('n07', 'cinnarizine_combinations').
+atc_l3('n07', 'cytisinicline').
+atc_l3('n07', 'deutetrabenazine').
+atc_l3('n07', 'dextromethorphan_combinations').
+atc_l3('n07', 'diamorphine').
+atc_l3('n07', 'distigmine').
+atc_l3('n07', 'disulfiram').
+atc_l3('n07', 'edaravone').
+atc_l3('n07', 'eplontersen').
+atc_l3('n07', 'fampridine').
+atc_l3('n07', 'flunarizine').
+atc_l3('n07', 'inotersen').
+atc_l3('n07', 'laquinimod').
+atc_l3('n07', 'levacetylmethadol').
+atc_l3('n07', 'levomethadone').
+atc_l3('n07', 'lofexidine').
+atc_l3('n07', 'methadone').
+atc_l3('n07', 'nalmefene').
+atc_l3('n07', 'naltrexone').
+atc_l3('n07', 'neostigmine').
+atc_l3('n07', 'neostigmine_combinations').
+atc_l3('n07', 'nicotine').
+atc_l3('n07', 'patisiran').
+atc_l3('n07', 'pilocarpine').
+atc_l3('n07', 'pitolisant').
+atc_l3('n07', 'pyridostigmine').
+atc_l3('n07', 'riluzole').
+atc_l3('n07', 'sodium_oxybate').
+atc_l3('n07', 'sodium_phenylbutyrate_and_ursodoxicoltaurine').
+atc_l3('n07', 'tafamidis').
+atc_l3('n07', 'tetrabenazine').
+atc_l3('n07', 'tirilazad').
+atc_l3('n07', 'tofersen').
+atc_l3('n07', 'troriluzole').
+atc_l3('n07', 'valbenazine').
+atc_l3('n07', 'varenicline').
+atc_l3('n07', 'vutrisiran').
+atc_l3('n07', 'xaliproden').
+atc_l3('p01', 'acetarsol').
+atc_l3('p01', 'amodiaquine').
+atc_l3('p01', 'arsthinol').
+atc_l3('p01', 'artemether').
+atc_l3('p01', 'artemether_and_lumefantrine').
+atc_l3('p01', 'artemisinin').
+atc_l3('p01', 'artemisinin_and_naphthoquine').
+atc_l3('p01', 'artemisinin_and_piperaquine').
+atc_l3('p01', 'artemotil').
+atc_l3('p01', 'artenimol').
+atc_l3('p01', 'artenimol_and_piperaquine').
+atc_l3('p01', 'arterolane_and_piperaquine').
+atc_l3('p01', 'artesunate').
+atc_l3('p01', 'artesunate_and_amodiaquine').
+atc_l3('p01', 'artesunate_and_mefloquine').
+atc_l3('p01', 'artesunate_and_pyronaridine').
+atc_l3('p01', 'artesunate_sulfadoxine_and_pyrimethamine').
+atc_l3('p01', 'artesunate_sulfalene_and_pyrimethamine').
+atc_l3('p01', 'atovaquone').
+atc_l3('p01', 'azanidazole').
+atc_l3('p01', 'benznidazole').
+atc_l3('p01', 'broxyquinoline').
+atc_l3('p01', 'chiniofon').
+atc_l3('p01', 'chloroquine').
+atc_l3('p01', 'chloroquine_and_proguanil').
+atc_l3('p01', 'chlorquinaldol').
+atc_l3('p01', 'clefamide').
+atc_l3('p01', 'clioquinol').
+atc_l3('p01', 'clioquinol_combinations').
+atc_l3('p01', 'cycloguanil_embonate').
+atc_l3('p01', 'dehydroemetine').
+atc_l3('p01', 'difetarsone').
+atc_l3('p01', 'diloxanide').
+atc_l3('p01', 'eflornithine').
+atc_l3('p01', 'emetine').
+atc_l3('p01', 'emetine_combinations').
+atc_l3('p01', 'etofamide').
+atc_l3('p01', 'fexinidazole').
+atc_l3('p01', 'fumagillin').
+atc_l3('p01', 'glycobiarsol').
+atc_l3('p01', 'glycobiarsol_combinations').
+atc_l3('p01', 'halofantrine').
+atc_l3('p01', 'hydroxychloroquine').
+atc_l3('p01', 'mefloquine').
+atc_l3('p01', 'meglumine_antimonate').
+atc_l3('p01', 'melarsoprol').
+atc_l3('p01', 'mepacrine').
+atc_l3('p01', 'metronidazole').
+atc_l3('p01', 'metronidazole_and_diloxanide').
+atc_l3('p01', 'metronidazole_and_furazolidone').
+atc_l3('p01', 'miltefosine').
+atc_l3('p01', 'nifurtimox').
+atc_l3('p01', 'nimorazole').
+atc_l3('p01', 'nitazoxanide').
+atc_l3('p01', 'nitrofural').
+atc_l3('p01', 'ornidazole').
+atc_l3('p01', 'pentamidine_isethionate').
+atc_l3('p01', 'phanquinone').
+atc_l3('p01', 'primaquine').
+atc_l3('p01', 'proguanil').
+atc_l3('p01', 'proguanil_and_atovaquone').
+atc_l3('p01', 'propenidazole').
+atc_l3('p01', 'pyrimethamine').
+atc_l3('p01', 'pyrimethamine_combinations').
+atc_l3('p01', 'quinine').
+atc_l3('p01', 'secnidazole').
+atc_l3('p01', 'sodium_stibogluconate').
+atc_l3('p01', 'suramin_sodium').
+atc_l3('p01', 'tafenoquine').
+atc_l3('p01', 'teclozan').
+atc_l3('p01', 'tenonitrozole').
+atc_l3('p01', 'tilbroquinol').
+atc_l3('p01', 'tilbroquinol_and_tiliquinol').
+atc_l3('p01', 'tinidazole').
+atc_l3('p01', 'trimetrexate').
+atc_l3('p02', 'albendazole').
+atc_l3('p02', 'arpraziquantel').
+atc_l3('p02', 'bephenium').
+atc_l3('p02', 'bithionol').
+atc_l3('p02', 'ciclobendazole').
+atc_l3('p02', 'desaspidin').
+atc_l3('p02', 'dichlorophen').
+atc_l3('p02', 'diethylcarbamazine').
+atc_l3('p02', 'fenbendazole').
+atc_l3('p02', 'flubendazole').
+atc_l3('p02', 'ivermectin').
+atc_l3('p02', 'levamisole').
+atc_l3('p02', 'mebendazole').
+atc_l3('p02', 'mebendazole_combinations').
+atc_l3('p02', 'metrifonate').
+atc_l3('p02', 'moxidectin').
+atc_l3('p02', 'niclosamide').
+atc_l3('p02', 'niridazole').
+atc_l3('p02', 'oxamniquine').
+atc_l3('p02', 'oxantel').
+atc_l3('p02', 'piperazine').
+atc_l3('p02', 'praziquantel').
+atc_l3('p02', 'pyrantel').
+atc_l3('p02', 'pyrvinium').
+atc_l3('p02', 'stibophen').
+atc_l3('p02', 'tiabendazole').
+atc_l3('p02', 'triclabendazole').
+atc_l3('p03', 'abametapir').
+atc_l3('p03', 'benzyl_alcohol').
+atc_l3('p03', 'benzyl_benzoate').
+atc_l3('p03', 'bioallethrin').
+atc_l3('p03', 'bioallethrin_combinations').
+atc_l3('p03', 'clofenotane').
+atc_l3('p03', 'clofenotane_combinations').
+atc_l3('p03', 'copper_oleinate').
+atc_l3('p03', 'cyfluthrin').
+atc_l3('p03', 'cypermethrin').
+atc_l3('p03', 'decamethrin').
+atc_l3('p03', 'dibutylphthalate').
+atc_l3('p03', 'dibutylsuccinate').
+atc_l3('p03', 'diethyltoluamide').
+atc_l3('p03', 'dimethylcarbate').
+atc_l3('p03', 'dimethylphthalate').
+atc_l3('p03', 'dimeticone').
+atc_l3('p03', 'disulfiram').
+atc_l3('p03', 'disulfiram_combinations').
+atc_l3('p03', 'dixanthogen').
+atc_l3('p03', 'etohexadiol').
+atc_l3('p03', 'lindane').
+atc_l3('p03', 'malathion').
+atc_l3('p03', 'mesulfen').
+atc_l3('p03', 'permethrin').
+atc_l3('p03', 'permethrin_combinations').
+atc_l3('p03', 'phenothrin').
+atc_l3('p03', 'phenothrin_combinations').
+atc_l3('p03', 'potassium_polysulfide').
+atc_l3('p03', 'pyrethrum').
+atc_l3('p03', 'pyrethrum_combinations').
+atc_l3('p03', 'quassia').
+atc_l3('p03', 'tetramethrin').
+atc_l3('p03', 'thiram').
+atc_l3('r01', 'antazoline').
+atc_l3('r01', 'azelastine').
+atc_l3('r01', 'beclometasone').
+atc_l3('r01', 'betamethasone').
+atc_l3('r01', 'budesonide').
+atc_l3('r01', 'calcium_hexamine_thiocyanate').
+atc_l3('r01', 'ciclesonide').
+atc_l3('r01', 'combinations').
+atc_l3('r01', 'cromoglicic_acid').
+atc_l3('r01', 'cromoglicic_acid_combinations').
+atc_l3('r01', 'cyclopentamine').
+atc_l3('r01', 'dexamethasone').
+atc_l3('r01', 'dexamethasone_combinations').
+atc_l3('r01', 'ephedrine').
+atc_l3('r01', 'epinephrine').
+atc_l3('r01', 'fenoxazoline').
+atc_l3('r01', 'flunisolide').
+atc_l3('r01', 'fluticasone').
+atc_l3('r01', 'fluticasone_combinations').
+atc_l3('r01', 'fluticasone_furoate').
+atc_l3('r01', 'framycetin').
+atc_l3('r01', 'hexamidine').
+atc_l3('r01', 'hyaluronic_acid').
+atc_l3('r01', 'hydrocortisone_combinations').
+atc_l3('r01', 'indanazoline').
+atc_l3('r01', 'ipratropium_bromide').
+atc_l3('r01', 'levocabastine').
+atc_l3('r01', 'metizoline').
+atc_l3('r01', 'mometasone').
+atc_l3('r01', 'mometasone_combinations').
+atc_l3('r01', 'mupirocin').
+atc_l3('r01', 'naphazoline').
+atc_l3('r01', 'nedocromil').
+atc_l3('r01', 'olopatadine').
+atc_l3('r01', 'oxymetazoline').
+atc_l3('r01', 'phenylephrine').
+atc_l3('r01', 'phenylephrine_combinations').
+atc_l3('r01', 'phenylpropanolamine').
+atc_l3('r01', 'phenylpropanolamine_combinations').
+atc_l3('r01', 'prednisolone').
+atc_l3('r01', 'prednisolone_combinations').
+atc_l3('r01', 'pseudoephedrine').
+atc_l3('r01', 'pseudoephedrine_combinations').
+atc_l3('r01', 'retinol').
+atc_l3('r01', 'ritiometan').
+atc_l3('r01', 'spaglumic_acid').
+atc_l3('r01', 'tetryzoline').
+atc_l3('r01', 'thonzylamine').
+atc_l3('r01', 'tixocortol').
+atc_l3('r01', 'tixocortol_combinations').
+atc_l3('r01', 'tramazoline').
+atc_l3('r01', 'triamcinolone').
+atc_l3('r01', 'tuaminoheptane').
+atc_l3('r01', 'tymazoline').
+atc_l3('r01', 'various').
+atc_l3('r01', 'xylometazoline').
+atc_l3('r02', 'acriflavinium_chloride').
+atc_l3('r02', 'ambazone').
+atc_l3('r02', 'ambroxol').
+atc_l3('r02', 'bacitracin').
+atc_l3('r02', 'benzalkonium').
+atc_l3('r02', 'benzethonium').
+atc_l3('r02', 'benzocaine').
+atc_l3('r02', 'benzydamine').
+atc_l3('r02', 'cetrimonium').
+atc_l3('r02', 'cetylpyridinium').
+atc_l3('r02', 'chlorhexidine').
+atc_l3('r02', 'chlorquinaldol').
+atc_l3('r02', 'cocaine').
+atc_l3('r02', 'dequalinium').
+atc_l3('r02', 'dichlorobenzyl_alcohol').
+atc_l3('r02', 'dyclonine').
+atc_l3('r02', 'flurbiprofen').
+atc_l3('r02', 'fusafungine').
+atc_l3('r02', 'gramicidin').
+atc_l3('r02', 'hexamidine').
+atc_l3('r02', 'hexylresorcinol').
+atc_l3('r02', 'ibuprofen').
+atc_l3('r02', 'lidocaine').
+atc_l3('r02', 'myristyl_benzalkonium').
+atc_l3('r02', 'neomycin').
+atc_l3('r02', 'octenidine').
+atc_l3('r02', 'oxyquinoline').
+atc_l3('r02', 'phenol').
+atc_l3('r02', 'povidone_iodine').
+atc_l3('r02', 'tyrothricin').
+atc_l3('r02', 'various').
+atc_l3('r03', 'acefylline_piperazine').
+atc_l3('r03', 'aclidinium_bromide').
+atc_l3('r03', 'aminophylline').
+atc_l3('r03', 'aminophylline_and_adrenergics').
+atc_l3('r03', 'aminophylline_combinations').
+atc_l3('r03', 'amlexanox').
+atc_l3('r03', 'bambuterol').
+atc_l3('r03', 'bamifylline').
+atc_l3('r03', 'beclometasone').
+atc_l3('r03', 'benralizumab').
+atc_l3('r03', 'betamethasone').
+atc_l3('r03', 'bitolterol').
+atc_l3('r03', 'budesonide').
+atc_l3('r03', 'bufylline').
+atc_l3('r03', 'carbuterol').
+atc_l3('r03', 'choline_theophyllinate').
+atc_l3('r03', 'choline_theophyllinate_and_adrenergics').
+atc_l3('r03', 'ciclesonide').
+atc_l3('r03', 'clenbuterol').
+atc_l3('r03', 'clenbuterol_and_ambroxol').
+atc_l3('r03', 'combinations_of_xanthines').
+atc_l3('r03', 'cromoglicic_acid').
+atc_l3('r03', 'diprophylline').
+atc_l3('r03', 'diprophylline_and_adrenergics').
+atc_l3('r03', 'diprophylline_combinations').
+atc_l3('r03', 'doxofylline').
+atc_l3('r03', 'ephedrine').
+atc_l3('r03', 'epinephrine').
+atc_l3('r03', 'epinephrine_and_other_drugs_for_obstructive_airway_diseases').
+atc_l3('r03', 'eprozinol').
+atc_l3('r03', 'etamiphylline').
+atc_l3('r03', 'etamiphylline_and_adrenergics').
+atc_l3('r03', 'fenoterol').
+atc_l3('r03', 'fenoterol_and_ipratropium_bromide').
+atc_l3('r03', 'fenspiride').
+atc_l3('r03', 'flunisolide').
+atc_l3('r03', 'fluticasone').
+atc_l3('r03', 'fluticasone_furoate').
+atc_l3('r03', 'formoterol').
+atc_l3('r03', 'formoterol_and_aclidinium_bromide').
+atc_l3('r03', 'formoterol_and_beclometasone').
+atc_l3('r03', 'formoterol_and_budesonide').
+atc_l3('r03', 'formoterol_and_fluticasone').
+atc_l3('r03', 'formoterol_and_glycopyrronium_bromide').
+atc_l3('r03', 'formoterol_and_mometasone').
+atc_l3('r03', 'formoterol_and_tiotropium_bromide').
+atc_l3('r03', 'formoterol_glycopyrronium_bromide_and_beclometasone').
+atc_l3('r03', 'formoterol_glycopyrronium_bromide_and_budesonide').
+atc_l3('r03', 'glycopyrronium_bromide').
+atc_l3('r03', 'hexoprenaline').
+atc_l3('r03', 'ibudilast').
+atc_l3('r03', 'indacaterol').
+atc_l3('r03', 'indacaterol_and_glycopyrronium_bromide').
+atc_l3('r03', 'indacaterol_and_mometasone').
+atc_l3('r03', 'indacaterol_glycopyrronium_bromide_and_mometasone').
+atc_l3('r03', 'ipratropium_bromide').
+atc_l3('r03', 'isoetarine').
+atc_l3('r03', 'isoprenaline').
+atc_l3('r03', 'isoprenaline_and_other_drugs_for_obstructive_airway_diseases').
+atc_l3('r03', 'isoprenaline_combinations').
+atc_l3('r03', 'mepolizumab').
+atc_l3('r03', 'mepyramine_theophyllinacetate').
+atc_l3('r03', 'methoxyphenamine').
+atc_l3('r03', 'mometasone').
+atc_l3('r03', 'montelukast').
+atc_l3('r03', 'montelukast_combinations').
+atc_l3('r03', 'nedocromil').
+atc_l3('r03', 'olodaterol').
+atc_l3('r03', 'olodaterol_and_tiotropium_bromide').
+atc_l3('r03', 'omalizumab').
+atc_l3('r03', 'orciprenaline').
+atc_l3('r03', 'orciprenaline_combinations').
+atc_l3('r03', 'oxitropium_bromide').
+atc_l3('r03', 'pirbuterol').
+atc_l3('r03', 'pranlukast').
+atc_l3('r03', 'procaterol').
+atc_l3('r03', 'proxyphylline').
+atc_l3('r03', 'proxyphylline_and_adrenergics').
+atc_l3('r03', 'reproterol').
+atc_l3('r03', 'reproterol_and_sodium_cromoglicate').
+atc_l3('r03', 'reslizumab').
+atc_l3('r03', 'revefenacin').
+atc_l3('r03', 'rimiterol').
+atc_l3('r03', 'roflumilast').
+atc_l3('r03', 'salbutamol').
+atc_l3('r03', 'salbutamol_and_beclometasone').
+atc_l3('r03', 'salbutamol_and_budesonide').
+atc_l3('r03', 'salbutamol_and_ipratropium_bromide').
+atc_l3('r03', 'salbutamol_and_sodium_cromoglicate').
+atc_l3('r03', 'salmeterol').
+atc_l3('r03', 'salmeterol_and_budesonide').
+atc_l3('r03', 'salmeterol_and_fluticasone').
+atc_l3('r03', 'seratrodast').
+atc_l3('r03', 'stramoni_preparations').
+atc_l3('r03', 'terbutaline').
+atc_l3('r03', 'terbutaline_combinations').
+atc_l3('r03', 'tezepelumab').
+atc_l3('r03', 'theobromine').
+atc_l3('r03', 'theobromine_combinations').
+atc_l3('r03', 'theophylline').
+atc_l3('r03', 'theophylline_and_adrenergics').
+atc_l3('r03', 'theophylline_combinations_excl_psycholeptics').
+atc_l3('r03', 'theophylline_combinations_with_psycholeptics').
+atc_l3('r03', 'tiotropium_bromide').
+atc_l3('r03', 'tiotropium_bromide_combinations').
+atc_l3('r03', 'tretoquinol').
+atc_l3('r03', 'triamcinolone').
+atc_l3('r03', 'tulobuterol').
+atc_l3('r03', 'umeclidinium_bromide').
+atc_l3('r03', 'vilanterol_and_fluticasone_furoate').
+atc_l3('r03', 'vilanterol_and_umeclidinium_bromide').
+atc_l3('r03', 'vilanterol_umeclidinium_bromide_and_fluticasone_furoate').
+atc_l3('r03', 'zafirlukast').
+atc_l3('r05', 'acetylcysteine').
+atc_l3('r05', 'acetyldihydrocodeine').
+atc_l3('r05', 'altheae_radix').
+atc_l3('r05', 'ambroxol').
+atc_l3('r05', 'antimony_pentasulfide').
+atc_l3('r05', 'benproperine').
+atc_l3('r05', 'benzonatate').
+atc_l3('r05', 'bibenzonium_bromide').
+atc_l3('r05', 'bromhexine').
+atc_l3('r05', 'butamirate').
+atc_l3('r05', 'carbocisteine').
+atc_l3('r05', 'cineole').
+atc_l3('r05', 'clobutinol').
+atc_l3('r05', 'clofedanol').
+atc_l3('r05', 'cloperastine').
+atc_l3('r05', 'codeine').
+atc_l3('r05', 'combinations').
+atc_l3('r05', 'cough_suppressants_and_expectorants').
+atc_l3('r05', 'cough_suppressants_and_mucolytics').
+atc_l3('r05', 'creosote').
+atc_l3('r05', 'dextromethorphan').
+atc_l3('r05', 'dibunate').
+atc_l3('r05', 'dimemorfan').
+atc_l3('r05', 'dimethoxanate').
+atc_l3('r05', 'domiodol').
+atc_l3('r05', 'dornase_alfa_desoxyribonuclease').
+atc_l3('r05', 'dropropizine').
+atc_l3('r05', 'droxypropine').
+atc_l3('r05', 'eprazinone').
+atc_l3('r05', 'erdosteine').
+atc_l3('r05', 'ethylmorphine').
+atc_l3('r05', 'fedrilate').
+atc_l3('r05', 'gefapixant').
+atc_l3('r05', 'guaiacolsulfonate').
+atc_l3('r05', 'guaifenesin').
+atc_l3('r05', 'hederae_helicis_folium').
+atc_l3('r05', 'hydrocodone').
+atc_l3('r05', 'ipecacuanha').
+atc_l3('r05', 'isoaminile').
+atc_l3('r05', 'letosteine').
+atc_l3('r05', 'levodropropizine').
+atc_l3('r05', 'levoverbenone').
+atc_l3('r05', 'mannitol').
+atc_l3('r05', 'meprotixol').
+atc_l3('r05', 'mesna').
+atc_l3('r05', 'morclofone').
+atc_l3('r05', 'neltenexine').
+atc_l3('r05', 'nepinalone').
+atc_l3('r05', 'normethadone').
+atc_l3('r05', 'noscapine').
+atc_l3('r05', 'opium_alkaloids_with_morphine').
+atc_l3('r05', 'opium_derivatives_and_expectorants').
+atc_l3('r05', 'opium_derivatives_and_mucolytics').
+atc_l3('r05', 'oxeladin').
+atc_l3('r05', 'oxolamine').
+atc_l3('r05', 'pentoxyverine').
+atc_l3('r05', 'pholcodine').
+atc_l3('r05', 'pipazetate').
+atc_l3('r05', 'piperidione').
+atc_l3('r05', 'potassium_iodide').
+atc_l3('r05', 'prenoxdiazine').
+atc_l3('r05', 'senega').
+atc_l3('r05', 'sobrerol').
+atc_l3('r05', 'stepronin').
+atc_l3('r05', 'thebacon').
+atc_l3('r05', 'tipepidine').
+atc_l3('r05', 'tyloxapol').
+atc_l3('r05', 'zipeprol').
+atc_l3('r06', 'acrivastine').
+atc_l3('r06', 'alimemazine').
+atc_l3('r06', 'antazoline').
+atc_l3('r06', 'astemizole').
+atc_l3('r06', 'azatadine').
+atc_l3('r06', 'azelastine').
+atc_l3('r06', 'bamipine').
+atc_l3('r06', 'bilastine').
+atc_l3('r06', 'bromazine').
+atc_l3('r06', 'brompheniramine').
+atc_l3('r06', 'brompheniramine_combinations').
+atc_l3('r06', 'buclizine').
+atc_l3('r06', 'buclizine_combinations').
+atc_l3('r06', 'carbinoxamine').
+atc_l3('r06', 'cetirizine').
+atc_l3('r06', 'chlorcyclizine').
+atc_l3('r06', 'chloropyramine').
+atc_l3('r06', 'chloropyramine_combinations').
+atc_l3('r06', 'chlorphenamine').
+atc_l3('r06', 'chlorphenamine_combinations').
+atc_l3('r06', 'chlorphenoxamine').
+atc_l3('r06', 'chlorphenoxamine_combinations').
+atc_l3('r06', 'clemastine').
+atc_l3('r06', 'clemastine_combinations').
+atc_l3('r06', 'cyclizine').
+atc_l3('r06', 'cyclizine_combinations').
+atc_l3('r06', 'cyproheptadine').
+atc_l3('r06', 'deptropine').
+atc_l3('r06', 'desloratadine').
+atc_l3('r06', 'dexbrompheniramine').
+atc_l3('r06', 'dexbrompheniramine_combinations').
+atc_l3('r06', 'dexchlorpheniramine').
+atc_l3('r06', 'dexchlorpheniramine_combinations').
+atc_l3('r06', 'dimenhydrinate').
+atc_l3('r06', 'dimenhydrinate_combinations').
+atc_l3('r06', 'dimetindene').
+atc_l3('r06', 'diphenhydramine').
+atc_l3('r06', 'diphenhydramine_combinations').
+atc_l3('r06', 'diphenylpyraline').
+atc_l3('r06', 'diphenylpyraline_combinations').
+atc_l3('r06', 'doxylamine').
+atc_l3('r06', 'doxylamine_combinations').
+atc_l3('r06', 'ebastine').
+atc_l3('r06', 'epinastine').
+atc_l3('r06', 'fexofenadine').
+atc_l3('r06', 'histapyrrodine').
+atc_l3('r06', 'histapyrrodine_combinations').
+atc_l3('r06', 'hydroxyethylpromethazine').
+atc_l3('r06', 'hydroxyethylpromethazine_combinations').
+atc_l3('r06', 'isothipendyl').
+atc_l3('r06', 'ketotifen').
+atc_l3('r06', 'levocetirizine').
+atc_l3('r06', 'loratadine').
+atc_l3('r06', 'mebhydrolin').
+atc_l3('r06', 'meclozine').
+atc_l3('r06', 'meclozine_combinations').
+atc_l3('r06', 'mepyramine').
+atc_l3('r06', 'mequitazine').
+atc_l3('r06', 'methapyrilene').
+atc_l3('r06', 'methdilazine').
+atc_l3('r06', 'mizolastine').
+atc_l3('r06', 'oxatomide').
+atc_l3('r06', 'oxomemazine').
+atc_l3('r06', 'phenindamine').
+atc_l3('r06', 'pheniramine').
+atc_l3('r06', 'pimethixene').
+atc_l3('r06', 'promethazine').
+atc_l3('r06', 'promethazine_combinations').
+atc_l3('r06', 'pyrrobutamine').
+atc_l3('r06', 'pyrrobutamine_combinations').
+atc_l3('r06', 'quifenadine').
+atc_l3('r06', 'rupatadine').
+atc_l3('r06', 'sequifenadine').
+atc_l3('r06', 'talastine').
+atc_l3('r06', 'terfenadine').
+atc_l3('r06', 'thenalidine').
+atc_l3('r06', 'thenalidine_combinations').
+atc_l3('r06', 'thiazinam').
+atc_l3('r06', 'thiethylperazine').
+atc_l3('r06', 'thonzylamine').
+atc_l3('r06', 'trimethobenzamide').
+atc_l3('r06', 'tripelennamine').
+atc_l3('r06', 'triprolidine').
+atc_l3('r06', 'tritoqualine').
+atc_l3('r07', 'almitrine').
+atc_l3('r07', 'bemegride').
+atc_l3('r07', 'colfosceril_palmitate').
+atc_l3('r07', 'combinations').
+atc_l3('r07', 'dimefline').
+atc_l3('r07', 'doxapram').
+atc_l3('r07', 'etamivan').
+atc_l3('r07', 'ivacaftor').
+atc_l3('r07', 'ivacaftor_and_lumacaftor').
+atc_l3('r07', 'ivacaftor_and_tezacaftor').
+atc_l3('r07', 'ivacaftor_tezacaftor_and_elexacaftor').
+atc_l3('r07', 'mepixanox').
+atc_l3('r07', 'natural_phospholipids').
+atc_l3('r07', 'nikethamide').
+atc_l3('r07', 'nikethamide_combinations').
+atc_l3('r07', 'nitric_oxide').
+atc_l3('r07', 'pentetrazol').
+atc_l3('r07', 'pentetrazol_combinations').
+atc_l3('r07', 'prethcamide').
+atc_l3('s01', 'abicipar_pegol').
+atc_l3('s01', 'aceclidine').
+atc_l3('s01', 'aceclidine_combinations').
+atc_l3('s01', 'acetazolamide').
+atc_l3('s01', 'acetylcholine').
+atc_l3('s01', 'acetylcysteine').
+atc_l3('s01', 'aciclovir').
+atc_l3('s01', 'aflibercept').
+atc_l3('s01', 'alcaftadine').
+atc_l3('s01', 'alclometasone').
+atc_l3('s01', 'alteplase').
+atc_l3('s01', 'alum').
+atc_l3('s01', 'amikacin').
+atc_l3('s01', 'ampicillin').
+atc_l3('s01', 'anecortave').
+atc_l3('s01', 'antibiotics_in_combination_with_other_drugs').
+atc_l3('s01', 'apraclonidine').
+atc_l3('s01', 'artificial_tears_and_other_indifferent_preparations').
+atc_l3('s01', 'ascorbic_acid').
+atc_l3('s01', 'atropine').
+atc_l3('s01', 'azelastine').
+atc_l3('s01', 'azidamfenicol').
+atc_l3('s01', 'azithromycin').
+atc_l3('s01', 'bacitracin').
+atc_l3('s01', 'befunolol').
+atc_l3('s01', 'bendazac').
+atc_l3('s01', 'benzylpenicillin').
+atc_l3('s01', 'besifloxacin').
+atc_l3('s01', 'betamethasone').
+atc_l3('s01', 'betamethasone_and_antiinfectives').
+atc_l3('s01', 'betamethasone_and_mydriatics').
+atc_l3('s01', 'betaxolol').
+atc_l3('s01', 'betaxolol_combinations').
+atc_l3('s01', 'bevacizumab').
+atc_l3('s01', 'bibrocathol').
+atc_l3('s01', 'bilastine').
+atc_l3('s01', 'bimatoprost').
+atc_l3('s01', 'brimonidine').
+atc_l3('s01', 'brinzolamide').
+atc_l3('s01', 'brinzolamide_combinations').
+atc_l3('s01', 'brolucizumab').
+atc_l3('s01', 'bromfenac').
+atc_l3('s01', 'carbachol').
+atc_l3('s01', 'carteolol').
+atc_l3('s01', 'carteolol_combinations').
+atc_l3('s01', 'cefmenoxime').
+atc_l3('s01', 'cefuroxime').
+atc_l3('s01', 'cenegermin').
+atc_l3('s01', 'cetirizine').
+atc_l3('s01', 'chloramphenicol').
+atc_l3('s01', 'chlorhexidine').
+atc_l3('s01', 'chloroprednisone_and_antiinfectives').
+atc_l3('s01', 'chloroprocaine').
+atc_l3('s01', 'chlortetracycline').
+atc_l3('s01', 'chymotrypsin').
+atc_l3('s01', 'ciclosporin').
+atc_l3('s01', 'cinchocaine').
+atc_l3('s01', 'ciprofloxacin').
+atc_l3('s01', 'clobetasone').
+atc_l3('s01', 'clobetasone_and_antiinfectives').
+atc_l3('s01', 'clonidine').
+atc_l3('s01', 'cocaine').
+atc_l3('s01', 'combinations').
+atc_l3('s01', 'combinations_of_different_antibiotics').
+atc_l3('s01', 'cortisone').
+atc_l3('s01', 'cromoglicic_acid').
+atc_l3('s01', 'cromoglicic_acid_combinations').
+atc_l3('s01', 'cyclopentolate').
+atc_l3('s01', 'cyclopentolate_combinations').
+atc_l3('s01', 'dapiprazole').
+atc_l3('s01', 'demecarium').
+atc_l3('s01', 'desonide').
+atc_l3('s01', 'dexamethasone').
+atc_l3('s01', 'dexamethasone_and_antiinfectives').
+atc_l3('s01', 'dexpanthenol').
+atc_l3('s01', 'dibekacin').
+atc_l3('s01', 'dibrompropamidine').
+atc_l3('s01', 'diclofenac').
+atc_l3('s01', 'diclofenac_and_antiinfectives').
+atc_l3('s01', 'diclofenamide').
+atc_l3('s01', 'difluprednate').
+atc_l3('s01', 'dihydrostreptomycin').
+atc_l3('s01', 'dipivefrine').
+atc_l3('s01', 'dorzolamide').
+atc_l3('s01', 'ecothiopate').
+atc_l3('s01', 'emedastine').
+atc_l3('s01', 'ephedrine').
+atc_l3('s01', 'epinastine').
+atc_l3('s01', 'epinephrine').
+atc_l3('s01', 'epinephrine_combinations').
+atc_l3('s01', 'erythromycin').
+atc_l3('s01', 'ethylmorphine').
+atc_l3('s01', 'famciclovir').
+atc_l3('s01', 'faricimab').
+atc_l3('s01', 'fludrocortisone_and_antiinfectives').
+atc_l3('s01', 'fluocinolone_acetonide').
+atc_l3('s01', 'fluocinolone_acetonide_and_antiinfectives').
+atc_l3('s01', 'fluocortolone_and_antiinfectives').
+atc_l3('s01', 'fluorescein').
+atc_l3('s01', 'fluorescein_combinations').
+atc_l3('s01', 'fluorometholone').
+atc_l3('s01', 'fluorometholone_and_antiinfectives').
+atc_l3('s01', 'fluorometholone_and_mydriatics').
+atc_l3('s01', 'fluostigmine').
+atc_l3('s01', 'flurbiprofen').
+atc_l3('s01', 'fomivirsen').
+atc_l3('s01', 'formocortal').
+atc_l3('s01', 'framycetin').
+atc_l3('s01', 'fusidic_acid').
+atc_l3('s01', 'ganciclovir').
+atc_l3('s01', 'gatifloxacin').
+atc_l3('s01', 'gentamicin').
+atc_l3('s01', 'guaiazulen').
+atc_l3('s01', 'guanethidine').
+atc_l3('s01', 'heparin').
+atc_l3('s01', 'hexamidine').
+atc_l3('s01', 'homatropine').
+atc_l3('s01', 'hyaluronic_acid').
+atc_l3('s01', 'hyaluronic_acid_combinations').
+atc_l3('s01', 'hydrocortisone').
+atc_l3('s01', 'hydrocortisone_and_antiinfectives').
+atc_l3('s01', 'hydrocortisone_and_mydriatics').
+atc_l3('s01', 'hypromellose').
+atc_l3('s01', 'ibopamine').
+atc_l3('s01', 'idoxuridine').
+atc_l3('s01', 'indometacin').
+atc_l3('s01', 'indometacin_and_antiinfectives').
+atc_l3('s01', 'inosine').
+atc_l3('s01', 'interferon').
+atc_l3('s01', 'iodoheparinate').
+atc_l3('s01', 'kanamycin').
+atc_l3('s01', 'ketorolac').
+atc_l3('s01', 'ketotifen').
+atc_l3('s01', 'latanoprost').
+atc_l3('s01', 'latanoprost_and_netarsudil').
+atc_l3('s01', 'latanoprostene_bunod').
+atc_l3('s01', 'levobunolol').
+atc_l3('s01', 'levocabastine').
+atc_l3('s01', 'levofloxacin').
+atc_l3('s01', 'lidocaine').
+atc_l3('s01', 'lifitegrast').
+atc_l3('s01', 'limbal_stem_cells_autologous').
+atc_l3('s01', 'lodoxamide').
+atc_l3('s01', 'lomefloxacin').
+atc_l3('s01', 'loteprednol').
+atc_l3('s01', 'loteprednol_and_antiinfectives').
+atc_l3('s01', 'medrysone').
+atc_l3('s01', 'mercaptamine').
+atc_l3('s01', 'mercury_compounds').
+atc_l3('s01', 'methazolamide').
+atc_l3('s01', 'methylprednisolone_and_antiinfectives').
+atc_l3('s01', 'methylscopolamine').
+atc_l3('s01', 'metipranolol').
+atc_l3('s01', 'metipranolol_combinations').
+atc_l3('s01', 'micronomicin').
+atc_l3('s01', 'moxifloxacin').
+atc_l3('s01', 'nandrolone').
+atc_l3('s01', 'naphazoline').
+atc_l3('s01', 'naphazoline_combinations').
+atc_l3('s01', 'natamycin').
+atc_l3('s01', 'nedocromil').
+atc_l3('s01', 'neomycin').
+atc_l3('s01', 'neostigmine').
+atc_l3('s01', 'nepafenac').
+atc_l3('s01', 'netarsudil').
+atc_l3('s01', 'netilmicin').
+atc_l3('s01', 'nitrofural').
+atc_l3('s01', 'norfloxacin').
+atc_l3('s01', 'ocriplasmin').
+atc_l3('s01', 'ofloxacin').
+atc_l3('s01', 'olopatadine').
+atc_l3('s01', 'omidenepag').
+atc_l3('s01', 'oxedrine').
+atc_l3('s01', 'oxedrine_combinations').
+atc_l3('s01', 'oxybuprocaine').
+atc_l3('s01', 'oxymetazoline').
+atc_l3('s01', 'oxyphenbutazone').
+atc_l3('s01', 'oxytetracycline').
+atc_l3('s01', 'paraoxon').
+atc_l3('s01', 'pegaptanib').
+atc_l3('s01', 'pegcetacoplan').
+atc_l3('s01', 'phenylephrine').
+atc_l3('s01', 'phenylephrine_and_ketorolac').
+atc_l3('s01', 'phenylephrine_combinations').
+atc_l3('s01', 'physostigmine').
+atc_l3('s01', 'picloxydine').
+atc_l3('s01', 'pilocarpine').
+atc_l3('s01', 'pilocarpine_combinations').
+atc_l3('s01', 'piroxicam').
+atc_l3('s01', 'polihexanide').
+atc_l3('s01', 'polymyxin_b').
+atc_l3('s01', 'potassium_iodide').
+atc_l3('s01', 'povidone_iodine').
+atc_l3('s01', 'pranoprofen').
+atc_l3('s01', 'prednisolone').
+atc_l3('s01', 'prednisolone_and_antiinfectives').
+atc_l3('s01', 'prednisolone_and_mydriatics').
+atc_l3('s01', 'procaine').
+atc_l3('s01', 'propamidine').
+atc_l3('s01', 'proxymetacaine').
+atc_l3('s01', 'ranibizumab').
+atc_l3('s01', 'resorcinol').
+atc_l3('s01', 'retinol').
+atc_l3('s01', 'riboflavin').
+atc_l3('s01', 'rifamycin').
+atc_l3('s01', 'rimexolone').
+atc_l3('s01', 'ripasudil').
+atc_l3('s01', 'rose_bengal_sodium').
+atc_l3('s01', 'salicylic_acid').
+atc_l3('s01', 'scopolamine').
+atc_l3('s01', 'sepofarsen').
+atc_l3('s01', 'silver_compounds').
+atc_l3('s01', 'sirolimus').
+atc_l3('s01', 'sodium_borate').
+atc_l3('s01', 'sodium_chloride_hypertonic').
+atc_l3('s01', 'sodium_edetate').
+atc_l3('s01', 'sodium_propionate').
+atc_l3('s01', 'spaglumic_acid').
+atc_l3('s01', 'sulfacetamide').
+atc_l3('s01', 'sulfadicramide').
+atc_l3('s01', 'sulfafenazol').
+atc_l3('s01', 'sulfafurazole').
+atc_l3('s01', 'sulfamethizole').
+atc_l3('s01', 'tafluprost').
+atc_l3('s01', 'tetracaine').
+atc_l3('s01', 'tetracycline').
+atc_l3('s01', 'tetryzoline').
+atc_l3('s01', 'tetryzoline_combinations').
+atc_l3('s01', 'timolol').
+atc_l3('s01', 'timolol_combinations').
+atc_l3('s01', 'tobramycin').
+atc_l3('s01', 'tosufloxacin').
+atc_l3('s01', 'travoprost').
+atc_l3('s01', 'triamcinolone').
+atc_l3('s01', 'trifluridine').
+atc_l3('s01', 'tropicamide').
+atc_l3('s01', 'tropicamide_combinations').
+atc_l3('s01', 'trypan_blue').
+atc_l3('s01', 'tyrothricin').
+atc_l3('s01', 'unoprostone').
+atc_l3('s01', 'vancomycin').
+atc_l3('s01', 'varenicline').
+atc_l3('s01', 'verteporfin').
+atc_l3('s01', 'vidarabine').
+atc_l3('s01', 'voretigene_neparvovec').
+atc_l3('s01', 'xylometazoline').
+atc_l3('s01', 'xylometazoline_combinations').
+atc_l3('s01', 'zinc_compounds').
+atc_l3('s02', 'acetic_acid').
+atc_l3('s02', 'aluminium_acetotartrate').
+atc_l3('s02', 'antiinfectives_combinations').
+atc_l3('s02', 'betamethasone').
+atc_l3('s02', 'boric_acid').
+atc_l3('s02', 'cefmenoxime').
+atc_l3('s02', 'chloramphenicol').
+atc_l3('s02', 'chlorhexidine').
+atc_l3('s02', 'cinchocaine').
+atc_l3('s02', 'ciprofloxacin').
+atc_l3('s02', 'clioquinol').
+atc_l3('s02', 'cocaine').
+atc_l3('s02', 'combinations').
+atc_l3('s02', 'dexamethasone').
+atc_l3('s02', 'dexamethasone_and_antiinfectives').
+atc_l3('s02', 'fludrocortisone_and_antiinfectives').
+atc_l3('s02', 'flumetasone_and_antiinfectives').
+atc_l3('s02', 'fluocinolone_acetonide').
+atc_l3('s02', 'fluocinolone_acetonide_and_antiinfectives').
+atc_l3('s02', 'fosfomycin').
+atc_l3('s02', 'gentamicin').
+atc_l3('s02', 'hydrocortisone').
+atc_l3('s02', 'hydrocortisone_and_antiinfectives').
+atc_l3('s02', 'hydrogen_peroxide').
+atc_l3('s02', 'lidocaine').
+atc_l3('s02', 'miconazole').
+atc_l3('s02', 'neomycin').
+atc_l3('s02', 'nitrofural').
+atc_l3('s02', 'ofloxacin').
+atc_l3('s02', 'phenazone').
+atc_l3('s02', 'polymyxin_b').
+atc_l3('s02', 'prednisolone').
+atc_l3('s02', 'prednisolone_and_antiinfectives').
+atc_l3('s02', 'rifamycin').
+atc_l3('s02', 'tetracycline').
+atc_l3('s02', 'triamcinolone_and_antiinfectives').
+atc_l3('s03', 'antiinfectives_combinations').
+atc_l3('s03', 'betamethasone').
+atc_l3('s03', 'betamethasone_and_antiinfectives').
+atc_l3('s03', 'chloramphenicol').
+atc_l3('s03', 'chlorhexidine').
+atc_l3('s03', 'ciprofloxacin').
+atc_l3('s03', 'dexamethasone').
+atc_l3('s03', 'dexamethasone_and_antiinfectives').
+atc_l3('s03', 'fludrocortisone_and_antiinfectives').
+atc_l3('s03', 'gentamicin').
+atc_l3('s03', 'hexamidine').
+atc_l3('s03', 'hydrocortisone_and_antiinfectives').
+atc_l3('s03', 'methylprednisolone_and_antiinfectives').
+atc_l3('s03', 'neomycin').
+atc_l3('s03', 'polymyxin_b').
+atc_l3('s03', 'prednisolone').
+atc_l3('s03', 'prednisolone_and_antiinfectives').
+atc_l3('s03', 'tetracycline').
+atc_l3('v01', 'animals').
+atc_l3('v01', 'feather').
+atc_l3('v01', 'flowers').
+atc_l3('v01', 'food').
+atc_l3('v01', 'grass_pollen').
+atc_l3('v01', 'house_dust_mites').
+atc_l3('v01', 'insects').
+atc_l3('v01', 'mould_fungus_and_yeast_fungus').
+atc_l3('v01', 'textiles').
+atc_l3('v01', 'tree_pollen').
+atc_l3('v01', 'various').
+atc_l3('v03', 'acetylcysteine').
+atc_l3('v03', 'amifostine').
+atc_l3('v03', 'amyl_nitrite').
+atc_l3('v03', 'andexanet_alfa').
+atc_l3('v03', 'arginine_and_lysine').
+atc_l3('v03', 'calcium_acetate').
+atc_l3('v03', 'calcium_acetate_and_magnesium_carbonate').
+atc_l3('v03', 'calcium_folinate').
+atc_l3('v03', 'calcium_levofolinate').
+atc_l3('v03', 'carbon_dioxide').
+atc_l3('v03', 'cholinesterase').
+atc_l3('v03', 'cobicistat').
+atc_l3('v03', 'colestilan').
+atc_l3('v03', 'copper_sulfate').
+atc_l3('v03', 'deferasirox').
+atc_l3('v03', 'deferiprone').
+atc_l3('v03', 'deferoxamine').
+atc_l3('v03', 'dexrazoxane').
+atc_l3('v03', 'diazoxide').
+atc_l3('v03', 'difelikefalin').
+atc_l3('v03', 'digitalis_antitoxin').
+atc_l3('v03', 'dimercaprol').
+atc_l3('v03', 'edetates').
+atc_l3('v03', 'ethanol').
+atc_l3('v03', 'ferric_citrate').
+atc_l3('v03', 'flumazenil').
+atc_l3('v03', 'fomepizole').
+atc_l3('v03', 'glucarpidase').
+atc_l3('v03', 'glutathione').
+atc_l3('v03', 'helium').
+atc_l3('v03', 'hydroxocobalamin').
+atc_l3('v03', 'idarucizumab').
+atc_l3('v03', 'ipecacuanha').
+atc_l3('v03', 'lanthanum_carbonate').
+atc_l3('v03', 'medical_air').
+atc_l3('v03', 'mesna').
+atc_l3('v03', 'methionine').
+atc_l3('v03', 'methylthioninium_chloride').
+atc_l3('v03', 'n_4_dimethylaminophenol').
+atc_l3('v03', 'nalfurafine').
+atc_l3('v03', 'nalorphine').
+atc_l3('v03', 'naloxone').
+atc_l3('v03', 'nitrogen').
+atc_l3('v03', 'obidoxime').
+atc_l3('v03', 'oxygen').
+atc_l3('v03', 'palifermin').
+atc_l3('v03', 'patiromer_calcium').
+atc_l3('v03', 'phentolamine').
+atc_l3('v03', 'physostigmine').
+atc_l3('v03', 'polystyrene_sulfonate').
+atc_l3('v03', 'potassium_iodide').
+atc_l3('v03', 'potassium_permanganate').
+atc_l3('v03', 'pralidoxime').
+atc_l3('v03', 'pralidoxime_and_atropine').
+atc_l3('v03', 'prednisolone_and_promethazine').
+atc_l3('v03', 'protamine').
+atc_l3('v03', 'prussian_blue').
+atc_l3('v03', 'rasburicase').
+atc_l3('v03', 'sevelamer').
+atc_l3('v03', 'sodium_cellulose_phosphate').
+atc_l3('v03', 'sodium_folinate').
+atc_l3('v03', 'sodium_levofolinate').
+atc_l3('v03', 'sodium_nitrite').
+atc_l3('v03', 'sodium_phosphate').
+atc_l3('v03', 'sodium_zirconium_cyclosilicate').
+atc_l3('v03', 'sucroferric_oxyhydroxide').
+atc_l3('v03', 'sugammadex').
+atc_l3('v03', 'thiosulfate').
+atc_l3('v03', 'trilaciclib').
+atc_l3('v04', 'alsactide').
+atc_l3('v04', 'aminohippuric_acid').
+atc_l3('v04', 'bentiromide').
+atc_l3('v04', 'betazole').
+atc_l3('v04', 'caffeine_and_sodium_benzoate').
+atc_l3('v04', 'carbon_monoxide').
+atc_l3('v04', 'cation_exchange_resins').
+atc_l3('v04', 'ceruletide').
+atc_l3('v04', 'corticorelin').
+atc_l3('v04', 'edrophonium').
+atc_l3('v04', 'folic_acid').
+atc_l3('v04', 'galactose').
+atc_l3('v04', 'glucose').
+atc_l3('v04', 'gonadorelin').
+atc_l3('v04', 'hexaminolevulinate').
+atc_l3('v04', 'histamine_phosphate').
+atc_l3('v04', 'indigo_carmine').
+atc_l3('v04', 'indocyanine_green').
+atc_l3('v04', 'inulin_and_other_polyfructosans').
+atc_l3('v04', 'lithium_chloride').
+atc_l3('v04', 'macimorelin').
+atc_l3('v04', 'magnesium_sulfate').
+atc_l3('v04', 'mannitol').
+atc_l3('v04', 'methacetin_13c').
+atc_l3('v04', 'methacholine').
+atc_l3('v04', 'methylthioninium_chloride').
+atc_l3('v04', 'metyrapone').
+atc_l3('v04', 'n_13c_urea').
+atc_l3('v04', 'pafolacianine').
+atc_l3('v04', 'pancreozymin_cholecystokinin').
+atc_l3('v04', 'patent_blue').
+atc_l3('v04', 'pentagastrin').
+atc_l3('v04', 'phenolsulfonphthalein').
+atc_l3('v04', 'protirelin').
+atc_l3('v04', 'secretin').
+atc_l3('v04', 'sermorelin').
+atc_l3('v04', 'sincalide').
+atc_l3('v04', 'somatorelin').
+atc_l3('v04', 'sorbitol').
+atc_l3('v04', 'sulfobromophthalein').
+atc_l3('v04', 'thyrotropin').
+atc_l3('v04', 'tolbutamide').
+atc_l3('v04', 'tuberculin').
+atc_l3('v04', 'vitamin_a_concentrates').
+atc_l3('v06', 'fructose').
+atc_l3('v06', 'glucose').
+atc_l3('v08', 'acetrizoic_acid').
+atc_l3('v08', 'adipiodone').
+atc_l3('v08', 'barium_sulfate_with_suspending_agents').
+atc_l3('v08', 'barium_sulfate_without_suspending_agents').
+atc_l3('v08', 'calcium_iopodate').
+atc_l3('v08', 'diatrizoic_acid').
+atc_l3('v08', 'diodone').
+atc_l3('v08', 'ethyl_esters_of_iodised_fatty_acids').
+atc_l3('v08', 'ferric_ammonium_citrate').
+atc_l3('v08', 'ferristene').
+atc_l3('v08', 'ferumoxsil').
+atc_l3('v08', 'gadobenic_acid').
+atc_l3('v08', 'gadobutrol').
+atc_l3('v08', 'gadodiamide').
+atc_l3('v08', 'gadofosveset').
+atc_l3('v08', 'gadopentetic_acid').
+atc_l3('v08', 'gadopiclenol').
+atc_l3('v08', 'gadoteric_acid').
+atc_l3('v08', 'gadoteridol').
+atc_l3('v08', 'gadoversetamide').
+atc_l3('v08', 'gadoxetic_acid').
+atc_l3('v08', 'iobenzamic_acid').
+atc_l3('v08', 'iobitridol').
+atc_l3('v08', 'iocarmic_acid').
+atc_l3('v08', 'iocetamic_acid').
+atc_l3('v08', 'iodamide').
+atc_l3('v08', 'iodixanol').
+atc_l3('v08', 'iodoxamic_acid').
+atc_l3('v08', 'iofendylate').
+atc_l3('v08', 'ioglicic_acid').
+atc_l3('v08', 'ioglycamic_acid').
+atc_l3('v08', 'iohexol').
+atc_l3('v08', 'iomeprol').
+atc_l3('v08', 'iopamidol').
+atc_l3('v08', 'iopanoic_acid').
+atc_l3('v08', 'iopentol').
+atc_l3('v08', 'iopromide').
+atc_l3('v08', 'iopydol').
+atc_l3('v08', 'iotalamic_acid').
+atc_l3('v08', 'iotrolan').
+atc_l3('v08', 'iotroxic_acid').
+atc_l3('v08', 'ioversol').
+atc_l3('v08', 'ioxaglic_acid').
+atc_l3('v08', 'ioxilan').
+atc_l3('v08', 'ioxitalamic_acid').
+atc_l3('v08', 'iron_oxide_nanoparticles').
+atc_l3('v08', 'mangafodipir').
+atc_l3('v08', 'methiodal').
+atc_l3('v08', 'metrizamide').
+atc_l3('v08', 'metrizoic_acid').
+atc_l3('v08', 'microparticles_of_galactose').
+atc_l3('v08', 'perflenapent').
+atc_l3('v08', 'perflubron').
+atc_l3('v08', 'perflubutane_phospholipid_microspheres').
+atc_l3('v08', 'perflutren_human_albumin_microspheres').
+atc_l3('v08', 'perflutren_phospholipid_microspheres').
+atc_l3('v08', 'propyliodone').
+atc_l3('v08', 'sodium_iopodate').
+atc_l3('v08', 'sulfur_hexafluoride_phospholipid_microspheres').
+atc_l3('v08', 'tyropanoic_acid').
+atc_l3('v09', 'ammonia_13n').
+atc_l3('v09', 'chromium_51cr_chromate_labelled_cells').
+atc_l3('v09', 'chromium_51cr_edetate').
+atc_l3('v09', 'cobalt_57co_cyanocobalamine').
+atc_l3('v09', 'cobalt_58co_cyanocobalamine').
+atc_l3('v09', 'copper_64cu_dotatate').
+atc_l3('v09', 'ferric_59fe_citrate').
+atc_l3('v09', 'fibrinogen_125i').
+atc_l3('v09', 'florbetaben_18f').
+atc_l3('v09', 'florbetapir_18f').
+atc_l3('v09', 'flortaucipir_18f').
+atc_l3('v09', 'fluciclovine_18f').
+atc_l3('v09', 'fludeoxyglucose_18f').
+atc_l3('v09', 'fluorocholine_18f').
+atc_l3('v09', 'fluorodopa_18f').
+atc_l3('v09', 'fluoroestradiol_18f').
+atc_l3('v09', 'fluoroethyl_l_tyrosine_18f').
+atc_l3('v09', 'fluoroethylcholine_18f').
+atc_l3('v09', 'flutemetamol_18f').
+atc_l3('v09', 'gallium_67ga_citrate').
+atc_l3('v09', 'gallium_68ga_edotreotide').
+atc_l3('v09', 'gallium_68ga_gozetotide').
+atc_l3('v09', 'indium_111in_antiovariumcarcinoma_antibody').
+atc_l3('v09', 'indium_111in_capromab_pendetide').
+atc_l3('v09', 'indium_111in_imciromab').
+atc_l3('v09', 'indium_111in_oxinate_labelled_cells').
+atc_l3('v09', 'indium_111in_pentetic_acid').
+atc_l3('v09', 'indium_111in_pentetreotide').
+atc_l3('v09', 'indium_111in_satumomab_pendetide').
+atc_l3('v09', 'indium_111in_tropolonate_labelled_cells').
+atc_l3('v09', 'iobenguane_123i').
+atc_l3('v09', 'iobenguane_131i').
+atc_l3('v09', 'iodine_124i_2beta_carbomethoxy_3beta_4_iodophenyl_tropane').
+atc_l3('v09', 'iodine_125i_cc49_monoclonal_antibody').
+atc_l3('v09', 'iodine_125i_human_albumin').
+atc_l3('v09', 'iodine_131i_human_albumin').
+atc_l3('v09', 'iodine_131i_norcholesterol').
+atc_l3('v09', 'iodine_iofetamine_123i').
+atc_l3('v09', 'iodine_ioflupane_123i').
+atc_l3('v09', 'iodine_iolopride_123i').
+atc_l3('v09', 'iodocholesterol_131i').
+atc_l3('v09', 'krypton_81mkr_gas').
+atc_l3('v09', 'methionine_11c').
+atc_l3('v09', 'piflufolastat_18f').
+atc_l3('v09', 'psma_1007_18f').
+atc_l3('v09', 'rubidium_82rb_chloride').
+atc_l3('v09', 'selenium_75se_norcholesterol').
+atc_l3('v09', 'selenium_75se_tauroselcholic_acid').
+atc_l3('v09', 'sodium_fluoride_18f').
+atc_l3('v09', 'sodium_iodide_123i').
+atc_l3('v09', 'sodium_iodide_124i').
+atc_l3('v09', 'sodium_iodide_131i').
+atc_l3('v09', 'sodium_iodohippurate_123i').
+atc_l3('v09', 'sodium_iodohippurate_131i').
+atc_l3('v09', 'sodium_iothalamate_125i').
+atc_l3('v09', 'technetium_99mtc_anticarcinoembryonicantigen_antibody').
+atc_l3('v09', 'technetium_99mtc_antigranulocyte_antibody').
+atc_l3('v09', 'technetium_99mtc_antimelanoma_antibody').
+atc_l3('v09', 'technetium_99mtc_apcitide').
+atc_l3('v09', 'technetium_99mtc_arcitumomab').
+atc_l3('v09', 'technetium_99mtc_bicisate').
+atc_l3('v09', 'technetium_99mtc_butedronic_acid').
+atc_l3('v09', 'technetium_99mtc_depreotide').
+atc_l3('v09', 'technetium_99mtc_disofenin').
+atc_l3('v09', 'technetium_99mtc_etarfolatide').
+atc_l3('v09', 'technetium_99mtc_ethylenedicysteine').
+atc_l3('v09', 'technetium_99mtc_etifenin').
+atc_l3('v09', 'technetium_99mtc_exametazime').
+atc_l3('v09', 'technetium_99mtc_exametazime_labelled_cells').
+atc_l3('v09', 'technetium_99mtc_furifosmin').
+atc_l3('v09', 'technetium_99mtc_galtifenin').
+atc_l3('v09', 'technetium_99mtc_gluceptate').
+atc_l3('v09', 'technetium_99mtc_gluconate').
+atc_l3('v09', 'technetium_99mtc_human_albumin').
+atc_l3('v09', 'technetium_99mtc_human_immunoglobulin').
+atc_l3('v09', 'technetium_99mtc_hynic_octreotide').
+atc_l3('v09', 'technetium_99mtc_lidofenin').
+atc_l3('v09', 'technetium_99mtc_macrosalb').
+atc_l3('v09', 'technetium_99mtc_mebrofenin').
+atc_l3('v09', 'technetium_99mtc_medronic_acid').
+atc_l3('v09', 'technetium_99mtc_mertiatide').
+atc_l3('v09', 'technetium_99mtc_microcolloid').
+atc_l3('v09', 'technetium_99mtc_microspheres').
+atc_l3('v09', 'technetium_99mtc_millimicrospheres').
+atc_l3('v09', 'technetium_99mtc_nanocolloid').
+atc_l3('v09', 'technetium_99mtc_oxidronic_acid').
+atc_l3('v09', 'technetium_99mtc_pentavalent_succimer').
+atc_l3('v09', 'technetium_99mtc_pentetic_acid').
+atc_l3('v09', 'technetium_99mtc_pertechnetate').
+atc_l3('v09', 'technetium_99mtc_phytate').
+atc_l3('v09', 'technetium_99mtc_pyrophosphate').
+atc_l3('v09', 'technetium_99mtc_rheniumsulfide_colloid').
+atc_l3('v09', 'technetium_99mtc_sestamibi').
+atc_l3('v09', 'technetium_99mtc_stannous_agent_labelled_cells').
+atc_l3('v09', 'technetium_99mtc_succimer').
+atc_l3('v09', 'technetium_99mtc_sulesomab').
+atc_l3('v09', 'technetium_99mtc_sulfur_colloid').
+atc_l3('v09', 'technetium_99mtc_teboroxime').
+atc_l3('v09', 'technetium_99mtc_technegas').
+atc_l3('v09', 'technetium_99mtc_tetrofosmin').
+atc_l3('v09', 'technetium_99mtc_tilmanocept').
+atc_l3('v09', 'technetium_99mtc_tin_colloid').
+atc_l3('v09', 'technetium_99mtc_trofolastat_chloride').
+atc_l3('v09', 'technetium_99mtc_votumumab').
+atc_l3('v09', 'thallium_201tl_chloride').
+atc_l3('v09', 'xenon_127xe_gas').
+atc_l3('v09', 'xenon_133xe_gas').
+atc_l3('v10', 'dysprosium_165dy_colloid').
+atc_l3('v10', 'erbium_169er_citrate_colloid').
+atc_l3('v10', 'gold_198au_colloidal').
+atc_l3('v10', 'ibritumomab_tiuxetan_90y').
+atc_l3('v10', 'iobenguane_131i').
+atc_l3('v10', 'iodine_131i_omburtamab').
+atc_l3('v10', 'lutetium_177lu_oxodotreotide').
+atc_l3('v10', 'lutetium_177lu_vipivotide_tetraxetan').
+atc_l3('v10', 'phosphorous_32p_chromicphosphate_colloid').
+atc_l3('v10', 'radium_223ra_dichloride').
+atc_l3('v10', 'rhenium_186re_etidronic_acid').
+atc_l3('v10', 'rhenium_186re_sulfide_colloid').
+atc_l3('v10', 'samarium_153sm_hydroxyapatite_colloid').
+atc_l3('v10', 'samarium_153sm_lexidronam').
+atc_l3('v10', 'sodium_iodide_131i').
+atc_l3('v10', 'sodium_phosphate_32p').
+atc_l3('v10', 'strontium_89sr_chloride').
+atc_l3('v10', 'tositumomab_iodine_131i_tositumomab').
+atc_l3('v10', 'yttrium_90y_citrate_colloid').
+atc_l3('v10', 'yttrium_90y_ferrihydroxide_colloid').
+atc_l3('v10', 'yttrium_90y_silicate_colloid').
+atc_l4('a01a', 'acetylsalicylic_acid').
+atc_l4('a01a', 'adrenalone').
+atc_l4('a01a', 'amlexanox').
+atc_l4('a01a', 'amphotericin_b').
+atc_l4('a01a', 'becaplermin').
+atc_l4('a01a', 'benzoxonium_chloride').
+atc_l4('a01a', 'benzydamine').
+atc_l4('a01a', 'chlorhexidine').
+atc_l4('a01a', 'chlorhexidine_and_cetylpyridinium').
+atc_l4('a01a', 'chlortetracycline').
+atc_l4('a01a', 'clotrimazole').
+atc_l4('a01a', 'combinations').
+atc_l4('a01a', 'dexamethasone').
+atc_l4('a01a', 'domiphen').
+atc_l4('a01a', 'doxycycline').
+atc_l4('a01a', 'epinephrine').
+atc_l4('a01a', 'hexetidine').
+atc_l4('a01a', 'hydrocortisone').
+atc_l4('a01a', 'hydrogen_peroxide').
+atc_l4('a01a', 'mepartricin').
+atc_l4('a01a', 'metronidazole').
+atc_l4('a01a', 'miconazole').
+atc_l4('a01a', 'minocycline').
+atc_l4('a01a', 'natamycin').
+atc_l4('a01a', 'neomycin').
+atc_l4('a01a', 'octenidine').
+atc_l4('a01a', 'olaflur').
+atc_l4('a01a', 'oxyquinoline').
+atc_l4('a01a', 'oxytetracycline').
+atc_l4('a01a', 'polynoxylin').
+atc_l4('a01a', 'prednisolone').
+atc_l4('a01a', 'prednisolone_combinations').
+atc_l4('a01a', 'sodium_fluoride').
+atc_l4('a01a', 'sodium_fluoride_combinations').
+atc_l4('a01a', 'sodium_monofluorophosphate').
+atc_l4('a01a', 'sodium_perborate').
+atc_l4('a01a', 'stannous_fluoride').
+atc_l4('a01a', 'tetracycline').
+atc_l4('a01a', 'tibezonium_iodide').
+atc_l4('a01a', 'triamcinolone').
+atc_l4('a01a', 'various').
+atc_l4('a02a', 'algeldrate').
+atc_l4('a02a', 'almagate').
+atc_l4('a02a', 'almasilate').
+atc_l4('a02a', 'aloglutamol').
+atc_l4('a02a', 'aluminium_acetoacetate').
+atc_l4('a02a', 'aluminium_glycinate').
+atc_l4('a02a', 'aluminium_hydroxide').
+atc_l4('a02a', 'aluminium_phosphate').
+atc_l4('a02a', 'calcium_carbonate').
+atc_l4('a02a', 'calcium_silicate').
+atc_l4('a02a', 'combinations').
+atc_l4('a02a', 'dihydroxialumini_sodium_carbonate').
+atc_l4('a02a', 'hydrotalcite').
+atc_l4('a02a', 'magaldrate').
+atc_l4('a02a', 'magaldrate_and_antiflatulents').
+atc_l4('a02a', 'magnesium_carbonate').
+atc_l4('a02a', 'magnesium_hydroxide').
+atc_l4('a02a', 'magnesium_oxide').
+atc_l4('a02a', 'magnesium_peroxide').
+atc_l4('a02a', 'magnesium_silicate').
+atc_l4('a02a', 'ordinary_salt_combinations').
+atc_l4('a02a', 'ordinary_salt_combinations_and_antiflatulents').
+atc_l4('a02b', 'acetoxolone').
+atc_l4('a02b', 'alginic_acid').
+atc_l4('a02b', 'bismuth_subcitrate').
+atc_l4('a02b', 'bismuth_subcitrate_tetracycline_and_metronidazole').
+atc_l4('a02b', 'bismuth_subnitrate').
+atc_l4('a02b', 'carbenoxolone').
+atc_l4('a02b', 'carbenoxolone_combinations_excl_psycholeptics').
+atc_l4('a02b', 'carbenoxolone_combinations_with_psycholeptics').
+atc_l4('a02b', 'cimetidine').
+atc_l4('a02b', 'cimetidine_combinations').
+atc_l4('a02b', 'dexlansoprazole').
+atc_l4('a02b', 'dexrabeprazole').
+atc_l4('a02b', 'enprostil').
+atc_l4('a02b', 'esomeprazole').
+atc_l4('a02b', 'esomeprazole_amoxicillin_and_clarithromycin').
+atc_l4('a02b', 'famotidine').
+atc_l4('a02b', 'famotidine_combinations').
+atc_l4('a02b', 'gefarnate').
+atc_l4('a02b', 'gefarnate_combinations_with_psycholeptics').
+atc_l4('a02b', 'irsogladine').
+atc_l4('a02b', 'lafutidine').
+atc_l4('a02b', 'lansoprazole').
+atc_l4('a02b', 'lansoprazole_amoxicillin_and_clarithromycin').
+atc_l4('a02b', 'lansoprazole_amoxicillin_and_levofloxacin').
+atc_l4('a02b', 'lansoprazole_amoxicillin_and_metronidazole').
+atc_l4('a02b', 'lansoprazole_clarithromycin_and_tinidazole').
+atc_l4('a02b', 'lansoprazole_combinations').
+atc_l4('a02b', 'lansoprazole_tetracycline_and_metronidazole').
+atc_l4('a02b', 'methiosulfonium_chloride').
+atc_l4('a02b', 'misoprostol').
+atc_l4('a02b', 'niperotidine').
+atc_l4('a02b', 'nizatidine').
+atc_l4('a02b', 'omeprazole').
+atc_l4('a02b', 'omeprazole_amoxicillin_and_clarithromycin').
+atc_l4('a02b', 'omeprazole_amoxicillin_and_metronidazole').
+atc_l4('a02b', 'omeprazole_amoxicillin_and_rifabutin').
+atc_l4('a02b', 'omeprazole_combinations').
+atc_l4('a02b', 'pantoprazole').
+atc_l4('a02b', 'pantoprazole_amoxicillin_and_clarithromycin').
+atc_l4('a02b', 'pantoprazole_amoxicillin_clarithromycin_and_metronidazole').
+atc_l4('a02b', 'pirenzepine').
+atc_l4('a02b', 'proglumide').
+atc_l4('a02b', 'rabeprazole').
+atc_l4('a02b', 'rabeprazole_amoxicillin_and_clarithromycin').
+atc_l4('a02b', 'rabeprazole_amoxicillin_and_metronidazole').
+atc_l4('a02b', 'rabeprazole_combinations').
+atc_l4('a02b', 'ranitidine').
+atc_l4('a02b', 'ranitidine_bismuth_citrate').
+atc_l4('a02b', 'rebamipide').
+atc_l4('a02b', 'roxatidine').
+atc_l4('a02b', 'sucralfate').
+atc_l4('a02b', 'sulglicotide').
+atc_l4('a02b', 'tegoprazan').
+atc_l4('a02b', 'teprenone').
+atc_l4('a02b', 'troxipide').
+atc_l4('a02b', 'vonoprazan').
+atc_l4('a02b', 'vonoprazan_amoxicillin_and_clarithromycin').
+atc_l4('a02b', 'vonoprazan_amoxicillin_and_metronidazole').
+atc_l4('a02b', 'vonoprazan_and_amoxicillin').
+atc_l4('a02b', 'zolimidine').
+atc_l4('a03a', 'alosetron').
+atc_l4('a03a', 'alverine').
+atc_l4('a03a', 'alverine_combinations').
+atc_l4('a03a', 'benzilone').
+atc_l4('a03a', 'bevonium').
+atc_l4('a03a', 'camylofin').
+atc_l4('a03a', 'caroverine').
+atc_l4('a03a', 'chlorbenzoxamine').
+atc_l4('a03a', 'cilansetron').
+atc_l4('a03a', 'dicycloverine').
+atc_l4('a03a', 'difemerine').
+atc_l4('a03a', 'dihexyverine').
+atc_l4('a03a', 'diisopromine').
+atc_l4('a03a', 'dimethylaminopropionylphenothiazine').
+atc_l4('a03a', 'diphemanil').
+atc_l4('a03a', 'drotaverine').
+atc_l4('a03a', 'fenoverine').
+atc_l4('a03a', 'fenpiprane').
+atc_l4('a03a', 'fenpiverinium').
+atc_l4('a03a', 'glycopyrronium_bromide').
+atc_l4('a03a', 'hexocyclium').
+atc_l4('a03a', 'idanpramine').
+atc_l4('a03a', 'isometheptene').
+atc_l4('a03a', 'isopropamide').
+atc_l4('a03a', 'mebeverine').
+atc_l4('a03a', 'menthae_piperitae_aetheroleum').
+atc_l4('a03a', 'mepenzolate').
+atc_l4('a03a', 'methantheline').
+atc_l4('a03a', 'moxaverine').
+atc_l4('a03a', 'n_2_benzhydryloxyethyl_diethyl_methylammonium_iodide').
+atc_l4('a03a', 'nicofetamide').
+atc_l4('a03a', 'otilonium_bromide').
+atc_l4('a03a', 'oxyphencyclimine').
+atc_l4('a03a', 'oxyphenonium').
+atc_l4('a03a', 'oxyphenonium_combinations').
+atc_l4('a03a', 'papaverine').
+atc_l4('a03a', 'penthienate').
+atc_l4('a03a', 'phloroglucinol').
+atc_l4('a03a', 'pinaverium').
+atc_l4('a03a', 'pipenzolate').
+atc_l4('a03a', 'piperidolate').
+atc_l4('a03a', 'poldine').
+atc_l4('a03a', 'prifinium_bromide').
+atc_l4('a03a', 'propantheline').
+atc_l4('a03a', 'proxazole').
+atc_l4('a03a', 'rociverine').
+atc_l4('a03a', 'silicones').
+atc_l4('a03a', 'tiemonium_iodide').
+atc_l4('a03a', 'timepidium_bromide').
+atc_l4('a03a', 'tiropramide').
+atc_l4('a03a', 'trepibutone').
+atc_l4('a03a', 'tridihexethyl').
+atc_l4('a03a', 'trimebutine').
+atc_l4('a03a', 'trimethyldiphenylpropylamine').
+atc_l4('a03a', 'valethamate').
+atc_l4('a03b', 'atropine').
+atc_l4('a03b', 'belladonna_total_alkaloids').
+atc_l4('a03b', 'butylscopolamine').
+atc_l4('a03b', 'cimetropium_bromide').
+atc_l4('a03b', 'fentonium').
+atc_l4('a03b', 'homatropine_methylbromide').
+atc_l4('a03b', 'hyoscyamine').
+atc_l4('a03b', 'methylatropine').
+atc_l4('a03b', 'methylscopolamine').
+atc_l4('a03c', 'ambutonium_and_psycholeptics').
+atc_l4('a03c', 'atropine_and_psycholeptics').
+atc_l4('a03c', 'belladonna_total_alkaloids_and_psycholeptics').
+atc_l4('a03c', 'bevonium_and_psycholeptics').
+atc_l4('a03c', 'clidinium_and_psycholeptics').
+atc_l4('a03c', 'diphemanil_and_psycholeptics').
+atc_l4('a03c', 'emepronium_and_psycholeptics').
+atc_l4('a03c', 'glycopyrronium_bromide_and_psycholeptics').
+atc_l4('a03c', 'homatropine_methylbromide_and_psycholeptics').
+atc_l4('a03c', 'hyoscyamine_and_psycholeptics').
+atc_l4('a03c', 'isopropamide_and_psycholeptics').
+atc_l4('a03c', 'methylscopolamine_and_psycholeptics').
+atc_l4('a03c', 'otilonium_bromide_and_psycholeptics').
+atc_l4('a03c', 'oxyphencyclimine_and_psycholeptics').
+atc_l4('a03c', 'pipenzolate_and_psycholeptics').
+atc_l4('a03c', 'propantheline_and_psycholeptics').
+atc_l4('a03d', 'bevonium_and_analgesics').
+atc_l4('a03d', 'butylscopolamine_and_analgesics').
+atc_l4('a03d', 'camylofin_and_analgesics').
+atc_l4('a03d', 'ciclonium_and_analgesics').
+atc_l4('a03d', 'pitofenone_and_analgesics').
+atc_l4('a03d', 'tiemonium_iodide_and_analgesics').
+atc_l4('a03d', 'tropenzilone_and_analgesics').
+atc_l4('a03d', 'trospium_and_analgesics').
+atc_l4('a03f', 'acotiamide').
+atc_l4('a03f', 'alizapride').
+atc_l4('a03f', 'bromopride').
+atc_l4('a03f', 'cinitapride').
+atc_l4('a03f', 'cisapride').
+atc_l4('a03f', 'clebopride').
+atc_l4('a03f', 'domperidone').
+atc_l4('a03f', 'itopride').
+atc_l4('a03f', 'metoclopramide').
+atc_l4('a03f', 'mosapride').
+atc_l4('a04a', 'aprepitant').
+atc_l4('a04a', 'casopitant').
+atc_l4('a04a', 'cerium_oxalate').
+atc_l4('a04a', 'chlorobutanol').
+atc_l4('a04a', 'chlorobutanol_combinations').
+atc_l4('a04a', 'dolasetron').
+atc_l4('a04a', 'dronabinol').
+atc_l4('a04a', 'granisetron').
+atc_l4('a04a', 'metopimazine').
+atc_l4('a04a', 'nabilone').
+atc_l4('a04a', 'ondansetron').
+atc_l4('a04a', 'palonosetron').
+atc_l4('a04a', 'palonosetron_combinations').
+atc_l4('a04a', 'rolapitant').
+atc_l4('a04a', 'scopolamine').
+atc_l4('a04a', 'scopolamine_combinations').
+atc_l4('a04a', 'tropisetron').
+atc_l4('a05a', 'chenodeoxycholic_acid').
+atc_l4('a05a', 'cholic_acid').
+atc_l4('a05a', 'cyclobutyrol').
+atc_l4('a05a', 'elafibranor').
+atc_l4('a05a', 'hymecromone').
+atc_l4('a05a', 'maralixibat_chloride').
+atc_l4('a05a', 'nicotinyl_methylamide').
+atc_l4('a05a', 'obeticholic_acid').
+atc_l4('a05a', 'odevixibat').
+atc_l4('a05a', 'piprozolin').
+atc_l4('a05a', 'ursodeoxycholic_acid').
+atc_l4('a05a', 'ursodoxicoltaurine').
+atc_l4('a05b', 'arginine_glutamate').
+atc_l4('a05b', 'citiolone').
+atc_l4('a05b', 'epomediol').
+atc_l4('a05b', 'glycyrrhizic_acid').
+atc_l4('a05b', 'metadoxine').
+atc_l4('a05b', 'ornithine_oxoglurate').
+atc_l4('a05b', 'phospholipids').
+atc_l4('a05b', 'silymarin').
+atc_l4('a05b', 'tidiacic_arginine').
+atc_l4('a06a', 'alvimopan').
+atc_l4('a06a', 'bisacodyl').
+atc_l4('a06a', 'bisacodyl_combinations').
+atc_l4('a06a', 'bisoxatin').
+atc_l4('a06a', 'carbon_dioxide_producing_drugs').
+atc_l4('a06a', 'cascara').
+atc_l4('a06a', 'cascara_combinations').
+atc_l4('a06a', 'castor_oil').
+atc_l4('a06a', 'combinations').
+atc_l4('a06a', 'contact_laxatives_in_combination').
+atc_l4('a06a', 'contact_laxatives_in_combination_with_belladonna_alkaloids').
+atc_l4('a06a', 'dantron').
+atc_l4('a06a', 'dantron_combinations').
+atc_l4('a06a', 'dantron_incl_combinations').
+atc_l4('a06a', 'docusate_sodium').
+atc_l4('a06a', 'docusate_sodium_incl_combinations').
+atc_l4('a06a', 'elobixibat').
+atc_l4('a06a', 'ethulose').
+atc_l4('a06a', 'glycerol').
+atc_l4('a06a', 'ispaghula_combinations').
+atc_l4('a06a', 'ispaghula_psylla_seeds').
+atc_l4('a06a', 'lactitol').
+atc_l4('a06a', 'lactulose').
+atc_l4('a06a', 'lactulose_combinations').
+atc_l4('a06a', 'linaclotide').
+atc_l4('a06a', 'linseed').
+atc_l4('a06a', 'linseed_combinations').
+atc_l4('a06a', 'liquid_paraffin').
+atc_l4('a06a', 'liquid_paraffin_combinations').
+atc_l4('a06a', 'lubiprostone').
+atc_l4('a06a', 'macrogol').
+atc_l4('a06a', 'macrogol_combinations').
+atc_l4('a06a', 'magnesium_carbonate').
+atc_l4('a06a', 'magnesium_citrate').
+atc_l4('a06a', 'magnesium_oxide').
+atc_l4('a06a', 'magnesium_peroxide').
+atc_l4('a06a', 'magnesium_sulfate').
+atc_l4('a06a', 'mannitol').
+atc_l4('a06a', 'methylcellulose').
+atc_l4('a06a', 'methylnaltrexone_bromide').
+atc_l4('a06a', 'mineral_salts_in_combination').
+atc_l4('a06a', 'naldemedine').
+atc_l4('a06a', 'naloxegol').
+atc_l4('a06a', 'naloxone').
+atc_l4('a06a', 'oil').
+atc_l4('a06a', 'oxyphenisatine').
+atc_l4('a06a', 'pentaerithrityl').
+atc_l4('a06a', 'phenolphthalein').
+atc_l4('a06a', 'plecanatide').
+atc_l4('a06a', 'polycarbophil_calcium').
+atc_l4('a06a', 'prucalopride').
+atc_l4('a06a', 'senna_glycosides').
+atc_l4('a06a', 'senna_glycosides_combinations').
+atc_l4('a06a', 'sodium_lauryl_sulfoacetate_incl_combinations').
+atc_l4('a06a', 'sodium_phosphate').
+atc_l4('a06a', 'sodium_picosulfate').
+atc_l4('a06a', 'sodium_picosulfate_combinations').
+atc_l4('a06a', 'sodium_sulfate').
+atc_l4('a06a', 'sodium_tartrate').
+atc_l4('a06a', 'sorbitol').
+atc_l4('a06a', 'sterculia').
+atc_l4('a06a', 'sterculia_combinations').
+atc_l4('a06a', 'tegaserod').
+atc_l4('a06a', 'tenapanor').
+atc_l4('a06a', 'triticum_wheat_fibre').
+atc_l4('a07a', 'acetarsol').
+atc_l4('a07a', 'amphotericin_b').
+atc_l4('a07a', 'broxyquinoline').
+atc_l4('a07a', 'colistin').
+atc_l4('a07a', 'fidaxomicin').
+atc_l4('a07a', 'kanamycin').
+atc_l4('a07a', 'miconazole').
+atc_l4('a07a', 'natamycin').
+atc_l4('a07a', 'neomycin').
+atc_l4('a07a', 'neomycin_combinations').
+atc_l4('a07a', 'nifuroxazide').
+atc_l4('a07a', 'nifurzide').
+atc_l4('a07a', 'nystatin').
+atc_l4('a07a', 'paromomycin').
+atc_l4('a07a', 'phthalylsulfathiazole').
+atc_l4('a07a', 'polymyxin_b').
+atc_l4('a07a', 'rifamycin').
+atc_l4('a07a', 'rifaximin').
+atc_l4('a07a', 'streptomycin').
+atc_l4('a07a', 'streptomycin_combinations').
+atc_l4('a07a', 'succinylsulfathiazole').
+atc_l4('a07a', 'sulfaguanidine').
+atc_l4('a07a', 'vancomycin').
+atc_l4('a07b', 'attapulgite').
+atc_l4('a07b', 'attapulgite_combinations').
+atc_l4('a07b', 'combinations').
+atc_l4('a07b', 'crospovidone').
+atc_l4('a07b', 'diosmectite').
+atc_l4('a07b', 'kaolin').
+atc_l4('a07b', 'medicinal_charcoal').
+atc_l4('a07b', 'medicinal_charcoal_combinations').
+atc_l4('a07b', 'pectin').
+atc_l4('a07d', 'difenoxin').
+atc_l4('a07d', 'diphenoxylate').
+atc_l4('a07d', 'eluxadoline').
+atc_l4('a07d', 'loperamide').
+atc_l4('a07d', 'loperamide_combinations').
+atc_l4('a07d', 'loperamide_oxide').
+atc_l4('a07d', 'morphine_combinations').
+atc_l4('a07d', 'opium').
+atc_l4('a07e', 'balsalazide').
+atc_l4('a07e', 'beclometasone').
+atc_l4('a07e', 'betamethasone').
+atc_l4('a07e', 'budesonide').
+atc_l4('a07e', 'cromoglicic_acid').
+atc_l4('a07e', 'hydrocortisone').
+atc_l4('a07e', 'mesalazine').
+atc_l4('a07e', 'olsalazine').
+atc_l4('a07e', 'prednisolone').
+atc_l4('a07e', 'prednisone').
+atc_l4('a07e', 'sulfasalazine').
+atc_l4('a07e', 'tixocortol').
+atc_l4('a07f', 'escherichia_coli').
+atc_l4('a07f', 'lactic_acid_producing_organisms').
+atc_l4('a07f', 'lactic_acid_producing_organisms_combinations').
+atc_l4('a07f', 'saccharomyces_boulardii').
+atc_l4('a07x', 'albumin_tannate').
+atc_l4('a07x', 'albumin_tannate_combinations').
+atc_l4('a07x', 'calcium_compounds').
+atc_l4('a07x', 'ceratonia').
+atc_l4('a07x', 'crofelemer').
+atc_l4('a07x', 'racecadotril').
+atc_l4('a08a', 'amfepramone').
+atc_l4('a08a', 'bupropion_and_naltrexone').
+atc_l4('a08a', 'cathine').
+atc_l4('a08a', 'clobenzorex').
+atc_l4('a08a', 'dexfenfluramine').
+atc_l4('a08a', 'ephedrine_combinations').
+atc_l4('a08a', 'etilamfetamine').
+atc_l4('a08a', 'fenfluramine').
+atc_l4('a08a', 'lorcaserin').
+atc_l4('a08a', 'mazindol').
+atc_l4('a08a', 'mefenorex').
+atc_l4('a08a', 'orlistat').
+atc_l4('a08a', 'phentermine').
+atc_l4('a08a', 'phentermine_and_topiramate').
+atc_l4('a08a', 'rimonabant').
+atc_l4('a08a', 'setmelanotide').
+atc_l4('a08a', 'sibutramine').
+atc_l4('a09a', 'betaine_hydrochloride').
+atc_l4('a09a', 'citric_acid').
+atc_l4('a09a', 'diastase').
+atc_l4('a09a', 'glutamic_acid_hydrochloride').
+atc_l4('a09a', 'hydrochloric_acid').
+atc_l4('a09a', 'multienzymes_and_acid_preparations').
+atc_l4('a09a', 'multienzymes_lipase_protease_etc').
+atc_l4('a09a', 'pepsin').
+atc_l4('a09a', 'pepsin_and_acid_preparations').
+atc_l4('a09a', 'tilactase').
+atc_l4('a10a', 'combinations').
+atc_l4('a10a', 'insulin_aspart').
+atc_l4('a10a', 'insulin_beef').
+atc_l4('a10a', 'insulin_degludec').
+atc_l4('a10a', 'insulin_degludec_and_insulin_aspart').
+atc_l4('a10a', 'insulin_degludec_and_liraglutide').
+atc_l4('a10a', 'insulin_detemir').
+atc_l4('a10a', 'insulin_glargine').
+atc_l4('a10a', 'insulin_glargine_and_lixisenatide').
+atc_l4('a10a', 'insulin_glulisine').
+atc_l4('a10a', 'insulin_human').
+atc_l4('a10a', 'insulin_icodec').
+atc_l4('a10a', 'insulin_lispro').
+atc_l4('a10a', 'insulin_pork').
+atc_l4('a10b', 'acarbose').
+atc_l4('a10b', 'acetohexamide').
+atc_l4('a10b', 'albiglutide').
+atc_l4('a10b', 'alogliptin').
+atc_l4('a10b', 'beinaglutide').
+atc_l4('a10b', 'benfluorex').
+atc_l4('a10b', 'bexagliflozin').
+atc_l4('a10b', 'buformin').
+atc_l4('a10b', 'canagliflozin').
+atc_l4('a10b', 'carbutamide').
+atc_l4('a10b', 'carfloglitazar').
+atc_l4('a10b', 'chlorpropamide').
+atc_l4('a10b', 'dapagliflozin').
+atc_l4('a10b', 'dorzagliatin').
+atc_l4('a10b', 'dulaglutide').
+atc_l4('a10b', 'empagliflozin').
+atc_l4('a10b', 'ertugliflozin').
+atc_l4('a10b', 'evogliptin').
+atc_l4('a10b', 'exenatide').
+atc_l4('a10b', 'gemigliptin').
+atc_l4('a10b', 'gemigliptin_and_rosuvastatin').
+atc_l4('a10b', 'glibenclamide').
+atc_l4('a10b', 'glibornuride').
+atc_l4('a10b', 'gliclazide').
+atc_l4('a10b', 'glimepiride').
+atc_l4('a10b', 'glimepiride_and_pioglitazone').
+atc_l4('a10b', 'glimepiride_and_rosiglitazone').
+atc_l4('a10b', 'glipizide').
+atc_l4('a10b', 'gliquidone').
+atc_l4('a10b', 'glisoxepide').
+atc_l4('a10b', 'glymidine').
+atc_l4('a10b', 'guar_gum').
+atc_l4('a10b', 'imeglimin').
+atc_l4('a10b', 'ipragliflozin').
+atc_l4('a10b', 'linagliptin').
+atc_l4('a10b', 'linagliptin_and_empagliflozin').
+atc_l4('a10b', 'liraglutide').
+atc_l4('a10b', 'lixisenatide').
+atc_l4('a10b', 'lobeglitazone').
+atc_l4('a10b', 'luseogliflozin').
+atc_l4('a10b', 'metahexamide').
+atc_l4('a10b', 'metformin').
+atc_l4('a10b', 'metformin_and_acarbose').
+atc_l4('a10b', 'metformin_and_alogliptin').
+atc_l4('a10b', 'metformin_and_canagliflozin').
+atc_l4('a10b', 'metformin_and_dapagliflozin').
+atc_l4('a10b', 'metformin_and_empagliflozin').
+atc_l4('a10b', 'metformin_and_ertugliflozin').
+atc_l4('a10b', 'metformin_and_evogliptin').
+atc_l4('a10b', 'metformin_and_gemigliptin').
+atc_l4('a10b', 'metformin_and_linagliptin').
+atc_l4('a10b', 'metformin_and_lobeglitazone').
+atc_l4('a10b', 'metformin_and_pioglitazone').
+atc_l4('a10b', 'metformin_and_repaglinide').
+atc_l4('a10b', 'metformin_and_rosiglitazone').
+atc_l4('a10b', 'metformin_and_saxagliptin').
+atc_l4('a10b', 'metformin_and_sitagliptin').
+atc_l4('a10b', 'metformin_and_sulfonylureas').
+atc_l4('a10b', 'metformin_and_teneligliptin').
+atc_l4('a10b', 'metformin_and_vildagliptin').
+atc_l4('a10b', 'metformin_linagliptin_and_empagliflozin').
+atc_l4('a10b', 'metformin_saxagliptin_and_dapagliflozin').
+atc_l4('a10b', 'miglitol').
+atc_l4('a10b', 'mitiglinide').
+atc_l4('a10b', 'nateglinide').
+atc_l4('a10b', 'phenformin').
+atc_l4('a10b', 'phenformin_and_sulfonylureas').
+atc_l4('a10b', 'pioglitazone').
+atc_l4('a10b', 'pioglitazone_and_alogliptin').
+atc_l4('a10b', 'pioglitazone_and_sitagliptin').
+atc_l4('a10b', 'pramlintide').
+atc_l4('a10b', 'repaglinide').
+atc_l4('a10b', 'rosiglitazone').
+atc_l4('a10b', 'saxagliptin').
+atc_l4('a10b', 'saxagliptin_and_dapagliflozin').
+atc_l4('a10b', 'semaglutide').
+atc_l4('a10b', 'sitagliptin').
+atc_l4('a10b', 'sitagliptin_and_dapagliflozin').
+atc_l4('a10b', 'sitagliptin_and_ertugliflozin').
+atc_l4('a10b', 'sitagliptin_and_simvastatin').
+atc_l4('a10b', 'sotagliflozin').
+atc_l4('a10b', 'teneligliptin').
+atc_l4('a10b', 'tirzepatide').
+atc_l4('a10b', 'tolazamide').
+atc_l4('a10b', 'tolbutamide').
+atc_l4('a10b', 'troglitazone').
+atc_l4('a10b', 'vildagliptin').
+atc_l4('a10b', 'voglibose').
+atc_l4('a10x', 'teplizumab').
+atc_l4('a10x', 'tolrestat').
+atc_l4('a11a', 'multivitamins_and_calcium').
+atc_l4('a11a', 'multivitamins_and_iron').
+atc_l4('a11a', 'multivitamins_and_other_minerals_incl_combinations').
+atc_l4('a11a', 'multivitamins_and_trace_elements').
+atc_l4('a11c', 'alfacalcidol').
+atc_l4('a11c', 'betacarotene').
+atc_l4('a11c', 'calcifediol').
+atc_l4('a11c', 'calcitriol').
+atc_l4('a11c', 'colecalciferol').
+atc_l4('a11c', 'colecalciferol_combinations').
+atc_l4('a11c', 'combinations').
+atc_l4('a11c', 'dihydrotachysterol').
+atc_l4('a11c', 'ergocalciferol').
+atc_l4('a11c', 'retinol_vit_a').
+atc_l4('a11d', 'benfotiamine').
+atc_l4('a11d', 'sulbutiamine').
+atc_l4('a11d', 'thiamine_vit_b1').
+atc_l4('a11g', 'ascorbic_acid_vit_c').
+atc_l4('a11g', 'ascorbic_acid_vit_c_and_calcium').
+atc_l4('a11h', 'biotin').
+atc_l4('a11h', 'calcium_pantothenate').
+atc_l4('a11h', 'dexpanthenol').
+atc_l4('a11h', 'inositol').
+atc_l4('a11h', 'nicotinamide').
+atc_l4('a11h', 'pantethine').
+atc_l4('a11h', 'pyridoxal_phosphate').
+atc_l4('a11h', 'pyridoxine_vit_b6').
+atc_l4('a11h', 'riboflavin_vit_b2').
+atc_l4('a11h', 'tocofersolan').
+atc_l4('a11h', 'tocopherol_vit_e').
+atc_l4('a12a', 'calcium_carbonate').
+atc_l4('a12a', 'calcium_chloride').
+atc_l4('a12a', 'calcium_citrate').
+atc_l4('a12a', 'calcium_citrate_lysine_complex').
+atc_l4('a12a', 'calcium_different_salts_in_combination').
+atc_l4('a12a', 'calcium_glubionate').
+atc_l4('a12a', 'calcium_glucoheptonate').
+atc_l4('a12a', 'calcium_gluconate').
+atc_l4('a12a', 'calcium_glycerylphosphate').
+atc_l4('a12a', 'calcium_lactate').
+atc_l4('a12a', 'calcium_lactate_gluconate').
+atc_l4('a12a', 'calcium_laevulate').
+atc_l4('a12a', 'calcium_pangamate').
+atc_l4('a12a', 'calcium_phosphate').
+atc_l4('a12b', 'potassium_chloride').
+atc_l4('a12b', 'potassium_chloride_combinations').
+atc_l4('a12b', 'potassium_citrate').
+atc_l4('a12b', 'potassium_different_salts_in_combination').
+atc_l4('a12b', 'potassium_gluconate').
+atc_l4('a12b', 'potassium_hydrogencarbonate').
+atc_l4('a12b', 'potassium_hydrogentartrate').
+atc_l4('a12c', 'fluoride_combinations').
+atc_l4('a12c', 'magnesium_aspartate').
+atc_l4('a12c', 'magnesium_chloride').
+atc_l4('a12c', 'magnesium_citrate').
+atc_l4('a12c', 'magnesium_different_salts_in_combination').
+atc_l4('a12c', 'magnesium_gluconate').
+atc_l4('a12c', 'magnesium_lactate').
+atc_l4('a12c', 'magnesium_levulinate').
+atc_l4('a12c', 'magnesium_orotate').
+atc_l4('a12c', 'magnesium_oxide').
+atc_l4('a12c', 'magnesium_pidolate').
+atc_l4('a12c', 'magnesium_sulfate').
+atc_l4('a12c', 'sodium_chloride').
+atc_l4('a12c', 'sodium_fluoride').
+atc_l4('a12c', 'sodium_monofluorophosphate').
+atc_l4('a12c', 'sodium_selenate').
+atc_l4('a12c', 'sodium_selenite').
+atc_l4('a12c', 'sodium_sulfate').
+atc_l4('a12c', 'zinc_gluconate').
+atc_l4('a12c', 'zinc_protein_complex').
+atc_l4('a12c', 'zinc_sulfate').
+atc_l4('a14a', 'androstanolone').
+atc_l4('a14a', 'ethylestrenol').
+atc_l4('a14a', 'metandienone').
+atc_l4('a14a', 'metenolone').
+atc_l4('a14a', 'nandrolone').
+atc_l4('a14a', 'norethandrolone').
+atc_l4('a14a', 'oxabolone_cipionate').
+atc_l4('a14a', 'oxandrolone').
+atc_l4('a14a', 'oxymetholone').
+atc_l4('a14a', 'prasterone').
+atc_l4('a14a', 'quinbolone').
+atc_l4('a14a', 'stanozolol').
+atc_l4('a16a', 'ademetionine').
+atc_l4('a16a', 'agalsidase_alfa').
+atc_l4('a16a', 'agalsidase_beta').
+atc_l4('a16a', 'alglucerase').
+atc_l4('a16a', 'alglucosidase_alfa').
+atc_l4('a16a', 'anethole_trithione').
+atc_l4('a16a', 'asfotase_alfa').
+atc_l4('a16a', 'atidarsagene_autotemcel').
+atc_l4('a16a', 'avalglucosidase_alfa').
+atc_l4('a16a', 'betaine').
+atc_l4('a16a', 'carglumic_acid').
+atc_l4('a16a', 'cerliponase_alfa').
+atc_l4('a16a', 'cipaglucosidase_alfa').
+atc_l4('a16a', 'eladocagene_exuparvovec').
+atc_l4('a16a', 'eliglustat').
+atc_l4('a16a', 'elivaldogene_autotemcel').
+atc_l4('a16a', 'elosulfase_alfa').
+atc_l4('a16a', 'fosdenopterin').
+atc_l4('a16a', 'galsulfase').
+atc_l4('a16a', 'givosiran').
+atc_l4('a16a', 'glutamine').
+atc_l4('a16a', 'glycerol_phenylbutyrate').
+atc_l4('a16a', 'idursulfase').
+atc_l4('a16a', 'idursulfase_beta').
+atc_l4('a16a', 'imiglucerase').
+atc_l4('a16a', 'laronidase').
+atc_l4('a16a', 'leriglitazone').
+atc_l4('a16a', 'levocarnitine').
+atc_l4('a16a', 'lonafarnib').
+atc_l4('a16a', 'lumasiran').
+atc_l4('a16a', 'mercaptamine').
+atc_l4('a16a', 'metreleptin').
+atc_l4('a16a', 'migalastat').
+atc_l4('a16a', 'miglustat').
+atc_l4('a16a', 'nitisinone').
+atc_l4('a16a', 'olipudase_alfa').
+atc_l4('a16a', 'pabinafusp_alfa').
+atc_l4('a16a', 'pegunigalsidase_alfa').
+atc_l4('a16a', 'pegvaliase').
+atc_l4('a16a', 'pegzilarginase').
+atc_l4('a16a', 'sacrosidase').
+atc_l4('a16a', 'sapropterin').
+atc_l4('a16a', 'sebelipase_alfa').
+atc_l4('a16a', 'sodium_benzoate').
+atc_l4('a16a', 'sodium_benzoate_and_sodium_phenylacetate').
+atc_l4('a16a', 'sodium_phenylbutyrate').
+atc_l4('a16a', 'taliglucerase_alfa').
+atc_l4('a16a', 'teduglutide').
+atc_l4('a16a', 'telotristat').
+atc_l4('a16a', 'thioctic_acid').
+atc_l4('a16a', 'tiomolibdic_acid').
+atc_l4('a16a', 'trientine').
+atc_l4('a16a', 'triheptanoin').
+atc_l4('a16a', 'uridine_triacetate').
+atc_l4('a16a', 'velaglucerase_alfa').
+atc_l4('a16a', 'velmanase_alfa').
+atc_l4('a16a', 'vestronidase_alfa').
+atc_l4('a16a', 'zinc_acetate').
+atc_l4('b01a', 'abciximab').
+atc_l4('b01a', 'acenocoumarol').
+atc_l4('b01a', 'acetylsalicylic_acid').
+atc_l4('b01a', 'acetylsalicylic_acid_combinations_with_proton_pump_inhibitors').
+atc_l4('b01a', 'aloxiprin').
+atc_l4('b01a', 'alteplase').
+atc_l4('b01a', 'ancrod').
+atc_l4('b01a', 'anistreplase').
+atc_l4('b01a', 'antithrombin_iii').
+atc_l4('b01a', 'apadamtase_alfa_and_cinaxadamtase_alfa').
+atc_l4('b01a', 'apixaban').
+atc_l4('b01a', 'argatroban').
+atc_l4('b01a', 'bemiparin').
+atc_l4('b01a', 'beraprost').
+atc_l4('b01a', 'betrixaban').
+atc_l4('b01a', 'bivalirudin').
+atc_l4('b01a', 'brinase').
+atc_l4('b01a', 'cangrelor').
+atc_l4('b01a', 'caplacizumab').
+atc_l4('b01a', 'carbasalate_calcium').
+atc_l4('b01a', 'cilostazol').
+atc_l4('b01a', 'clopidogrel').
+atc_l4('b01a', 'cloricromen').
+atc_l4('b01a', 'clorindione').
+atc_l4('b01a', 'combinations').
+atc_l4('b01a', 'dabigatran_etexilate').
+atc_l4('b01a', 'dalteparin').
+atc_l4('b01a', 'danaparoid').
+atc_l4('b01a', 'defibrotide').
+atc_l4('b01a', 'dermatan_sulfate').
+atc_l4('b01a', 'desirudin').
+atc_l4('b01a', 'dicoumarol').
+atc_l4('b01a', 'diphenadione').
+atc_l4('b01a', 'dipyridamole').
+atc_l4('b01a', 'ditazole').
+atc_l4('b01a', 'drotrecogin_alfa_activated').
+atc_l4('b01a', 'edoxaban').
+atc_l4('b01a', 'enoxaparin').
+atc_l4('b01a', 'epoprostenol').
+atc_l4('b01a', 'eptifibatide').
+atc_l4('b01a', 'ethyl_biscoumacetate').
+atc_l4('b01a', 'fibrinolysin').
+atc_l4('b01a', 'fluindione').
+atc_l4('b01a', 'fondaparinux').
+atc_l4('b01a', 'heparin').
+atc_l4('b01a', 'heparin_combinations').
+atc_l4('b01a', 'iloprost').
+atc_l4('b01a', 'indobufen').
+atc_l4('b01a', 'lepirudin').
+atc_l4('b01a', 'limaprost').
+atc_l4('b01a', 'melagatran').
+atc_l4('b01a', 'nadroparin').
+atc_l4('b01a', 'parnaparin').
+atc_l4('b01a', 'phenindione').
+atc_l4('b01a', 'phenprocoumon').
+atc_l4('b01a', 'picotamide').
+atc_l4('b01a', 'prasugrel').
+atc_l4('b01a', 'protein_c').
+atc_l4('b01a', 'reteplase').
+atc_l4('b01a', 'reviparin').
+atc_l4('b01a', 'rivaroxaban').
+atc_l4('b01a', 'rivaroxaban_and_acetylsalicylic_acid').
+atc_l4('b01a', 'saruplase').
+atc_l4('b01a', 'selexipag').
+atc_l4('b01a', 'streptokinase').
+atc_l4('b01a', 'sulodexide').
+atc_l4('b01a', 'tenecteplase').
+atc_l4('b01a', 'ticagrelor').
+atc_l4('b01a', 'ticlopidine').
+atc_l4('b01a', 'tinzaparin').
+atc_l4('b01a', 'tioclomarol').
+atc_l4('b01a', 'tirofiban').
+atc_l4('b01a', 'treprostinil').
+atc_l4('b01a', 'triflusal').
+atc_l4('b01a', 'urokinase').
+atc_l4('b01a', 'vorapaxar').
+atc_l4('b01a', 'warfarin').
+atc_l4('b01a', 'ximelagatran').
+atc_l4('b02a', 'alfa1_antitrypsin').
+atc_l4('b02a', 'aminocaproic_acid').
+atc_l4('b02a', 'aminomethylbenzoic_acid').
+atc_l4('b02a', 'aprotinin').
+atc_l4('b02a', 'camostat').
+atc_l4('b02a', 'tranexamic_acid').
+atc_l4('b02a', 'ulinastatin').
+atc_l4('b02b', 'absorbable_gelatin_sponge').
+atc_l4('b02b', 'adrenalone').
+atc_l4('b02b', 'avatrombopag').
+atc_l4('b02b', 'batroxobin').
+atc_l4('b02b', 'calcium_alginate').
+atc_l4('b02b', 'carbazochrome').
+atc_l4('b02b', 'catridecacog').
+atc_l4('b02b', 'coagulation_factor_ix').
+atc_l4('b02b', 'coagulation_factor_ix_ii_vii_and_x_in_combination').
+atc_l4('b02b', 'coagulation_factor_vii').
+atc_l4('b02b', 'coagulation_factor_viia').
+atc_l4('b02b', 'coagulation_factor_viii').
+atc_l4('b02b', 'coagulation_factor_x').
+atc_l4('b02b', 'coagulation_factor_xiii').
+atc_l4('b02b', 'collagen').
+atc_l4('b02b', 'combinations').
+atc_l4('b02b', 'concizumab').
+atc_l4('b02b', 'eltrombopag').
+atc_l4('b02b', 'emicizumab').
+atc_l4('b02b', 'epinephrine').
+atc_l4('b02b', 'etamsylate').
+atc_l4('b02b', 'etranacogene_dezaparvovec').
+atc_l4('b02b', 'factor_viii_inhibitor_bypassing_activity').
+atc_l4('b02b', 'fibrinogen_human').
+atc_l4('b02b', 'fostamatinib').
+atc_l4('b02b', 'lusutrombopag').
+atc_l4('b02b', 'menadione').
+atc_l4('b02b', 'oxidized_cellulose').
+atc_l4('b02b', 'phytomenadione').
+atc_l4('b02b', 'romiplostim').
+atc_l4('b02b', 'susoctocog_alfa').
+atc_l4('b02b', 'tetragalacturonic_acid_hydroxymethylester').
+atc_l4('b02b', 'thrombin').
+atc_l4('b02b', 'valoctocogene_roxaparvovec').
+atc_l4('b02b', 'von_willebrand_factor').
+atc_l4('b02b', 'von_willebrand_factor_and_coagulation_factor_viii_in_combination').
+atc_l4('b03a', 'chondroitin_sulfate_iron_complex').
+atc_l4('b03a', 'ferric_acetyl_transferrin').
+atc_l4('b03a', 'ferric_hydroxide').
+atc_l4('b03a', 'ferric_maltol').
+atc_l4('b03a', 'ferric_oxide_polymaltose_complexes').
+atc_l4('b03a', 'ferric_oxide_polymaltose_complexes_and_folic_acid').
+atc_l4('b03a', 'ferric_proteinsuccinylate').
+atc_l4('b03a', 'ferric_sodium_citrate').
+atc_l4('b03a', 'ferrous_amino_acid_complex_and_folic_acid').
+atc_l4('b03a', 'ferrous_ascorbate').
+atc_l4('b03a', 'ferrous_aspartate').
+atc_l4('b03a', 'ferrous_carbonate').
+atc_l4('b03a', 'ferrous_chloride').
+atc_l4('b03a', 'ferrous_fumarate').
+atc_l4('b03a', 'ferrous_fumarate_and_folic_acid').
+atc_l4('b03a', 'ferrous_gluconate').
+atc_l4('b03a', 'ferrous_gluconate_and_folic_acid').
+atc_l4('b03a', 'ferrous_glycine_sulfate').
+atc_l4('b03a', 'ferrous_iodine').
+atc_l4('b03a', 'ferrous_sodium_citrate').
+atc_l4('b03a', 'ferrous_succinate').
+atc_l4('b03a', 'ferrous_sulfate').
+atc_l4('b03a', 'ferrous_sulfate_and_folic_acid').
+atc_l4('b03a', 'ferrous_tartrate').
+atc_l4('b03a', 'iron_and_multivitamins').
+atc_l4('b03a', 'iron_multivitamins_and_folic_acid').
+atc_l4('b03a', 'iron_multivitamins_and_minerals').
+atc_l4('b03a', 'iron_vitamin_b12_and_folic_acid').
+atc_l4('b03a', 'saccharated_iron_oxide').
+atc_l4('b03a', 'sodium_feredetate').
+atc_l4('b03a', 'various_combinations').
+atc_l4('b03b', 'cobamamide').
+atc_l4('b03b', 'cyanocobalamin').
+atc_l4('b03b', 'cyanocobalamin_combinations').
+atc_l4('b03b', 'cyanocobalamin_tannin_complex').
+atc_l4('b03b', 'folic_acid').
+atc_l4('b03b', 'folic_acid_combinations').
+atc_l4('b03b', 'hydroxocobalamin').
+atc_l4('b03b', 'hydroxocobalamin_combinations').
+atc_l4('b03b', 'mecobalamin').
+atc_l4('b03x', 'daprodustat').
+atc_l4('b03x', 'darbepoetin_alfa').
+atc_l4('b03x', 'erythropoietin').
+atc_l4('b03x', 'luspatercept').
+atc_l4('b03x', 'methoxy_polyethylene_glycol_epoetin_beta').
+atc_l4('b03x', 'peginesatide').
+atc_l4('b03x', 'roxadustat').
+atc_l4('b03x', 'vadadustat').
+atc_l4('b05a', 'albumin').
+atc_l4('b05a', 'blood_plasma').
+atc_l4('b05a', 'dextran').
+atc_l4('b05a', 'erythrocytes').
+atc_l4('b05a', 'fluorocarbon_blood_substitutes').
+atc_l4('b05a', 'gelatin_agents').
+atc_l4('b05a', 'hemoglobin_crosfumaril').
+atc_l4('b05a', 'hemoglobin_glutamer_bovine').
+atc_l4('b05a', 'hemoglobin_raffimer').
+atc_l4('b05a', 'hydroxyethylstarch').
+atc_l4('b05a', 'other_plasma_protein_fractions').
+atc_l4('b05a', 'stem_cells_from_umbilical_cord_blood').
+atc_l4('b05a', 'thrombocytes').
+atc_l4('b05b', 'amino_acids').
+atc_l4('b05b', 'carbamide').
+atc_l4('b05b', 'carbohydrates').
+atc_l4('b05b', 'combinations').
+atc_l4('b05b', 'electrolytes').
+atc_l4('b05b', 'electrolytes_in_combination_with_other_drugs').
+atc_l4('b05b', 'electrolytes_with_carbohydrates').
+atc_l4('b05b', 'fat_emulsions').
+atc_l4('b05b', 'mannitol').
+atc_l4('b05b', 'protein_hydrolysates').
+atc_l4('b05b', 'trometamol').
+atc_l4('b05c', 'cetylpyridinium').
+atc_l4('b05c', 'chlorhexidine').
+atc_l4('b05c', 'combinations').
+atc_l4('b05c', 'ethacridine_lactate').
+atc_l4('b05c', 'glucose').
+atc_l4('b05c', 'glycine').
+atc_l4('b05c', 'magnesium_citrate').
+atc_l4('b05c', 'mandelic_acid').
+atc_l4('b05c', 'mannitol').
+atc_l4('b05c', 'neomycin').
+atc_l4('b05c', 'nitrofural').
+atc_l4('b05c', 'noxytiolin').
+atc_l4('b05c', 'sodium_bicarbonate').
+atc_l4('b05c', 'sodium_chloride').
+atc_l4('b05c', 'sodium_citrate').
+atc_l4('b05c', 'sorbitol').
+atc_l4('b05c', 'sulfamethizole').
+atc_l4('b05c', 'taurolidine').
+atc_l4('b05x', 'alanyl_glutamine').
+atc_l4('b05x', 'ammonium_chloride').
+atc_l4('b05x', 'arginine_hydrochloride').
+atc_l4('b05x', 'calcium_chloride').
+atc_l4('b05x', 'calcium_gluconate').
+atc_l4('b05x', 'cardioplegia_solutions').
+atc_l4('b05x', 'combinations_of_electrolytes').
+atc_l4('b05x', 'electrolytes_in_combination_with_other_drugs').
+atc_l4('b05x', 'hydrochloric_acid').
+atc_l4('b05x', 'lysine').
+atc_l4('b05x', 'magnesium_chloride').
+atc_l4('b05x', 'magnesium_phosphate').
+atc_l4('b05x', 'magnesium_sulfate').
+atc_l4('b05x', 'potassium_acetate').
+atc_l4('b05x', 'potassium_chloride').
+atc_l4('b05x', 'potassium_lactate').
+atc_l4('b05x', 'potassium_phosphate_incl_combinations_with_other_potassium_salts').
+atc_l4('b05x', 'sodium_acetate').
+atc_l4('b05x', 'sodium_bicarbonate').
+atc_l4('b05x', 'sodium_chloride').
+atc_l4('b05x', 'sodium_glycerophosphate').
+atc_l4('b05x', 'sodium_phosphate').
+atc_l4('b05x', 'sodium_selenite').
+atc_l4('b05x', 'trometamol').
+atc_l4('b05x', 'zinc_chloride').
+atc_l4('b05x', 'zinc_sulfate').
+atc_l4('b06a', 'berotralstat').
+atc_l4('b06a', 'betibeglogene_autotemcel').
+atc_l4('b06a', 'c1_inhibitor_plasma_derived').
+atc_l4('b06a', 'chymotrypsin').
+atc_l4('b06a', 'conestat_alfa').
+atc_l4('b06a', 'crizanlizumab').
+atc_l4('b06a', 'desoxyribonuclease').
+atc_l4('b06a', 'ecallantide').
+atc_l4('b06a', 'exagamglogene_autotemcel').
+atc_l4('b06a', 'fibrinolysin_and_desoxyribonuclease').
+atc_l4('b06a', 'hemin').
+atc_l4('b06a', 'hyaluronidase').
+atc_l4('b06a', 'icatibant').
+atc_l4('b06a', 'lanadelumab').
+atc_l4('b06a', 'mitapivat').
+atc_l4('b06a', 'streptokinase_combinations').
+atc_l4('b06a', 'trypsin').
+atc_l4('b06a', 'voxelotor').
+atc_l4('c01a', 'acetyldigitoxin').
+atc_l4('c01a', 'acetyldigoxin').
+atc_l4('c01a', 'acetyldigoxin_combinations').
+atc_l4('c01a', 'cymarin').
+atc_l4('c01a', 'deslanoside').
+atc_l4('c01a', 'digitalis_leaves').
+atc_l4('c01a', 'digitoxin').
+atc_l4('c01a', 'digoxin').
+atc_l4('c01a', 'g_strophanthin').
+atc_l4('c01a', 'gitoformate').
+atc_l4('c01a', 'lanatoside_c').
+atc_l4('c01a', 'metildigoxin').
+atc_l4('c01a', 'peruvoside').
+atc_l4('c01a', 'proscillaridin').
+atc_l4('c01a', 'proscillaridin_combinations').
+atc_l4('c01b', 'ajmaline').
+atc_l4('c01b', 'amiodarone').
+atc_l4('c01b', 'aprindine').
+atc_l4('c01b', 'bretylium_tosilate').
+atc_l4('c01b', 'bunaftine').
+atc_l4('c01b', 'cibenzoline').
+atc_l4('c01b', 'disopyramide').
+atc_l4('c01b', 'dofetilide').
+atc_l4('c01b', 'dronedarone').
+atc_l4('c01b', 'encainide').
+atc_l4('c01b', 'ethacizine').
+atc_l4('c01b', 'flecainide').
+atc_l4('c01b', 'hydroquinidine').
+atc_l4('c01b', 'ibutilide').
+atc_l4('c01b', 'lidocaine').
+atc_l4('c01b', 'lorajmine').
+atc_l4('c01b', 'lorcainide').
+atc_l4('c01b', 'mexiletine').
+atc_l4('c01b', 'moracizine').
+atc_l4('c01b', 'prajmaline').
+atc_l4('c01b', 'procainamide').
+atc_l4('c01b', 'propafenone').
+atc_l4('c01b', 'quinidine').
+atc_l4('c01b', 'quinidine_combinations_excl_psycholeptics').
+atc_l4('c01b', 'quinidine_combinations_with_psycholeptics').
+atc_l4('c01b', 'sparteine').
+atc_l4('c01b', 'tedisamil').
+atc_l4('c01b', 'tocainide').
+atc_l4('c01b', 'vernakalant').
+atc_l4('c01c', 'amezinium_metilsulfate').
+atc_l4('c01c', 'amrinone').
+atc_l4('c01c', 'angiotensin_ii').
+atc_l4('c01c', 'angiotensinamide').
+atc_l4('c01c', 'arbutamine').
+atc_l4('c01c', 'bucladesine').
+atc_l4('c01c', 'cafedrine').
+atc_l4('c01c', 'centhaquine').
+atc_l4('c01c', 'combinations').
+atc_l4('c01c', 'dimetofrine').
+atc_l4('c01c', 'dobutamine').
+atc_l4('c01c', 'dopamine').
+atc_l4('c01c', 'dopexamine').
+atc_l4('c01c', 'droxidopa').
+atc_l4('c01c', 'enoximone').
+atc_l4('c01c', 'ephedrine').
+atc_l4('c01c', 'epinephrine').
+atc_l4('c01c', 'etilefrine').
+atc_l4('c01c', 'etilefrine_combinations').
+atc_l4('c01c', 'fenoldopam').
+atc_l4('c01c', 'gepefrine').
+atc_l4('c01c', 'ibopamine').
+atc_l4('c01c', 'isoprenaline').
+atc_l4('c01c', 'levosimendan').
+atc_l4('c01c', 'mephentermine').
+atc_l4('c01c', 'metaraminol').
+atc_l4('c01c', 'methoxamine').
+atc_l4('c01c', 'midodrine').
+atc_l4('c01c', 'milrinone').
+atc_l4('c01c', 'norepinephrine').
+atc_l4('c01c', 'norfenefrine').
+atc_l4('c01c', 'octopamine').
+atc_l4('c01c', 'omecamtiv_mecarbil').
+atc_l4('c01c', 'oxedrine').
+atc_l4('c01c', 'phenylephrine').
+atc_l4('c01c', 'prenalterol').
+atc_l4('c01c', 'theodrenaline').
+atc_l4('c01c', 'xamoterol').
+atc_l4('c01d', 'benziodarone').
+atc_l4('c01d', 'benziodarone_combinations').
+atc_l4('c01d', 'carbocromen').
+atc_l4('c01d', 'cinepazet').
+atc_l4('c01d', 'cloridarol').
+atc_l4('c01d', 'dilazep').
+atc_l4('c01d', 'efloxate').
+atc_l4('c01d', 'eritrityl_tetranitrate').
+atc_l4('c01d', 'eritrityl_tetranitrate_combinations').
+atc_l4('c01d', 'etafenone').
+atc_l4('c01d', 'flosequinan').
+atc_l4('c01d', 'glyceryl_trinitrate').
+atc_l4('c01d', 'glyceryl_trinitrate_combinations').
+atc_l4('c01d', 'heptaminol').
+atc_l4('c01d', 'hexobendine').
+atc_l4('c01d', 'imolamine').
+atc_l4('c01d', 'isosorbide_dinitrate').
+atc_l4('c01d', 'isosorbide_dinitrate_combinations').
+atc_l4('c01d', 'isosorbide_mononitrate').
+atc_l4('c01d', 'itramin_tosilate').
+atc_l4('c01d', 'itramin_tosilate_combinations').
+atc_l4('c01d', 'linsidomine').
+atc_l4('c01d', 'methylpropylpropanediol_dinitrate').
+atc_l4('c01d', 'methylpropylpropanediol_dinitrate_combinations').
+atc_l4('c01d', 'molsidomine').
+atc_l4('c01d', 'nesiritide').
+atc_l4('c01d', 'nicorandil').
+atc_l4('c01d', 'organic_nitrates_in_combination').
+atc_l4('c01d', 'organic_nitrates_in_combination_with_psycholeptics').
+atc_l4('c01d', 'oxyfedrine').
+atc_l4('c01d', 'oxyfedrine_combinations').
+atc_l4('c01d', 'pentaerithrityl_tetranitrate').
+atc_l4('c01d', 'pentaerithrityl_tetranitrate_combinations').
+atc_l4('c01d', 'prenylamine').
+atc_l4('c01d', 'prenylamine_combinations').
+atc_l4('c01d', 'propatylnitrate').
+atc_l4('c01d', 'propatylnitrate_combinations').
+atc_l4('c01d', 'serelaxin').
+atc_l4('c01d', 'tenitramine').
+atc_l4('c01d', 'trapidil').
+atc_l4('c01d', 'trolnitrate').
+atc_l4('c01d', 'trolnitrate_combinations').
+atc_l4('c01d', 'vericiguat').
+atc_l4('c01e', 'acadesine').
+atc_l4('c01e', 'adenosine').
+atc_l4('c01e', 'alprostadil').
+atc_l4('c01e', 'camphora').
+atc_l4('c01e', 'crataegus_glycosides').
+atc_l4('c01e', 'creatinolfosfate').
+atc_l4('c01e', 'fosfocreatine').
+atc_l4('c01e', 'fructose_1_6_diphosphate').
+atc_l4('c01e', 'ibuprofen').
+atc_l4('c01e', 'indometacin').
+atc_l4('c01e', 'ivabradine').
+atc_l4('c01e', 'mavacamten').
+atc_l4('c01e', 'meldonium').
+atc_l4('c01e', 'ranolazine').
+atc_l4('c01e', 'regadenoson').
+atc_l4('c01e', 'tiazotic_acid').
+atc_l4('c01e', 'tiracizine').
+atc_l4('c01e', 'trimetazidine').
+atc_l4('c01e', 'ubidecarenone').
+atc_l4('c02a', 'bietaserpine').
+atc_l4('c02a', 'bietaserpine_combinations').
+atc_l4('c02a', 'clonidine').
+atc_l4('c02a', 'combinations_of_rauwolfia_alkaloids').
+atc_l4('c02a', 'combinations_of_rauwolfia_alkoloids_combinations').
+atc_l4('c02a', 'deserpidine').
+atc_l4('c02a', 'guanfacine').
+atc_l4('c02a', 'methoserpidine').
+atc_l4('c02a', 'methyldopa_levorotatory').
+atc_l4('c02a', 'methyldopa_racemic').
+atc_l4('c02a', 'moxonidine').
+atc_l4('c02a', 'rauwolfia_alkaloids_whole_root').
+atc_l4('c02a', 'rescinnamine').
+atc_l4('c02a', 'reserpine').
+atc_l4('c02a', 'reserpine_combinations').
+atc_l4('c02a', 'rilmenidine').
+atc_l4('c02a', 'tolonidine').
+atc_l4('c02b', 'mecamylamine').
+atc_l4('c02b', 'trimetaphan').
+atc_l4('c02c', 'betanidine').
+atc_l4('c02c', 'debrisoquine').
+atc_l4('c02c', 'doxazosin').
+atc_l4('c02c', 'guanazodine').
+atc_l4('c02c', 'guanethidine').
+atc_l4('c02c', 'guanoclor').
+atc_l4('c02c', 'guanoxabenz').
+atc_l4('c02c', 'guanoxan').
+atc_l4('c02c', 'indoramin').
+atc_l4('c02c', 'prazosin').
+atc_l4('c02c', 'trimazosin').
+atc_l4('c02c', 'urapidil').
+atc_l4('c02d', 'cadralazine').
+atc_l4('c02d', 'diazoxide').
+atc_l4('c02d', 'dihydralazine').
+atc_l4('c02d', 'endralazine').
+atc_l4('c02d', 'hydralazine').
+atc_l4('c02d', 'minoxidil').
+atc_l4('c02d', 'nitroprusside').
+atc_l4('c02d', 'pinacidil').
+atc_l4('c02k', 'ambrisentan').
+atc_l4('c02k', 'ambrisentan_and_tadalafil').
+atc_l4('c02k', 'aprocitentan').
+atc_l4('c02k', 'bosentan').
+atc_l4('c02k', 'ketanserin').
+atc_l4('c02k', 'macitentan').
+atc_l4('c02k', 'macitentan_and_tadalafil').
+atc_l4('c02k', 'metirosine').
+atc_l4('c02k', 'pargyline').
+atc_l4('c02k', 'riociguat').
+atc_l4('c02k', 'sitaxentan').
+atc_l4('c02k', 'veratrum').
+atc_l4('c02l', 'bietaserpine_and_diuretics').
+atc_l4('c02l', 'clonidine_and_diuretics').
+atc_l4('c02l', 'clonidine_and_diuretics_combinations_with_other_drugs').
+atc_l4('c02l', 'combination_of_rauwolfia_alkaloids_and_diuretics_incl_other_combinations').
+atc_l4('c02l', 'deserpidine_and_diuretics').
+atc_l4('c02l', 'dihydralazine_and_diuretics').
+atc_l4('c02l', 'dihydralazine_and_diuretics_combinations_with_other_drugs').
+atc_l4('c02l', 'guanethidine_and_diuretics').
+atc_l4('c02l', 'hydralazine_and_diuretics').
+atc_l4('c02l', 'methoserpidine_and_diuretics').
+atc_l4('c02l', 'methyldopa_levorotatory_and_diuretics').
+atc_l4('c02l', 'moxonidine_and_diuretics').
+atc_l4('c02l', 'pargyline_and_diuretics').
+atc_l4('c02l', 'picodralazine_and_diuretics').
+atc_l4('c02l', 'picodralazine_and_diuretics_combinations_with_psycholeptics').
+atc_l4('c02l', 'pinacidil_and_diuretics').
+atc_l4('c02l', 'prazosin_and_diuretics').
+atc_l4('c02l', 'rauwolfia_alkaloids_whole_root_and_diuretics').
+atc_l4('c02l', 'rescinnamine_and_diuretics').
+atc_l4('c02l', 'rescinnamine_and_diuretics_combinations_with_other_drugs').
+atc_l4('c02l', 'reserpine_and_diuretics').
+atc_l4('c02l', 'reserpine_and_diuretics_combinations_with_other_drugs').
+atc_l4('c02l', 'reserpine_and_diuretics_combinations_with_psycholeptics').
+atc_l4('c02l', 'syrosingopine_and_diuretics').
+atc_l4('c02l', 'veratrum_and_diuretics').
+atc_l4('c03a', 'bendroflumethiazide').
+atc_l4('c03a', 'bendroflumethiazide_and_potassium').
+atc_l4('c03a', 'chlorothiazide').
+atc_l4('c03a', 'chlorothiazide_and_potassium').
+atc_l4('c03a', 'chlorothiazide_combinations').
+atc_l4('c03a', 'cyclopenthiazide').
+atc_l4('c03a', 'cyclopenthiazide_and_potassium').
+atc_l4('c03a', 'cyclothiazide').
+atc_l4('c03a', 'cyclothiazide_and_potassium').
+atc_l4('c03a', 'hydrochlorothiazide').
+atc_l4('c03a', 'hydrochlorothiazide_and_potassium').
+atc_l4('c03a', 'hydrochlorothiazide_combinations').
+atc_l4('c03a', 'hydroflumethiazide').
+atc_l4('c03a', 'hydroflumethiazide_and_potassium').
+atc_l4('c03a', 'hydroflumethiazide_combinations').
+atc_l4('c03a', 'mebutizide').
+atc_l4('c03a', 'methyclothiazide').
+atc_l4('c03a', 'methyclothiazide_and_potassium').
+atc_l4('c03a', 'polythiazide').
+atc_l4('c03a', 'polythiazide_and_potassium').
+atc_l4('c03a', 'trichlormethiazide').
+atc_l4('c03a', 'trichlormethiazide_and_potassium').
+atc_l4('c03b', 'chlortalidone').
+atc_l4('c03b', 'chlortalidone_and_potassium').
+atc_l4('c03b', 'cicletanine').
+atc_l4('c03b', 'clofenamide').
+atc_l4('c03b', 'clofenamide_and_potassium').
+atc_l4('c03b', 'clopamide').
+atc_l4('c03b', 'clopamide_and_potassium').
+atc_l4('c03b', 'clorexolone').
+atc_l4('c03b', 'clorexolone_combinations_with_psycholeptics').
+atc_l4('c03b', 'fenquizone').
+atc_l4('c03b', 'indapamide').
+atc_l4('c03b', 'mefruside').
+atc_l4('c03b', 'mefruside_and_potassium').
+atc_l4('c03b', 'mersalyl').
+atc_l4('c03b', 'meticrane').
+atc_l4('c03b', 'metolazone').
+atc_l4('c03b', 'quinethazone').
+atc_l4('c03b', 'quinethazone_and_potassium').
+atc_l4('c03b', 'theobromine').
+atc_l4('c03b', 'xipamide').
+atc_l4('c03c', 'bumetanide').
+atc_l4('c03c', 'bumetanide_and_potassium').
+atc_l4('c03c', 'etacrynic_acid').
+atc_l4('c03c', 'etozolin').
+atc_l4('c03c', 'furosemide').
+atc_l4('c03c', 'furosemide_and_potassium').
+atc_l4('c03c', 'muzolimine').
+atc_l4('c03c', 'piretanide').
+atc_l4('c03c', 'tienilic_acid').
+atc_l4('c03c', 'torasemide').
+atc_l4('c03d', 'amiloride').
+atc_l4('c03d', 'canrenone').
+atc_l4('c03d', 'eplerenone').
+atc_l4('c03d', 'finerenone').
+atc_l4('c03d', 'potassium_canrenoate').
+atc_l4('c03d', 'spironolactone').
+atc_l4('c03d', 'triamterene').
+atc_l4('c03e', 'altizide_and_potassium_sparing_agents').
+atc_l4('c03e', 'bendroflumethiazide_and_potassium_sparing_agents').
+atc_l4('c03e', 'bumetanide_and_potassium_sparing_agents').
+atc_l4('c03e', 'butizide_and_potassium_sparing_agents').
+atc_l4('c03e', 'chlortalidone_and_potassium_sparing_agents').
+atc_l4('c03e', 'cyclopenthiazide_and_potassium_sparing_agents').
+atc_l4('c03e', 'epitizide_and_potassium_sparing_agents').
+atc_l4('c03e', 'furosemide_and_potassium_sparing_agents').
+atc_l4('c03e', 'hydrochlorothiazide_and_potassium_sparing_agents').
+atc_l4('c03e', 'mebutizide_and_potassium_sparing_agents').
+atc_l4('c03e', 'metolazone_and_potassium_sparing_agents').
+atc_l4('c03e', 'trichlormethiazide_and_potassium_sparing_agents').
+atc_l4('c03x', 'conivaptan').
+atc_l4('c03x', 'tolvaptan').
+atc_l4('c04a', 'azapetine').
+atc_l4('c04a', 'bamethan').
+atc_l4('c04a', 'bencyclane').
+atc_l4('c04a', 'buflomedil').
+atc_l4('c04a', 'buphenine').
+atc_l4('c04a', 'butalamine').
+atc_l4('c04a', 'cetiedil').
+atc_l4('c04a', 'ciclonicate').
+atc_l4('c04a', 'cinepazide').
+atc_l4('c04a', 'clazosentan').
+atc_l4('c04a', 'cyclandelate').
+atc_l4('c04a', 'dihydroergocristine').
+atc_l4('c04a', 'dihydroergocristine_combinations').
+atc_l4('c04a', 'ergoloid_mesylates').
+atc_l4('c04a', 'ergoloid_mesylates_combinations').
+atc_l4('c04a', 'etofylline_nicotinate').
+atc_l4('c04a', 'fasudil').
+atc_l4('c04a', 'ifenprodil').
+atc_l4('c04a', 'inositol_nicotinate').
+atc_l4('c04a', 'isoxsuprine').
+atc_l4('c04a', 'kallidinogenase').
+atc_l4('c04a', 'moxisylyte').
+atc_l4('c04a', 'naftidrofuryl').
+atc_l4('c04a', 'nicergoline').
+atc_l4('c04a', 'nicotinic_acid').
+atc_l4('c04a', 'nicotinyl_alcohol_pyridylcarbinol').
+atc_l4('c04a', 'pentifylline').
+atc_l4('c04a', 'pentoxifylline').
+atc_l4('c04a', 'phenoxybenzamine').
+atc_l4('c04a', 'phentolamine').
+atc_l4('c04a', 'suloctidil').
+atc_l4('c04a', 'tolazoline').
+atc_l4('c04a', 'vinburnine').
+atc_l4('c04a', 'vincamine').
+atc_l4('c04a', 'visnadine').
+atc_l4('c04a', 'xantinol_nicotinate').
+atc_l4('c05a', 'aluminium_preparations').
+atc_l4('c05a', 'benzocaine').
+atc_l4('c05a', 'betamethasone').
+atc_l4('c05a', 'bismuth_preparations_combinations').
+atc_l4('c05a', 'cinchocaine').
+atc_l4('c05a', 'dexamethasone').
+atc_l4('c05a', 'diltiazem').
+atc_l4('c05a', 'fluocinolone_acetonide').
+atc_l4('c05a', 'fluocinonide').
+atc_l4('c05a', 'fluocortolone').
+atc_l4('c05a', 'fluorometholone').
+atc_l4('c05a', 'glyceryl_trinitrate').
+atc_l4('c05a', 'hydrocortisone').
+atc_l4('c05a', 'isosorbide_dinitrate').
+atc_l4('c05a', 'lidocaine').
+atc_l4('c05a', 'other_preparations_combinations').
+atc_l4('c05a', 'oxetacaine').
+atc_l4('c05a', 'phenylephrine').
+atc_l4('c05a', 'pramocaine').
+atc_l4('c05a', 'prednisolone').
+atc_l4('c05a', 'procaine').
+atc_l4('c05a', 'tetracaine').
+atc_l4('c05a', 'triamcinolone').
+atc_l4('c05a', 'tribenoside').
+atc_l4('c05a', 'zinc_preparations').
+atc_l4('c05b', 'calcium_dobesilate').
+atc_l4('c05b', 'calcium_dobesilate_combinations').
+atc_l4('c05b', 'glucose_combinations').
+atc_l4('c05b', 'heparin').
+atc_l4('c05b', 'heparin_combinations').
+atc_l4('c05b', 'heparinoid_combinations').
+atc_l4('c05b', 'invert_sugar').
+atc_l4('c05b', 'monoethanolamine_oleate').
+atc_l4('c05b', 'organo_heparinoid').
+atc_l4('c05b', 'pentosan_polysulfate_sodium').
+atc_l4('c05b', 'phenol').
+atc_l4('c05b', 'polidocanol').
+atc_l4('c05b', 'sodium_apolate').
+atc_l4('c05b', 'sodium_tetradecyl_sulfate').
+atc_l4('c05c', 'diosmin').
+atc_l4('c05c', 'diosmin_combinations').
+atc_l4('c05c', 'hidrosmin').
+atc_l4('c05c', 'hippocastani_semen').
+atc_l4('c05c', 'monoxerutin').
+atc_l4('c05c', 'naftazone').
+atc_l4('c05c', 'rutoside').
+atc_l4('c05c', 'rutoside_combinations').
+atc_l4('c05c', 'tribenoside').
+atc_l4('c05c', 'troxerutin').
+atc_l4('c05c', 'troxerutin_combinations').
+atc_l4('c05x', 'beperminogene_perplasmid').
+atc_l4('c07a', 'acebutolol').
+atc_l4('c07a', 'alprenolol').
+atc_l4('c07a', 'atenolol').
+atc_l4('c07a', 'betaxolol').
+atc_l4('c07a', 'bevantolol').
+atc_l4('c07a', 'bisoprolol').
+atc_l4('c07a', 'bopindolol').
+atc_l4('c07a', 'bupranolol').
+atc_l4('c07a', 'carteolol').
+atc_l4('c07a', 'carvedilol').
+atc_l4('c07a', 'celiprolol').
+atc_l4('c07a', 'cloranolol').
+atc_l4('c07a', 'epanolol').
+atc_l4('c07a', 'esmolol').
+atc_l4('c07a', 'labetalol').
+atc_l4('c07a', 'landiolol').
+atc_l4('c07a', 'mepindolol').
+atc_l4('c07a', 'metoprolol').
+atc_l4('c07a', 'nadolol').
+atc_l4('c07a', 'nebivolol').
+atc_l4('c07a', 'oxprenolol').
+atc_l4('c07a', 'penbutolol').
+atc_l4('c07a', 'pindolol').
+atc_l4('c07a', 'practolol').
+atc_l4('c07a', 'propranolol').
+atc_l4('c07a', 's_atenolol').
+atc_l4('c07a', 'sotalol').
+atc_l4('c07a', 'talinolol').
+atc_l4('c07a', 'tertatolol').
+atc_l4('c07a', 'timolol').
+atc_l4('c07b', 'acebutolol_and_thiazides').
+atc_l4('c07b', 'atenolol_and_thiazides').
+atc_l4('c07b', 'bevantolol_and_thiazides').
+atc_l4('c07b', 'bisoprolol_and_thiazides').
+atc_l4('c07b', 'labetalol_and_thiazides').
+atc_l4('c07b', 'metipranolol_and_thiazides_combinations').
+atc_l4('c07b', 'metoprolol_and_thiazides').
+atc_l4('c07b', 'metoprolol_and_thiazides_combinations').
+atc_l4('c07b', 'nadolol_and_thiazides').
+atc_l4('c07b', 'nebivolol_and_thiazides').
+atc_l4('c07b', 'oxprenolol_and_thiazides').
+atc_l4('c07b', 'propranolol_and_thiazides').
+atc_l4('c07b', 'sotalol_and_thiazides').
+atc_l4('c07b', 'timolol_and_thiazides').
+atc_l4('c07c', 'atenolol_and_other_diuretics').
+atc_l4('c07c', 'atenolol_and_other_diuretics_combinations').
+atc_l4('c07c', 'bopindolol_and_other_diuretics').
+atc_l4('c07c', 'labetalol_and_other_diuretics').
+atc_l4('c07c', 'metoprolol_and_other_diuretics').
+atc_l4('c07c', 'oxprenolol_and_other_diuretics').
+atc_l4('c07c', 'penbutolol_and_other_diuretics').
+atc_l4('c07c', 'pindolol_and_other_diuretics').
+atc_l4('c07d', 'atenolol_thiazides_and_other_diuretics').
+atc_l4('c07d', 'timolol_thiazides_and_other_diuretics').
+atc_l4('c07f', 'atenolol_and_nifedipine').
+atc_l4('c07f', 'bisoprolol_and_acetylsalicylic_acid').
+atc_l4('c07f', 'bisoprolol_and_amlodipine').
+atc_l4('c07f', 'carvedilol_and_ivabradine').
+atc_l4('c07f', 'metoprolol_and_acetylsalicylic_acid').
+atc_l4('c07f', 'metoprolol_and_amlodipine').
+atc_l4('c07f', 'metoprolol_and_felodipine').
+atc_l4('c07f', 'metoprolol_and_ivabradine').
+atc_l4('c07f', 'nebivolol_and_amlodipine').
+atc_l4('c07f', 'propranolol_and_other_combinations').
+atc_l4('c07f', 'sotalol_and_acetylsalicylic_acid').
+atc_l4('c08c', 'amlodipine').
+atc_l4('c08c', 'amlodipine_and_celecoxib').
+atc_l4('c08c', 'barnidipine').
+atc_l4('c08c', 'benidipine').
+atc_l4('c08c', 'cilnidipine').
+atc_l4('c08c', 'clevidipine').
+atc_l4('c08c', 'felodipine').
+atc_l4('c08c', 'isradipine').
+atc_l4('c08c', 'lacidipine').
+atc_l4('c08c', 'lercanidipine').
+atc_l4('c08c', 'levamlodipine').
+atc_l4('c08c', 'manidipine').
+atc_l4('c08c', 'mibefradil').
+atc_l4('c08c', 'nicardipine').
+atc_l4('c08c', 'nifedipine').
+atc_l4('c08c', 'nifedipine_combinations').
+atc_l4('c08c', 'nilvadipine').
+atc_l4('c08c', 'nimodipine').
+atc_l4('c08c', 'nisoldipine').
+atc_l4('c08c', 'nitrendipine').
+atc_l4('c08d', 'diltiazem').
+atc_l4('c08d', 'gallopamil').
+atc_l4('c08d', 'verapamil').
+atc_l4('c08d', 'verapamil_combinations').
+atc_l4('c08e', 'bepridil').
+atc_l4('c08e', 'fendiline').
+atc_l4('c08e', 'lidoflazine').
+atc_l4('c08e', 'perhexiline').
+atc_l4('c08g', 'amlodipine_and_diuretics').
+atc_l4('c08g', 'nifedipine_and_diuretics').
+atc_l4('c09a', 'benazepril').
+atc_l4('c09a', 'captopril').
+atc_l4('c09a', 'cilazapril').
+atc_l4('c09a', 'delapril').
+atc_l4('c09a', 'enalapril').
+atc_l4('c09a', 'fosinopril').
+atc_l4('c09a', 'imidapril').
+atc_l4('c09a', 'lisinopril').
+atc_l4('c09a', 'moexipril').
+atc_l4('c09a', 'perindopril').
+atc_l4('c09a', 'quinapril').
+atc_l4('c09a', 'ramipril').
+atc_l4('c09a', 'spirapril').
+atc_l4('c09a', 'temocapril').
+atc_l4('c09a', 'trandolapril').
+atc_l4('c09a', 'zofenopril').
+atc_l4('c09b', 'benazepril_and_amlodipine').
+atc_l4('c09b', 'benazepril_and_diuretics').
+atc_l4('c09b', 'captopril_and_diuretics').
+atc_l4('c09b', 'cilazapril_and_diuretics').
+atc_l4('c09b', 'delapril_and_diuretics').
+atc_l4('c09b', 'delapril_and_manidipine').
+atc_l4('c09b', 'enalapril_and_diuretics').
+atc_l4('c09b', 'enalapril_and_lercanidipine').
+atc_l4('c09b', 'enalapril_and_nitrendipine').
+atc_l4('c09b', 'fosinopril_and_diuretics').
+atc_l4('c09b', 'lisinopril_and_amlodipine').
+atc_l4('c09b', 'lisinopril_and_diuretics').
+atc_l4('c09b', 'moexipril_and_diuretics').
+atc_l4('c09b', 'perindopril_amlodipine_and_indapamide').
+atc_l4('c09b', 'perindopril_and_amlodipine').
+atc_l4('c09b', 'perindopril_and_bisoprolol').
+atc_l4('c09b', 'perindopril_and_diuretics').
+atc_l4('c09b', 'perindopril_bisoprolol_amlodipine_and_indapamide').
+atc_l4('c09b', 'perindopril_bisoprolol_and_amlodipine').
+atc_l4('c09b', 'quinapril_and_diuretics').
+atc_l4('c09b', 'ramipril_amlodipine_and_hydrochlorothiazide').
+atc_l4('c09b', 'ramipril_and_amlodipine').
+atc_l4('c09b', 'ramipril_and_bisoprolol').
+atc_l4('c09b', 'ramipril_and_diuretics').
+atc_l4('c09b', 'ramipril_and_felodipine').
+atc_l4('c09b', 'trandolapril_and_verapamil').
+atc_l4('c09b', 'zofenopril_and_diuretics').
+atc_l4('c09b', 'zofenopril_and_nebivolol').
+atc_l4('c09c', 'azilsartan_medoxomil').
+atc_l4('c09c', 'candesartan').
+atc_l4('c09c', 'eprosartan').
+atc_l4('c09c', 'fimasartan').
+atc_l4('c09c', 'irbesartan').
+atc_l4('c09c', 'losartan').
+atc_l4('c09c', 'olmesartan_medoxomil').
+atc_l4('c09c', 'tasosartan').
+atc_l4('c09c', 'telmisartan').
+atc_l4('c09c', 'valsartan').
+atc_l4('c09d', 'azilsartan_medoxomil_and_diuretics').
+atc_l4('c09d', 'candesartan_amlodipine_and_hydrochlorothiazide').
+atc_l4('c09d', 'candesartan_and_amlodipine').
+atc_l4('c09d', 'candesartan_and_diuretics').
+atc_l4('c09d', 'eprosartan_and_diuretics').
+atc_l4('c09d', 'fimasartan_and_amlodipine').
+atc_l4('c09d', 'fimasartan_and_diuretics').
+atc_l4('c09d', 'irbesartan_amlodipine_and_hydrochlorothiazide').
+atc_l4('c09d', 'irbesartan_and_amlodipine').
+atc_l4('c09d', 'irbesartan_and_diuretics').
+atc_l4('c09d', 'losartan_and_amlodipine').
+atc_l4('c09d', 'losartan_and_diuretics').
+atc_l4('c09d', 'olmesartan_medoxomil_amlodipine_and_hydrochlorothiazide').
+atc_l4('c09d', 'olmesartan_medoxomil_and_amlodipine').
+atc_l4('c09d', 'olmesartan_medoxomil_and_diuretics').
+atc_l4('c09d', 'telmisartan_amlodipine_and_hydrochlorothiazide').
+atc_l4('c09d', 'telmisartan_and_amlodipine').
+atc_l4('c09d', 'telmisartan_and_diuretics').
+atc_l4('c09d', 'valsartan_amlodipine_and_hydrochlorothiazide').
+atc_l4('c09d', 'valsartan_and_aliskiren').
+atc_l4('c09d', 'valsartan_and_amlodipine').
+atc_l4('c09d', 'valsartan_and_diuretics').
+atc_l4('c09d', 'valsartan_and_lercanidipine').
+atc_l4('c09d', 'valsartan_and_nebivolol').
+atc_l4('c09d', 'valsartan_and_sacubitril').
+atc_l4('c09x', 'aliskiren').
+atc_l4('c09x', 'aliskiren_amlodipine_and_hydrochlorothiazide').
+atc_l4('c09x', 'aliskiren_and_amlodipine').
+atc_l4('c09x', 'aliskiren_and_hydrochlorothiazide').
+atc_l4('c09x', 'remikiren').
+atc_l4('c10a', 'acipimox').
+atc_l4('c10a', 'alipogene_tiparvovec').
+atc_l4('c10a', 'alirocumab').
+atc_l4('c10a', 'aluminium_clofibrate').
+atc_l4('c10a', 'aluminium_nicotinate').
+atc_l4('c10a', 'atorvastatin').
+atc_l4('c10a', 'bempedoic_acid').
+atc_l4('c10a', 'bezafibrate').
+atc_l4('c10a', 'cerivastatin').
+atc_l4('c10a', 'choline_fenofibrate').
+atc_l4('c10a', 'ciprofibrate').
+atc_l4('c10a', 'clofibrate').
+atc_l4('c10a', 'clofibride').
+atc_l4('c10a', 'colesevelam').
+atc_l4('c10a', 'colestipol').
+atc_l4('c10a', 'colestyramine').
+atc_l4('c10a', 'colextran').
+atc_l4('c10a', 'dextrothyroxine').
+atc_l4('c10a', 'etofibrate').
+atc_l4('c10a', 'evinacumab').
+atc_l4('c10a', 'evolocumab').
+atc_l4('c10a', 'ezetimibe').
+atc_l4('c10a', 'fenofibrate').
+atc_l4('c10a', 'fluvastatin').
+atc_l4('c10a', 'gemfibrozil').
+atc_l4('c10a', 'inclisiran').
+atc_l4('c10a', 'lomitapide').
+atc_l4('c10a', 'lovastatin').
+atc_l4('c10a', 'magnesium_pyridoxal_5_phosphate_glutamate').
+atc_l4('c10a', 'meglutol').
+atc_l4('c10a', 'mipomersen').
+atc_l4('c10a', 'niceritrol').
+atc_l4('c10a', 'nicofuranose').
+atc_l4('c10a', 'nicotinic_acid').
+atc_l4('c10a', 'nicotinic_acid_combinations').
+atc_l4('c10a', 'nicotinyl_alcohol_pyridylcarbinol').
+atc_l4('c10a', 'omega_3_triglycerides_incl_other_esters_and_acids').
+atc_l4('c10a', 'pemafibrate').
+atc_l4('c10a', 'pitavastatin').
+atc_l4('c10a', 'policosanol').
+atc_l4('c10a', 'pravastatin').
+atc_l4('c10a', 'probucol').
+atc_l4('c10a', 'ronifibrate').
+atc_l4('c10a', 'rosuvastatin').
+atc_l4('c10a', 'simfibrate').
+atc_l4('c10a', 'simvastatin').
+atc_l4('c10a', 'tiadenol').
+atc_l4('c10a', 'volanesorsen').
+atc_l4('c10b', 'atorvastatin_acetylsalicylic_acid_and_perindopril').
+atc_l4('c10b', 'atorvastatin_acetylsalicylic_acid_and_ramipril').
+atc_l4('c10b', 'atorvastatin_amlodipine_and_candesartan').
+atc_l4('c10b', 'atorvastatin_amlodipine_and_perindopril').
+atc_l4('c10b', 'atorvastatin_amlodipine_and_ramipril').
+atc_l4('c10b', 'atorvastatin_and_acetylsalicylic_acid').
+atc_l4('c10b', 'atorvastatin_and_amlodipine').
+atc_l4('c10b', 'atorvastatin_and_ezetimibe').
+atc_l4('c10b', 'atorvastatin_and_omega_3_fatty_acids').
+atc_l4('c10b', 'atorvastatin_and_perindopril').
+atc_l4('c10b', 'bempedoic_acid_and_ezetimibe').
+atc_l4('c10b', 'lovastatin_and_nicotinic_acid').
+atc_l4('c10b', 'pravastatin_and_acetylsalicylic_acid').
+atc_l4('c10b', 'pravastatin_and_ezetimibe').
+atc_l4('c10b', 'pravastatin_and_fenofibrate').
+atc_l4('c10b', 'pravastatin_ezetimibe_and_fenofibrate').
+atc_l4('c10b', 'rosuvastatin_amlodipine_and_lisinopril').
+atc_l4('c10b', 'rosuvastatin_amlodipine_and_perindopril').
+atc_l4('c10b', 'rosuvastatin_and_acetylsalicylic_acid').
+atc_l4('c10b', 'rosuvastatin_and_amlodipine').
+atc_l4('c10b', 'rosuvastatin_and_ezetimibe').
+atc_l4('c10b', 'rosuvastatin_and_fenofibrate').
+atc_l4('c10b', 'rosuvastatin_and_fimasartan').
+atc_l4('c10b', 'rosuvastatin_and_omega_3_fatty_acids').
+atc_l4('c10b', 'rosuvastatin_and_perindopril').
+atc_l4('c10b', 'rosuvastatin_and_ramipril').
+atc_l4('c10b', 'rosuvastatin_and_telmisartan').
+atc_l4('c10b', 'rosuvastatin_and_valsartan').
+atc_l4('c10b', 'rosuvastatin_perindopril_and_indapamide').
+atc_l4('c10b', 'simvastatin_acetylsalicylic_acid_and_ramipril').
+atc_l4('c10b', 'simvastatin_and_acetylsalicylic_acid').
+atc_l4('c10b', 'simvastatin_and_ezetimibe').
+atc_l4('c10b', 'simvastatin_and_fenofibrate').
+atc_l4('d01a', 'amorolfine').
+atc_l4('d01a', 'bifonazole').
+atc_l4('d01a', 'bifonazole_combinations').
+atc_l4('d01a', 'bromochlorosalicylanilide').
+atc_l4('d01a', 'butenafine').
+atc_l4('d01a', 'chlormidazole').
+atc_l4('d01a', 'chlorphenesin').
+atc_l4('d01a', 'ciclopirox').
+atc_l4('d01a', 'clotrimazole').
+atc_l4('d01a', 'combinations').
+atc_l4('d01a', 'dimazole').
+atc_l4('d01a', 'eberconazole').
+atc_l4('d01a', 'econazole').
+atc_l4('d01a', 'efinaconazole').
+atc_l4('d01a', 'ethyl_hydroxybenzoate').
+atc_l4('d01a', 'fenticonazole').
+atc_l4('d01a', 'fluconazole').
+atc_l4('d01a', 'flucytosine').
+atc_l4('d01a', 'flutrimazole').
+atc_l4('d01a', 'griseofulvin').
+atc_l4('d01a', 'hachimycin').
+atc_l4('d01a', 'haloprogin').
+atc_l4('d01a', 'imidazoles_triazoles_in_combination_with_corticosteroids').
+atc_l4('d01a', 'isoconazole').
+atc_l4('d01a', 'ketoconazole').
+atc_l4('d01a', 'lanoconazole').
+atc_l4('d01a', 'liranaftate').
+atc_l4('d01a', 'luliconazole').
+atc_l4('d01a', 'mepartricin').
+atc_l4('d01a', 'methylrosaniline').
+atc_l4('d01a', 'miconazole').
+atc_l4('d01a', 'miconazole_combinations').
+atc_l4('d01a', 'n_2_4_chlorphenoxy_ethanol').
+atc_l4('d01a', 'naftifine').
+atc_l4('d01a', 'natamycin').
+atc_l4('d01a', 'neticonazole').
+atc_l4('d01a', 'nystatin').
+atc_l4('d01a', 'omoconazole').
+atc_l4('d01a', 'oxiconazole').
+atc_l4('d01a', 'pecilocin').
+atc_l4('d01a', 'polynoxylin').
+atc_l4('d01a', 'pyrrolnitrin').
+atc_l4('d01a', 'salicylic_acid').
+atc_l4('d01a', 'selenium_sulfide').
+atc_l4('d01a', 'sertaconazole').
+atc_l4('d01a', 'sulbentine').
+atc_l4('d01a', 'sulconazole').
+atc_l4('d01a', 'tavaborole').
+atc_l4('d01a', 'terbinafine').
+atc_l4('d01a', 'tiabendazole').
+atc_l4('d01a', 'ticlatone').
+atc_l4('d01a', 'tioconazole').
+atc_l4('d01a', 'tolciclate').
+atc_l4('d01a', 'tolnaftate').
+atc_l4('d01a', 'tribromometacresol').
+atc_l4('d01a', 'undecylenic_acid').
+atc_l4('d01a', 'undecylenic_acid_combinations').
+atc_l4('d01b', 'fosravuconazole').
+atc_l4('d01b', 'griseofulvin').
+atc_l4('d01b', 'terbinafine').
+atc_l4('d02a', 'carbamide').
+atc_l4('d02a', 'carbamide_combinations').
+atc_l4('d02b', 'afamelanotide').
+atc_l4('d02b', 'aminobenzoic_acid').
+atc_l4('d02b', 'betacarotene').
+atc_l4('d02b', 'octinoxate').
+atc_l4('d03a', 'becaplermin').
+atc_l4('d03a', 'beremagene_geperpavec').
+atc_l4('d03a', 'betulae_cortex').
+atc_l4('d03a', 'cadexomer_iodine').
+atc_l4('d03a', 'calcium_pantothenate').
+atc_l4('d03a', 'centella_asiatica_herba_incl_combinations').
+atc_l4('d03a', 'crilanomer').
+atc_l4('d03a', 'dexpanthenol').
+atc_l4('d03a', 'dextranomer').
+atc_l4('d03a', 'enoxolone').
+atc_l4('d03a', 'hyaluronic_acid').
+atc_l4('d03a', 'sodium_chlorite').
+atc_l4('d03a', 'trafermin').
+atc_l4('d03a', 'trolamine').
+atc_l4('d03b', 'bromelains').
+atc_l4('d03b', 'collagenase').
+atc_l4('d03b', 'collagenase_combinations').
+atc_l4('d03b', 'trypsin').
+atc_l4('d04a', 'bamipine').
+atc_l4('d04a', 'benzocaine').
+atc_l4('d04a', 'chloropyramine').
+atc_l4('d04a', 'chlorphenoxamine').
+atc_l4('d04a', 'cinchocaine').
+atc_l4('d04a', 'clemastine').
+atc_l4('d04a', 'dimetindene').
+atc_l4('d04a', 'diphenhydramine').
+atc_l4('d04a', 'diphenhydramine_methylbromide').
+atc_l4('d04a', 'doxepin').
+atc_l4('d04a', 'isothipendyl').
+atc_l4('d04a', 'lidocaine').
+atc_l4('d04a', 'mepyramine').
+atc_l4('d04a', 'oxybuprocaine').
+atc_l4('d04a', 'pheniramine').
+atc_l4('d04a', 'pramocaine').
+atc_l4('d04a', 'promethazine').
+atc_l4('d04a', 'quinisocaine').
+atc_l4('d04a', 'tetracaine').
+atc_l4('d04a', 'thenalidine').
+atc_l4('d04a', 'thonzylamine').
+atc_l4('d04a', 'tolpropamine').
+atc_l4('d04a', 'tripelennamine').
+atc_l4('d05a', 'calcipotriol').
+atc_l4('d05a', 'calcipotriol_combinations').
+atc_l4('d05a', 'calcitriol').
+atc_l4('d05a', 'dithranol').
+atc_l4('d05a', 'dithranol_combinations').
+atc_l4('d05a', 'fumaric_acid').
+atc_l4('d05a', 'methoxsalen').
+atc_l4('d05a', 'roflumilast').
+atc_l4('d05a', 'tacalcitol').
+atc_l4('d05a', 'tapinarof').
+atc_l4('d05a', 'tazarotene').
+atc_l4('d05a', 'tazarotene_and_ulobetasol').
+atc_l4('d05a', 'trioxysalen').
+atc_l4('d05b', 'acitretin').
+atc_l4('d05b', 'bergapten').
+atc_l4('d05b', 'etretinate').
+atc_l4('d05b', 'fumaric_acid_derivatives_combinations').
+atc_l4('d05b', 'methoxsalen').
+atc_l4('d05b', 'trioxysalen').
+atc_l4('d06a', 'amikacin').
+atc_l4('d06a', 'bacitracin').
+atc_l4('d06a', 'chloramphenicol').
+atc_l4('d06a', 'chlortetracycline').
+atc_l4('d06a', 'demeclocycline').
+atc_l4('d06a', 'fusidic_acid').
+atc_l4('d06a', 'gentamicin').
+atc_l4('d06a', 'mupirocin').
+atc_l4('d06a', 'neomycin').
+atc_l4('d06a', 'oxytetracycline').
+atc_l4('d06a', 'ozenoxacin').
+atc_l4('d06a', 'retapamulin').
+atc_l4('d06a', 'rifamycin').
+atc_l4('d06a', 'rifaximin').
+atc_l4('d06a', 'tetracycline').
+atc_l4('d06a', 'tyrothricin').
+atc_l4('d06a', 'virginiamycin').
+atc_l4('d06b', 'aciclovir').
+atc_l4('d06b', 'aciclovir_combinations').
+atc_l4('d06b', 'docosanol').
+atc_l4('d06b', 'edoxudine').
+atc_l4('d06b', 'ibacitabine').
+atc_l4('d06b', 'idoxuridine').
+atc_l4('d06b', 'imiquimod').
+atc_l4('d06b', 'ingenol_mebutate').
+atc_l4('d06b', 'inosine').
+atc_l4('d06b', 'lysozyme').
+atc_l4('d06b', 'mafenide').
+atc_l4('d06b', 'metronidazole').
+atc_l4('d06b', 'penciclovir').
+atc_l4('d06b', 'podophyllotoxin').
+atc_l4('d06b', 'silver_sulfadiazine').
+atc_l4('d06b', 'silver_sulfadiazine_combinations').
+atc_l4('d06b', 'sinecatechins').
+atc_l4('d06b', 'sulfamerazine').
+atc_l4('d06b', 'sulfamethizole').
+atc_l4('d06b', 'sulfanilamide').
+atc_l4('d06b', 'sulfathiazole').
+atc_l4('d06b', 'tirbanibulin').
+atc_l4('d06b', 'tromantadine').
+atc_l4('d07a', 'alclometasone').
+atc_l4('d07a', 'amcinonide').
+atc_l4('d07a', 'beclometasone').
+atc_l4('d07a', 'betamethasone').
+atc_l4('d07a', 'budesonide').
+atc_l4('d07a', 'clobetasol').
+atc_l4('d07a', 'clobetasone').
+atc_l4('d07a', 'clocortolone').
+atc_l4('d07a', 'combinations_of_corticosteroids').
+atc_l4('d07a', 'desonide').
+atc_l4('d07a', 'desoximetasone').
+atc_l4('d07a', 'dexamethasone').
+atc_l4('d07a', 'diflorasone').
+atc_l4('d07a', 'diflucortolone').
+atc_l4('d07a', 'difluprednate').
+atc_l4('d07a', 'fluclorolone').
+atc_l4('d07a', 'fludroxycortide').
+atc_l4('d07a', 'flumetasone').
+atc_l4('d07a', 'fluocinolone_acetonide').
+atc_l4('d07a', 'fluocinonide').
+atc_l4('d07a', 'fluocortin').
+atc_l4('d07a', 'fluocortolone').
+atc_l4('d07a', 'fluorometholone').
+atc_l4('d07a', 'fluperolone').
+atc_l4('d07a', 'fluprednidene').
+atc_l4('d07a', 'fluticasone').
+atc_l4('d07a', 'halcinonide').
+atc_l4('d07a', 'halometasone').
+atc_l4('d07a', 'hydrocortisone').
+atc_l4('d07a', 'hydrocortisone_aceponate').
+atc_l4('d07a', 'hydrocortisone_buteprate').
+atc_l4('d07a', 'hydrocortisone_butyrate').
+atc_l4('d07a', 'methylprednisolone').
+atc_l4('d07a', 'methylprednisolone_aceponate').
+atc_l4('d07a', 'mometasone').
+atc_l4('d07a', 'prednicarbate').
+atc_l4('d07a', 'prednisolone').
+atc_l4('d07a', 'triamcinolone').
+atc_l4('d07a', 'ulobetasol').
+atc_l4('d07b', 'betamethasone_and_antiseptics').
+atc_l4('d07b', 'desonide_and_antiseptics').
+atc_l4('d07b', 'diflucortolone_and_antiseptics').
+atc_l4('d07b', 'flumetasone_and_antiseptics').
+atc_l4('d07b', 'fluocinolone_acetonide_and_antiseptics').
+atc_l4('d07b', 'fluocortolone_and_antiseptics').
+atc_l4('d07b', 'hydrocortisone_and_antiseptics').
+atc_l4('d07b', 'hydrocortisone_butyrate_and_antiseptics').
+atc_l4('d07b', 'prednisolone_and_antiseptics').
+atc_l4('d07b', 'triamcinolone_and_antiseptics').
+atc_l4('d07c', 'beclometasone_and_antibiotics').
+atc_l4('d07c', 'betamethasone_and_antibiotics').
+atc_l4('d07c', 'clobetasol_and_antibiotics').
+atc_l4('d07c', 'dexamethasone_and_antibiotics').
+atc_l4('d07c', 'fludroxycortide_and_antibiotics').
+atc_l4('d07c', 'flumetasone_and_antibiotics').
+atc_l4('d07c', 'fluocinolone_acetonide_and_antibiotics').
+atc_l4('d07c', 'fluocinonide_and_antibiotics').
+atc_l4('d07c', 'fluocortolone_and_antibiotics').
+atc_l4('d07c', 'fluorometholone_and_antibiotics').
+atc_l4('d07c', 'fluprednidene_and_antibiotics').
+atc_l4('d07c', 'hydrocortisone_and_antibiotics').
+atc_l4('d07c', 'methylprednisolone_and_antibiotics').
+atc_l4('d07c', 'prednisolone_and_antibiotics').
+atc_l4('d07c', 'triamcinolone_and_antibiotics').
+atc_l4('d07x', 'betamethasone').
+atc_l4('d07x', 'combinations_of_corticosteroids').
+atc_l4('d07x', 'desoximetasone').
+atc_l4('d07x', 'dexamethasone').
+atc_l4('d07x', 'diflucortolone').
+atc_l4('d07x', 'flumetasone').
+atc_l4('d07x', 'fluocortolone').
+atc_l4('d07x', 'fluorometholone').
+atc_l4('d07x', 'fluprednidene').
+atc_l4('d07x', 'hydrocortisone').
+atc_l4('d07x', 'mometasone').
+atc_l4('d07x', 'prednisolone').
+atc_l4('d07x', 'triamcinolone').
+atc_l4('d08a', 'aminoacridine').
+atc_l4('d08a', 'benzalkonium').
+atc_l4('d08a', 'benzethonium_chloride').
+atc_l4('d08a', 'benzethonium_chloride_combinations').
+atc_l4('d08a', 'benzoxonium_chloride').
+atc_l4('d08a', 'biphenylol').
+atc_l4('d08a', 'cetrimide').
+atc_l4('d08a', 'cetrimonium').
+atc_l4('d08a', 'cetylpyridinium').
+atc_l4('d08a', 'chlorhexidine').
+atc_l4('d08a', 'chlorhexidine_combinations').
+atc_l4('d08a', 'chloroxylenol').
+atc_l4('d08a', 'chlorquinaldol').
+atc_l4('d08a', 'clioquinol').
+atc_l4('d08a', 'decamethoxine').
+atc_l4('d08a', 'dequalinium').
+atc_l4('d08a', 'dibrompropamidine').
+atc_l4('d08a', 'didecyldimethylammonium_chloride').
+atc_l4('d08a', 'diiodohydroxypropane').
+atc_l4('d08a', 'dodeclonium_bromide_combinations').
+atc_l4('d08a', 'eosin').
+atc_l4('d08a', 'ethacridine_lactate').
+atc_l4('d08a', 'ethanol').
+atc_l4('d08a', 'euflavine').
+atc_l4('d08a', 'hexachlorophene').
+atc_l4('d08a', 'hexamidine').
+atc_l4('d08a', 'hydrogen_peroxide').
+atc_l4('d08a', 'iodine').
+atc_l4('d08a', 'iodine_octylphenoxypolyglycolether').
+atc_l4('d08a', 'isopropanol').
+atc_l4('d08a', 'merbromin').
+atc_l4('d08a', 'mercuric_amidochloride').
+atc_l4('d08a', 'mercuric_chloride').
+atc_l4('d08a', 'mercuric_iodide').
+atc_l4('d08a', 'mercury_metallic').
+atc_l4('d08a', 'nitrofural').
+atc_l4('d08a', 'octenidine_combinations').
+atc_l4('d08a', 'oxyquinoline').
+atc_l4('d08a', 'phenol').
+atc_l4('d08a', 'phenylmercuric_borate').
+atc_l4('d08a', 'policresulen').
+atc_l4('d08a', 'polihexanide').
+atc_l4('d08a', 'potassium_permanganate').
+atc_l4('d08a', 'povidone_iodine').
+atc_l4('d08a', 'propamidine').
+atc_l4('d08a', 'propanol').
+atc_l4('d08a', 'propanol_combinations').
+atc_l4('d08a', 'silver').
+atc_l4('d08a', 'silver_nitrate').
+atc_l4('d08a', 'sodium_hypochlorite').
+atc_l4('d08a', 'thiomersal').
+atc_l4('d08a', 'tosylchloramide_sodium').
+atc_l4('d08a', 'triclosan').
+atc_l4('d09a', 'aluminium_chlorohydrate').
+atc_l4('d09a', 'benzalkonium').
+atc_l4('d09a', 'benzododecinium').
+atc_l4('d09a', 'cetylpyridinium').
+atc_l4('d09a', 'chlorhexidine').
+atc_l4('d09a', 'clioquinol').
+atc_l4('d09a', 'framycetin').
+atc_l4('d09a', 'fusidic_acid').
+atc_l4('d09a', 'iodoform').
+atc_l4('d09a', 'nitrofural').
+atc_l4('d09a', 'phenylmercuric_nitrate').
+atc_l4('d09a', 'povidone_iodine').
+atc_l4('d09a', 'triclosan').
+atc_l4('d09a', 'zinc_bandage_with_supplements').
+atc_l4('d09a', 'zinc_bandage_without_supplements').
+atc_l4('d10a', 'adapalene').
+atc_l4('d10a', 'adapalene_combinations').
+atc_l4('d10a', 'aluminium_chloride').
+atc_l4('d10a', 'aluminium_oxide').
+atc_l4('d10a', 'azelaic_acid').
+atc_l4('d10a', 'benzoyl_peroxide').
+atc_l4('d10a', 'benzoyl_peroxide_combinations').
+atc_l4('d10a', 'bithionol').
+atc_l4('d10a', 'chloramphenicol').
+atc_l4('d10a', 'clascoterone').
+atc_l4('d10a', 'clindamycin').
+atc_l4('d10a', 'clindamycin_combinations').
+atc_l4('d10a', 'dapsone').
+atc_l4('d10a', 'dexamethasone').
+atc_l4('d10a', 'erythromycin').
+atc_l4('d10a', 'erythromycin_combinations').
+atc_l4('d10a', 'fluorometholone').
+atc_l4('d10a', 'isotretinoin').
+atc_l4('d10a', 'isotretinoin_combinations').
+atc_l4('d10a', 'meclocycline').
+atc_l4('d10a', 'mesulfen').
+atc_l4('d10a', 'methylprednisolone').
+atc_l4('d10a', 'minocycline').
+atc_l4('d10a', 'motretinide').
+atc_l4('d10a', 'nadifloxacin').
+atc_l4('d10a', 'resorcinol').
+atc_l4('d10a', 'retinol').
+atc_l4('d10a', 'sulfacetamide').
+atc_l4('d10a', 'sulfur').
+atc_l4('d10a', 'tioxolone').
+atc_l4('d10a', 'tretinoin').
+atc_l4('d10a', 'tretinoin_combinations').
+atc_l4('d10a', 'trifarotene').
+atc_l4('d10a', 'various_combinations').
+atc_l4('d10b', 'ichtasol').
+atc_l4('d10b', 'isotretinoin').
+atc_l4('d11a', 'abrocitinib').
+atc_l4('d11a', 'alitretinoin').
+atc_l4('d11a', 'aminobenzoate_potassium').
+atc_l4('d11a', 'brimonidine').
+atc_l4('d11a', 'cadmium_compounds').
+atc_l4('d11a', 'caffeine').
+atc_l4('d11a', 'calcium_gluconate').
+atc_l4('d11a', 'cetrimide').
+atc_l4('d11a', 'collagen_combinations').
+atc_l4('d11a', 'crisaborole').
+atc_l4('d11a', 'cromoglicic_acid').
+atc_l4('d11a', 'delgocitinib').
+atc_l4('d11a', 'deoxycholic_acid').
+atc_l4('d11a', 'diclofenac').
+atc_l4('d11a', 'dupilumab').
+atc_l4('d11a', 'eflornithine').
+atc_l4('d11a', 'finasteride').
+atc_l4('d11a', 'gamolenic_acid').
+atc_l4('d11a', 'gamolenic_acid_combinations').
+atc_l4('d11a', 'glycopyrronium').
+atc_l4('d11a', 'hydrogen_peroxide').
+atc_l4('d11a', 'hydroquinone').
+atc_l4('d11a', 'ivermectin').
+atc_l4('d11a', 'lebrikizumab').
+atc_l4('d11a', 'lithium_succinate').
+atc_l4('d11a', 'magnesium_sulfate').
+atc_l4('d11a', 'mequinol').
+atc_l4('d11a', 'metandienone').
+atc_l4('d11a', 'minoxidil').
+atc_l4('d11a', 'monobenzone').
+atc_l4('d11a', 'nemolizumab').
+atc_l4('d11a', 'others').
+atc_l4('d11a', 'oxaceprol').
+atc_l4('d11a', 'oxymetazoline').
+atc_l4('d11a', 'pimecrolimus').
+atc_l4('d11a', 'povidone_iodine').
+atc_l4('d11a', 'pyrithione_zinc').
+atc_l4('d11a', 'ruxolitinib').
+atc_l4('d11a', 'selenium_compounds').
+atc_l4('d11a', 'sulfur_compounds').
+atc_l4('d11a', 'tacrolimus').
+atc_l4('d11a', 'tiratricol').
+atc_l4('d11a', 'tralokinumab').
+atc_l4('d11a', 'xenysalate').
+atc_l4('g01a', 'acetarsol').
+atc_l4('g01a', 'acetic_acid').
+atc_l4('g01a', 'amphotericin_b').
+atc_l4('g01a', 'ascorbic_acid').
+atc_l4('g01a', 'azanidazole').
+atc_l4('g01a', 'broxyquinoline').
+atc_l4('g01a', 'butoconazole').
+atc_l4('g01a', 'candicidin').
+atc_l4('g01a', 'carfecillin').
+atc_l4('g01a', 'chloramphenicol').
+atc_l4('g01a', 'chlorquinaldol').
+atc_l4('g01a', 'ciclopirox').
+atc_l4('g01a', 'clindamycin').
+atc_l4('g01a', 'clioquinol').
+atc_l4('g01a', 'clodantoin').
+atc_l4('g01a', 'clotrimazole').
+atc_l4('g01a', 'combinations_of_imidazole_derivatives').
+atc_l4('g01a', 'combinations_of_sulfonamides').
+atc_l4('g01a', 'copper_usnate').
+atc_l4('g01a', 'dapivirine').
+atc_l4('g01a', 'dequalinium').
+atc_l4('g01a', 'diiodohydroxyquinoline').
+atc_l4('g01a', 'econazole').
+atc_l4('g01a', 'econazole_combinations').
+atc_l4('g01a', 'fenticonazole').
+atc_l4('g01a', 'flutrimazole').
+atc_l4('g01a', 'furazolidone').
+atc_l4('g01a', 'hachimycin').
+atc_l4('g01a', 'hexetidine').
+atc_l4('g01a', 'inosine').
+atc_l4('g01a', 'isoconazole').
+atc_l4('g01a', 'ketoconazole').
+atc_l4('g01a', 'lactic_acid').
+atc_l4('g01a', 'lactobacillus').
+atc_l4('g01a', 'mepartricin').
+atc_l4('g01a', 'methylrosaniline').
+atc_l4('g01a', 'metronidazole').
+atc_l4('g01a', 'miconazole').
+atc_l4('g01a', 'natamycin').
+atc_l4('g01a', 'nifuratel').
+atc_l4('g01a', 'nystatin').
+atc_l4('g01a', 'nystatin_combinations').
+atc_l4('g01a', 'octenidine_combinations').
+atc_l4('g01a', 'omoconazole').
+atc_l4('g01a', 'ornidazole').
+atc_l4('g01a', 'oxiconazole').
+atc_l4('g01a', 'oxyquinoline').
+atc_l4('g01a', 'oxytetracycline').
+atc_l4('g01a', 'pentamycin').
+atc_l4('g01a', 'policresulen').
+atc_l4('g01a', 'povidone_iodine').
+atc_l4('g01a', 'propenidazole').
+atc_l4('g01a', 'protiofate').
+atc_l4('g01a', 'sertaconazole').
+atc_l4('g01a', 'sulfatolamide').
+atc_l4('g01a', 'terconazole').
+atc_l4('g01a', 'tinidazole').
+atc_l4('g01a', 'tioconazole').
+atc_l4('g02a', 'carboprost').
+atc_l4('g02a', 'dinoprost').
+atc_l4('g02a', 'dinoprostone').
+atc_l4('g02a', 'ergometrine').
+atc_l4('g02a', 'ergot_alkaloids').
+atc_l4('g02a', 'gemeprost').
+atc_l4('g02a', 'methylergometrine').
+atc_l4('g02a', 'methylergometrine_and_oxytocin').
+atc_l4('g02a', 'misoprostol').
+atc_l4('g02a', 'sulprostone').
+atc_l4('g02b', 'plastic_iud').
+atc_l4('g02b', 'plastic_iud_with_copper').
+atc_l4('g02b', 'plastic_iud_with_progestogen').
+atc_l4('g02b', 'vaginal_ring_with_progestogen').
+atc_l4('g02b', 'vaginal_ring_with_progestogen_and_estrogen').
+atc_l4('g02c', 'agni_casti_fructus').
+atc_l4('g02c', 'atosiban').
+atc_l4('g02c', 'benzydamine').
+atc_l4('g02c', 'bremelanotide').
+atc_l4('g02c', 'bromocriptine').
+atc_l4('g02c', 'buphenine').
+atc_l4('g02c', 'cabergoline').
+atc_l4('g02c', 'cimicifugae_rhizoma').
+atc_l4('g02c', 'fenoterol').
+atc_l4('g02c', 'fezolinetant').
+atc_l4('g02c', 'flibanserin').
+atc_l4('g02c', 'flunoxaprofen').
+atc_l4('g02c', 'ibuprofen').
+atc_l4('g02c', 'lisuride').
+atc_l4('g02c', 'metergoline').
+atc_l4('g02c', 'naproxen').
+atc_l4('g02c', 'quinagolide').
+atc_l4('g02c', 'ritodrine').
+atc_l4('g02c', 'terguride').
+atc_l4('g03a', 'chlormadinone_and_ethinylestradiol').
+atc_l4('g03a', 'desogestrel').
+atc_l4('g03a', 'desogestrel_and_ethinylestradiol').
+atc_l4('g03a', 'dienogest_and_estradiol').
+atc_l4('g03a', 'dienogest_and_ethinylestradiol').
+atc_l4('g03a', 'drospirenone').
+atc_l4('g03a', 'drospirenone_and_estetrol').
+atc_l4('g03a', 'drospirenone_and_ethinylestradiol').
+atc_l4('g03a', 'etonogestrel').
+atc_l4('g03a', 'etynodiol_and_ethinylestradiol').
+atc_l4('g03a', 'gestodene_and_ethinylestradiol').
+atc_l4('g03a', 'levonorgestrel').
+atc_l4('g03a', 'levonorgestrel_and_ethinylestradiol').
+atc_l4('g03a', 'lynestrenol').
+atc_l4('g03a', 'lynestrenol_and_ethinylestradiol').
+atc_l4('g03a', 'medroxyprogesterone').
+atc_l4('g03a', 'medroxyprogesterone_and_estradiol').
+atc_l4('g03a', 'medroxyprogesterone_and_ethinylestradiol').
+atc_l4('g03a', 'megestrol').
+atc_l4('g03a', 'megestrol_and_ethinylestradiol').
+atc_l4('g03a', 'nomegestrol_and_estradiol').
+atc_l4('g03a', 'norelgestromin_and_ethinylestradiol').
+atc_l4('g03a', 'norethisterone').
+atc_l4('g03a', 'norethisterone_and_ethinylestradiol').
+atc_l4('g03a', 'norgestimate_and_ethinylestradiol').
+atc_l4('g03a', 'norgestrel_and_ethinylestradiol').
+atc_l4('g03a', 'norgestrienone').
+atc_l4('g03a', 'quingestanol').
+atc_l4('g03a', 'quingestanol_and_ethinylestradiol').
+atc_l4('g03a', 'ulipristal').
+atc_l4('g03b', 'androstanolone').
+atc_l4('g03b', 'fluoxymesterone').
+atc_l4('g03b', 'mesterolone').
+atc_l4('g03b', 'methyltestosterone').
+atc_l4('g03b', 'testosterone').
+atc_l4('g03c', 'chlorotrianisene').
+atc_l4('g03c', 'conjugated_estrogens').
+atc_l4('g03c', 'conjugated_estrogens_and_bazedoxifene').
+atc_l4('g03c', 'dienestrol').
+atc_l4('g03c', 'diethylstilbestrol').
+atc_l4('g03c', 'estradiol').
+atc_l4('g03c', 'estradiol_combinations').
+atc_l4('g03c', 'estriol').
+atc_l4('g03c', 'estrone').
+atc_l4('g03c', 'ethinylestradiol').
+atc_l4('g03c', 'methallenestril').
+atc_l4('g03c', 'moxestrol').
+atc_l4('g03c', 'promestriene').
+atc_l4('g03c', 'tibolone').
+atc_l4('g03d', 'allylestrenol').
+atc_l4('g03d', 'chlormadinone').
+atc_l4('g03d', 'demegestone').
+atc_l4('g03d', 'dienogest').
+atc_l4('g03d', 'dydrogesterone').
+atc_l4('g03d', 'ethisterone').
+atc_l4('g03d', 'etynodiol').
+atc_l4('g03d', 'gestonorone').
+atc_l4('g03d', 'hydroxyprogesterone').
+atc_l4('g03d', 'lynestrenol').
+atc_l4('g03d', 'medrogestone').
+atc_l4('g03d', 'medroxyprogesterone').
+atc_l4('g03d', 'megestrol').
+atc_l4('g03d', 'methylestrenolone').
+atc_l4('g03d', 'nomegestrol').
+atc_l4('g03d', 'norethisterone').
+atc_l4('g03d', 'progesterone').
+atc_l4('g03d', 'promegestone').
+atc_l4('g03e', 'methyltestosterone').
+atc_l4('g03e', 'methyltestosterone_and_estrogen').
+atc_l4('g03e', 'prasterone_and_estrogen').
+atc_l4('g03e', 'testosterone_and_estrogen').
+atc_l4('g03f', 'chlormadinone_and_estrogen').
+atc_l4('g03f', 'desogestrel_and_estrogen').
+atc_l4('g03f', 'dienogest_and_estrogen').
+atc_l4('g03f', 'drospirenone_and_estrogen').
+atc_l4('g03f', 'dydrogesterone_and_estrogen').
+atc_l4('g03f', 'ethisterone_and_estrogen').
+atc_l4('g03f', 'etynodiol_and_estrogen').
+atc_l4('g03f', 'hydroxyprogesterone_and_estrogen').
+atc_l4('g03f', 'levonorgestrel_and_estrogen').
+atc_l4('g03f', 'lynestrenol_and_estrogen').
+atc_l4('g03f', 'medrogestone_and_estrogen').
+atc_l4('g03f', 'medroxyprogesterone_and_estrogen').
+atc_l4('g03f', 'megestrol_and_estrogen').
+atc_l4('g03f', 'methylnortestosterone_and_estrogen').
+atc_l4('g03f', 'nomegestrol_and_estrogen').
+atc_l4('g03f', 'norethisterone_and_estrogen').
+atc_l4('g03f', 'noretynodrel_and_estrogen').
+atc_l4('g03f', 'norgestimate_and_estrogen').
+atc_l4('g03f', 'norgestrel_and_estrogen').
+atc_l4('g03f', 'progesterone_and_estrogen').
+atc_l4('g03f', 'trimegestone_and_estrogen').
+atc_l4('g03g', 'choriogonadotropin_alfa').
+atc_l4('g03g', 'chorionic_gonadotrophin').
+atc_l4('g03g', 'clomifene').
+atc_l4('g03g', 'combinations').
+atc_l4('g03g', 'corifollitropin_alfa').
+atc_l4('g03g', 'cyclofenil').
+atc_l4('g03g', 'epimestrol').
+atc_l4('g03g', 'follitropin_alfa').
+atc_l4('g03g', 'follitropin_beta').
+atc_l4('g03g', 'follitropin_delta').
+atc_l4('g03g', 'human_menopausal_gonadotrophin').
+atc_l4('g03g', 'lutropin_alfa').
+atc_l4('g03g', 'serum_gonadotrophin').
+atc_l4('g03g', 'urofollitropin').
+atc_l4('g03h', 'cyproterone').
+atc_l4('g03h', 'cyproterone_and_estrogen').
+atc_l4('g03x', 'bazedoxifene').
+atc_l4('g03x', 'danazol').
+atc_l4('g03x', 'gestrinone').
+atc_l4('g03x', 'lasofoxifene').
+atc_l4('g03x', 'mifepristone').
+atc_l4('g03x', 'mifepristone_combinations').
+atc_l4('g03x', 'ormeloxifene').
+atc_l4('g03x', 'ospemifene').
+atc_l4('g03x', 'prasterone').
+atc_l4('g03x', 'raloxifene').
+atc_l4('g03x', 'ulipristal').
+atc_l4('g04b', 'acetohydroxamic_acid').
+atc_l4('g04b', 'alprostadil').
+atc_l4('g04b', 'ammonium_chloride').
+atc_l4('g04b', 'apomorphine').
+atc_l4('g04b', 'avanafil').
+atc_l4('g04b', 'calcium_chloride').
+atc_l4('g04b', 'collagen').
+atc_l4('g04b', 'combinations').
+atc_l4('g04b', 'dapoxetine').
+atc_l4('g04b', 'darifenacin').
+atc_l4('g04b', 'desfesoterodine').
+atc_l4('g04b', 'dimethyl_sulfoxide').
+atc_l4('g04b', 'emepronium').
+atc_l4('g04b', 'fesoterodine').
+atc_l4('g04b', 'flavoxate').
+atc_l4('g04b', 'imidafenacin').
+atc_l4('g04b', 'magnesium_hydroxide').
+atc_l4('g04b', 'meladrazine').
+atc_l4('g04b', 'mirabegron').
+atc_l4('g04b', 'moxisylyte').
+atc_l4('g04b', 'oxybutynin').
+atc_l4('g04b', 'papaverine').
+atc_l4('g04b', 'papaverine_combinations').
+atc_l4('g04b', 'pentosan_polysulfate_sodium').
+atc_l4('g04b', 'phenazopyridine').
+atc_l4('g04b', 'phenyl_salicylate').
+atc_l4('g04b', 'propiverine').
+atc_l4('g04b', 'sildenafil').
+atc_l4('g04b', 'sodium_salicylate_and_methenamine').
+atc_l4('g04b', 'solifenacin').
+atc_l4('g04b', 'succinimide').
+atc_l4('g04b', 'tadalafil').
+atc_l4('g04b', 'terodiline').
+atc_l4('g04b', 'tiopronin').
+atc_l4('g04b', 'tolterodine').
+atc_l4('g04b', 'trospium').
+atc_l4('g04b', 'udenafil').
+atc_l4('g04b', 'vardenafil').
+atc_l4('g04b', 'vibegron').
+atc_l4('g04b', 'yohimbine').
+atc_l4('g04c', 'alfuzosin').
+atc_l4('g04c', 'alfuzosin_and_finasteride').
+atc_l4('g04c', 'doxazosin_and_finasteride').
+atc_l4('g04c', 'dutasteride').
+atc_l4('g04c', 'fexapotide').
+atc_l4('g04c', 'finasteride').
+atc_l4('g04c', 'finasteride_and_tadalafil').
+atc_l4('g04c', 'mepartricin').
+atc_l4('g04c', 'prunus_africanae_cortex').
+atc_l4('g04c', 'sabalis_serrulatae_fructus').
+atc_l4('g04c', 'silodosin').
+atc_l4('g04c', 'tamsulosin').
+atc_l4('g04c', 'tamsulosin_and_dutasteride').
+atc_l4('g04c', 'tamsulosin_and_solifenacin').
+atc_l4('g04c', 'tamsulosin_and_tadalafil').
+atc_l4('g04c', 'terazosin').
+atc_l4('h01a', 'corticotropin').
+atc_l4('h01a', 'lonapegsomatropin').
+atc_l4('h01a', 'mecasermin').
+atc_l4('h01a', 'mecasermin_rinfabate').
+atc_l4('h01a', 'pegvisomant').
+atc_l4('h01a', 'sermorelin').
+atc_l4('h01a', 'somapacitan').
+atc_l4('h01a', 'somatrem').
+atc_l4('h01a', 'somatrogon').
+atc_l4('h01a', 'somatropin').
+atc_l4('h01a', 'tesamorelin').
+atc_l4('h01a', 'tetracosactide').
+atc_l4('h01a', 'thyrotropin_alfa').
+atc_l4('h01b', 'carbetocin').
+atc_l4('h01b', 'demoxytocin').
+atc_l4('h01b', 'desmopressin').
+atc_l4('h01b', 'lypressin').
+atc_l4('h01b', 'ornipressin').
+atc_l4('h01b', 'oxytocin').
+atc_l4('h01b', 'terlipressin').
+atc_l4('h01b', 'vasopressin_argipressin').
+atc_l4('h01c', 'cetrorelix').
+atc_l4('h01c', 'elagolix').
+atc_l4('h01c', 'elagolix_estradiol_and_norethisterone').
+atc_l4('h01c', 'ganirelix').
+atc_l4('h01c', 'gonadorelin').
+atc_l4('h01c', 'lanreotide').
+atc_l4('h01c', 'linzagolix').
+atc_l4('h01c', 'nafarelin').
+atc_l4('h01c', 'octreotide').
+atc_l4('h01c', 'pasireotide').
+atc_l4('h01c', 'relugolix_estradiol_and_norethisterone').
+atc_l4('h01c', 'somatostatin').
+atc_l4('h01c', 'vapreotide').
+atc_l4('h02a', 'aldosterone').
+atc_l4('h02a', 'betamethasone').
+atc_l4('h02a', 'cloprednol').
+atc_l4('h02a', 'cortisone').
+atc_l4('h02a', 'cortivazol').
+atc_l4('h02a', 'deflazacort').
+atc_l4('h02a', 'desoxycortone').
+atc_l4('h02a', 'dexamethasone').
+atc_l4('h02a', 'fludrocortisone').
+atc_l4('h02a', 'fluocortolone').
+atc_l4('h02a', 'hydrocortisone').
+atc_l4('h02a', 'meprednisone').
+atc_l4('h02a', 'methylprednisolone').
+atc_l4('h02a', 'paramethasone').
+atc_l4('h02a', 'prednisolone').
+atc_l4('h02a', 'prednisone').
+atc_l4('h02a', 'prednylidene').
+atc_l4('h02a', 'rimexolone').
+atc_l4('h02a', 'triamcinolone').
+atc_l4('h02a', 'vamorolone').
+atc_l4('h02b', 'methylprednisolone_combinations').
+atc_l4('h02c', 'ketoconazole').
+atc_l4('h02c', 'levoketoconazole').
+atc_l4('h02c', 'osilodrostat').
+atc_l4('h02c', 'trilostane').
+atc_l4('h03a', 'combinations_of_levothyroxine_and_liothyronine').
+atc_l4('h03a', 'levothyroxine_sodium').
+atc_l4('h03a', 'levothyroxine_sodium_and_iodine_compounds').
+atc_l4('h03a', 'liothyronine_sodium').
+atc_l4('h03a', 'thyroid_gland_preparations').
+atc_l4('h03a', 'tiratricol').
+atc_l4('h03b', 'benzylthiouracil').
+atc_l4('h03b', 'carbimazole').
+atc_l4('h03b', 'dibromotyrosine').
+atc_l4('h03b', 'diiodotyrosine').
+atc_l4('h03b', 'methylthiouracil').
+atc_l4('h03b', 'potassium_perchlorate').
+atc_l4('h03b', 'propylthiouracil').
+atc_l4('h03b', 'thiamazole').
+atc_l4('h03b', 'thiamazole_combinations').
+atc_l4('h04a', 'dasiglucagon').
+atc_l4('h04a', 'glucagon').
+atc_l4('h05a', 'abaloparatide').
+atc_l4('h05a', 'palopegteriparatide').
+atc_l4('h05a', 'parathyroid_gland_extract').
+atc_l4('h05a', 'parathyroid_hormone').
+atc_l4('h05a', 'teriparatide').
+atc_l4('h05b', 'calcifediol').
+atc_l4('h05b', 'calcitonin_human_synthetic').
+atc_l4('h05b', 'calcitonin_pork_natural').
+atc_l4('h05b', 'calcitonin_salmon_synthetic').
+atc_l4('h05b', 'cinacalcet').
+atc_l4('h05b', 'doxercalciferol').
+atc_l4('h05b', 'elcatonin').
+atc_l4('h05b', 'etelcalcetide').
+atc_l4('h05b', 'evocalcet').
+atc_l4('h05b', 'paricalcitol').
+atc_l4('j01a', 'chlortetracycline').
+atc_l4('j01a', 'clomocycline').
+atc_l4('j01a', 'combinations_of_tetracyclines').
+atc_l4('j01a', 'demeclocycline').
+atc_l4('j01a', 'doxycycline').
+atc_l4('j01a', 'eravacycline').
+atc_l4('j01a', 'lymecycline').
+atc_l4('j01a', 'metacycline').
+atc_l4('j01a', 'minocycline').
+atc_l4('j01a', 'omadacycline').
+atc_l4('j01a', 'oxytetracycline').
+atc_l4('j01a', 'oxytetracycline_combinations').
+atc_l4('j01a', 'penimepicycline').
+atc_l4('j01a', 'rolitetracycline').
+atc_l4('j01a', 'sarecycline').
+atc_l4('j01a', 'tetracycline').
+atc_l4('j01a', 'tigecycline').
+atc_l4('j01b', 'chloramphenicol').
+atc_l4('j01b', 'thiamphenicol').
+atc_l4('j01b', 'thiamphenicol_combinations').
+atc_l4('j01c', 'amoxicillin').
+atc_l4('j01c', 'amoxicillin_and_beta_lactamase_inhibitor').
+atc_l4('j01c', 'ampicillin').
+atc_l4('j01c', 'ampicillin_and_beta_lactamase_inhibitor').
+atc_l4('j01c', 'ampicillin_combinations').
+atc_l4('j01c', 'aspoxicillin').
+atc_l4('j01c', 'azidocillin').
+atc_l4('j01c', 'azlocillin').
+atc_l4('j01c', 'bacampicillin').
+atc_l4('j01c', 'benzathine_benzylpenicillin').
+atc_l4('j01c', 'benzathine_phenoxymethylpenicillin').
+atc_l4('j01c', 'benzylpenicillin').
+atc_l4('j01c', 'carbenicillin').
+atc_l4('j01c', 'carindacillin').
+atc_l4('j01c', 'clometocillin').
+atc_l4('j01c', 'cloxacillin').
+atc_l4('j01c', 'combinations').
+atc_l4('j01c', 'combinations_of_penicillins').
+atc_l4('j01c', 'dicloxacillin').
+atc_l4('j01c', 'epicillin').
+atc_l4('j01c', 'flucloxacillin').
+atc_l4('j01c', 'hetacillin').
+atc_l4('j01c', 'mecillinam').
+atc_l4('j01c', 'metampicillin').
+atc_l4('j01c', 'meticillin').
+atc_l4('j01c', 'mezlocillin').
+atc_l4('j01c', 'nafcillin').
+atc_l4('j01c', 'oxacillin').
+atc_l4('j01c', 'penamecillin').
+atc_l4('j01c', 'pheneticillin').
+atc_l4('j01c', 'phenoxymethylpenicillin').
+atc_l4('j01c', 'piperacillin').
+atc_l4('j01c', 'piperacillin_and_beta_lactamase_inhibitor').
+atc_l4('j01c', 'pivampicillin').
+atc_l4('j01c', 'pivmecillinam').
+atc_l4('j01c', 'procaine_benzylpenicillin').
+atc_l4('j01c', 'propicillin').
+atc_l4('j01c', 'sulbactam').
+atc_l4('j01c', 'sulbenicillin').
+atc_l4('j01c', 'sultamicillin').
+atc_l4('j01c', 'talampicillin').
+atc_l4('j01c', 'tazobactam').
+atc_l4('j01c', 'temocillin').
+atc_l4('j01c', 'ticarcillin').
+atc_l4('j01c', 'ticarcillin_and_beta_lactamase_inhibitor').
+atc_l4('j01d', 'aztreonam').
+atc_l4('j01d', 'biapenem').
+atc_l4('j01d', 'carumonam').
+atc_l4('j01d', 'cefacetrile').
+atc_l4('j01d', 'cefaclor').
+atc_l4('j01d', 'cefadroxil').
+atc_l4('j01d', 'cefalexin').
+atc_l4('j01d', 'cefaloridine').
+atc_l4('j01d', 'cefalotin').
+atc_l4('j01d', 'cefamandole').
+atc_l4('j01d', 'cefapirin').
+atc_l4('j01d', 'cefatrizine').
+atc_l4('j01d', 'cefazedone').
+atc_l4('j01d', 'cefazolin').
+atc_l4('j01d', 'cefbuperazone').
+atc_l4('j01d', 'cefcapene').
+atc_l4('j01d', 'cefdinir').
+atc_l4('j01d', 'cefditoren').
+atc_l4('j01d', 'cefepime').
+atc_l4('j01d', 'cefepime_and_beta_lactamase_inhibitor').
+atc_l4('j01d', 'cefetamet').
+atc_l4('j01d', 'cefiderocol').
+atc_l4('j01d', 'cefixime').
+atc_l4('j01d', 'cefixime_and_beta_lactamase_inhibitor').
+atc_l4('j01d', 'cefmenoxime').
+atc_l4('j01d', 'cefmetazole').
+atc_l4('j01d', 'cefminox').
+atc_l4('j01d', 'cefodizime').
+atc_l4('j01d', 'cefonicid').
+atc_l4('j01d', 'cefoperazone').
+atc_l4('j01d', 'cefoperazone_and_beta_lactamase_inhibitor').
+atc_l4('j01d', 'ceforanide').
+atc_l4('j01d', 'cefotaxime').
+atc_l4('j01d', 'cefotaxime_and_beta_lactamase_inhibitor').
+atc_l4('j01d', 'cefotetan').
+atc_l4('j01d', 'cefotiam').
+atc_l4('j01d', 'cefoxitin').
+atc_l4('j01d', 'cefozopran').
+atc_l4('j01d', 'cefpiramide').
+atc_l4('j01d', 'cefpirome').
+atc_l4('j01d', 'cefpodoxime').
+atc_l4('j01d', 'cefpodoxime_and_beta_lactamase_inhibitor').
+atc_l4('j01d', 'cefprozil').
+atc_l4('j01d', 'cefradine').
+atc_l4('j01d', 'cefroxadine').
+atc_l4('j01d', 'cefsulodin').
+atc_l4('j01d', 'ceftaroline_fosamil').
+atc_l4('j01d', 'ceftazidime').
+atc_l4('j01d', 'ceftazidime_and_beta_lactamase_inhibitor').
+atc_l4('j01d', 'cefteram').
+atc_l4('j01d', 'ceftezole').
+atc_l4('j01d', 'ceftibuten').
+atc_l4('j01d', 'ceftizoxime').
+atc_l4('j01d', 'ceftobiprole_medocaril').
+atc_l4('j01d', 'ceftolozane_and_beta_lactamase_inhibitor').
+atc_l4('j01d', 'ceftriaxone').
+atc_l4('j01d', 'ceftriaxone_and_beta_lactamase_inhibitor').
+atc_l4('j01d', 'ceftriaxone_combinations').
+atc_l4('j01d', 'cefuroxime').
+atc_l4('j01d', 'cefuroxime_and_beta_lactamase_inhibitor').
+atc_l4('j01d', 'doripenem').
+atc_l4('j01d', 'ertapenem').
+atc_l4('j01d', 'faropenem').
+atc_l4('j01d', 'flomoxef').
+atc_l4('j01d', 'imipenem_and_cilastatin').
+atc_l4('j01d', 'imipenem_cilastatin_and_relebactam').
+atc_l4('j01d', 'latamoxef').
+atc_l4('j01d', 'loracarbef').
+atc_l4('j01d', 'meropenem').
+atc_l4('j01d', 'meropenem_and_vaborbactam').
+atc_l4('j01d', 'panipenem_and_betamipron').
+atc_l4('j01d', 'tebipenem_pivoxil').
+atc_l4('j01e', 'brodimoprim').
+atc_l4('j01e', 'combinations').
+atc_l4('j01e', 'iclaprim').
+atc_l4('j01e', 'sulfadiazine').
+atc_l4('j01e', 'sulfadiazine_and_tetroxoprim').
+atc_l4('j01e', 'sulfadiazine_and_trimethoprim').
+atc_l4('j01e', 'sulfadimethoxine').
+atc_l4('j01e', 'sulfadimidine').
+atc_l4('j01e', 'sulfadimidine_and_trimethoprim').
+atc_l4('j01e', 'sulfafurazole').
+atc_l4('j01e', 'sulfaisodimidine').
+atc_l4('j01e', 'sulfalene').
+atc_l4('j01e', 'sulfamazone').
+atc_l4('j01e', 'sulfamerazine').
+atc_l4('j01e', 'sulfamerazine_and_trimethoprim').
+atc_l4('j01e', 'sulfamethizole').
+atc_l4('j01e', 'sulfamethoxazole').
+atc_l4('j01e', 'sulfamethoxazole_and_trimethoprim').
+atc_l4('j01e', 'sulfamethoxypyridazine').
+atc_l4('j01e', 'sulfametomidine').
+atc_l4('j01e', 'sulfametoxydiazine').
+atc_l4('j01e', 'sulfametrole_and_trimethoprim').
+atc_l4('j01e', 'sulfamoxole').
+atc_l4('j01e', 'sulfamoxole_and_trimethoprim').
+atc_l4('j01e', 'sulfanilamide').
+atc_l4('j01e', 'sulfaperin').
+atc_l4('j01e', 'sulfaphenazole').
+atc_l4('j01e', 'sulfapyridine').
+atc_l4('j01e', 'sulfathiazole').
+atc_l4('j01e', 'sulfathiourea').
+atc_l4('j01e', 'trimethoprim').
+atc_l4('j01f', 'azithromycin').
+atc_l4('j01f', 'clarithromycin').
+atc_l4('j01f', 'clindamycin').
+atc_l4('j01f', 'dirithromycin').
+atc_l4('j01f', 'erythromycin').
+atc_l4('j01f', 'flurithromycin').
+atc_l4('j01f', 'josamycin').
+atc_l4('j01f', 'lincomycin').
+atc_l4('j01f', 'midecamycin').
+atc_l4('j01f', 'miocamycin').
+atc_l4('j01f', 'oleandomycin').
+atc_l4('j01f', 'pristinamycin').
+atc_l4('j01f', 'quinupristin_dalfopristin').
+atc_l4('j01f', 'rokitamycin').
+atc_l4('j01f', 'roxithromycin').
+atc_l4('j01f', 'solithromycin').
+atc_l4('j01f', 'spiramycin').
+atc_l4('j01f', 'telithromycin').
+atc_l4('j01f', 'troleandomycin').
+atc_l4('j01g', 'amikacin').
+atc_l4('j01g', 'arbekacin').
+atc_l4('j01g', 'bekanamycin').
+atc_l4('j01g', 'dibekacin').
+atc_l4('j01g', 'gentamicin').
+atc_l4('j01g', 'isepamicin').
+atc_l4('j01g', 'kanamycin').
+atc_l4('j01g', 'neomycin').
+atc_l4('j01g', 'netilmicin').
+atc_l4('j01g', 'plazomicin').
+atc_l4('j01g', 'ribostamycin').
+atc_l4('j01g', 'sisomicin').
+atc_l4('j01g', 'streptoduocin').
+atc_l4('j01g', 'streptomycin').
+atc_l4('j01g', 'tobramycin').
+atc_l4('j01m', 'cinoxacin').
+atc_l4('j01m', 'ciprofloxacin').
+atc_l4('j01m', 'delafloxacin').
+atc_l4('j01m', 'enoxacin').
+atc_l4('j01m', 'fleroxacin').
+atc_l4('j01m', 'flumequine').
+atc_l4('j01m', 'garenoxacin').
+atc_l4('j01m', 'gatifloxacin').
+atc_l4('j01m', 'gemifloxacin').
+atc_l4('j01m', 'grepafloxacin').
+atc_l4('j01m', 'lascufloxacin').
+atc_l4('j01m', 'levofloxacin').
+atc_l4('j01m', 'levonadifloxacin').
+atc_l4('j01m', 'lomefloxacin').
+atc_l4('j01m', 'moxifloxacin').
+atc_l4('j01m', 'nalidixic_acid').
+atc_l4('j01m', 'nemonoxacin').
+atc_l4('j01m', 'norfloxacin').
+atc_l4('j01m', 'ofloxacin').
+atc_l4('j01m', 'oxolinic_acid').
+atc_l4('j01m', 'pazufloxacin').
+atc_l4('j01m', 'pefloxacin').
+atc_l4('j01m', 'pipemidic_acid').
+atc_l4('j01m', 'piromidic_acid').
+atc_l4('j01m', 'prulifloxacin').
+atc_l4('j01m', 'rosoxacin').
+atc_l4('j01m', 'rufloxacin').
+atc_l4('j01m', 'sitafloxacin').
+atc_l4('j01m', 'sparfloxacin').
+atc_l4('j01m', 'temafloxacin').
+atc_l4('j01m', 'tosufloxacin').
+atc_l4('j01m', 'trovafloxacin').
+atc_l4('j01r', 'azithromycin_fluconazole_and_secnidazole').
+atc_l4('j01r', 'cefepime_and_amikacin').
+atc_l4('j01r', 'cefixime_and_azithromycin').
+atc_l4('j01r', 'cefixime_and_ornidazole').
+atc_l4('j01r', 'cefuroxime_and_metronidazole').
+atc_l4('j01r', 'ciprofloxacin_and_metronidazole').
+atc_l4('j01r', 'ciprofloxacin_and_ornidazole').
+atc_l4('j01r', 'ciprofloxacin_and_tinidazole').
+atc_l4('j01r', 'levofloxacin_and_ornidazole').
+atc_l4('j01r', 'norfloxacin_and_metronidazole').
+atc_l4('j01r', 'norfloxacin_and_tinidazole').
+atc_l4('j01r', 'ofloxacin_and_ornidazole').
+atc_l4('j01r', 'penicillins_combinations_with_other_antibacterials').
+atc_l4('j01r', 'spiramycin_and_metronidazole').
+atc_l4('j01r', 'sulfonamides_combinations_with_other_antibacterials_excl_trimethoprim').
+atc_l4('j01r', 'tetracycline_and_oleandomycin').
+atc_l4('j01x', 'bacitracin').
+atc_l4('j01x', 'clofoctol').
+atc_l4('j01x', 'colistin').
+atc_l4('j01x', 'dalbavancin').
+atc_l4('j01x', 'daptomycin').
+atc_l4('j01x', 'fosfomycin').
+atc_l4('j01x', 'furazidin').
+atc_l4('j01x', 'fusidic_acid').
+atc_l4('j01x', 'lefamulin').
+atc_l4('j01x', 'linezolid').
+atc_l4('j01x', 'mandelic_acid').
+atc_l4('j01x', 'methenamine').
+atc_l4('j01x', 'metronidazole').
+atc_l4('j01x', 'nifurtoinol').
+atc_l4('j01x', 'nitrofurantoin').
+atc_l4('j01x', 'nitrofurantoin_combinations').
+atc_l4('j01x', 'nitroxoline').
+atc_l4('j01x', 'oritavancin').
+atc_l4('j01x', 'ornidazole').
+atc_l4('j01x', 'polymyxin_b').
+atc_l4('j01x', 'spectinomycin').
+atc_l4('j01x', 'tedizolid').
+atc_l4('j01x', 'teicoplanin').
+atc_l4('j01x', 'telavancin').
+atc_l4('j01x', 'tinidazole').
+atc_l4('j01x', 'vancomycin').
+atc_l4('j01x', 'xibornol').
+atc_l4('j02a', 'amphotericin_b').
+atc_l4('j02a', 'anidulafungin').
+atc_l4('j02a', 'caspofungin').
+atc_l4('j02a', 'fluconazole').
+atc_l4('j02a', 'flucytosine').
+atc_l4('j02a', 'hachimycin').
+atc_l4('j02a', 'ibrexafungerp').
+atc_l4('j02a', 'isavuconazole').
+atc_l4('j02a', 'itraconazole').
+atc_l4('j02a', 'ketoconazole').
+atc_l4('j02a', 'micafungin').
+atc_l4('j02a', 'miconazole').
+atc_l4('j02a', 'oteseconazole').
+atc_l4('j02a', 'posaconazole').
+atc_l4('j02a', 'rezafungin_acetate').
+atc_l4('j02a', 'voriconazole').
+atc_l4('j04a', 'bedaquiline').
+atc_l4('j04a', 'calcium_aminosalicylate').
+atc_l4('j04a', 'capreomycin').
+atc_l4('j04a', 'cycloserine').
+atc_l4('j04a', 'delamanid').
+atc_l4('j04a', 'enviomycin').
+atc_l4('j04a', 'ethambutol').
+atc_l4('j04a', 'ethambutol_and_isoniazid').
+atc_l4('j04a', 'ethionamide').
+atc_l4('j04a', 'isoniazid').
+atc_l4('j04a', 'isoniazid_combinations').
+atc_l4('j04a', 'isoniazid_sulfamethoxazole_trimethoprim_and_pyridoxine').
+atc_l4('j04a', 'morinamide').
+atc_l4('j04a', 'n_4_aminosalicylic_acid').
+atc_l4('j04a', 'pretomanid').
+atc_l4('j04a', 'protionamide').
+atc_l4('j04a', 'pyrazinamide').
+atc_l4('j04a', 'rifabutin').
+atc_l4('j04a', 'rifampicin').
+atc_l4('j04a', 'rifampicin_and_isoniazid').
+atc_l4('j04a', 'rifampicin_ethambutol_and_isoniazid').
+atc_l4('j04a', 'rifampicin_pyrazinamide_and_isoniazid').
+atc_l4('j04a', 'rifampicin_pyrazinamide_ethambutol_and_isoniazid').
+atc_l4('j04a', 'rifamycin').
+atc_l4('j04a', 'rifapentine').
+atc_l4('j04a', 'sodium_aminosalicylate').
+atc_l4('j04a', 'streptomycin_and_isoniazid').
+atc_l4('j04a', 'terizidone').
+atc_l4('j04a', 'thioacetazone').
+atc_l4('j04a', 'thioacetazone_and_isoniazid').
+atc_l4('j04a', 'tiocarlide').
+atc_l4('j04b', 'aldesulfone_sodium').
+atc_l4('j04b', 'clofazimine').
+atc_l4('j04b', 'dapsone').
+atc_l4('j04b', 'dapsone_and_rifampicin').
+atc_l4('j04b', 'dapsone_rifampicin_and_clofazimine').
+atc_l4('j05a', 'abacavir').
+atc_l4('j05a', 'aciclovir').
+atc_l4('j05a', 'adefovir_dipivoxil').
+atc_l4('j05a', 'amenamevir').
+atc_l4('j05a', 'amprenavir').
+atc_l4('j05a', 'asunaprevir').
+atc_l4('j05a', 'atazanavir').
+atc_l4('j05a', 'atazanavir_and_cobicistat').
+atc_l4('j05a', 'atazanavir_and_ritonavir').
+atc_l4('j05a', 'baloxavir_marboxil').
+atc_l4('j05a', 'boceprevir').
+atc_l4('j05a', 'brincidofovir').
+atc_l4('j05a', 'brivudine').
+atc_l4('j05a', 'bulevirtide').
+atc_l4('j05a', 'cabotegravir').
+atc_l4('j05a', 'cidofovir').
+atc_l4('j05a', 'clevudine').
+atc_l4('j05a', 'coblopasvir').
+atc_l4('j05a', 'daclatasvir').
+atc_l4('j05a', 'daclatasvir_asunaprevir_and_beclabuvir').
+atc_l4('j05a', 'darunavir').
+atc_l4('j05a', 'darunavir_and_cobicistat').
+atc_l4('j05a', 'darunavir_and_ritonavir').
+atc_l4('j05a', 'dasabuvir').
+atc_l4('j05a', 'dasabuvir_ombitasvir_paritaprevir_and_ritonavir').
+atc_l4('j05a', 'delavirdine').
+atc_l4('j05a', 'didanosine').
+atc_l4('j05a', 'dolutegravir').
+atc_l4('j05a', 'dolutegravir_and_rilpivirine').
+atc_l4('j05a', 'doravirine').
+atc_l4('j05a', 'efavirenz').
+atc_l4('j05a', 'elbasvir').
+atc_l4('j05a', 'elbasvir_and_grazoprevir').
+atc_l4('j05a', 'elvitegravir').
+atc_l4('j05a', 'emtricitabine').
+atc_l4('j05a', 'emtricitabine_and_tenofovir_alafenamide').
+atc_l4('j05a', 'emtricitabine_tenofovir_alafenamide_and_bictegravir').
+atc_l4('j05a', 'emtricitabine_tenofovir_alafenamide_and_rilpivirine').
+atc_l4('j05a', 'emtricitabine_tenofovir_alafenamide_darunavir_and_cobicistat').
+atc_l4('j05a', 'emtricitabine_tenofovir_alafenamide_elvitegravir_and_cobicistat').
+atc_l4('j05a', 'emtricitabine_tenofovir_disoproxil_and_efavirenz').
+atc_l4('j05a', 'emtricitabine_tenofovir_disoproxil_and_rilpivirine').
+atc_l4('j05a', 'emtricitabine_tenofovir_disoproxil_elvitegravir_and_cobicistat').
+atc_l4('j05a', 'enfuvirtide').
+atc_l4('j05a', 'enisamium_iodide').
+atc_l4('j05a', 'ensitrelvir').
+atc_l4('j05a', 'entecavir').
+atc_l4('j05a', 'etravirine').
+atc_l4('j05a', 'faldaprevir').
+atc_l4('j05a', 'famciclovir').
+atc_l4('j05a', 'favipiravir').
+atc_l4('j05a', 'fosamprenavir').
+atc_l4('j05a', 'foscarnet').
+atc_l4('j05a', 'fosfonet').
+atc_l4('j05a', 'fostemsavir').
+atc_l4('j05a', 'ganciclovir').
+atc_l4('j05a', 'glecaprevir_and_pibrentasvir').
+atc_l4('j05a', 'grazoprevir').
+atc_l4('j05a', 'ibalizumab').
+atc_l4('j05a', 'idoxuridine').
+atc_l4('j05a', 'indinavir').
+atc_l4('j05a', 'inosine_pranobex').
+atc_l4('j05a', 'lamivudine').
+atc_l4('j05a', 'lamivudine_abacavir_and_dolutegravir').
+atc_l4('j05a', 'lamivudine_and_abacavir').
+atc_l4('j05a', 'lamivudine_and_dolutegravir').
+atc_l4('j05a', 'lamivudine_and_raltegravir').
+atc_l4('j05a', 'lamivudine_and_tenofovir_disoproxil').
+atc_l4('j05a', 'lamivudine_tenofovir_disoproxil_and_dolutegravir').
+atc_l4('j05a', 'lamivudine_tenofovir_disoproxil_and_doravirine').
+atc_l4('j05a', 'lamivudine_tenofovir_disoproxil_and_efavirenz').
+atc_l4('j05a', 'laninamivir').
+atc_l4('j05a', 'lenacapavir').
+atc_l4('j05a', 'letermovir').
+atc_l4('j05a', 'lopinavir_and_ritonavir').
+atc_l4('j05a', 'lysozyme').
+atc_l4('j05a', 'maraviroc').
+atc_l4('j05a', 'maribavir').
+atc_l4('j05a', 'metisazone').
+atc_l4('j05a', 'molnupiravir').
+atc_l4('j05a', 'moroxydine').
+atc_l4('j05a', 'nelfinavir').
+atc_l4('j05a', 'nevirapine').
+atc_l4('j05a', 'nirmatrelvir_and_ritonavir').
+atc_l4('j05a', 'ombitasvir_paritaprevir_and_ritonavir').
+atc_l4('j05a', 'oseltamivir').
+atc_l4('j05a', 'penciclovir').
+atc_l4('j05a', 'pentanedioic_acid_imidazolyl_ethanamide').
+atc_l4('j05a', 'peramivir').
+atc_l4('j05a', 'pleconaril').
+atc_l4('j05a', 'raltegravir').
+atc_l4('j05a', 'ravidasvir').
+atc_l4('j05a', 'remdesivir').
+atc_l4('j05a', 'ribavirin').
+atc_l4('j05a', 'rilpivirine').
+atc_l4('j05a', 'rimantadine').
+atc_l4('j05a', 'ritonavir').
+atc_l4('j05a', 'saquinavir').
+atc_l4('j05a', 'simeprevir').
+atc_l4('j05a', 'sofosbuvir').
+atc_l4('j05a', 'sofosbuvir_and_ledipasvir').
+atc_l4('j05a', 'sofosbuvir_and_velpatasvir').
+atc_l4('j05a', 'sofosbuvir_velpatasvir_and_voxilaprevir').
+atc_l4('j05a', 'stavudine').
+atc_l4('j05a', 'stavudine_and_lamivudine').
+atc_l4('j05a', 'stavudine_lamivudine_and_nevirapine').
+atc_l4('j05a', 'tecovirimat').
+atc_l4('j05a', 'telaprevir').
+atc_l4('j05a', 'telbivudine').
+atc_l4('j05a', 'tenofovir_alafenamide').
+atc_l4('j05a', 'tenofovir_disoproxil').
+atc_l4('j05a', 'tenofovir_disoproxil_and_emtricitabine').
+atc_l4('j05a', 'tilorone').
+atc_l4('j05a', 'tipranavir').
+atc_l4('j05a', 'tromantadine').
+atc_l4('j05a', 'umifenovir').
+atc_l4('j05a', 'valaciclovir').
+atc_l4('j05a', 'valganciclovir').
+atc_l4('j05a', 'vidarabine').
+atc_l4('j05a', 'zalcitabine').
+atc_l4('j05a', 'zanamivir').
+atc_l4('j05a', 'zidovudine').
+atc_l4('j05a', 'zidovudine_and_lamivudine').
+atc_l4('j05a', 'zidovudine_lamivudine_and_abacavir').
+atc_l4('j05a', 'zidovudine_lamivudine_and_nevirapine').
+atc_l4('j06a', 'botulinum_antitoxin').
+atc_l4('j06a', 'diphtheria_antitoxin').
+atc_l4('j06a', 'gas_gangrene_sera').
+atc_l4('j06a', 'rabies_serum').
+atc_l4('j06a', 'snake_venom_antiserum').
+atc_l4('j06a', 'tetanus_antitoxin').
+atc_l4('j06b', 'ansuvimab').
+atc_l4('j06b', 'anthrax_immunoglobulin').
+atc_l4('j06b', 'anti_d_rh_immunoglobulin').
+atc_l4('j06b', 'bezlotoxumab').
+atc_l4('j06b', 'casirivimab_and_imdevimab').
+atc_l4('j06b', 'combinations').
+atc_l4('j06b', 'cytomegalovirus_immunoglobulin').
+atc_l4('j06b', 'diphtheria_immunoglobulin').
+atc_l4('j06b', 'encephalitis_tick_borne_immunoglobulin').
+atc_l4('j06b', 'hepatitis_a_immunoglobulin').
+atc_l4('j06b', 'hepatitis_b_immunoglobulin').
+atc_l4('j06b', 'immunoglobulins_normal_human_for_extravascular_adm').
+atc_l4('j06b', 'immunoglobulins_normal_human_for_intravascular_adm').
+atc_l4('j06b', 'measles_immunoglobulin').
+atc_l4('j06b', 'motavizumab').
+atc_l4('j06b', 'mumps_immunoglobulin').
+atc_l4('j06b', 'nebacumab').
+atc_l4('j06b', 'nirsevimab').
+atc_l4('j06b', 'obiltoxaximab').
+atc_l4('j06b', 'palivizumab').
+atc_l4('j06b', 'pertussis_immunoglobulin').
+atc_l4('j06b', 'rabies_immunoglobulin').
+atc_l4('j06b', 'raxibacumab').
+atc_l4('j06b', 'regdanvimab').
+atc_l4('j06b', 'rubella_immunoglobulin').
+atc_l4('j06b', 'sotrovimab').
+atc_l4('j06b', 'staphylococcus_immunoglobulin').
+atc_l4('j06b', 'tetanus_immunoglobulin').
+atc_l4('j06b', 'tixagevimab_and_cilgavimab').
+atc_l4('j06b', 'vaccinia_immunoglobulin').
+atc_l4('j06b', 'varicella_zoster_immunoglobulin').
+atc_l4('j07a', 'anthrax_antigen').
+atc_l4('j07a', 'brucella_antigen').
+atc_l4('j07a', 'cholera_combinations_with_typhoid_vaccine_inactivated_whole_cell').
+atc_l4('j07a', 'cholera_inactivated_whole_cell').
+atc_l4('j07a', 'cholera_live_attenuated').
+atc_l4('j07a', 'diphtheria_toxoid').
+atc_l4('j07a', 'haemophilus_influenza_b_combinations_with_meningococcus_c_y_conjugated').
+atc_l4('j07a', 'haemophilus_influenzae_b_combinations_with_meningococcus_c_conjugated').
+atc_l4('j07a', 'haemophilus_influenzae_b_combinations_with_pertussis_and_toxoids').
+atc_l4('j07a', 'haemophilus_influenzae_b_combinations_with_toxoids').
+atc_l4('j07a', 'haemophilus_influenzae_b_purified_antigen_conjugated').
+atc_l4('j07a', 'leptospira_vaccines').
+atc_l4('j07a', 'meningococcus_a_c_bivalent_purified_polysaccharides_antigen').
+atc_l4('j07a', 'meningococcus_a_c_y_w_135_tetravalent_purified_polysaccharides_antigen').
+atc_l4('j07a', 'meningococcus_a_c_y_w_135_tetravalent_purified_polysaccharides_antigen_conjugated').
+atc_l4('j07a', 'meningococcus_a_purified_polysaccharides_antigen').
+atc_l4('j07a', 'meningococcus_a_purified_polysaccharides_antigen_conjugated').
+atc_l4('j07a', 'meningococcus_b_multicomponent_vaccine').
+atc_l4('j07a', 'meningococcus_b_outer_membrane_vesicle_vaccine').
+atc_l4('j07a', 'meningococcus_c_purified_polysaccharides_antigen_conjugated').
+atc_l4('j07a', 'other_meningococcal_monovalent_purified_polysaccharides_antigen').
+atc_l4('j07a', 'other_meningococcal_polyvalent_purified_polysaccharides_antigen').
+atc_l4('j07a', 'pertussis_inactivated_whole_cell').
+atc_l4('j07a', 'pertussis_inactivated_whole_cell_combinations_with_toxoids').
+atc_l4('j07a', 'pertussis_purified_antigen').
+atc_l4('j07a', 'pertussis_purified_antigen_combinations_with_toxoids').
+atc_l4('j07a', 'plague_inactivated_whole_cell').
+atc_l4('j07a', 'pneumococcus_purified_polysaccharides_antigen').
+atc_l4('j07a', 'pneumococcus_purified_polysaccharides_antigen_and_haemophilus_influenzae_conjugated').
+atc_l4('j07a', 'pneumococcus_purified_polysaccharides_antigen_conjugated').
+atc_l4('j07a', 'tetanus_toxoid').
+atc_l4('j07a', 'tetanus_toxoid_combinations_with_diphtheria_toxoid').
+atc_l4('j07a', 'tetanus_toxoid_combinations_with_tetanus_immunoglobulin').
+atc_l4('j07a', 'tuberculosis_live_attenuated').
+atc_l4('j07a', 'typhoid_combinations_with_paratyphi_types').
+atc_l4('j07a', 'typhoid_inactivated_whole_cell').
+atc_l4('j07a', 'typhoid_oral_live_attenuated').
+atc_l4('j07a', 'typhoid_purified_polysaccharide_antigen').
+atc_l4('j07a', 'typhus_exanthematicus_inactivated_whole_cell').
+atc_l4('j07b', 'combinations').
+atc_l4('j07b', 'covid_19_inactivated_virus').
+atc_l4('j07b', 'covid_19_protein_subunit').
+atc_l4('j07b', 'covid_19_rna_based_vaccine').
+atc_l4('j07b', 'covid_19_viral_vector_non_replicating').
+atc_l4('j07b', 'covid_19_virus_like_particles').
+atc_l4('j07b', 'dengue_virus_vaccines').
+atc_l4('j07b', 'ebola_vaccines').
+atc_l4('j07b', 'encephalitis_japanese_inactivated_whole_virus').
+atc_l4('j07b', 'encephalitis_japanese_live_attenuated').
+atc_l4('j07b', 'encephalitis_tick_borne_inactivated_whole_virus').
+atc_l4('j07b', 'enterovirus_71_vaccines').
+atc_l4('j07b', 'hepatitis_a_inactivated_whole_virus').
+atc_l4('j07b', 'hepatitis_b_purified_antigen').
+atc_l4('j07b', 'influenza_inactivated_split_virus_or_surface_antigen').
+atc_l4('j07b', 'influenza_inactivated_whole_virus').
+atc_l4('j07b', 'influenza_live_attenuated').
+atc_l4('j07b', 'influenza_virus_like_particles').
+atc_l4('j07b', 'measles_combinations_with_mumps_and_rubella_live_attenuated').
+atc_l4('j07b', 'measles_combinations_with_mumps_live_attenuated').
+atc_l4('j07b', 'measles_combinations_with_mumps_rubella_and_varicella_live_attenuated').
+atc_l4('j07b', 'measles_combinations_with_rubella_live_attenuated').
+atc_l4('j07b', 'measles_live_attenuated').
+atc_l4('j07b', 'mumps_live_attenuated').
+atc_l4('j07b', 'papillomavirus_human_types_16_18').
+atc_l4('j07b', 'papillomavirus_human_types_6_11_16_18').
+atc_l4('j07b', 'papillomavirus_human_types_6_11_16_18_31_33_45_52_58').
+atc_l4('j07b', 'poliomyelitis_oral_bivalent_live_attenuated').
+atc_l4('j07b', 'poliomyelitis_oral_monovalent_live_attenuated').
+atc_l4('j07b', 'poliomyelitis_oral_trivalent_live_attenuated').
+atc_l4('j07b', 'poliomyelitis_trivalent_inactivated_whole_virus').
+atc_l4('j07b', 'rabies_inactivated_whole_virus').
+atc_l4('j07b', 'respiratory_syncytial_virus_vaccines').
+atc_l4('j07b', 'rota_virus_live_attenuated').
+atc_l4('j07b', 'rota_virus_pentavalent_live_reassorted').
+atc_l4('j07b', 'rubella_combinations_with_mumps_live_attenuated').
+atc_l4('j07b', 'rubella_live_attenuated').
+atc_l4('j07b', 'smallpox_and_monkeypox_vaccines').
+atc_l4('j07b', 'varicella_live_attenuated').
+atc_l4('j07b', 'yellow_fever_live_attenuated').
+atc_l4('j07b', 'zoster_live_attenuated').
+atc_l4('j07b', 'zoster_purified_antigen').
+atc_l4('j07c', 'diphtheria_haemophilus_influenzae_b_pertussis_poliomyelitis_tetanus').
+atc_l4('j07c', 'diphtheria_haemophilus_influenzae_b_pertussis_poliomyelitis_tetanus_hepatitis_b').
+atc_l4('j07c', 'diphtheria_haemophilus_influenzae_b_pertussis_tetanus_hepatitis_b').
+atc_l4('j07c', 'diphtheria_haemophilus_influenzae_b_pertussis_tetanus_hepatitis_b_meningococcus_a_c').
+atc_l4('j07c', 'diphtheria_hepatitis_b_pertussis_tetanus').
+atc_l4('j07c', 'diphtheria_hepatitis_b_tetanus').
+atc_l4('j07c', 'diphtheria_pertussis_poliomyelitis_tetanus').
+atc_l4('j07c', 'diphtheria_pertussis_poliomyelitis_tetanus_hepatitis_b').
+atc_l4('j07c', 'diphtheria_poliomyelitis_tetanus').
+atc_l4('j07c', 'diphtheria_rubella_tetanus').
+atc_l4('j07c', 'haemophilus_influenzae_b_and_hepatitis_b').
+atc_l4('j07c', 'haemophilus_influenzae_b_and_poliomyelitis').
+atc_l4('j07c', 'typhoid_hepatitis_a').
+atc_l4('j07x', 'malaria_vaccines').
+atc_l4('l01a', 'bendamustine').
+atc_l4('l01a', 'busulfan').
+atc_l4('l01a', 'carboquone').
+atc_l4('l01a', 'carmustine').
+atc_l4('l01a', 'chlorambucil').
+atc_l4('l01a', 'chlormethine').
+atc_l4('l01a', 'cyclophosphamide').
+atc_l4('l01a', 'dacarbazine').
+atc_l4('l01a', 'etoglucid').
+atc_l4('l01a', 'fotemustine').
+atc_l4('l01a', 'ifosfamide').
+atc_l4('l01a', 'lomustine').
+atc_l4('l01a', 'mannosulfan').
+atc_l4('l01a', 'melphalan').
+atc_l4('l01a', 'melphalan_flufenamide').
+atc_l4('l01a', 'mitobronitol').
+atc_l4('l01a', 'nimustine').
+atc_l4('l01a', 'pipobroman').
+atc_l4('l01a', 'prednimustine').
+atc_l4('l01a', 'ranimustine').
+atc_l4('l01a', 'semustine').
+atc_l4('l01a', 'streptozocin').
+atc_l4('l01a', 'temozolomide').
+atc_l4('l01a', 'thiotepa').
+atc_l4('l01a', 'treosulfan').
+atc_l4('l01a', 'triaziquone').
+atc_l4('l01a', 'trofosfamide').
+atc_l4('l01a', 'uramustine').
+atc_l4('l01b', 'azacitidine').
+atc_l4('l01b', 'capecitabine').
+atc_l4('l01b', 'carmofur').
+atc_l4('l01b', 'cladribine').
+atc_l4('l01b', 'clofarabine').
+atc_l4('l01b', 'cytarabine').
+atc_l4('l01b', 'decitabine').
+atc_l4('l01b', 'decitabine_combinations').
+atc_l4('l01b', 'floxuridine').
+atc_l4('l01b', 'fludarabine').
+atc_l4('l01b', 'fluorouracil').
+atc_l4('l01b', 'fluorouracil_combinations').
+atc_l4('l01b', 'gemcitabine').
+atc_l4('l01b', 'mercaptopurine').
+atc_l4('l01b', 'methotrexate').
+atc_l4('l01b', 'nelarabine').
+atc_l4('l01b', 'pemetrexed').
+atc_l4('l01b', 'pralatrexate').
+atc_l4('l01b', 'raltitrexed').
+atc_l4('l01b', 'tegafur').
+atc_l4('l01b', 'tegafur_combinations').
+atc_l4('l01b', 'tioguanine').
+atc_l4('l01b', 'trifluridine_combinations').
+atc_l4('l01c', 'belotecan').
+atc_l4('l01c', 'cabazitaxel').
+atc_l4('l01c', 'demecolcine').
+atc_l4('l01c', 'docetaxel').
+atc_l4('l01c', 'etirinotecan_pegol').
+atc_l4('l01c', 'etoposide').
+atc_l4('l01c', 'irinotecan').
+atc_l4('l01c', 'paclitaxel').
+atc_l4('l01c', 'paclitaxel_and_encequidar').
+atc_l4('l01c', 'paclitaxel_poliglumex').
+atc_l4('l01c', 'teniposide').
+atc_l4('l01c', 'topotecan').
+atc_l4('l01c', 'trabectedin').
+atc_l4('l01c', 'vinblastine').
+atc_l4('l01c', 'vincristine').
+atc_l4('l01c', 'vindesine').
+atc_l4('l01c', 'vinflunine').
+atc_l4('l01c', 'vinorelbine').
+atc_l4('l01c', 'vintafolide').
+atc_l4('l01d', 'aclarubicin').
+atc_l4('l01d', 'amrubicin').
+atc_l4('l01d', 'bleomycin').
+atc_l4('l01d', 'dactinomycin').
+atc_l4('l01d', 'daunorubicin').
+atc_l4('l01d', 'doxorubicin').
+atc_l4('l01d', 'epirubicin').
+atc_l4('l01d', 'idarubicin').
+atc_l4('l01d', 'ixabepilone').
+atc_l4('l01d', 'mitomycin').
+atc_l4('l01d', 'mitoxantrone').
+atc_l4('l01d', 'pirarubicin').
+atc_l4('l01d', 'pixantrone').
+atc_l4('l01d', 'plicamycin').
+atc_l4('l01d', 'valrubicin').
+atc_l4('l01d', 'zorubicin').
+atc_l4('l01e', 'abemaciclib').
+atc_l4('l01e', 'acalabrutinib').
+atc_l4('l01e', 'afatinib').
+atc_l4('l01e', 'alectinib').
+atc_l4('l01e', 'alpelisib').
+atc_l4('l01e', 'asciminib').
+atc_l4('l01e', 'aumolertinib').
+atc_l4('l01e', 'avapritinib').
+atc_l4('l01e', 'axitinib').
+atc_l4('l01e', 'binimetinib').
+atc_l4('l01e', 'bosutinib').
+atc_l4('l01e', 'brigatinib').
+atc_l4('l01e', 'cabozantinib').
+atc_l4('l01e', 'capivasertib').
+atc_l4('l01e', 'capmatinib').
+atc_l4('l01e', 'cediranib').
+atc_l4('l01e', 'ceritinib').
+atc_l4('l01e', 'cobimetinib').
+atc_l4('l01e', 'copanlisib').
+atc_l4('l01e', 'crizotinib').
+atc_l4('l01e', 'dabrafenib').
+atc_l4('l01e', 'dacomitinib').
+atc_l4('l01e', 'dasatinib').
+atc_l4('l01e', 'duvelisib').
+atc_l4('l01e', 'encorafenib').
+atc_l4('l01e', 'entrectinib').
+atc_l4('l01e', 'erdafitinib').
+atc_l4('l01e', 'erlotinib').
+atc_l4('l01e', 'everolimus').
+atc_l4('l01e', 'fedratinib').
+atc_l4('l01e', 'fruquintinib').
+atc_l4('l01e', 'futibatinib').
+atc_l4('l01e', 'gefitinib').
+atc_l4('l01e', 'gilteritinib').
+atc_l4('l01e', 'ibrutinib').
+atc_l4('l01e', 'icotinib').
+atc_l4('l01e', 'idelalisib').
+atc_l4('l01e', 'imatinib').
+atc_l4('l01e', 'infigratinib').
+atc_l4('l01e', 'lapatinib').
+atc_l4('l01e', 'larotrectinib').
+atc_l4('l01e', 'lazertinib').
+atc_l4('l01e', 'lenvatinib').
+atc_l4('l01e', 'lorlatinib').
+atc_l4('l01e', 'masitinib').
+atc_l4('l01e', 'midostaurin').
+atc_l4('l01e', 'mobocertinib').
+atc_l4('l01e', 'momelotinib').
+atc_l4('l01e', 'neratinib').
+atc_l4('l01e', 'nilotinib').
+atc_l4('l01e', 'nintedanib').
+atc_l4('l01e', 'olmutinib').
+atc_l4('l01e', 'orelabrutinib').
+atc_l4('l01e', 'osimertinib').
+atc_l4('l01e', 'pacritinib').
+atc_l4('l01e', 'palbociclib').
+atc_l4('l01e', 'parsaclisib').
+atc_l4('l01e', 'pazopanib').
+atc_l4('l01e', 'pemigatinib').
+atc_l4('l01e', 'pexidartinib').
+atc_l4('l01e', 'pirtobrutinib').
+atc_l4('l01e', 'ponatinib').
+atc_l4('l01e', 'pralsetinib').
+atc_l4('l01e', 'quizartinib').
+atc_l4('l01e', 'regorafenib').
+atc_l4('l01e', 'ribociclib').
+atc_l4('l01e', 'ridaforolimus').
+atc_l4('l01e', 'ripretinib').
+atc_l4('l01e', 'rociletinib').
+atc_l4('l01e', 'ruxolitinib').
+atc_l4('l01e', 'selpercatinib').
+atc_l4('l01e', 'selumetinib').
+atc_l4('l01e', 'sirolimus').
+atc_l4('l01e', 'sitravatinib').
+atc_l4('l01e', 'sorafenib').
+atc_l4('l01e', 'sunitinib').
+atc_l4('l01e', 'surufatinib').
+atc_l4('l01e', 'temsirolimus').
+atc_l4('l01e', 'tepotinib').
+atc_l4('l01e', 'tivozanib').
+atc_l4('l01e', 'trametinib').
+atc_l4('l01e', 'tucatinib').
+atc_l4('l01e', 'umbralisib').
+atc_l4('l01e', 'vandetanib').
+atc_l4('l01e', 'vemurafenib').
+atc_l4('l01e', 'zanubrutinib').
+atc_l4('l01f', 'amivantamab').
+atc_l4('l01f', 'atezolizumab').
+atc_l4('l01f', 'avelumab').
+atc_l4('l01f', 'belantamab_mafodotin').
+atc_l4('l01f', 'bermekimab').
+atc_l4('l01f', 'bevacizumab').
+atc_l4('l01f', 'blinatumomab').
+atc_l4('l01f', 'brentuximab_vedotin').
+atc_l4('l01f', 'catumaxomab').
+atc_l4('l01f', 'cemiplimab').
+atc_l4('l01f', 'cetuximab').
+atc_l4('l01f', 'daratumumab').
+atc_l4('l01f', 'dinutuximab_beta').
+atc_l4('l01f', 'dostarlimab').
+atc_l4('l01f', 'durvalumab').
+atc_l4('l01f', 'edrecolomab').
+atc_l4('l01f', 'elotuzumab').
+atc_l4('l01f', 'enfortumab_vedotin').
+atc_l4('l01f', 'epcoritamab').
+atc_l4('l01f', 'gemtuzumab_ozogamicin').
+atc_l4('l01f', 'glofitamab').
+atc_l4('l01f', 'inotuzumab_ozogamicin').
+atc_l4('l01f', 'ipilimumab').
+atc_l4('l01f', 'isatuximab').
+atc_l4('l01f', 'loncastuximab_tesirine').
+atc_l4('l01f', 'margetuximab').
+atc_l4('l01f', 'mirvetuximab_soravtansine').
+atc_l4('l01f', 'mogamulizumab').
+atc_l4('l01f', 'mosunetuzumab').
+atc_l4('l01f', 'moxetumomab_pasudotox').
+atc_l4('l01f', 'naxitamab').
+atc_l4('l01f', 'necitumumab').
+atc_l4('l01f', 'nivolumab').
+atc_l4('l01f', 'nivolumab_and_relatlimab').
+atc_l4('l01f', 'obinutuzumab').
+atc_l4('l01f', 'ofatumumab').
+atc_l4('l01f', 'olaratumab').
+atc_l4('l01f', 'oportuzumab_monatox').
+atc_l4('l01f', 'panitumumab').
+atc_l4('l01f', 'pembrolizumab').
+atc_l4('l01f', 'pertuzumab').
+atc_l4('l01f', 'pertuzumab_and_trastuzumab').
+atc_l4('l01f', 'polatuzumab_vedotin').
+atc_l4('l01f', 'prolgolimab').
+atc_l4('l01f', 'prolgolimab_and_nurulimab').
+atc_l4('l01f', 'ramucirumab').
+atc_l4('l01f', 'retifanlimab').
+atc_l4('l01f', 'rituximab').
+atc_l4('l01f', 'sabatolimab').
+atc_l4('l01f', 'sacituzumab_govitecan').
+atc_l4('l01f', 'serplulimab').
+atc_l4('l01f', 'sugemalimab').
+atc_l4('l01f', 'tafasitamab').
+atc_l4('l01f', 'talquetamab').
+atc_l4('l01f', 'teclistamab').
+atc_l4('l01f', 'tislelizumab').
+atc_l4('l01f', 'tisotumab_vedotin').
+atc_l4('l01f', 'toripalimab').
+atc_l4('l01f', 'trastuzumab').
+atc_l4('l01f', 'trastuzumab_deruxtecan').
+atc_l4('l01f', 'trastuzumab_duocarmazine').
+atc_l4('l01f', 'trastuzumab_emtansine').
+atc_l4('l01f', 'tremelimumab').
+atc_l4('l01x', 'adagrasib').
+atc_l4('l01x', 'aflibercept').
+atc_l4('l01x', 'alitretinoin').
+atc_l4('l01x', 'altretamine').
+atc_l4('l01x', 'aminolevulinic_acid').
+atc_l4('l01x', 'amsacrine').
+atc_l4('l01x', 'anagrelide').
+atc_l4('l01x', 'arsenic_trioxide').
+atc_l4('l01x', 'asparaginase').
+atc_l4('l01x', 'axicabtagene_ciloleucel').
+atc_l4('l01x', 'belinostat').
+atc_l4('l01x', 'belzutifan').
+atc_l4('l01x', 'bexarotene').
+atc_l4('l01x', 'bortezomib').
+atc_l4('l01x', 'brexucabtagene_autoleucel').
+atc_l4('l01x', 'carboplatin').
+atc_l4('l01x', 'carfilzomib').
+atc_l4('l01x', 'celecoxib').
+atc_l4('l01x', 'ciltacabtagene_autoleucel').
+atc_l4('l01x', 'cisplatin').
+atc_l4('l01x', 'cytarabine_and_daunorubicin').
+atc_l4('l01x', 'denileukin_diftitox').
+atc_l4('l01x', 'efaproxiral').
+atc_l4('l01x', 'eflornithine').
+atc_l4('l01x', 'enasidenib').
+atc_l4('l01x', 'entinostat').
+atc_l4('l01x', 'epacadostat').
+atc_l4('l01x', 'eribulin').
+atc_l4('l01x', 'estramustine').
+atc_l4('l01x', 'glasdegib').
+atc_l4('l01x', 'hydroxycarbamide').
+atc_l4('l01x', 'idecabtagene_vicleucel').
+atc_l4('l01x', 'imetelstat').
+atc_l4('l01x', 'ivosidenib').
+atc_l4('l01x', 'ixazomib').
+atc_l4('l01x', 'lifileucel').
+atc_l4('l01x', 'lisocabtagene_maraleucel').
+atc_l4('l01x', 'lonidamine').
+atc_l4('l01x', 'lurbinectedin').
+atc_l4('l01x', 'masoprocol').
+atc_l4('l01x', 'methyl_aminolevulinate').
+atc_l4('l01x', 'mitoguazone').
+atc_l4('l01x', 'mitotane').
+atc_l4('l01x', 'nadofaragene_firadenovec').
+atc_l4('l01x', 'navitoclax').
+atc_l4('l01x', 'niraparib').
+atc_l4('l01x', 'niraparib_and_abiraterone').
+atc_l4('l01x', 'oblimersen').
+atc_l4('l01x', 'olaparib').
+atc_l4('l01x', 'omacetaxine_mepesuccinate').
+atc_l4('l01x', 'oxaliplatin').
+atc_l4('l01x', 'padeliporfin').
+atc_l4('l01x', 'pamiparib').
+atc_l4('l01x', 'panobinostat').
+atc_l4('l01x', 'pegaspargase').
+atc_l4('l01x', 'pentostatin').
+atc_l4('l01x', 'plitidepsin').
+atc_l4('l01x', 'polyplatillen').
+atc_l4('l01x', 'porfimer_sodium').
+atc_l4('l01x', 'procarbazine').
+atc_l4('l01x', 'romidepsin').
+atc_l4('l01x', 'rucaparib').
+atc_l4('l01x', 'satraplatin').
+atc_l4('l01x', 'selinexor').
+atc_l4('l01x', 'sitimagene_ceradenovec').
+atc_l4('l01x', 'sonidegib').
+atc_l4('l01x', 'sotorasib').
+atc_l4('l01x', 'tabelecleucel').
+atc_l4('l01x', 'tagraxofusp').
+atc_l4('l01x', 'talazoparib').
+atc_l4('l01x', 'talimogene_laherparepvec').
+atc_l4('l01x', 'tazemetostat').
+atc_l4('l01x', 'tebentafusp').
+atc_l4('l01x', 'temoporfin').
+atc_l4('l01x', 'tiazofurine').
+atc_l4('l01x', 'tisagenlecleucel').
+atc_l4('l01x', 'tretinoin').
+atc_l4('l01x', 'veliparib').
+atc_l4('l01x', 'venetoclax').
+atc_l4('l01x', 'vismodegib').
+atc_l4('l01x', 'vorinostat').
+atc_l4('l01x', 'vosaroxin').
+atc_l4('l02a', 'buserelin').
+atc_l4('l02a', 'diethylstilbestrol').
+atc_l4('l02a', 'ethinylestradiol').
+atc_l4('l02a', 'fosfestrol').
+atc_l4('l02a', 'gestonorone').
+atc_l4('l02a', 'goserelin').
+atc_l4('l02a', 'histrelin').
+atc_l4('l02a', 'leuprorelin').
+atc_l4('l02a', 'leuprorelin_and_bicalutamide').
+atc_l4('l02a', 'medroxyprogesterone').
+atc_l4('l02a', 'megestrol').
+atc_l4('l02a', 'polyestradiol_phosphate').
+atc_l4('l02a', 'triptorelin').
+atc_l4('l02b', 'abarelix').
+atc_l4('l02b', 'abiraterone').
+atc_l4('l02b', 'abiraterone_and_prednisolone').
+atc_l4('l02b', 'aminoglutethimide').
+atc_l4('l02b', 'anastrozole').
+atc_l4('l02b', 'apalutamide').
+atc_l4('l02b', 'bicalutamide').
+atc_l4('l02b', 'darolutamide').
+atc_l4('l02b', 'degarelix').
+atc_l4('l02b', 'elacestrant').
+atc_l4('l02b', 'enzalutamide').
+atc_l4('l02b', 'exemestane').
+atc_l4('l02b', 'flutamide').
+atc_l4('l02b', 'formestane').
+atc_l4('l02b', 'fulvestrant').
+atc_l4('l02b', 'letrozole').
+atc_l4('l02b', 'nilutamide').
+atc_l4('l02b', 'relugolix').
+atc_l4('l02b', 'tamoxifen').
+atc_l4('l02b', 'toremifene').
+atc_l4('l02b', 'vorozole').
+atc_l4('l03a', 'albinterferon_alfa_2b').
+atc_l4('l03a', 'aldesleukin').
+atc_l4('l03a', 'ancestim').
+atc_l4('l03a', 'balugrastim').
+atc_l4('l03a', 'bcg_vaccine').
+atc_l4('l03a', 'cepeginterferon_alfa_2b').
+atc_l4('l03a', 'cridanimod').
+atc_l4('l03a', 'dasiprotimut_t').
+atc_l4('l03a', 'efbemalenograstim_alfa').
+atc_l4('l03a', 'eflapegrastim').
+atc_l4('l03a', 'elapegademase').
+atc_l4('l03a', 'empegfilgrastim').
+atc_l4('l03a', 'filgrastim').
+atc_l4('l03a', 'glatiramer_acetate').
+atc_l4('l03a', 'histamine_dihydrochloride').
+atc_l4('l03a', 'immunocyanin').
+atc_l4('l03a', 'interferon_alfa_2a').
+atc_l4('l03a', 'interferon_alfa_2b').
+atc_l4('l03a', 'interferon_alfa_n1').
+atc_l4('l03a', 'interferon_alfa_natural').
+atc_l4('l03a', 'interferon_alfacon_1').
+atc_l4('l03a', 'interferon_beta_1a').
+atc_l4('l03a', 'interferon_beta_1b').
+atc_l4('l03a', 'interferon_beta_natural').
+atc_l4('l03a', 'interferon_gamma').
+atc_l4('l03a', 'leniolisib').
+atc_l4('l03a', 'lenograstim').
+atc_l4('l03a', 'lentinan').
+atc_l4('l03a', 'lipegfilgrastim').
+atc_l4('l03a', 'melanoma_vaccine').
+atc_l4('l03a', 'mifamurtide').
+atc_l4('l03a', 'molgramostim').
+atc_l4('l03a', 'oprelvekin').
+atc_l4('l03a', 'pegademase').
+atc_l4('l03a', 'pegfilgrastim').
+atc_l4('l03a', 'peginterferon_alfa_2a').
+atc_l4('l03a', 'peginterferon_alfa_2a_combinations').
+atc_l4('l03a', 'peginterferon_alfa_2b').
+atc_l4('l03a', 'peginterferon_alfa_2b_combinations').
+atc_l4('l03a', 'peginterferon_alfacon_2').
+atc_l4('l03a', 'peginterferon_beta_1a').
+atc_l4('l03a', 'pegteograstim').
+atc_l4('l03a', 'pidotimod').
+atc_l4('l03a', 'plerixafor').
+atc_l4('l03a', 'poly_i_c').
+atc_l4('l03a', 'poly_iclc').
+atc_l4('l03a', 'ropeginterferon_alfa_2b').
+atc_l4('l03a', 'roquinimex').
+atc_l4('l03a', 'sampeginterferon_beta_1a').
+atc_l4('l03a', 'sargramostim').
+atc_l4('l03a', 'sipuleucel_t').
+atc_l4('l03a', 'tasonermin').
+atc_l4('l03a', 'thymopentin').
+atc_l4('l04a', 'abatacept').
+atc_l4('l04a', 'abetimus').
+atc_l4('l04a', 'adalimumab').
+atc_l4('l04a', 'afelimomab').
+atc_l4('l04a', 'alefacept').
+atc_l4('l04a', 'alemtuzumab').
+atc_l4('l04a', 'anakinra').
+atc_l4('l04a', 'anifrolumab').
+atc_l4('l04a', 'antilymphocyte_immunoglobulin_horse').
+atc_l4('l04a', 'antithymocyte_immunoglobulin_rabbit').
+atc_l4('l04a', 'apremilast').
+atc_l4('l04a', 'avacopan').
+atc_l4('l04a', 'azathioprine').
+atc_l4('l04a', 'baricitinib').
+atc_l4('l04a', 'basiliximab').
+atc_l4('l04a', 'begelomab').
+atc_l4('l04a', 'belatacept').
+atc_l4('l04a', 'belimumab').
+atc_l4('l04a', 'belumosudil').
+atc_l4('l04a', 'bimekizumab').
+atc_l4('l04a', 'briakinumab').
+atc_l4('l04a', 'brodalumab').
+atc_l4('l04a', 'canakinumab').
+atc_l4('l04a', 'certolizumab_pegol').
+atc_l4('l04a', 'ciclosporin').
+atc_l4('l04a', 'cladribine').
+atc_l4('l04a', 'crovalimab').
+atc_l4('l04a', 'daclizumab').
+atc_l4('l04a', 'danicopan').
+atc_l4('l04a', 'darvadstrocel').
+atc_l4('l04a', 'deucravacitinib').
+atc_l4('l04a', 'dimethyl_fumarate').
+atc_l4('l04a', 'diroximel_fumarate').
+atc_l4('l04a', 'divozilimab').
+atc_l4('l04a', 'eculizumab').
+atc_l4('l04a', 'efalizumab').
+atc_l4('l04a', 'efgartigimod_alfa').
+atc_l4('l04a', 'emapalumab').
+atc_l4('l04a', 'etanercept').
+atc_l4('l04a', 'etrasimod').
+atc_l4('l04a', 'everolimus').
+atc_l4('l04a', 'filgotinib').
+atc_l4('l04a', 'fingolimod').
+atc_l4('l04a', 'golimumab').
+atc_l4('l04a', 'guselkumab').
+atc_l4('l04a', 'gusperimus').
+atc_l4('l04a', 'imlifidase').
+atc_l4('l04a', 'inebilizumab').
+atc_l4('l04a', 'infliximab').
+atc_l4('l04a', 'iptacopan').
+atc_l4('l04a', 'itacitinib').
+atc_l4('l04a', 'ixekizumab').
+atc_l4('l04a', 'leflunomide').
+atc_l4('l04a', 'lenalidomide').
+atc_l4('l04a', 'levilimab').
+atc_l4('l04a', 'methotrexate').
+atc_l4('l04a', 'mirikizumab').
+atc_l4('l04a', 'muromonab_cd3').
+atc_l4('l04a', 'mycophenolic_acid').
+atc_l4('l04a', 'natalizumab').
+atc_l4('l04a', 'netakimab').
+atc_l4('l04a', 'ocrelizumab').
+atc_l4('l04a', 'ofatumumab').
+atc_l4('l04a', 'olokizumab').
+atc_l4('l04a', 'opinercept').
+atc_l4('l04a', 'ozanimod').
+atc_l4('l04a', 'peficitinib').
+atc_l4('l04a', 'pegcetacoplan').
+atc_l4('l04a', 'pirfenidone').
+atc_l4('l04a', 'pomalidomide').
+atc_l4('l04a', 'ponesimod').
+atc_l4('l04a', 'ravulizumab').
+atc_l4('l04a', 'rilonacept').
+atc_l4('l04a', 'risankizumab').
+atc_l4('l04a', 'ritlecitinib').
+atc_l4('l04a', 'rozanolixizumab').
+atc_l4('l04a', 'sarilumab').
+atc_l4('l04a', 'satralizumab').
+atc_l4('l04a', 'secukinumab').
+atc_l4('l04a', 'siltuximab').
+atc_l4('l04a', 'siponimod').
+atc_l4('l04a', 'sirolimus').
+atc_l4('l04a', 'sirukumab').
+atc_l4('l04a', 'spesolimab').
+atc_l4('l04a', 'sutimlimab').
+atc_l4('l04a', 'tacrolimus').
+atc_l4('l04a', 'teprotumumab').
+atc_l4('l04a', 'teriflunomide').
+atc_l4('l04a', 'thalidomide').
+atc_l4('l04a', 'tildrakizumab').
+atc_l4('l04a', 'tocilizumab').
+atc_l4('l04a', 'tofacitinib').
+atc_l4('l04a', 'ublituximab').
+atc_l4('l04a', 'upadacitinib').
+atc_l4('l04a', 'ustekinumab').
+atc_l4('l04a', 'vedolizumab').
+atc_l4('l04a', 'voclosporin').
+atc_l4('l04a', 'zilucoplan').
+atc_l4('m01a', 'aceclofenac').
+atc_l4('m01a', 'acemetacin').
+atc_l4('m01a', 'alclofenac').
+atc_l4('m01a', 'alminoprofen').
+atc_l4('m01a', 'avocado_and_soyabean_oil_unsaponifiables').
+atc_l4('m01a', 'azapropazone').
+atc_l4('m01a', 'benoxaprofen').
+atc_l4('m01a', 'benzydamine').
+atc_l4('m01a', 'bufexamac').
+atc_l4('m01a', 'bumadizone').
+atc_l4('m01a', 'celecoxib').
+atc_l4('m01a', 'chondroitin_sulfate').
+atc_l4('m01a', 'clofezone').
+atc_l4('m01a', 'dexibuprofen').
+atc_l4('m01a', 'dexketoprofen').
+atc_l4('m01a', 'diacerein').
+atc_l4('m01a', 'diclofenac').
+atc_l4('m01a', 'diclofenac_combinations').
+atc_l4('m01a', 'difenpiramide').
+atc_l4('m01a', 'droxicam').
+atc_l4('m01a', 'etodolac').
+atc_l4('m01a', 'etoricoxib').
+atc_l4('m01a', 'fenbufen').
+atc_l4('m01a', 'fenoprofen').
+atc_l4('m01a', 'fentiazac').
+atc_l4('m01a', 'feprazone').
+atc_l4('m01a', 'feprazone_combinations').
+atc_l4('m01a', 'flufenamic_acid').
+atc_l4('m01a', 'flunoxaprofen').
+atc_l4('m01a', 'flurbiprofen').
+atc_l4('m01a', 'glucosamine').
+atc_l4('m01a', 'glucosaminoglycan_polysulfate').
+atc_l4('m01a', 'ibuprofen').
+atc_l4('m01a', 'ibuprofen_combinations').
+atc_l4('m01a', 'ibuproxam').
+atc_l4('m01a', 'indometacin').
+atc_l4('m01a', 'indometacin_combinations').
+atc_l4('m01a', 'indoprofen').
+atc_l4('m01a', 'kebuzone').
+atc_l4('m01a', 'ketoprofen').
+atc_l4('m01a', 'ketoprofen_combinations').
+atc_l4('m01a', 'ketorolac').
+atc_l4('m01a', 'lonazolac').
+atc_l4('m01a', 'lornoxicam').
+atc_l4('m01a', 'lumiracoxib').
+atc_l4('m01a', 'meclofenamic_acid').
+atc_l4('m01a', 'mefenamic_acid').
+atc_l4('m01a', 'meloxicam').
+atc_l4('m01a', 'meloxicam_combinations').
+atc_l4('m01a', 'mofebutazone').
+atc_l4('m01a', 'morniflumate').
+atc_l4('m01a', 'nabumetone').
+atc_l4('m01a', 'naproxcinod').
+atc_l4('m01a', 'naproxen').
+atc_l4('m01a', 'naproxen_and_diphenhydramine').
+atc_l4('m01a', 'naproxen_and_esomeprazole').
+atc_l4('m01a', 'naproxen_and_misoprostol').
+atc_l4('m01a', 'niflumic_acid').
+atc_l4('m01a', 'nimesulide').
+atc_l4('m01a', 'orgotein').
+atc_l4('m01a', 'oxaceprol').
+atc_l4('m01a', 'oxametacin').
+atc_l4('m01a', 'oxaprozin').
+atc_l4('m01a', 'oxyphenbutazone').
+atc_l4('m01a', 'parecoxib').
+atc_l4('m01a', 'phenylbutazone').
+atc_l4('m01a', 'piroxicam').
+atc_l4('m01a', 'pirprofen').
+atc_l4('m01a', 'polmacoxib').
+atc_l4('m01a', 'proglumetacin').
+atc_l4('m01a', 'proquazone').
+atc_l4('m01a', 'rofecoxib').
+atc_l4('m01a', 'sulindac').
+atc_l4('m01a', 'suprofen').
+atc_l4('m01a', 'tenidap').
+atc_l4('m01a', 'tenoxicam').
+atc_l4('m01a', 'tiaprofenic_acid').
+atc_l4('m01a', 'tolfenamic_acid').
+atc_l4('m01a', 'tolmetin').
+atc_l4('m01a', 'valdecoxib').
+atc_l4('m01a', 'zomepirac').
+atc_l4('m01b', 'acetylsalicylic_acid_and_corticosteroids').
+atc_l4('m01b', 'dipyrocetyl_and_corticosteroids').
+atc_l4('m01b', 'phenylbutazone_and_corticosteroids').
+atc_l4('m01c', 'auranofin').
+atc_l4('m01c', 'aurothioglucose').
+atc_l4('m01c', 'aurotioprol').
+atc_l4('m01c', 'bucillamine').
+atc_l4('m01c', 'oxycinchophen').
+atc_l4('m01c', 'penicillamine').
+atc_l4('m01c', 'sodium_aurothiomalate').
+atc_l4('m01c', 'sodium_aurotiosulfate').
+atc_l4('m02a', 'aceclofenac').
+atc_l4('m02a', 'bendazac').
+atc_l4('m02a', 'benzydamine').
+atc_l4('m02a', 'bufexamac').
+atc_l4('m02a', 'capsaicin').
+atc_l4('m02a', 'clofezone').
+atc_l4('m02a', 'dexketoprofen').
+atc_l4('m02a', 'diclofenac').
+atc_l4('m02a', 'dimethyl_sulfoxide').
+atc_l4('m02a', 'esflurbiprofen').
+atc_l4('m02a', 'etofenamate').
+atc_l4('m02a', 'felbinac').
+atc_l4('m02a', 'fentiazac').
+atc_l4('m02a', 'feprazone').
+atc_l4('m02a', 'flurbiprofen').
+atc_l4('m02a', 'ibuprofen').
+atc_l4('m02a', 'idrocilamide').
+atc_l4('m02a', 'indometacin').
+atc_l4('m02a', 'ketoprofen').
+atc_l4('m02a', 'loxoprofen').
+atc_l4('m02a', 'meclofenamic_acid').
+atc_l4('m02a', 'mofebutazone').
+atc_l4('m02a', 'naproxen').
+atc_l4('m02a', 'nifenazone').
+atc_l4('m02a', 'niflumic_acid').
+atc_l4('m02a', 'nimesulide').
+atc_l4('m02a', 'oxyphenbutazone').
+atc_l4('m02a', 'phenylbutazone').
+atc_l4('m02a', 'piketoprofen').
+atc_l4('m02a', 'piroxicam').
+atc_l4('m02a', 'suxibuzone').
+atc_l4('m02a', 'tolazoline').
+atc_l4('m02a', 'tolmetin').
+atc_l4('m02a', 'tolperisone').
+atc_l4('m02a', 'various').
+atc_l4('m02a', 'zucapsaicin').
+atc_l4('m03a', 'alcuronium').
+atc_l4('m03a', 'atracurium').
+atc_l4('m03a', 'botulinum_toxin').
+atc_l4('m03a', 'cisatracurium').
+atc_l4('m03a', 'dimethyltubocurarine').
+atc_l4('m03a', 'doxacurium_chloride').
+atc_l4('m03a', 'fazadinium_bromide').
+atc_l4('m03a', 'gallamine').
+atc_l4('m03a', 'hexafluronium').
+atc_l4('m03a', 'mivacurium_chloride').
+atc_l4('m03a', 'pancuronium').
+atc_l4('m03a', 'pipecuronium_bromide').
+atc_l4('m03a', 'rocuronium_bromide').
+atc_l4('m03a', 'suxamethonium').
+atc_l4('m03a', 'tubocurarine').
+atc_l4('m03a', 'vecuronium').
+atc_l4('m03b', 'baclofen').
+atc_l4('m03b', 'carisoprodol').
+atc_l4('m03b', 'carisoprodol_combinations_excl_psycholeptics').
+atc_l4('m03b', 'carisoprodol_combinations_with_psycholeptics').
+atc_l4('m03b', 'chlormezanone').
+atc_l4('m03b', 'chlormezanone_combinations_excl_psycholeptics').
+atc_l4('m03b', 'chlormezanone_combinations_with_psycholeptics').
+atc_l4('m03b', 'chlorzoxazone').
+atc_l4('m03b', 'chlorzoxazone_combinations_excl_psycholeptics').
+atc_l4('m03b', 'chlorzoxazone_combinations_with_psycholeptics').
+atc_l4('m03b', 'cyclobenzaprine').
+atc_l4('m03b', 'eperisone').
+atc_l4('m03b', 'febarbamate').
+atc_l4('m03b', 'fenyramidol').
+atc_l4('m03b', 'mephenesin').
+atc_l4('m03b', 'methocarbamol').
+atc_l4('m03b', 'methocarbamol_combinations_excl_psycholeptics').
+atc_l4('m03b', 'methocarbamol_combinations_with_psycholeptics').
+atc_l4('m03b', 'orphenadrine_citrate').
+atc_l4('m03b', 'orphenadrine_combinations').
+atc_l4('m03b', 'phenprobamate').
+atc_l4('m03b', 'phenprobamate_combinations_excl_psycholeptics').
+atc_l4('m03b', 'phenprobamate_combinations_with_psycholeptics').
+atc_l4('m03b', 'pridinol').
+atc_l4('m03b', 'pridinol_combinations').
+atc_l4('m03b', 'styramate').
+atc_l4('m03b', 'tetrazepam').
+atc_l4('m03b', 'thiocolchicoside').
+atc_l4('m03b', 'thiocolchicoside_combinations').
+atc_l4('m03b', 'tizanidine').
+atc_l4('m03b', 'tolperisone').
+atc_l4('m03c', 'dantrolene').
+atc_l4('m04a', 'allopurinol').
+atc_l4('m04a', 'allopurinol_combinations').
+atc_l4('m04a', 'benzbromarone').
+atc_l4('m04a', 'cinchophen').
+atc_l4('m04a', 'colchicine').
+atc_l4('m04a', 'colchicine_and_probenecid').
+atc_l4('m04a', 'febuxostat').
+atc_l4('m04a', 'isobromindione').
+atc_l4('m04a', 'lesinurad').
+atc_l4('m04a', 'pegloticase').
+atc_l4('m04a', 'probenecid').
+atc_l4('m04a', 'sulfinpyrazone').
+atc_l4('m04a', 'tisopurine').
+atc_l4('m04a', 'urate_oxidase').
+atc_l4('m05b', 'alendronic_acid').
+atc_l4('m05b', 'alendronic_acid_and_alfacalcidol_sequential').
+atc_l4('m05b', 'alendronic_acid_and_colecalciferol').
+atc_l4('m05b', 'alendronic_acid_calcium_and_colecalciferol_sequential').
+atc_l4('m05b', 'aluminium_chlorohydrate').
+atc_l4('m05b', 'burosumab').
+atc_l4('m05b', 'clodronic_acid').
+atc_l4('m05b', 'denosumab').
+atc_l4('m05b', 'dibotermin_alfa').
+atc_l4('m05b', 'eptotermin_alfa').
+atc_l4('m05b', 'etidronic_acid').
+atc_l4('m05b', 'etidronic_acid_and_calcium_sequential').
+atc_l4('m05b', 'ibandronic_acid').
+atc_l4('m05b', 'ibandronic_acid_and_colecalciferol').
+atc_l4('m05b', 'ipriflavone').
+atc_l4('m05b', 'menatetrenone').
+atc_l4('m05b', 'pamidronic_acid').
+atc_l4('m05b', 'risedronic_acid').
+atc_l4('m05b', 'risedronic_acid_and_calcium_sequential').
+atc_l4('m05b', 'risedronic_acid_and_colecalciferol').
+atc_l4('m05b', 'risedronic_acid_calcium_and_colecalciferol_sequential').
+atc_l4('m05b', 'romosozumab').
+atc_l4('m05b', 'strontium_ranelate').
+atc_l4('m05b', 'strontium_ranelate_and_colecalciferol').
+atc_l4('m05b', 'tiludronic_acid').
+atc_l4('m05b', 'vosoritide').
+atc_l4('m05b', 'zoledronic_acid').
+atc_l4('m05b', 'zoledronic_acid_calcium_and_colecalciferol_sequential').
+atc_l4('m09a', 'aceneuramic_acid').
+atc_l4('m09a', 'ataluren').
+atc_l4('m09a', 'bromelains').
+atc_l4('m09a', 'casimersen').
+atc_l4('m09a', 'chondrocytes_autologous').
+atc_l4('m09a', 'chymopapain').
+atc_l4('m09a', 'collagenase_clostridium_histolyticum').
+atc_l4('m09a', 'delandistrogene_moxeparvovec').
+atc_l4('m09a', 'drisapersen').
+atc_l4('m09a', 'eteplirsen').
+atc_l4('m09a', 'givinostat').
+atc_l4('m09a', 'golodirsen').
+atc_l4('m09a', 'hyaluronic_acid').
+atc_l4('m09a', 'hydroquinine').
+atc_l4('m09a', 'nusinersen').
+atc_l4('m09a', 'onasemnogene_abeparvovec').
+atc_l4('m09a', 'palovarotene').
+atc_l4('m09a', 'quinine_combinations_with_psycholeptics').
+atc_l4('m09a', 'risdiplam').
+atc_l4('m09a', 'trypsin_combinations').
+atc_l4('m09a', 'viltolarsen').
+atc_l4('n01a', 'alfaxalone').
+atc_l4('n01a', 'alfentanil').
+atc_l4('n01a', 'anileridine').
+atc_l4('n01a', 'chloroform').
+atc_l4('n01a', 'desflurane').
+atc_l4('n01a', 'diethyl_ether').
+atc_l4('n01a', 'enflurane').
+atc_l4('n01a', 'esketamine').
+atc_l4('n01a', 'etomidate').
+atc_l4('n01a', 'fentanyl').
+atc_l4('n01a', 'fentanyl_combinations').
+atc_l4('n01a', 'halothane').
+atc_l4('n01a', 'hexobarbital').
+atc_l4('n01a', 'isoflurane').
+atc_l4('n01a', 'ketamine').
+atc_l4('n01a', 'methohexital').
+atc_l4('n01a', 'narcobarbital').
+atc_l4('n01a', 'nitrous_oxide').
+atc_l4('n01a', 'nitrous_oxide_combinations').
+atc_l4('n01a', 'phenoperidine').
+atc_l4('n01a', 'propanidid').
+atc_l4('n01a', 'propofol').
+atc_l4('n01a', 'remifentanil').
+atc_l4('n01a', 'sevoflurane').
+atc_l4('n01a', 'sodium_oxybate').
+atc_l4('n01a', 'sufentanil').
+atc_l4('n01a', 'thiopental').
+atc_l4('n01a', 'trichloroethylene').
+atc_l4('n01a', 'vinyl_ether').
+atc_l4('n01a', 'xenon').
+atc_l4('n01b', 'articaine').
+atc_l4('n01b', 'articaine_combinations').
+atc_l4('n01b', 'benzocaine').
+atc_l4('n01b', 'bupivacaine').
+atc_l4('n01b', 'bupivacaine_and_meloxicam').
+atc_l4('n01b', 'bupivacaine_combinations').
+atc_l4('n01b', 'butanilicaine').
+atc_l4('n01b', 'capsaicin').
+atc_l4('n01b', 'chloroprocaine').
+atc_l4('n01b', 'cinchocaine').
+atc_l4('n01b', 'cocaine').
+atc_l4('n01b', 'combinations').
+atc_l4('n01b', 'dyclonine').
+atc_l4('n01b', 'ethyl_chloride').
+atc_l4('n01b', 'etidocaine').
+atc_l4('n01b', 'etidocaine_combinations').
+atc_l4('n01b', 'levobupivacaine').
+atc_l4('n01b', 'lidocaine').
+atc_l4('n01b', 'lidocaine_combinations').
+atc_l4('n01b', 'mepivacaine').
+atc_l4('n01b', 'mepivacaine_combinations').
+atc_l4('n01b', 'metabutethamine').
+atc_l4('n01b', 'phenol').
+atc_l4('n01b', 'prilocaine').
+atc_l4('n01b', 'prilocaine_combinations').
+atc_l4('n01b', 'procaine').
+atc_l4('n01b', 'procaine_combinations').
+atc_l4('n01b', 'ropivacaine').
+atc_l4('n01b', 'tetracaine').
+atc_l4('n01b', 'tetracaine_combinations').
+atc_l4('n02a', 'bezitramide').
+atc_l4('n02a', 'buprenorphine').
+atc_l4('n02a', 'butorphanol').
+atc_l4('n02a', 'codeine_and_acetylsalicylic_acid').
+atc_l4('n02a', 'codeine_and_ibuprofen').
+atc_l4('n02a', 'codeine_and_other_non_opioid_analgesics').
+atc_l4('n02a', 'codeine_and_paracetamol').
+atc_l4('n02a', 'codeine_combinations_excl_psycholeptics').
+atc_l4('n02a', 'codeine_combinations_with_psycholeptics').
+atc_l4('n02a', 'dextromoramide').
+atc_l4('n02a', 'dextropropoxyphene').
+atc_l4('n02a', 'dextropropoxyphene_combinations_excl_psycholeptics').
+atc_l4('n02a', 'dextropropoxyphene_combinations_with_psycholeptics').
+atc_l4('n02a', 'dezocine').
+atc_l4('n02a', 'dihydrocodeine').
+atc_l4('n02a', 'dihydrocodeine_and_acetylsalicylic_acid').
+atc_l4('n02a', 'dihydrocodeine_and_other_non_opioid_analgesics').
+atc_l4('n02a', 'dihydrocodeine_and_paracetamol').
+atc_l4('n02a', 'dihydrocodeine_combinations').
+atc_l4('n02a', 'fentanyl').
+atc_l4('n02a', 'hydrocodone_and_ibuprofen').
+atc_l4('n02a', 'hydrocodone_and_paracetamol').
+atc_l4('n02a', 'hydromorphone').
+atc_l4('n02a', 'hydromorphone_and_antispasmodics').
+atc_l4('n02a', 'hydromorphone_and_naloxone').
+atc_l4('n02a', 'ketobemidone').
+atc_l4('n02a', 'ketobemidone_and_antispasmodics').
+atc_l4('n02a', 'meptazinol').
+atc_l4('n02a', 'methadone_combinations_excl_psycholeptics').
+atc_l4('n02a', 'morphine').
+atc_l4('n02a', 'morphine_and_antispasmodics').
+atc_l4('n02a', 'morphine_combinations').
+atc_l4('n02a', 'nalbuphine').
+atc_l4('n02a', 'nicomorphine').
+atc_l4('n02a', 'oliceridine').
+atc_l4('n02a', 'opium').
+atc_l4('n02a', 'oxycodone').
+atc_l4('n02a', 'oxycodone_and_acetylsalicylic_acid').
+atc_l4('n02a', 'oxycodone_and_ibuprofen').
+atc_l4('n02a', 'oxycodone_and_naloxone').
+atc_l4('n02a', 'oxycodone_and_naltrexone').
+atc_l4('n02a', 'oxycodone_and_paracetamol').
+atc_l4('n02a', 'oxymorphone').
+atc_l4('n02a', 'papaveretum').
+atc_l4('n02a', 'pentazocine').
+atc_l4('n02a', 'pentazocine_and_naloxone').
+atc_l4('n02a', 'pethidine').
+atc_l4('n02a', 'pethidine_and_antispasmodics').
+atc_l4('n02a', 'pethidine_combinations_excl_psycholeptics').
+atc_l4('n02a', 'pethidine_combinations_with_psycholeptics').
+atc_l4('n02a', 'phenazocine').
+atc_l4('n02a', 'piritramide').
+atc_l4('n02a', 'tapentadol').
+atc_l4('n02a', 'tilidine').
+atc_l4('n02a', 'tilidine_and_naloxone').
+atc_l4('n02a', 'tramadol').
+atc_l4('n02a', 'tramadol_and_celecoxib').
+atc_l4('n02a', 'tramadol_and_dexketoprofen').
+atc_l4('n02a', 'tramadol_and_other_non_opioid_analgesics').
+atc_l4('n02a', 'tramadol_and_paracetamol').
+atc_l4('n02b', 'acetylsalicylic_acid').
+atc_l4('n02b', 'acetylsalicylic_acid_combinations_excl_psycholeptics').
+atc_l4('n02b', 'acetylsalicylic_acid_combinations_with_psycholeptics').
+atc_l4('n02b', 'aloxiprin').
+atc_l4('n02b', 'aminophenazone').
+atc_l4('n02b', 'aminophenazone_combinations_excl_psycholeptics').
+atc_l4('n02b', 'aminophenazone_combinations_with_psycholeptics').
+atc_l4('n02b', 'benorilate').
+atc_l4('n02b', 'bucetin').
+atc_l4('n02b', 'bucetin_combinations_excl_psycholeptics').
+atc_l4('n02b', 'bucetin_combinations_with_psycholeptics').
+atc_l4('n02b', 'cannabinoids').
+atc_l4('n02b', 'carbasalate_calcium').
+atc_l4('n02b', 'carbasalate_calcium_combinations_excl_psycholeptics').
+atc_l4('n02b', 'choline_salicylate').
+atc_l4('n02b', 'diflunisal').
+atc_l4('n02b', 'dipyrocetyl').
+atc_l4('n02b', 'dipyrocetyl_combinations_excl_psycholeptics').
+atc_l4('n02b', 'dipyrocetyl_combinations_with_psycholeptics').
+atc_l4('n02b', 'ethenzamide').
+atc_l4('n02b', 'ethenzamide_combinations_excl_psycholeptics').
+atc_l4('n02b', 'ethenzamide_combinations_with_psycholeptics').
+atc_l4('n02b', 'floctafenine').
+atc_l4('n02b', 'flupirtine').
+atc_l4('n02b', 'gabapentin').
+atc_l4('n02b', 'glafenine').
+atc_l4('n02b', 'guacetisal').
+atc_l4('n02b', 'imidazole_salicylate').
+atc_l4('n02b', 'magnesium_salicylate_combinations_excl_psycholeptics').
+atc_l4('n02b', 'metamizole_sodium').
+atc_l4('n02b', 'metamizole_sodium_combinations_excl_psycholeptics').
+atc_l4('n02b', 'metamizole_sodium_combinations_with_psycholeptics').
+atc_l4('n02b', 'methoxyflurane').
+atc_l4('n02b', 'mirogabalin').
+atc_l4('n02b', 'morpholine_salicylate').
+atc_l4('n02b', 'nefopam').
+atc_l4('n02b', 'nifenazone').
+atc_l4('n02b', 'paracetamol').
+atc_l4('n02b', 'paracetamol_combinations_excl_psycholeptics').
+atc_l4('n02b', 'paracetamol_combinations_with_psycholeptics').
+atc_l4('n02b', 'phenacetin').
+atc_l4('n02b', 'phenacetin_combinations_excl_psycholeptics').
+atc_l4('n02b', 'phenacetin_combinations_with_psycholeptics').
+atc_l4('n02b', 'phenazone').
+atc_l4('n02b', 'phenazone_combinations_excl_psycholeptics').
+atc_l4('n02b', 'phenazone_combinations_with_psycholeptics').
+atc_l4('n02b', 'potassium_salicylate').
+atc_l4('n02b', 'pregabalin').
+atc_l4('n02b', 'propacetamol').
+atc_l4('n02b', 'propyphenazone').
+atc_l4('n02b', 'propyphenazone_combinations_excl_psycholeptics').
+atc_l4('n02b', 'propyphenazone_combinations_with_psycholeptics').
+atc_l4('n02b', 'rimazolium').
+atc_l4('n02b', 'salicylamide').
+atc_l4('n02b', 'salicylamide_combinations_excl_psycholeptics').
+atc_l4('n02b', 'salicylamide_combinations_with_psycholeptics').
+atc_l4('n02b', 'salsalate').
+atc_l4('n02b', 'sodium_salicylate').
+atc_l4('n02b', 'tanezumab').
+atc_l4('n02b', 'viminol').
+atc_l4('n02b', 'ziconotide').
+atc_l4('n02c', 'almotriptan').
+atc_l4('n02c', 'atogepant').
+atc_l4('n02c', 'clonidine').
+atc_l4('n02c', 'dihydroergotamine').
+atc_l4('n02c', 'dihydroergotamine_combinations').
+atc_l4('n02c', 'dimetotiazine').
+atc_l4('n02c', 'eletriptan').
+atc_l4('n02c', 'eptinezumab').
+atc_l4('n02c', 'erenumab').
+atc_l4('n02c', 'ergotamine').
+atc_l4('n02c', 'ergotamine_combinations_excl_psycholeptics').
+atc_l4('n02c', 'ergotamine_combinations_with_psycholeptics').
+atc_l4('n02c', 'flumedroxone').
+atc_l4('n02c', 'fremanezumab').
+atc_l4('n02c', 'frovatriptan').
+atc_l4('n02c', 'galcanezumab').
+atc_l4('n02c', 'iprazochrome').
+atc_l4('n02c', 'lasmiditan').
+atc_l4('n02c', 'lisuride').
+atc_l4('n02c', 'methysergide').
+atc_l4('n02c', 'naratriptan').
+atc_l4('n02c', 'oxetorone').
+atc_l4('n02c', 'pizotifen').
+atc_l4('n02c', 'rimegepant').
+atc_l4('n02c', 'rizatriptan').
+atc_l4('n02c', 'sumatriptan').
+atc_l4('n02c', 'sumatriptan_and_naproxen').
+atc_l4('n02c', 'ubrogepant').
+atc_l4('n02c', 'zolmitriptan').
+atc_l4('n03a', 'amino_diphenylhydantoin_valeric_acid').
+atc_l4('n03a', 'aminobutyric_acid').
+atc_l4('n03a', 'barbexaclone').
+atc_l4('n03a', 'beclamide').
+atc_l4('n03a', 'brivaracetam').
+atc_l4('n03a', 'cannabidiol').
+atc_l4('n03a', 'carbamazepine').
+atc_l4('n03a', 'carisbamate').
+atc_l4('n03a', 'cenobamate').
+atc_l4('n03a', 'clonazepam').
+atc_l4('n03a', 'eslicarbazepine').
+atc_l4('n03a', 'ethadione').
+atc_l4('n03a', 'ethosuximide').
+atc_l4('n03a', 'ethosuximide_combinations').
+atc_l4('n03a', 'ethotoin').
+atc_l4('n03a', 'felbamate').
+atc_l4('n03a', 'fenfluramine').
+atc_l4('n03a', 'fosphenytoin').
+atc_l4('n03a', 'ganaxolone').
+atc_l4('n03a', 'lacosamide').
+atc_l4('n03a', 'lamotrigine').
+atc_l4('n03a', 'levetiracetam').
+atc_l4('n03a', 'mephenytoin').
+atc_l4('n03a', 'mephenytoin_combinations').
+atc_l4('n03a', 'mesuximide').
+atc_l4('n03a', 'metharbital').
+atc_l4('n03a', 'methylphenobarbital').
+atc_l4('n03a', 'oxcarbazepine').
+atc_l4('n03a', 'paramethadione').
+atc_l4('n03a', 'perampanel').
+atc_l4('n03a', 'phenacemide').
+atc_l4('n03a', 'pheneturide').
+atc_l4('n03a', 'phenobarbital').
+atc_l4('n03a', 'phensuximide').
+atc_l4('n03a', 'phenytoin').
+atc_l4('n03a', 'phenytoin_combinations').
+atc_l4('n03a', 'primidone').
+atc_l4('n03a', 'progabide').
+atc_l4('n03a', 'retigabine').
+atc_l4('n03a', 'rufinamide').
+atc_l4('n03a', 'stiripentol').
+atc_l4('n03a', 'sultiame').
+atc_l4('n03a', 'tiagabine').
+atc_l4('n03a', 'topiramate').
+atc_l4('n03a', 'trimethadione').
+atc_l4('n03a', 'valproic_acid').
+atc_l4('n03a', 'valpromide').
+atc_l4('n03a', 'vigabatrin').
+atc_l4('n03a', 'zonisamide').
+atc_l4('n04a', 'benzatropine').
+atc_l4('n04a', 'biperiden').
+atc_l4('n04a', 'bornaprine').
+atc_l4('n04a', 'dexetimide').
+atc_l4('n04a', 'etanautine').
+atc_l4('n04a', 'etybenzatropine').
+atc_l4('n04a', 'mazaticol').
+atc_l4('n04a', 'metixene').
+atc_l4('n04a', 'orphenadrine_chloride').
+atc_l4('n04a', 'phenglutarimide').
+atc_l4('n04a', 'procyclidine').
+atc_l4('n04a', 'profenamine').
+atc_l4('n04a', 'trihexyphenidyl').
+atc_l4('n04a', 'tropatepine').
+atc_l4('n04b', 'amantadine').
+atc_l4('n04b', 'apomorphine').
+atc_l4('n04b', 'bromocriptine').
+atc_l4('n04b', 'budipine').
+atc_l4('n04b', 'cabergoline').
+atc_l4('n04b', 'dihydroergocryptine_mesylate').
+atc_l4('n04b', 'entacapone').
+atc_l4('n04b', 'etilevodopa_and_decarboxylase_inhibitor').
+atc_l4('n04b', 'foslevodopa_and_decarboxylase_inhibitor').
+atc_l4('n04b', 'levodopa').
+atc_l4('n04b', 'levodopa_and_decarboxylase_inhibitor').
+atc_l4('n04b', 'levodopa_decarboxylase_inhibitor_and_comt_inhibitor').
+atc_l4('n04b', 'melevodopa').
+atc_l4('n04b', 'melevodopa_and_decarboxylase_inhibitor').
+atc_l4('n04b', 'opicapone').
+atc_l4('n04b', 'pergolide').
+atc_l4('n04b', 'piribedil').
+atc_l4('n04b', 'pramipexole').
+atc_l4('n04b', 'rasagiline').
+atc_l4('n04b', 'ropinirole').
+atc_l4('n04b', 'rotigotine').
+atc_l4('n04b', 'safinamide').
+atc_l4('n04b', 'selegiline').
+atc_l4('n04b', 'tolcapone').
+atc_l4('n04c', 'istradefylline').
+atc_l4('n05a', 'acepromazine').
+atc_l4('n05a', 'acetophenazine').
+atc_l4('n05a', 'amisulpride').
+atc_l4('n05a', 'aripiprazole').
+atc_l4('n05a', 'asenapine').
+atc_l4('n05a', 'benperidol').
+atc_l4('n05a', 'brexpiprazole').
+atc_l4('n05a', 'bromperidol').
+atc_l4('n05a', 'butaperazine').
+atc_l4('n05a', 'cariprazine').
+atc_l4('n05a', 'chlorproethazine').
+atc_l4('n05a', 'chlorpromazine').
+atc_l4('n05a', 'chlorprothixene').
+atc_l4('n05a', 'clopenthixol').
+atc_l4('n05a', 'clotiapine').
+atc_l4('n05a', 'clozapine').
+atc_l4('n05a', 'cyamemazine').
+atc_l4('n05a', 'dixyrazine').
+atc_l4('n05a', 'droperidol').
+atc_l4('n05a', 'fluanisone').
+atc_l4('n05a', 'flupentixol').
+atc_l4('n05a', 'fluphenazine').
+atc_l4('n05a', 'fluspirilene').
+atc_l4('n05a', 'haloperidol').
+atc_l4('n05a', 'iloperidone').
+atc_l4('n05a', 'levomepromazine').
+atc_l4('n05a', 'levosulpiride').
+atc_l4('n05a', 'lithium').
+atc_l4('n05a', 'loxapine').
+atc_l4('n05a', 'lumateperone').
+atc_l4('n05a', 'lurasidone').
+atc_l4('n05a', 'melperone').
+atc_l4('n05a', 'mesoridazine').
+atc_l4('n05a', 'molindone').
+atc_l4('n05a', 'moperone').
+atc_l4('n05a', 'mosapramine').
+atc_l4('n05a', 'olanzapine').
+atc_l4('n05a', 'olanzapine_and_samidorphan').
+atc_l4('n05a', 'oxypertine').
+atc_l4('n05a', 'paliperidone').
+atc_l4('n05a', 'penfluridol').
+atc_l4('n05a', 'perazine').
+atc_l4('n05a', 'periciazine').
+atc_l4('n05a', 'perphenazine').
+atc_l4('n05a', 'pimavanserin').
+atc_l4('n05a', 'pimozide').
+atc_l4('n05a', 'pipamperone').
+atc_l4('n05a', 'pipotiazine').
+atc_l4('n05a', 'prochlorperazine').
+atc_l4('n05a', 'promazine').
+atc_l4('n05a', 'prothipendyl').
+atc_l4('n05a', 'quetiapine').
+atc_l4('n05a', 'remoxipride').
+atc_l4('n05a', 'risperidone').
+atc_l4('n05a', 'sertindole').
+atc_l4('n05a', 'sulpiride').
+atc_l4('n05a', 'sultopride').
+atc_l4('n05a', 'thiopropazate').
+atc_l4('n05a', 'thioproperazine').
+atc_l4('n05a', 'thioridazine').
+atc_l4('n05a', 'tiapride').
+atc_l4('n05a', 'tiotixene').
+atc_l4('n05a', 'trifluoperazine').
+atc_l4('n05a', 'trifluperidol').
+atc_l4('n05a', 'triflupromazine').
+atc_l4('n05a', 'veralipride').
+atc_l4('n05a', 'ziprasidone').
+atc_l4('n05a', 'zotepine').
+atc_l4('n05a', 'zuclopenthixol').
+atc_l4('n05b', 'adinazolam').
+atc_l4('n05b', 'alprazolam').
+atc_l4('n05b', 'bentazepam').
+atc_l4('n05b', 'benzoctamine').
+atc_l4('n05b', 'bromazepam').
+atc_l4('n05b', 'buspirone').
+atc_l4('n05b', 'camazepam').
+atc_l4('n05b', 'captodiame').
+atc_l4('n05b', 'chlordiazepoxide').
+atc_l4('n05b', 'clobazam').
+atc_l4('n05b', 'clotiazepam').
+atc_l4('n05b', 'cloxazolam').
+atc_l4('n05b', 'diazepam').
+atc_l4('n05b', 'emylcamate').
+atc_l4('n05b', 'ethyl_loflazepate').
+atc_l4('n05b', 'etifoxine').
+atc_l4('n05b', 'etizolam').
+atc_l4('n05b', 'fabomotizole').
+atc_l4('n05b', 'fludiazepam').
+atc_l4('n05b', 'gedocarnil').
+atc_l4('n05b', 'halazepam').
+atc_l4('n05b', 'hydroxyzine').
+atc_l4('n05b', 'hydroxyzine_combinations').
+atc_l4('n05b', 'ketazolam').
+atc_l4('n05b', 'lavandulae_aetheroleum').
+atc_l4('n05b', 'lorazepam').
+atc_l4('n05b', 'lorazepam_combinations').
+atc_l4('n05b', 'mebutamate').
+atc_l4('n05b', 'medazepam').
+atc_l4('n05b', 'mephenoxalone').
+atc_l4('n05b', 'meprobamate').
+atc_l4('n05b', 'meprobamate_combinations').
+atc_l4('n05b', 'mexazolam').
+atc_l4('n05b', 'nordazepam').
+atc_l4('n05b', 'oxazepam').
+atc_l4('n05b', 'pinazepam').
+atc_l4('n05b', 'potassium_clorazepate').
+atc_l4('n05b', 'prazepam').
+atc_l4('n05b', 'tofisopam').
+atc_l4('n05c', 'acetylglycinamide_chloral_hydrate').
+atc_l4('n05c', 'allobarbital').
+atc_l4('n05c', 'amobarbital').
+atc_l4('n05c', 'aprobarbital').
+atc_l4('n05c', 'apronal').
+atc_l4('n05c', 'barbital').
+atc_l4('n05c', 'barbiturates_in_combination_with_other_drugs').
+atc_l4('n05c', 'bromides').
+atc_l4('n05c', 'bromisoval').
+atc_l4('n05c', 'brotizolam').
+atc_l4('n05c', 'butobarbital').
+atc_l4('n05c', 'carbromal').
+atc_l4('n05c', 'chloral_hydrate').
+atc_l4('n05c', 'chloralodol').
+atc_l4('n05c', 'cinolazepam').
+atc_l4('n05c', 'clomethiazole').
+atc_l4('n05c', 'clomethiazole_combinations').
+atc_l4('n05c', 'combinations_of_barbiturates').
+atc_l4('n05c', 'cyclobarbital').
+atc_l4('n05c', 'daridorexant').
+atc_l4('n05c', 'dexmedetomidine').
+atc_l4('n05c', 'dichloralphenazone').
+atc_l4('n05c', 'dipiperonylaminoethanol_combinations').
+atc_l4('n05c', 'doxefazepam').
+atc_l4('n05c', 'emepronium_combinations').
+atc_l4('n05c', 'estazolam').
+atc_l4('n05c', 'eszopiclone').
+atc_l4('n05c', 'etallobarbital').
+atc_l4('n05c', 'ethchlorvynol').
+atc_l4('n05c', 'flunitrazepam').
+atc_l4('n05c', 'flurazepam').
+atc_l4('n05c', 'glutethimide').
+atc_l4('n05c', 'heptabarbital').
+atc_l4('n05c', 'hexapropymate').
+atc_l4('n05c', 'hexobarbital').
+atc_l4('n05c', 'lemborexant').
+atc_l4('n05c', 'loprazolam').
+atc_l4('n05c', 'lormetazepam').
+atc_l4('n05c', 'melatonin').
+atc_l4('n05c', 'meprobamate_combinations').
+atc_l4('n05c', 'methaqualone').
+atc_l4('n05c', 'methaqualone_combinations').
+atc_l4('n05c', 'methohexital').
+atc_l4('n05c', 'methylpentynol').
+atc_l4('n05c', 'methylpentynol_combinations').
+atc_l4('n05c', 'methyprylon').
+atc_l4('n05c', 'midazolam').
+atc_l4('n05c', 'niaprazine').
+atc_l4('n05c', 'nimetazepam').
+atc_l4('n05c', 'nitrazepam').
+atc_l4('n05c', 'paraldehyde').
+atc_l4('n05c', 'pentobarbital').
+atc_l4('n05c', 'propiomazine').
+atc_l4('n05c', 'proxibarbal').
+atc_l4('n05c', 'pyrithyldione').
+atc_l4('n05c', 'quazepam').
+atc_l4('n05c', 'ramelteon').
+atc_l4('n05c', 'remimazolam').
+atc_l4('n05c', 'reposal').
+atc_l4('n05c', 'scopolamine').
+atc_l4('n05c', 'secobarbital').
+atc_l4('n05c', 'suvorexant').
+atc_l4('n05c', 'talbutal').
+atc_l4('n05c', 'tasimelteon').
+atc_l4('n05c', 'temazepam').
+atc_l4('n05c', 'thiopental').
+atc_l4('n05c', 'triazolam').
+atc_l4('n05c', 'triclofos').
+atc_l4('n05c', 'valerianae_radix').
+atc_l4('n05c', 'valnoctamide').
+atc_l4('n05c', 'vinbarbital').
+atc_l4('n05c', 'vinylbital').
+atc_l4('n05c', 'zaleplon').
+atc_l4('n05c', 'zolpidem').
+atc_l4('n05c', 'zopiclone').
+atc_l4('n06a', 'agomelatine').
+atc_l4('n06a', 'alaproclate').
+atc_l4('n06a', 'amineptine').
+atc_l4('n06a', 'amitriptyline').
+atc_l4('n06a', 'amoxapine').
+atc_l4('n06a', 'bifemelane').
+atc_l4('n06a', 'brexanolone').
+atc_l4('n06a', 'bupropion').
+atc_l4('n06a', 'bupropion_and_dextromethorphan').
+atc_l4('n06a', 'butriptyline').
+atc_l4('n06a', 'citalopram').
+atc_l4('n06a', 'clomipramine').
+atc_l4('n06a', 'desipramine').
+atc_l4('n06a', 'desvenlafaxine').
+atc_l4('n06a', 'dibenzepin').
+atc_l4('n06a', 'dimetacrine').
+atc_l4('n06a', 'dosulepin').
+atc_l4('n06a', 'doxepin').
+atc_l4('n06a', 'duloxetine').
+atc_l4('n06a', 'escitalopram').
+atc_l4('n06a', 'esketamine').
+atc_l4('n06a', 'etoperidone').
+atc_l4('n06a', 'fluoxetine').
+atc_l4('n06a', 'fluvoxamine').
+atc_l4('n06a', 'gepirone').
+atc_l4('n06a', 'hyperici_herba').
+atc_l4('n06a', 'imipramine').
+atc_l4('n06a', 'imipramine_oxide').
+atc_l4('n06a', 'iprindole').
+atc_l4('n06a', 'iproclozide').
+atc_l4('n06a', 'iproniazide').
+atc_l4('n06a', 'isocarboxazid').
+atc_l4('n06a', 'levomilnacipran').
+atc_l4('n06a', 'lofepramine').
+atc_l4('n06a', 'maprotiline').
+atc_l4('n06a', 'medifoxamine').
+atc_l4('n06a', 'melitracen').
+atc_l4('n06a', 'mianserin').
+atc_l4('n06a', 'milnacipran').
+atc_l4('n06a', 'minaprine').
+atc_l4('n06a', 'mirtazapine').
+atc_l4('n06a', 'moclobemide').
+atc_l4('n06a', 'nefazodone').
+atc_l4('n06a', 'nialamide').
+atc_l4('n06a', 'nomifensine').
+atc_l4('n06a', 'nortriptyline').
+atc_l4('n06a', 'opipramol').
+atc_l4('n06a', 'oxaflozane').
+atc_l4('n06a', 'oxitriptan').
+atc_l4('n06a', 'paroxetine').
+atc_l4('n06a', 'phenelzine').
+atc_l4('n06a', 'pivagabine').
+atc_l4('n06a', 'protriptyline').
+atc_l4('n06a', 'quinupramine').
+atc_l4('n06a', 'reboxetine').
+atc_l4('n06a', 'sertraline').
+atc_l4('n06a', 'tianeptine').
+atc_l4('n06a', 'toloxatone').
+atc_l4('n06a', 'tranylcypromine').
+atc_l4('n06a', 'trazodone').
+atc_l4('n06a', 'trimipramine').
+atc_l4('n06a', 'tryptophan').
+atc_l4('n06a', 'venlafaxine').
+atc_l4('n06a', 'vilazodone').
+atc_l4('n06a', 'viloxazine').
+atc_l4('n06a', 'vortioxetine').
+atc_l4('n06a', 'zimeldine').
+atc_l4('n06b', 'acetylcarnitine').
+atc_l4('n06b', 'adrafinil').
+atc_l4('n06b', 'amfetamine').
+atc_l4('n06b', 'aniracetam').
+atc_l4('n06b', 'armodafinil').
+atc_l4('n06b', 'atomoxetine').
+atc_l4('n06b', 'caffeine').
+atc_l4('n06b', 'citicoline').
+atc_l4('n06b', 'deanol').
+atc_l4('n06b', 'dexamfetamine').
+atc_l4('n06b', 'dexmethylphenidate').
+atc_l4('n06b', 'dexmethylphenidate_and_serdexmethylphenidate').
+atc_l4('n06b', 'fencamfamin').
+atc_l4('n06b', 'fenetylline').
+atc_l4('n06b', 'fenozolone').
+atc_l4('n06b', 'fipexide').
+atc_l4('n06b', 'idebenone').
+atc_l4('n06b', 'linopirdine').
+atc_l4('n06b', 'lisdexamfetamine').
+atc_l4('n06b', 'meclofenoxate').
+atc_l4('n06b', 'metamfetamine').
+atc_l4('n06b', 'methylphenidate').
+atc_l4('n06b', 'modafinil').
+atc_l4('n06b', 'nizofenone').
+atc_l4('n06b', 'oxiracetam').
+atc_l4('n06b', 'pemoline').
+atc_l4('n06b', 'phenibut').
+atc_l4('n06b', 'pipradrol').
+atc_l4('n06b', 'piracetam').
+atc_l4('n06b', 'pirisudanol').
+atc_l4('n06b', 'pramiracetam').
+atc_l4('n06b', 'prolintane').
+atc_l4('n06b', 'propentofylline').
+atc_l4('n06b', 'pyritinol').
+atc_l4('n06b', 'solriamfetol').
+atc_l4('n06b', 'temgicoluril').
+atc_l4('n06b', 'vinpocetine').
+atc_l4('n06c', 'amitriptyline_and_psycholeptics').
+atc_l4('n06c', 'fluoxetine_and_psycholeptics').
+atc_l4('n06c', 'melitracen_and_psycholeptics').
+atc_l4('n06d', 'aducanumab').
+atc_l4('n06d', 'combinations').
+atc_l4('n06d', 'donanemab').
+atc_l4('n06d', 'donepezil').
+atc_l4('n06d', 'donepezil_and_memantine').
+atc_l4('n06d', 'donepezil_memantine_and_ginkgo_folium').
+atc_l4('n06d', 'galantamine').
+atc_l4('n06d', 'ginkgo_folium').
+atc_l4('n06d', 'ipidacrine').
+atc_l4('n06d', 'lecanemab').
+atc_l4('n06d', 'memantine').
+atc_l4('n06d', 'rivastigmine').
+atc_l4('n06d', 'tacrine').
+atc_l4('n07a', 'ambenonium').
+atc_l4('n07a', 'bethanechol').
+atc_l4('n07a', 'carbachol').
+atc_l4('n07a', 'cevimeline').
+atc_l4('n07a', 'choline_alfoscerate').
+atc_l4('n07a', 'distigmine').
+atc_l4('n07a', 'neostigmine').
+atc_l4('n07a', 'neostigmine_combinations').
+atc_l4('n07a', 'pilocarpine').
+atc_l4('n07a', 'pyridostigmine').
+atc_l4('n07b', 'acamprosate').
+atc_l4('n07b', 'buprenorphine').
+atc_l4('n07b', 'buprenorphine_combinations').
+atc_l4('n07b', 'calcium_carbimide').
+atc_l4('n07b', 'cytisinicline').
+atc_l4('n07b', 'diamorphine').
+atc_l4('n07b', 'disulfiram').
+atc_l4('n07b', 'levacetylmethadol').
+atc_l4('n07b', 'levomethadone').
+atc_l4('n07b', 'lofexidine').
+atc_l4('n07b', 'methadone').
+atc_l4('n07b', 'nalmefene').
+atc_l4('n07b', 'naltrexone').
+atc_l4('n07b', 'nicotine').
+atc_l4('n07b', 'varenicline').
+atc_l4('n07c', 'acetylleucine').
+atc_l4('n07c', 'betahistine').
+atc_l4('n07c', 'cinnarizine').
+atc_l4('n07c', 'cinnarizine_combinations').
+atc_l4('n07c', 'flunarizine').
+atc_l4('n07x', 'amifampridine').
+atc_l4('n07x', 'arimoclomol').
+atc_l4('n07x', 'deutetrabenazine').
+atc_l4('n07x', 'dextromethorphan_combinations').
+atc_l4('n07x', 'edaravone').
+atc_l4('n07x', 'eplontersen').
+atc_l4('n07x', 'fampridine').
+atc_l4('n07x', 'inotersen').
+atc_l4('n07x', 'laquinimod').
+atc_l4('n07x', 'patisiran').
+atc_l4('n07x', 'pitolisant').
+atc_l4('n07x', 'riluzole').
+atc_l4('n07x', 'sodium_oxybate').
+atc_l4('n07x', 'sodium_phenylbutyrate_and_ursodoxicoltaurine').
+atc_l4('n07x', 'tafamidis').
+atc_l4('n07x', 'tetrabenazine').
+atc_l4('n07x', 'tirilazad').
+atc_l4('n07x', 'tofersen').
+atc_l4('n07x', 'troriluzole').
+atc_l4('n07x', 'valbenazine').
+atc_l4('n07x', 'vutrisiran').
+atc_l4('n07x', 'xaliproden').
+atc_l4('p01a', 'arsthinol').
+atc_l4('p01a', 'atovaquone').
+atc_l4('p01a', 'azanidazole').
+atc_l4('p01a', 'broxyquinoline').
+atc_l4('p01a', 'chiniofon').
+atc_l4('p01a', 'chlorquinaldol').
+atc_l4('p01a', 'clefamide').
+atc_l4('p01a', 'clioquinol').
+atc_l4('p01a', 'clioquinol_combinations').
+atc_l4('p01a', 'dehydroemetine').
+atc_l4('p01a', 'difetarsone').
+atc_l4('p01a', 'diloxanide').
+atc_l4('p01a', 'emetine').
+atc_l4('p01a', 'emetine_combinations').
+atc_l4('p01a', 'etofamide').
+atc_l4('p01a', 'fumagillin').
+atc_l4('p01a', 'glycobiarsol').
+atc_l4('p01a', 'glycobiarsol_combinations').
+atc_l4('p01a', 'mepacrine').
+atc_l4('p01a', 'metronidazole').
+atc_l4('p01a', 'metronidazole_and_diloxanide').
+atc_l4('p01a', 'metronidazole_and_furazolidone').
+atc_l4('p01a', 'nimorazole').
+atc_l4('p01a', 'nitazoxanide').
+atc_l4('p01a', 'ornidazole').
+atc_l4('p01a', 'phanquinone').
+atc_l4('p01a', 'propenidazole').
+atc_l4('p01a', 'secnidazole').
+atc_l4('p01a', 'teclozan').
+atc_l4('p01a', 'tenonitrozole').
+atc_l4('p01a', 'tilbroquinol').
+atc_l4('p01a', 'tilbroquinol_and_tiliquinol').
+atc_l4('p01a', 'tinidazole').
+atc_l4('p01a', 'trimetrexate').
+atc_l4('p01b', 'amodiaquine').
+atc_l4('p01b', 'artemether').
+atc_l4('p01b', 'artemether_and_lumefantrine').
+atc_l4('p01b', 'artemisinin').
+atc_l4('p01b', 'artemisinin_and_naphthoquine').
+atc_l4('p01b', 'artemisinin_and_piperaquine').
+atc_l4('p01b', 'artemotil').
+atc_l4('p01b', 'artenimol').
+atc_l4('p01b', 'artenimol_and_piperaquine').
+atc_l4('p01b', 'arterolane_and_piperaquine').
+atc_l4('p01b', 'artesunate').
+atc_l4('p01b', 'artesunate_and_amodiaquine').
+atc_l4('p01b', 'artesunate_and_mefloquine').
+atc_l4('p01b', 'artesunate_and_pyronaridine').
+atc_l4('p01b', 'artesunate_sulfadoxine_and_pyrimethamine').
+atc_l4('p01b', 'artesunate_sulfalene_and_pyrimethamine').
+atc_l4('p01b', 'chloroquine').
+atc_l4('p01b', 'chloroquine_and_proguanil').
+atc_l4('p01b', 'cycloguanil_embonate').
+atc_l4('p01b', 'halofantrine').
+atc_l4('p01b', 'hydroxychloroquine').
+atc_l4('p01b', 'mefloquine').
+atc_l4('p01b', 'primaquine').
+atc_l4('p01b', 'proguanil').
+atc_l4('p01b', 'proguanil_and_atovaquone').
+atc_l4('p01b', 'pyrimethamine').
+atc_l4('p01b', 'pyrimethamine_combinations').
+atc_l4('p01b', 'quinine').
+atc_l4('p01b', 'tafenoquine').
+atc_l4('p01c', 'acetarsol').
+atc_l4('p01c', 'benznidazole').
+atc_l4('p01c', 'eflornithine').
+atc_l4('p01c', 'fexinidazole').
+atc_l4('p01c', 'meglumine_antimonate').
+atc_l4('p01c', 'melarsoprol').
+atc_l4('p01c', 'miltefosine').
+atc_l4('p01c', 'nifurtimox').
+atc_l4('p01c', 'nitrofural').
+atc_l4('p01c', 'pentamidine_isethionate').
+atc_l4('p01c', 'sodium_stibogluconate').
+atc_l4('p01c', 'suramin_sodium').
+atc_l4('p02b', 'arpraziquantel').
+atc_l4('p02b', 'bithionol').
+atc_l4('p02b', 'metrifonate').
+atc_l4('p02b', 'niridazole').
+atc_l4('p02b', 'oxamniquine').
+atc_l4('p02b', 'praziquantel').
+atc_l4('p02b', 'stibophen').
+atc_l4('p02b', 'triclabendazole').
+atc_l4('p02c', 'albendazole').
+atc_l4('p02c', 'bephenium').
+atc_l4('p02c', 'ciclobendazole').
+atc_l4('p02c', 'diethylcarbamazine').
+atc_l4('p02c', 'fenbendazole').
+atc_l4('p02c', 'flubendazole').
+atc_l4('p02c', 'ivermectin').
+atc_l4('p02c', 'levamisole').
+atc_l4('p02c', 'mebendazole').
+atc_l4('p02c', 'mebendazole_combinations').
+atc_l4('p02c', 'moxidectin').
+atc_l4('p02c', 'oxantel').
+atc_l4('p02c', 'piperazine').
+atc_l4('p02c', 'pyrantel').
+atc_l4('p02c', 'pyrvinium').
+atc_l4('p02c', 'tiabendazole').
+atc_l4('p02d', 'desaspidin').
+atc_l4('p02d', 'dichlorophen').
+atc_l4('p02d', 'niclosamide').
+atc_l4('p03a', 'abametapir').
+atc_l4('p03a', 'benzyl_alcohol').
+atc_l4('p03a', 'benzyl_benzoate').
+atc_l4('p03a', 'bioallethrin').
+atc_l4('p03a', 'bioallethrin_combinations').
+atc_l4('p03a', 'clofenotane').
+atc_l4('p03a', 'clofenotane_combinations').
+atc_l4('p03a', 'copper_oleinate').
+atc_l4('p03a', 'dimeticone').
+atc_l4('p03a', 'disulfiram').
+atc_l4('p03a', 'disulfiram_combinations').
+atc_l4('p03a', 'dixanthogen').
+atc_l4('p03a', 'lindane').
+atc_l4('p03a', 'malathion').
+atc_l4('p03a', 'mesulfen').
+atc_l4('p03a', 'permethrin').
+atc_l4('p03a', 'permethrin_combinations').
+atc_l4('p03a', 'phenothrin').
+atc_l4('p03a', 'phenothrin_combinations').
+atc_l4('p03a', 'potassium_polysulfide').
+atc_l4('p03a', 'pyrethrum').
+atc_l4('p03a', 'pyrethrum_combinations').
+atc_l4('p03a', 'quassia').
+atc_l4('p03a', 'thiram').
+atc_l4('p03b', 'cyfluthrin').
+atc_l4('p03b', 'cypermethrin').
+atc_l4('p03b', 'decamethrin').
+atc_l4('p03b', 'dibutylphthalate').
+atc_l4('p03b', 'dibutylsuccinate').
+atc_l4('p03b', 'diethyltoluamide').
+atc_l4('p03b', 'dimethylcarbate').
+atc_l4('p03b', 'dimethylphthalate').
+atc_l4('p03b', 'etohexadiol').
+atc_l4('p03b', 'tetramethrin').
+atc_l4('r01a', 'antazoline').
+atc_l4('r01a', 'azelastine').
+atc_l4('r01a', 'beclometasone').
+atc_l4('r01a', 'betamethasone').
+atc_l4('r01a', 'budesonide').
+atc_l4('r01a', 'calcium_hexamine_thiocyanate').
+atc_l4('r01a', 'ciclesonide').
+atc_l4('r01a', 'combinations').
+atc_l4('r01a', 'cromoglicic_acid').
+atc_l4('r01a', 'cromoglicic_acid_combinations').
+atc_l4('r01a', 'cyclopentamine').
+atc_l4('r01a', 'dexamethasone').
+atc_l4('r01a', 'dexamethasone_combinations').
+atc_l4('r01a', 'ephedrine').
+atc_l4('r01a', 'epinephrine').
+atc_l4('r01a', 'fenoxazoline').
+atc_l4('r01a', 'flunisolide').
+atc_l4('r01a', 'fluticasone').
+atc_l4('r01a', 'fluticasone_combinations').
+atc_l4('r01a', 'fluticasone_furoate').
+atc_l4('r01a', 'framycetin').
+atc_l4('r01a', 'hexamidine').
+atc_l4('r01a', 'hyaluronic_acid').
+atc_l4('r01a', 'hydrocortisone_combinations').
+atc_l4('r01a', 'indanazoline').
+atc_l4('r01a', 'ipratropium_bromide').
+atc_l4('r01a', 'levocabastine').
+atc_l4('r01a', 'metizoline').
+atc_l4('r01a', 'mometasone').
+atc_l4('r01a', 'mometasone_combinations').
+atc_l4('r01a', 'mupirocin').
+atc_l4('r01a', 'naphazoline').
+atc_l4('r01a', 'nedocromil').
+atc_l4('r01a', 'olopatadine').
+atc_l4('r01a', 'oxymetazoline').
+atc_l4('r01a', 'phenylephrine').
+atc_l4('r01a', 'prednisolone').
+atc_l4('r01a', 'prednisolone_combinations').
+atc_l4('r01a', 'retinol').
+atc_l4('r01a', 'ritiometan').
+atc_l4('r01a', 'spaglumic_acid').
+atc_l4('r01a', 'tetryzoline').
+atc_l4('r01a', 'thonzylamine').
+atc_l4('r01a', 'tixocortol').
+atc_l4('r01a', 'tixocortol_combinations').
+atc_l4('r01a', 'tramazoline').
+atc_l4('r01a', 'triamcinolone').
+atc_l4('r01a', 'tuaminoheptane').
+atc_l4('r01a', 'tymazoline').
+atc_l4('r01a', 'various').
+atc_l4('r01a', 'xylometazoline').
+atc_l4('r01b', 'phenylephrine').
+atc_l4('r01b', 'phenylephrine_combinations').
+atc_l4('r01b', 'phenylpropanolamine').
+atc_l4('r01b', 'phenylpropanolamine_combinations').
+atc_l4('r01b', 'pseudoephedrine').
+atc_l4('r01b', 'pseudoephedrine_combinations').
+atc_l4('r02a', 'acriflavinium_chloride').
+atc_l4('r02a', 'ambazone').
+atc_l4('r02a', 'ambroxol').
+atc_l4('r02a', 'bacitracin').
+atc_l4('r02a', 'benzalkonium').
+atc_l4('r02a', 'benzethonium').
+atc_l4('r02a', 'benzocaine').
+atc_l4('r02a', 'benzydamine').
+atc_l4('r02a', 'cetrimonium').
+atc_l4('r02a', 'cetylpyridinium').
+atc_l4('r02a', 'chlorhexidine').
+atc_l4('r02a', 'chlorquinaldol').
+atc_l4('r02a', 'cocaine').
+atc_l4('r02a', 'dequalinium').
+atc_l4('r02a', 'dichlorobenzyl_alcohol').
+atc_l4('r02a', 'dyclonine').
+atc_l4('r02a', 'flurbiprofen').
+atc_l4('r02a', 'fusafungine').
+atc_l4('r02a', 'gramicidin').
+atc_l4('r02a', 'hexamidine').
+atc_l4('r02a', 'hexylresorcinol').
+atc_l4('r02a', 'ibuprofen').
+atc_l4('r02a', 'lidocaine').
+atc_l4('r02a', 'myristyl_benzalkonium').
+atc_l4('r02a', 'neomycin').
+atc_l4('r02a', 'octenidine').
+atc_l4('r02a', 'oxyquinoline').
+atc_l4('r02a', 'phenol').
+atc_l4('r02a', 'povidone_iodine').
+atc_l4('r02a', 'tyrothricin').
+atc_l4('r02a', 'various').
+atc_l4('r03a', 'bitolterol').
+atc_l4('r03a', 'carbuterol').
+atc_l4('r03a', 'clenbuterol').
+atc_l4('r03a', 'epinephrine').
+atc_l4('r03a', 'epinephrine_and_other_drugs_for_obstructive_airway_diseases').
+atc_l4('r03a', 'fenoterol').
+atc_l4('r03a', 'fenoterol_and_ipratropium_bromide').
+atc_l4('r03a', 'formoterol').
+atc_l4('r03a', 'formoterol_and_aclidinium_bromide').
+atc_l4('r03a', 'formoterol_and_beclometasone').
+atc_l4('r03a', 'formoterol_and_budesonide').
+atc_l4('r03a', 'formoterol_and_fluticasone').
+atc_l4('r03a', 'formoterol_and_glycopyrronium_bromide').
+atc_l4('r03a', 'formoterol_and_mometasone').
+atc_l4('r03a', 'formoterol_and_tiotropium_bromide').
+atc_l4('r03a', 'formoterol_glycopyrronium_bromide_and_beclometasone').
+atc_l4('r03a', 'formoterol_glycopyrronium_bromide_and_budesonide').
+atc_l4('r03a', 'hexoprenaline').
+atc_l4('r03a', 'indacaterol').
+atc_l4('r03a', 'indacaterol_and_glycopyrronium_bromide').
+atc_l4('r03a', 'indacaterol_and_mometasone').
+atc_l4('r03a', 'indacaterol_glycopyrronium_bromide_and_mometasone').
+atc_l4('r03a', 'isoetarine').
+atc_l4('r03a', 'isoprenaline').
+atc_l4('r03a', 'isoprenaline_and_other_drugs_for_obstructive_airway_diseases').
+atc_l4('r03a', 'olodaterol').
+atc_l4('r03a', 'olodaterol_and_tiotropium_bromide').
+atc_l4('r03a', 'orciprenaline').
+atc_l4('r03a', 'pirbuterol').
+atc_l4('r03a', 'procaterol').
+atc_l4('r03a', 'reproterol').
+atc_l4('r03a', 'reproterol_and_sodium_cromoglicate').
+atc_l4('r03a', 'rimiterol').
+atc_l4('r03a', 'salbutamol').
+atc_l4('r03a', 'salbutamol_and_beclometasone').
+atc_l4('r03a', 'salbutamol_and_budesonide').
+atc_l4('r03a', 'salbutamol_and_ipratropium_bromide').
+atc_l4('r03a', 'salbutamol_and_sodium_cromoglicate').
+atc_l4('r03a', 'salmeterol').
+atc_l4('r03a', 'salmeterol_and_budesonide').
+atc_l4('r03a', 'salmeterol_and_fluticasone').
+atc_l4('r03a', 'terbutaline').
+atc_l4('r03a', 'tretoquinol').
+atc_l4('r03a', 'tulobuterol').
+atc_l4('r03a', 'vilanterol_and_fluticasone_furoate').
+atc_l4('r03a', 'vilanterol_and_umeclidinium_bromide').
+atc_l4('r03a', 'vilanterol_umeclidinium_bromide_and_fluticasone_furoate').
+atc_l4('r03b', 'aclidinium_bromide').
+atc_l4('r03b', 'beclometasone').
+atc_l4('r03b', 'betamethasone').
+atc_l4('r03b', 'budesonide').
+atc_l4('r03b', 'ciclesonide').
+atc_l4('r03b', 'cromoglicic_acid').
+atc_l4('r03b', 'fenspiride').
+atc_l4('r03b', 'flunisolide').
+atc_l4('r03b', 'fluticasone').
+atc_l4('r03b', 'fluticasone_furoate').
+atc_l4('r03b', 'glycopyrronium_bromide').
+atc_l4('r03b', 'ipratropium_bromide').
+atc_l4('r03b', 'mometasone').
+atc_l4('r03b', 'nedocromil').
+atc_l4('r03b', 'oxitropium_bromide').
+atc_l4('r03b', 'revefenacin').
+atc_l4('r03b', 'stramoni_preparations').
+atc_l4('r03b', 'tiotropium_bromide').
+atc_l4('r03b', 'tiotropium_bromide_combinations').
+atc_l4('r03b', 'triamcinolone').
+atc_l4('r03b', 'umeclidinium_bromide').
+atc_l4('r03c', 'bambuterol').
+atc_l4('r03c', 'carbuterol').
+atc_l4('r03c', 'clenbuterol').
+atc_l4('r03c', 'clenbuterol_and_ambroxol').
+atc_l4('r03c', 'ephedrine').
+atc_l4('r03c', 'fenoterol').
+atc_l4('r03c', 'formoterol').
+atc_l4('r03c', 'hexoprenaline').
+atc_l4('r03c', 'isoetarine').
+atc_l4('r03c', 'isoprenaline').
+atc_l4('r03c', 'isoprenaline_combinations').
+atc_l4('r03c', 'methoxyphenamine').
+atc_l4('r03c', 'orciprenaline').
+atc_l4('r03c', 'orciprenaline_combinations').
+atc_l4('r03c', 'pirbuterol').
+atc_l4('r03c', 'procaterol').
+atc_l4('r03c', 'reproterol').
+atc_l4('r03c', 'salbutamol').
+atc_l4('r03c', 'terbutaline').
+atc_l4('r03c', 'terbutaline_combinations').
+atc_l4('r03c', 'tretoquinol').
+atc_l4('r03c', 'tulobuterol').
+atc_l4('r03d', 'acefylline_piperazine').
+atc_l4('r03d', 'aminophylline').
+atc_l4('r03d', 'aminophylline_and_adrenergics').
+atc_l4('r03d', 'aminophylline_combinations').
+atc_l4('r03d', 'amlexanox').
+atc_l4('r03d', 'bamifylline').
+atc_l4('r03d', 'benralizumab').
+atc_l4('r03d', 'bufylline').
+atc_l4('r03d', 'choline_theophyllinate').
+atc_l4('r03d', 'choline_theophyllinate_and_adrenergics').
+atc_l4('r03d', 'combinations_of_xanthines').
+atc_l4('r03d', 'diprophylline').
+atc_l4('r03d', 'diprophylline_and_adrenergics').
+atc_l4('r03d', 'diprophylline_combinations').
+atc_l4('r03d', 'doxofylline').
+atc_l4('r03d', 'eprozinol').
+atc_l4('r03d', 'etamiphylline').
+atc_l4('r03d', 'etamiphylline_and_adrenergics').
+atc_l4('r03d', 'fenspiride').
+atc_l4('r03d', 'ibudilast').
+atc_l4('r03d', 'mepolizumab').
+atc_l4('r03d', 'mepyramine_theophyllinacetate').
+atc_l4('r03d', 'montelukast').
+atc_l4('r03d', 'montelukast_combinations').
+atc_l4('r03d', 'omalizumab').
+atc_l4('r03d', 'pranlukast').
+atc_l4('r03d', 'proxyphylline').
+atc_l4('r03d', 'proxyphylline_and_adrenergics').
+atc_l4('r03d', 'reslizumab').
+atc_l4('r03d', 'roflumilast').
+atc_l4('r03d', 'seratrodast').
+atc_l4('r03d', 'tezepelumab').
+atc_l4('r03d', 'theobromine').
+atc_l4('r03d', 'theobromine_combinations').
+atc_l4('r03d', 'theophylline').
+atc_l4('r03d', 'theophylline_and_adrenergics').
+atc_l4('r03d', 'theophylline_combinations_excl_psycholeptics').
+atc_l4('r03d', 'theophylline_combinations_with_psycholeptics').
+atc_l4('r03d', 'zafirlukast').
+atc_l4('r05c', 'acetylcysteine').
+atc_l4('r05c', 'altheae_radix').
+atc_l4('r05c', 'ambroxol').
+atc_l4('r05c', 'antimony_pentasulfide').
+atc_l4('r05c', 'bromhexine').
+atc_l4('r05c', 'carbocisteine').
+atc_l4('r05c', 'cineole').
+atc_l4('r05c', 'combinations').
+atc_l4('r05c', 'creosote').
+atc_l4('r05c', 'domiodol').
+atc_l4('r05c', 'dornase_alfa_desoxyribonuclease').
+atc_l4('r05c', 'eprazinone').
+atc_l4('r05c', 'erdosteine').
+atc_l4('r05c', 'guaiacolsulfonate').
+atc_l4('r05c', 'guaifenesin').
+atc_l4('r05c', 'hederae_helicis_folium').
+atc_l4('r05c', 'ipecacuanha').
+atc_l4('r05c', 'letosteine').
+atc_l4('r05c', 'levoverbenone').
+atc_l4('r05c', 'mannitol').
+atc_l4('r05c', 'mesna').
+atc_l4('r05c', 'neltenexine').
+atc_l4('r05c', 'potassium_iodide').
+atc_l4('r05c', 'senega').
+atc_l4('r05c', 'sobrerol').
+atc_l4('r05c', 'stepronin').
+atc_l4('r05c', 'tyloxapol').
+atc_l4('r05d', 'acetyldihydrocodeine').
+atc_l4('r05d', 'benproperine').
+atc_l4('r05d', 'benzonatate').
+atc_l4('r05d', 'bibenzonium_bromide').
+atc_l4('r05d', 'butamirate').
+atc_l4('r05d', 'clobutinol').
+atc_l4('r05d', 'clofedanol').
+atc_l4('r05d', 'cloperastine').
+atc_l4('r05d', 'codeine').
+atc_l4('r05d', 'combinations').
+atc_l4('r05d', 'dextromethorphan').
+atc_l4('r05d', 'dibunate').
+atc_l4('r05d', 'dimemorfan').
+atc_l4('r05d', 'dimethoxanate').
+atc_l4('r05d', 'dropropizine').
+atc_l4('r05d', 'droxypropine').
+atc_l4('r05d', 'ethylmorphine').
+atc_l4('r05d', 'fedrilate').
+atc_l4('r05d', 'gefapixant').
+atc_l4('r05d', 'hydrocodone').
+atc_l4('r05d', 'isoaminile').
+atc_l4('r05d', 'levodropropizine').
+atc_l4('r05d', 'meprotixol').
+atc_l4('r05d', 'morclofone').
+atc_l4('r05d', 'nepinalone').
+atc_l4('r05d', 'normethadone').
+atc_l4('r05d', 'noscapine').
+atc_l4('r05d', 'opium_alkaloids_with_morphine').
+atc_l4('r05d', 'oxeladin').
+atc_l4('r05d', 'oxolamine').
+atc_l4('r05d', 'pentoxyverine').
+atc_l4('r05d', 'pholcodine').
+atc_l4('r05d', 'pipazetate').
+atc_l4('r05d', 'piperidione').
+atc_l4('r05d', 'prenoxdiazine').
+atc_l4('r05d', 'thebacon').
+atc_l4('r05d', 'tipepidine').
+atc_l4('r05d', 'zipeprol').
+atc_l4('r05f', 'cough_suppressants_and_expectorants').
+atc_l4('r05f', 'cough_suppressants_and_mucolytics').
+atc_l4('r05f', 'opium_derivatives_and_expectorants').
+atc_l4('r05f', 'opium_derivatives_and_mucolytics').
+atc_l4('r06a', 'acrivastine').
+atc_l4('r06a', 'alimemazine').
+atc_l4('r06a', 'antazoline').
+atc_l4('r06a', 'astemizole').
+atc_l4('r06a', 'azatadine').
+atc_l4('r06a', 'azelastine').
+atc_l4('r06a', 'bamipine').
+atc_l4('r06a', 'bilastine').
+atc_l4('r06a', 'bromazine').
+atc_l4('r06a', 'brompheniramine').
+atc_l4('r06a', 'brompheniramine_combinations').
+atc_l4('r06a', 'buclizine').
+atc_l4('r06a', 'buclizine_combinations').
+atc_l4('r06a', 'carbinoxamine').
+atc_l4('r06a', 'cetirizine').
+atc_l4('r06a', 'chlorcyclizine').
+atc_l4('r06a', 'chloropyramine').
+atc_l4('r06a', 'chloropyramine_combinations').
+atc_l4('r06a', 'chlorphenamine').
+atc_l4('r06a', 'chlorphenamine_combinations').
+atc_l4('r06a', 'chlorphenoxamine').
+atc_l4('r06a', 'chlorphenoxamine_combinations').
+atc_l4('r06a', 'clemastine').
+atc_l4('r06a', 'clemastine_combinations').
+atc_l4('r06a', 'cyclizine').
+atc_l4('r06a', 'cyclizine_combinations').
+atc_l4('r06a', 'cyproheptadine').
+atc_l4('r06a', 'deptropine').
+atc_l4('r06a', 'desloratadine').
+atc_l4('r06a', 'dexbrompheniramine').
+atc_l4('r06a', 'dexbrompheniramine_combinations').
+atc_l4('r06a', 'dexchlorpheniramine').
+atc_l4('r06a', 'dexchlorpheniramine_combinations').
+atc_l4('r06a', 'dimenhydrinate').
+atc_l4('r06a', 'dimenhydrinate_combinations').
+atc_l4('r06a', 'dimetindene').
+atc_l4('r06a', 'diphenhydramine').
+atc_l4('r06a', 'diphenhydramine_combinations').
+atc_l4('r06a', 'diphenylpyraline').
+atc_l4('r06a', 'diphenylpyraline_combinations').
+atc_l4('r06a', 'doxylamine').
+atc_l4('r06a', 'doxylamine_combinations').
+atc_l4('r06a', 'ebastine').
+atc_l4('r06a', 'epinastine').
+atc_l4('r06a', 'fexofenadine').
+atc_l4('r06a', 'histapyrrodine').
+atc_l4('r06a', 'histapyrrodine_combinations').
+atc_l4('r06a', 'hydroxyethylpromethazine').
+atc_l4('r06a', 'hydroxyethylpromethazine_combinations').
+atc_l4('r06a', 'isothipendyl').
+atc_l4('r06a', 'ketotifen').
+atc_l4('r06a', 'levocetirizine').
+atc_l4('r06a', 'loratadine').
+atc_l4('r06a', 'mebhydrolin').
+atc_l4('r06a', 'meclozine').
+atc_l4('r06a', 'meclozine_combinations').
+atc_l4('r06a', 'mepyramine').
+atc_l4('r06a', 'mequitazine').
+atc_l4('r06a', 'methapyrilene').
+atc_l4('r06a', 'methdilazine').
+atc_l4('r06a', 'mizolastine').
+atc_l4('r06a', 'oxatomide').
+atc_l4('r06a', 'oxomemazine').
+atc_l4('r06a', 'phenindamine').
+atc_l4('r06a', 'pheniramine').
+atc_l4('r06a', 'pimethixene').
+atc_l4('r06a', 'promethazine').
+atc_l4('r06a', 'promethazine_combinations').
+atc_l4('r06a', 'pyrrobutamine').
+atc_l4('r06a', 'pyrrobutamine_combinations').
+atc_l4('r06a', 'quifenadine').
+atc_l4('r06a', 'rupatadine').
+atc_l4('r06a', 'sequifenadine').
+atc_l4('r06a', 'talastine').
+atc_l4('r06a', 'terfenadine').
+atc_l4('r06a', 'thenalidine').
+atc_l4('r06a', 'thenalidine_combinations').
+atc_l4('r06a', 'thiazinam').
+atc_l4('r06a', 'thiethylperazine').
+atc_l4('r06a', 'thonzylamine').
+atc_l4('r06a', 'trimethobenzamide').
+atc_l4('r06a', 'tripelennamine').
+atc_l4('r06a', 'triprolidine').
+atc_l4('r06a', 'tritoqualine').
+atc_l4('r07a', 'almitrine').
+atc_l4('r07a', 'bemegride').
+atc_l4('r07a', 'colfosceril_palmitate').
+atc_l4('r07a', 'combinations').
+atc_l4('r07a', 'dimefline').
+atc_l4('r07a', 'doxapram').
+atc_l4('r07a', 'etamivan').
+atc_l4('r07a', 'ivacaftor').
+atc_l4('r07a', 'ivacaftor_and_lumacaftor').
+atc_l4('r07a', 'ivacaftor_and_tezacaftor').
+atc_l4('r07a', 'ivacaftor_tezacaftor_and_elexacaftor').
+atc_l4('r07a', 'mepixanox').
+atc_l4('r07a', 'natural_phospholipids').
+atc_l4('r07a', 'nikethamide').
+atc_l4('r07a', 'nikethamide_combinations').
+atc_l4('r07a', 'nitric_oxide').
+atc_l4('r07a', 'pentetrazol').
+atc_l4('r07a', 'pentetrazol_combinations').
+atc_l4('r07a', 'prethcamide').
+atc_l4('s01a', 'aciclovir').
+atc_l4('s01a', 'amikacin').
+atc_l4('s01a', 'ampicillin').
+atc_l4('s01a', 'antibiotics_in_combination_with_other_drugs').
+atc_l4('s01a', 'azidamfenicol').
+atc_l4('s01a', 'azithromycin').
+atc_l4('s01a', 'bacitracin').
+atc_l4('s01a', 'benzylpenicillin').
+atc_l4('s01a', 'besifloxacin').
+atc_l4('s01a', 'bibrocathol').
+atc_l4('s01a', 'cefmenoxime').
+atc_l4('s01a', 'cefuroxime').
+atc_l4('s01a', 'chloramphenicol').
+atc_l4('s01a', 'chlorhexidine').
+atc_l4('s01a', 'chlortetracycline').
+atc_l4('s01a', 'ciprofloxacin').
+atc_l4('s01a', 'combinations_of_different_antibiotics').
+atc_l4('s01a', 'dibekacin').
+atc_l4('s01a', 'dibrompropamidine').
+atc_l4('s01a', 'dihydrostreptomycin').
+atc_l4('s01a', 'erythromycin').
+atc_l4('s01a', 'famciclovir').
+atc_l4('s01a', 'fomivirsen').
+atc_l4('s01a', 'framycetin').
+atc_l4('s01a', 'fusidic_acid').
+atc_l4('s01a', 'ganciclovir').
+atc_l4('s01a', 'gatifloxacin').
+atc_l4('s01a', 'gentamicin').
+atc_l4('s01a', 'hexamidine').
+atc_l4('s01a', 'idoxuridine').
+atc_l4('s01a', 'interferon').
+atc_l4('s01a', 'kanamycin').
+atc_l4('s01a', 'levofloxacin').
+atc_l4('s01a', 'lomefloxacin').
+atc_l4('s01a', 'mercury_compounds').
+atc_l4('s01a', 'micronomicin').
+atc_l4('s01a', 'moxifloxacin').
+atc_l4('s01a', 'natamycin').
+atc_l4('s01a', 'neomycin').
+atc_l4('s01a', 'netilmicin').
+atc_l4('s01a', 'nitrofural').
+atc_l4('s01a', 'norfloxacin').
+atc_l4('s01a', 'ofloxacin').
+atc_l4('s01a', 'oxytetracycline').
+atc_l4('s01a', 'picloxydine').
+atc_l4('s01a', 'polihexanide').
+atc_l4('s01a', 'polymyxin_b').
+atc_l4('s01a', 'povidone_iodine').
+atc_l4('s01a', 'propamidine').
+atc_l4('s01a', 'resorcinol').
+atc_l4('s01a', 'rifamycin').
+atc_l4('s01a', 'silver_compounds').
+atc_l4('s01a', 'sodium_borate').
+atc_l4('s01a', 'sodium_propionate').
+atc_l4('s01a', 'sulfacetamide').
+atc_l4('s01a', 'sulfadicramide').
+atc_l4('s01a', 'sulfafenazol').
+atc_l4('s01a', 'sulfafurazole').
+atc_l4('s01a', 'sulfamethizole').
+atc_l4('s01a', 'tetracycline').
+atc_l4('s01a', 'tobramycin').
+atc_l4('s01a', 'tosufloxacin').
+atc_l4('s01a', 'trifluridine').
+atc_l4('s01a', 'tyrothricin').
+atc_l4('s01a', 'vancomycin').
+atc_l4('s01a', 'vidarabine').
+atc_l4('s01a', 'zinc_compounds').
+atc_l4('s01b', 'alclometasone').
+atc_l4('s01b', 'bendazac').
+atc_l4('s01b', 'betamethasone').
+atc_l4('s01b', 'betamethasone_and_mydriatics').
+atc_l4('s01b', 'bromfenac').
+atc_l4('s01b', 'clobetasone').
+atc_l4('s01b', 'cortisone').
+atc_l4('s01b', 'desonide').
+atc_l4('s01b', 'dexamethasone').
+atc_l4('s01b', 'diclofenac').
+atc_l4('s01b', 'difluprednate').
+atc_l4('s01b', 'fluocinolone_acetonide').
+atc_l4('s01b', 'fluorometholone').
+atc_l4('s01b', 'fluorometholone_and_mydriatics').
+atc_l4('s01b', 'flurbiprofen').
+atc_l4('s01b', 'formocortal').
+atc_l4('s01b', 'hydrocortisone').
+atc_l4('s01b', 'hydrocortisone_and_mydriatics').
+atc_l4('s01b', 'indometacin').
+atc_l4('s01b', 'ketorolac').
+atc_l4('s01b', 'loteprednol').
+atc_l4('s01b', 'medrysone').
+atc_l4('s01b', 'nepafenac').
+atc_l4('s01b', 'oxyphenbutazone').
+atc_l4('s01b', 'piroxicam').
+atc_l4('s01b', 'pranoprofen').
+atc_l4('s01b', 'prednisolone').
+atc_l4('s01b', 'prednisolone_and_mydriatics').
+atc_l4('s01b', 'rimexolone').
+atc_l4('s01b', 'salicylic_acid').
+atc_l4('s01b', 'triamcinolone').
+atc_l4('s01c', 'betamethasone').
+atc_l4('s01c', 'betamethasone_and_antiinfectives').
+atc_l4('s01c', 'chloroprednisone_and_antiinfectives').
+atc_l4('s01c', 'clobetasone_and_antiinfectives').
+atc_l4('s01c', 'dexamethasone').
+atc_l4('s01c', 'dexamethasone_and_antiinfectives').
+atc_l4('s01c', 'diclofenac_and_antiinfectives').
+atc_l4('s01c', 'fludrocortisone_and_antiinfectives').
+atc_l4('s01c', 'fluocinolone_acetonide_and_antiinfectives').
+atc_l4('s01c', 'fluocortolone_and_antiinfectives').
+atc_l4('s01c', 'fluorometholone').
+atc_l4('s01c', 'fluorometholone_and_antiinfectives').
+atc_l4('s01c', 'hydrocortisone').
+atc_l4('s01c', 'hydrocortisone_and_antiinfectives').
+atc_l4('s01c', 'indometacin_and_antiinfectives').
+atc_l4('s01c', 'loteprednol_and_antiinfectives').
+atc_l4('s01c', 'methylprednisolone_and_antiinfectives').
+atc_l4('s01c', 'prednisolone').
+atc_l4('s01c', 'prednisolone_and_antiinfectives').
+atc_l4('s01e', 'aceclidine').
+atc_l4('s01e', 'aceclidine_combinations').
+atc_l4('s01e', 'acetazolamide').
+atc_l4('s01e', 'acetylcholine').
+atc_l4('s01e', 'apraclonidine').
+atc_l4('s01e', 'befunolol').
+atc_l4('s01e', 'betaxolol').
+atc_l4('s01e', 'betaxolol_combinations').
+atc_l4('s01e', 'bimatoprost').
+atc_l4('s01e', 'brimonidine').
+atc_l4('s01e', 'brinzolamide').
+atc_l4('s01e', 'brinzolamide_combinations').
+atc_l4('s01e', 'carbachol').
+atc_l4('s01e', 'carteolol').
+atc_l4('s01e', 'carteolol_combinations').
+atc_l4('s01e', 'clonidine').
+atc_l4('s01e', 'dapiprazole').
+atc_l4('s01e', 'demecarium').
+atc_l4('s01e', 'diclofenamide').
+atc_l4('s01e', 'dipivefrine').
+atc_l4('s01e', 'dorzolamide').
+atc_l4('s01e', 'ecothiopate').
+atc_l4('s01e', 'epinephrine').
+atc_l4('s01e', 'epinephrine_combinations').
+atc_l4('s01e', 'fluostigmine').
+atc_l4('s01e', 'guanethidine').
+atc_l4('s01e', 'latanoprost').
+atc_l4('s01e', 'latanoprost_and_netarsudil').
+atc_l4('s01e', 'latanoprostene_bunod').
+atc_l4('s01e', 'levobunolol').
+atc_l4('s01e', 'methazolamide').
+atc_l4('s01e', 'metipranolol').
+atc_l4('s01e', 'metipranolol_combinations').
+atc_l4('s01e', 'neostigmine').
+atc_l4('s01e', 'netarsudil').
+atc_l4('s01e', 'omidenepag').
+atc_l4('s01e', 'paraoxon').
+atc_l4('s01e', 'physostigmine').
+atc_l4('s01e', 'pilocarpine').
+atc_l4('s01e', 'pilocarpine_combinations').
+atc_l4('s01e', 'ripasudil').
+atc_l4('s01e', 'tafluprost').
+atc_l4('s01e', 'timolol').
+atc_l4('s01e', 'timolol_combinations').
+atc_l4('s01e', 'travoprost').
+atc_l4('s01e', 'unoprostone').
+atc_l4('s01f', 'atropine').
+atc_l4('s01f', 'cyclopentolate').
+atc_l4('s01f', 'cyclopentolate_combinations').
+atc_l4('s01f', 'ephedrine').
+atc_l4('s01f', 'homatropine').
+atc_l4('s01f', 'ibopamine').
+atc_l4('s01f', 'methylscopolamine').
+atc_l4('s01f', 'phenylephrine').
+atc_l4('s01f', 'phenylephrine_and_ketorolac').
+atc_l4('s01f', 'scopolamine').
+atc_l4('s01f', 'tropicamide').
+atc_l4('s01f', 'tropicamide_combinations').
+atc_l4('s01g', 'alcaftadine').
+atc_l4('s01g', 'azelastine').
+atc_l4('s01g', 'bilastine').
+atc_l4('s01g', 'brimonidine').
+atc_l4('s01g', 'cetirizine').
+atc_l4('s01g', 'cromoglicic_acid').
+atc_l4('s01g', 'cromoglicic_acid_combinations').
+atc_l4('s01g', 'emedastine').
+atc_l4('s01g', 'epinastine').
+atc_l4('s01g', 'ketotifen').
+atc_l4('s01g', 'levocabastine').
+atc_l4('s01g', 'lodoxamide').
+atc_l4('s01g', 'naphazoline').
+atc_l4('s01g', 'naphazoline_combinations').
+atc_l4('s01g', 'nedocromil').
+atc_l4('s01g', 'olopatadine').
+atc_l4('s01g', 'oxedrine').
+atc_l4('s01g', 'oxedrine_combinations').
+atc_l4('s01g', 'oxymetazoline').
+atc_l4('s01g', 'phenylephrine').
+atc_l4('s01g', 'phenylephrine_combinations').
+atc_l4('s01g', 'spaglumic_acid').
+atc_l4('s01g', 'tetryzoline').
+atc_l4('s01g', 'tetryzoline_combinations').
+atc_l4('s01g', 'xylometazoline').
+atc_l4('s01g', 'xylometazoline_combinations').
+atc_l4('s01h', 'chloroprocaine').
+atc_l4('s01h', 'cinchocaine').
+atc_l4('s01h', 'cocaine').
+atc_l4('s01h', 'combinations').
+atc_l4('s01h', 'lidocaine').
+atc_l4('s01h', 'oxybuprocaine').
+atc_l4('s01h', 'procaine').
+atc_l4('s01h', 'proxymetacaine').
+atc_l4('s01h', 'tetracaine').
+atc_l4('s01j', 'fluorescein').
+atc_l4('s01j', 'fluorescein_combinations').
+atc_l4('s01j', 'rose_bengal_sodium').
+atc_l4('s01k', 'chymotrypsin').
+atc_l4('s01k', 'hyaluronic_acid').
+atc_l4('s01k', 'hyaluronic_acid_combinations').
+atc_l4('s01k', 'hypromellose').
+atc_l4('s01k', 'trypan_blue').
+atc_l4('s01l', 'abicipar_pegol').
+atc_l4('s01l', 'aflibercept').
+atc_l4('s01l', 'anecortave').
+atc_l4('s01l', 'bevacizumab').
+atc_l4('s01l', 'brolucizumab').
+atc_l4('s01l', 'faricimab').
+atc_l4('s01l', 'pegaptanib').
+atc_l4('s01l', 'ranibizumab').
+atc_l4('s01l', 'verteporfin').
+atc_l4('s01x', 'acetylcysteine').
+atc_l4('s01x', 'alteplase').
+atc_l4('s01x', 'alum').
+atc_l4('s01x', 'artificial_tears_and_other_indifferent_preparations').
+atc_l4('s01x', 'ascorbic_acid').
+atc_l4('s01x', 'cenegermin').
+atc_l4('s01x', 'ciclosporin').
+atc_l4('s01x', 'dexpanthenol').
+atc_l4('s01x', 'ethylmorphine').
+atc_l4('s01x', 'guaiazulen').
+atc_l4('s01x', 'heparin').
+atc_l4('s01x', 'inosine').
+atc_l4('s01x', 'iodoheparinate').
+atc_l4('s01x', 'lifitegrast').
+atc_l4('s01x', 'limbal_stem_cells_autologous').
+atc_l4('s01x', 'mercaptamine').
+atc_l4('s01x', 'nandrolone').
+atc_l4('s01x', 'ocriplasmin').
+atc_l4('s01x', 'pegcetacoplan').
+atc_l4('s01x', 'potassium_iodide').
+atc_l4('s01x', 'retinol').
+atc_l4('s01x', 'riboflavin').
+atc_l4('s01x', 'sepofarsen').
+atc_l4('s01x', 'sirolimus').
+atc_l4('s01x', 'sodium_chloride_hypertonic').
+atc_l4('s01x', 'sodium_edetate').
+atc_l4('s01x', 'varenicline').
+atc_l4('s01x', 'voretigene_neparvovec').
+atc_l4('s02a', 'acetic_acid').
+atc_l4('s02a', 'aluminium_acetotartrate').
+atc_l4('s02a', 'antiinfectives_combinations').
+atc_l4('s02a', 'boric_acid').
+atc_l4('s02a', 'cefmenoxime').
+atc_l4('s02a', 'chloramphenicol').
+atc_l4('s02a', 'chlorhexidine').
+atc_l4('s02a', 'ciprofloxacin').
+atc_l4('s02a', 'clioquinol').
+atc_l4('s02a', 'fosfomycin').
+atc_l4('s02a', 'gentamicin').
+atc_l4('s02a', 'hydrogen_peroxide').
+atc_l4('s02a', 'miconazole').
+atc_l4('s02a', 'neomycin').
+atc_l4('s02a', 'nitrofural').
+atc_l4('s02a', 'ofloxacin').
+atc_l4('s02a', 'polymyxin_b').
+atc_l4('s02a', 'rifamycin').
+atc_l4('s02a', 'tetracycline').
+atc_l4('s02b', 'betamethasone').
+atc_l4('s02b', 'dexamethasone').
+atc_l4('s02b', 'fluocinolone_acetonide').
+atc_l4('s02b', 'hydrocortisone').
+atc_l4('s02b', 'prednisolone').
+atc_l4('s02c', 'dexamethasone_and_antiinfectives').
+atc_l4('s02c', 'fludrocortisone_and_antiinfectives').
+atc_l4('s02c', 'flumetasone_and_antiinfectives').
+atc_l4('s02c', 'fluocinolone_acetonide_and_antiinfectives').
+atc_l4('s02c', 'hydrocortisone_and_antiinfectives').
+atc_l4('s02c', 'prednisolone_and_antiinfectives').
+atc_l4('s02c', 'triamcinolone_and_antiinfectives').
+atc_l4('s02d', 'cinchocaine').
+atc_l4('s02d', 'cocaine').
+atc_l4('s02d', 'combinations').
+atc_l4('s02d', 'lidocaine').
+atc_l4('s02d', 'phenazone').
+atc_l4('s03a', 'antiinfectives_combinations').
+atc_l4('s03a', 'chloramphenicol').
+atc_l4('s03a', 'chlorhexidine').
+atc_l4('s03a', 'ciprofloxacin').
+atc_l4('s03a', 'gentamicin').
+atc_l4('s03a', 'hexamidine').
+atc_l4('s03a', 'neomycin').
+atc_l4('s03a', 'polymyxin_b').
+atc_l4('s03a', 'tetracycline').
+atc_l4('s03b', 'betamethasone').
+atc_l4('s03b', 'dexamethasone').
+atc_l4('s03b', 'prednisolone').
+atc_l4('s03c', 'betamethasone_and_antiinfectives').
+atc_l4('s03c', 'dexamethasone_and_antiinfectives').
+atc_l4('s03c', 'fludrocortisone_and_antiinfectives').
+atc_l4('s03c', 'hydrocortisone_and_antiinfectives').
+atc_l4('s03c', 'methylprednisolone_and_antiinfectives').
+atc_l4('s03c', 'prednisolone_and_antiinfectives').
+atc_l4('v01a', 'animals').
+atc_l4('v01a', 'feather').
+atc_l4('v01a', 'flowers').
+atc_l4('v01a', 'food').
+atc_l4('v01a', 'grass_pollen').
+atc_l4('v01a', 'house_dust_mites').
+atc_l4('v01a', 'insects').
+atc_l4('v01a', 'mould_fungus_and_yeast_fungus').
+atc_l4('v01a', 'textiles').
+atc_l4('v01a', 'tree_pollen').
+atc_l4('v01a', 'various').
+atc_l4('v03a', 'acetylcysteine').
+atc_l4('v03a', 'amifostine').
+atc_l4('v03a', 'amyl_nitrite').
+atc_l4('v03a', 'andexanet_alfa').
+atc_l4('v03a', 'arginine_and_lysine').
+atc_l4('v03a', 'calcium_acetate').
+atc_l4('v03a', 'calcium_acetate_and_magnesium_carbonate').
+atc_l4('v03a', 'calcium_folinate').
+atc_l4('v03a', 'calcium_levofolinate').
+atc_l4('v03a', 'carbon_dioxide').
+atc_l4('v03a', 'cholinesterase').
+atc_l4('v03a', 'cobicistat').
+atc_l4('v03a', 'colestilan').
+atc_l4('v03a', 'copper_sulfate').
+atc_l4('v03a', 'deferasirox').
+atc_l4('v03a', 'deferiprone').
+atc_l4('v03a', 'deferoxamine').
+atc_l4('v03a', 'dexrazoxane').
+atc_l4('v03a', 'diazoxide').
+atc_l4('v03a', 'difelikefalin').
+atc_l4('v03a', 'digitalis_antitoxin').
+atc_l4('v03a', 'dimercaprol').
+atc_l4('v03a', 'edetates').
+atc_l4('v03a', 'ethanol').
+atc_l4('v03a', 'ferric_citrate').
+atc_l4('v03a', 'flumazenil').
+atc_l4('v03a', 'fomepizole').
+atc_l4('v03a', 'glucarpidase').
+atc_l4('v03a', 'glutathione').
+atc_l4('v03a', 'helium').
+atc_l4('v03a', 'hydroxocobalamin').
+atc_l4('v03a', 'idarucizumab').
+atc_l4('v03a', 'ipecacuanha').
+atc_l4('v03a', 'lanthanum_carbonate').
+atc_l4('v03a', 'medical_air').
+atc_l4('v03a', 'mesna').
+atc_l4('v03a', 'methionine').
+atc_l4('v03a', 'methylthioninium_chloride').
+atc_l4('v03a', 'n_4_dimethylaminophenol').
+atc_l4('v03a', 'nalfurafine').
+atc_l4('v03a', 'nalorphine').
+atc_l4('v03a', 'naloxone').
+atc_l4('v03a', 'nitrogen').
+atc_l4('v03a', 'obidoxime').
+atc_l4('v03a', 'oxygen').
+atc_l4('v03a', 'palifermin').
+atc_l4('v03a', 'patiromer_calcium').
+atc_l4('v03a', 'phentolamine').
+atc_l4('v03a', 'physostigmine').
+atc_l4('v03a', 'polystyrene_sulfonate').
+atc_l4('v03a', 'potassium_iodide').
+atc_l4('v03a', 'potassium_permanganate').
+atc_l4('v03a', 'pralidoxime').
+atc_l4('v03a', 'pralidoxime_and_atropine').
+atc_l4('v03a', 'prednisolone_and_promethazine').
+atc_l4('v03a', 'protamine').
+atc_l4('v03a', 'prussian_blue').
+atc_l4('v03a', 'rasburicase').
+atc_l4('v03a', 'sevelamer').
+atc_l4('v03a', 'sodium_cellulose_phosphate').
+atc_l4('v03a', 'sodium_folinate').
+atc_l4('v03a', 'sodium_levofolinate').
+atc_l4('v03a', 'sodium_nitrite').
+atc_l4('v03a', 'sodium_phosphate').
+atc_l4('v03a', 'sodium_zirconium_cyclosilicate').
+atc_l4('v03a', 'sucroferric_oxyhydroxide').
+atc_l4('v03a', 'sugammadex').
+atc_l4('v03a', 'thiosulfate').
+atc_l4('v03a', 'trilaciclib').
+atc_l4('v04c', 'alsactide').
+atc_l4('v04c', 'aminohippuric_acid').
+atc_l4('v04c', 'bentiromide').
+atc_l4('v04c', 'betazole').
+atc_l4('v04c', 'caffeine_and_sodium_benzoate').
+atc_l4('v04c', 'carbon_monoxide').
+atc_l4('v04c', 'cation_exchange_resins').
+atc_l4('v04c', 'ceruletide').
+atc_l4('v04c', 'corticorelin').
+atc_l4('v04c', 'edrophonium').
+atc_l4('v04c', 'folic_acid').
+atc_l4('v04c', 'galactose').
+atc_l4('v04c', 'glucose').
+atc_l4('v04c', 'gonadorelin').
+atc_l4('v04c', 'hexaminolevulinate').
+atc_l4('v04c', 'histamine_phosphate').
+atc_l4('v04c', 'indigo_carmine').
+atc_l4('v04c', 'indocyanine_green').
+atc_l4('v04c', 'inulin_and_other_polyfructosans').
+atc_l4('v04c', 'lithium_chloride').
+atc_l4('v04c', 'macimorelin').
+atc_l4('v04c', 'magnesium_sulfate').
+atc_l4('v04c', 'mannitol').
+atc_l4('v04c', 'methacetin_13c').
+atc_l4('v04c', 'methacholine').
+atc_l4('v04c', 'methylthioninium_chloride').
+atc_l4('v04c', 'metyrapone').
+atc_l4('v04c', 'n_13c_urea').
+atc_l4('v04c', 'pafolacianine').
+atc_l4('v04c', 'pancreozymin_cholecystokinin').
+atc_l4('v04c', 'patent_blue').
+atc_l4('v04c', 'pentagastrin').
+atc_l4('v04c', 'phenolsulfonphthalein').
+atc_l4('v04c', 'protirelin').
+atc_l4('v04c', 'secretin').
+atc_l4('v04c', 'sermorelin').
+atc_l4('v04c', 'sincalide').
+atc_l4('v04c', 'somatorelin').
+atc_l4('v04c', 'sorbitol').
+atc_l4('v04c', 'sulfobromophthalein').
+atc_l4('v04c', 'thyrotropin').
+atc_l4('v04c', 'tolbutamide').
+atc_l4('v04c', 'tuberculin').
+atc_l4('v04c', 'vitamin_a_concentrates').
+atc_l4('v06d', 'fructose').
+atc_l4('v06d', 'glucose').
+atc_l4('v08a', 'acetrizoic_acid').
+atc_l4('v08a', 'adipiodone').
+atc_l4('v08a', 'calcium_iopodate').
+atc_l4('v08a', 'diatrizoic_acid').
+atc_l4('v08a', 'diodone').
+atc_l4('v08a', 'ethyl_esters_of_iodised_fatty_acids').
+atc_l4('v08a', 'iobenzamic_acid').
+atc_l4('v08a', 'iobitridol').
+atc_l4('v08a', 'iocarmic_acid').
+atc_l4('v08a', 'iocetamic_acid').
+atc_l4('v08a', 'iodamide').
+atc_l4('v08a', 'iodixanol').
+atc_l4('v08a', 'iodoxamic_acid').
+atc_l4('v08a', 'iofendylate').
+atc_l4('v08a', 'ioglicic_acid').
+atc_l4('v08a', 'ioglycamic_acid').
+atc_l4('v08a', 'iohexol').
+atc_l4('v08a', 'iomeprol').
+atc_l4('v08a', 'iopamidol').
+atc_l4('v08a', 'iopanoic_acid').
+atc_l4('v08a', 'iopentol').
+atc_l4('v08a', 'iopromide').
+atc_l4('v08a', 'iopydol').
+atc_l4('v08a', 'iotalamic_acid').
+atc_l4('v08a', 'iotrolan').
+atc_l4('v08a', 'iotroxic_acid').
+atc_l4('v08a', 'ioversol').
+atc_l4('v08a', 'ioxaglic_acid').
+atc_l4('v08a', 'ioxilan').
+atc_l4('v08a', 'ioxitalamic_acid').
+atc_l4('v08a', 'methiodal').
+atc_l4('v08a', 'metrizamide').
+atc_l4('v08a', 'metrizoic_acid').
+atc_l4('v08a', 'propyliodone').
+atc_l4('v08a', 'sodium_iopodate').
+atc_l4('v08a', 'tyropanoic_acid').
+atc_l4('v08b', 'barium_sulfate_with_suspending_agents').
+atc_l4('v08b', 'barium_sulfate_without_suspending_agents').
+atc_l4('v08c', 'ferric_ammonium_citrate').
+atc_l4('v08c', 'ferristene').
+atc_l4('v08c', 'ferumoxsil').
+atc_l4('v08c', 'gadobenic_acid').
+atc_l4('v08c', 'gadobutrol').
+atc_l4('v08c', 'gadodiamide').
+atc_l4('v08c', 'gadofosveset').
+atc_l4('v08c', 'gadopentetic_acid').
+atc_l4('v08c', 'gadopiclenol').
+atc_l4('v08c', 'gadoteric_acid').
+atc_l4('v08c', 'gadoteridol').
+atc_l4('v08c', 'gadoversetamide').
+atc_l4('v08c', 'gadoxetic_acid').
+atc_l4('v08c', 'iron_oxide_nanoparticles').
+atc_l4('v08c', 'mangafodipir').
+atc_l4('v08c', 'perflubron').
+atc_l4('v08d', 'microparticles_of_galactose').
+atc_l4('v08d', 'perflenapent').
+atc_l4('v08d', 'perflubutane_phospholipid_microspheres').
+atc_l4('v08d', 'perflutren_human_albumin_microspheres').
+atc_l4('v08d', 'perflutren_phospholipid_microspheres').
+atc_l4('v08d', 'sulfur_hexafluoride_phospholipid_microspheres').
+atc_l4('v09a', 'florbetaben_18f').
+atc_l4('v09a', 'florbetapir_18f').
+atc_l4('v09a', 'flortaucipir_18f').
+atc_l4('v09a', 'flutemetamol_18f').
+atc_l4('v09a', 'indium_111in_pentetic_acid').
+atc_l4('v09a', 'iodine_124i_2beta_carbomethoxy_3beta_4_iodophenyl_tropane').
+atc_l4('v09a', 'iodine_iofetamine_123i').
+atc_l4('v09a', 'iodine_ioflupane_123i').
+atc_l4('v09a', 'iodine_iolopride_123i').
+atc_l4('v09a', 'technetium_99mtc_bicisate').
+atc_l4('v09a', 'technetium_99mtc_exametazime').
+atc_l4('v09b', 'technetium_99mtc_butedronic_acid').
+atc_l4('v09b', 'technetium_99mtc_medronic_acid').
+atc_l4('v09b', 'technetium_99mtc_oxidronic_acid').
+atc_l4('v09b', 'technetium_99mtc_pyrophosphate').
+atc_l4('v09c', 'chromium_51cr_edetate').
+atc_l4('v09c', 'sodium_iodohippurate_123i').
+atc_l4('v09c', 'sodium_iodohippurate_131i').
+atc_l4('v09c', 'sodium_iothalamate_125i').
+atc_l4('v09c', 'technetium_99mtc_ethylenedicysteine').
+atc_l4('v09c', 'technetium_99mtc_gluceptate').
+atc_l4('v09c', 'technetium_99mtc_gluconate').
+atc_l4('v09c', 'technetium_99mtc_mertiatide').
+atc_l4('v09c', 'technetium_99mtc_pentetic_acid').
+atc_l4('v09c', 'technetium_99mtc_succimer').
+atc_l4('v09d', 'selenium_75se_tauroselcholic_acid').
+atc_l4('v09d', 'technetium_99mtc_disofenin').
+atc_l4('v09d', 'technetium_99mtc_etifenin').
+atc_l4('v09d', 'technetium_99mtc_galtifenin').
+atc_l4('v09d', 'technetium_99mtc_lidofenin').
+atc_l4('v09d', 'technetium_99mtc_mebrofenin').
+atc_l4('v09d', 'technetium_99mtc_microcolloid').
+atc_l4('v09d', 'technetium_99mtc_millimicrospheres').
+atc_l4('v09d', 'technetium_99mtc_nanocolloid').
+atc_l4('v09d', 'technetium_99mtc_phytate').
+atc_l4('v09d', 'technetium_99mtc_rheniumsulfide_colloid').
+atc_l4('v09d', 'technetium_99mtc_sulfur_colloid').
+atc_l4('v09d', 'technetium_99mtc_tin_colloid').
+atc_l4('v09e', 'krypton_81mkr_gas').
+atc_l4('v09e', 'technetium_99mtc_macrosalb').
+atc_l4('v09e', 'technetium_99mtc_microspheres').
+atc_l4('v09e', 'technetium_99mtc_nanocolloid').
+atc_l4('v09e', 'technetium_99mtc_pentetic_acid').
+atc_l4('v09e', 'technetium_99mtc_technegas').
+atc_l4('v09e', 'xenon_127xe_gas').
+atc_l4('v09e', 'xenon_133xe_gas').
+atc_l4('v09f', 'sodium_iodide_123i').
+atc_l4('v09f', 'sodium_iodide_124i').
+atc_l4('v09f', 'sodium_iodide_131i').
+atc_l4('v09f', 'technetium_99mtc_pertechnetate').
+atc_l4('v09g', 'ammonia_13n').
+atc_l4('v09g', 'chromium_51cr_chromate_labelled_cells').
+atc_l4('v09g', 'fibrinogen_125i').
+atc_l4('v09g', 'indium_111in_imciromab').
+atc_l4('v09g', 'iodine_125i_human_albumin').
+atc_l4('v09g', 'rubidium_82rb_chloride').
+atc_l4('v09g', 'technetium_99mtc_apcitide').
+atc_l4('v09g', 'technetium_99mtc_furifosmin').
+atc_l4('v09g', 'technetium_99mtc_human_albumin').
+atc_l4('v09g', 'technetium_99mtc_sestamibi').
+atc_l4('v09g', 'technetium_99mtc_stannous_agent_labelled_cells').
+atc_l4('v09g', 'technetium_99mtc_teboroxime').
+atc_l4('v09g', 'technetium_99mtc_tetrofosmin').
+atc_l4('v09g', 'thallium_201tl_chloride').
+atc_l4('v09h', 'gallium_67ga_citrate').
+atc_l4('v09h', 'indium_111in_oxinate_labelled_cells').
+atc_l4('v09h', 'indium_111in_tropolonate_labelled_cells').
+atc_l4('v09h', 'technetium_99mtc_antigranulocyte_antibody').
+atc_l4('v09h', 'technetium_99mtc_exametazime_labelled_cells').
+atc_l4('v09h', 'technetium_99mtc_human_immunoglobulin').
+atc_l4('v09h', 'technetium_99mtc_sulesomab').
+atc_l4('v09i', 'copper_64cu_dotatate').
+atc_l4('v09i', 'fluciclovine_18f').
+atc_l4('v09i', 'fludeoxyglucose_18f').
+atc_l4('v09i', 'fluorocholine_18f').
+atc_l4('v09i', 'fluorodopa_18f').
+atc_l4('v09i', 'fluoroestradiol_18f').
+atc_l4('v09i', 'fluoroethyl_l_tyrosine_18f').
+atc_l4('v09i', 'fluoroethylcholine_18f').
+atc_l4('v09i', 'gallium_68ga_edotreotide').
+atc_l4('v09i', 'gallium_68ga_gozetotide').
+atc_l4('v09i', 'indium_111in_antiovariumcarcinoma_antibody').
+atc_l4('v09i', 'indium_111in_capromab_pendetide').
+atc_l4('v09i', 'indium_111in_pentetreotide').
+atc_l4('v09i', 'indium_111in_satumomab_pendetide').
+atc_l4('v09i', 'iobenguane_123i').
+atc_l4('v09i', 'iobenguane_131i').
+atc_l4('v09i', 'iodine_125i_cc49_monoclonal_antibody').
+atc_l4('v09i', 'methionine_11c').
+atc_l4('v09i', 'piflufolastat_18f').
+atc_l4('v09i', 'psma_1007_18f').
+atc_l4('v09i', 'sodium_fluoride_18f').
+atc_l4('v09i', 'technetium_99mtc_anticarcinoembryonicantigen_antibody').
+atc_l4('v09i', 'technetium_99mtc_antimelanoma_antibody').
+atc_l4('v09i', 'technetium_99mtc_arcitumomab').
+atc_l4('v09i', 'technetium_99mtc_depreotide').
+atc_l4('v09i', 'technetium_99mtc_etarfolatide').
+atc_l4('v09i', 'technetium_99mtc_hynic_octreotide').
+atc_l4('v09i', 'technetium_99mtc_pentavalent_succimer').
+atc_l4('v09i', 'technetium_99mtc_tilmanocept').
+atc_l4('v09i', 'technetium_99mtc_trofolastat_chloride').
+atc_l4('v09i', 'technetium_99mtc_votumumab').
+atc_l4('v09x', 'cobalt_57co_cyanocobalamine').
+atc_l4('v09x', 'cobalt_58co_cyanocobalamine').
+atc_l4('v09x', 'ferric_59fe_citrate').
+atc_l4('v09x', 'iodine_131i_human_albumin').
+atc_l4('v09x', 'iodine_131i_norcholesterol').
+atc_l4('v09x', 'iodocholesterol_131i').
+atc_l4('v09x', 'selenium_75se_norcholesterol').
+atc_l4('v10a', 'dysprosium_165dy_colloid').
+atc_l4('v10a', 'erbium_169er_citrate_colloid').
+atc_l4('v10a', 'gold_198au_colloidal').
+atc_l4('v10a', 'phosphorous_32p_chromicphosphate_colloid').
+atc_l4('v10a', 'rhenium_186re_sulfide_colloid').
+atc_l4('v10a', 'samarium_153sm_hydroxyapatite_colloid').
+atc_l4('v10a', 'yttrium_90y_citrate_colloid').
+atc_l4('v10a', 'yttrium_90y_ferrihydroxide_colloid').
+atc_l4('v10a', 'yttrium_90y_silicate_colloid').
+atc_l4('v10b', 'rhenium_186re_etidronic_acid').
+atc_l4('v10b', 'samarium_153sm_lexidronam').
+atc_l4('v10b', 'strontium_89sr_chloride').
+atc_l4('v10x', 'ibritumomab_tiuxetan_90y').
+atc_l4('v10x', 'iobenguane_131i').
+atc_l4('v10x', 'iodine_131i_omburtamab').
+atc_l4('v10x', 'lutetium_177lu_oxodotreotide').
+atc_l4('v10x', 'lutetium_177lu_vipivotide_tetraxetan').
+atc_l4('v10x', 'radium_223ra_dichloride').
+atc_l4('v10x', 'sodium_iodide_131i').
+atc_l4('v10x', 'sodium_phosphate_32p').
+atc_l4('v10x', 'tositumomab_iodine_131i_tositumomab').
@@ -13,15 +13,24 @@
 %   3. Motore di inferenza        — deduzione delle linee terapeutiche appropriate
 %   4. Calcolo dei costi          — assegnazione dei costi per l'algoritmo A*
 %   5. Safety checker             — rilevazione delle interazioni farmacologiche (DDI)
+%   6. Verifica della terapia     — raccolta dei conflitti di un intero regime
 %
 % Dipendenze:
 %   - facts.pl: A-Box estensionale con i fatti has_atc_code/2 generati dal WHO ATC-DDD
+%               e i prefissi precalcolati atc_l3/2 e atc_l4/2
 %
 % Formato dei codici ATC:
 %   I codici ATC sono gerarchici su 5 livelli (es. C09AA01).
-%   Le regole usano sub_atom/5 per classificare i farmaci a livello
-%   di sottogruppo terapeutico (caratteri 0-3 o 0-4), senza enumerare
-%   i singoli principi attivi.
+%   Le regole classificano i farmaci a livello di sottogruppo terapeutico
+%   (prefisso di 3 o 4 caratteri) tramite i fatti atc_l3(Prefisso, Drug) e
+%   atc_l4(Prefisso, Drug), senza enumerare i singoli principi attivi.
+%   Il prefisso è il primo argomento: la classificazione è una lookup
+%   indicizzata anziché una scansione di tutti i fatti has_atc_code/2.
+%
+% Tabling:
+%   approved_for/3 e le categorie aggregate sono tabellate: la catena di
+%   classificazione viene calcolata una sola volta per variante di chiamata
+%   e riutilizzata dalle interrogazioni successive.
 
 :- use_module(library(lists)).
 :- consult('facts.pl').
@@ -33,39 +42,42 @@
 :- discontiguous increases_bp/1.
 :- discontiguous decreases_bp/1.
 
+:- table approved_for/3.
+:- table is_analgesic/1, is_bp_lowering/1, is_anti_inflammatory/1.
+
 % ======================================================================
 % 1. ONTOLOGIA FARMACODINAMICA
 %
 % Ogni predicato is_X(Drug) classifica un farmaco in una categoria
-% terapeutica in base al prefisso del suo codice ATC.
+% terapeutica in base al prefisso del suo codice ATC (atc_l3/2, atc_l4/2).
 % La classificazione è universalmente quantificata: vale per qualsiasi
 % farmaco presente nell'A-Box che soddisfi il pattern ATC.
 % ======================================================================
 
-is_antacid(Drug)                 :- has_atc_code(Drug, Atc), sub_atom(Atc, 0, 4, _, 'a02a').
-is_acid_suppressor(Drug)         :- has_atc_code(Drug, Atc), sub_atom(Atc, 0, 4, _, 'a02b').
-is_insulin(Drug)                 :- has_atc_code(Drug, Atc), sub_atom(Atc, 0, 4, _, 'a10a').
-is_oral_hypoglycemic(Drug)       :- has_atc_code(Drug, Atc), sub_atom(Atc, 0, 4, _, 'a10b').
-is_antithrombotic(Drug)          :- has_atc_code(Drug, Atc), sub_atom(Atc, 0, 4, _, 'b01a').
-is_antihypertensive(Drug)        :- has_atc_code(Drug, Atc), sub_atom(Atc, 0, 3, _, 'c02').
-is_diuretic(Drug)                :- has_atc_code(Drug, Atc), sub_atom(Atc, 0, 3, _, 'c03').
-is_beta_blocker(Drug)            :- has_atc_code(Drug, Atc), sub_atom(Atc, 0, 3, _, 'c07').
-is_calcium_channel_blocker(Drug) :- has_atc_code(Drug, Atc), sub_atom(Atc, 0, 3, _, 'c08').
-is_ace_inhibitor(Drug)           :- has_atc_code(Drug, Atc), sub_atom(Atc, 0, 4, _, 'c09a').
-is_arb(Drug)                     :- has_atc_code(Drug, Atc), sub_atom(Atc, 0, 4, _, 'c09c').
-is_lipid_lowering(Drug)          :- has_atc_code(Drug, Atc), sub_atom(Atc, 0, 3, _, 'c10').
-is_corticosteroid(Drug)          :- has_atc_code(Drug, Atc), sub_atom(Atc, 0, 3, _, 'h02').
-is_thyroid_therapy(Drug)         :- has_atc_code(Drug, Atc), sub_atom(Atc, 0, 3, _, 'h03').
-is_antibacterial(Drug)           :- has_atc_code(Drug, Atc), sub_atom(Atc, 0, 3, _, 'j01').
-is_nsaid(Drug)                   :- has_atc_code(Drug, Atc), sub_atom(Atc, 0, 4, _, 'm01a').
-is_opioid(Drug)                  :- has_atc_code(Drug, Atc), sub_atom(Atc, 0, 4, _, 'n02a').
-is_analgesic_other(Drug)         :- has_atc_code(Drug, Atc), sub_atom(Atc, 0, 4, _, 'n02b').
-is_antiepileptic(Drug)           :- has_atc_code(Drug, Atc), sub_atom(Atc, 0, 3, _, 'n03').
-is_antipsychotic(Drug)           :- has_atc_code(Drug, Atc), sub_atom(Atc, 0, 4, _, 'n05a').
-is_anxiolytic(Drug)              :- has_atc_code(Drug, Atc), sub_atom(Atc, 0, 4, _, 'n05b').
-is_antidepressant(Drug)          :- has_atc_code(Drug, Atc), sub_atom(Atc, 0, 4, _, 'n06a').
-is_bronchodilator(Drug)          :- has_atc_code(Drug, Atc), sub_atom(Atc, 0, 3, _, 'r03').
-is_antihistamine(Drug)           :- has_atc_code(Drug, Atc), sub_atom(Atc, 0, 4, _, 'r06a').
+is_antacid(Drug)                 :- atc_l4('a02a', Drug).
+is_acid_suppressor(Drug)         :- atc_l4('a02b', Drug).
+is_insulin(Drug)                 :- atc_l4('a10a', Drug).
+is_oral_hypoglycemic(Drug)       :- atc_l4('a10b', Drug).
+is_antithrombotic(Drug)          :- atc_l4('b01a', Drug).
+is_antihypertensive(Drug)        :- atc_l3('c02', Drug).
+is_diuretic(Drug)                :- atc_l3('c03', Drug).
+is_beta_blocker(Drug)            :- atc_l3('c07', Drug).
+is_calcium_channel_blocker(Drug) :- atc_l3('c08', Drug).
+is_ace_inhibitor(Drug)           :- atc_l4('c09a', Drug).
+is_arb(Drug)                     :- atc_l4('c09c', Drug).
+is_lipid_lowering(Drug)          :- atc_l3('c10', Drug).
+is_corticosteroid(Drug)          :- atc_l3('h02', Drug).
+is_thyroid_therapy(Drug)         :- atc_l3('h03', Drug).
+is_antibacterial(Drug)           :- atc_l3('j01', Drug).
+is_nsaid(Drug)                   :- atc_l4('m01a', Drug).
+is_opioid(Drug)                  :- atc_l4('n02a', Drug).
+is_analgesic_other(Drug)         :- atc_l4('n02b', Drug).
+is_antiepileptic(Drug)           :- atc_l3('n03', Drug).
+is_antipsychotic(Drug)           :- atc_l4('n05a', Drug).
+is_anxiolytic(Drug)              :- atc_l4('n05b', Drug).
+is_antidepressant(Drug)          :- atc_l4('n06a', Drug).
+is_bronchodilator(Drug)          :- atc_l3('r03', Drug).
+is_antihistamine(Drug)           :- atc_l4('r06a', Drug).
 
 % Categorie aggregate: un farmaco appartiene alla categoria se soddisfa
 % almeno una delle sottocategorie che la compongono.
@@ -241,8 +253,8 @@ dangerous_classes('b01',  'm01a', 'high', 'CRITICAL: Severe bleeding risk (Antic
 dangerous_classes('n06ab','n06af','high', 'CRITICAL: Serotonin syndrome risk').
 
 % Proprietà fisiopatologiche degli effetti sulla pressione arteriosa.
-increases_bp(Drug) :- has_atc_code(Drug, Atc), sub_atom(Atc, 0, 3, _, 'r03').
-decreases_bp(Drug) :- has_atc_code(Drug, Atc), sub_atom(Atc, 0, 3, _, 'c07').
+increases_bp(Drug) :- atc_l3('r03', Drug).
+decreases_bp(Drug) :- atc_l3('c07', Drug).
 
 % 1. Antagonismo fisiopatologico sulla pressione arteriosa.
 check_pair_safety(Drug1, Drug2, conflict('high', 'CRITICAL: Physiological Antagonism (Opposite BP effects)')) :-
@@ -271,21 +283,40 @@ check_pair_safety(Drug1, Drug2, conflict(Severity, Msg)) :-
 % 3. Cascata prescrittiva: FANS che induce ipertensione secondaria
 %    trattata con ACE-inibitore, generando un ciclo iatrogeno evitabile.
 check_pair_safety(Drug1, Drug2, conflict('medium', 'WARNING: Prescribing Cascade detected.')) :-
-    has_atc_code(Drug1, Atc1), sub_atom(Atc1, 0, 4, _, 'm01a'),
-    has_atc_code(Drug2, Atc2), sub_atom(Atc2, 0, 4, _, 'c09a').
+    atc_l4('m01a', Drug1),
+    atc_l4('c09a', Drug2).
 
 check_pair_safety(Drug1, Drug2, conflict('medium', 'WARNING: Prescribing Cascade detected.')) :-
-    has_atc_code(Drug1, Atc1), sub_atom(Atc1, 0, 4, _, 'c09a'),
-    has_atc_code(Drug2, Atc2), sub_atom(Atc2, 0, 4, _, 'm01a').
+    atc_l4('c09a', Drug1),
+    atc_l4('m01a', Drug2).
 
 % 4. Duplicazione terapeutica: due farmaci della stessa sottoclasse ATC
 %    (prime 4 cifre), che implica stesso meccanismo d'azione.
+%    Join sui fatti atc_l4/2: i sottogruppi di Drug1 (indice JIT sul secondo
+%    argomento) vengono verificati direttamente per Drug2.
 check_pair_safety(Drug1, Drug2, conflict('medium', 'WARNING: Therapeutic Duplication (Same pharmacological subgroup)')) :-
     Drug1 \= Drug2,
-    has_atc_code(Drug1, Atc1),
-    has_atc_code(Drug2, Atc2),
-    sub_atom(Atc1, 0, 4, _, CoreClass),
-    sub_atom(Atc2, 0, 4, _, CoreClass).
+    atc_l4(CoreClass, Drug1),
+    atc_l4(CoreClass, Drug2).
 
 % 5. Fallback: nessuna delle condizioni precedenti è verificata.
-check_pair_safety(_, _, safe).
\ No newline at end of file
+check_pair_safety(_, _, safe).
+
+% ======================================================================
+% 6. VERIFICA DELLA TERAPIA
+%
+% therapy_conflicts(Drugs, Conflicts) valuta in una singola chiamata
+% tutte le coppie non ordinate della lista Drugs e unifica Conflicts con
+% la lista dei termini conflict(Drug1, Drug2, Severity, Msg).
+% Per ciascuna coppia vale la prima clausola di check_pair_safety/3 che
+% ha successo (once/1), secondo la priorità di rilevazione definita
+% nella sezione 5; le coppie sicure non compaiono nella lista.
+% ======================================================================
+
+therapy_conflicts(Drugs, Conflicts) :-
+    findall(conflict(Drug1, Drug2, Severity, Msg),
+            ( append(_, [Drug1|Others], Drugs),
+              member(Drug2, Others),
+              once(check_pair_safety(Drug1, Drug2, Result)),
+              Result = conflict(Severity, Msg) ),
+            Conflicts).
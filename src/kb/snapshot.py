@@ -0,0 +1,383 @@
+# File: src/kb/snapshot.py
+
+"""
+Snapshot compilato della chiusura della Knowledge Base.
+
+L'algoritmo A* usa solo due relazioni derivate dalla T-Box: le approvazioni
+`approved_for(Drug, Disease, Line)` e la severità delle interazioni tra coppie
+di farmaci (`check_pair_safety/3`). Entrambe cambiano solo quando cambiano
+`reasoning.pl` o il catalogo WHO (`facts.pl`): questo modulo le materializza
+offline in un artefatto binario compatto e versionato, identificato dall'hash
+del contenuto dei due file Prolog, e fornisce un backend di interrogazione
+che le serve a runtime senza alcuna dipendenza da PySwip/SWI-Prolog.
+
+Uso:
+    python src/kb/snapshot.py build    # compila lo snapshot dalla KB live
+    python src/kb/snapshot.py check    # verifica lo snapshot contro Prolog
+"""
+
+import os
+import sys
+import random
+import hashlib
+import argparse
+import numpy as np
+import joblib
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from src.metrics import get_metrics
+
+metrics = get_metrics()
+
+SNAPSHOT_FORMAT_VERSION = 1
+
+# Codifica compatta della severità dei conflitti.
+SEVERITY_CODES = {'medium': 1, 'high': 2}
+SEVERITY_NAMES = {code: name for name, code in SEVERITY_CODES.items()}
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+PROLOG_DIR = os.path.join(BASE_DIR, "prolog")
+SNAPSHOT_DIR = os.path.join(BASE_DIR, "snapshots")
+
+
+def kb_source_hash(prolog_dir: str = PROLOG_DIR) -> str:
+    """
+    Calcola l'hash SHA-256 del contenuto di `facts.pl` e `reasoning.pl`.
+
+    Args:
+        prolog_dir (str): Directory contenente i due file Prolog.
+
+    Returns:
+        str: Digest esadecimale che identifica la versione della KB.
+    """
+    digest = hashlib.sha256()
+    for name in ("facts.pl", "reasoning.pl"):
+        digest.update(name.encode('utf-8'))
+        with open(os.path.join(prolog_dir, name), 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+    return digest.hexdigest()
+
+
+def snapshot_path_for(source_hash: str, snapshot_dir: str = SNAPSHOT_DIR) -> str:
+    """Restituisce il percorso dello snapshot associato a una versione della KB."""
+    return os.path.join(snapshot_dir, f"kb_closure_{source_hash[:16]}.pkl")
+
+
+class KBSnapshotBuilder:
+    """
+    Compila la chiusura della KB interrogando il runtime Prolog (offline).
+
+    L'universo dei farmaci materializzato è l'insieme dei farmaci approvati
+    per almeno una patologia: sono gli unici che l'A* può inserire in un
+    regime, e quindi le uniche coppie per cui serve la severità del conflitto.
+
+    Attributes:
+        kb (PrologInterface): Interfaccia verso la KB live.
+        prolog_dir (str): Directory dei file Prolog sorgente.
+        snapshot_dir (str): Directory di destinazione degli snapshot.
+    """
+
+    def __init__(self, kb=None, prolog_dir: str = PROLOG_DIR, snapshot_dir: str = SNAPSHOT_DIR):
+        """
+        Inizializza il builder.
+
+        Args:
+            kb (PrologInterface, optional): Interfaccia Prolog già inizializzata.
+                Se assente ne viene creata una nuova su `prolog_dir`.
+            prolog_dir (str): Directory dei file Prolog sorgente.
+            snapshot_dir (str): Directory di destinazione degli snapshot.
+        """
+        if kb is None:
+            from src.kb.interface import PrologInterface
+            kb = PrologInterface(rule_file=os.path.join(prolog_dir, "reasoning.pl"))
+        self.kb = kb
+        self.prolog_dir = prolog_dir
+        self.snapshot_dir = snapshot_dir
+
+    def build(self) -> dict:
+        """
+        Materializza approvazioni e conflitti dalla KB live.
+
+        Returns:
+            dict: Lo snapshot in formato serializzabile (array NumPy compatti
+                e vocabolari di farmaci, patologie e messaggi).
+        """
+        print("[KB-SNAPSHOT] Enumerazione di approved_for/3...")
+        approvals = {}
+        for res in self.kb.prolog.query("approved_for(Drug, Disease, Line)"):
+            # Linea più bassa per (farmaco, patologia), come `PrologInterface.get_approvals`
+            table = approvals.setdefault(res['Disease'], {})
+            line = int(res['Line'])
+            if res['Drug'] not in table or line < table[res['Drug']]:
+                table[res['Drug']] = line
+
+        drugs = sorted({drug for table in approvals.values() for drug in table})
+        diseases = sorted(approvals)
+        drug_index = {drug: i for i, drug in enumerate(drugs)}
+        print(f"[KB-SNAPSHOT] {len(diseases)} patologie, {len(drugs)} farmaci candidati.")
+
+        approval_arrays = {}
+        for disease in diseases:
+            table = approvals[disease]
+            ordered = sorted(table)
+            approval_arrays[disease] = (
+                np.array([drug_index[d] for d in ordered], dtype=np.int32),
+                np.array([table[d] for d in ordered], dtype=np.int8),
+            )
+
+        print(f"[KB-SNAPSHOT] Calcolo dei conflitti su {len(drugs) * (len(drugs) - 1) // 2} coppie...")
+        conflicts = self.kb.find_conflicts(drugs)
+
+        messages = sorted({c['msg'] for c in conflicts})
+        message_index = {msg: i for i, msg in enumerate(messages)}
+        left, right, severity, msg_ids = [], [], [], []
+        for c in conflicts:
+            i, j = drug_index[c['drugs'][0]], drug_index[c['drugs'][1]]
+            left.append(min(i, j))
+            right.append(max(i, j))
+            severity.append(SEVERITY_CODES.get(c['severity'], SEVERITY_CODES['high']))
+            msg_ids.append(message_index[c['msg']])
+        print(f"[KB-SNAPSHOT] {len(conflicts)} coppie in conflitto.")
+
+        return {
+            'format_version': SNAPSHOT_FORMAT_VERSION,
+            'source_hash': kb_source_hash(self.prolog_dir),
+            'drugs': drugs,
+            'diseases': diseases,
+            'approvals': approval_arrays,
+            'conflicts': {
+                'left': np.array(left, dtype=np.int32),
+                'right': np.array(right, dtype=np.int32),
+                'severity': np.array(severity, dtype=np.int8),
+                'msg': np.array(msg_ids, dtype=np.int16),
+            },
+            'messages': messages,
+        }
+
+    def build_and_save(self) -> str:
+        """
+        Compila lo snapshot e lo salva su disco, nominato con l'hash della KB.
+
+        Returns:
+            str: Percorso del file salvato.
+        """
+        snapshot = self.build()
+        os.makedirs(self.snapshot_dir, exist_ok=True)
+        path = snapshot_path_for(snapshot['source_hash'], self.snapshot_dir)
+        joblib.dump(snapshot, path, compress=3)
+        print(f"✅ [KB-SNAPSHOT] Snapshot salvato in: {path}")
+        return path
+
+
+class SnapshotInterface:
+    """
+    Backend di interrogazione della KB basato sullo snapshot compilato.
+
+    Espone la stessa API usata dall'A* su `PrologInterface` (`get_approvals`,
+    `verify_therapy`, `conflict_bitsets`) rispondendo da tabelle in memoria, senza importare
+    PySwip né avviare SWI-Prolog.
+
+    Attributes:
+        source_hash (str): Hash della versione della KB da cui è stato compilato.
+        prolog_dir (str): Directory dei file Prolog a cui lo snapshot si riferisce.
+        drugs (list[str]): Universo dei farmaci candidati.
+        diseases (list[str]): Patologie con almeno un farmaco approvato.
+    """
+
+    def __init__(self, snapshot_path: str = None, prolog_dir: str = PROLOG_DIR,
+                 snapshot_dir: str = SNAPSHOT_DIR):
+        """
+        Carica lo snapshot corrispondente alla versione corrente della KB.
+
+        Args:
+            snapshot_path (str, optional): Percorso esplicito dello snapshot.
+                Se assente viene risolto dall'hash dei file Prolog correnti.
+            prolog_dir (str): Directory dei file Prolog sorgente.
+            snapshot_dir (str): Directory degli snapshot compilati.
+
+        Raises:
+            FileNotFoundError: Se non esiste uno snapshot per la KB corrente.
+            ValueError: Se il formato dello snapshot non è supportato.
+        """
+        current_hash = None
+        if snapshot_path is None:
+            current_hash = kb_source_hash(prolog_dir)
+            snapshot_path = snapshot_path_for(current_hash, snapshot_dir)
+
+        if not os.path.exists(snapshot_path):
+            raise FileNotFoundError(
+                f"[KB-SNAPSHOT] Snapshot non trovato: {snapshot_path}. "
+                f"Eseguire prima: python src/kb/snapshot.py build"
+            )
+
+        data = joblib.load(snapshot_path)
+        if data.get('format_version') != SNAPSHOT_FORMAT_VERSION:
+            raise ValueError(
+                f"[KB-SNAPSHOT] Formato snapshot non supportato: {data.get('format_version')}"
+            )
+
+        self.path = snapshot_path
+        self.prolog_dir = prolog_dir
+        self.source_hash = data['source_hash']
+        if current_hash is not None and current_hash != self.source_hash:
+            print("[KB-WARN] Lo snapshot non corrisponde alla versione corrente della KB.")
+
+        self.drugs = data['drugs']
+        self.diseases = data['diseases']
+        self._drug_index = {drug: i for i, drug in enumerate(self.drugs)}
+
+        self._approvals = {}
+        for disease, (drug_ids, lines) in data['approvals'].items():
+            self._approvals[disease] = {
+                self.drugs[i]: int(line) for i, line in zip(drug_ids.tolist(), lines.tolist())
+            }
+
+        messages = data['messages']
+        table = data['conflicts']
+        self._conflict_arrays = (table['left'], table['right'], table['severity'])
+        self._conflicts = {
+            (i, j): (SEVERITY_NAMES[sev], messages[m])
+            for i, j, sev, m in zip(table['left'].tolist(), table['right'].tolist(),
+                                    table['severity'].tolist(), table['msg'].tolist())
+        }
+
+    @metrics.timed('kb.snapshot.approved_for')
+    def get_approvals(self, disease_atom: str) -> dict:
+        """
+        Restituisce i farmaci approvati per una patologia con la linea terapeutica.
+
+        Args:
+            disease_atom (str): L'atomo Prolog della patologia.
+
+        Returns:
+            dict: Mappa {farmaco_atom: linea_terapeutica}.
+        """
+        return dict(self._approvals.get(disease_atom, {}))
+
+    @metrics.timed('kb.snapshot.therapy_conflicts')
+    def verify_therapy(self, drugs: list) -> dict:
+        """
+        Valuta la sicurezza di una combinazione di farmaci dallo snapshot.
+
+        I farmaci esterni all'universo dei candidati (mai approvati per alcuna
+        patologia) non compaiono nello snapshot e sono considerati privi di
+        interazioni.
+
+        Args:
+            drugs (list[str]): Lista di atomi Prolog dei farmaci.
+
+        Returns:
+            dict: Stesso formato di `PrologInterface.verify_therapy`.
+        """
+        conflicts = []
+        ids = [self._drug_index.get(d) for d in drugs]
+        for a in range(len(drugs)):
+            for b in range(a + 1, len(drugs)):
+                if ids[a] is None or ids[b] is None:
+                    continue
+                key = (ids[a], ids[b]) if ids[a] < ids[b] else (ids[b], ids[a])
+                hit = self._conflicts.get(key)
+                if hit is not None:
+                    conflicts.append({
+                        'drugs': (drugs[a], drugs[b]),
+                        'severity': hit[0],
+                        'msg': hit[1]
+                    })
+        return {'safe': len(conflicts) == 0, 'conflicts': conflicts}
+
+    @metrics.timed('kb.snapshot.conflict_bitsets')
+    def conflict_bitsets(self, drugs: list) -> tuple:
+        """
+        Restituisce in blocco i conflitti tra tutte le coppie di farmaci.
+
+        Args:
+            drugs (list[str]): Lista di atomi Prolog dei farmaci (N).
+
+        Returns:
+            tuple: (hard, medium), liste di N bitset con i vicini 'high' e
+                'medium' di ciascun farmaco (bit i = drugs[i]).
+        """
+        from src.kb.conflict_graph import pair_conflicts
+
+        position = np.full(len(self.drugs), -1, dtype=np.int64)
+        for k, drug in enumerate(drugs):
+            i = self._drug_index.get(drug)
+            if i is not None:
+                position[i] = k
+
+        left, right, severity = self._conflict_arrays
+        left, right = position[left], position[right]
+        known = (left >= 0) & (right >= 0)
+        return pair_conflicts(len(drugs), left[known], right[known], severity[known])
+
+
+def check_snapshot_consistency(snapshot: SnapshotInterface, kb, n_samples: int = 500,
+                               max_regimen: int = 4, seed: int = 42) -> dict:
+    """
+    Confronta lo snapshot con la KB live.
+
+    Le approvazioni vengono confrontate integralmente per ogni patologia;
+    i conflitti su un campione riproducibile di regimi casuali estratti
+    dall'universo dei candidati. L'hash sorgente è confrontato con quello
+    dei file Prolog di `snapshot.prolog_dir`, la KB a cui lo snapshot si
+    riferisce (che deve essere anche quella caricata in `kb`).
+
+    Args:
+        snapshot (SnapshotInterface): Il backend compilato da verificare.
+        kb (PrologInterface): Interfaccia verso la KB live.
+        n_samples (int): Numero di regimi casuali da confrontare.
+        max_regimen (int): Numero massimo di farmaci per regime.
+        seed (int): Seed del campionamento.
+
+    Returns:
+        dict: Report con l'esito ('consistent') e le discrepanze trovate.
+    """
+    report = {
+        'consistent': True,
+        'source_hash_matches': snapshot.source_hash == kb_source_hash(snapshot.prolog_dir),
+        'approval_mismatches': [],
+        'conflict_mismatches': [],
+    }
+
+    live_diseases = {res['Disease'] for res in kb.prolog.query("approved_for(_, Disease, _)")}
+    for disease in sorted(live_diseases | set(snapshot.diseases)):
+        if kb.get_approvals(disease) != snapshot.get_approvals(disease):
+            report['approval_mismatches'].append(disease)
+
+    rng = random.Random(seed)
+    for _ in range(n_samples):
+        regimen = rng.sample(snapshot.drugs, rng.randint(2, max_regimen))
+        live = {(frozenset(c['drugs']), c['severity']) for c in kb.find_conflicts(regimen)}
+        compiled = {(frozenset(c['drugs']), c['severity'])
+                    for c in snapshot.verify_therapy(regimen)['conflicts']}
+        if live != compiled:
+            report['conflict_mismatches'].append(regimen)
+
+    report['consistent'] = (report['source_hash_matches']
+                            and not report['approval_mismatches']
+                            and not report['conflict_mismatches'])
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="SafeTherapy - Snapshot compilato della KB")
+    parser.add_argument("command", choices=["build", "check"], help="Compila o verifica lo snapshot")
+    parser.add_argument("--samples", type=int, default=500, help="Regimi casuali da verificare (check)")
+    parser.add_argument("--kb-dir", type=str, default=PROLOG_DIR,
+                        help="Directory con reasoning.pl e facts.pl (default: src/kb/prolog)")
+    args = parser.parse_args()
+
+    if args.command == "build":
+        KBSnapshotBuilder(prolog_dir=args.kb_dir).build_and_save()
+    else:
+        from src.kb.interface import PrologInterface
+        live_kb = PrologInterface(rule_file=os.path.join(args.kb_dir, "reasoning.pl"))
+        result = check_snapshot_consistency(SnapshotInterface(prolog_dir=args.kb_dir), live_kb,
+                                            n_samples=args.samples)
+        print(f"[KB-SNAPSHOT] Hash sorgente coerente : {result['source_hash_matches']}")
+        print(f"[KB-SNAPSHOT] Approvazioni divergenti: {len(result['approval_mismatches'])}")
+        print(f"[KB-SNAPSHOT] Regimi divergenti      : {len(result['conflict_mismatches'])}")
+        print("✅ Snapshot coerente con la KB live." if result['consistent'] else "❌ Snapshot NON coerente.")
+        sys.exit(0 if result['consistent'] else 1)
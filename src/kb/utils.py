@@ -1,6 +1,7 @@
 # File: src/kb/utils.py
 import os
 import re
+import pandas as pd
 
 def to_prolog_atom(text: str) -> str:
     """
@@ -40,6 +41,37 @@ def to_prolog_atom(text: str) -> str:
     return text
 
 
+def to_prolog_atoms(texts: pd.Series) -> pd.Series:
+    """
+    Versione vettorizzata di `to_prolog_atom` per intere colonne di testo.
+
+    Applica le stesse trasformazioni (minuscolo, underscore, filtro dei
+    caratteri, prefisso 'a_') tramite lo `.str` accessor di pandas, evitando
+    una chiamata Python per riga. Le colonne vengono elaborate come `object`
+    per usare il motore `re` di Python e ottenere risultati identici alla
+    versione scalare (anche per gli spazi Unicode in `\\s`).
+
+    Args:
+        texts (pd.Series): Serie di stringhe da convertire. I valori non
+            stringa vengono trattati come non validi.
+
+    Returns:
+        pd.Series: Serie di atomi Prolog con lo stesso indice dell'input;
+            "unknown" per i valori non validi.
+    """
+    is_text = texts.map(lambda v: isinstance(v, str))
+    atoms = texts.where(is_text).astype(object)
+
+    atoms = atoms.str.strip().str.lower()
+    atoms = atoms.str.replace(r'[\s\-]+', '_', regex=True)
+    atoms = atoms.str.replace(r'[^a-z0-9_]', '', regex=True)
+    atoms = atoms.fillna('')
+
+    needs_prefix = atoms.str.match(r'[0-9_]')
+    atoms = atoms.mask(needs_prefix, 'a_' + atoms)
+    return atoms.mask(atoms == '', 'unknown')
+
+
 class ProjectConfig:
     """
     Contenitore centralizzato per la configurazione dei percorsi di sistema.
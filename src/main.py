@@ -1,26 +1,30 @@
 # File: src/main.py
 
 import argparse
+import json
 import sys
 import os
+import contextlib
 
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from src.sss.search import TherapyOptimizer
+from src.kb.atoms import get_atom_registry
+from src.metrics import get_metrics, profiled
 
-def format_disease_names(optimizer: TherapyOptimizer, disease_atoms: set) -> str:
+def format_disease_names(disease_atoms: set) -> str:
     """
     Traduce un insieme di atomi Prolog (es. 'coronary_artery_disease') nei 
     rispettivi nomi originali formattati (es. 'Coronary artery disease').
     
     Args:
-        optimizer (TherapyOptimizer): L'istanza dell'ottimizzatore contenente il mapping.
         disease_atoms (set): L'insieme degli atomi delle patologie coperte dal farmaco.
         
     Returns:
         str: Una stringa leggibile con le patologie separate da virgola.
     """
-    real_names = [optimizer.ai._get_original_name(d) for d in disease_atoms]
+    atoms = get_atom_registry()
+    real_names = [atoms.original_name(d) for d in disease_atoms]
     return ", ".join(sorted(real_names))
 
 def main():
@@ -36,6 +40,14 @@ def main():
     parser.add_argument("--sex", type=str, choices=['M', 'F'], default='M', help="Sesso del paziente (M/F)")
     parser.add_argument("--conditions", type=str, default="none", help="Patologie pregresse/concomitanti (separate da virgola)")
     parser.add_argument("--treat", type=str, required=True, help="Patologie target da curare (separate da virgola)")
+    parser.add_argument("--kb", type=str, choices=['prolog', 'snapshot'], default='prolog',
+                        help="Backend della Knowledge Base: T-Box live (prolog) o snapshot compilato (snapshot)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Thread per la valutazione parallela delle penalità ML/BN dei successori (default: 1)")
+    parser.add_argument("--stats", type=str, nargs='?', const='-', default=None,
+                        help="Salva le metriche della ricerca in JSON nel file indicato (senza file: stampa su stdout)")
+    parser.add_argument("--profile", type=str, default=None,
+                        help="Salva il profilo cProfile della ricerca (pstats) nel file indicato, più un riepilogo .txt")
 
     args = parser.parse_args()
 
@@ -58,8 +70,14 @@ def main():
     print(f" [🎯] Target   : {', '.join(diseases_to_treat)}")
     print("-" * 70)
 
-    optimizer = TherapyOptimizer()
-    solution_node = optimizer.solve(patient_profile, diseases_to_treat)
+    metrics = get_metrics()
+    if args.stats:
+        metrics.enable()
+
+    optimizer = TherapyOptimizer(kb_backend=args.kb, workers=args.workers)
+    with profiled(args.profile) if args.profile else contextlib.nullcontext():
+        solution_node = optimizer.solve(patient_profile, diseases_to_treat)
+    optimizer.close()
 
     print("\n" + "="*70)
     if solution_node:
@@ -69,8 +87,8 @@ def main():
         print("-" * 70)
         
         for drug_atom, disease_atoms in solution_node.selected_drugs.items():
-            real_drug_name = optimizer.ai._get_original_name(drug_atom)
-            real_diseases_str = format_disease_names(optimizer, disease_atoms)
+            real_drug_name = optimizer.atoms.original_name(drug_atom)
+            real_diseases_str = format_disease_names(disease_atoms)
             multi_target_flag = " ⭐ [MULTI]" if len(disease_atoms) > 1 else ""
             print(f" {real_drug_name[:25]:<25} | {real_diseases_str}{multi_target_flag}")
             
@@ -84,5 +102,17 @@ def main():
         print("    i vincoli di sicurezza (hard constraints) per tutte le malattie.")
         print("="*70 + "\n")
 
+    if args.profile:
+        print(f"[PROFILE] Profilo della ricerca salvato in {args.profile} (riepilogo: {args.profile}.txt)")
+
+    if args.stats:
+        report = {'solve': optimizer.stats, **metrics.snapshot()}
+        if args.stats == '-':
+            print(json.dumps(report, indent=2))
+        else:
+            with open(args.stats, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2)
+            print(f"[STATS] Metriche salvate in {args.stats}")
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
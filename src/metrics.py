@@ -0,0 +1,164 @@
+# File: src/metrics.py
+
+"""
+Strato di metriche dei percorsi caldi (ricerca A*, Knowledge Base, modelli).
+
+Un unico registro per processo (`get_metrics`) raccoglie:
+
+  - contatori (`incr`): nodi, query Prolog, chiamate ai modelli, hit/miss
+    delle cache;
+  - timer (`timed`, `observe`): numero di chiamate, tempo totale e massimo;
+  - gauge (`gauge_max`): valori di picco, es. la dimensione dell'heap.
+
+Il registro è disabilitato per default. Da disabilitato ogni punto di misura
+si riduce alla lettura di un attributo booleano: i metodi decorati con
+`timed` chiamano direttamente la funzione originale e i contatori nei cicli
+caldi sono protetti da `if metrics.enabled`. La CLI lo abilita con `--stats`.
+
+Esempio:
+    metrics = get_metrics()
+    metrics.enable()
+    ...
+    print(json.dumps(metrics.snapshot(), indent=2))
+"""
+
+import time
+import cProfile
+import pstats
+import functools
+import threading
+import contextlib
+from collections import defaultdict
+
+
+class Metrics:
+    """
+    Registro di contatori, timer e gauge.
+
+    Gli aggiornamenti sono protetti da un lock, così che il registro possa
+    essere condiviso dai thread (es. le query servite da un `PrologEnginePool`).
+
+    Attributes:
+        enabled (bool): Se False i punti di misura non registrano nulla.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self._lock = threading.Lock()
+        self.reset()
+
+    def enable(self) -> None:
+        self.enabled = True
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def reset(self) -> None:
+        """Azzera tutte le misure raccolte."""
+        with self._lock:
+            self._counters = defaultdict(int)
+            self._timers = defaultdict(lambda: [0, 0.0, 0.0])  # chiamate, totale, massimo
+            self._gauges = {}
+
+    def incr(self, name: str, n: int = 1) -> None:
+        """Incrementa il contatore `name` di `n`."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._counters[name] += n
+
+    def observe(self, name: str, seconds: float) -> None:
+        """Registra una durata per il timer `name`."""
+        if not self.enabled:
+            return
+        with self._lock:
+            timer = self._timers[name]
+            timer[0] += 1
+            timer[1] += seconds
+            if seconds > timer[2]:
+                timer[2] = seconds
+
+    def gauge_max(self, name: str, value: float) -> None:
+        """Conserva il valore massimo osservato per la gauge `name`."""
+        if not self.enabled:
+            return
+        with self._lock:
+            if value > self._gauges.get(name, float('-inf')):
+                self._gauges[name] = value
+
+    def timed(self, name: str):
+        """
+        Decoratore che misura numero di chiamate e durata di una funzione.
+
+        Args:
+            name (str): Nome del timer (es. 'kb.query.approved_for').
+        """
+        def decorator(fn):
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return fn(*args, **kwargs)
+                start = time.perf_counter()
+                try:
+                    return fn(*args, **kwargs)
+                finally:
+                    self.observe(name, time.perf_counter() - start)
+            return wrapper
+        return decorator
+
+    def snapshot(self) -> dict:
+        """
+        Restituisce le misure raccolte in forma serializzabile in JSON.
+
+        Returns:
+            dict: {'counters': {...}, 'timers': {nome: {calls, total_ms,
+                mean_ms, max_ms}}, 'gauges': {...}}.
+        """
+        with self._lock:
+            timers = {
+                name: {
+                    'calls': calls,
+                    'total_ms': round(total * 1000, 3),
+                    'mean_ms': round(total * 1000 / calls, 4) if calls else 0.0,
+                    'max_ms': round(peak * 1000, 3)
+                }
+                for name, (calls, total, peak) in sorted(self._timers.items())
+            }
+            return {
+                'counters': dict(sorted(self._counters.items())),
+                'timers': timers,
+                'gauges': dict(sorted(self._gauges.items()))
+            }
+
+
+@contextlib.contextmanager
+def profiled(path: str, top: int = 25):
+    """
+    Esegue il blocco sotto cProfile e ne salva le statistiche.
+
+    Scrive in `path` il dump binario di pstats (leggibile con
+    `python -m pstats` o snakeviz) e in `path + '.txt'` le `top` funzioni
+    ordinate per tempo cumulativo.
+
+    Args:
+        path (str): File di output del profilo.
+        top (int): Righe del riepilogo testuale.
+    """
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield profiler
+    finally:
+        profiler.disable()
+        profiler.dump_stats(path)
+        with open(path + ".txt", 'w', encoding='utf-8') as f:
+            stats = pstats.Stats(profiler, stream=f)
+            stats.sort_stats('cumulative').print_stats(top)
+
+
+_metrics = Metrics()
+
+
+def get_metrics() -> Metrics:
+    """Restituisce il registro delle metriche condiviso dal processo."""
+    return _metrics
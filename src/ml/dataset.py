@@ -0,0 +1,276 @@
+# File: src/ml/dataset.py
+
+"""
+Lettura a blocchi del dataset FAERS condivisa dai moduli di addestramento.
+
+Il CSV viene letto una sola volta, a blocchi di dimensione fissa, e ogni
+blocco viene passato a uno o più "sink" che ne accumulano il contenuto:
+la tabella di contingenza della Rete Bayesiana (`GroupCountSink`) e la
+matrice delle feature del Random Forest, scritta su disco e riletta come
+memory-map (`FeatureMatrixSink`). La memoria occupata dipende dalla
+dimensione del blocco e non dal numero di righe del dataset.
+
+Un sink è un qualsiasi oggetto con i metodi `update(chunk)`, chiamato per
+ogni blocco, e `finalize()`, chiamato al termine della lettura.
+"""
+
+import os
+import json
+import hashlib
+import numpy as np
+import pandas as pd
+from sklearn.preprocessing import LabelEncoder
+
+DEFAULT_CHUNK_SIZE = 250_000
+
+
+def dataset_sha256(path: str) -> str:
+    """
+    Calcola l'hash SHA-256 di un file, leggendolo a blocchi.
+
+    Args:
+        path (str): Percorso del file.
+
+    Returns:
+        str: L'hash esadecimale.
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class FaersChunkReader:
+    """
+    Lettore a blocchi del CSV FAERS.
+
+    Attributes:
+        path (str): Percorso del CSV.
+        columns (list[str]): Colonne da leggere (tutte le altre sono ignorate).
+        chunksize (int): Righe per blocco.
+        dtype (dict): Dtype delle colonne, passati a `pd.read_csv`.
+        rows_read (int): Righe lette dall'ultima passata.
+    """
+
+    def __init__(self, path: str, columns: list, chunksize: int = DEFAULT_CHUNK_SIZE, dtype: dict = None):
+        """
+        Args:
+            path (str): Percorso del CSV.
+            columns (list[str]): Colonne necessarie ai sink.
+            chunksize (int): Righe per blocco.
+            dtype (dict, optional): Dtype delle colonne.
+        """
+        self.path = path
+        self.columns = list(columns)
+        self.chunksize = chunksize
+        self.dtype = dtype
+        self.rows_read = 0
+
+    def __iter__(self):
+        """Restituisce i blocchi del CSV come DataFrame."""
+        self.rows_read = 0
+        reader = pd.read_csv(self.path, usecols=self.columns, dtype=self.dtype, chunksize=self.chunksize)
+        for chunk in reader:
+            self.rows_read += len(chunk)
+            yield chunk
+
+    def consume(self, *sinks) -> int:
+        """
+        Esegue una passata sul CSV alimentando tutti i sink.
+
+        Args:
+            *sinks: Oggetti con i metodi `update(chunk)` e `finalize()`.
+
+        Returns:
+            int: Numero di righe lette.
+        """
+        for chunk in self:
+            for sink in sinks:
+                sink.update(chunk)
+        for sink in sinks:
+            sink.finalize()
+        return self.rows_read
+
+
+class GroupCountSink:
+    """
+    Accumula i conteggi delle configurazioni di un insieme di colonne discrete.
+
+    Attributes:
+        by (list[str]): Colonne su cui raggruppare.
+        transform (callable): Funzione applicata a ogni blocco prima del conteggio
+            (es. la discretizzazione della Rete Bayesiana).
+        columns (list[str]): Colonne del CSV richieste da `transform`, da
+            includere nella lettura quando il sink condivide la passata con altri.
+        table (pd.DataFrame): Dopo `finalize()`, una riga per configurazione
+            osservata con la colonna `_weight` dei conteggi.
+    """
+
+    def __init__(self, by: list, transform=None, columns: list = None):
+        """
+        Args:
+            by (list[str]): Colonne su cui raggruppare.
+            transform (callable, optional): Trasformazione DataFrame → DataFrame
+                applicata a ogni blocco.
+            columns (list[str], optional): Colonne del CSV richieste. Default: `by`.
+        """
+        self.by = list(by)
+        self.transform = transform
+        self.columns = list(columns) if columns is not None else list(by)
+        self.table = None
+        self._counts = None
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        """Aggiunge i conteggi di un blocco."""
+        if self.transform is not None:
+            chunk = self.transform(chunk)
+        counts = chunk.groupby(self.by, observed=True).size()
+        self._counts = counts if self._counts is None else self._counts.add(counts, fill_value=0)
+
+    def finalize(self) -> None:
+        """Costruisce la tabella dei conteggi, con colonne categoriali."""
+        if self._counts is None:
+            self.table = pd.DataFrame(columns=self.by + ['_weight'])
+            return
+        counts = self._counts
+        table = counts[counts > 0].astype('int64').rename('_weight').reset_index()
+        for col in self.by:
+            table[col] = table[col].astype(str).astype('category')
+        self.table = table
+
+
+class FeatureMatrixSink:
+    """
+    Codifica le feature e le scrive su disco come matrice float32 memory-mappable.
+
+    Durante la lettura le categorie ricevono un codice provvisorio, nell'ordine
+    di prima apparizione, mantenuto da un vocabolario incrementale (solo i
+    valori distinti risiedono in memoria). Al termine i codici vengono
+    rimappati, a blocchi, sull'ordinamento lessicografico di `LabelEncoder`:
+    matrice ed encoder sono identici a quelli di `LabelEncoder.fit_transform`
+    applicato all'intera colonna.
+
+    Nella directory di output vengono scritti `X.f32` (righe × feature,
+    float32), `y.i8` (target, int8) e `meta.json` (forma, colonne, classi
+    degli encoder e metadati forniti dal chiamante).
+
+    Attributes:
+        output_dir (str): Directory degli artefatti.
+        feature_cols (list[str]): Colonne della matrice, nell'ordine.
+        categorical_cols (list[str]): Colonne da codificare.
+        target_col (str): Colonna del target.
+        encoders (dict): Dopo `finalize()`, i LabelEncoder per colonna.
+    """
+
+    def __init__(self, output_dir: str, feature_cols: list, categorical_cols: list,
+                 target_col: str, metadata: dict = None):
+        """
+        Args:
+            output_dir (str): Directory degli artefatti (creata se assente).
+            feature_cols (list[str]): Colonne della matrice.
+            categorical_cols (list[str]): Sottoinsieme categoriale di `feature_cols`.
+            target_col (str): Colonna del target.
+            metadata (dict, optional): Informazioni aggiuntive salvate in `meta.json`
+                (es. l'hash del CSV sorgente).
+        """
+        self.output_dir = output_dir
+        self.feature_cols = list(feature_cols)
+        self.categorical_cols = list(categorical_cols)
+        self.target_col = target_col
+        self.metadata = metadata or {}
+        self.encoders = {}
+
+        self._vocab = {col: {} for col in self.categorical_cols}
+        self._rows = 0
+        os.makedirs(output_dir, exist_ok=True)
+        self._x_file = open(os.path.join(output_dir, "X.f32.tmp"), 'wb')
+        self._y_file = open(os.path.join(output_dir, "y.i8.tmp"), 'wb')
+
+    def _provisional_codes(self, col: str, values: pd.Series) -> np.ndarray:
+        """Codifica un blocco con il vocabolario incrementale della colonna."""
+        codes, uniques = pd.factorize(values.fillna('Unknown').astype(str), sort=False)
+        vocab = self._vocab[col]
+        lookup = np.fromiter((vocab.setdefault(u, len(vocab)) for u in uniques),
+                             dtype=np.int64, count=len(uniques))
+        return lookup[codes]
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        """Codifica un blocco e ne accoda le righe ai file della matrice."""
+        block = np.empty((len(chunk), len(self.feature_cols)), dtype=np.float32)
+        for j, col in enumerate(self.feature_cols):
+            if col in self.categorical_cols:
+                block[:, j] = self._provisional_codes(col, chunk[col])
+            else:
+                block[:, j] = chunk[col].to_numpy(dtype=np.float32)
+
+        self._x_file.write(block.tobytes())
+        self._y_file.write(chunk[self.target_col].to_numpy(dtype=np.int8).tobytes())
+        self._rows += len(chunk)
+
+    def finalize(self) -> None:
+        """Rimappa i codici sull'ordine di LabelEncoder e scrive i metadati."""
+        self._x_file.close()
+        self._y_file.close()
+
+        remaps = {}
+        for col in self.categorical_cols:
+            vocab = self._vocab[col]
+            le = LabelEncoder()
+            le.classes_ = np.array(sorted(vocab), dtype=object)
+            remap = np.empty(len(vocab), dtype=np.float32)
+            remap[list(vocab.values())] = np.searchsorted(le.classes_.astype(str), np.array(list(vocab), dtype=str))
+            remaps[self.feature_cols.index(col)] = remap
+            self.encoders[col] = le
+
+        x_tmp = os.path.join(self.output_dir, "X.f32.tmp")
+        if self._rows:
+            matrix = np.memmap(x_tmp, dtype=np.float32, mode='r+', shape=(self._rows, len(self.feature_cols)))
+            for start in range(0, self._rows, DEFAULT_CHUNK_SIZE):
+                block = matrix[start:start + DEFAULT_CHUNK_SIZE]
+                for j, remap in remaps.items():
+                    block[:, j] = remap[block[:, j].astype(np.int64)]
+            matrix.flush()
+            del matrix
+
+        os.replace(x_tmp, os.path.join(self.output_dir, "X.f32"))
+        os.replace(os.path.join(self.output_dir, "y.i8.tmp"), os.path.join(self.output_dir, "y.i8"))
+
+        meta = dict(self.metadata)
+        meta.update({
+            'rows': self._rows,
+            'feature_cols': self.feature_cols,
+            'target_col': self.target_col,
+            'classes': {col: le.classes_.tolist() for col, le in self.encoders.items()}
+        })
+        with open(os.path.join(self.output_dir, "meta.json"), 'w', encoding='utf-8') as f:
+            json.dump(meta, f, ensure_ascii=False)
+
+
+def load_feature_matrix(output_dir: str):
+    """
+    Apre come memory-map la matrice scritta da `FeatureMatrixSink`.
+
+    Args:
+        output_dir (str): Directory degli artefatti.
+
+    Returns:
+        tuple | None: (X memmap float32, y memmap int8, dict degli encoder,
+            metadati) oppure None se gli artefatti non sono presenti.
+    """
+    meta_path = os.path.join(output_dir, "meta.json")
+    if not os.path.exists(meta_path):
+        return None
+    with open(meta_path, 'r', encoding='utf-8') as f:
+        meta = json.load(f)
+
+    shape = (meta['rows'], len(meta['feature_cols']))
+    X = np.memmap(os.path.join(output_dir, "X.f32"), dtype=np.float32, mode='r', shape=shape)
+    y = np.memmap(os.path.join(output_dir, "y.i8"), dtype=np.int8, mode='r', shape=(meta['rows'],))
+
+    encoders = {}
+    for col, classes in meta['classes'].items():
+        le = LabelEncoder()
+        le.classes_ = np.array(classes, dtype=object)
+        encoders[col] = le
+    return X, y, encoders, meta
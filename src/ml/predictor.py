@@ -4,12 +4,27 @@
 Modulo di Inferenza in Real-Time.
 Carica in memoria i modelli serializzati e fornisce le predizioni probabilistiche
 sul rischio di reazione avversa durante l'esplorazione dell'algoritmo A*.
+
+Oltre all'inferenza puntuale (`predict_risk`) è disponibile quella di coorte
+(`predict_risk_matrix`), che valuta N pazienti × M farmaci con codifica
+vettoriale e a blocchi di dimensione limitata.
 """
 
 import os
+import sys
+import numpy as np
 import pandas as pd
 import joblib
 
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from src.metrics import get_metrics
+
+metrics = get_metrics()
+
+FEATURE_COLS = ['AGE', 'SEX', 'WEIGHT', 'DRUG_NAME', 'CONCOMITANT']
+
+
 class RiskPredictor:
     """
     Gestisce l'istanza del Random Forest addestrato e applica la medesima 
@@ -26,6 +41,7 @@ class RiskPredictor:
         
         self.model = None
         self.encoders = {}
+        self._splits = None
         
         self.load_artifacts()
 
@@ -40,10 +56,30 @@ class RiskPredictor:
             print(f"[ML-ERROR] Artifacts non trovati in {self.model_dir}. Eseguire prima il training.")
             return False
             
-        self.model = joblib.load(self.model_path)
-        self.encoders = joblib.load(self.encoder_path)
+        self.install(*self.read_artifacts())
         return True
 
+    def read_artifacts(self) -> tuple:
+        """
+        Legge da disco modello ed encoder senza sostituire quelli in uso.
+
+        Returns:
+            tuple: (modello, dizionario degli encoder).
+        """
+        return joblib.load(self.model_path), joblib.load(self.encoder_path)
+
+    def install(self, model, encoders: dict) -> None:
+        """
+        Sostituisce modello ed encoder in uso (es. dopo un riaddestramento).
+
+        Args:
+            model: Il classificatore letto da `read_artifacts`.
+            encoders (dict): Gli encoder associati al modello.
+        """
+        self.model, self.encoders = model, encoders
+        self._splits = None
+
+    @metrics.timed('ml.predict_risk')
     def predict_risk(self, age: float, sex: str, weight: float, drug_name: str, concomitant: list) -> float:
         """
         Esegue un'inferenza probabilistica sul rischio di effetti avversi per
@@ -94,6 +130,7 @@ class RiskPredictor:
                 else:
                     input_data[col] = 0
                     
+            metrics.incr('ml.predict_proba_rows')
             try:
                 risk_prob = self.model.predict_proba(input_data)[0][1]
                 if risk_prob > max_risk:
@@ -101,4 +138,203 @@ class RiskPredictor:
             except Exception as e:
                 print(f"[ML-WARN] Fallimento inferenza sul nodo: {e}")
                 
-        return max_risk if max_risk > 0.0 else 0.5
\ No newline at end of file
+        return max_risk if max_risk > 0.0 else 0.5
+
+    def profile_key(self, age: float, sex: str, weight: float, concomitant: list) -> tuple:
+        """
+        Restituisce la forma discretizzata degli input del paziente letti dal
+        Random Forest: a parità di farmaco, due profili con la stessa chiave
+        ricevono da `predict_risk` lo stesso rischio.
+
+        Età e peso sono sostituiti dall'intervallo tra due soglie di split
+        consecutive della foresta (i valori nello stesso intervallo percorrono
+        gli stessi rami in ogni albero), sesso e comorbidità dal codice
+        dell'encoder (le voci fuori vocabolario condividono la classe zero).
+        Le comorbidità formano un insieme, perché `predict_risk` ne prende il
+        rischio massimo.
+
+        Args:
+            age (float): Età del paziente.
+            sex (str): Sesso biologico.
+            weight (float): Peso corporeo in Kg.
+            concomitant (list): Lista di patologie o farmaci assunti dal paziente.
+
+        Returns:
+            tuple: Chiave hashable del profilo; vuota in assenza del modello,
+                quando `predict_risk` restituisce sempre 0.5.
+        """
+        if not self.model:
+            return ()
+        splits = self._split_points()
+        conc_codes = self._encode('CONCOMITANT', [c.strip() for c in self._concomitant_list(concomitant)])
+        return (
+            self._bin(age, splits.get('AGE')),
+            int(self._encode('SEX', [sex])[0]),
+            self._bin(weight, splits.get('WEIGHT')),
+            tuple(sorted({int(c) for c in conc_codes}))
+        )
+
+    def _split_points(self) -> dict:
+        """
+        Soglie di split della foresta su età e peso, calcolate una volta per modello.
+
+        Per un modello che non espone gli alberi (`estimators_[i].tree_`) il
+        dizionario è vuoto e `profile_key` usa i valori esatti.
+        """
+        if self._splits is None:
+            splits = {}
+            trees = [getattr(est, 'tree_', None) for est in getattr(self.model, 'estimators_', [])]
+            if trees and all(tree is not None for tree in trees):
+                for col in ('AGE', 'WEIGHT'):
+                    idx = FEATURE_COLS.index(col)
+                    splits[col] = np.unique(np.concatenate([t.threshold[t.feature == idx] for t in trees]))
+            self._splits = splits
+        return self._splits
+
+    @staticmethod
+    def _bin(value: float, points: np.ndarray):
+        """
+        Indice dell'intervallo di `value` tra le soglie `points`.
+
+        Gli alberi confrontano l'input convertito in float32 con `x <= soglia`:
+        il numero di soglie strettamente minori del valore determina quindi
+        l'esito di ogni confronto.
+        """
+        value = np.float32(value)
+        if points is None:
+            return float(value)
+        return int(np.searchsorted(points, value, side='left'))
+
+    @staticmethod
+    def _concomitant_list(concomitant) -> list:
+        """
+        Normalizza l'anamnesi di un paziente come in `predict_risk`.
+
+        Nelle coorti colonnari (es. una colonna pandas) le anamnesi mancanti
+        arrivano come NaN o None: ogni valore che non sia una stringa o una
+        lista viene trattato come anamnesi vuota, e le voci non testuali
+        vengono scartate.
+        """
+        if isinstance(concomitant, str):
+            return [concomitant]
+        if not pd.api.types.is_list_like(concomitant):
+            return ['none']
+        return [c for c in concomitant if isinstance(c, str)] or ['none']
+
+    def _encode(self, col: str, values) -> np.ndarray:
+        """
+        Codifica un array di valori con il LabelEncoder della colonna.
+
+        Applica lo stesso fallback Out-Of-Vocabulary di `predict_risk`: i valori
+        sconosciuti (o l'assenza dell'encoder) ricevono la classe zero.
+        """
+        values = [str(v) for v in values]
+        le = self.encoders.get(col)
+        if not le:
+            return np.zeros(len(values), dtype=np.float32)
+        codes = pd.Index(le.classes_).get_indexer(values)
+        codes[codes < 0] = 0
+        return codes.astype(np.float32)
+
+    def _score_rows(self, rows: np.ndarray, drug_codes: np.ndarray, max_batch_rows: int) -> np.ndarray:
+        """
+        Valuta il Random Forest sul prodotto cartesiano righe paziente × farmaci.
+
+        Args:
+            rows (np.ndarray): Matrice (U, 4) con AGE, SEX, WEIGHT, CONCOMITANT codificati.
+            drug_codes (np.ndarray): Codici dei farmaci (M,).
+            max_batch_rows (int): Righe massime per chiamata a `predict_proba`.
+
+        Returns:
+            np.ndarray: Matrice (U, M) float32 delle probabilità; 0.0 dove
+                l'inferenza è fallita.
+        """
+        n_rows, n_drugs = len(rows), len(drug_codes)
+        risk = np.zeros((n_rows, n_drugs), dtype=np.float32)
+        drugs_per_batch = min(n_drugs, max_batch_rows)
+        rows_per_batch = max(1, max_batch_rows // drugs_per_batch)
+
+        for d0 in range(0, n_drugs, drugs_per_batch):
+            drugs = drug_codes[d0:d0 + drugs_per_batch]
+            for r0 in range(0, n_rows, rows_per_batch):
+                block = rows[r0:r0 + rows_per_batch]
+                X = np.empty((len(block) * len(drugs), len(FEATURE_COLS)), dtype=np.float32)
+                X[:, [0, 1, 2, 4]] = np.repeat(block, len(drugs), axis=0)
+                X[:, 3] = np.tile(drugs, len(block))
+
+                metrics.incr('ml.predict_proba_rows', len(X))
+                try:
+                    proba = self.model.predict_proba(pd.DataFrame(X, columns=FEATURE_COLS, copy=False))[:, 1]
+                except Exception as e:
+                    print(f"[ML-WARN] Fallimento inferenza sul blocco: {e}")
+                    continue
+                risk[r0:r0 + len(block), d0:d0 + len(drugs)] = proba.reshape(len(block), len(drugs))
+        return risk
+
+    @metrics.timed('ml.predict_risk_matrix')
+    def predict_risk_matrix(self, age, sex, weight, concomitant, drug_names: list,
+                            block_patients: int = 4096, max_batch_rows: int = 262_144,
+                            out: np.ndarray = None) -> np.ndarray:
+        """
+        Calcola il rischio di reazione avversa per una coorte di pazienti e una lista di farmaci.
+
+        È l'equivalente vettoriale di `predict_risk` applicato a ogni coppia
+        (paziente, farmaco): per ogni paziente viene restituito il rischio
+        massimo sulle sue comorbidità e 0.5 quando il massimo è nullo.
+
+        I pazienti sono elaborati a blocchi di `block_patients`: all'interno di
+        un blocco le righe (età, sesso, peso, comorbidità) identiche vengono
+        valutate una sola volta, e il Random Forest riceve al più
+        `max_batch_rows` righe per chiamata. La memoria di lavoro dipende quindi
+        dalla dimensione dei blocchi e non da N; l'unica struttura di dimensione
+        N × M è la matrice di output, che può essere preallocata dal chiamante
+        (es. un `np.memmap`).
+
+        Args:
+            age (array-like): Età dei pazienti (N,).
+            sex (array-like): Sesso biologico dei pazienti (N,).
+            weight (array-like): Peso corporeo in Kg (N,).
+            concomitant (array-like): Per ogni paziente, lista (o stringa) delle
+                patologie o dei farmaci assunti.
+            drug_names (list[str]): Molecole da valutare (M), con i nomi originali.
+            block_patients (int): Pazienti per blocco.
+            max_batch_rows (int): Righe massime per chiamata a `predict_proba`.
+            out (np.ndarray, optional): Matrice (N, M) in cui scrivere il risultato.
+
+        Returns:
+            np.ndarray: Matrice (N, M) float32 delle probabilità di reazione avversa.
+        """
+        n_patients, n_drugs = len(age), len(drug_names)
+        if out is None:
+            out = np.empty((n_patients, n_drugs), dtype=np.float32)
+        if not self.model:
+            out[:] = 0.5
+            return out
+        if not n_patients or not n_drugs:
+            return out
+
+        age = np.asarray(age, dtype=np.float32)
+        weight = np.asarray(weight, dtype=np.float32)
+        sex_codes = self._encode('SEX', sex)
+        drug_codes = self._encode('DRUG_NAME', drug_names)
+
+        # Una riga per coppia (paziente, comorbidità), nell'ordine dei pazienti
+        conc_lists = [self._concomitant_list(c) for c in concomitant]
+        counts = np.fromiter((len(c) for c in conc_lists), dtype=np.int64, count=n_patients)
+        conc_codes = self._encode('CONCOMITANT', (c.strip() for cs in conc_lists for c in cs))
+        row_patient = np.repeat(np.arange(n_patients), counts)
+        row_start = np.concatenate(([0], np.cumsum(counts)))
+
+        for p0 in range(0, n_patients, block_patients):
+            p1 = min(p0 + block_patients, n_patients)
+            r0, r1 = row_start[p0], row_start[p1]
+            idx = row_patient[r0:r1]
+            rows = np.column_stack((age[idx], sex_codes[idx], weight[idx], conc_codes[r0:r1]))
+            unique_rows, inverse = np.unique(rows, axis=0, return_inverse=True)
+
+            risk = self._score_rows(unique_rows, drug_codes, max_batch_rows)
+            block = np.maximum.reduceat(risk[inverse.ravel()], row_start[p0:p1] - r0, axis=0)
+            block[block <= 0.0] = 0.5
+            out[p0:p1] = block
+
+        return out
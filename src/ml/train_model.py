@@ -10,10 +10,20 @@ Output generati automaticamente in SafeTherapy/docs/:
   plots/rf_metrics_boxplot.png    — boxplot distribuzione metriche
   plots/rf_feature_importances.png — importanze delle feature
   metrics/rf_evaluation_report.json — report completo di valutazione
+
+Il dataset viene letto a blocchi (solo le colonne necessarie) e la matrice
+delle feature codificata viene scritta su disco e usata come memory-map,
+riutilizzata finché il CSV non cambia.
 """
 
 import os
 import json
+import sys
+import time
+import pickle
+import argparse
+import tracemalloc
+from collections import Counter
 import pandas as pd
 import numpy as np
 import joblib
@@ -21,14 +31,155 @@ import matplotlib.pyplot as plt
 import matplotlib.ticker as mticker
 import seaborn as sns
 from tqdm import tqdm
+from joblib import Parallel, delayed
 from sklearn.ensemble import RandomForestClassifier
-from sklearn.model_selection import StratifiedKFold, GridSearchCV
-from sklearn.preprocessing import LabelEncoder
+from sklearn.experimental import enable_halving_search_cv  # noqa: F401
+from sklearn.model_selection import (
+    StratifiedKFold, GridSearchCV, HalvingGridSearchCV, ParameterGrid, train_test_split
+)
 from sklearn.metrics import precision_score, recall_score, f1_score, accuracy_score
 
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from src.ml.dataset import FaersChunkReader, FeatureMatrixSink, dataset_sha256, load_feature_matrix
+
 sns.set_theme(style="whitegrid", palette="muted")
 PLOT_DPI = 150
 
+FEATURE_COLS = ['AGE', 'SEX', 'WEIGHT', 'DRUG_NAME', 'CONCOMITANT']
+CATEGORICAL_COLS = ['SEX', 'DRUG_NAME', 'CONCOMITANT']
+TARGET_COL = 'TARGET'
+FEATURE_CACHE_VERSION = 2
+
+SEARCH_STRATEGIES = {
+    'grid': 'GridSearchCV',
+    'halving': 'HalvingGridSearchCV (successive halving)'
+}
+
+
+def _evaluate_outer_fold(fold: int, X: np.ndarray, y: np.ndarray, train_idx, test_idx,
+                         param_grid: dict, inner_cv, search: str, inner_jobs: int) -> dict:
+    """
+    Esegue la ricerca degli iperparametri e la valutazione di un fold esterno.
+
+    È una funzione di modulo (e non un metodo) perché viene eseguita nei
+    processi worker di joblib. I Random Forest sono a thread singolo: il
+    parallelismo è interamente gestito dalla ricerca interna (`inner_jobs`).
+
+    Args:
+        fold (int): Indice del fold esterno (0-based).
+        X (np.ndarray): Matrice delle feature dell'intero dataset.
+        y (np.ndarray): Target dell'intero dataset.
+        train_idx (np.ndarray): Indici di training del fold.
+        test_idx (np.ndarray): Indici di test del fold.
+        param_grid (dict): Griglia degli iperparametri.
+        inner_cv: Splitter della cross-validation interna.
+        search (str): 'grid' o 'halving'.
+        inner_jobs (int): Job paralleli della ricerca interna.
+
+    Returns:
+        dict: Metriche del fold, iperparametri migliori e durata in secondi.
+    """
+    start = time.perf_counter()
+    rf = RandomForestClassifier(random_state=42, n_jobs=1)
+    if search == 'halving':
+        clf = HalvingGridSearchCV(
+            estimator=rf, param_grid=param_grid, cv=inner_cv, scoring='f1',
+            factor=3, random_state=42, n_jobs=inner_jobs
+        )
+    else:
+        clf = GridSearchCV(
+            estimator=rf, param_grid=param_grid, cv=inner_cv, scoring='f1', n_jobs=inner_jobs
+        )
+    clf.fit(X[train_idx], y[train_idx])
+
+    y_test = y[test_idx]
+    y_pred = clf.predict(X[test_idx])
+
+    return {
+        'fold': fold + 1,
+        'accuracy':    round(accuracy_score(y_test, y_pred), 4),
+        'precision':   round(precision_score(y_test, y_pred, zero_division=0), 4),
+        'recall':      round(recall_score(y_test, y_pred, zero_division=0), 4),
+        'f1':          round(f1_score(y_test, y_pred, zero_division=0), 4),
+        'best_params': {k: v for k, v in clf.best_params_.items() if k != 'class_weight'},
+        'seconds':     round(time.perf_counter() - start, 3)
+    }
+
+
+def _measure_inference(model: RandomForestClassifier, X_probe: pd.DataFrame,
+                       n_single: int = 200) -> dict:
+    """
+    Misura latenza di inferenza e dimensione serializzata di un modello.
+
+    La latenza a riga singola è misurata con DataFrame di una riga, come nelle
+    chiamate di `RiskPredictor` durante la ricerca A*; quella batch con un
+    unico `predict_proba` sull'intero campione di prova.
+
+    Args:
+        model (RandomForestClassifier): Il modello addestrato.
+        X_probe (pd.DataFrame): Campione di righe su cui misurare la latenza.
+        n_single (int): Numero di chiamate a riga singola cronometrate.
+
+    Returns:
+        dict: 'single_row_us' (mediana, µs per chiamata), 'batch_row_us'
+            (µs per riga) e 'model_mb' (dimensione del pickle in MB).
+    """
+    rows = [X_probe.iloc[[i % len(X_probe)]] for i in range(n_single)]
+    model.predict_proba(rows[0])  # warm-up
+
+    single = []
+    for row in rows:
+        start = time.perf_counter()
+        model.predict_proba(row)
+        single.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    model.predict_proba(X_probe)
+    batch = time.perf_counter() - start
+
+    return {
+        'single_row_us': round(float(np.median(single)) * 1e6, 1),
+        'batch_row_us': round(batch / len(X_probe) * 1e6, 2),
+        'model_mb': round(len(pickle.dumps(model, protocol=pickle.HIGHEST_PROTOCOL)) / 2**20, 3)
+    }
+
+
+def _rank_final_params(fold_results: list, profiles: list = None) -> list:
+    """
+    Ordina le configurazioni candidate al refit finale.
+
+    Prima le configurazioni selezionate nei fold esterni: quella scelta dal
+    maggior numero di fold e, a parità, con l'F1 medio più alto sui fold che
+    l'hanno selezionata. Seguono le altre configurazioni ammissibili del
+    profiling, dalla più leggera, usate come ripiego se il modello finale
+    supera i vincoli di latenza e dimensione.
+
+    Args:
+        fold_results (list[dict]): Risultati dei fold esterni.
+        profiles (list[dict], optional): Configurazioni profilate
+            (vedi `RiskModelTrainer.profile_inference`).
+
+    Returns:
+        list[dict]: Iperparametri in ordine di preferenza, senza duplicati.
+    """
+    votes = Counter()
+    f1_by_config = {}
+    for r in fold_results:
+        key = tuple(sorted(r['best_params'].items(), key=lambda kv: kv[0]))
+        votes[key] += 1
+        f1_by_config.setdefault(key, []).append(r['f1'])
+
+    ranked = sorted(votes, key=lambda k: (votes[k], np.mean(f1_by_config[k])), reverse=True)
+    fallback = sorted((p for p in profiles or () if p['feasible']),
+                      key=lambda p: (p['model_mb'], p['single_row_us']))
+    for p in fallback:
+        key = tuple(sorted(p['params'].items(), key=lambda kv: kv[0]))
+        if key not in votes:
+            ranked.append(key)
+            votes[key] = 0
+    return [dict(key) for key in ranked]
+
 
 class RiskModelTrainer:
     """
@@ -49,6 +200,7 @@ class RiskModelTrainer:
         model_path (str): Percorso al modello Random Forest serializzato.
         encoder_path (str): Percorso ai LabelEncoder serializzati.
         report_path (str): Percorso al report JSON di valutazione.
+        feature_cache_dir (str): Directory della matrice delle feature in cache (memory-map).
     """
 
     def __init__(self):
@@ -63,6 +215,102 @@ class RiskModelTrainer:
         self.model_path   = os.path.join(self.model_dir, "rf_risk_model.pkl")
         self.encoder_path = os.path.join(self.model_dir, "label_encoders.pkl")
         self.report_path  = os.path.join(self.docs_metrics_dir, "rf_evaluation_report.json")
+        self.feature_cache_dir = os.path.join(self.model_dir, "faers_features")
+
+    # ------------------------------------------------------------------
+    # CARICAMENTO DATI
+    # ------------------------------------------------------------------
+
+    def feature_sink(self, source_hash: str) -> FeatureMatrixSink:
+        """
+        Crea il sink che scrive la matrice delle feature nella cache su disco.
+
+        Args:
+            source_hash (str): Hash del CSV, registrato nei metadati della cache.
+
+        Returns:
+            FeatureMatrixSink: Il sink da passare a `FaersChunkReader.consume`.
+        """
+        return FeatureMatrixSink(
+            self.feature_cache_dir, FEATURE_COLS, CATEGORICAL_COLS, TARGET_COL,
+            metadata={'version': FEATURE_CACHE_VERSION, 'source_sha256': source_hash}
+        )
+
+    def _read_feature_cache(self, source_hash: str):
+        """
+        Apre la matrice delle feature in cache come memory-map, se valida.
+
+        Args:
+            source_hash (str): Hash del CSV corrente.
+
+        Returns:
+            tuple | None: (matrice, target, encoder) oppure None se la cache
+                manca, è di una versione diversa o è relativa a un altro CSV.
+        """
+        loaded = load_feature_matrix(self.feature_cache_dir)
+        if loaded is None:
+            return None
+        matrix, y, encoders, meta = loaded
+        if meta.get('version') != FEATURE_CACHE_VERSION or meta.get('source_sha256') != source_hash:
+            return None
+        return matrix, y, encoders
+
+    def load_features(self, use_cache: bool = True, extra_sinks: tuple = ()):
+        """
+        Carica il dataset di training come matrice delle feature codificata.
+
+        Il CSV viene letto a blocchi (solo le colonne del modello) da
+        `FaersChunkReader`; `FeatureMatrixSink` codifica ogni blocco e lo scrive
+        su disco, e la matrice risultante viene poi aperta come memory-map:
+        né il CSV né la matrice vengono mai caricati interamente in memoria.
+        Gli encoder sono identici a quelli di `LabelEncoder.fit_transform`.
+
+        Misura tempo di caricamento e picco di memoria allocata (tracemalloc),
+        riportati poi nel report di valutazione.
+
+        Args:
+            use_cache (bool): Se True riusa la matrice in cache quando è coerente
+                con il CSV; se False rilegge sempre il CSV (e rigenera la cache).
+            extra_sinks (tuple): Sink aggiuntivi da alimentare nella stessa
+                passata sul CSV (es. i conteggi della Rete Bayesiana). Se
+                presenti, il CSV viene sempre riletto.
+
+        Returns:
+            tuple: (X DataFrame con le colonne FEATURE_COLS, y Series,
+                dict degli encoder, dict delle statistiche di caricamento).
+        """
+        tracemalloc.start()
+        start = time.perf_counter()
+
+        source_hash = dataset_sha256(self.dataset_path)
+        loaded = self._read_feature_cache(source_hash) if use_cache and not extra_sinks else None
+        source = 'memmap_cache'
+        if loaded is None:
+            source = 'csv'
+            columns = sorted(set(FEATURE_COLS + [TARGET_COL]).union(*(getattr(s, 'columns', ()) for s in extra_sinks)))
+            dtypes = {col: str for col in CATEGORICAL_COLS}
+            reader = FaersChunkReader(self.dataset_path, columns, dtype=dtypes)
+            reader.consume(self.feature_sink(source_hash), *extra_sinks)
+            loaded = self._read_feature_cache(source_hash)
+        matrix, y, encoders = loaded
+
+        X = pd.DataFrame(matrix, columns=FEATURE_COLS, copy=False)
+        y = pd.Series(y, name=TARGET_COL, copy=False)
+
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        stats = {
+            'source': source,
+            'seconds': round(elapsed, 3),
+            'peak_memory_mb': round(peak / 2**20, 2),
+            'feature_matrix_mb': round((matrix.nbytes + y.nbytes) / 2**20, 2),
+            'cache_path': os.path.relpath(self.feature_cache_dir, self.base_dir)
+        }
+        print(f"[ML-TRAINER] Dataset caricato da {source} in {stats['seconds']:.2f} s "
+              f"(picco memoria {stats['peak_memory_mb']:.1f} MB)")
+        return X, y, encoders, stats
 
     # ------------------------------------------------------------------
     # GRAFICI
@@ -175,49 +423,136 @@ class RiskModelTrainer:
     # TRAINING
     # ------------------------------------------------------------------
 
-    def train(self) -> dict:
+    def profile_inference(self, X: pd.DataFrame, y: pd.Series, param_grid: dict,
+                          max_latency_us: float = None, max_model_mb: float = None,
+                          profile_samples: int = 20000, probe_rows: int = 1000) -> list:
+        """
+        Profila il costo di inferenza di ogni configurazione della griglia.
+
+        Ogni configurazione viene addestrata su un sottocampione stratificato
+        di `profile_samples` righe e misurata con `_measure_inference` su
+        `probe_rows` righe disgiunte. Le misure sono indicative: alberi senza
+        limite di profondità addestrati sull'intero dataset risultano più
+        profondi, e quindi più lenti e voluminosi, di quelli del sottocampione.
+
+        Args:
+            X (pd.DataFrame): Matrice delle feature.
+            y (pd.Series): Target.
+            param_grid (dict): Griglia degli iperparametri.
+            max_latency_us (float, optional): Latenza massima a riga singola (µs).
+            max_model_mb (float, optional): Dimensione massima del modello (MB).
+            profile_samples (int): Righe del sottocampione di addestramento.
+            probe_rows (int): Righe usate per misurare la latenza.
+
+        Returns:
+            list[dict]: Per ogni configurazione gli iperparametri ('params'),
+                le misure di latenza e dimensione e il flag 'feasible'
+                rispetto ai vincoli.
+        """
+        train_size = min(profile_samples, len(y) - probe_rows)
+        X_sub, X_probe, y_sub, _ = train_test_split(
+            X, y, train_size=train_size, test_size=probe_rows, stratify=y, random_state=42
+        )
+
+        profiles = []
+        for params in tqdm(list(ParameterGrid(param_grid)), desc="Profiling inferenza", unit="config"):
+            model = RandomForestClassifier(random_state=42, n_jobs=1, **params).fit(X_sub, y_sub)
+            profile = {'params': {k: v for k, v in params.items() if k != 'class_weight'}}
+            profile.update(_measure_inference(model, X_probe))
+            profile['feasible'] = (
+                (max_latency_us is None or profile['single_row_us'] <= max_latency_us) and
+                (max_model_mb is None or profile['model_mb'] <= max_model_mb)
+            )
+            profiles.append(profile)
+        return profiles
+
+    @staticmethod
+    def _log_phase(name: str, start: float) -> float:
+        """
+        Registra la durata di una fase dell'addestramento.
+
+        Args:
+            name (str): Nome della fase.
+            start (float): Istante di inizio (`time.perf_counter()`).
+
+        Returns:
+            float: La durata in secondi, arrotondata al millisecondo.
+        """
+        seconds = round(time.perf_counter() - start, 3)
+        print(f"[ML-TRAINER] Fase '{name}' completata in {seconds:.2f} s")
+        return seconds
+
+    def train(self, use_cache: bool = True, search: str = 'grid', outer_jobs: int = None,
+              max_latency_us: float = None, max_model_mb: float = None,
+              profile_samples: int = 20000, extra_sinks: tuple = ()) -> dict:
         """
         Esegue la pipeline completa di Machine Learning.
 
         Fasi:
-            1. Caricamento e encoding del dataset FAERS.
-            2. Nested Cross-Validation (5 outer, 3 inner fold) con GridSearchCV.
-            3. Calcolo di accuracy, precision, recall e F1 per ciascun fold.
-            4. Refit finale sull'intero dataset.
+            1. Lettura a blocchi e encoding del dataset FAERS (o matrice in cache).
+            2. Solo con dei vincoli: profiling di latenza e dimensione di ogni
+               configurazione della griglia, ristretta poi alle configurazioni
+               che li rispettano ("miglior F1 sotto X µs / Y MB").
+            3. Nested Cross-Validation (5 outer, 3 inner fold) con GridSearchCV
+               o HalvingGridSearchCV; i fold esterni sono eseguiti in parallelo,
+               con il calcolo di accuracy, precision, recall e F1 per ciascun fold.
+            4. Refit finale sull'intero dataset con gli iperparametri già
+               selezionati nei fold esterni (nessuna nuova ricerca a griglia).
+               Con dei vincoli, latenza e dimensione sono rimisurate sul
+               modello finale; se li supera si riaddestra la configurazione
+               successiva (`_rank_final_params`).
             5. Salvataggio modello, encoder, report JSON e grafici.
 
+        I core disponibili vengono ripartiti una sola volta tra i due livelli:
+        `outer_jobs` processi per i fold esterni, ciascuno con
+        `cpu_count // outer_jobs` thread per la ricerca interna, e Random
+        Forest a thread singolo. La durata di ogni fase è registrata nel report.
+
+        Args:
+            use_cache (bool): Se True riusa la matrice delle feature in cache
+                quando il CSV non è cambiato.
+            search (str): Strategia di ricerca interna, 'grid' (GridSearchCV)
+                o 'halving' (HalvingGridSearchCV, successive halving sui campioni).
+            outer_jobs (int, optional): Fold esterni eseguiti in parallelo.
+                Default: min(5, numero di CPU).
+            max_latency_us (float, optional): Vincolo sulla latenza di
+                `predict_proba` a riga singola, in microsecondi.
+            max_model_mb (float, optional): Vincolo sulla dimensione del modello
+                serializzato, in MB.
+            profile_samples (int): Righe usate per addestrare i modelli di
+                profiling (usato solo con `max_latency_us` o `max_model_mb`).
+            extra_sinks (tuple): Sink da alimentare nella stessa passata di
+                lettura del CSV (vedi `load_features`).
+
         Returns:
             dict: Report completo di valutazione, identico a quello salvato
                 su disco in docs/metrics/rf_evaluation_report.json.
 
         Raises:
             FileNotFoundError: Se il dataset non è presente nel percorso configurato.
+            ValueError: Se `search` non è una strategia supportata o se nessuna
+                configurazione rispetta i vincoli di latenza e dimensione, né
+                nel profiling né dopo il refit finale (in tal caso nessun
+                artefatto viene salvato).
         """
         if not os.path.exists(self.dataset_path):
             raise FileNotFoundError(
                 f"[ML-TRAINER] Impossibile trovare il dataset: {self.dataset_path}"
             )
+        if search not in SEARCH_STRATEGIES:
+            raise ValueError(f"[ML-TRAINER] Strategia di ricerca non supportata: {search}")
 
-        print(f"[ML-TRAINER] Ingestion dataset: {self.dataset_path}")
-        df = pd.read_csv(self.dataset_path)
+        timings = {}
+        phase_start = time.perf_counter()
 
-        feature_cols = ['AGE', 'SEX', 'WEIGHT', 'DRUG_NAME', 'CONCOMITANT']
-        X = df[feature_cols].copy()
-        y = df['TARGET']
+        print(f"[ML-TRAINER] Ingestion dataset: {self.dataset_path}")
+        X, y, encoders, loading_stats = self.load_features(use_cache=use_cache, extra_sinks=extra_sinks)
+        feature_cols = FEATURE_COLS
 
-        print(f"[ML-TRAINER] Dataset: {len(df)} campioni | "
+        print(f"[ML-TRAINER] Dataset: {len(y)} campioni | "
               f"Positivi: {y.sum()} ({y.mean()*100:.1f}%) | "
               f"Negativi: {(~y.astype(bool)).sum()} ({(1-y.mean())*100:.1f}%)")
-
-        encoders = {}
-        categorical_cols = ['SEX', 'DRUG_NAME', 'CONCOMITANT']
-
-        print("[ML-TRAINER] Adattamento dei dizionari categoriali (Label Encoders)...")
-        for col in categorical_cols:
-            X[col] = X[col].fillna('Unknown').astype(str)
-            le = LabelEncoder()
-            X[col] = le.fit_transform(X[col])
-            encoders[col] = le
+        timings['data_loading'] = self._log_phase("Caricamento dati", phase_start)
 
         outer_cv = StratifiedKFold(n_splits=5, shuffle=True, random_state=42)
         inner_cv = StratifiedKFold(n_splits=3, shuffle=True, random_state=42)
@@ -231,82 +566,131 @@ class RiskModelTrainer:
             'min_samples_split':[2, 5, 10],
             'class_weight':     ['balanced']
         }
-        rf = RandomForestClassifier(random_state=42)
-
-        print("\n[ML-TRAINER] Avvio Nested Cross-Validation (5 outer fold, 3 inner fold)...")
-        fold_results = []
-        outer_acc, outer_prec, outer_rec, outer_f1 = [], [], [], []
-
-        fold_iterator = tqdm(
-            outer_cv.split(X, y),
-            total=outer_cv.get_n_splits(),
-            desc="Training Progress",
-            unit="fold"
-        )
-
-        for fold, (train_idx, test_idx) in enumerate(fold_iterator):
-            X_train, X_test = X.iloc[train_idx], X.iloc[test_idx]
-            y_train, y_test = y.iloc[train_idx], y.iloc[test_idx]
 
-            fold_iterator.set_description(f"Ottimizzazione Fold {fold+1}/5")
-
-            clf = GridSearchCV(
-                estimator=rf, param_grid=param_grid,
-                cv=inner_cv, scoring='f1', n_jobs=-1
+        # Il profiling costa un fit per configurazione: senza vincoli non
+        # influisce sulla selezione e viene saltato
+        constrained = max_latency_us is not None or max_model_mb is not None
+        profiles = []
+        if constrained:
+            print("\n[ML-TRAINER] Profiling di latenza e dimensione delle configurazioni...")
+            phase_start = time.perf_counter()
+            profiles = self.profile_inference(
+                X, y, param_grid, max_latency_us=max_latency_us,
+                max_model_mb=max_model_mb, profile_samples=profile_samples
+            )
+            for p in profiles:
+                tqdm.write(
+                    f"    {'✓' if p['feasible'] else '✗'} {p['params']} | "
+                    f"1 riga: {p['single_row_us']:.0f} µs | batch: {p['batch_row_us']:.1f} µs/riga | "
+                    f"{p['model_mb']:.2f} MB"
+                )
+            timings['inference_profiling'] = self._log_phase("Profiling inferenza", phase_start)
+
+            feasible = [p['params'] for p in profiles if p['feasible']]
+            if not feasible:
+                raise ValueError(
+                    f"[ML-TRAINER] Nessuna configurazione rispetta i vincoli "
+                    f"(max_latency_us={max_latency_us}, max_model_mb={max_model_mb})"
+                )
+            print(f"[ML-TRAINER] Configurazioni entro i vincoli: {len(feasible)}/{len(profiles)}")
+            param_grid = [
+                {**{k: [v] for k, v in params.items()}, 'class_weight': ['balanced']}
+                for params in feasible
+            ]
+
+        n_cpu = os.cpu_count() or 1
+        n_outer = outer_cv.get_n_splits()
+        outer_jobs = max(1, min(outer_jobs or n_cpu, n_outer, n_cpu))
+        inner_jobs = max(1, n_cpu // outer_jobs)
+
+        print(f"\n[ML-TRAINER] Avvio Nested Cross-Validation (5 outer fold, 3 inner fold, "
+              f"ricerca '{search}', {outer_jobs} fold in parallelo × {inner_jobs} job interni)...")
+        phase_start = time.perf_counter()
+
+        # Gli split sono calcolati una volta sola; la matrice NumPy viene
+        # condivisa con i worker tramite memory-mapping di joblib.
+        X_values, y_values = X.to_numpy(), y.to_numpy()
+        splits = list(outer_cv.split(X_values, y_values))
+        jobs = (
+            delayed(_evaluate_outer_fold)(
+                fold, X_values, y_values, train_idx, test_idx,
+                param_grid, inner_cv, search, inner_jobs
             )
-            clf.fit(X_train, y_train)
-            y_pred = clf.predict(X_test)
-
-            acc  = accuracy_score(y_test, y_pred)
-            prec = precision_score(y_test, y_pred, zero_division=0)
-            rec  = recall_score(y_test, y_pred, zero_division=0)
-            f1   = f1_score(y_test, y_pred, zero_division=0)
-
-            outer_acc.append(acc);  outer_prec.append(prec)
-            outer_rec.append(rec);  outer_f1.append(f1)
-
-            best_params = {k: v for k, v in clf.best_params_.items() if k != 'class_weight'}
-            fold_results.append({
-                'fold': fold + 1,
-                'accuracy':    round(acc,  4),
-                'precision':   round(prec, 4),
-                'recall':      round(rec,  4),
-                'f1':          round(f1,   4),
-                'best_params': best_params
-            })
+            for fold, (train_idx, test_idx) in enumerate(splits)
+        )
+        results = Parallel(n_jobs=outer_jobs, return_as="generator_unordered")(jobs)
 
+        fold_results = []
+        for result in tqdm(results, total=n_outer, desc="Training Progress", unit="fold"):
+            fold_results.append(result)
             tqdm.write(
-                f"    ✓ [Fold {fold+1}] "
-                f"Acc: {acc:.4f} | Prec: {prec:.4f} | Rec: {rec:.4f} | F1: {f1:.4f} | "
-                f"Params: {best_params}"
+                f"    ✓ [Fold {result['fold']}] "
+                f"Acc: {result['accuracy']:.4f} | Prec: {result['precision']:.4f} | "
+                f"Rec: {result['recall']:.4f} | F1: {result['f1']:.4f} | "
+                f"Params: {result['best_params']} | {result['seconds']:.1f} s"
             )
+        fold_results.sort(key=lambda r: r['fold'])
+        timings['nested_cv'] = self._log_phase("Nested Cross-Validation", phase_start)
+        timings['outer_folds'] = [r.pop('seconds') for r in fold_results]
 
         summary = {
-            'accuracy':  {'mean': round(np.mean(outer_acc),  4), 'std': round(np.std(outer_acc),  4)},
-            'precision': {'mean': round(np.mean(outer_prec), 4), 'std': round(np.std(outer_prec), 4)},
-            'recall':    {'mean': round(np.mean(outer_rec),  4), 'std': round(np.std(outer_rec),  4)},
-            'f1':        {'mean': round(np.mean(outer_f1),   4), 'std': round(np.std(outer_f1),   4)},
+            metric: {
+                'mean': round(np.mean([r[metric] for r in fold_results]), 4),
+                'std':  round(np.std([r[metric] for r in fold_results]), 4)
+            }
+            for metric in ['accuracy', 'precision', 'recall', 'f1']
         }
 
         print(f"\n[ML-TRAINER] === Valutazione Globale (media ± std su 5 fold) ===")
         for metric, vals in summary.items():
             print(f"    {metric:<12}: {vals['mean']:.4f} ± {vals['std']:.4f}")
 
-        print("\n[ML-TRAINER] Refit finale sull'intero dataset...")
-        final_clf = GridSearchCV(
-            estimator=rf, param_grid=param_grid, cv=5, scoring='f1', n_jobs=-1
-        )
-        with tqdm(total=1, desc="Final Refit",
-                  bar_format="{l_bar}{bar}| [Elaborazione in corso...]") as pbar:
-            final_clf.fit(X, y)
-            pbar.update(1)
+        candidates = _rank_final_params(fold_results, profiles if constrained else None)
+        if not constrained:
+            candidates = candidates[:1]
+        probe = X.sample(n=min(1000, len(X)), random_state=42) if constrained else None
+        rejected = []
+        timings['final_refit'] = 0.0
 
-        best_final_params = {
-            k: v for k, v in final_clf.best_params_.items() if k != 'class_weight'
-        }
-        print(f"[ML-TRAINER] Iperparametri finali: {best_final_params}")
+        for best_final_params in candidates:
+            print(f"\n[ML-TRAINER] Refit finale sull'intero dataset con gli iperparametri "
+                  f"{'selezionati nei fold esterni' if not rejected else 'di ripiego'}: {best_final_params}")
+            phase_start = time.perf_counter()
 
-        importances = final_clf.best_estimator_.feature_importances_
+            final_model = RandomForestClassifier(
+                random_state=42, class_weight='balanced', n_jobs=n_cpu, **best_final_params
+            )
+            with tqdm(total=1, desc="Final Refit",
+                      bar_format="{l_bar}{bar}| [Elaborazione in corso...]") as pbar:
+                final_model.fit(X, y)
+                pbar.update(1)
+            # Il modello viene interrogato riga per riga durante la ricerca A*:
+            # la predizione a thread singolo evita l'overhead di dispatch.
+            final_model.n_jobs = 1
+            timings['final_refit'] = round(timings['final_refit'] + self._log_phase("Refit finale", phase_start), 3)
+
+            if not constrained:
+                final_profile = None
+                break
+            # I vincoli sono verificati sul modello addestrato sull'intero
+            # dataset: alberi più profondi di quelli del sottocampione di
+            # profiling possono superarli
+            final_profile = _measure_inference(final_model, probe)
+            print(f"[ML-TRAINER] Modello finale: 1 riga {final_profile['single_row_us']:.0f} µs | "
+                  f"batch {final_profile['batch_row_us']:.1f} µs/riga | {final_profile['model_mb']:.2f} MB")
+            if not ((max_latency_us is not None and final_profile['single_row_us'] > max_latency_us) or
+                    (max_model_mb is not None and final_profile['model_mb'] > max_model_mb)):
+                break
+            print("[ML-TRAINER] ⚠ Il modello finale supera i vincoli: si passa alla configurazione successiva.")
+            rejected.append({'params': best_final_params, **final_profile})
+        else:
+            raise ValueError(
+                f"[ML-TRAINER] Nessun modello finale rispetta i vincoli "
+                f"(max_latency_us={max_latency_us}, max_model_mb={max_model_mb}) "
+                f"dopo il refit di {len(rejected)} configurazioni: nessun artefatto salvato"
+            )
+
+        importances = final_model.feature_importances_
         feature_importance_dict = {
             col: round(float(imp), 4)
             for col, imp in sorted(
@@ -319,27 +703,44 @@ class RiskModelTrainer:
             print(f"    {feat:<20}: {imp:.4f}")
 
         # ── Salvataggio artefatti ──────────────────────────────────────
+        phase_start = time.perf_counter()
         os.makedirs(self.model_dir, exist_ok=True)
         os.makedirs(self.docs_plots_dir, exist_ok=True)
         os.makedirs(self.docs_metrics_dir, exist_ok=True)
 
-        joblib.dump(final_clf.best_estimator_, self.model_path)
+        joblib.dump(final_model, self.model_path)
         joblib.dump(encoders, self.encoder_path)
+        timings['artifacts'] = self._log_phase("Salvataggio artefatti", phase_start)
+        timings['total'] = round(
+            sum(v for k, v in timings.items() if k != 'outer_folds'), 3
+        )
 
         report = {
             'model': 'RandomForestClassifier',
             'validation_strategy': 'Nested Cross-Validation (5 outer, 3 inner)',
+            'search_strategy': SEARCH_STRATEGIES[search],
+            'final_refit': 'Iperparametri più frequenti tra i fold esterni',
             'scoring_metric': 'F1',
             'dataset': {
-                'size': len(df),
+                'size': len(y),
                 'positive_samples': int(y.sum()),
                 'negative_samples': int((~y.astype(bool)).sum()),
                 'positive_rate': round(float(y.mean()), 4)
             },
+            'data_loading': loading_stats,
             'per_fold_results': fold_results,
             'summary': summary,
             'best_params_final': best_final_params,
-            'feature_importances': feature_importance_dict
+            'feature_importances': feature_importance_dict,
+            'inference_profile': {
+                'profile_samples': profile_samples,
+                'constraints': {'max_latency_us': max_latency_us, 'max_model_mb': max_model_mb},
+                'configurations': profiles,
+                'final_model': final_profile,
+                'rejected_final_models': rejected
+            },
+            'parallelism': {'cpu_count': n_cpu, 'outer_jobs': outer_jobs, 'inner_jobs': inner_jobs},
+            'timings_seconds': timings
         }
 
         with open(self.report_path, 'w', encoding='utf-8') as f:
@@ -359,5 +760,33 @@ class RiskModelTrainer:
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="SafeTherapy - Addestramento del Random Forest")
+    parser.add_argument("--no-cache", action="store_true", help="Rilegge il CSV ignorando la matrice delle feature in cache")
+    parser.add_argument("--search", choices=sorted(SEARCH_STRATEGIES), default="grid",
+                        help="Ricerca interna: griglia completa o successive halving")
+    parser.add_argument("--outer-jobs", type=int, default=None, help="Fold esterni eseguiti in parallelo")
+    parser.add_argument("--max-latency-us", type=float, default=None,
+                        help="Latenza massima di predict_proba a riga singola (µs)")
+    parser.add_argument("--max-model-mb", type=float, default=None,
+                        help="Dimensione massima del modello serializzato (MB)")
+    parser.add_argument("--profile-samples", type=int, default=20000,
+                        help="Righe del sottocampione usato per il profiling di latenza "
+                             "(solo con --max-latency-us o --max-model-mb)")
+    parser.add_argument("--train-bn", action="store_true",
+                        help="Addestra anche la Rete Bayesiana, con un'unica passata di lettura del CSV")
+    args = parser.parse_args()
+
+    bn_sink = None
+    if args.train_bn:
+        from src.bn.learner import FaersBN
+        bbn = FaersBN()
+        bn_sink = bbn.count_sink()
+
     trainer = RiskModelTrainer()
-    trainer.train()
\ No newline at end of file
+    trainer.train(
+        use_cache=not args.no_cache, search=args.search, outer_jobs=args.outer_jobs,
+        max_latency_us=args.max_latency_us, max_model_mb=args.max_model_mb,
+        profile_samples=args.profile_samples, extra_sinks=(bn_sink,) if bn_sink else ()
+    )
+    if bn_sink is not None:
+        bbn.train_and_save(counts=bn_sink.table)
\ No newline at end of file
@@ -0,0 +1,62 @@
+# File: src/sss/cache.py
+
+"""
+Cache a dimensione limitata per i risultati della T-Box condivisi tra ricerche.
+Le voci usate meno di recente vengono scartate al superamento della capacità
+(politica LRU), così che la memoria dell'ottimizzatore non cresca con la
+storia delle richieste di un processo di lunga durata.
+"""
+
+from collections import OrderedDict
+
+
+class LRUCache:
+    """
+    Dizionario con capacità massima e scarto della voce usata meno di recente.
+
+    Sia la lettura (`get`) sia la scrittura di una chiave la marcano come usata
+    più di recente.
+
+    Attributes:
+        maxsize (int): Numero massimo di voci conservate.
+        evictions (int): Numero di voci scartate per superamento della capacità.
+    """
+
+    def __init__(self, maxsize: int):
+        """
+        Args:
+            maxsize (int): Numero massimo di voci (almeno 1).
+
+        Raises:
+            ValueError: Se `maxsize` è minore di 1.
+        """
+        if maxsize < 1:
+            raise ValueError(f"[CACHE] Capacità non valida: {maxsize}")
+        self.maxsize = maxsize
+        self.evictions = 0
+        self._data = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key) -> bool:
+        return key in self._data
+
+    def get(self, key, default=None):
+        """Restituisce il valore associato a `key` (o `default`) e lo marca come recente."""
+        try:
+            self._data.move_to_end(key)
+        except KeyError:
+            return default
+        return self._data[key]
+
+    def __setitem__(self, key, value) -> None:
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Svuota la cache (il contatore degli scarti viene mantenuto)."""
+        self._data.clear()
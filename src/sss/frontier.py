@@ -0,0 +1,116 @@
+# File: src/sss/frontier.py
+
+"""
+Frontiera dell'algoritmo A*.
+Implementa una coda di priorità indicizzata per firma di stato, con
+cancellazione pigra (lazy deletion) delle voci obsolete e ordinamento
+deterministico tramite chiavi a tupla (f, h, seq).
+"""
+
+import heapq
+import itertools
+
+
+class IndexedFrontier:
+    """
+    Min-Heap indicizzato per firma di stato (insieme dei farmaci, malattie residue).
+
+    Ogni stato ha al più una voce "viva" nella coda. Quando lo stesso stato
+    viene raggiunto con un costo g(n) migliore, la voce precedente non viene
+    rimossa fisicamente dall'heap (operazione O(n)), ma marcata come obsoleta
+    e scartata al momento dell'estrazione (decrease-key tramite lazy deletion).
+
+    Le voci sono ordinate per la chiave `(f, h, seq)`: a parità di f(n) viene
+    preferito il nodo con h(n) minore (più vicino al goal), e a parità di
+    entrambi il nodo inserito per primo. L'ordine di estrazione è quindi
+    completamente deterministico e non dipende da `TherapyNode.__lt__`.
+
+    Attributes:
+        pushes (int): Numero totale di inserimenti nell'heap.
+        duplicate_pops (int): Numero di voci obsolete estratte e scartate.
+        max_heap_size (int): Dimensione fisica massima raggiunta dall'heap.
+    """
+
+    def __init__(self):
+        """Inizializza un heap vuoto e l'indice firma → voce viva."""
+        self._heap = []
+        self._entries = {}
+        self._seq = itertools.count()
+
+        self.pushes = 0
+        self.duplicate_pops = 0
+        self.max_heap_size = 0
+
+    def __len__(self) -> int:
+        """Restituisce il numero di stati vivi (non obsoleti) in frontiera."""
+        return len(self._entries)
+
+    def __contains__(self, state_sig) -> bool:
+        """Verifica se lo stato ha una voce viva in frontiera."""
+        return state_sig in self._entries
+
+    @property
+    def heap_size(self) -> int:
+        """Dimensione fisica dell'heap, incluse le voci obsolete non ancora estratte."""
+        return len(self._heap)
+
+    def push(self, state_sig, node) -> None:
+        """
+        Inserisce un nodo in frontiera, sostituendo l'eventuale voce viva
+        associata alla stessa firma di stato.
+
+        Il chiamante è responsabile di inserire un nodo solo se migliora il
+        costo g(n) noto per lo stato: la voce precedente viene invalidata
+        senza confronto.
+
+        Args:
+            state_sig (tuple): Firma hashable dello stato.
+            node (TherapyNode): Il nodo da inserire, con attributi `f` e `h`.
+        """
+        old_entry = self._entries.get(state_sig)
+        if old_entry is not None:
+            old_entry[-1] = None
+
+        entry = [node.f, node.h, next(self._seq), state_sig, node]
+        self._entries[state_sig] = entry
+        heapq.heappush(self._heap, entry)
+
+        self.pushes += 1
+        if len(self._heap) > self.max_heap_size:
+            self.max_heap_size = len(self._heap)
+
+    def pop(self):
+        """
+        Estrae il nodo vivo con chiave `(f, h, seq)` minima.
+
+        Le voci obsolete incontrate in cima all'heap vengono scartate e
+        conteggiate in `duplicate_pops`.
+
+        Returns:
+            TherapyNode: Il nodo estratto, oppure None se la frontiera è vuota.
+        """
+        while self._heap:
+            entry = heapq.heappop(self._heap)
+            node = entry[-1]
+            if node is None:
+                self.duplicate_pops += 1
+                continue
+            del self._entries[entry[3]]
+            return node
+        return None
+
+    def stats(self) -> dict:
+        """
+        Restituisce le statistiche di utilizzo della frontiera.
+
+        Returns:
+            dict: Inserimenti, estrazioni duplicate scartate, dimensione
+                massima e dimensione corrente (fisica e viva) dell'heap.
+        """
+        return {
+            'heap_pushes': self.pushes,
+            'duplicate_pops': self.duplicate_pops,
+            'max_heap_size': self.max_heap_size,
+            'heap_size': self.heap_size,
+            'open_states': len(self._entries),
+        }
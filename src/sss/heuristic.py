@@ -8,12 +8,19 @@ di Intelligenza Artificiale (Machine Learning e Reti Bayesiane).
 
 import sys
 import os
-import json
+import numpy as np
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
 
 from src.ml.predictor import RiskPredictor
-from src.bn.learner import FaersBN
+from src.bn.predictor import BNPredictor
+from src.kb.atoms import get_atom_registry
+from src.metrics import get_metrics
+
+metrics = get_metrics()
+
+# Oltre questa dimensione una tabella di rischio/fragilità viene svuotata
+MAX_TABLE_ENTRIES = 200_000
 
 
 class AIHeuristic:
@@ -33,30 +40,35 @@ class AIHeuristic:
 
     Attributes:
         ml (RiskPredictor): Classificatore Random Forest per il rischio molecolare.
-        bn (FaersBN): Rete Bayesiana per la fragilità sistemica del paziente.
-        atom_mapping (dict): Dizionario di traduzione atomo Prolog → nome originale.
+        bn (BNPredictor): Rete Bayesiana per la fragilità sistemica del paziente.
+        atoms (AtomRegistry): Registro condiviso per la traduzione atomo Prolog → nome originale.
+        evaluations (dict): Inferenze effettivamente eseguite dai modelli ('risk', 'frailty'),
+            escluse quelle servite dalle tabelle.
     """
 
-    def __init__(self):
+    def __init__(self, atoms=None):
         """
-        Inizializza i modelli predittivi e carica il dizionario di traduzione.
+        Inizializza i modelli predittivi e il riferimento al registro degli atomi.
+
+        Carica `RiskPredictor` e `BNPredictor` per l'inferenza probabilistica in tempo reale.
+        La traduzione degli atomi Prolog nei nomi farmaceutici attesi dal ML
+        usa il registro condiviso dal processo (`get_atom_registry`): in assenza
+        di `atom_mapping.json`, `_get_original_name` restituirà l'atomo grezzo.
 
-        Carica `RiskPredictor` e `FaersBN` per l'inferenza probabilistica in tempo reale.
-        Se il file `atom_mapping.json` è presente, lo legge per consentire
-        la traduzione degli atomi Prolog nei nomi farmaceutici attesi dal ML.
-        In assenza del file, il mapping rimane vuoto e `_get_original_name`
-        restituirà l'atomo grezzo.
+        Args:
+            atoms (AtomRegistry, optional): Registro alternativo, per le KB
+                caricate da una directory diversa da quella predefinita.
         """
         self.ml = RiskPredictor()
-        self.bn = FaersBN()
-
-        self.atom_mapping = {}
-        base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        mapping_path = os.path.join(base_dir, "kb", "prolog", "atom_mapping.json")
+        self.bn = BNPredictor()
+        self.atoms = atoms if atoms is not None else get_atom_registry()
 
-        if os.path.exists(mapping_path):
-            with open(mapping_path, 'r', encoding='utf-8') as f:
-                self.atom_mapping = json.load(f)
+        # Rischi e fragilità già calcolati, indicizzati dagli input discretizzati
+        # dei modelli: validi finché il modello che li ha prodotti resta in uso
+        self._risk_table = {}
+        self._frailty_table = {}
+        self._table_models = (None, None)
+        self.evaluations = {'risk': 0, 'frailty': 0}
 
     def _get_original_name(self, atom: str) -> str:
         """
@@ -73,8 +85,9 @@ class AIHeuristic:
             str: Il nome originale dalla Knowledge Base se presente nel mapping,
                 oppure l'atomo invariato se non viene trovata corrispondenza.
         """
-        return self.atom_mapping.get(atom, atom)
+        return self.atoms.original_name(atom)
 
+    @metrics.timed('heuristic.drug_penalty')
     def evaluate_drug_penalty(self, patient_profile: dict, drug_atom: str) -> float:
         """
         Calcola la penalità di rischio clinico reale da sommare al costo g(n).
@@ -90,6 +103,10 @@ class AIHeuristic:
         In caso di errore in uno dei due modelli, il valore di fallback è 0.5
         (rischio neutro), per non bloccare la ricerca.
 
+        Rischio e fragilità vengono letti dalle tabelle dell'euristica quando un
+        profilo con gli stessi input discretizzati (`profile_key`) è già stato
+        valutato, anche in una ricerca precedente.
+
         Args:
             patient_profile (dict): Profilo clinico del paziente con le chiavi 'age', 
                                     'sex', 'weight' e 'concomitant'.
@@ -99,17 +116,97 @@ class AIHeuristic:
             float: Valore di penalità non negativo da aggiungere a g(n).
         """
         drug_real_name = self._get_original_name(drug_atom)
+        risk_ml = self._risk(patient_profile, drug_real_name)
+        frailty_bn = self._frailty(patient_profile)
+
+        base_risk_cost = risk_ml * 1000.0
+        frailty_multiplier = 1.0 + frailty_bn
+
+        return base_risk_cost * frailty_multiplier
+
+    def profile_key(self, patient_profile: dict) -> tuple:
+        """
+        Restituisce gli input discretizzati del profilo per i due modelli.
+
+        Due profili con la stessa chiave ricevono le stesse penalità per ogni
+        farmaco (es. 70 e 72 anni cadono nello stesso intervallo tra le soglie
+        di split della foresta e nella stessa fascia d'età della rete).
+
+        Returns:
+            tuple: (chiave del Random Forest, evidenza della Rete Bayesiana),
+                oppure None se il profilo non è valutabile dai modelli.
+        """
+        try:
+            return (self._risk_key(patient_profile), self._frailty_key(patient_profile))
+        except Exception:
+            return None
+
+    def clear_tables(self) -> None:
+        """Svuota le tabelle di rischio e fragilità (es. per misure a cache fredde)."""
+        self._risk_table.clear()
+        self._frailty_table.clear()
+
+    def _sync_tables(self) -> None:
+        """Scarta le tabelle se nel frattempo è stato installato un altro modello."""
+        models = (self.ml.model, self.bn.inference_engine)
+        if models[0] is not self._table_models[0] or models[1] is not self._table_models[1]:
+            self.clear_tables()
+            self._table_models = models
+
+    def _risk_key(self, patient_profile: dict) -> tuple:
+        return self.ml.profile_key(patient_profile['age'], patient_profile['sex'],
+                                   patient_profile['weight'], patient_profile['concomitant'])
+
+    def _frailty_key(self, patient_profile: dict) -> tuple:
+        return self.bn.evidence_key(patient_profile['age'], patient_profile['weight'],
+                                    patient_profile['concomitant'])
+
+    @staticmethod
+    def _remember(table: dict, key, value: float) -> None:
+        if len(table) >= MAX_TABLE_ENTRIES:
+            table.clear()
+        table[key] = value
+
+    def _risk(self, patient_profile: dict, drug_name: str) -> float:
+        """Rischio ML del farmaco per il paziente, con fallback a 0.5 in caso di errore."""
+        self._sync_tables()
+        try:
+            key = (self._risk_key(patient_profile), drug_name)
+        except Exception:
+            key = None
+        risk_ml = self._risk_table.get(key) if key is not None else None
+        if risk_ml is not None:
+            if metrics.enabled:
+                metrics.incr('heuristic.risk_table.hit')
+            return risk_ml
 
         try:
             risk_ml = self.ml.predict_risk(
                 age=patient_profile['age'],
                 sex=patient_profile['sex'],
                 weight=patient_profile['weight'],
-                drug_name=drug_real_name,
+                drug_name=drug_name,
                 concomitant=patient_profile['concomitant']
             )
         except Exception:
             risk_ml = 0.5
+        self.evaluations['risk'] += 1
+        if key is not None:
+            self._remember(self._risk_table, key, risk_ml)
+        return risk_ml
+
+    def _frailty(self, patient_profile: dict) -> float:
+        """Fragilità BN del paziente, con fallback a 0.5 in caso di errore."""
+        self._sync_tables()
+        try:
+            key = self._frailty_key(patient_profile)
+        except Exception:
+            key = None
+        frailty_bn = self._frailty_table.get(key) if key is not None else None
+        if frailty_bn is not None:
+            if metrics.enabled:
+                metrics.incr('heuristic.frailty_table.hit')
+            return frailty_bn
 
         try:
             frailty_bn = self.bn.get_patient_fragility(
@@ -119,11 +216,54 @@ class AIHeuristic:
             )
         except Exception:
             frailty_bn = 0.5
+        self.evaluations['frailty'] += 1
+        if key is not None:
+            self._remember(self._frailty_table, key, frailty_bn)
+        return frailty_bn
 
-        base_risk_cost = risk_ml * 1000.0
-        frailty_multiplier = 1.0 + frailty_bn
+    @metrics.timed('heuristic.cohort_penalty_matrix')
+    def cohort_penalty_matrix(self, patients, drug_atoms: list, **kwargs) -> np.ndarray:
+        """
+        Calcola le penalità di rischio per una coorte di pazienti e una lista di farmaci.
 
-        return base_risk_cost * frailty_multiplier
+        Applica a ogni coppia (paziente, farmaco) la formula di
+        `evaluate_drug_penalty`, `(risk_ml * 1000) * (1 + frailty_bn)`, usando le
+        inferenze di coorte dei due modelli, con lo stesso fallback a 0.5 in
+        caso di errore.
+
+        Args:
+            patients (dict | pd.DataFrame): Profili in forma colonnare, con le
+                colonne 'age', 'sex', 'weight' e 'concomitant' (N pazienti).
+            drug_atoms (list[str]): Atomi Prolog dei farmaci da valutare (M).
+            **kwargs: Parametri di blocco inoltrati a `RiskPredictor.predict_risk_matrix`
+                (`block_patients`, `max_batch_rows`, `out`).
+
+        Returns:
+            np.ndarray: Matrice (N, M) float32 delle penalità.
+        """
+        n_patients = len(patients['age'])
+        drug_names = [self._get_original_name(atom) for atom in drug_atoms]
+
+        try:
+            penalty = self.ml.predict_risk_matrix(
+                patients['age'], patients['sex'], patients['weight'], patients['concomitant'],
+                drug_names, **kwargs
+            )
+        except Exception as e:
+            print(f"[HEURISTIC] Errore nella matrice di rischio ML: {e}. Fallback a 0.5")
+            penalty = kwargs.get('out')
+            if penalty is None:
+                penalty = np.empty((n_patients, len(drug_names)), dtype=np.float32)
+            penalty[:] = 0.5
+
+        try:
+            frailty = self.bn.get_cohort_fragility(patients['age'], patients['weight'], patients['concomitant'])
+        except Exception:
+            frailty = np.full(n_patients, 0.5)
+
+        penalty *= 1000.0
+        penalty *= (1.0 + np.asarray(frailty, dtype=np.float32))[:, None]
+        return penalty
 
     def calculate_admissible_h(self, remaining_diseases: list) -> float:
         """
@@ -0,0 +1,286 @@
+# File: src/sss/reload.py
+
+"""
+Ricaricamento a caldo degli artefatti di modelli e Knowledge Base.
+
+Un processo di lunga durata (es. un servizio che riusa lo stesso
+`TherapyOptimizer`) non deve essere riavviato quando si riaddestra il Random
+Forest o si rigenera l'A-Box. `ArtifactReloader` sorveglia quattro gruppi di
+artefatti, ciascuno identificato dall'hash SHA-256 del contenuto:
+
+  - 'ml'    : `rf_risk_model.pkl` e `label_encoders.pkl` (RiskPredictor);
+  - 'bn'    : `faers_frailty_bbn.pkl` (BNPredictor);
+  - 'atoms' : `atom_mapping.json` (AtomRegistry);
+  - 'kb'    : `facts.pl` e `reasoning.pl` (PrologInterface o SnapshotInterface).
+
+Un thread in background controlla periodicamente dimensione e data di modifica
+dei file; quando cambiano e restano stabili per un intervallo (scrittura
+completata) ricalcola l'hash e, se il contenuto è nuovo, legge la nuova
+versione senza toccare quella in uso. L'installazione avviene all'inizio della
+ricerca successiva (`TherapyOptimizer.refresh_artifacts`): una ricerca in corso
+termina sempre sulla versione con cui è partita, e vengono invalidate solo le
+cache che dipendono dal gruppo cambiato (tabelle di approvazione e penalità
+DDI per la KB, penalità ML/BN delle sessioni per i modelli e gli atomi).
+
+Il runtime SWI-Prolog è unico per processo e non può ospitare due versioni
+della KB: con il backend 'prolog' la nuova KB viene riconsultata al momento
+dell'installazione, mentre con il backend 'snapshot' lo snapshot della nuova
+versione (compilato con `python src/kb/snapshot.py build`) viene caricato in
+background come gli altri artefatti.
+
+Esempio:
+    optimizer = TherapyOptimizer(kb_backend='snapshot')
+    reloader = ArtifactReloader(optimizer, interval=5.0)
+    reloader.start()
+"""
+
+import os
+import sys
+import hashlib
+import threading
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from src.kb.atoms import read_mapping
+from src.metrics import get_metrics
+
+metrics = get_metrics()
+
+DEFAULT_PROLOG_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "kb", "prolog")
+
+# Ordine di installazione: gli atomi prima dei modelli che li usano, la KB per ultima
+INSTALL_ORDER = ('atoms', 'ml', 'bn', 'kb')
+
+
+def content_hash(paths: list) -> str:
+    """
+    Calcola l'hash SHA-256 del contenuto di un gruppo di file.
+
+    Args:
+        paths (list[str]): File del gruppo, in ordine fisso.
+
+    Returns:
+        str: Digest esadecimale, oppure None se uno dei file non esiste.
+    """
+    digest = hashlib.sha256()
+    for path in paths:
+        if not os.path.exists(path):
+            return None
+        digest.update(os.path.basename(path).encode('utf-8'))
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+    return digest.hexdigest()
+
+
+def file_signature(paths: list) -> tuple:
+    """Firma economica di un gruppo di file: (dimensione, mtime) per file."""
+    signature = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            signature.append((stat.st_size, stat.st_mtime_ns))
+        except OSError:
+            signature.append(None)
+    return tuple(signature)
+
+
+class ArtifactGroup:
+    """
+    Gruppo di artefatti che vengono letti e installati insieme.
+
+    Attributes:
+        name (str): Nome del gruppo ('ml', 'bn', 'atoms', 'kb').
+        paths (list[str]): File sorvegliati.
+        read (callable): Legge la nuova versione senza installarla; eseguita
+            dal thread del watcher.
+        install (callable): Installa il risultato di `read` nell'ottimizzatore
+            e invalida le cache dipendenti; eseguita tra due ricerche.
+    """
+
+    def __init__(self, name: str, paths: list, read, install):
+        self.name = name
+        self.paths = paths
+        self.read = read
+        self.install = install
+
+
+class ArtifactReloader:
+    """
+    Watcher degli artefatti di un `TherapyOptimizer` con installazione atomica
+    tra una ricerca e l'altra.
+
+    Attributes:
+        optimizer (TherapyOptimizer): Ottimizzatore servito.
+        interval (float): Secondi tra due controlli del watcher.
+        groups (dict): Gruppi sorvegliati, per nome.
+        versions (dict): Hash della versione installata, per gruppo.
+    """
+
+    def __init__(self, optimizer, interval: float = 5.0):
+        """
+        Registra il reloader sull'ottimizzatore e calcola le versioni correnti.
+
+        Args:
+            optimizer (TherapyOptimizer): Ottimizzatore da aggiornare.
+            interval (float): Secondi tra due controlli del watcher.
+        """
+        self.optimizer = optimizer
+        self.interval = interval
+        self.groups = {group.name: group for group in self._build_groups()}
+        self.versions = {name: content_hash(group.paths) for name, group in self.groups.items()}
+
+        self._seen = {name: file_signature(group.paths) for name, group in self.groups.items()}
+        self._checked = dict(self._seen)
+        self._staged = {}
+        self._failed = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+        optimizer.reloader = self
+        optimizer.artifact_versions = self._short_versions()
+
+    def _build_groups(self) -> list:
+        """Costruisce i gruppi di artefatti a partire dai componenti dell'ottimizzatore."""
+        opt = self.optimizer
+        ml, bn = opt.ai.ml, opt.ai.bn
+        kb_dir = opt.kb_dir or DEFAULT_PROLOG_DIR
+        atoms_path = opt.atoms.mapping_path
+
+        def install_ml(payload):
+            ml.install(*payload)
+            opt.model_version += 1
+
+        def install_bn(payload):
+            bn.install(*payload)
+            opt.model_version += 1
+
+        def install_atoms(payload):
+            opt.atoms.install(*payload)
+            opt.model_version += 1
+
+        def read_kb():
+            if opt.kb_backend != 'snapshot':
+                return None
+            from src.kb.snapshot import SnapshotInterface
+            return SnapshotInterface(prolog_dir=kb_dir)
+
+        def install_kb(payload):
+            if payload is None:
+                opt.kb.reload()
+            else:
+                opt.kb = payload
+            opt.invalidate_kb_caches()
+
+        return [
+            ArtifactGroup('ml', [ml.model_path, ml.encoder_path], ml.read_artifacts, install_ml),
+            ArtifactGroup('bn', [bn.model_path], bn.read_model, install_bn),
+            ArtifactGroup('atoms', [atoms_path], lambda: read_mapping(atoms_path), install_atoms),
+            ArtifactGroup('kb', [os.path.join(kb_dir, "facts.pl"), os.path.join(kb_dir, "reasoning.pl")],
+                          read_kb, install_kb),
+        ]
+
+    def _short_versions(self) -> dict:
+        return {name: digest[:12] if digest else None for name, digest in self.versions.items()}
+
+    def poll(self) -> list:
+        """
+        Esegue un controllo degli artefatti e prepara le versioni nuove.
+
+        Un gruppo viene letto solo se la sua firma (dimensione, mtime) è
+        cambiata rispetto all'ultima versione verificata ed è rimasta identica
+        per due controlli consecutivi, così da non leggere file ancora in
+        scrittura. Se la lettura fallisce il gruppo viene ritentato al
+        controllo successivo.
+
+        Returns:
+            list[str]: Gruppi per cui è stata preparata una nuova versione.
+        """
+        staged = []
+        for name, group in self.groups.items():
+            signature = file_signature(group.paths)
+            if signature == self._checked[name]:
+                continue
+            if signature != self._seen[name]:
+                self._seen[name] = signature
+                continue
+
+            digest = content_hash(group.paths)
+            with self._lock:
+                pending = self._staged.get(name)
+            if digest is None or digest == (pending[0] if pending else self.versions[name]):
+                self._checked[name] = signature
+                continue
+
+            try:
+                payload = group.read()
+            except Exception as e:
+                if self._failed.get(name) != digest:
+                    self._failed[name] = digest
+                    print(f"[RELOAD] Lettura della nuova versione di '{name}' fallita, nuovi tentativi ai prossimi controlli: {e}")
+                continue
+            self._failed.pop(name, None)
+
+            with self._lock:
+                self._staged[name] = (digest, payload)
+            self._checked[name] = signature
+            staged.append(name)
+            print(f"[RELOAD] Nuova versione di '{name}' pronta ({digest[:12]}), installazione alla prossima ricerca")
+        return staged
+
+    def apply_pending(self) -> list:
+        """
+        Installa le versioni preparate da `poll`.
+
+        Va chiamato dal thread che esegue le ricerche, quando nessuna ricerca è
+        in corso (lo fa `TherapyOptimizer.solve` prima di iniziare).
+
+        Returns:
+            list[str]: Gruppi installati.
+        """
+        with self._lock:
+            if not self._staged:
+                return []
+            staged, self._staged = self._staged, {}
+
+        installed = []
+        for name in INSTALL_ORDER:
+            if name not in staged:
+                continue
+            digest, payload = staged[name]
+            try:
+                self.groups[name].install(payload)
+            except Exception as e:
+                print(f"[RELOAD] Installazione di '{name}' fallita, resta in uso la versione precedente: {e}")
+                continue
+            self.versions[name] = digest
+            installed.append(name)
+            metrics.incr(f'reload.{name}')
+            print(f"[RELOAD] '{name}' aggiornato alla versione {digest[:12]}")
+
+        self.optimizer.artifact_versions = self._short_versions()
+        return installed
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.poll()
+            except Exception as e:
+                print(f"[RELOAD] Errore del watcher: {e}")
+
+    def start(self) -> None:
+        """Avvia il watcher in un thread daemon."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="artifact-reloader", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Ferma il watcher e ne attende la terminazione."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
@@ -1,15 +1,30 @@
 # File: src/sss/search.py
-import heapq
 import os
 import sys
-import json
-import copy
+from concurrent.futures import ThreadPoolExecutor
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
 
-from src.kb.interface import PrologInterface
 from src.kb.utils import to_prolog_atom
+from src.kb.atoms import AtomRegistry, get_atom_registry
 from src.sss.heuristic import AIHeuristic
+from src.sss.frontier import IndexedFrontier
+from src.sss.cache import LRUCache
+from src.kb.conflict_graph import ConflictGraph
+from src.metrics import get_metrics
+
+metrics = get_metrics()
+
+# Statistiche della ricerca pubblicate come gauge (valore di picco) anziché come contatori
+GAUGE_STATS = ('max_heap_size', 'heap_size', 'open_states')
+
+# Candidati oltre i quali il grafo dei conflitti non viene costruito (≈ 2·N²/8 byte di bitset)
+MAX_GRAPH_DRUGS = 20_000
+
+# Capacità delle cache LRU della T-Box: tabelle di approvazione (una per
+# patologia) e penalità DDI dei regimi valutati da `verify_therapy`
+MAX_APPROVAL_ENTRIES = 512
+MAX_SAFETY_ENTRIES = 50_000
 
 class TherapyNode:
     """
@@ -35,6 +50,9 @@ class TherapyNode:
         """
         Metodo di comparazione per la gestione della Priority Queue (Min-Heap).
         L'A* estrae sempre il nodo con il costo f(n) minore.
+
+        La frontiera di `solve` ordina i nodi con chiavi `(f, h, seq)` tramite
+        `IndexedFrontier`; il metodo resta disponibile per confronti diretti.
         """
         return self.f < other.f
 
@@ -44,22 +62,106 @@ class TherapyOptimizer:
     Interroga la T-Box (Prolog) per le regole cliniche assolute e valuta 
     i percorsi probabilistici tramite l'euristica Neuro-Simbolica (ML + BBN).
     """
-    def __init__(self):
+    def __init__(self, kb_backend: str = 'prolog', kb_dir: str = None, workers: int = 1):
         """
         Inizializza le interfacce verso la Knowledge Base Prolog e i modelli AI.
-        Carica inoltre il mapping degli atomi per la traduzione dei nomi.
+        La traduzione dei nomi è affidata al registro degli atomi condiviso
+        dal processo (`self.atoms`).
+
+        Le cache `_approval_cache` (patologia → farmaci approvati e linea),
+        `_safety_cache` (regime → penalità DDI) e il grafo dei conflitti dei
+        candidati (`_conflict_graph`) dipendono solo dalla T-Box e vengono
+        quindi condivisi tra esecuzioni successive di `solve`. Le due cache
+        sono LRU limitate a `MAX_APPROVAL_ENTRIES` e `MAX_SAFETY_ENTRIES`
+        voci, così che un processo di lunga durata non accumuli regimi.
+
+        Args:
+            kb_backend (str): 'prolog' per interrogare la T-Box live tramite
+                PySwip, 'snapshot' per rispondere dalla chiusura compilata
+                offline (`src/kb/snapshot.py`), senza avviare SWI-Prolog.
+            kb_dir (str, optional): Directory alternativa con `reasoning.pl`,
+                `facts.pl` e `atom_mapping.json` (es. una KB sintetica
+                ingrandita per i test di scalabilità). Default: `src/kb/prolog`.
+            workers (int): Thread usati per valutare in parallelo le penalità
+                ML/BN dei successori di un nodo. Con 1 (default) la valutazione
+                è sequenziale. Le query alla Knowledge Base restano comunque sul
+                thread chiamante.
         """
         print("[SSS] Inizializzazione Algoritmo A* (Ontological Set Cover Mode)...")
-        self.kb = PrologInterface()
-        self.ai = AIHeuristic()
+        self.kb_backend = kb_backend
+        self.kb_dir = kb_dir
+        if kb_dir is None:
+            self.atoms = get_atom_registry()
+        else:
+            self.atoms = AtomRegistry(os.path.join(kb_dir, "atom_mapping.json"))
+
+        if kb_backend == 'snapshot':
+            from src.kb.snapshot import SnapshotInterface
+            self.kb = SnapshotInterface() if kb_dir is None else SnapshotInterface(prolog_dir=kb_dir)
+        else:
+            from src.kb.interface import PrologInterface
+            self.kb = PrologInterface() if kb_dir is None else PrologInterface(rule_file=os.path.join(kb_dir, "reasoning.pl"))
+        self.ai = AIHeuristic(atoms=self.atoms)
         self.polypharmacy_penalty = 20.0
-        self.atom_mapping = {}
-        
-        base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        mapping_path = os.path.join(base_dir, "kb", "prolog", "atom_mapping.json")
-        if os.path.exists(mapping_path):
-            with open(mapping_path, 'r', encoding='utf-8') as f:
-                self.atom_mapping = json.load(f)
+        self.stats = {}
+
+        self._approval_cache = LRUCache(MAX_APPROVAL_ENTRIES)
+        self._safety_cache = LRUCache(MAX_SAFETY_ENTRIES)
+        self._conflict_graph = None
+        self._conflict_graph_failed = False
+
+        self.workers = workers
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="sss-score") if workers > 1 else None
+
+        # Ricaricamento a caldo degli artefatti (`src/sss/reload.py`): le nuove
+        # versioni vengono installate solo all'inizio di una ricerca
+        self.reloader = None
+        self.model_version = 0
+        self.artifact_versions = {}
+
+    def refresh_artifacts(self) -> list:
+        """
+        Installa le versioni degli artefatti preparate in background, se presenti.
+
+        Returns:
+            list[str]: Gruppi di artefatti aggiornati (vuota senza reloader).
+        """
+        if self.reloader is None:
+            return []
+        return self.reloader.apply_pending()
+
+    def invalidate_kb_caches(self) -> None:
+        """Svuota le cache che dipendono dalla T-Box/A-Box."""
+        self._approval_cache.clear()
+        self._safety_cache.clear()
+        self._conflict_graph = None
+        self._conflict_graph_failed = False
+
+    def close(self) -> None:
+        """Termina i thread del pool di valutazione, se presente."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _get_approvals(self, disease_atom: str) -> dict:
+        """
+        Restituisce la tabella di approvazione di una patologia, interrogando
+        la T-Box una sola volta per patologia.
+
+        Args:
+            disease_atom (str): L'atomo Prolog della patologia.
+
+        Returns:
+            dict: Mappa {farmaco_atom: linea_terapeutica}.
+        """
+        approvals = self._approval_cache.get(disease_atom)
+        if approvals is None:
+            metrics.incr('sss.approval_cache.miss')
+            approvals = self.kb.get_approvals(disease_atom)
+            self._approval_cache[disease_atom] = approvals
+        elif metrics.enabled:
+            metrics.incr('sss.approval_cache.hit')
+        return approvals
 
     def _get_candidates_for_disease(self, disease_atom: str) -> set:
         """
@@ -72,11 +174,36 @@ class TherapyOptimizer:
         Returns:
             set: Insieme degli atomi Prolog dei farmaci candidati.
         """
-        candidates = set()
-        query_result = list(self.kb.prolog.query(f"approved_for(Drug, '{disease_atom}', _)"))
-        for res in query_result:
-            candidates.add(res['Drug'])
-        return candidates
+        return set(self._get_approvals(disease_atom))
+
+    def _prepare_conflict_graph(self, disease_atoms: frozenset) -> None:
+        """
+        Garantisce che il grafo dei conflitti copra i candidati delle patologie target.
+
+        Il grafo di una ricerca precedente viene riusato se contiene già tutti
+        i candidati; altrimenti viene ricostruito sui soli candidati di questa
+        ricerca, così che la memoria dipenda dall'universo di una singola
+        ricerca e non dalla storia delle richieste. Oltre `MAX_GRAPH_DRUGS`
+        candidati, se il backend della KB non fornisce `conflict_bitsets` o se
+        la sua costruzione è fallita (es. regole non coerenti con la T-Box,
+        fino al prossimo `invalidate_kb_caches`), la sicurezza dei regimi resta
+        affidata a `verify_therapy`.
+        """
+        universe = set().union(*(self._get_candidates_for_disease(d) for d in disease_atoms))
+        graph = self._conflict_graph
+        if graph is not None and graph.covers(universe):
+            return
+        self._conflict_graph = None
+        if self._conflict_graph_failed or not hasattr(self.kb, 'conflict_bitsets') or len(universe) > MAX_GRAPH_DRUGS:
+            return
+
+        drugs = sorted(universe)
+        try:
+            self._conflict_graph = ConflictGraph(drugs, *self.kb.conflict_bitsets(drugs))
+            metrics.incr('sss.conflict_graph.build')
+        except Exception as e:
+            print(f"[SSS-WARN] Grafo dei conflitti non disponibile, verifica dei regimi sulla KB: {e}")
+            self._conflict_graph_failed = True
 
     def _get_covered_diseases(self, drug_atom: str, target_diseases: frozenset) -> set:
         """
@@ -90,16 +217,12 @@ class TherapyOptimizer:
         Returns:
             set: Sottoinsieme delle patologie coperte dal farmaco.
         """
-        covered = set()
-        for disease in target_diseases:
-            if list(self.kb.prolog.query(f"approved_for('{drug_atom}', '{disease}', _)")):
-                covered.add(disease)
-        return covered
+        return {d for d in target_diseases if drug_atom in self._get_approvals(d)}
 
     def _get_disease_specific_cost(self, drug_atom: str, target_disease: str) -> float:
         """
         Calcola il costo prescrittivo dando priorità alla linea guida clinica.
-        Interroga Prolog per la Linea di trattamento (1=Prima scelta, 2=Seconda, 3=Estrema ratio).
+        Usa la Linea di trattamento dedotta dalla T-Box (1=Prima scelta, 2=Seconda, 3=Estrema ratio).
         
         Args:
             drug_atom (str): Il farmaco da valutare.
@@ -108,19 +231,13 @@ class TherapyOptimizer:
         Returns:
             float: Costo algoritmico basato sull'appropriatezza clinica.
         """
-        try:
-            res = list(self.kb.prolog.query(f"approved_for('{drug_atom}', '{target_disease}', Line)"))
-            if res:
-                line = int(res[0]['Line'])
-                
-                if line == 1:
-                    return 0.0
-                elif line == 2:
-                    return 2000.0
-                elif line == 3:
-                    return 4000.0
-        except Exception:
-            pass
+        line = self._get_approvals(target_disease).get(drug_atom)
+        if line == 1:
+            return 0.0
+        elif line == 2:
+            return 2000.0
+        elif line == 3:
+            return 4000.0
         
         return 10000.0
 
@@ -128,6 +245,12 @@ class TherapyOptimizer:
         """
         Interroga la T-Box (Prolog/FOL) per rilevare interazioni farmacologiche (DDI)
         e calcola la conseguente penalità sul costo reale g(n).
+
+        Il risultato dipende solo dall'insieme dei farmaci del regime e non
+        dall'ordine in cui sono stati aggiunti. Se i farmaci appartengono al
+        grafo dei conflitti dei candidati la valutazione è un AND tra bitset
+        (conflitti 'high') e un conteggio di bit (coppie 'medium'); altrimenti
+        ogni regime distinto viene valutato da Prolog una sola volta.
         
         Args:
             current_drugs (dict): I farmaci già prescritti nello stato corrente.
@@ -135,38 +258,223 @@ class TherapyOptimizer:
             
         Returns:
             float: Penalità per l'A*. Restituisce float('inf') in caso di 
-                   controindicazioni assolute (pruning del ramo).
+                   controindicazioni assolute o di verifica non riuscita
+                   (pruning del ramo).
         """
         drugs_to_test = list(current_drugs.keys()) + [new_drug_atom]
         if len(drugs_to_test) < 2: 
             return 0.0
-            
+
+        if self._conflict_graph is not None:
+            verdict = self._conflict_graph.assess(current_drugs, new_drug_atom)
+            if verdict is not None:
+                hard, medium_pairs = verdict
+                return float('inf') if hard else 500.0 * medium_pairs
+
+        regimen = frozenset(drugs_to_test)
+        cached = self._safety_cache.get(regimen)
+        if cached is not None:
+            if metrics.enabled:
+                metrics.incr('sss.safety_cache.hit')
+            return cached
+        metrics.incr('sss.safety_cache.miss')
+
+        self.stats['regimens_costed'] = self.stats.get('regimens_costed', 0) + 1
+        penalty = 0.0
         validation = self.kb.verify_therapy(drugs_to_test)
         if not validation['safe']:
-            penalty = 0.0
             for conflict in validation.get('conflicts', []):
                 severity = conflict.get('severity', 'unknown')
                 if severity == 'high': 
-                    return float('inf')
+                    penalty = float('inf')
+                    break
                 elif severity == 'medium': 
                     penalty += 500.0
+
+        # Un errore della KB scarta il regime senza memorizzarlo: la stessa
+        # combinazione viene riverificata se raggiunta da un altro ramo
+        if 'error' in validation:
+            metrics.incr('sss.safety_check.error')
             return penalty
-        return 0.0
+        self._safety_cache[regimen] = penalty
+        return penalty
+
+    def _drug_penalty(self, patient_profile: dict, drug_atom: str, drug_penalties: dict,
+                      pending: dict = None) -> float:
+        """
+        Restituisce la penalità ML/BN del farmaco, calcolandola una sola volta
+        per paziente e memorizzandola in `drug_penalties`.
+
+        Se la penalità è già in calcolo nel pool (`pending`, farmaco → Future)
+        ne attende il risultato invece di ricalcolarla.
+        """
+        penalty = drug_penalties.get(drug_atom)
+        if penalty is None:
+            future = pending.pop(drug_atom, None) if pending else None
+            if future is not None:
+                penalty = future.result()
+            else:
+                penalty = self.ai.evaluate_drug_penalty(patient_profile, drug_atom)
+            drug_penalties[drug_atom] = penalty
+            self.stats['drug_penalties_evaluated'] += 1
+        elif metrics.enabled:
+            metrics.incr('sss.drug_penalty_cache.hit')
+        return penalty
+
+    def _submit_penalties(self, patient_profile: dict, successors: list, current_drugs: frozenset,
+                          drug_penalties: dict) -> dict:
+        """
+        Avvia nel pool il calcolo delle penalità ML/BN dei successori non ancora valutati.
+
+        Le penalità vengono poi consumate da `_step_cost` nell'ordine canonico
+        dei successori, mentre il thread chiamante esegue le query DDI sulla
+        Knowledge Base: il risultato e i contatori sono identici a quelli
+        della valutazione sequenziale.
+
+        Returns:
+            dict: Mappa {farmaco_atom: Future}; vuota senza pool.
+        """
+        if self._executor is None:
+            return {}
+        pending = {}
+        for drug, *_ in successors:
+            if drug not in current_drugs and drug not in drug_penalties and drug not in pending:
+                pending[drug] = self._executor.submit(self.ai.evaluate_drug_penalty, patient_profile, drug)
+        return pending
+
+    def _step_cost(self, patient_profile: dict, selected_drugs: dict, drug_atom: str,
+                   target: str, drug_penalties: dict, pending: dict = None) -> float:
+        """
+        Calcola il costo del passo che aggiunge un nuovo farmaco al regime per
+        trattare `target`: polifarmacia, linea terapeutica, rischio ML/BN e DDI.
+
+        Returns:
+            float: Il costo del passo, oppure float('inf') se il regime risultante
+                contiene una controindicazione assoluta.
+        """
+        step_g = 0.0
+        step_g += self.polypharmacy_penalty
+        step_g += self._get_disease_specific_cost(drug_atom, target)
+        step_g += self._drug_penalty(patient_profile, drug_atom, drug_penalties, pending)
+
+        safety_penalty = self._calculate_safety_penalty(selected_drugs, drug_atom)
+        if safety_penalty == float('inf'):
+            return safety_penalty
+        step_g += safety_penalty
+        return step_g
+
+    def build_incumbent(self, patient_profile: dict, disease_atoms: frozenset, preferred_drugs,
+                        drug_penalties: dict) -> TherapyNode:
+        """
+        Costruisce una soluzione ammissibile a partire da un piano precedente.
+
+        Ripercorre l'espansione canonica di `solve` (a ogni passo la patologia
+        residua lessicograficamente minima): se uno dei farmaci preferiti è
+        approvato per la patologia viene riutilizzato, altrimenti si sceglie
+        il candidato di costo minimo. Il costo del nodo restituito è quindi il
+        costo di un cammino reale dell'albero di ricerca, ed è un limite
+        superiore valido per l'ottimo.
+
+        Args:
+            patient_profile (dict): Profilo clinico del paziente.
+            disease_atoms (frozenset): Patologie target (atomi validi).
+            preferred_drugs (iterable): Farmaci del piano precedente.
+            drug_penalties (dict): Cache delle penalità ML/BN del paziente.
+
+        Returns:
+            TherapyNode: Il nodo goal del cammino, oppure None se il
+                completamento greedy non trova un regime sicuro.
+        """
+        preferred = set(preferred_drugs)
+        selected, remaining, g = {}, disease_atoms, 0.0
+
+        while remaining:
+            target = min(remaining)
+            candidates = self._get_candidates_for_disease(target)
+            reused = candidates & preferred
+            best = None
+            for drug in sorted(reused or candidates):
+                step_g = self._step_cost(patient_profile, selected, drug, target, drug_penalties)
+                if step_g != float('inf') and (best is None or step_g < best[1]):
+                    best = (drug, step_g)
+            if best is None:
+                return None
 
-    def solve(self, patient_profile: dict, target_diseases: list) -> TherapyNode:
+            drug, step_g = best
+            covered = self._get_covered_diseases(drug, remaining)
+            selected = {d: set(c) for d, c in selected.items()}
+            selected[drug] = covered
+            remaining = frozenset(remaining - covered)
+            g = g + step_g
+
+        return TherapyNode(selected, remaining, g, 0.0)
+
+    def _publish_stats(self) -> None:
+        """Riversa i contatori dell'ultima esecuzione nel registro delle metriche."""
+        if not metrics.enabled:
+            return
+        for key, value in self.stats.items():
+            if key in GAUGE_STATS:
+                metrics.gauge_max(f'sss.{key}', value)
+            else:
+                metrics.incr(f'sss.{key}', value)
+        metrics.gauge_max('sss.safety_cache.size', len(self._safety_cache))
+
+    @metrics.timed('sss.solve')
+    def solve(self, patient_profile: dict, target_diseases: list, drug_penalties: dict = None,
+              incumbent_drugs=None) -> TherapyNode:
         """
         Esegue l'algoritmo A* esplorando lo spazio logico della T-Box per trovare
         la combinazione farmacologica ottima (minimo rischio globale) che copre
         tutte le patologie target.
 
+        La generazione dei successori segue un ordine canonico: ogni nodo viene
+        espanso sulla patologia residua lessicograficamente minima, e gli stati
+        già chiusi vengono scartati prima di calcolarne i costi. Poiché l'euristica
+        è consistente (ogni passo costa almeno la penalità di polifarmacia), uno
+        stato chiuso non deve mai essere riaperto. Le penalità ML/BN di ciascun
+        farmaco vengono calcolate una sola volta per esecuzione.
+
+        Con `incumbent_drugs` il piano indicato viene completato in una soluzione
+        ammissibile (`build_incumbent`) il cui costo fa da limite superiore: i
+        successori con f(n) maggiore vengono scartati senza entrare in frontiera.
+        Poiché l'euristica è ammissibile la soluzione restituita non cambia.
+
+        Con un `ArtifactReloader` collegato, le nuove versioni di modelli e KB
+        vengono installate prima di iniziare: una ricerca in corso termina
+        sempre sulla versione con cui è partita.
+
         Args:
             patient_profile (dict): Profilo clinico del paziente (usato dai modelli ML/BBN).
             target_diseases (list): Lista delle patologie testuali da curare.
+            drug_penalties (dict, optional): Cache {farmaco_atom: penalità ML/BN}
+                dello stesso paziente, aggiornata in place (es. da `TherapySession`).
+            incumbent_drugs (iterable, optional): Farmaci di un piano precedente
+                da usare come soluzione incumbent.
 
         Returns:
             TherapyNode: Il nodo terminale contenente la terapia ottima e il suo costo, 
                          oppure None se non esiste alcuna soluzione sicura.
+
+        Note:
+            Al termine della ricerca `self.stats` contiene i contatori dell'esecuzione
+            (nodi espansi e generati, successori duplicati scartati prima del costo,
+            regimi e farmaci valutati, successori scartati dal limite dell'incumbent,
+            inserimenti nell'heap, estrazioni duplicate scartate, dimensione massima
+            della frontiera). Con il registro delle metriche abilitato
+            (`src/metrics.py`) gli stessi valori vengono accumulati con prefisso
+            `sss.`, insieme agli hit/miss delle cache.
         """
+        self.refresh_artifacts()
+        self.stats = {
+            'nodes_expanded': 0,
+            'nodes_generated': 0,
+            'pruned_duplicates': 0,
+            'regimens_costed': 0,
+            'drug_penalties_evaluated': 0,
+            'pruned_by_bound': 0,
+        }
+
         valid_disease_atoms = set()
         for d in target_diseases:
             atom = to_prolog_atom(d)
@@ -179,57 +487,83 @@ class TherapyOptimizer:
         if not disease_atoms: 
             print("[SSS-ERROR] Nessuna patologia curabile fornita.")
             return None
+        self._prepare_conflict_graph(disease_atoms)
         
-        open_list = []
+        frontier = IndexedFrontier()
         visited_states = {} 
+        closed_states = set()
+        if drug_penalties is None:
+            drug_penalties = {}
+
+        incumbent = None
+        upper_bound = float('inf')
+        if incumbent_drugs is not None:
+            incumbent = self.build_incumbent(patient_profile, disease_atoms, incumbent_drugs, drug_penalties)
+            if incumbent is not None:
+                upper_bound = incumbent.f
         
         start_node = TherapyNode(selected_drugs={}, remaining_diseases=disease_atoms, g=0.0, h=0.0)
-        heapq.heappush(open_list, start_node)
+        start_sig = (frozenset(), disease_atoms)
+        visited_states[start_sig] = 0.0
+        frontier.push(start_sig, start_node)
         
         print("[SSS] Avvio ricerca A* nello spazio ontologico (T-Box)...")
         
-        while open_list:
-            current_node = heapq.heappop(open_list)
+        while frontier:
+            current_node = frontier.pop()
             
             if not current_node.remaining_diseases:
+                self.stats.update(frontier.stats())
+                self._publish_stats()
                 return current_node
+
+            current_drugs = frozenset(current_node.selected_drugs)
+            closed_states.add((current_drugs, current_node.remaining_diseases))
+            self.stats['nodes_expanded'] += 1
                 
-            target = next(iter(current_node.remaining_diseases))
+            target = min(current_node.remaining_diseases)
             candidates = self._get_candidates_for_disease(target)
             
             if not candidates: 
                 continue
                 
-            for drug in candidates:
-                new_selected = copy.deepcopy(current_node.selected_drugs)
+            successors = []
+            for drug in sorted(candidates):
                 covered_diseases = self._get_covered_diseases(drug, current_node.remaining_diseases)
-                
                 new_remaining = frozenset(current_node.remaining_diseases - covered_diseases)
-                
+
+                state_sig = (current_drugs | {drug}, new_remaining)
+                if state_sig in closed_states:
+                    self.stats['pruned_duplicates'] += 1
+                    continue
+                successors.append((drug, covered_diseases, new_remaining, state_sig))
+
+            pending = self._submit_penalties(patient_profile, successors, current_drugs, drug_penalties)
+
+            for drug, covered_diseases, new_remaining, state_sig in successors:
                 step_g = 0.0
-                if drug not in new_selected:
-                    step_g += self.polypharmacy_penalty
-                    step_g += self._get_disease_specific_cost(drug, target)
-                    step_g += self.ai.evaluate_drug_penalty(patient_profile, drug)
-                    
-                    safety_penalty = self._calculate_safety_penalty(current_node.selected_drugs, drug)
-                    if safety_penalty == float('inf'): 
+                if drug not in current_drugs:
+                    step_g = self._step_cost(patient_profile, current_node.selected_drugs, drug, target,
+                                             drug_penalties, pending)
+                    if step_g == float('inf'): 
                         continue
-                    step_g += safety_penalty
                 
                 new_g = current_node.g + step_g
-                
-                if drug not in new_selected: 
-                    new_selected[drug] = set()
-                new_selected[drug].update(covered_diseases)
-                
                 new_h = self.ai.calculate_admissible_h(list(new_remaining))
-                new_node = TherapyNode(new_selected, new_remaining, new_g, new_h)
-                
-                state_sig = (frozenset(new_selected.keys()), new_remaining)
+                if new_g + new_h > upper_bound:
+                    self.stats['pruned_by_bound'] += 1
+                    continue
+                if state_sig in visited_states and new_g >= visited_states[state_sig]:
+                    continue
+                visited_states[state_sig] = new_g
+
+                new_selected = {d: set(covered) for d, covered in current_node.selected_drugs.items()}
+                new_selected.setdefault(drug, set()).update(covered_diseases)
                 
-                if state_sig not in visited_states or new_g < visited_states[state_sig]:
-                    visited_states[state_sig] = new_g
-                    heapq.heappush(open_list, new_node)
-                    
-        return None
\ No newline at end of file
+                new_node = TherapyNode(new_selected, new_remaining, new_g, new_h)
+                self.stats['nodes_generated'] += 1
+                frontier.push(state_sig, new_node)
+
+        self.stats.update(frontier.stats())
+        self._publish_stats()
+        return incumbent
\ No newline at end of file
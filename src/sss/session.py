@@ -0,0 +1,113 @@
+# File: src/sss/session.py
+
+"""
+Sessione di prescrizione incrementale.
+
+Nella pratica clinica la lista delle patologie da trattare cambia per passi
+successivi (una diagnosi aggiunta, una rimossa) per lo stesso paziente.
+`TherapySession` conserva tra una richiesta e l'altra lo stato che non
+dipende dalla lista dei target:
+
+  - le penalità ML/BN dei farmaci già valutati per il paziente;
+  - le tabelle di approvazione e le penalità DDI dei regimi, che dipendono
+    solo dalla T-Box e sono già condivise dall'ottimizzatore;
+  - il piano dell'ultima soluzione, usato come incumbent della nuova ricerca.
+
+A ogni modifica dei target solo i farmaci candidati per le nuove patologie
+vengono valutati dai modelli, e i successori più costosi del piano
+precedente (completato per le nuove patologie) vengono scartati senza entrare
+in frontiera.
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from src.sss.search import TherapyOptimizer, TherapyNode
+
+
+class TherapySession:
+    """
+    Stato di ricerca di un singolo paziente tra più richieste successive.
+
+    Attributes:
+        optimizer (TherapyOptimizer): Ottimizzatore condiviso (KB, modelli, cache della T-Box).
+        patient_profile (dict): Profilo clinico del paziente, fissato per la sessione.
+        targets (list[str]): Patologie target dell'ultima richiesta, in forma testuale.
+        solution (TherapyNode): Ultima soluzione trovata, oppure None.
+        drug_penalties (dict): Penalità ML/BN {farmaco_atom: penalità} già calcolate.
+    """
+
+    def __init__(self, optimizer: TherapyOptimizer, patient_profile: dict):
+        """
+        Args:
+            optimizer (TherapyOptimizer): Ottimizzatore da usare per le ricerche.
+            patient_profile (dict): Profilo clinico del paziente. Un profilo diverso
+                invalida le penalità ML/BN e richiede una nuova sessione.
+        """
+        self.optimizer = optimizer
+        self.patient_profile = patient_profile
+        self.targets = []
+        self.solution = None
+        self.drug_penalties = {}
+        self._model_version = optimizer.model_version
+
+    @property
+    def stats(self) -> dict:
+        """Contatori dell'ultima ricerca eseguita dalla sessione."""
+        return self.optimizer.stats
+
+    def solve(self, target_diseases: list) -> TherapyNode:
+        """
+        Risolve il problema per la lista di patologie indicata, riutilizzando
+        lo stato della sessione.
+
+        Se nel frattempo i modelli sono stati ricaricati (`optimizer.model_version`)
+        le penalità ML/BN memorizzate vengono scartate; il piano precedente resta
+        valido come incumbent, perché il suo costo viene ricalcolato.
+
+        Args:
+            target_diseases (list[str]): Patologie testuali da curare.
+
+        Returns:
+            TherapyNode: La terapia ottima, oppure None se non esiste una soluzione sicura.
+        """
+        self.optimizer.refresh_artifacts()
+        if self._model_version != self.optimizer.model_version:
+            self.drug_penalties.clear()
+            self._model_version = self.optimizer.model_version
+
+        incumbent = list(self.solution.selected_drugs) if self.solution is not None else None
+        solution = self.optimizer.solve(self.patient_profile, target_diseases,
+                                        drug_penalties=self.drug_penalties,
+                                        incumbent_drugs=incumbent)
+        self.targets = list(target_diseases)
+        if solution is not None:
+            self.solution = solution
+        return solution
+
+    def add_diseases(self, diseases: list) -> TherapyNode:
+        """
+        Aggiunge patologie ai target correnti e ricalcola la terapia.
+
+        Args:
+            diseases (list[str]): Patologie testuali da aggiungere.
+
+        Returns:
+            TherapyNode: La nuova terapia ottima, oppure None.
+        """
+        return self.solve(self.targets + [d for d in diseases if d not in self.targets])
+
+    def remove_diseases(self, diseases: list) -> TherapyNode:
+        """
+        Rimuove patologie dai target correnti e ricalcola la terapia.
+
+        Args:
+            diseases (list[str]): Patologie testuali da rimuovere.
+
+        Returns:
+            TherapyNode: La nuova terapia ottima, oppure None.
+        """
+        removed = set(diseases)
+        return self.solve([d for d in self.targets if d not in removed])
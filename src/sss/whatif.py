@@ -0,0 +1,183 @@
+# File: src/sss/whatif.py
+
+"""
+Analisi di sensibilità "what-if" sul profilo del paziente.
+
+Per capire come cambierebbe la terapia se il paziente fosse più anziano, più
+leggero o avesse un'altra comorbidità, `what_if` risolve il profilo base e le
+sue varianti come un'unica richiesta. Tra le varianti viene condiviso tutto
+ciò che non dipende dal profilo:
+
+  - candidati, linee di approvazione e penalità DDI dei regimi (cache della
+    T-Box dell'ottimizzatore);
+  - rischio RF e fragilità BN già calcolati, indicizzati dagli input
+    discretizzati dei modelli (`AIHeuristic.profile_key`): una variante
+    ricalcola le penalità solo se cambia l'intervallo tra le soglie di split
+    della foresta, la fascia della rete o la codifica delle comorbidità;
+  - il piano base, usato come incumbent della ricerca di ogni variante.
+
+Esempio:
+    result = what_if(optimizer, profile, ['pain', 'hypertension'], [
+        {'age_delta': 10},
+        {'weight': 48.0},
+        {'add_concomitant': 'diabetes', 'label': 'diabetico'},
+    ])
+    for variant in result['variants']:
+        print(variant['label'], variant['plan'], variant['changed'])
+"""
+
+import os
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from src.sss.search import TherapyOptimizer, TherapyNode
+
+# Chiavi del profilo sostituibili da una perturbazione
+PROFILE_KEYS = ('age', 'sex', 'weight', 'concomitant')
+
+
+def apply_perturbation(base_profile: dict, perturbation: dict) -> dict:
+    """
+    Costruisce il profilo di una variante.
+
+    Una perturbazione è un dizionario con:
+      - 'age', 'sex', 'weight', 'concomitant': valori che sostituiscono quelli base;
+      - 'age_delta', 'weight_delta': variazioni da sommare a età e peso;
+      - 'add_concomitant': comorbidità (stringa o lista) da aggiungere all'anamnesi;
+      - 'label' (opzionale): nome della variante nel risultato.
+
+    Args:
+        base_profile (dict): Profilo clinico di partenza, non modificato.
+        perturbation (dict): Modifiche da applicare.
+
+    Returns:
+        dict: Il profilo della variante.
+
+    Raises:
+        ValueError: Se la perturbazione contiene una chiave non supportata.
+    """
+    profile = dict(base_profile)
+    for key, value in perturbation.items():
+        if key in PROFILE_KEYS:
+            profile[key] = value
+        elif key not in ('age_delta', 'weight_delta', 'add_concomitant', 'label'):
+            raise ValueError(f"[WHAT-IF] Perturbazione non supportata: '{key}'")
+
+    profile['age'] = profile['age'] + perturbation.get('age_delta', 0)
+    profile['weight'] = profile['weight'] + perturbation.get('weight_delta', 0)
+
+    added = perturbation.get('add_concomitant')
+    if added:
+        added = [added] if isinstance(added, str) else list(added)
+        current = profile.get('concomitant') or []
+        current = [current] if isinstance(current, str) else list(current)
+        # 'none' indica un'anamnesi vuota e non va affiancato a una comorbidità
+        current = [c for c in current if c.strip().lower() != 'none']
+        profile['concomitant'] = current + [c for c in added if c not in current]
+    return profile
+
+
+def describe(perturbation: dict) -> str:
+    """Etichetta di una variante: 'label' se presente, altrimenti le modifiche applicate."""
+    if 'label' in perturbation:
+        return str(perturbation['label'])
+    return ", ".join(f"{key}={value}" for key, value in perturbation.items())
+
+
+def plan_of(node: TherapyNode) -> dict:
+    """Piano di un nodo soluzione in forma canonica: {farmaco: patologie coperte ordinate}."""
+    if node is None:
+        return None
+    return {drug: sorted(diseases) for drug, diseases in sorted(node.selected_drugs.items())}
+
+
+def what_if(optimizer: TherapyOptimizer, base_profile: dict, target_diseases: list,
+            perturbations: list) -> dict:
+    """
+    Risolve il profilo base e le sue varianti condividendo le valutazioni.
+
+    Le varianti con gli stessi input discretizzati del profilo base (o di una
+    variante precedente) riusano anche la stessa tabella {farmaco: penalità}
+    e non interrogano i modelli. Tutte le ricerche usano la stessa versione di
+    modelli e KB: un `ArtifactReloader` collegato installa le nuove versioni
+    solo all'inizio dell'analisi.
+
+    Args:
+        optimizer (TherapyOptimizer): Ottimizzatore condiviso.
+        base_profile (dict): Profilo clinico di riferimento.
+        target_diseases (list[str]): Patologie testuali da curare.
+        perturbations (list[dict]): Varianti del profilo (vedi `apply_perturbation`).
+
+    Returns:
+        dict: Risultato dell'analisi, con le chiavi:
+            - 'base': voce del profilo base;
+            - 'variants': una voce per perturbazione, nello stesso ordine;
+            - 'stats': profili risolti, profili distinti per i modelli,
+              inferenze RF/BN eseguite, nodi generati e tempo totale;
+            - 'artifact_versions': versioni degli artefatti usate.
+            Ogni voce contiene 'label', 'profile', 'solution' (TherapyNode o
+            None), 'plan', 'cost', 'changed' (piano diverso da quello base),
+            'reused_penalties' (penalità già calcolate per un profilo
+            equivalente) e 'stats' (contatori della ricerca).
+
+    Raises:
+        ValueError: Se una perturbazione contiene una chiave non supportata.
+    """
+    profiles = [apply_perturbation(base_profile, p) for p in perturbations]
+
+    optimizer.refresh_artifacts()
+    reloader, optimizer.reloader = optimizer.reloader, None
+    evaluations_before = dict(optimizer.ai.evaluations)
+    start = time.perf_counter()
+
+    penalty_tables = {}
+    distinct_inputs = 0
+    incumbent = None
+    entries = []
+    try:
+        for label, profile in [('base', base_profile)] + list(zip(map(describe, perturbations), profiles)):
+            key = optimizer.ai.profile_key(profile)
+            reused = key is not None and key in penalty_tables
+            if key is None:
+                drug_penalties = {}
+            else:
+                drug_penalties = penalty_tables.setdefault(key, {})
+            distinct_inputs += not reused
+
+            solution = optimizer.solve(profile, target_diseases, drug_penalties=drug_penalties,
+                                       incumbent_drugs=incumbent)
+            plan = plan_of(solution)
+            if not entries and solution is not None:
+                incumbent = list(solution.selected_drugs)
+            entries.append({
+                'label': label,
+                'profile': profile,
+                'solution': solution,
+                'plan': plan,
+                'cost': None if solution is None else solution.g,
+                'changed': bool(entries) and plan != entries[0]['plan'],
+                'reused_penalties': reused,
+                'stats': dict(optimizer.stats)
+            })
+    finally:
+        optimizer.reloader = reloader
+
+    stats = {
+        'profiles': len(entries),
+        'distinct_model_inputs': distinct_inputs,
+        'risk_evaluations': optimizer.ai.evaluations['risk'] - evaluations_before['risk'],
+        'frailty_evaluations': optimizer.ai.evaluations['frailty'] - evaluations_before['frailty'],
+        'nodes_generated': sum(e['stats'].get('nodes_generated', 0) for e in entries),
+        'elapsed_s': round(time.perf_counter() - start, 3)
+    }
+    print(f"[WHAT-IF] {stats['profiles']} profili ({stats['distinct_model_inputs']} distinti per i modelli): "
+          f"{stats['risk_evaluations']} inferenze RF, {stats['frailty_evaluations']} BN in {stats['elapsed_s']:.2f} s")
+
+    return {
+        'base': entries[0],
+        'variants': entries[1:],
+        'stats': stats,
+        'artifact_versions': dict(optimizer.artifact_versions)
+    }
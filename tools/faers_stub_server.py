@@ -0,0 +1,121 @@
+"""
+Server HTTP locale che imita l'endpoint openFDA /drug/event.json.
+
+Serve report FAERS sintetici ma deterministici (dipendono solo dal nome del
+farmaco cercato), così che tools/generate_dataset_faers.py possa essere
+provato offline, compresi i casi di errore: con --error-rate una frazione
+delle richieste riceve 429 (con Retry-After) o 503, per esercitare retry e
+backoff; i farmaci il cui hash è multiplo di 7 rispondono 404 come fa
+openFDA per le ricerche senza risultati.
+
+Esempio:
+    python tools/faers_stub_server.py --port 8765 --error-rate 0.2
+    python tools/generate_dataset_faers.py --api-url http://127.0.0.1:8765/drug/event.json \\
+        --rate 6000 --concurrency 8 --max-drugs 50 --output /tmp/faers_test.csv
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+INDICATIONS = ['type 2 diabetes', 'essential hypertension', 'blood pressure', 'cardiac failure',
+               'back pain', 'rheumatoid arthritis', 'hypercholesterolaemia', 'depression',
+               'anxiety', 'product used for unknown indication']
+REACTIONS = ['Nausea', 'Dizziness', 'Headache', 'Rash', 'Fatigue', 'Haemorrhage', 'Vomiting']
+
+
+def _seed_for(drug):
+    return int(hashlib.sha256(drug.encode('utf-8')).hexdigest()[:12], 16)
+
+
+def canned_reports(drug, limit):
+    """Report openFDA sintetici per un farmaco, sempre uguali a parità di input."""
+    seed = _seed_for(drug)
+    rng = random.Random(seed)
+    n = min(limit, rng.randint(0, 3 * limit // 2))
+    reports = []
+    for _ in range(n):
+        patient = {
+            'patientonsetage': str(rng.randint(1, 99)),
+            # Una parte dei report usa unità di età diverse dagli anni, come nei dati reali
+            'patientonsetageunit': '801' if rng.random() < 0.85 else '802',
+            'patientsex': rng.choice(['1', '2', '0']),
+            'drug': [{'medicinalproduct': drug.upper(), 'drugindication': rng.choice(INDICATIONS)}],
+            'reaction': [{'reactionmeddrapt': rng.choice(REACTIONS)}],
+        }
+        if rng.random() < 0.7:
+            patient['patientweight'] = f"{rng.uniform(40, 130):.1f}"
+        reports.append({'safetyreportid': str(rng.randint(10**7, 10**8)), 'patient': patient})
+    return reports
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    error_rate = 0.0
+    retry_after = 1
+    _lock = threading.Lock()
+    _rng = random.Random(0)
+    hits = 0
+
+    def _send(self, status, payload, headers=None):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path != '/drug/event.json':
+            return self._send(404, {'error': {'code': 'NOT_FOUND', 'message': 'Unknown endpoint'}})
+
+        with StubHandler._lock:
+            StubHandler.hits += 1
+            roll = StubHandler._rng.random()
+        if roll < self.error_rate / 2:
+            return self._send(429, {'error': {'code': 'OVER_RATE_LIMIT'}}, {'Retry-After': str(self.retry_after)})
+        if roll < self.error_rate:
+            return self._send(503, {'error': {'code': 'SERVICE_UNAVAILABLE'}})
+
+        query = parse_qs(url.query)
+        match = re.search(r'"(.+)"', query.get('search', [''])[0])
+        drug = match.group(1) if match else ''
+        limit = int(query.get('limit', ['100'])[0])
+
+        reports = canned_reports(drug, limit)
+        if not drug or _seed_for(drug) % 7 == 0 or not reports:
+            return self._send(404, {'error': {'code': 'NOT_FOUND', 'message': 'No matches found!'}})
+        self._send(200, {'meta': {'results': {'skip': 0, 'limit': limit, 'total': len(reports)}},
+                         'results': reports})
+
+    def log_message(self, format, *args):
+        pass # Silenzioso: il bot di mining produce già il proprio log
+
+
+def make_server(host='127.0.0.1', port=8765, error_rate=0.0, retry_after=1):
+    StubHandler.error_rate = error_rate
+    StubHandler.retry_after = retry_after
+    return ThreadingHTTPServer((host, port), StubHandler)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Stub locale dell'API openFDA drug/event")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Frazione di risposte 429/503")
+    parser.add_argument("--retry-after", type=int, default=1, help="Valore dell'header Retry-After sui 429")
+    args = parser.parse_args()
+
+    server = make_server(args.host, args.port, args.error_rate, args.retry_after)
+    print(f"[STUB] openFDA stub in ascolto su http://{args.host}:{args.port}/drug/event.json")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
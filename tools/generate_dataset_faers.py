@@ -1,26 +1,124 @@
 import pandas as pd
 import numpy as np
 import requests
+import asyncio
+import argparse
+import hashlib
+import json
 import time
 import os
 import random
+from requests.adapters import HTTPAdapter
 from tqdm import tqdm
 
+OPENFDA_EVENT_URL = "https://api.fda.gov/drug/event.json"
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+class TokenBucket:
+    """
+    Rate limiter a token bucket per coroutine asyncio.
+    Ogni richiesta consuma un token; i token si ricaricano a `rate` al secondo
+    fino a `capacity`, che è anche il burst massimo consentito.
+    """
+    def __init__(self, rate, capacity=1):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class BufferedDatasetWriter:
+    """
+    Writer unico del dataset: accumula i blocchi dei farmaci in memoria e li
+    scrive sul CSV (aperto una sola volta) ogni `buffer_rows` righe.
+    Il checkpoint dei farmaci di un blocco viene scritto solo dopo che le loro
+    righe sono state salvate, con la dimensione del CSV a quel punto.
+    """
+    def __init__(self, path, checkpoint_path, buffer_rows=50_000):
+        self.path = path
+        self.checkpoint_path = checkpoint_path
+        self.buffer_rows = buffer_rows
+        self.rows_written = 0
+        self._chunks, self._drugs, self._buffered = [], [], 0
+        self._fh = open(path, 'a', encoding='utf-8', newline='')
+        self._header = self._fh.tell() == 0
+
+    def add(self, drug, df_chunk=None):
+        """Accoda le righe di un farmaco (None = farmaco senza casi utili, solo checkpoint)."""
+        if df_chunk is not None and len(df_chunk):
+            self._chunks.append(df_chunk)
+            self._buffered += len(df_chunk)
+        self._drugs.append(drug)
+        if self._buffered >= self.buffer_rows:
+            self.flush()
+
+    def flush(self):
+        if self._chunks:
+            block = pd.concat(self._chunks, ignore_index=True)
+            block.to_csv(self._fh, header=self._header, index=False)
+            self._header = False
+            self.rows_written += len(block)
+        self._fh.flush()
+        offset = self._fh.tell()
+        if self._drugs:
+            with open(self.checkpoint_path, 'a', encoding='utf-8') as f:
+                f.writelines(json.dumps({'drug': d, 'offset': offset}) + "\n" for d in self._drugs)
+        self._chunks, self._drugs, self._buffered = [], [], 0
+
+    def close(self):
+        self.flush()
+        self._fh.close()
+
+
 class FaersMiningBot:
-    def __init__(self, cases_per_drug=150):
+    def __init__(self, cases_per_drug=150, api_url=OPENFDA_EVENT_URL, api_key=None,
+                 concurrency=4, requests_per_minute=None, max_retries=5, output_file=None,
+                 seed=42, buffer_rows=50_000):
         """
         cases_per_drug: Numero di casi REALI da cercare per OGNI singolo farmaco.
         Il numero finale di righe sarà (cases_per_drug * 2) * numero_farmaci.
+
+        api_url: Endpoint openFDA (o un server locale di test, vedi tools/faers_stub_server.py).
+        concurrency: Richieste HTTP contemporanee al massimo.
+        requests_per_minute: Limite del token bucket. Default: i limiti openFDA
+            (40/min senza API key, 240/min con API key).
+        max_retries: Tentativi per farmaco su 429/5xx ed errori di connessione.
+        seed: Seme dei generatori casuali. Ogni farmaco usa un Generator derivato
+            da (seed, nome del farmaco): i casi generati sono riproducibili e non
+            dipendono dall'ordine in cui arrivano le risposte dell'API.
+        buffer_rows: Righe accumulate prima di ogni scrittura sul CSV.
         """
         self.cases_per_drug = cases_per_drug
         
         self.base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         self.data_dir = os.path.join(self.base_dir, "data")
         self.who_file = os.path.join(self.data_dir, "WHO ATC-DDD 2024-07-31.csv")
-        self.output_file = os.path.join(self.data_dir, "faers_smart_dataset.csv")
+        self.output_file = output_file or os.path.join(self.data_dir, "faers_smart_dataset.csv")
+        # Un farmaco completato per riga (JSON), con la dimensione del CSV dopo il salvataggio
+        self.checkpoint_file = self.output_file + ".checkpoint"
         
-        self.api_url = "https://api.fda.gov/drug/event.json"
-        self.api_key = None # Inserisci qui la tua API Key se ne hai una, per andare ancora più veloce
+        self.api_url = api_url
+        self.api_key = api_key # Inserisci qui la tua API Key se ne hai una, per andare ancora più veloce
+
+        self.concurrency = concurrency
+        self.requests_per_minute = requests_per_minute or (240 if api_key else 40)
+        self.max_retries = max_retries
+        self.seed = seed
+        self.buffer_rows = buffer_rows
+        self.stats = {'requests': 0, 'retries': 0, 'failed_drugs': []}
 
         # Parole chiave per mappare le malattie comuni in modo consistente
         self.keywords = {
@@ -29,6 +127,8 @@ class FaersMiningBot:
             'arthri': 'Arthritis', 'cholesterol': 'High Cholesterol', 'lipid': 'High Cholesterol',
             'depression': 'Depression', 'anxiety': 'Anxiety'
         }
+        # Comorbidità in ordine fisso: il campionamento dei casi shadow non dipende dall'hash delle stringhe
+        self.conditions = sorted(set(self.keywords.values()))
 
     def load_who_drugs(self):
         print(f"[INIT] Caricamento whitelist da: {self.who_file} ...")
@@ -51,47 +151,54 @@ class FaersMiningBot:
             print(f"❌ Errore lettura WHO: {e}")
             return []
 
-    def generate_smart_shadows(self, df_real):
+    def drug_rng(self, drug):
+        """Generator NumPy dedicato a un farmaco, derivato dal seme del bot."""
+        digest = int(hashlib.sha256(drug.encode('utf-8')).hexdigest()[:16], 16)
+        return np.random.default_rng([self.seed, digest])
+
+    def generate_smart_shadows(self, df_real, rng=None):
         """
         Genera i casi SICURI (TARGET=0). Invece di copiare i malati, crea
         profili di pazienti standard (media età, peso forma, meno patologie)
         per dare al ML un contrasto matematico netto.
+
+        Tutti i valori sono campionati in blocco da un Generator NumPy (`rng`),
+        una riga shadow per ogni caso reale.
         """
-        safe_data = []
-        for _, row in df_real.iterrows():
-            # 1. Età realistica ma normalizzata (es. tra i 20 e i 65)
-            age = np.random.normal(45, 12)
-            age = max(18, min(75, age))
-            
-            # 2. Sesso bilanciato e Peso Forma
-            sex = random.choice(['M', 'F'])
-            if sex == 'M': weight = np.random.normal(80, 10)
-            else: weight = np.random.normal(62, 8)
-            weight = max(45, min(110, weight))
-            
-            # 3. Comorbidità: Il 70% delle volte il paziente sano non ha comorbidità, 
-            # altrimenti ne ha una casuale e DIVERSA da quella del malato.
-            if random.random() < 0.70:
-                concomitant = 'None'
-            else:
-                conditions = list(set(self.keywords.values()))
-                if row['CONCOMITANT'] in conditions:
-                    conditions.remove(row['CONCOMITANT'])
-                concomitant = random.choice(conditions) if conditions else 'None'
+        rng = rng if rng is not None else np.random.default_rng(self.seed)
+        n = len(df_real)
 
-            safe_data.append({
-                'AGE': int(age),
-                'SEX': sex,
-                'WEIGHT': round(weight, 1),
-                'DRUG_NAME': row['DRUG_NAME'],
-                'CONCOMITANT': concomitant,
-                'REACTION_DESC': 'No Adverse Event',
-                'TARGET': 0
-            })
-        return pd.DataFrame(safe_data)
+        # 1. Età realistica ma normalizzata (es. tra i 20 e i 65)
+        age = np.clip(rng.normal(45, 12, n), 18, 75).astype(int)
+
+        # 2. Sesso bilanciato e Peso Forma
+        sex = rng.choice(np.array(['M', 'F']), n)
+        weight = np.where(sex == 'M', rng.normal(80, 10, n), rng.normal(62, 8, n))
+        weight = np.round(np.clip(weight, 45, 110), 1)
+
+        # 3. Comorbidità: Il 70% delle volte il paziente sano non ha comorbidità,
+        # altrimenti ne ha una casuale e DIVERSA da quella del malato.
+        conditions = np.array(self.conditions, dtype=object)
+        real_idx = pd.Categorical(df_real['CONCOMITANT'], categories=self.conditions).codes
+        has_real = real_idx >= 0
+        # Indice uniforme sulle condizioni restanti: si salta quella del malato
+        pick = np.floor(rng.random(n) * np.where(has_real, len(conditions) - 1, len(conditions))).astype(int)
+        pick += has_real & (pick >= real_idx)
+        concomitant = np.where(rng.random(n) < 0.70, 'None', conditions[pick])
+
+        return pd.DataFrame({
+            'AGE': age,
+            'SEX': sex,
+            'WEIGHT': weight,
+            'DRUG_NAME': df_real['DRUG_NAME'].to_numpy(),
+            'CONCOMITANT': concomitant,
+            'REACTION_DESC': 'No Adverse Event',
+            'TARGET': 0
+        })
 
-    def _extract_consistent(self, report, drug_name):
+    def _extract_consistent(self, report, drug_name, rng=None):
         """Estrae un singolo record pulito dal JSON della FDA."""
+        rng = rng if rng is not None else np.random.default_rng(self.seed)
         try:
             p = report.get('patient', {})
             
@@ -114,7 +221,7 @@ class FaersMiningBot:
                 if weight < 5 or weight > 250: return None
             else:
                 base = 78.0 if sex == 'M' else 65.0
-                weight = base + np.random.normal(0, 8)
+                weight = base + rng.normal(0, 8)
             
             # Comorbidità
             concomitant = 'None'
@@ -142,75 +249,168 @@ class FaersMiningBot:
         except:
             return None
 
-    def run(self):
-        who_drugs = self.load_who_drugs()
+    def _load_checkpoint(self):
+        """
+        Legge il checkpoint e riallinea il CSV all'ultimo farmaco completato.
+        Restituisce l'insieme dei farmaci già elaborati.
+        """
+        done, offset = set(), 0
+        if os.path.exists(self.checkpoint_file):
+            with open(self.checkpoint_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        break # Riga troncata da un'interruzione durante la scrittura
+                    done.add(entry['drug'])
+                    offset = entry['offset']
+
+        # Righe scritte dopo l'ultimo checkpoint (run interrotto a metà salvataggio) vengono scartate
+        if os.path.exists(self.output_file):
+            with open(self.output_file, 'r+b') as f:
+                f.truncate(offset)
+        return done
+
+    def _fetch_once(self, session, params):
+        resp = session.get(self.api_url, params=params, timeout=10)
+        retry_after = resp.headers.get('Retry-After')
+        payload = resp.json() if resp.status_code == 200 else None
+        return resp.status_code, payload, retry_after
+
+    async def _fetch_reports(self, session, drug, bucket, semaphore):
+        """
+        Scarica i report FAERS di un farmaco con retry e backoff esponenziale.
+        Restituisce la lista dei report (vuota se il farmaco non ha risultati)
+        oppure None se tutti i tentativi sono falliti.
+        """
+        params = {
+            'search': f'patient.drug.medicinalproduct:"{drug}"',
+            'limit': min(1000, self.cases_per_drug * 3) # Chiediamo il triplo per scartare gli sporchi
+        }
+        if self.api_key: params['api_key'] = self.api_key
+
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                self.stats['retries'] += 1
+            await bucket.acquire()
+            async with semaphore:
+                self.stats['requests'] += 1
+                try:
+                    status, payload, retry_after = await asyncio.to_thread(self._fetch_once, session, params)
+                except (requests.RequestException, ValueError):
+                    status, payload, retry_after = None, None, None
+
+            if status == 200:
+                return payload.get('results', [])
+            if status == 404:
+                return [] # openFDA risponde 404 quando la ricerca non ha risultati
+            if status is not None and status not in RETRY_STATUS:
+                return None
+
+            # 429/5xx/errore di rete: backoff esponenziale con jitter (o Retry-After se indicato)
+            delay = min(60.0, 2 ** attempt) + random.uniform(0, 1)
+            if retry_after and retry_after.isdigit():
+                delay = max(delay, float(retry_after))
+            await asyncio.sleep(delay)
+        return None
+
+    def _process_drug(self, drug, results):
+        """Estrae i casi reali di un farmaco e vi affianca i casi shadow."""
+        rng = self.drug_rng(drug)
+        real_cases = []
+        for report in results:
+            extracted = self._extract_consistent(report, drug, rng)
+            if extracted:
+                real_cases.append(extracted)
+            if len(real_cases) >= self.cases_per_drug:
+                break
+        if not real_cases:
+            return None
+
+        df_real = pd.DataFrame(real_cases)
+        df_shadow = self.generate_smart_shadows(df_real, rng)
+        
+        # Uniamo e mischiamo per il chunk corrente
+        df_chunk = pd.concat([df_real, df_shadow], ignore_index=True)
+        return df_chunk.sample(frac=1, random_state=rng).reset_index(drop=True)
+
+    async def _mine(self, drugs, pbar):
+        bucket = TokenBucket(self.requests_per_minute / 60.0, capacity=self.concurrency)
+        semaphore = asyncio.Semaphore(self.concurrency)
+        session = requests.Session()
+        session.mount('http://', HTTPAdapter(pool_maxsize=self.concurrency))
+        session.mount('https://', HTTPAdapter(pool_maxsize=self.concurrency))
+
+        async def fetch(drug):
+            return drug, await self._fetch_reports(session, drug, bucket, semaphore)
+
+        writer = BufferedDatasetWriter(self.output_file, self.checkpoint_file, self.buffer_rows)
+        tasks = [asyncio.create_task(fetch(drug)) for drug in drugs]
+        try:
+            # Tutti i salvataggi passano dal writer, in sequenza: CSV e checkpoint restano coerenti
+            for next_done in asyncio.as_completed(tasks):
+                drug, results = await next_done
+                if results is None:
+                    self.stats['failed_drugs'].append(drug)
+                else:
+                    writer.add(drug, self._process_drug(drug, results))
+                pbar.update(1)
+        finally:
+            for task in tasks:
+                task.cancel()
+            session.close()
+            writer.close()
+        return writer.rows_written
+
+    def run(self, resume=True, max_drugs=None):
+        """
+        resume: Se True riprende dall'ultimo checkpoint, saltando i farmaci già
+            elaborati; se False cancella output e checkpoint e riparte da zero.
+        max_drugs: Limita il numero di farmaci elaborati (utile per i test).
+        """
+        who_drugs = sorted(self.load_who_drugs())
         if not who_drugs:
             return
-            
-        print(f"\n--- START MINING: Target {self.cases_per_drug} casi per {len(who_drugs)} farmaci ---")
-        
-        # Inizializza/Pulisce il file di output
-        if os.path.exists(self.output_file):
-            os.remove(self.output_file)
-            
-        total_records_saved = 0
-        pbar = tqdm(total=len(who_drugs), desc="Progresso Farmaci")
-
-        for drug in who_drugs:
-            # Chiamata API massiva per singolo farmaco (Velocità 10x)
-            params = {
-                'search': f'patient.drug.medicinalproduct:"{drug}"',
-                'limit': min(1000, self.cases_per_drug * 3) # Chiediamo il triplo per scartare gli sporchi
-            }
-            if self.api_key: params['api_key'] = self.api_key
-            
-            real_cases = []
-            
-            try:
-                resp = requests.get(self.api_url, params=params, timeout=10)
-                
-                if resp.status_code == 200:
-                    results = resp.json().get('results', [])
-                    for report in results:
-                        extracted = self._extract_consistent(report, drug)
-                        if extracted:
-                            real_cases.append(extracted)
-                        if len(real_cases) >= self.cases_per_drug:
-                            break
-                            
-                elif resp.status_code == 429:
-                    # Rate Limit colpito
-                    time.sleep(3)
-                    pbar.update(0)
-                    continue
-
-            except Exception:
-                pass # Ignora errori di connessione e passa al prossimo farmaco
-                
-            # Se abbiamo trovato casi reali per questo farmaco, generiamo gli shadow e salviamo
-            if real_cases:
-                df_real = pd.DataFrame(real_cases)
-                df_shadow = self.generate_smart_shadows(df_real)
-                
-                # Uniamo e mischiamo per il chunk corrente
-                df_chunk = pd.concat([df_real, df_shadow], ignore_index=True)
-                df_chunk = df_chunk.sample(frac=1, random_state=42).reset_index(drop=True)
-                
-                # SALVATAGGIO INCREMENTALE (Append mode)
-                file_exists = os.path.isfile(self.output_file)
-                df_chunk.to_csv(self.output_file, mode='a', header=not file_exists, index=False)
-                
-                total_records_saved += len(df_chunk)
-            
-            # Pausa di rispetto per l'API (FDA chiede max 40 req/min senza key = 1.5 sec)
-            time.sleep(1.5 if not self.api_key else 0.5)
-            pbar.update(1)
-            
+        if max_drugs:
+            who_drugs = who_drugs[:max_drugs]
+
+        if not resume:
+            # Inizializza/Pulisce il file di output
+            for path in (self.output_file, self.checkpoint_file):
+                if os.path.exists(path):
+                    os.remove(path)
+
+        done = self._load_checkpoint()
+        pending = [d for d in who_drugs if d not in done]
+        print(f"\n--- START MINING: Target {self.cases_per_drug} casi per {len(who_drugs)} farmaci "
+              f"({len(who_drugs) - len(pending)} già completati, {self.concurrency} richieste parallele, "
+              f"{self.requests_per_minute} req/min) ---")
+
+        pbar = tqdm(total=len(pending), desc="Progresso Farmaci")
+        total_records_saved = asyncio.run(self._mine(pending, pbar))
         pbar.close()
+
         print("\n" + "="*50)
         print(f"✅ DATASET COMPLETATO: {total_records_saved} righe salvate in {self.output_file}")
+        print(f"   Richieste: {self.stats['requests']} | Retry: {self.stats['retries']} | "
+              f"Farmaci falliti: {len(self.stats['failed_drugs'])} (verranno ritentati al prossimo avvio)")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="SafeTherapy - Mining del dataset FAERS da openFDA")
+    parser.add_argument("--cases-per-drug", type=int, default=150)
+    parser.add_argument("--api-url", default=OPENFDA_EVENT_URL, help="Endpoint openFDA o server stub locale")
+    parser.add_argument("--api-key", default=None)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--rate", type=float, default=None, help="Richieste al minuto (default: limiti openFDA)")
+    parser.add_argument("--max-drugs", type=int, default=None)
+    parser.add_argument("--output", default=None, help="CSV di output (default: data/faers_smart_dataset.csv)")
+    parser.add_argument("--fresh", action="store_true", help="Ignora il checkpoint e riparte da zero")
+    parser.add_argument("--seed", type=int, default=42, help="Seme per i casi shadow e i pesi imputati")
+    parser.add_argument("--buffer-rows", type=int, default=50_000, help="Righe accumulate prima di ogni scrittura")
+    args = parser.parse_args()
+
     # 150 casi per farmaco * 300 farmaci * 2 (shadow) = ~90.000 righe pulite e bilanciate!
-    bot = FaersMiningBot(cases_per_drug=150)
-    bot.run()
\ No newline at end of file
+    bot = FaersMiningBot(cases_per_drug=args.cases_per_drug, api_url=args.api_url, api_key=args.api_key,
+                         concurrency=args.concurrency, requests_per_minute=args.rate, output_file=args.output,
+                         seed=args.seed, buffer_rows=args.buffer_rows)
+    bot.run(resume=not args.fresh, max_drugs=args.max_drugs)